@@ -0,0 +1,114 @@
+"""Measure small-file throughput under both connection-gate policies.
+
+Starts a local HTTP server that waits ``--rtt-ms`` before sending the
+response headers of each small file, standing in for the TLS handshake and
+time to first byte of a remote host.  Worker threads then download the
+files the way the requests engine does: ``session.get`` on the thread's
+``get_session()`` session (so through the shared per-host rate limiter)
+inside the connection gate, body streamed outside it.  The run is repeated
+with the ``serial`` policy (the Windows default) and the ``per_host``
+policy at the configured width.
+
+``--api`` requests ``/api/v1/...`` paths instead of file paths, so the
+limiter's pacing of API requests shows in the result.
+
+Usage::
+
+    python benchmarks/bench_connection_gate.py [--files 200] [--workers 10]
+        [--width 6] [--rtt-ms 50] [--size-kb 16] [--api]
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from kemonodownloader import creator_downloader as cd  # noqa: E402
+from kemonodownloader.connection_gate import ConnectionGate  # noqa: E402
+from kemonodownloader.rate_limiter import get_rate_limiter  # noqa: E402
+
+
+def start_server(rtt, size):
+    body = os.urandom(size)
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def do_GET(self):
+            time.sleep(rtt)
+            self.send_response(200)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def run_pass(base_url, files, workers, gate, api=False):
+    # Each pass starts with full token buckets and no backoff.
+    get_rate_limiter().reset()
+    path = "api/v1/files" if api else "data"
+
+    def download(i):
+        url = f"{base_url}/{path}/{i}.bin"
+        session = cd.get_session()
+        with gate.establishing(url) as ok:
+            assert ok
+            response = session.get(url, stream=True, timeout=(30, 30))
+        size = sum(len(chunk) for chunk in response.iter_content(8192))
+        response.close()
+        return size
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        total = sum(pool.map(download, range(files)))
+    elapsed = time.perf_counter() - started
+    return elapsed, total
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--files", type=int, default=200)
+    parser.add_argument("--workers", type=int, default=10)
+    parser.add_argument("--width", type=int, default=6)
+    parser.add_argument("--rtt-ms", type=float, default=50.0)
+    parser.add_argument("--size-kb", type=int, default=16)
+    parser.add_argument(
+        "--api", action="store_true", help="request API paths, which are paced"
+    )
+    args = parser.parse_args()
+
+    server = start_server(args.rtt_ms / 1000, args.size_kb * 1024)
+    base_url = f"http://127.0.0.1:{server.server_address[1]}"
+    print(
+        f"{args.files} files of {args.size_kb} KiB, {args.workers} workers, "
+        f"{args.rtt_ms:.0f} ms to first byte" + (", API paths" if args.api else "")
+    )
+    print(f"{'policy':<16}{'seconds':>10}{'files/s':>10}")
+    try:
+        for label, gate in (
+            ("serial", ConnectionGate(platform="win32")),
+            (f"per_host x{args.width}", ConnectionGate(width=args.width)),
+        ):
+            elapsed, _ = run_pass(base_url, args.files, args.workers, gate, args.api)
+            rate = args.files / elapsed if elapsed else float("inf")
+            print(f"{label:<16}{elapsed:>10.2f}{rate:>10.1f}")
+    finally:
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,120 @@
+"""Measure HashDB store and lookup throughput on a large database.
+
+Fills a fresh ``HashDB`` with ``--rows`` entries and reports:
+
+* stores/s through the write-behind queue (batched commits);
+* lookups/s from one thread and from ``--threads`` threads at once, each on
+  its persistent connection;
+* the same single lookups with a connection opened per call, which is how
+  every query used to run;
+* hashes/s checked through ``lookup_many``, as done for a creator's whole
+  file list.
+
+Usage::
+
+    python benchmarks/bench_hash_db.py [--rows 100000] [--lookups 20000]
+                                       [--threads 8]
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import os
+import random
+import sqlite3
+import sys
+import tempfile
+import threading
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from kemonodownloader.hash_db import HashDB  # noqa: E402
+
+
+def url_hash(i):
+    return hashlib.md5(f"https://kemono.cr/data/{i}.bin".encode()).hexdigest()
+
+
+def bench_store(db, rows):
+    started = time.perf_counter()
+    for i in range(rows):
+        db.store(url_hash(i), f"/library/{i}.bin", "0" * 32, f"u{i}", i, 1.0, i)
+    db.flush()
+    return time.perf_counter() - started
+
+
+def bench_lookup(db, keys, threads):
+    per_thread = [keys[n::threads] for n in range(threads)]
+
+    def work(chunk):
+        for key in chunk:
+            db.lookup(key)
+
+    workers = [threading.Thread(target=work, args=(c,)) for c in per_thread]
+    started = time.perf_counter()
+    for w in workers:
+        w.start()
+    for w in workers:
+        w.join()
+    return time.perf_counter() - started
+
+
+def bench_connect_per_call(db_path, keys):
+    started = time.perf_counter()
+    for key in keys:
+        conn = sqlite3.connect(db_path, timeout=30)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("SELECT * FROM file_hashes WHERE url_hash = ?", (key,))
+        conn.close()
+    return time.perf_counter() - started
+
+
+def bench_lookup_many(db, keys):
+    started = time.perf_counter()
+    found = db.lookup_many(keys)
+    elapsed = time.perf_counter() - started
+    assert len(found) == len(set(keys))
+    return elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=100_000)
+    parser.add_argument("--lookups", type=int, default=20_000)
+    parser.add_argument("--threads", type=int, default=8)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        db = HashDB(directory)
+        results = [("store (batched)", args.rows, bench_store(db, args.rows))]
+        keys = [url_hash(random.randrange(args.rows)) for _ in range(args.lookups)]
+        results.append(("lookup, 1 thread", len(keys), bench_lookup(db, keys, 1)))
+        results.append(
+            (
+                f"lookup, {args.threads} threads",
+                len(keys),
+                bench_lookup(db, keys, args.threads),
+            )
+        )
+        results.append(
+            (
+                "lookup, connect per call",
+                len(keys),
+                bench_connect_per_call(db.db_path, keys),
+            )
+        )
+        results.append(("lookup_many", len(keys), bench_lookup_many(db, keys)))
+        db.close()
+
+    print(f"{args.rows} rows")
+    print(f"{'operation':<28}{'count':>8}{'seconds':>10}{'ops/s':>12}")
+    for label, count, elapsed in results:
+        rate = count / elapsed if elapsed else float("inf")
+        print(f"{label:<28}{count:>8}{elapsed:>10.3f}{rate:>12.0f}")
+
+
+if __name__ == "__main__":
+    main()
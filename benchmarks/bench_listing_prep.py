@@ -0,0 +1,116 @@
+"""Compare per-post and listing-only file preparation for a creator.
+
+Runs ``FilePreparationThread`` against a fake API that answers each
+``/post/{id}`` request after a fixed latency, once with the listing records
+from post detection and once without them, and prints the number of API
+requests and the wall time of each mode.
+
+Usage::
+
+    python benchmarks/bench_listing_prep.py [--posts 3000] [--latency 0.05]
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+import threading
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from kemonodownloader import creator_downloader as cd  # noqa: E402
+
+CREATOR_URL = "https://kemono.cr/fanbox/user/1"
+
+
+def make_post(post_id):
+    return {
+        "id": str(post_id),
+        "title": f"Post {post_id}",
+        "file": {"name": f"{post_id}.jpg", "path": f"/aa/bb/{post_id}.jpg"},
+        "attachments": [{"name": f"{post_id}.zip", "path": f"/cc/dd/{post_id}.zip"}],
+        "content": f'<p><img src="/ee/ff/{post_id}.png"></p>',
+    }
+
+
+class FakeResponse:
+    status_code = 200
+
+    def __init__(self, post):
+        self._post = post
+
+    def json(self):
+        return {"post": self._post}
+
+
+class FakeSession:
+    def __init__(self, records, latency):
+        self.records = records
+        self.latency = latency
+        self.requests = 0
+        self._lock = threading.Lock()
+
+    def get(self, url, **kwargs):
+        with self._lock:
+            self.requests += 1
+        time.sleep(self.latency)
+        return FakeResponse(self.records[url.rstrip("/").rsplit("/", 1)[-1]])
+
+
+class Checked:
+    def isChecked(self):
+        return True
+
+
+class Signal:
+    def emit(self, *args):
+        pass
+
+
+def run_mode(records, latency, listing):
+    session = FakeSession(records, latency)
+    cd.get_session = lambda settings_tab=None: session
+    settings = cd.ThreadSettings(1, 3, 1, 1, 5, listing_prep=listing)
+    all_files_map = {
+        CREATOR_URL: [(post["title"], (pid, None)) for pid, post in records.items()]
+    }
+    thread = cd.FilePreparationThread(
+        list(records),
+        all_files_map,
+        {ext: Checked() for ext in (".jpg", ".zip", ".png")},
+        True,
+        True,
+        True,
+        settings,
+        max_concurrent=5,
+        post_records=records,
+    )
+    result = {}
+    thread.log = Signal()
+    thread.progress = Signal()
+    thread.finished = Signal()
+    thread.finished.emit = lambda files, files_map: result.update(files=files)
+    started = time.perf_counter()
+    thread.run()
+    elapsed = time.perf_counter() - started
+    return session.requests, elapsed, len(result.get("files", []))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--posts", type=int, default=3000)
+    parser.add_argument("--latency", type=float, default=0.05)
+    args = parser.parse_args()
+
+    records = {str(i): make_post(i) for i in range(args.posts)}
+    print(f"{args.posts} posts, {args.latency * 1000:.0f} ms per API request")
+    print(f"{'mode':<10}{'requests':>10}{'seconds':>10}{'files':>8}")
+    for label, listing in (("per-post", False), ("listing", True)):
+        requests_made, elapsed, files = run_mode(records, args.latency, listing)
+        print(f"{label:<10}{requests_made:>10}{elapsed:>10.2f}{files:>8}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+"""Count progress events per second with and without coalescing.
+
+Worker threads report 8 KiB chunks as fast as they can, standing in for
+downloads at line rate.  The ``per chunk`` pass calls the publish callback
+for every chunk, as the download threads used to emit ``file_progress``;
+the ``coalesced`` pass reports to a ``ProgressAggregator`` that publishes
+at most every ``--interval`` seconds.  The callback only counts, so the
+table shows the events a GUI thread would have to handle and the chunk
+rate the workers sustain.
+
+Usage::
+
+    python benchmarks/bench_progress.py [--workers 20] [--seconds 2]
+        [--interval 0.1]
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+import threading
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from kemonodownloader.progress import ProgressAggregator  # noqa: E402
+
+CHUNK = 8192
+FILE_SIZE = 64 * 1024 * 1024
+
+
+def run_pass(workers, seconds, report):
+    chunks = [0] * workers
+    deadline = time.perf_counter() + seconds
+
+    def worker(key):
+        downloaded = 0
+        while time.perf_counter() < deadline:
+            downloaded = (downloaded + CHUNK) % FILE_SIZE
+            report(key, downloaded, FILE_SIZE)
+            chunks[key] += 1
+
+    threads = [threading.Thread(target=worker, args=(i,)) for i in range(workers)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return sum(chunks)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--workers", type=int, default=20)
+    parser.add_argument("--seconds", type=float, default=2.0)
+    parser.add_argument("--interval", type=float, default=0.1)
+    args = parser.parse_args()
+
+    print(f"{args.workers} workers, {CHUNK // 1024} KiB chunks, {args.seconds:g} s")
+    print(f"{'mode':<12}{'chunks/s':>14}{'events/s':>12}")
+    for label in ("per chunk", "coalesced"):
+        events = [0]
+
+        def publish(*args):
+            events[0] += 1
+
+        if label == "per chunk":
+            report = publish
+        else:
+            report = ProgressAggregator(publish, args.interval).update
+        chunks = run_pass(args.workers, args.seconds, report)
+        print(
+            f"{label:<12}{chunks / args.seconds:>14.0f}"
+            f"{events[0] / args.seconds:>12.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
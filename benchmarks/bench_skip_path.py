@@ -0,0 +1,73 @@
+"""Measure the throughput of the already-downloaded skip check.
+
+Creates a set of files recorded in a ``HashDB`` and times how fast the
+downloaders' skip path can confirm they are unchanged, once with the
+stat-based check (entries carry mtime/inode) and once with the legacy
+full-content MD5 (entries stored without stat data, re-stamped after each
+pass so every file is hashed).
+
+Usage::
+
+    python benchmarks/bench_skip_path.py [--files 2000] [--size-kb 512]
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from kemonodownloader.hash_db import HashDB, file_unchanged  # noqa: E402
+
+
+def populate(directory, count, size):
+    db = HashDB(os.path.join(directory, "db"))
+    entries = []
+    for i in range(count):
+        path = os.path.join(directory, f"{i}.bin")
+        content = os.urandom(size)
+        with open(path, "wb") as f:
+            f.write(content)
+        url_hash = f"k{i}"
+        db.store(url_hash, path, hashlib.md5(content).hexdigest(), path, size)
+        entries.append(url_hash)
+    return db, entries
+
+
+def run_pass(db, entries, stat_based):
+    if not stat_based:
+        for url_hash in entries:
+            db.update_stat(url_hash, 0, 0)
+    lookups = [(url_hash, db.lookup(url_hash)) for url_hash in entries]
+    started = time.perf_counter()
+    for url_hash, entry in lookups:
+        assert file_unchanged(db, url_hash, entry)
+    return time.perf_counter() - started
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--files", type=int, default=2000)
+    parser.add_argument("--size-kb", type=int, default=512)
+    args = parser.parse_args()
+
+    size = args.size_kb * 1024
+    total_mb = args.files * size / (1024 * 1024)
+    with tempfile.TemporaryDirectory() as directory:
+        db, entries = populate(directory, args.files, size)
+        print(f"{args.files} files of {args.size_kb} KiB ({total_mb:.0f} MiB)")
+        print(f"{'check':<10}{'seconds':>10}{'files/s':>12}{'MiB/s':>10}")
+        for label, stat_based in (("md5", False), ("stat", True)):
+            elapsed = run_pass(db, entries, stat_based)
+            rate = args.files / elapsed if elapsed else float("inf")
+            mb_rate = total_mb / elapsed if elapsed else float("inf")
+            print(f"{label:<10}{elapsed:>10.3f}{rate:>12.0f}{mb_rate:>10.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,5 +1,19 @@
 # src/kemonodownloader/__main__.py
-from kemonodownloader.app import main
+import sys
+
+
+def main():
+    # macOS passes a -psn_ process serial number to apps started from Finder.
+    args = [arg for arg in sys.argv[1:] if not arg.startswith("-psn_")]
+    if args:
+        # The command line never imports Qt.
+        from kemonodownloader.cli import main as cli_main
+
+        sys.exit(cli_main(args))
+    from kemonodownloader.app import main as app_main
+
+    app_main()
+
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,461 @@
+"""
+api_cache.py
+============
+Persistent on-disk cache for Kemono/Coomer API responses.
+
+The same post JSON is requested several times per run: file preparation
+fetches ``/post/{id}``, the creator download thread fetches it again for
+titles and once more for the description text, and re-running a creator
+the next day starts from scratch.  ``ApiResponseCache`` keeps successful
+API responses in a small SQLite database keyed by URL:
+
+* **TTL** - post JSON is served straight from disk while it is younger
+  than the configured TTL.  Listing and profile pages change whenever a
+  creator posts, so they are never served without asking the server.
+* **Revalidation** - once an entry is stale, the request carries
+  ``If-None-Match`` / ``If-Modified-Since`` built from the stored
+  ``ETag`` / ``Last-Modified``; a ``304`` is answered from disk.
+* **Size cap** - the total body size is capped; the least recently used
+  entries are evicted first.  A hit only rewrites an entry's access time
+  once it is ``ACCESS_GRANULARITY`` seconds old, so repeated lookups stay
+  reads.
+* **Offline mode** - every API request is answered from the cache,
+  whatever its age; a miss becomes a ``504`` response (the HTTP answer to
+  ``only-if-cached``) without touching the network.
+
+``CachingAdapter`` plugs the cache into the ``requests`` sessions handed out
+by ``creator_downloader.get_session``, so every API call site in the
+creator, post and thumbnail downloaders goes through it without changes.
+Only ``GET`` requests to ``/api/`` paths are considered; file downloads
+are never cached.
+
+The cache is process-wide (``get_api_cache``) and stays disabled until a
+database path is configured (the app does this in
+``ensure_folders_exist``).  Every thread works on its own persistent
+connection in WAL mode, as ``HashDB`` readers do, so lookups from
+different threads run concurrently; only writes that change the tracked
+total size are serialised.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import sqlite3
+import threading
+import time
+from typing import Callable, Dict, NamedTuple, Optional, Tuple
+from urllib.parse import urlparse
+
+import requests
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+
+from kemonodownloader.rate_limiter import RateLimitedAdapter, is_api_url
+
+# ---------------------------------------------------------------------------
+# Constants
+# ---------------------------------------------------------------------------
+
+API_CACHE_FILENAME = "api_cache.db"
+DEFAULT_TTL = 24 * 3600  # seconds a post response is used without asking
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+# Precision of the access times that drive eviction.
+ACCESS_GRANULARITY = 10 * 60
+# Status returned for a cache miss in offline mode.
+OFFLINE_MISS_STATUS = 504
+
+# The stored body is already decoded, so these no longer describe it.
+_DROPPED_HEADERS = {"content-encoding", "content-length", "transfer-encoding"}
+
+
+def is_post_url(url: str) -> bool:
+    """Return True for single-post API URLs (``.../post/{id}``)."""
+    return "/post/" in urlparse(url).path
+
+
+class CachedResponse(NamedTuple):
+    url: str
+    status: int
+    headers: dict
+    body: bytes
+    etag: Optional[str]
+    last_modified: Optional[str]
+    stored_at: float
+
+
+# ---------------------------------------------------------------------------
+# Cache
+# ---------------------------------------------------------------------------
+
+
+class ApiResponseCache:
+    """Thread-safe SQLite store of API responses keyed by URL."""
+
+    def __init__(
+        self,
+        path: Optional[str] = None,
+        ttl: float = DEFAULT_TTL,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        offline: bool = False,
+        clock: Callable[[], float] = time.time,
+    ):
+        # Guards the path, the connection registry and the total size.
+        self._lock = threading.Lock()
+        # Serialises writes that change the total size (store, evict).
+        self._write_lock = threading.Lock()
+        self._local = threading.local()
+        self._connections: Dict[int, Tuple[threading.Thread, sqlite3.Connection]] = {}
+        # Bumped on every path change so threads drop their old connection.
+        self._generation = 0
+        self._clock = clock
+        self._path: Optional[str] = None
+        self._total: Optional[int] = None
+        self.ttl = float(ttl)
+        self.max_bytes = int(max_bytes)
+        self.offline = bool(offline)
+        if path:
+            self.set_path(path)
+
+    @property
+    def path(self) -> Optional[str]:
+        return self._path
+
+    @property
+    def enabled(self) -> bool:
+        return self._path is not None
+
+    def configure(
+        self,
+        path: Optional[str],
+        ttl: Optional[float] = None,
+        max_bytes: Optional[int] = None,
+        offline: Optional[bool] = None,
+    ) -> None:
+        """Apply settings; a ``None`` *path* disables the cache."""
+        if ttl is not None:
+            self.ttl = max(0.0, float(ttl))
+        if max_bytes is not None:
+            self.max_bytes = max(0, int(max_bytes))
+        if offline is not None:
+            self.offline = bool(offline)
+        self.set_path(path)
+        self.evict()
+
+    def set_path(self, path: Optional[str]) -> None:
+        with self._write_lock, self._lock:
+            if path == self._path:
+                return
+            self._path = None
+            self._total = None
+            self._close_connections()
+            if path:
+                try:
+                    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+                    self._init_db(path)
+                except (OSError, sqlite3.Error):
+                    # An unusable cache just means every request goes out.
+                    return
+                self._path = path
+
+    def close(self) -> None:
+        """Close every thread's connection; they are reopened on demand."""
+        with self._write_lock, self._lock:
+            self._close_connections()
+
+    # -- internal helpers --------------------------------------------------
+
+    @staticmethod
+    def _connect(path: str) -> sqlite3.Connection:
+        # check_same_thread is off so ``close`` can close every connection;
+        # each one is still only used by the thread that owns it.
+        conn = sqlite3.connect(path, timeout=30, check_same_thread=False)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        return conn
+
+    def _connection(self) -> Optional[sqlite3.Connection]:
+        """Return the calling thread's connection, or None when disabled."""
+        conn = getattr(self._local, "conn", None)
+        if conn is not None and self._local.generation == self._generation:
+            return conn
+        with self._lock:
+            if self._path is None:
+                return None
+            conn = self._connect(self._path)
+            current = threading.current_thread()
+            # Connections of threads that have exited are closed here, so
+            # short-lived worker threads do not accumulate open handles.
+            for ident, (thread, other) in list(self._connections.items()):
+                if not thread.is_alive():
+                    other.close()
+                    del self._connections[ident]
+            self._connections[current.ident or 0] = (current, conn)
+            self._local.conn = conn
+            self._local.generation = self._generation
+        return conn
+
+    def _close_connections(self) -> None:
+        """Close every registered connection; the caller holds ``_lock``."""
+        for _thread, conn in self._connections.values():
+            conn.close()
+        self._connections.clear()
+        self._generation += 1
+
+    def _init_db(self, path: str) -> None:
+        conn = self._connect(path)
+        try:
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS api_responses (
+                    url           TEXT PRIMARY KEY,
+                    status        INTEGER NOT NULL,
+                    headers       TEXT NOT NULL,
+                    body          BLOB NOT NULL,
+                    etag          TEXT,
+                    last_modified TEXT,
+                    stored_at     REAL NOT NULL,
+                    last_access   REAL NOT NULL,
+                    size          INTEGER NOT NULL
+                )
+                """
+            )
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_api_responses_last_access "
+                "ON api_responses (last_access)"
+            )
+            conn.commit()
+        finally:
+            conn.close()
+
+    def _total_size(self, conn: sqlite3.Connection) -> int:
+        """Return the summed body size; the caller holds ``_write_lock``."""
+        if self._total is None:
+            row = conn.execute("SELECT COALESCE(SUM(size), 0) FROM api_responses")
+            self._total = int(row.fetchone()[0])
+        return self._total
+
+    def _evict_locked(self, conn: sqlite3.Connection) -> int:
+        """Drop least recently used rows until under ``max_bytes``."""
+        excess = self._total_size(conn) - self.max_bytes
+        if excess <= 0:
+            return 0
+        freed = 0
+        rows = conn.execute(
+            "SELECT url, size FROM api_responses ORDER BY last_access ASC"
+        )
+        victims = []
+        for url, size in rows:
+            if freed >= excess:
+                break
+            victims.append((url,))
+            freed += size
+        conn.executemany("DELETE FROM api_responses WHERE url = ?", victims)
+        conn.commit()
+        self._total = (self._total or 0) - freed
+        return len(victims)
+
+    # -- public API --------------------------------------------------------
+
+    def is_fresh(self, entry: CachedResponse) -> bool:
+        """Return True when *entry* may be used without asking the server."""
+        if not is_post_url(entry.url):
+            return False
+        return self._clock() - entry.stored_at < self.ttl
+
+    def get(self, url: str) -> Optional[CachedResponse]:
+        """Return the stored response for *url* and mark it recently used."""
+        try:
+            conn = self._connection()
+            if conn is None:
+                return None
+            row = conn.execute(
+                "SELECT status, headers, body, etag, last_modified, "
+                "stored_at, last_access FROM api_responses WHERE url = ?",
+                (url,),
+            ).fetchone()
+            if row is None:
+                return None
+            now = self._clock()
+            if now - row[6] >= ACCESS_GRANULARITY:
+                with conn:
+                    conn.execute(
+                        "UPDATE api_responses SET last_access = ? WHERE url = ?",
+                        (now, url),
+                    )
+        except sqlite3.Error:
+            return None
+        status, headers, body, etag, last_modified, stored_at, _ = row
+        try:
+            header_map = json.loads(headers)
+        except ValueError:
+            header_map = {}
+        return CachedResponse(
+            url, status, header_map, bytes(body), etag, last_modified, stored_at
+        )
+
+    def store(self, url: str, status: int, headers, body: bytes) -> None:
+        """Store a response for *url*, evicting old entries past the cap."""
+        header_map = {
+            key: value
+            for key, value in dict(headers or {}).items()
+            if key.lower() not in _DROPPED_HEADERS
+        }
+        lowered = {key.lower(): value for key, value in header_map.items()}
+        size = len(body)
+        if size > self.max_bytes:
+            return
+        with self._write_lock:
+            now = self._clock()
+            try:
+                conn = self._connection()
+                if conn is None:
+                    return
+                total = self._total_size(conn)
+                old = conn.execute(
+                    "SELECT size FROM api_responses WHERE url = ?", (url,)
+                ).fetchone()
+                conn.execute(
+                    """
+                    INSERT OR REPLACE INTO api_responses
+                    (url, status, headers, body, etag, last_modified,
+                     stored_at, last_access, size)
+                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+                    """,
+                    (
+                        url,
+                        int(status),
+                        json.dumps(header_map),
+                        sqlite3.Binary(body),
+                        lowered.get("etag"),
+                        lowered.get("last-modified"),
+                        now,
+                        now,
+                        size,
+                    ),
+                )
+                conn.commit()
+                self._total = total - (old[0] if old else 0) + size
+                self._evict_locked(conn)
+            except sqlite3.Error:
+                self._total = None
+
+    def refresh(self, url: str, headers=None) -> None:
+        """Mark *url* as just revalidated (after a ``304``)."""
+        lowered = {key.lower(): value for key, value in dict(headers or {}).items()}
+        now = self._clock()
+        try:
+            conn = self._connection()
+            if conn is None:
+                return
+            with conn:
+                conn.execute(
+                    """
+                    UPDATE api_responses
+                    SET stored_at = ?, last_access = ?,
+                        etag = COALESCE(?, etag),
+                        last_modified = COALESCE(?, last_modified)
+                    WHERE url = ?
+                    """,
+                    (
+                        now,
+                        now,
+                        lowered.get("etag"),
+                        lowered.get("last-modified"),
+                        url,
+                    ),
+                )
+        except sqlite3.Error:
+            pass
+
+    def evict(self) -> int:
+        """Enforce the size cap now; return the number of entries dropped."""
+        with self._write_lock:
+            try:
+                conn = self._connection()
+                if conn is None:
+                    return 0
+                return self._evict_locked(conn)
+            except sqlite3.Error:
+                self._total = None
+                return 0
+
+    def total_size(self) -> int:
+        with self._write_lock:
+            conn = self._connection()
+            if conn is None:
+                return 0
+            return self._total_size(conn)
+
+    def clear(self) -> None:
+        """Delete every stored response."""
+        with self._write_lock:
+            conn = self._connection()
+            if conn is None:
+                return
+            with conn:
+                conn.execute("DELETE FROM api_responses")
+            self._total = 0
+
+
+# ---------------------------------------------------------------------------
+# Process-wide instance
+# ---------------------------------------------------------------------------
+
+_cache = ApiResponseCache()
+
+
+def get_api_cache() -> ApiResponseCache:
+    """Return the API response cache shared by every session."""
+    return _cache
+
+
+# ---------------------------------------------------------------------------
+# requests integration
+# ---------------------------------------------------------------------------
+
+
+def build_response(request, status: int, headers=None, body: bytes = b""):
+    """Return a ``requests.Response`` answering *request* without the network."""
+    response = requests.Response()
+    response.status_code = status
+    response.headers = CaseInsensitiveDict(headers or {})
+    response._content = body
+    response.encoding = get_encoding_from_headers(response.headers)
+    response.url = request.url
+    response.request = request
+    response.reason = "OK" if status == 200 else "Not Cached"
+    response.from_cache = True  # type: ignore[attr-defined]
+    return response
+
+
+class CachingAdapter(RateLimitedAdapter):
+    """``RateLimitedAdapter`` that answers API requests from the cache."""
+
+    def send(self, request, stream=False, *args, **kwargs):
+        cache = get_api_cache()
+        if not cache.enabled or request.method != "GET" or not is_api_url(request.url):
+            return super().send(request, stream, *args, **kwargs)
+
+        entry = cache.get(request.url)
+        if cache.offline:
+            if entry is None:
+                return build_response(request, OFFLINE_MISS_STATUS)
+            return build_response(request, entry.status, entry.headers, entry.body)
+        if entry is not None and cache.is_fresh(entry):
+            return build_response(request, entry.status, entry.headers, entry.body)
+
+        if entry is not None:
+            if entry.etag:
+                request.headers["If-None-Match"] = entry.etag
+            if entry.last_modified:
+                request.headers["If-Modified-Since"] = entry.last_modified
+        response = super().send(request, stream, *args, **kwargs)
+
+        if response.status_code == 304 and entry is not None:
+            cache.refresh(request.url, response.headers)
+            response.close()
+            return build_response(request, entry.status, entry.headers, entry.body)
+        if response.status_code == 200 and not stream:
+            cache.store(request.url, 200, response.headers, response.content)
+        return response
@@ -23,7 +23,9 @@ from PyQt6.QtWidgets import (
     QWidget,
 )
 
+from kemonodownloader.api_cache import API_CACHE_FILENAME, get_api_cache
 from kemonodownloader.creator_downloader import CreatorDownloaderTab
+from kemonodownloader.endpoint_cache import ENDPOINT_CACHE_FILENAME, get_endpoint_cache
 from kemonodownloader.kd_extension import ExtensionTab
 from kemonodownloader.kd_help import HelpTab
 from kemonodownloader.kd_language import translate
@@ -313,6 +315,23 @@ class KemonoDownloader(QMainWindow):
             self.other_files_folder,
         ]:
             os.makedirs(folder, exist_ok=True)
+        # Remember working API endpoint forms between sessions.
+        get_endpoint_cache().set_path(
+            os.path.join(self.cache_folder, ENDPOINT_CACHE_FILENAME)
+        )
+        # Re-applied on every settings change, which lands here too.
+        settings_tab = self.settings_tab
+        api_cache_enabled = settings_tab.is_api_cache_enabled()
+        get_api_cache().configure(
+            (
+                os.path.join(self.cache_folder, API_CACHE_FILENAME)
+                if api_cache_enabled
+                else None
+            ),
+            ttl=settings_tab.get_api_cache_ttl_hours() * 3600,
+            max_bytes=settings_tab.get_api_cache_max_mb() * 1024 * 1024,
+            offline=api_cache_enabled and settings_tab.is_api_cache_offline(),
+        )
 
     def disable_other_tabs(self):
         if hasattr(self, "tabs"):
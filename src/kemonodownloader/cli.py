@@ -0,0 +1,347 @@
+"""
+cli.py
+======
+Headless command line: ``python -m kemonodownloader URL ...``.
+
+Downloads creators and posts through ``download_core`` without importing
+Qt, so it runs on servers without PyQt6 or a display, for example from
+cron.  The folder layout is the GUI's (``Downloads``, ``Cache`` and
+``Other Files`` below the base folder), so both share one library and
+hash database and never download the same file twice.
+
+``--watch SECONDS`` keeps the process running and repeats the sync after
+each pause (daemon mode).  Ctrl+C (SIGINT) or SIGTERM finishes the files
+in flight and stops; a second Ctrl+C aborts at once.
+
+The exit status is 0 when every file is on disk, 1 when any failed and 2
+for invalid arguments.
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import signal
+import sys
+import time
+from typing import Any, Dict, Iterable, List, Optional
+
+from kemonodownloader.download_core import (
+    DEFAULT_EXTENSIONS,
+    DEFAULT_MAX_RETRIES,
+    DEFAULT_TEMPLATE,
+    DEFAULT_WORKERS,
+    FOLDER_STRATEGIES,
+    PER_POST,
+    CoreSettings,
+    DownloadCore,
+    DownloadListener,
+    DownloadSummary,
+)
+from kemonodownloader.endpoint_cache import ENDPOINT_CACHE_FILENAME, get_endpoint_cache
+from kemonodownloader.hash_db import HashDB
+from kemonodownloader.kd_language import translate
+
+# ---------------------------------------------------------------------------
+# Constants
+# ---------------------------------------------------------------------------
+
+BASE_FOLDER_NAME = "Kemono Downloader"
+
+QUIET = 0
+NORMAL = 1
+VERBOSE = 2
+
+# Lowest level printed at each verbosity.
+_LEVELS = {"DEBUG": 0, "INFO": 1, "WARNING": 2, "ERROR": 3}
+_THRESHOLDS = {QUIET: 2, NORMAL: 1, VERBOSE: 0}
+
+
+def default_base_directory() -> str:
+    """Return the platform's default app data directory.
+
+    Same as ``SettingsTab.get_default_base_directory``, which cannot be
+    imported without Qt.
+    """
+    if sys.platform == "win32":
+        return os.path.join(
+            os.getenv("APPDATA", os.path.expanduser("~")), BASE_FOLDER_NAME
+        )
+    if sys.platform == "darwin":
+        return os.path.expanduser(f"~/Library/Application Support/{BASE_FOLDER_NAME}")
+    fallback_data_home = os.path.join(os.path.expanduser("~"), ".local/share")
+    return os.path.join(
+        os.getenv("XDG_DATA_HOME", fallback_data_home), BASE_FOLDER_NAME
+    )
+
+
+# ---------------------------------------------------------------------------
+# Arguments
+# ---------------------------------------------------------------------------
+
+
+def _extension_list(value: str) -> List[str]:
+    extensions = []
+    for item in value.split(","):
+        item = item.strip().lower()
+        if item:
+            extensions.append(item if item.startswith(".") else f".{item}")
+    if not extensions:
+        raise argparse.ArgumentTypeError("no file types given")
+    return extensions
+
+
+def _positive(value: str) -> int:
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError("must be at least 1")
+    return number
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="python -m kemonodownloader",
+        description=(
+            "Download Kemono/Coomer creators and posts without the GUI. "
+            "Run without arguments to start the GUI."
+        ),
+    )
+    parser.add_argument("urls", nargs="*", metavar="URL", help="creator or post URL")
+    parser.add_argument(
+        "-i",
+        "--input-file",
+        action="append",
+        default=[],
+        metavar="FILE",
+        help="read URLs from FILE, one per line ('#' comments, '-' for stdin)",
+    )
+    parser.add_argument(
+        "--base-dir",
+        default=None,
+        help="folder holding the '%s' folder (default: the GUI's default)"
+        % BASE_FOLDER_NAME,
+    )
+    parser.add_argument(
+        "-o",
+        "--output",
+        default=None,
+        help="download folder (default: <base folder>/Downloads)",
+    )
+    parser.add_argument(
+        "--fast",
+        action="store_true",
+        help="prepare posts from listing pages where possible and stop detection "
+        "at posts seen by the last complete sync",
+    )
+    parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help="stop detection at posts seen by the last complete sync",
+    )
+    parser.add_argument(
+        "--ext",
+        type=_extension_list,
+        default=None,
+        metavar="LIST",
+        help="comma-separated file types to download (default: %s)"
+        % ",".join(ext.lstrip(".") for ext in DEFAULT_EXTENSIONS),
+    )
+    parser.add_argument("--no-main", action="store_true", help="skip main files")
+    parser.add_argument(
+        "--no-attachments", action="store_true", help="skip attachments"
+    )
+    parser.add_argument(
+        "--no-content", action="store_true", help="skip images in post bodies"
+    )
+    parser.add_argument(
+        "--template",
+        default=DEFAULT_TEMPLATE,
+        help="filename template; fields: post_id, post_title, orig_name, ext, "
+        "creator_name, creator_id, file_index, total_files (default: %(default)s)",
+    )
+    parser.add_argument(
+        "--folder-strategy",
+        choices=FOLDER_STRATEGIES,
+        default=PER_POST,
+        help="folder layout below each creator (default: %(default)s)",
+    )
+    parser.add_argument(
+        "--auto-rename",
+        action="store_true",
+        help="prefix files with their number within the post",
+    )
+    parser.add_argument(
+        "--redownload-completed",
+        action="store_true",
+        help="check posts an earlier run completed again",
+    )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=_positive,
+        default=DEFAULT_WORKERS,
+        help="files downloaded at once (default: %(default)s)",
+    )
+    parser.add_argument(
+        "--retries",
+        type=_positive,
+        default=DEFAULT_MAX_RETRIES,
+        help="attempts per request (default: %(default)s)",
+    )
+    parser.add_argument(
+        "--proxy", default=None, help="proxy URL (http://, socks5://, ...)"
+    )
+    parser.add_argument(
+        "--watch",
+        type=_positive,
+        default=None,
+        metavar="SECONDS",
+        help="keep running and sync again SECONDS after each run ends",
+    )
+    verbosity = parser.add_mutually_exclusive_group()
+    verbosity.add_argument(
+        "-q",
+        "--quiet",
+        dest="verbosity",
+        action="store_const",
+        const=QUIET,
+        default=NORMAL,
+        help="only print warnings and errors",
+    )
+    verbosity.add_argument(
+        "-v",
+        "--verbose",
+        dest="verbosity",
+        action="store_const",
+        const=VERBOSE,
+        help="also print debug messages",
+    )
+    return parser
+
+
+def read_url_lines(lines: Iterable[str]) -> List[str]:
+    """Return the URLs of an input file, without blanks and comments."""
+    urls = []
+    for line in lines:
+        line = line.strip()
+        if line and not line.startswith("#"):
+            urls.append(line)
+    return urls
+
+
+def collect_urls(args) -> List[str]:
+    """Return the URLs of the command line and input files, deduplicated."""
+    urls = list(args.urls)
+    for path in args.input_file:
+        if path == "-":
+            urls.extend(read_url_lines(sys.stdin))
+        else:
+            with open(path, encoding="utf-8") as f:
+                urls.extend(read_url_lines(f))
+    return list(dict.fromkeys(url.strip() for url in urls))
+
+
+def core_settings(args, download_dir: str) -> CoreSettings:
+    return CoreSettings(
+        download_dir,
+        extensions=args.ext or DEFAULT_EXTENSIONS,
+        main=not args.no_main,
+        attachments=not args.no_attachments,
+        content=not args.no_content,
+        template=args.template,
+        folder_strategy=args.folder_strategy,
+        auto_rename=args.auto_rename,
+        workers=args.jobs,
+        max_retries=args.retries,
+        listing_prep=args.fast,
+        incremental=args.fast or args.incremental,
+        skip_completed=not args.redownload_completed,
+        proxies={"http": args.proxy, "https": args.proxy} if args.proxy else None,
+    )
+
+
+# ---------------------------------------------------------------------------
+# Output
+# ---------------------------------------------------------------------------
+
+
+class ConsoleListener(DownloadListener):
+    """Prints core log lines at or above the chosen verbosity to *stream*."""
+
+    def __init__(self, verbosity: int = NORMAL, stream=None):
+        self.threshold = _THRESHOLDS.get(verbosity, 1)
+        self.stream = stream if stream is not None else sys.stderr
+
+    def log(self, message: str, level: str) -> None:
+        if _LEVELS.get(level, 1) >= self.threshold:
+            print(message, file=self.stream, flush=True)
+
+
+# ---------------------------------------------------------------------------
+# Entry point
+# ---------------------------------------------------------------------------
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    try:
+        urls = collect_urls(args)
+    except OSError as e:
+        parser.error(str(e))
+    if not urls:
+        parser.error("no URLs given")
+
+    base_folder = os.path.join(
+        args.base_dir or default_base_directory(), BASE_FOLDER_NAME
+    )
+    download_dir = os.path.abspath(
+        args.output or os.path.join(base_folder, "Downloads")
+    )
+    cache_folder = os.path.join(base_folder, "Cache")
+    other_files_folder = os.path.join(base_folder, "Other Files")
+    for folder in (download_dir, cache_folder, other_files_folder):
+        os.makedirs(folder, exist_ok=True)
+    get_endpoint_cache().set_path(os.path.join(cache_folder, ENDPOINT_CACHE_FILENAME))
+
+    listener = ConsoleListener(args.verbosity)
+    hash_db = HashDB(other_files_folder, base_dir=download_dir)
+    settings = core_settings(args, download_dir)
+    state: Dict[str, Any] = {"core": None, "stopping": False}
+
+    def request_stop(signum, frame):
+        state["stopping"] = True
+        if state["core"] is not None:
+            state["core"].stop()
+        # A second Ctrl+C interrupts at once.
+        signal.signal(signal.SIGINT, signal.default_int_handler)
+
+    previous_handlers = {
+        signum: signal.signal(signum, request_stop)
+        for signum in (signal.SIGINT, signal.SIGTERM)
+    }
+    failed = 0
+    try:
+        while True:
+            core = DownloadCore(settings, listener, hash_db)
+            state["core"] = core
+            summary: DownloadSummary = core.run(urls)
+            failed = summary.failed
+            listener.log(
+                translate("log_info", translate("cli_summary", *summary)), "INFO"
+            )
+            if args.watch is None or state["stopping"]:
+                break
+            listener.log(
+                translate("log_info", translate("cli_next_run", args.watch)), "INFO"
+            )
+            deadline = time.monotonic() + args.watch
+            while not state["stopping"] and time.monotonic() < deadline:
+                time.sleep(0.5)
+            if state["stopping"]:
+                break
+    finally:
+        for signum, handler in previous_handlers.items():
+            signal.signal(signum, handler)
+        hash_db.close()
+    return 1 if failed else 0
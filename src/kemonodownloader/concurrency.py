@@ -0,0 +1,209 @@
+"""
+concurrency.py
+==============
+Worker-count control for the download and preparation threads.
+
+Every worker pool used to run at the fixed ``simultaneous_downloads``
+value from the Settings tab.  Any fixed number is wrong for part of the
+day: too low wastes bandwidth when the servers are idle, too high turns a
+busy period into a storm of timeouts and ``429`` responses.  Threads now
+ask a controller for their current limit instead:
+
+* ``FixedConcurrency`` always returns the configured value (the default).
+* ``AIMDConcurrency`` adapts the limit while running, using the same
+  additive-increase / multiplicative-decrease rule as TCP congestion
+  control.  Over each measurement window it looks at completed bytes per
+  second, the average time to first byte and the error and ``429`` rates:
+
+  - a ``429`` cuts the limit immediately (at most once per window);
+  - an error rate above ``error_threshold`` or a time to first byte more
+    than ``ttfb_factor`` times the best seen so far halves it;
+  - otherwise, while throughput keeps up with the previous window, the
+    limit grows by one.
+
+  The limit always stays within the user's ``[min_limit, max_limit]``.
+
+Pools start ``max_limit`` workers (or poll for a slot) and only let
+``limit`` of them run at a time, so the limit can change mid-run without
+restarting anything.  ``on_change(limit)`` is called whenever it moves so
+threads can surface the effective concurrency in the UI.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from typing import Callable, Optional
+
+# ---------------------------------------------------------------------------
+# Constants
+# ---------------------------------------------------------------------------
+
+DEFAULT_MIN_CONCURRENCY = 2
+DEFAULT_MAX_CONCURRENCY = 20
+
+
+def is_throttled_error(error: BaseException) -> bool:
+    """Return True when *error* carries an HTTP 429 status.
+
+    Understands ``requests.HTTPError`` (``error.response.status_code``) and
+    ``aiohttp.ClientResponseError`` (``error.status``).
+    """
+    status = getattr(error, "status", None)
+    if status is None:
+        response = getattr(error, "response", None)
+        status = getattr(response, "status_code", None)
+    return status == 429
+
+
+class FixedConcurrency:
+    """Controller that keeps the configured limit."""
+
+    adaptive = False
+
+    def __init__(self, limit: int):
+        # Used exactly as configured, like the plain max_concurrent it replaces.
+        self.limit = int(limit)
+        self.min_limit = self.max_limit = self.limit
+
+    def record_success(self, nbytes: int = 0, ttfb: Optional[float] = None) -> None:
+        pass
+
+    def record_failure(self, throttled: bool = False) -> None:
+        pass
+
+
+class AIMDConcurrency:
+    """Additive-increase / multiplicative-decrease concurrency controller."""
+
+    adaptive = True
+
+    def __init__(
+        self,
+        initial: int,
+        min_limit: int = DEFAULT_MIN_CONCURRENCY,
+        max_limit: int = DEFAULT_MAX_CONCURRENCY,
+        interval: float = 3.0,
+        min_samples: int = 3,
+        decrease_factor: float = 0.5,
+        error_threshold: float = 0.2,
+        ttfb_factor: float = 2.0,
+        clock: Callable[[], float] = time.monotonic,
+        on_change: Optional[Callable[[int], None]] = None,
+    ):
+        self.min_limit = max(1, int(min_limit))
+        self.max_limit = max(self.min_limit, int(max_limit))
+        self.interval = interval
+        self.min_samples = min_samples
+        self.decrease_factor = decrease_factor
+        self.error_threshold = error_threshold
+        self.ttfb_factor = ttfb_factor
+        self.on_change = on_change
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._limit = self._clamp(initial)
+        self._best_ttfb: Optional[float] = None
+        self._last_throughput: Optional[float] = None
+        self._last_decrease = float("-inf")
+        self._reset_window(clock())
+
+    @property
+    def limit(self) -> int:
+        return self._limit
+
+    # -- recording ---------------------------------------------------------
+
+    def record_success(self, nbytes: int = 0, ttfb: Optional[float] = None) -> None:
+        """Record a finished request of *nbytes* with its time to first byte."""
+        with self._lock:
+            self._successes += 1
+            self._bytes += max(0, nbytes)
+            if ttfb is not None:
+                self._ttfb_total += ttfb
+                self._ttfb_count += 1
+            changed = self._evaluate(self._clock())
+        self._notify(changed)
+
+    def record_failure(self, throttled: bool = False) -> None:
+        """Record a failed request; *throttled* marks a ``429`` response."""
+        with self._lock:
+            now = self._clock()
+            self._failures += 1
+            if throttled and now - self._last_decrease >= self.interval:
+                changed = self._decrease(now)
+                self._reset_window(now)
+            else:
+                changed = self._evaluate(now)
+        self._notify(changed)
+
+    # -- internals ---------------------------------------------------------
+
+    def _clamp(self, value: float) -> int:
+        return max(self.min_limit, min(self.max_limit, int(value)))
+
+    def _reset_window(self, now: float) -> None:
+        self._window_start = now
+        self._successes = 0
+        self._failures = 0
+        self._bytes = 0
+        self._ttfb_total = 0.0
+        self._ttfb_count = 0
+
+    def _decrease(self, now: float) -> bool:
+        self._last_decrease = now
+        previous = self._limit
+        self._limit = self._clamp(self._limit * self.decrease_factor)
+        return self._limit != previous
+
+    def _evaluate(self, now: float) -> bool:
+        """Adjust the limit once a measurement window is complete."""
+        elapsed = now - self._window_start
+        samples = self._successes + self._failures
+        if elapsed < self.interval or samples < self.min_samples:
+            return False
+
+        error_rate = self._failures / samples
+        throughput = self._bytes / elapsed if elapsed > 0 else 0.0
+        avg_ttfb = self._ttfb_total / self._ttfb_count if self._ttfb_count else None
+        slow_first_byte = (
+            avg_ttfb is not None
+            and self._best_ttfb is not None
+            and avg_ttfb > self._best_ttfb * self.ttfb_factor
+        )
+
+        previous = self._limit
+        if error_rate > self.error_threshold or slow_first_byte:
+            self._decrease(now)
+        elif self._last_throughput is None or throughput >= self._last_throughput * 0.9:
+            self._limit = self._clamp(self._limit + 1)
+
+        if avg_ttfb is not None:
+            self._best_ttfb = (
+                avg_ttfb if self._best_ttfb is None else min(self._best_ttfb, avg_ttfb)
+            )
+        self._last_throughput = throughput
+        self._reset_window(now)
+        return self._limit != previous
+
+    def _notify(self, changed: bool) -> None:
+        if changed and self.on_change is not None:
+            self.on_change(self._limit)
+
+
+def create_controller(
+    fixed_limit: int,
+    adaptive: bool = False,
+    min_limit: int = DEFAULT_MIN_CONCURRENCY,
+    max_limit: int = DEFAULT_MAX_CONCURRENCY,
+    on_change: Optional[Callable[[int], None]] = None,
+):
+    """Return the controller for a worker pool.
+
+    In adaptive mode the configured ``fixed_limit`` becomes the starting
+    point within ``[min_limit, max_limit]``.
+    """
+    if not adaptive:
+        return FixedConcurrency(fixed_limit)
+    return AIMDConcurrency(
+        fixed_limit, min_limit=min_limit, max_limit=max_limit, on_change=on_change
+    )
@@ -0,0 +1,146 @@
+"""
+connection_gate.py
+==================
+Platform-aware limit on requests establishing their connection.
+
+Every download thread used to serialise the connection phase of its
+requests (``session.get``: TLS handshake, redirects and response headers)
+behind a ``_ssl_lock`` of its own.  The lock works around native crashes
+of concurrent OpenSSL handshakes on Windows with Python 3.14, but it was
+taken on every platform: only one file per thread could be between
+connect and first byte, which capped small-file throughput at about one
+file per round trip.
+
+``ConnectionGate`` is shared by every thread in the process and applies
+one of two policies:
+
+* ``serial`` -- one connection is established at a time, across all hosts
+  and threads.  This is the default on Windows, where the crash workaround
+  is needed.
+* ``per_host`` -- up to *width* connections per host are established at
+  once (``DEFAULT_WIDTH`` unless configured).  This is the default
+  elsewhere.
+
+A width of 0 selects the platform default; any other width selects
+``per_host`` with that width.  Bodies are streamed outside the gate, as
+before.
+
+A host's slots are a list of plain ``Lock`` lanes.  A waiter tries every
+lane, then blocks on one of them with a short timeout and looks again.
+This avoids ``threading.Semaphore``/``Condition``, for the same Windows /
+Python 3.14 reasons as the download threads.
+"""
+
+from __future__ import annotations
+
+import itertools
+import sys
+import threading
+from contextlib import contextmanager
+from typing import Callable, Dict, Iterator, List, Optional
+
+from kemonodownloader.rate_limiter import host_of
+
+# ---------------------------------------------------------------------------
+# Constants
+# ---------------------------------------------------------------------------
+
+SERIAL = "serial"
+PER_HOST = "per_host"
+
+# Connections established at once per host under the per-host policy.
+DEFAULT_WIDTH = 6
+MAX_WIDTH = 64
+_WAIT_SLICE = 0.05
+# Lane key shared by every host under the serial policy.
+_ALL_HOSTS = "*"
+
+
+def default_policy(platform: Optional[str] = None) -> str:
+    """Return the policy used when no width is configured on *platform*."""
+    platform = sys.platform if platform is None else platform
+    return SERIAL if platform.startswith("win") else PER_HOST
+
+
+# ---------------------------------------------------------------------------
+# Gate
+# ---------------------------------------------------------------------------
+
+
+class ConnectionGate:
+    """Per-host (or process-wide) connection-establishment slots."""
+
+    def __init__(self, width: int = 0, platform: Optional[str] = None):
+        self._lock = threading.Lock()
+        self._lanes: Dict[str, List[threading.Lock]] = {}
+        self._turn = itertools.count()
+        self.policy = PER_HOST
+        self.width = DEFAULT_WIDTH
+        self.configure(width, platform)
+
+    def configure(self, width: int = 0, platform: Optional[str] = None) -> None:
+        """Set the width; 0 picks the default policy of *platform*."""
+        width = max(0, min(int(width), MAX_WIDTH))
+        if width:
+            policy = PER_HOST
+        else:
+            policy = default_policy(platform)
+            width = 1 if policy == SERIAL else DEFAULT_WIDTH
+        with self._lock:
+            if (policy, width) == (self.policy, self.width):
+                return
+            self.policy = policy
+            self.width = width
+            # Holders release the lanes they took; new requests use fresh
+            # ones, so a change applies at once.
+            self._lanes = {}
+
+    def _lanes_for(self, url: str) -> List[threading.Lock]:
+        with self._lock:
+            key = _ALL_HOSTS if self.policy == SERIAL else host_of(url)
+            lanes = self._lanes.get(key)
+            if lanes is None:
+                lanes = [threading.Lock() for _ in range(self.width)]
+                self._lanes[key] = lanes
+            return lanes
+
+    def acquire(
+        self, url: str, should_continue: Optional[Callable[[], bool]] = None
+    ) -> Optional[threading.Lock]:
+        """Wait for a slot for *url*'s host and return the lane taken.
+
+        Returns ``None`` when *should_continue* turned false first.
+        """
+        lanes = self._lanes_for(url)
+        waiting_on = lanes[next(self._turn) % len(lanes)]
+        while should_continue is None or should_continue():
+            for lane in lanes:
+                if lane.acquire(blocking=False):
+                    return lane
+            if waiting_on.acquire(timeout=_WAIT_SLICE):
+                return waiting_on
+        return None
+
+    @contextmanager
+    def establishing(
+        self, url: str, should_continue: Optional[Callable[[], bool]] = None
+    ) -> Iterator[bool]:
+        """Hold a slot while a request to *url* connects.
+
+        Yields False when *should_continue* turned false before a slot
+        was free; the caller must not connect then.
+        """
+        lane = self.acquire(url, should_continue)
+        try:
+            yield lane is not None
+        finally:
+            if lane is not None:
+                lane.release()
+
+
+_gate = ConnectionGate()
+
+
+def get_connection_gate() -> ConnectionGate:
+    """Return the gate shared by every download thread in the process."""
+    return _gate
@@ -1,11 +1,8 @@
 import asyncio
 import ctypes
-import gzip
 import hashlib
-import json
 import locale
 import os
-import re
 import threading
 import time
 from typing import Optional
@@ -37,15 +34,84 @@ from PyQt6.QtWidgets import (
     QVBoxLayout,
     QWidget,
 )
-from requests.adapters import HTTPAdapter  # type: ignore[import]
 
-from kemonodownloader.domain_config import (
-    clean_file_url,
-    get_domain_config,
-    get_domains,
+from kemonodownloader.aiohttp_engine import (
+    ENGINE_AIOHTTP,
+    ENGINE_REQUESTS,
+    RETRYABLE_ERRORS,
+    UnsupportedProxyError,
+    create_client_session,
+    stream_range_to_file,
+    stream_to_file,
+)
+from kemonodownloader.api_cache import CachingAdapter
+from kemonodownloader.concurrency import create_controller, is_throttled_error
+from kemonodownloader.connection_gate import get_connection_gate
+from kemonodownloader.dedupe import find_local_copy
+from kemonodownloader.deep_verify import get_deep_verifier
+from kemonodownloader.domain_config import get_domain_config, get_domains
+from kemonodownloader.download_core import (
+    CoreSettings,
+    CreatorRef,
+    DownloadCore,
+    DownloadListener,
+    adopt_local_copy,
+    complete_part,
+    creator_folder_for,
+    detect_post_files,
+    intact_download,
+    listing_record_usable,
+    post_entry,
+    render_file_name,
+    sanitize_filename,
+    split_file_name,
+    target_folder_for,
+    transfer_to_part,
+)
+from kemonodownloader.download_feed import DownloadFeed, Wakeup
+from kemonodownloader.download_scheduler import get_download_scheduler
+from kemonodownloader.fast_pipeline import (
+    PREPARING,
+    READY,
+    FastModePipeline,
+    PreparedCreator,
 )
 from kemonodownloader.hash_db import HashDB
 from kemonodownloader.kd_language import translate
+from kemonodownloader.post_completion import (
+    completed_post_ids,
+    creator_key,
+    record_post_complete,
+    selection_key,
+)
+from kemonodownloader.prep_pool import PrepPool
+from kemonodownloader.progress import ProgressAggregator, format_bytes, format_duration
+from kemonodownloader.rate_limiter import (
+    RequestCancelled,
+    cancellable,
+    get_rate_limiter,
+    host_of,
+)
+from kemonodownloader.resumable import (
+    DownloadCancelled,
+    IncompleteDownloadError,
+    StreamHasher,
+    hash_file,
+    part_path_for,
+)
+from kemonodownloader.retry_schedule import RetryLater, RetrySchedule, backoff_delay
+from kemonodownloader.segmented import (
+    SegmentedDownloadRequired,
+    SegmentedFile,
+    SegmentFailedError,
+    SegmentJob,
+    check_segment_response,
+    segment_range_headers,
+    segmented_paths,
+    server_sha256,
+    should_segment,
+    split_ranges,
+)
 
 
 class ThreadSettings:
@@ -59,6 +125,13 @@ class ThreadSettings:
         api_request_max_retries,
         simultaneous_downloads,
         settings_tab=None,
+        download_engine=ENGINE_REQUESTS,
+        segmented_threshold_mb=0,
+        segmented_segments=4,
+        listing_prep=True,
+        incremental_sync=False,
+        skip_completed=False,
+        stream_prep=False,
     ):
         self.creator_posts_max_attempts = creator_posts_max_attempts
         self.post_data_max_retries = post_data_max_retries
@@ -66,6 +139,69 @@ class ThreadSettings:
         self.api_request_max_retries = api_request_max_retries
         self.simultaneous_downloads = simultaneous_downloads
         self.settings_tab = settings_tab
+        self.download_engine = download_engine
+        # Files of at least this many MB are fetched as parallel byte
+        # ranges when the server supports it; 0 disables segmentation.
+        self.segmented_threshold_mb = segmented_threshold_mb
+        self.segmented_segments = segmented_segments
+        # Detect files from the records returned by the creator listing and
+        # only fetch /post/{id} for records that lack the needed fields.
+        self.listing_prep = listing_prep
+        # Stop creator detection at the first page of already known posts.
+        self.incremental_sync = incremental_sync
+        # Drop posts an earlier run downloaded completely before preparing.
+        self.skip_completed = skip_completed
+        # Download each post's files as soon as it is prepared.
+        self.stream_prep = stream_prep
+
+
+def create_concurrency_controller(settings_tab, fixed_limit, on_change=None):
+    """Return the worker-count controller configured in the Settings tab.
+
+    Fixed mode keeps *fixed_limit*; adaptive mode starts there and moves
+    within the user's min/max bounds (see ``concurrency``).  Without a
+    Settings tab the limit stays fixed.
+    """
+    if settings_tab is None:
+        return create_controller(fixed_limit, on_change=on_change)
+    return create_controller(
+        fixed_limit,
+        adaptive=settings_tab.is_adaptive_concurrency_enabled(),
+        min_limit=settings_tab.get_adaptive_min_concurrency(),
+        max_limit=settings_tab.get_adaptive_max_concurrency(),
+        on_change=on_change,
+    )
+
+
+def configure_download_scheduler(settings_tab, fixed_limit):
+    """Apply the Settings tab's caps to the process-wide download scheduler.
+
+    The global cap is the most a download thread may run at once: the fixed
+    limit, or the adaptive maximum in adaptive mode.  The per-creator cap
+    is optional (0 disables it).  The connection gate's width is applied
+    too (0 keeps the platform default).  Without a Settings tab only the
+    fixed limit applies.
+    """
+    scheduler = get_download_scheduler()
+    if settings_tab is None:
+        get_connection_gate().configure(0)
+        scheduler.configure(fixed_limit, 0)
+        return scheduler
+    get_connection_gate().configure(settings_tab.get_connection_setup_width())
+    global_limit = fixed_limit
+    if settings_tab.is_adaptive_concurrency_enabled():
+        global_limit = settings_tab.get_adaptive_max_concurrency()
+    scheduler.configure(global_limit, settings_tab.get_per_creator_download_limit())
+    return scheduler
+
+
+def open_completion_db(other_files_dir, download_folder):
+    """Open the hash database used to skip completed posts and sync creators.
+
+    Paths of library files are stored relative to the download folder, so
+    the database must know it to find them on disk.
+    """
+    return HashDB(other_files_dir, base_dir=download_folder or None)
 
 
 try:
@@ -159,8 +295,11 @@ def get_session(settings_tab=None):
         # via winreg cause "access violation" crashes.  The app manages
         # its own proxy settings through the Settings tab instead.
         session.trust_env = False
-        # Configure connection pool (per-thread, so modest sizes suffice)
-        adapter = HTTPAdapter(
+        # Configure connection pool (per-thread, so modest sizes suffice).
+        # The adapter paces requests through the process-wide per-host
+        # rate limiter shared by every thread and answers API requests
+        # from the on-disk response cache when it can.
+        adapter = CachingAdapter(
             pool_connections=10, pool_maxsize=10, max_retries=3, pool_block=False
         )
         session.mount("http://", adapter)
@@ -185,7 +324,7 @@ def get_session(settings_tab=None):
                 if socks_session is None:
                     socks_session = requests.Session()
                     socks_session.trust_env = False
-                    socks_adapter = HTTPAdapter(
+                    socks_adapter = CachingAdapter(
                         pool_connections=5,
                         pool_maxsize=5,
                         max_retries=3,
@@ -323,39 +462,103 @@ class ImageModal(QDialog):
         QMessageBox.critical(self, translate("image_load_error"), error_message)
 
 
+class ThreadListener(DownloadListener):
+    """Forwards the log of a ``DownloadCore`` to its QThread's ``log`` signal."""
+
+    def __init__(self, thread):
+        self.thread = thread
+
+    def log(self, message, level):
+        self.thread.log.emit(message, level)
+
+
+class DetectionListener(ThreadListener):
+    def page_detected(self, url, posts):
+        self.thread.emit_page(posts)
+
+
+class PreparationListener(ThreadListener):
+    def throttled(self, url):
+        self.thread.concurrency.record_failure(throttled=True)
+
+
+class ThreadCore(DownloadCore):
+    """``DownloadCore`` working for a QThread of this module.
+
+    It runs as long as the thread does and talks to the API through the
+    GUI's per-thread sessions and headers.
+    """
+
+    def __init__(self, thread, settings, listener, hash_db=None):
+        self.thread = thread
+        super().__init__(settings, listener, hash_db)
+
+    @property
+    def is_running(self):
+        return self.thread.is_running
+
+    @is_running.setter
+    def is_running(self, value):
+        self.thread.is_running = value
+
+    def session(self):
+        return get_session(self.thread.settings.settings_tab)
+
+    def headers(self, domain_config):
+        headers = get_headers().copy()
+        headers["Referer"] = domain_config["referer"]
+        return headers
+
+
 class PostDetectionThread(QThread):
+    """Detect a creator's posts with ``DownloadCore.detect_posts``.
+
+    Every listing page is emitted on ``posts_batch`` as it arrives, and
+    all posts on ``finished`` once the walk is over.
+    """
+
     finished = pyqtSignal(list)
     posts_batch = pyqtSignal(list)
     log = pyqtSignal(str, str)
     error = pyqtSignal(str)
 
-    def __init__(self, url, post_titles_map, settings):
+    def __init__(self, url, post_titles_map, settings, sync_db=None):
         super().__init__()
         self.url = url
         self.post_titles_map = post_titles_map  # Shared dictionary to store post titles
         self.settings = settings
         self.is_running = True
         self.domain_config = get_domain_config(url)
+        # Raw listing records by post id, kept for listing-only preparation.
+        self.post_records = {}
+        # HashDB holding each creator's newest known post; with incremental
+        # sync enabled the scan stops at the first page of known posts.
+        self.sync_db = sync_db
+        # SyncUpdate of a complete incremental scan; the marker moves once
+        # preparation and download settle its posts.
+        self.sync_update = None
+        self._ref = None
 
     def stop(self):
         self.is_running = False
 
-    def run(self):
-        try:
-            if not self.is_running:
-                return
-
-            # Parse URL to handle query parameters correctly and extract clean ID and service
-            parsed_url = urlparse(self.url)
-            path = parsed_url.path.strip("/")
-            path_parts = path.split("/")
-        except Exception as e:  # Top-level protection to at least log Python exceptions
-            try:
-                self.log.emit(translate("log_error", str(e)), "ERROR")
-                self.error.emit(str(e))
-            except Exception:
-                pass
-            return
+    def emit_page(self, posts):
+        """Record the titles of a listing page and emit it on ``posts_batch``."""
+        ref = self._ref
+        batch_posts = []
+        for post in posts:
+            entry = post_entry(post, self.domain_config)
+            self.post_titles_map[(ref.service, ref.creator_id, post["id"])] = (
+                sanitize_filename(entry[0])
+            )
+            batch_posts.append(entry)
+        self.posts_batch.emit(batch_posts)
+
+    def parse_url(self):
+        """Return the ``CreatorRef`` of ``url``, or None when it names no creator."""
+        # Parse URL to handle query parameters correctly and extract clean ID and service
+        parsed_url = urlparse(self.url)
+        path_parts = parsed_url.path.strip("/").split("/")
         # Check validity.
         # path_parts should end with user/{id}
         # Example: fanbox/user/12345 -> parts: ['fanbox', 'user', '12345']
@@ -374,54 +577,22 @@ class PostDetectionThread(QThread):
                 or (self.domain_config["domain"] not in self.url)
                 or parts[-2] != "user"
             ):
-                self.error.emit(translate("invalid_url_format"))
-                return
-            else:
-                # If fallback worked (e.g. some weird URL structure I didn't anticipate)
-                service, creator_id = parts[-3], parts[-1]
-                # Clean creator_id from potential query params if using split
-                if "?" in creator_id:
-                    creator_id = creator_id.split("?")[0]
+                return None
+            # If fallback worked (e.g. some weird URL structure I didn't anticipate)
+            service, creator_id = parts[-3], parts[-1]
+            # Clean creator_id from potential query params if using split
+            if "?" in creator_id:
+                creator_id = creator_id.split("?")[0]
         else:
             service = path_parts[-3]
             creator_id = path_parts[-1]
 
-        self.log.emit(
-            translate("log_info", translate("checking_creator_with_url", self.url)),
-            "INFO",
-        )
-        self.log.emit(
-            translate(
-                "log_debug",
-                translate("parsed_url_service_creator", service, creator_id),
-            ),
-            "INFO",
-        )
-
-        base_api_url = f"{self.domain_config['api_base']}/{service}/user/{creator_id}"
-        self.log.emit(
-            translate("log_debug", translate("base_api_url", base_api_url)), "INFO"
-        )
-
-        # Parse query parameters
         query_params = parse_qs(parsed_url.query)
-        search_query = query_params.get("q", [None])[0]
         offset_param = query_params.get("o", [None])[0]
-
-        start_offset = 0
-        single_page_target = False
-
+        offset = None
         if offset_param:
             try:
-                start_offset = int(offset_param)
-                single_page_target = True
-                self.log.emit(
-                    translate(
-                        "log_info",
-                        f"Validation started with specific offset: {start_offset}",
-                    ),
-                    "INFO",
-                )
+                offset = int(offset_param)
             except ValueError:
                 self.log.emit(
                     translate(
@@ -429,414 +600,36 @@ class PostDetectionThread(QThread):
                     ),
                     "WARNING",
                 )
+        return CreatorRef(service, creator_id, query_params.get("q", [None])[0], offset)
 
-        if search_query:
-            self.log.emit(
-                translate("log_info", f"Search query detected: {search_query}"), "INFO"
-            )
-
-        all_posts = []
-        offset = start_offset
-        page_size = 50
-        max_attempts = self.settings.creator_posts_max_attempts
-
-        attempt = 1
-        while attempt <= max_attempts and self.is_running:
-            # Construct query string suffix
-            query_suffix = f"?o={offset}"
-            if search_query:
-                query_suffix += f"&q={search_query}"
-
-            alternative_urls = [
-                f"{self.domain_config['api_base']}/{service}/user/{creator_id}/posts{query_suffix}",  # Try with /posts suffix
-                f"{base_api_url}{query_suffix}",  # Original format as fallback
-                f"{self.domain_config['base_url']}/api/{service}/user/{creator_id}{query_suffix}",  # Try without v1
-            ]
-
-            # Add variant with explicit offset/limit/q if needed, though usually standard params work
-            # For 4th option in original code:
-            alt_suffix_4 = f"?offset={offset}&limit={page_size}"
-            if search_query:
-                alt_suffix_4 += f"&q={search_query}"
-            alternative_urls.append(f"{base_api_url}{alt_suffix_4}")
-
-            success = False
-            response = None
-            likely_last_page = len(all_posts) > 0 and len(all_posts) % page_size != 0
-
-            for alt_url in alternative_urls:
-                if not self.is_running:
-                    return
-                self.log.emit(
-                    translate("log_debug", translate("trying_endpoint", alt_url)),
-                    "DEBUG",
-                )
-
-                fallback_headers = {
-                    "User-Agent": get_user_agent(),
-                    "Accept": "text/css",
-                    "Accept-Language": accept_language,
-                    "Connection": "keep-alive",
-                    "Cache-Control": "max-age=0",
-                    "Referer": self.domain_config["referer"],
-                }
-
-                try:
-                    alt_response = get_session(self.settings.settings_tab).get(
-                        alt_url, headers=fallback_headers, timeout=15
-                    )
-                    if alt_response.status_code == 200:
-                        response = alt_response
-                        self.log.emit(
-                            translate(
-                                "log_info", translate("endpoint_successful", alt_url)
-                            ),
-                            "INFO",
-                        )
-                        success = True
-                        break
-                    else:
-                        if likely_last_page or len(all_posts) > 0:
-                            self.log.emit(
-                                translate(
-                                    "log_debug",
-                                    translate(
-                                        "endpoint_returned_status_likely_end",
-                                        alt_response.status_code,
-                                        alt_url,
-                                    ),
-                                ),
-                                "DEBUG",
-                            )
-                        else:
-                            self.log.emit(
-                                translate(
-                                    "log_debug",
-                                    translate(
-                                        "endpoint_failed_with_status",
-                                        alt_url,
-                                        alt_response.status_code,
-                                    ),
-                                ),
-                                "DEBUG",
-                            )
-                except requests.RequestException as alt_e:
-                    if likely_last_page or len(all_posts) > 0:
-                        self.log.emit(
-                            translate(
-                                "log_debug",
-                                translate(
-                                    "endpoint_unavailable_likely_end",
-                                    alt_url,
-                                    str(alt_e),
-                                ),
-                            ),
-                            "DEBUG",
-                        )
-                    else:
-                        self.log.emit(
-                            translate(
-                                "log_debug",
-                                translate(
-                                    "endpoint_error_with_exception", alt_url, str(alt_e)
-                                ),
-                            ),
-                            "DEBUG",
-                        )
-
-            if not success:
-                if len(all_posts) > 0:
-                    self.log.emit(
-                        translate(
-                            "log_info",
-                            translate("reached_last_page", creator_id, len(all_posts)),
-                        ),
-                        "INFO",
-                    )
-                    break
-                else:
-                    self.log.emit(
-                        translate(
-                            "log_error",
-                            translate("all_api_endpoints_failed", creator_id),
-                        ),
-                        "ERROR",
-                    )
-                    break
-
+    def run(self):
+        try:
             if not self.is_running:
                 return
-
-            response_text = ""
+            ref = self.parse_url()
+        except Exception as e:  # Top-level protection to at least log Python exceptions
             try:
-
-                if response is None:  # pragma: no cover
-                    self.log.emit("No response received from any endpoint", "ERROR")
-                    attempt += 1
-                    continue
-
-                is_gzipped = response.content[:2] == b"\x1f\x8b"
-
-                if is_gzipped:
-                    try:
-                        decompressed = gzip.decompress(response.content)
-                        response_text = decompressed.decode("utf-8")
-                        self.log.emit(
-                            translate(
-                                "log_debug",
-                                translate("successfully_decompressed_gzipped_response"),
-                            ),
-                            "DEBUG",
-                        )
-                    except (gzip.BadGzipFile, UnicodeDecodeError, EOFError) as e:
-                        self.log.emit(
-                            translate(
-                                "log_warning",
-                                translate("gzip_decompression_failed", str(e)),
-                            ),
-                            "WARNING",
-                        )
-                        response_text = getattr(response, "text", "")
-                else:
-                    # Content is not gzipped, use as plain text
-                    response_text = getattr(response, "text", "")
-
-                # Check if response is empty or just whitespace
-                if not response_text.strip():
-                    self.log.emit(
-                        translate(
-                            "log_info", translate("empty_response_at_offset", offset)
-                        ),
-                        "INFO",
-                    )
-                    break
-
-                if not self.is_running:
-                    return
-
-                posts_data = json.loads(response_text or "")
-
-            except (json.JSONDecodeError, UnicodeDecodeError) as e:
-                self.log.emit(
-                    translate(
-                        "log_error", translate("failed_to_parse_response", str(e))
-                    ),
-                    "ERROR",
-                )
-                self.log.emit(
-                    translate(
-                        "log_debug",
-                        translate(
-                            "response_content_first_500_chars",
-                            (response_text or "")[:500],
-                        ),
-                    ),
-                    "DEBUG",
-                )
-                break
-
-            if not isinstance(posts_data, list):
-                # Sometimes the API returns an object with a posts array
-                if isinstance(posts_data, dict):
-                    if "posts" in posts_data:
-                        posts_data = posts_data["posts"]
-                    elif "data" in posts_data:
-                        posts_data = posts_data["data"]
-                    else:
-                        self.log.emit(
-                            translate(
-                                "log_error",
-                                translate(
-                                    "unexpected_response_structure",
-                                    (
-                                        list(posts_data.keys())
-                                        if posts_data
-                                        else "empty dict"
-                                    ),
-                                ),
-                            ),
-                            "ERROR",
-                        )
-                        break
-                else:
-                    self.log.emit(
-                        translate(
-                            "log_error",
-                            translate("invalid_posts_data_type", type(posts_data)),
-                        ),
-                        "ERROR",
-                    )
-                    break
-
-            self.log.emit(
-                translate(
-                    "log_debug",
-                    translate("fetched_posts_at_offset", len(posts_data), offset),
-                ),
-                "DEBUG",
-            )
-
-            if len(posts_data) < page_size and len(posts_data) > 0:
-                self.log.emit(
-                    translate(
-                        "log_info",
-                        translate(
-                            "received_less_than_page_size", len(posts_data), page_size
-                        ),
-                    ),
-                    "INFO",
-                )
-
-            for post in posts_data:
-                if not isinstance(post, dict):
-                    continue
-                post_id = post.get("id")
-                if not post_id:
-                    continue
-                title = post.get("title", f"Post {post_id}")
-                self.log.emit(
-                    translate(
-                        "log_debug", translate("post_id_and_title", post_id, title)
-                    ),
-                    "DEBUG",
-                )
-                # Store title in shared post_titles_map
-                self.post_titles_map[(service, creator_id, post_id)] = (
-                    sanitize_filename(title)
-                )
-
-            if not posts_data:
-                self.log.emit(
-                    translate("log_info", translate("no_more_posts_at_offset", offset)),
-                    "INFO",
-                )
-                break
-
-            # Process posts for this batch
-            batch_posts = []
-            for post in posts_data:
-                if not isinstance(post, dict):
-                    continue
-                post_id = post.get("id")
-                if not post_id:
-                    continue
-                title = post.get("title", f"Post {post_id}")
-                thumbnail_url = None
-                if "file" in post and post["file"] and "path" in post["file"]:
-                    if (
-                        post["file"]["path"]
-                        .lower()
-                        .endswith((".jpg", ".jpeg", ".png", ".gif", ".webp"))
-                    ):
-                        thumbnail_url = clean_file_url(
-                            post["file"]["path"], self.domain_config
-                        )
-                if not thumbnail_url and "attachments" in post:
-                    for attachment in post["attachments"]:
-                        if (
-                            isinstance(attachment, dict)
-                            and "path" in attachment
-                            and attachment["path"]
-                            .lower()
-                            .endswith((".jpg", ".jpeg", ".png", ".gif", ".webp"))
-                        ):
-                            thumbnail_url = clean_file_url(
-                                attachment["path"], self.domain_config
-                            )
-                            break
-                if (
-                    not thumbnail_url
-                    and "file" in post
-                    and post["file"]
-                    and "path" in post["file"]
-                ):
-                    thumbnail_url = clean_file_url(
-                        post["file"]["path"], self.domain_config
-                    )
-                batch_posts.append((title, (post_id, thumbnail_url)))
-
-            all_posts.extend(posts_data)
-
-            # Emit batch of processed posts
-            if batch_posts:
-                self.posts_batch.emit(batch_posts)
-
-            # If user requested a single page (via offset parameter), stop after the first successful batch
-            if single_page_target:
-                self.log.emit(
-                    translate("log_info", "Single page request satisfied, stopping."),
-                    "INFO",
-                )
-                break
-
-            if len(posts_data) < page_size:
-                self.log.emit(
-                    translate(
-                        "log_info",
-                        translate(
-                            "last_page_reached_with_counts",
-                            len(posts_data),
-                            page_size,
-                            len(all_posts),
-                        ),
-                    ),
-                    "INFO",
-                )
-                break
-
-            offset += page_size
-            attempt += 1
-            time.sleep(0.5)
-
-        if self.is_running:
-            detected_posts = []
-            for post in all_posts:
-                post_id = post.get("id")
-                title = post.get("title", f"Post {post_id}")
-                thumbnail_url = None
-                if "file" in post and post["file"] and "path" in post["file"]:
-                    if (
-                        post["file"]["path"]
-                        .lower()
-                        .endswith((".jpg", ".jpeg", ".png", ".gif", ".webp"))
-                    ):
-                        thumbnail_url = clean_file_url(
-                            post["file"]["path"], self.domain_config
-                        )
-                if not thumbnail_url and "attachments" in post:
-                    for attachment in post["attachments"]:
-                        if (
-                            isinstance(attachment, dict)
-                            and "path" in attachment
-                            and attachment["path"]
-                            .lower()
-                            .endswith((".jpg", ".jpeg", ".png", ".gif", ".webp"))
-                        ):
-                            thumbnail_url = clean_file_url(
-                                attachment["path"], self.domain_config
-                            )
-                            break
-                if (
-                    not thumbnail_url
-                    and "file" in post
-                    and post["file"]
-                    and "path" in post["file"]
-                ):
-                    thumbnail_url = clean_file_url(
-                        post["file"]["path"], self.domain_config
-                    )
-                detected_posts.append((title, (post_id, thumbnail_url)))
-
-            self.log.emit(
-                translate(
-                    "log_info",
-                    translate(
-                        "total_posts_fetched_for_creator", self.url, len(detected_posts)
-                    ),
-                ),
-                "INFO",
-            )
-            self.finished.emit(detected_posts)
+                self.log.emit(translate("log_error", str(e)), "ERROR")
+                self.error.emit(str(e))
+            except Exception:
+                pass
+            return
+        if ref is None:
+            self.error.emit(translate("invalid_url_format"))
+            return
+        self._ref = ref
+        settings = CoreSettings(
+            "",
+            max_pages=self.settings.creator_posts_max_attempts,
+            incremental=self.sync_db is not None and self.settings.incremental_sync,
+        )
+        core = ThreadCore(self, settings, DetectionListener(self), self.sync_db)
+        posts, sync_update = core.detect_posts(self.url, ref, self.domain_config)
+        if not self.is_running:
+            return
+        self.sync_update = sync_update
+        self.post_records = {str(post.get("id")): post for post in posts}
+        self.finished.emit([post_entry(post, self.domain_config) for post in posts])
 
 
 class PostPopulationThread(QThread):
@@ -921,6 +714,9 @@ class FilePreparationThread(QThread):
     log = pyqtSignal(str, str)
     error = pyqtSignal(str)
 
+    # Backoff window for the first retry of a post fetch; doubles per attempt.
+    PREP_RETRY_BASE_DELAY = 2.0
+
     def __init__(
         self,
         post_ids,
@@ -931,148 +727,150 @@ class FilePreparationThread(QThread):
         creator_content_check,
         settings,
         max_concurrent=20,
+        post_records=None,
     ):
         super().__init__()
         self.post_ids = post_ids
         self.all_files_map = all_files_map
+        self.post_records = post_records or {}
+        self._post_attempts = None
         self.creator_ext_checks = creator_ext_checks
         self.creator_main_check = creator_main_check
         self.creator_attachments_check = creator_attachments_check
         self.creator_content_check = creator_content_check
         self.settings = settings
         self.max_concurrent = max_concurrent
+        self.concurrency = create_concurrency_controller(
+            settings.settings_tab,
+            max_concurrent,
+            on_change=self._on_concurrency_changed,
+        )
+        # HashDB with post completion records; when set, posts an earlier
+        # run finished with the same file selection are not prepared again.
+        self.completion_db = None
+        self.skipped_posts = set()
+        # SyncUpdate of the detection that found these posts; posts skipped
+        # as complete or prepared without files are settled here.
+        self.sync_update = None
+        # DownloadFeed to stream each post's files to a download thread
+        # that runs alongside; finished then carries empty results.
+        self.feed = None
+        self._prep_pool = None
+        self._feed_room = None
         self.is_running = True
 
     def stop(self):
         self.is_running = False
+        pool = self._prep_pool
+        if pool is not None:
+            pool.stop()
+        # Read after is_running is cleared: a waiter that registers later
+        # sees the flag before it blocks.
+        feed_room = self._feed_room
+        if feed_room is not None:
+            feed_room.set()
+
+    def _wait_for_feed_room(self):
+        """Block while the feed is full, until the download thread takes files."""
+        feed = self.feed
+        if feed is None or feed.has_room():
+            return
+        feed_room = Wakeup()
+        self._feed_room = feed_room
+        feed.set_producer_wakeup(feed_room.set)
+        try:
+            while self.is_running and not feed.has_room():
+                # take(), close() and stop() set the wakeup.
+                feed_room.wait()
+        finally:
+            feed.set_producer_wakeup(None)
+            self._feed_room = None
+
+    def _on_concurrency_changed(self, limit):
+        try:
+            self.log.emit(
+                translate(
+                    "log_info", translate("effective_concurrency_changed", limit)
+                ),
+                "INFO",
+            )
+        except RuntimeError:
+            pass
+
+    def make_core(self):
+        """Return the ``DownloadCore`` posts are fetched through."""
+        settings = CoreSettings("", max_retries=self.settings.post_data_max_retries)
+        core = ThreadCore(self, settings, PreparationListener(self))
+        core.RETRY_BASE_DELAY = self.PREP_RETRY_BASE_DELAY
+        return core
 
     def detect_files(self, post, allowed_extensions, domain_config):
-        files_to_download = []
-        self.log.emit(
-            translate(
-                "log_debug", translate("detecting_files_for_post", allowed_extensions)
-            ),
-            "INFO",
+        return detect_post_files(
+            post,
+            allowed_extensions,
+            domain_config,
+            main=self.creator_main_check,
+            attachments=self.creator_attachments_check,
+            content=self.creator_content_check,
+            log=self.log.emit,
         )
 
-        def get_effective_extension(file_path, file_name):
-            name_ext = os.path.splitext(file_name)[1].lower()
-            path_ext = os.path.splitext(file_path)[1].lower()
-            return name_ext if name_ext else path_ext
+    def drop_completed_posts(self, work_items, allowed_extensions):
+        """Return *work_items* without the posts an earlier run completed.
 
-        # Main file detection
-        if (
-            self.creator_main_check
-            and "file" in post
-            and post["file"]
-            and "path" in post["file"]
-        ):
-            file_path = post["file"]["path"]
-            file_name = post["file"].get("name", "")
-            file_ext = get_effective_extension(file_path, file_name)
-            file_url = clean_file_url(file_path, domain_config)
-            if "f=" not in file_url and file_name:
-                file_url += f"?f={file_name}"
+        Dropped post ids are collected in ``skipped_posts``.
+        """
+        selection = selection_key(
+            allowed_extensions,
+            self.creator_main_check,
+            self.creator_attachments_check,
+            self.creator_content_check,
+        )
+        done_by_creator = {}
+        for creator_url in {curl for _, curl in work_items}:
+            key = creator_key(creator_url)
+            if key is None:
+                done_by_creator[creator_url] = set()
+                continue
+            done_by_creator[creator_url] = completed_post_ids(
+                self.completion_db, key[0], key[1], selection, self.post_records
+            )
+        remaining = []
+        for pid, curl in work_items:
+            if str(pid) in done_by_creator[curl]:
+                self.skipped_posts.add(pid)
+            else:
+                remaining.append((pid, curl))
+        if self.sync_update is not None:
+            self.sync_update.settle(self.skipped_posts)
+        if self.skipped_posts:
             self.log.emit(
                 translate(
-                    "log_debug", translate("checking_main_file", file_name, file_ext)
+                    "log_info",
+                    translate("completed_posts_skipped", len(self.skipped_posts)),
                 ),
                 "INFO",
             )
-            if ".jpg" in allowed_extensions and file_ext in [".jpg", ".jpeg"]:
-                self.log.emit(
-                    translate("log_debug", translate("added_main_file", file_name)),
-                    "INFO",
-                )
-                files_to_download.append((file_name, file_url))
-            elif file_ext in allowed_extensions:
-                self.log.emit(
-                    translate("log_debug", translate("added_main_file", file_name)),
-                    "INFO",
-                )
-                files_to_download.append((file_name, file_url))
-
-        # Attachments detection
-        if self.creator_attachments_check and "attachments" in post:
-            for attachment in post["attachments"]:
-                if isinstance(attachment, dict) and "path" in attachment:
-                    attachment_path = attachment["path"]
-                    attachment_name = attachment.get("name", "")
-                    attachment_ext = get_effective_extension(
-                        attachment_path, attachment_name
-                    )
-                    attachment_url = clean_file_url(attachment_path, domain_config)
-                    if "f=" not in attachment_url and attachment_name:
-                        attachment_url += f"?f={attachment_name}"
-                    self.log.emit(
-                        translate(
-                            "log_debug",
-                            translate(
-                                "checking_attachment", attachment_name, attachment_ext
-                            ),
-                        ),
-                        "INFO",
-                    )
-                    if ".jpg" in allowed_extensions and attachment_ext in [
-                        ".jpg",
-                        ".jpeg",
-                    ]:
-                        self.log.emit(
-                            translate(
-                                "log_debug",
-                                translate("added_attachment", attachment_name),
-                            ),
-                            "INFO",
-                        )
-                        files_to_download.append((attachment_name, attachment_url))
-                    elif attachment_ext in allowed_extensions:
-                        self.log.emit(
-                            translate(
-                                "log_debug",
-                                translate("added_attachment", attachment_name),
-                            ),
-                            "INFO",
-                        )
-                        files_to_download.append((attachment_name, attachment_url))
-
-        # Content images detection
-        if self.creator_content_check and "content" in post and post["content"]:
-            soup = BeautifulSoup(post["content"], "html.parser")
-            for img in soup.select("img[src]"):
-                img_url = clean_file_url(str(img.get("src")), domain_config)
-                img_ext = os.path.splitext(img_url)[1].lower()
-                img_name = os.path.basename(img_url)
-                self.log.emit(
-                    translate(
-                        "log_debug",
-                        translate("checking_content_image", img_name, img_ext),
-                    ),
-                    "INFO",
-                )
-                if ".jpg" in allowed_extensions and img_ext in [".jpg", ".jpeg"]:
-                    self.log.emit(
-                        translate(
-                            "log_debug", translate("added_content_image", img_name)
-                        ),
-                        "INFO",
-                    )
-                    files_to_download.append((img_name, img_url))
-                elif img_ext in allowed_extensions:
-                    self.log.emit(
-                        translate(
-                            "log_debug", translate("added_content_image", img_name)
-                        ),
-                        "INFO",
-                    )
-                    files_to_download.append((img_name, img_url))
+        return remaining
 
-        self.log.emit(
-            translate(
-                "log_debug", translate("total_files_detected", len(files_to_download))
-            ),
-            "INFO",
-        )
-        return list(dict.fromkeys(files_to_download))
+    def build_work_items(self):
+        """Return the ``(post_id, creator_url)`` pairs to prepare.
+
+        One pass over ``all_files_map`` indexes the creator(s) of every
+        post, so the work list is built in linear time, in ``post_ids``
+        order.
+        """
+        creators_by_post = {}
+        for creator_url, posts in self.all_files_map.items():
+            for _, (post_id, _) in posts:
+                creators = creators_by_post.setdefault(post_id, [])
+                if creator_url not in creators:
+                    creators.append(creator_url)
+        return [
+            (post_id, creator_url)
+            for post_id in dict.fromkeys(self.post_ids)
+            for creator_url in creators_by_post.get(post_id, ())
+        ]
 
     def fetch_and_detect_files(self, post_id, creator_url):
         creator_url = creator_url.rstrip("/")
@@ -1089,104 +887,52 @@ class FilePreparationThread(QThread):
             service = "unknown_service"
             creator_id = "unknown_creator"
         domain_config = get_domain_config(creator_url)
-        api_url = (
-            f"{domain_config['api_base']}/{service}/user/{creator_id}/post/{post_id}"
-        )
+        core = self.make_core()
         max_retries = self.settings.post_data_max_retries
-        retry_delay_seconds = 5
-        for attempt in range(1, max_retries + 1):
-            try:
-                headers = get_headers().copy()
-                headers["Referer"] = domain_config["referer"]
-                response = get_session(self.settings.settings_tab).get(
-                    api_url, headers=headers
-                )
-                if response.status_code != 200:
-                    if response.status_code == 429 and attempt < max_retries:
-                        self.log.emit(
-                            translate(
-                                "log_warning",
-                                translate(
-                                    "rate_limit_hit", api_url, attempt, max_retries
-                                ),
-                            ),
-                            "WARNING",
-                        )
-                        for i in range(retry_delay_seconds, 0, -1):
-                            self.log.emit(
-                                translate("log_info", translate("trying_again_in", i)),
-                                "INFO",
-                            )
-                            time.sleep(1)
-                        continue
-                    self.log.emit(
-                        translate(
-                            "log_error",
-                            translate(
-                                "failed_to_fetch_api", api_url, response.status_code
-                            ),
-                        ),
-                        "ERROR",
-                    )
-                    return None
-                post_data = response.json()
-                post = (
-                    post_data
-                    if isinstance(post_data, dict) and "post" not in post_data
-                    else post_data.get("post", {})
-                )
-                self.log.emit(
-                    translate(
-                        "log_debug",
-                        translate(
-                            "post_data_for_id", post_id, json.dumps(post, indent=2)
-                        ),
-                    ),
-                    "INFO",
-                )
-                allowed_extensions = [
-                    ext.lower()
-                    for ext, checkbox in self.creator_ext_checks.items()
-                    if checkbox.isChecked()
-                ]
-                detected_files = self.detect_files(
-                    post, allowed_extensions, domain_config
-                )
-                files_to_download = [
-                    (file_name, file_url) for file_name, file_url in detected_files
-                ]
-                return (post_id, files_to_download)
-            except Exception as e:
-                if attempt == max_retries:
-                    self.log.emit(
-                        translate(
-                            "log_error",
-                            translate(
-                                "error_fetching_post_max_attempts",
-                                post_id,
-                                max_retries,
-                                str(e),
-                            ),
-                        ),
-                        "ERROR",
-                    )
-                    return None
-                self.log.emit(
-                    translate(
-                        "log_warning",
-                        translate(
-                            "error_fetching_post", post_id, attempt, max_retries, str(e)
-                        ),
-                    ),
-                    "WARNING",
-                )
-                for i in range(retry_delay_seconds, 0, -1):
-                    self.log.emit(
-                        translate("log_info", translate("trying_again_in", i)), "INFO"
-                    )
-                    time.sleep(1)
+        # Inside run() a failed attempt is handed back as RetryLater so the
+        # worker slot is freed during the backoff; direct callers still get
+        # every attempt in one call.
+        requeue = self._post_attempts is not None
+        first_attempt = self._post_attempts.get(post_id, 0) + 1 if requeue else 1
+        for attempt in range(first_attempt, max_retries + 1):
+            post = core.fetch_post_attempt(
+                service, creator_id, post_id, domain_config, attempt
+            )
+            if isinstance(post, RetryLater):
+                if requeue:
+                    self._post_attempts[post_id] = attempt
+                    return post
+                # The shared limiter already holds the next request back for
+                # its own backoff; only the rest of the delay is slept here.
+                host = host_of(domain_config["api_base"])
+                delay = post.delay - get_rate_limiter().backoff_remaining(host)
+                if delay > 0:
+                    time.sleep(delay)
+                continue
+            if post is None:
+                return None
+            allowed_extensions = [
+                ext.lower()
+                for ext, checkbox in self.creator_ext_checks.items()
+                if checkbox.isChecked()
+            ]
+            return (post_id, self.detect_files(post, allowed_extensions, domain_config))
+        return None
 
     def run(self):
+        try:
+            self._prepare()
+            if self.sync_update is not None:
+                # The download thread saves again as its posts complete;
+                # this covers posts that need no download at all.
+                self.sync_update.save()
+        finally:
+            # However preparation ends, the download thread must not wait
+            # for more files.
+            if self.feed is not None:
+                self.feed.close()
+
+    def _prepare(self):
         if not self.is_running:
             return
         files_to_download = []
@@ -1207,98 +953,111 @@ class FilePreparationThread(QThread):
         total_posts = len(self.post_ids)
         completed_posts = 0
 
-        # Find the creator URL(s) associated with these post_ids
-        creator_urls = set()
-        for creator_url, posts in self.all_files_map.items():
-            for _, (post_id, _) in posts:
-                if post_id in self.post_ids:
-                    creator_urls.add(creator_url)
-                    break
-
-        if not creator_urls:
+        work_items = self.build_work_items()
+        if not work_items:
             self.log.emit(
                 translate("log_error", translate("no_matching_creator_urls")), "ERROR"
             )
             self.finished.emit([], {})
             return
 
-        # Build work list: (post_id, creator_url) pairs
-        work_items = []
-        for creator_url in creator_urls:
-            for post_id in self.post_ids:
-                if any(
-                    p[1][0] == post_id for p in self.all_files_map.get(creator_url, [])
-                ):
-                    work_items.append((post_id, creator_url))
+        if self.completion_db is not None:
+            work_items = self.drop_completed_posts(work_items, allowed_extensions)
+            completed_posts += len(self.skipped_posts)
+            if total_posts:
+                self.progress.emit(min(int((completed_posts / total_posts) * 100), 100))
 
-        # Use pure Lock + polling instead of Semaphore/Event to avoid
-        # Condition.notify() access violations on Python 3.14 + Windows.
-        slot_lock = threading.Lock()
-        active_slots = [0]
-        results_lock = threading.Lock()
-        workers = []
+        feed = self.feed
 
-        def _worker(pid, curl):
-            """Fetch & detect files in a daemon thread."""
-            try:
-                if not self.is_running:
-                    return
-                result = self.fetch_and_detect_files(pid, curl)
-                if result and self.is_running:
-                    pid_result, detected_files = result
-                    with results_lock:
-                        for file_name, file_url in detected_files:
-                            try:
-                                self.log.emit(
-                                    translate(
-                                        "log_debug",
-                                        translate("detected_file", file_name, file_url),
-                                    ),
-                                    "INFO",
-                                )
-                            except RuntimeError:
-                                pass
-                            files_to_download.append(file_url)
-                            files_to_posts_map[file_url] = pid_result
-            except Exception:
-                pass  # fetch_and_detect_files handles its own logging
-            finally:
-                with slot_lock:
-                    active_slots[0] -= 1
-                    nonlocal completed_posts
-                    completed_posts += 1
-                progress = min(int((completed_posts / total_posts) * 100), 100)
+        def _collect(pid, detected_files):
+            if not detected_files and self.sync_update is not None:
+                self.sync_update.settle([pid])
+            if feed is not None:
+                feed.put(pid, [file_url for _, file_url in detected_files])
+            for file_name, file_url in detected_files:
                 try:
-                    self.progress.emit(progress)
-                except RuntimeError:
-                    pass
-
-        for idx, (pid, curl) in enumerate(work_items):
-            if not self.is_running:
-                break
-            # Wait for a concurrency slot using pure Lock polling
-            while True:
-                with slot_lock:
-                    if active_slots[0] < self.max_concurrent:
-                        active_slots[0] += 1
-                        break
-                if not self.is_running:
-                    break
-                time.sleep(0.05)
+                    self.log.emit(
+                        translate(
+                            "log_debug",
+                            translate("detected_file", file_name, file_url),
+                        ),
+                        "INFO",
+                    )
+                except RuntimeError:
+                    pass
+                if feed is None:
+                    files_to_download.append(file_url)
+                    files_to_posts_map[file_url] = pid
+
+        # Posts whose listing record already has every needed field are
+        # detected right here; only the rest cost a /post/{id} request.
+        fetch_items = []
+        for pid, curl in work_items:
             if not self.is_running:
                 break
-            t = threading.Thread(target=_worker, args=(pid, curl), daemon=True)
-            t.start()
-            workers.append(t)
-
-        # Wait for all workers so none outlive the QThread C++ object.
-        # Thread.join() internally uses Event.wait() which triggers
-        # Condition.notify() access violations on Python 3.14 + Windows,
-        # so poll is_alive() instead.
-        _deadline = time.monotonic() + 30
-        for w in workers:
-            while w.is_alive() and time.monotonic() < _deadline:
-                time.sleep(0.05)
+            post = self.post_records.get(str(pid))
+            if not (
+                self.settings.listing_prep
+                and listing_record_usable(
+                    post,
+                    self.creator_main_check,
+                    self.creator_attachments_check,
+                    self.creator_content_check,
+                )
+            ):
+                fetch_items.append((pid, curl))
+                continue
+            self._wait_for_feed_room()
+            _collect(
+                pid,
+                self.detect_files(post, allowed_extensions, get_domain_config(curl)),
+            )
+            completed_posts += 1
+            self.progress.emit(min(int((completed_posts / total_posts) * 100), 100))
+        if self.post_records:
+            self.log.emit(
+                translate(
+                    "log_info",
+                    translate(
+                        "listing_prep_summary",
+                        len(work_items) - len(fetch_items),
+                        len(fetch_items),
+                    ),
+                ),
+                "INFO",
+            )
+        work_items = fetch_items
+
+        # Posts whose fetch failed are handed back as RetryLater and wait
+        # out their backoff on the pool's queue instead of in a worker.
+        self._post_attempts = {}
+
+        def _prepared(item, result):
+            nonlocal completed_posts
+            if result:
+                pid_result, detected_files = result
+                _collect(pid_result, detected_files)
+            completed_posts += 1
+            try:
+                self.progress.emit(min(int((completed_posts / total_posts) * 100), 100))
+            except RuntimeError:
+                pass
+
+        self._prep_pool = PrepPool(
+            self.concurrency,
+            lambda item: self.fetch_and_detect_files(*item),
+            _prepared,
+            lambda: self.is_running,
+            has_room=feed.has_room if feed is not None else None,
+        )
+        if feed is not None:
+            feed.set_producer_wakeup(self._prep_pool.wake)
+        try:
+            self._prep_pool.run(work_items)
+        finally:
+            self._prep_pool = None
+            if feed is not None:
+                feed.set_producer_wakeup(None)
 
         if self.is_running:
             files_to_download = list(dict.fromkeys(files_to_download))
@@ -1312,27 +1071,160 @@ class FilePreparationThread(QThread):
             self.finished.emit(files_to_download, files_to_posts_map)
 
 
-def sanitize_filename(name, max_length=100):
-    """Sanitize a filename by removing invalid characters, trailing dots, and limiting length."""
-    if not name:
-        return "unnamed"
-    # Remove invalid characters
-    sanitized = re.sub(r'[<>:"/\\|?*]', "_", name)
-    # Replace spaces with underscores
-    sanitized = sanitized.replace(" ", "_")
-    # Remove multiple consecutive underscores
-    sanitized = re.sub(r"_+", "_", sanitized)
-    # Remove trailing dots (Windows compatibility)
-    sanitized = sanitized.rstrip(".")
-    # Remove leading dots to avoid hidden/unsafe filenames
-    sanitized = sanitized.lstrip(".")
-    # Trim leading/trailing underscores
-    sanitized = sanitized.strip("_")
-    # Limit length
-    if len(sanitized) > max_length:
-        sanitized = sanitized[:max_length].rstrip(".").strip("_")
-    # Ensure non-empty
-    return sanitized if sanitized else "unnamed"
+class CreatorPrefetchThread(QThread):
+    """Detect a creator's posts and prepare its files ahead of its download.
+
+    Pipelined fast mode runs one of these for each creator it prepares
+    ahead (see ``fast_pipeline``).  ``PostDetectionThread`` and
+    ``FilePreparationThread`` run back to back on this thread without
+    touching the tab's post list; the result, or ``None`` when detection
+    or preparation failed, is handed over through ``prepared``.
+    """
+
+    prepared = pyqtSignal(str, object)  # url, PreparedCreator or None
+    log = pyqtSignal(str, str)
+
+    def __init__(
+        self,
+        url,
+        post_titles_map,
+        creator_ext_checks,
+        creator_main_check,
+        creator_attachments_check,
+        creator_content_check,
+        settings,
+        other_files_dir=None,
+        max_concurrent=5,
+        download_folder=None,
+    ):
+        super().__init__()
+        self.url = url
+        self.post_titles_map = post_titles_map
+        self.creator_ext_checks = creator_ext_checks
+        self.creator_main_check = creator_main_check
+        self.creator_attachments_check = creator_attachments_check
+        self.creator_content_check = creator_content_check
+        self.settings = settings
+        self.other_files_dir = other_files_dir
+        # Library base of the completion database (see open_completion_db).
+        self.download_folder = download_folder
+        self.max_concurrent = max_concurrent
+        self._step = None
+        self.is_running = True
+
+    def stop(self):
+        self.is_running = False
+        step = self._step
+        if step is not None:
+            step.stop()
+
+    def _forward_log(self, message, level):
+        try:
+            self.log.emit(message, level)
+        except RuntimeError:
+            pass
+
+    def _run_step(self, step):
+        """Run a detection or preparation thread's work on this thread."""
+        step.log.connect(self._forward_log, Qt.ConnectionType.DirectConnection)
+        self._step = step
+        try:
+            if self.is_running:
+                step.run()
+        finally:
+            self._step = None
+
+    def prepare(self):
+        """Return the ``PreparedCreator`` of ``url``, or ``None``."""
+        direct = Qt.ConnectionType.DirectConnection
+        errors = []
+        detected_posts = []
+        detection = PostDetectionThread(self.url, self.post_titles_map, self.settings)
+        if self.settings.incremental_sync and self.other_files_dir:
+            detection.sync_db = open_completion_db(
+                self.other_files_dir, self.download_folder
+            )
+        detection.finished.connect(detected_posts.extend, direct)
+        detection.error.connect(errors.append, direct)
+        self._run_step(detection)
+        if errors or not self.is_running:
+            return None
+        if not detected_posts:
+            return PreparedCreator(self.url, [], {}, [], {}, set())
+
+        results = []
+        preparation = FilePreparationThread(
+            [post_id for _, (post_id, _) in detected_posts],
+            {self.url: detected_posts},
+            self.creator_ext_checks,
+            self.creator_main_check,
+            self.creator_attachments_check,
+            self.creator_content_check,
+            self.settings,
+            max_concurrent=self.max_concurrent,
+            post_records=detection.post_records,
+        )
+        if self.settings.skip_completed and self.other_files_dir:
+            preparation.completion_db = open_completion_db(
+                self.other_files_dir, self.download_folder
+            )
+        preparation.sync_update = detection.sync_update
+        preparation.finished.connect(
+            lambda files, files_map: results.append((files, files_map)), direct
+        )
+        preparation.error.connect(errors.append, direct)
+        self._run_step(preparation)
+        if errors or not results or not self.is_running:
+            return None
+        files_to_download, files_to_posts_map = results[0]
+        return PreparedCreator(
+            self.url,
+            detected_posts,
+            detection.post_records,
+            files_to_download,
+            files_to_posts_map,
+            set(preparation.skipped_posts),
+            detection.sync_update,
+        )
+
+    def run(self):
+        result = None
+        try:
+            result = self.prepare()
+        except Exception as e:
+            message = translate("fast_mode_prefetch_failed", self.url, str(e))
+            self._forward_log(translate("log_error", message), "ERROR")
+        try:
+            self.prepared.emit(self.url, result)
+        except RuntimeError:
+            pass
+
+
+# Transport errors that trigger a retry in CreatorDownloadThread.download_file,
+# for both the requests and the aiohttp download engines.
+_RETRYABLE_DOWNLOAD_ERRORS = (
+    requests.RequestException,
+    IncompleteDownloadError,
+) + RETRYABLE_ERRORS
+# Raised when the user stops the thread mid-transfer; caught before the
+# retryable errors, as RequestCancelled is a RequestException.
+_CANCELLED_DOWNLOAD_ERRORS = (DownloadCancelled, RequestCancelled)
+
+
+def _check_segmentable(settings, plan, response_headers):
+    """Raise ``SegmentedDownloadRequired`` when a fresh response is large
+    enough to be fetched as parallel byte ranges instead."""
+    threshold_mb = settings.segmented_threshold_mb
+    segments = settings.segmented_segments
+    # An existing .part is resumed as a single stream.
+    if plan.offset > 0 or not isinstance(threshold_mb, int):
+        return
+    if not isinstance(segments, int):
+        return
+    if should_segment(
+        response_headers, plan.total_size, threshold_mb * 1024 * 1024, segments
+    ):
+        raise SegmentedDownloadRequired(plan.total_size)
 
 
 class CreatorDownloadThread(QThread):
@@ -1341,6 +1233,11 @@ class CreatorDownloadThread(QThread):
     post_completed = pyqtSignal(str)
     log = pyqtSignal(str, str)
     finished = pyqtSignal()
+    concurrency_changed = pyqtSignal(int)  # effective number of download slots
+    # Every file has been handed to a worker; only running downloads remain.
+    draining = pyqtSignal()
+    # ProgressSnapshot of all transfers in flight, at most every 100 ms.
+    transfer_progress = pyqtSignal(object)
 
     def __init__(
         self,
@@ -1370,7 +1267,7 @@ class CreatorDownloadThread(QThread):
         self.is_running = True
         self.download_text = download_text
         self.other_files_dir = other_files_dir
-        self.hash_db = HashDB(self.other_files_dir)
+        self.hash_db = HashDB(self.other_files_dir, base_dir=download_folder or None)
         self.max_concurrent = max_concurrent
         self.post_files_map = self.build_post_files_map()
         self.completed_files = set()
@@ -1387,12 +1284,60 @@ class CreatorDownloadThread(QThread):
         self.completed_files_lock = threading.Lock()
         self.fetched_texts_lock = threading.Lock()
         self.fetched_texts = set()
-        # Lock to serialize SSL connection establishment across workers.
-        # On Windows + Python 3.14, concurrent SSL handshakes / reads in
-        # OpenSSL trigger native access-violation crashes.  Serialising
-        # only the session.get() call (which does SSL + redirects) while
-        # allowing concurrent body streaming avoids the problem.
-        self._ssl_lock = threading.Lock()
+        # Connection setup (session.get(): TLS handshake, redirects and
+        # headers) holds a slot of the process-wide gate: serialised on
+        # Windows, where concurrent OpenSSL handshakes crash Python 3.14,
+        # and limited per host elsewhere.  Bodies stream concurrently.
+        self.connection_gate = get_connection_gate()
+        # Transport used for file bodies.  With the aiohttp engine a single
+        # ClientSession is shared by all workers on the thread's event loop
+        # (see _open_aiohttp_session); otherwise each download runs through
+        # requests inside asyncio.to_thread.
+        self.download_engine = settings.download_engine
+        self._aio_session = None
+        self._aio_proxy = None
+        # Worker queue of the running download loop.  Segmented downloads
+        # push helper tokens onto it so idle workers can fetch byte ranges
+        # of large files within the same concurrency budget.
+        self._download_queue = None
+        self._retry_schedule = None
+        self._download_attempts = None
+        # Hash-database entries of the files to download, fetched in bulk
+        # when the download loop starts; consumed by download_file.
+        self._known_entries = {}
+        # File selection key of this run (see post_completion); posts whose
+        # files all complete are recorded under it once the tab sets it.
+        self.selection_key = None
+        self._recorded_posts = set()
+        # SyncUpdate of the detection that found these posts; each post
+        # whose files all complete is settled, and the marker saved at the
+        # end of the run.
+        self.sync_update = None
+        # Workers only start a download while fewer than concurrency.limit
+        # are active; the limit is fixed or adapts at runtime (AIMD).
+        self.concurrency = create_concurrency_controller(
+            settings.settings_tab,
+            max_concurrent,
+            on_change=lambda limit: self._safe_emit(self.concurrency_changed, limit),
+        )
+        self._active_downloads = 0
+        # Set whenever a worker gives its slot back (see download_worker);
+        # run() replaces it for each event loop.
+        self._slot_freed = asyncio.Event()
+        # Workers report every chunk to the aggregator, which publishes one
+        # coalesced snapshot per interval instead of a signal per chunk.
+        self.progress = ProgressAggregator(self._publish_progress)
+        # Besides the thread's own limit, every download holds a slot of the
+        # process-wide scheduler, which caps downloads across all threads.
+        self.scheduler = get_download_scheduler()
+        self.scheduler_owner = f"{service}/{creator_id}"
+        # DownloadFeed of a FilePreparationThread running alongside: its
+        # posts join the worker queue as they are prepared (see
+        # _pump_feed), and the run ends once the feed is exhausted.
+        self.feed = None
+        # Wakes _pump_feed when files arrive, the feed closes or stop() runs.
+        self._feed_wakeup = None
+        self._wanted_files = None
         # Defence flag: set in stop() *before* any cleanup.  Workers
         # check this before emitting signals so they never touch the
         # C++ object after it has been scheduled for deletion.
@@ -1494,6 +1439,10 @@ class CreatorDownloadThread(QThread):
     def stop(self):
         self.is_running = False
         self._destroyed = True
+        feed_wakeup = self._feed_wakeup
+        if feed_wakeup is not None:
+            feed_wakeup()
+        self.hash_db.try_flush()
 
     def _safe_emit(self, signal, *args):
         """Emit *signal* only when the C++ object is still alive."""
@@ -1504,6 +1453,14 @@ class CreatorDownloadThread(QThread):
         except RuntimeError:
             pass
 
+    def _publish_progress(self, snapshot):
+        """Hand a coalesced progress snapshot to the GUI thread."""
+        for file_index in snapshot.changed:
+            self._safe_emit(
+                self.file_progress, file_index, snapshot.percent(file_index)
+            )
+        self._safe_emit(self.transfer_progress, snapshot)
+
     def generate_filename_and_folder(
         self, file_url, folder, file_index, total_files, post_id, post_title
     ):
@@ -1513,14 +1470,7 @@ class CreatorDownloadThread(QThread):
 
         Returns (target_folder, filename)
         """
-        # Determine raw filename from URL
-        raw_filename = (
-            file_url.split("f=")[-1]
-            if "f=" in file_url
-            else file_url.split("/")[-1].split("?")[0]
-        )
-        file_ext = os.path.splitext(raw_filename)[1]
-        original_name = os.path.splitext(raw_filename)[0]
+        original_name, file_ext = split_file_name(file_url)
 
         # Prepare context for template formatting
         key = (self.service, self.creator_id, post_id)
@@ -1551,13 +1501,8 @@ class CreatorDownloadThread(QThread):
             template = None
             strategy = "per_post"
 
-        if not template:
-            template = "{post_id}_{orig_name}"
-
-        # Attempt to format template with context, safely
-        try:
-            formatted = template.format(**context)
-        except Exception:
+        formatted = render_file_name(template, context)
+        if formatted is None:
             # Log a warning and fallback to a safe default template
             try:
                 self._safe_emit(
@@ -1585,28 +1530,12 @@ class CreatorDownloadThread(QThread):
         filename_no_ext = sanitize_filename(prefix + formatted)
         final_filename = f"{filename_no_ext}{file_ext}"
 
-        # Determine target folder
-        # Creator folder name
-        creator_folder_name = (
-            f"{self.creator_id}_{self.creator_name or self.creator_id}"
+        # `folder` may already be the creator folder (e.g. passed as the
+        # creator_folder in the thread); it is not appended again then.
+        creator_folder = creator_folder_for(folder, self.creator_id, self.creator_name)
+        target_folder = target_folder_for(
+            creator_folder, strategy, post_id, post_title_safe, file_ext
         )
-        # Determine creator_folder: if `folder` already ends with the creator folder
-        # (e.g., passed as the creator_folder in the thread), don't append it again.
-        norm_folder = os.path.normpath(folder)
-        if os.path.basename(norm_folder) == creator_folder_name:
-            creator_folder = norm_folder
-        else:
-            creator_folder = os.path.join(folder, creator_folder_name)
-
-        if strategy == "single_folder":
-            target_folder = creator_folder
-        elif strategy == "by_file_type":
-            ext_folder = (file_ext.lstrip(".") or "other").lower()
-            target_folder = os.path.join(creator_folder, ext_folder)
-        else:  # per_post (default)
-            post_folder_name = f"{post_id}_{post_title_safe}"
-            target_folder = os.path.join(creator_folder, post_folder_name)
-
         return target_folder, final_filename
 
     def get_desc_folder_for_post(self, creator_folder, post_id, post_title):
@@ -1685,7 +1614,10 @@ class CreatorDownloadThread(QThread):
             )
 
     async def download_file(self, file_url, folder, file_index, total_files):
-        if not self.is_running or file_url not in self.files_to_download:
+        wanted = self._wanted_files
+        if wanted is None:
+            wanted = self.files_to_download
+        if not self.is_running or file_url not in wanted:
             self._safe_emit(
                 self.log, translate("log_info", f"Skipping {file_url}"), "INFO"
             )
@@ -1725,57 +1657,116 @@ class CreatorDownloadThread(QThread):
         full_path = os.path.join(target_folder, filename.replace("/", "_"))
         url_hash = hashlib.md5(file_url.encode()).hexdigest()
 
-        entry = self.hash_db.lookup(url_hash)
-        if entry:
+        def size_mismatch(existing_path, actual_size, expected_size):
+            self._safe_emit(
+                self.log,
+                translate(
+                    "log_warning",
+                    translate(
+                        "size_mismatch_error", actual_size, expected_size, file_url
+                    ),
+                ),
+                "WARNING",
+            )
+            self._safe_emit(
+                self.log,
+                translate(
+                    "log_info",
+                    f"File size mismatch for {existing_path}, re-downloading",
+                ),
+                "INFO",
+            )
+
+        entry = intact_download(
+            self.hash_db,
+            url_hash,
+            self._known_entries.pop(url_hash, None),
+            on_size_mismatch=size_mismatch,
+        )
+        if entry is not None:
             existing_path = entry["file_path"]
-            if os.path.exists(existing_path):
-                # Check file size first for fast corruption detection
-                actual_size = os.path.getsize(existing_path)
-                expected_size = entry.get("file_size", 0)
-                if expected_size > 0 and actual_size != expected_size:
-                    self._safe_emit(
+            settings_tab = self.settings.settings_tab
+            if settings_tab is not None and settings_tab.is_deep_verify_enabled():
+                get_deep_verifier().submit(
+                    self.hash_db,
+                    url_hash,
+                    existing_path,
+                    entry["file_hash"],
+                    on_mismatch=lambda path: self._safe_emit(
                         self.log,
                         translate(
-                            "log_warning",
-                            translate(
-                                "size_mismatch_error",
-                                actual_size,
-                                expected_size,
-                                file_url,
-                            ),
+                            "log_warning", translate("deep_verify_mismatch", path)
                         ),
                         "WARNING",
-                    )
-                    self._safe_emit(
-                        self.log,
+                    ),
+                )
+            self._safe_emit(
+                self.log,
+                translate(
+                    "log_info",
+                    translate("file_already_downloaded", filename, existing_path),
+                ),
+                "INFO",
+            )
+            self._safe_emit(self.file_progress, file_index, 100)
+            self._safe_emit(self.file_completed, file_index, file_url, True)
+            with self.completed_files_lock:
+                self.completed_files.add(file_url)
+            self.check_post_completion(file_url)
+            return
+
+        # The same content may already be in the library under another name
+        # or post; reuse it instead of fetching it again.
+        local_copy = await asyncio.to_thread(
+            find_local_copy, self.hash_db, file_url, full_path
+        )
+        if local_copy is not None:
+            try:
+                mode = await asyncio.to_thread(
+                    adopt_local_copy,
+                    self.hash_db,
+                    local_copy,
+                    file_url,
+                    url_hash,
+                    full_path,
+                    self.service,
+                    self.creator_id,
+                    post_id,
+                )
+            except OSError as e:
+                self._safe_emit(
+                    self.log,
+                    translate(
+                        "log_warning",
                         translate(
-                            "log_info",
-                            f"File size mismatch for {existing_path}, re-downloading",
+                            "content_dedupe_failed",
+                            local_copy["file_path"],
+                            full_path,
+                            str(e),
                         ),
-                        "INFO",
-                    )
-                else:
-                    with open(existing_path, "rb") as f:
-                        file_hash = hashlib.md5(f.read()).hexdigest()
-                    if file_hash == entry["file_hash"]:
-                        self._safe_emit(
-                            self.log,
-                            translate(
-                                "log_info",
-                                translate(
-                                    "file_already_downloaded",
-                                    filename,
-                                    existing_path,
-                                ),
-                            ),
-                            "INFO",
-                        )
-                        self._safe_emit(self.file_progress, file_index, 100)
-                        self._safe_emit(self.file_completed, file_index, file_url, True)
-                        with self.completed_files_lock:
-                            self.completed_files.add(file_url)
-                        self.check_post_completion(file_url)
-                        return
+                    ),
+                    "WARNING",
+                )
+            else:
+                self._safe_emit(
+                    self.log,
+                    translate(
+                        "log_info",
+                        translate(
+                            "content_dedupe_reused",
+                            full_path,
+                            local_copy["file_path"],
+                            mode,
+                        ),
+                    ),
+                    "INFO",
+                )
+                self._safe_emit(self.file_progress, file_index, 100)
+                self._safe_emit(self.file_completed, file_index, file_url, True)
+                with self.completed_files_lock:
+                    self.completed_files.add(file_url)
+                self.check_post_completion(file_url)
+                return
 
         self._safe_emit(
             self.log,
@@ -1792,112 +1783,105 @@ class CreatorDownloadThread(QThread):
             "INFO",
         )
 
+        # Bytes are streamed into a .part file keyed by the URL hash so an
+        # interrupted transfer can resume with a Range request on the next
+        # attempt, or on the next run after a cancel or restart.
+        part_path = part_path_for(target_folder, url_hash)
+
+        concurrency = self.concurrency
         max_retries = self.settings.file_download_max_retries
-        for attempt in range(1, max_retries + 1):
+        # While run() owns a retry schedule, a failed attempt is requeued
+        # with backoff and this worker moves on to the next queued file.
+        retry_schedule = self._retry_schedule
+        attempts = self._download_attempts
+        first_attempt = attempts.get(file_url, 0) + 1 if attempts is not None else 1
+        for attempt in range(first_attempt, max_retries + 1):
+            # Time to first byte (response headers) feeds the adaptive
+            # concurrency controller.
+            started = time.monotonic()
+            first_byte = [None]
+            hasher = StreamHasher()
+
+            def mark_first_byte():
+                if first_byte[0] is None:
+                    first_byte[0] = time.monotonic() - started
+
             try:
                 headers = get_headers().copy()
                 headers["Referer"] = self.domain_config["referer"]
 
                 # Use requests instead of aiohttp for better proxy support
                 def download_with_requests():
-                    session = get_session(self.settings.settings_tab)
-                    # Serialize SSL connection establishment to prevent
-                    # concurrent SSL access violations on Windows.
-                    with self._ssl_lock:
-                        if not self.is_running:
-                            raise Exception("Download cancelled before connection")
-                        response = session.get(
+                    progress = self.progress
+
+                    def start(plan, response_headers):
+                        _check_segmentable(self.settings, plan, response_headers)
+                        progress.begin(file_index, plan.offset, plan.total_size)
+
+                    try:
+                        return transfer_to_part(
+                            get_session(self.settings.settings_tab),
                             file_url,
-                            headers=headers,
-                            stream=True,
-                            timeout=(30, 30),
+                            headers,
+                            part_path,
+                            hasher,
+                            lambda: self.is_running,
+                            gate=self.connection_gate,
+                            on_headers=mark_first_byte,
+                            on_plan=start,
+                            on_chunk=lambda downloaded, total: progress.update(
+                                file_index, downloaded, total
+                            ),
+                            chunk_size=8192,
                         )
-                    # After headers are received each thread has its own
-                    # SSL connection and can stream data concurrently.
-                    try:
-                        response.raise_for_status()
-                        header = response.headers.get("content-length")
-                        try:
-                            file_size = int(header) if header is not None else 0
-                        except Exception:
-                            file_size = 0
-                        downloaded_size = 0
-
-                        file_handle = open(full_path, "wb")
-                        try:
-                            for chunk in response.iter_content(chunk_size=8192):
-                                if not self.is_running:
-                                    raise Exception("Download interrupted by user")
-                                if chunk:
-                                    file_handle.write(chunk)
-                                    downloaded_size += len(chunk)
-                                    if file_size > 0:
-                                        progress = int(
-                                            (downloaded_size / file_size) * 100
-                                        )
-                                    else:
-                                        progress = 0
-                                    self._safe_emit(
-                                        self.file_progress,
-                                        file_index,
-                                        min(progress, 100),
-                                    )
-                        finally:
-                            file_handle.close()
-
-                        return file_size, downloaded_size
                     finally:
-                        response.close()
-
-                # Run the download in a thread to avoid blocking
-                file_size, downloaded_size = await asyncio.to_thread(
-                    download_with_requests
-                )
+                        progress.finish(file_index)
 
-                # Validate downloaded size matches content-length
-                if file_size > 0 and downloaded_size != file_size:
-                    error_msg = translate(
-                        "size_mismatch_error", downloaded_size, file_size, file_url
-                    )
-                    self._safe_emit(
-                        self.log, translate("log_warning", error_msg), "WARNING"
-                    )
-                    # Delete incomplete file
-                    if os.path.exists(full_path):
-                        try:
-                            os.remove(full_path)
-                            self._safe_emit(
-                                self.log,
-                                translate(
-                                    "log_info",
-                                    translate("deleted_incomplete_file", full_path),
-                                ),
-                                "INFO",
-                            )
-                        except OSError as e:
-                            self._safe_emit(
-                                self.log,
-                                translate(
-                                    "log_error",
-                                    translate(
-                                        "failed_to_delete_incomplete_file",
-                                        full_path,
-                                        str(e),
-                                    ),
-                                ),
-                                "ERROR",
-                            )
-                    # Raise exception to trigger retry
-                    raise Exception(
-                        f"Size mismatch: downloaded {downloaded_size} bytes, expected {file_size} bytes"
+                try:
+                    if self._aio_session is not None:
+                        file_size, downloaded_size = await self._download_with_aiohttp(
+                            file_url,
+                            headers,
+                            part_path,
+                            file_index,
+                            on_response=mark_first_byte,
+                            hasher=hasher,
+                        )
+                    else:
+                        # Run the download in a thread to avoid blocking
+                        file_size, downloaded_size = await asyncio.to_thread(
+                            download_with_requests
+                        )
+                except SegmentedDownloadRequired as required:
+                    file_size, downloaded_size = await self._download_segmented(
+                        file_url,
+                        headers,
+                        target_folder,
+                        url_hash,
+                        file_index,
+                        required.total_size,
+                        hasher=hasher,
                     )
 
-                with open(full_path, "rb") as f:
-                    file_hash = hashlib.md5(f.read()).hexdigest()
-                actual_file_size = os.path.getsize(full_path)
-                self.hash_db.store(
-                    url_hash, full_path, file_hash, file_url, actual_file_size
+                # Raises IncompleteDownloadError (retried) on a size mismatch
+                complete_part(
+                    self.hash_db,
+                    part_path,
+                    full_path,
+                    hasher,
+                    file_url,
+                    url_hash,
+                    file_size,
+                    downloaded_size,
+                    self.service,
+                    self.creator_id,
+                    post_id,
+                    log=lambda message, level: self._safe_emit(
+                        self.log, message, level
+                    ),
                 )
+                if concurrency is not None:
+                    concurrency.record_success(downloaded_size, first_byte[0])
                 self._safe_emit(
                     self.log,
                     translate(
@@ -1911,7 +1895,25 @@ class CreatorDownloadThread(QThread):
                 self.check_post_completion(file_url)
                 return
 
-            except requests.RequestException as e:
+            except _CANCELLED_DOWNLOAD_ERRORS as e:
+                # Stopped by the user: not an error, and the .part file
+                # stays for the next run; the file still counts as not done.
+                self._safe_emit(
+                    self.log,
+                    translate(
+                        "log_info", translate("download_cancelled_part_kept", file_url)
+                    ),
+                    "INFO",
+                )
+                with self.failed_files_lock:
+                    self.failed_files[file_url] = str(e)
+                self._safe_emit(self.file_progress, file_index, 0)
+                self._safe_emit(self.file_completed, file_index, file_url, False)
+                self.check_post_completion(file_url)
+                return
+            except _RETRYABLE_DOWNLOAD_ERRORS as e:
+                if concurrency is not None:
+                    concurrency.record_failure(throttled=is_throttled_error(e))
                 if attempt == max_retries:
                     error_msg = translate(
                         "error_downloading_after_retries", file_url, max_retries, str(e)
@@ -1940,7 +1942,20 @@ class CreatorDownloadThread(QThread):
                         ),
                         "WARNING",
                     )
-                    await asyncio.sleep(1)
+                    delay = backoff_delay(attempt)
+                    if retry_schedule is not None and attempts is not None:
+                        attempts[file_url] = attempt
+                        retry_schedule.schedule((file_index, file_url), delay)
+                        self._safe_emit(
+                            self.log,
+                            translate(
+                                "log_info",
+                                translate("retry_scheduled", file_url, delay),
+                            ),
+                            "INFO",
+                        )
+                        return
+                    await asyncio.sleep(delay)
             except Exception as e:
                 self._safe_emit(
                     self.log,
@@ -1950,42 +1965,260 @@ class CreatorDownloadThread(QThread):
                     ),
                     "ERROR",
                 )
-                # Attempt to remove any incomplete file left on disk
-                try:
-                    if os.path.exists(full_path):
-                        try:
-                            os.remove(full_path)
-                            self._safe_emit(
-                                self.log,
-                                translate(
-                                    "log_info",
-                                    translate("deleted_incomplete_file", full_path),
-                                ),
-                                "INFO",
-                            )
-                        except OSError as e_remove:
-                            self._safe_emit(
-                                self.log,
-                                translate(
-                                    "log_error",
-                                    translate(
-                                        "failed_to_delete_incomplete_file",
-                                        full_path,
-                                        str(e_remove),
-                                    ),
-                                ),
-                                "ERROR",
-                            )
-                except Exception:
-                    # Best-effort deletion; ignore errors here to avoid masking original exception
-                    pass
+                # Bytes only ever land in the .part file, which is kept for
+                # the next attempt to resume; full_path is a finished file.
+                with self.failed_files_lock:
+                    self.failed_files[file_url] = str(e)
+                self._safe_emit(self.file_progress, file_index, 0)
+                self._safe_emit(self.file_completed, file_index, file_url, False)
+                self.check_post_completion(file_url)
+                return
+
+    async def _download_with_aiohttp(
+        self, file_url, headers, part_path, file_index, on_response=None, hasher=None
+    ):
+        """Stream *file_url* into *part_path* over the shared aiohttp session.
+
+        Returns ``(file_size, downloaded_size)`` like the requests path.
+        ``on_response()`` is called once the response headers have arrived
+        and *hasher*, when given, is fed the body as it is written.
+        """
+        if not self.is_running:
+            raise DownloadCancelled(f"Download of {file_url} cancelled")
+
+        progress = self.progress
+
+        def on_chunk(downloaded_size, file_size):
+            progress.update(file_index, downloaded_size, file_size)
+
+        def on_plan(plan, response_headers):
+            if on_response is not None:
+                on_response()
+            _check_segmentable(self.settings, plan, response_headers)
+            progress.begin(file_index, plan.offset, plan.total_size)
+
+        try:
+            return await stream_to_file(
+                self._aio_session,
+                file_url,
+                part_path,
+                headers=headers,
+                proxy=self._aio_proxy,
+                on_chunk=on_chunk,
+                should_continue=lambda: self.is_running,
+                on_plan=lambda plan, response_headers: on_plan(plan, response_headers),
+                hasher=hasher,
+            )
+        finally:
+            progress.finish(file_index)
+
+    async def _download_segmented(
+        self,
+        file_url,
+        headers,
+        target_folder,
+        url_hash,
+        file_index,
+        total_size,
+        hasher=None,
+    ):
+        """Download *file_url* as parallel byte ranges into a preallocated file.
+
+        The ranges are shared between this worker and any idle download
+        workers (through helper tokens on the worker queue), so segments
+        count against the same ``max_concurrent`` budget as whole files.
+        On success the verified file is moved to the ``.part`` path and
+        ``(total_size, total_size)`` is returned like the single-stream path.
+        Ranges arrive out of order, so *hasher* is fed in the same single
+        pass over the assembled file that checks the server's SHA-256.
+        """
+        data_path, state_path = segmented_paths(target_folder, url_hash)
+        ranges = split_ranges(total_size, self.settings.segmented_segments)
+        segmented_file = SegmentedFile(data_path, state_path, total_size, ranges)
+        await asyncio.to_thread(segmented_file.prepare)
+        received = [segmented_file.completed_bytes()]
+        max_retries = self.settings.file_download_max_retries
+        progress = self.progress
+        progress.begin(file_index, received[0], total_size)
+
+        def on_bytes(count):
+            received[0] += count
+            progress.update(file_index, received[0], total_size)
+
+        async def fetch_once(start, end):
+            if not self.is_running:
+                raise DownloadCancelled(f"Download of {file_url} cancelled")
+            if self._aio_session is not None:
+                return await stream_range_to_file(
+                    self._aio_session,
+                    file_url,
+                    data_path,
+                    start,
+                    end,
+                    headers=headers,
+                    proxy=self._aio_proxy,
+                    on_bytes=on_bytes,
+                    should_continue=lambda: self.is_running,
+                )
+            return await asyncio.to_thread(
+                self._fetch_range_with_requests,
+                file_url,
+                headers,
+                data_path,
+                start,
+                end,
+                on_bytes,
+            )
+
+        async def fetch_segment(start, end):
+            position = start
+            for attempt in range(1, max_retries + 1):
+                try:
+                    position += await fetch_once(position, end)
+                    if position > end:
+                        return
+                    raise IncompleteDownloadError(
+                        f"Segment {start}-{end} ended at byte {position}"
+                    )
+                except _CANCELLED_DOWNLOAD_ERRORS:
+                    raise
+                except _RETRYABLE_DOWNLOAD_ERRORS as e:
+                    if attempt == max_retries:
+                        raise SegmentFailedError(
+                            translate("segment_failed", start, end, max_retries, str(e))
+                        ) from e
+                    self._safe_emit(
+                        self.log,
+                        translate(
+                            "log_warning",
+                            translate(
+                                "segment_failed_retrying",
+                                start,
+                                end,
+                                file_url,
+                                attempt,
+                                max_retries,
+                                str(e),
+                            ),
+                        ),
+                        "WARNING",
+                    )
+                    await asyncio.sleep(1)
+
+        job = SegmentJob(segmented_file, fetch_segment)
+        self._safe_emit(
+            self.log,
+            translate(
+                "log_info",
+                translate(
+                    "segmented_download_started",
+                    file_url,
+                    len(ranges),
+                    len(segmented_file.pending()),
+                ),
+            ),
+            "INFO",
+        )
+        if self._download_queue is not None:
+            for _ in range(job.helper_count):
+                self._download_queue.put_nowait((file_index, job))
+        try:
+            await job.run()
+        finally:
+            progress.finish(file_index)
+
+        # Verify the assembled file as a whole before it is moved into place.
+        if not segmented_file.is_complete():
+            raise IncompleteDownloadError(
+                f"Segmented download of {file_url} is incomplete"
+            )
+        expected_sha256 = server_sha256(file_url)
+        hashers = []
+        if hasher is not None:
+            hasher.resume(data_path, 0)
+            hashers.append(hasher)
+        if expected_sha256 is not None:
+            hashers.append(hashlib.sha256())
+        if hashers:
+            await asyncio.to_thread(hash_file, data_path, *hashers)
+        if expected_sha256 is not None:
+            actual_sha256 = hashers[-1].hexdigest()
+            if actual_sha256 != expected_sha256:
+                segmented_file.discard()
+                raise IncompleteDownloadError(
+                    translate("segmented_hash_mismatch", file_url, actual_sha256)
+                )
+        segmented_file.finalize(part_path_for(target_folder, url_hash))
+        return total_size, total_size
 
-                with self.failed_files_lock:
-                    self.failed_files[file_url] = str(e)
-                self._safe_emit(self.file_progress, file_index, 0)
-                self._safe_emit(self.file_completed, file_index, file_url, False)
-                self.check_post_completion(file_url)
-                return
+    def _fetch_range_with_requests(
+        self, file_url, headers, data_path, start, end, on_bytes
+    ):
+        """Blocking counterpart of ``stream_range_to_file`` for the requests
+        engine.  Returns the number of bytes written."""
+        session = get_session(self.settings.settings_tab)
+        with self.connection_gate.establishing(file_url, lambda: self.is_running) as ok:
+            if not ok or not self.is_running:
+                raise DownloadCancelled(f"Download of {file_url} cancelled")
+            with cancellable(lambda: self.is_running):
+                response = session.get(
+                    file_url,
+                    headers=segment_range_headers(headers, start, end),
+                    stream=True,
+                    timeout=(30, 30),
+                )
+        try:
+            response.raise_for_status()
+            check_segment_response(response.status_code, response.headers, start)
+            position = start
+            with open(data_path, "r+b") as file_handle:
+                file_handle.seek(start)
+                for chunk in response.iter_content(chunk_size=65536):
+                    if not self.is_running:
+                        raise DownloadCancelled(f"Download of {file_url} cancelled")
+                    chunk = chunk[: end + 1 - position]
+                    if chunk:
+                        file_handle.write(chunk)
+                        position += len(chunk)
+                        on_bytes(len(chunk))
+                    if position > end:
+                        break
+            return position - start
+        finally:
+            response.close()
+
+    async def _open_aiohttp_session(self):
+        """Create the shared aiohttp session when the aiohttp engine is selected.
+
+        Falls back to the requests engine (with a log line) when the
+        configured proxy cannot be used by aiohttp.
+        """
+        if self.download_engine != ENGINE_AIOHTTP:
+            return
+        settings_tab = self.settings.settings_tab
+        proxies = settings_tab.get_proxy_settings() if settings_tab else None
+        try:
+            self._aio_session, self._aio_proxy = create_client_session(
+                proxies, limit=self.concurrency.max_limit
+            )
+        except UnsupportedProxyError:
+            self.download_engine = ENGINE_REQUESTS
+            self._safe_emit(
+                self.log,
+                translate("log_warning", translate("aiohttp_engine_socks_fallback")),
+                "WARNING",
+            )
+            return
+        self._safe_emit(
+            self.log,
+            translate("log_info", translate("aiohttp_engine_enabled")),
+            "INFO",
+        )
+
+    async def _close_aiohttp_session(self):
+        session, self._aio_session = self._aio_session, None
+        if session is not None:
+            await session.close()
 
     def check_post_completion(self, file_url):
         post_id = self.files_to_posts_map.get(file_url)
@@ -1993,8 +2226,35 @@ class CreatorDownloadThread(QThread):
             post_files = self.post_files_map[post_id]
             if all(f in self.completed_files for f in post_files):
                 self._safe_emit(self.post_completed, post_id)
+                self.record_post_completion(post_id, post_files)
+                if self.sync_update is not None:
+                    self.sync_update.settle([post_id])
+
+    def record_post_completion(self, post_id, post_files):
+        """Record a post whose files are all downloaded, once per run."""
+        selection = self.selection_key
+        if selection is None or post_id in self._recorded_posts:
+            return
+        self._recorded_posts.add(post_id)
+        record_post_complete(
+            self.hash_db,
+            self.service,
+            self.creator_id,
+            str(post_id),
+            post_files,
+            selection,
+        )
 
     async def download_worker(self, queue, folder, total_files):
+        # run() starts concurrency.max_limit workers; only concurrency.limit
+        # of them download at once, so an adaptive limit can grow or shrink
+        # mid-run.  Workers share one event loop, so the counter needs no lock.
+        # A worker waiting for a slot sleeps on _slot_freed, which is set
+        # each time a download ends; the limit only grows when a download
+        # succeeds, so that is also when a larger limit can admit a waiter.
+        concurrency = self.concurrency
+        slot_freed = self._slot_freed
+        scheduler = self.scheduler
         while self.is_running:
             try:
                 file_index, file_url = await asyncio.wait_for(queue.get(), timeout=1.0)
@@ -2003,8 +2263,30 @@ class CreatorDownloadThread(QThread):
                 continue
             except asyncio.CancelledError:
                 return
+            slot_taken = False
+            scheduler_slot = False
             try:
-                await self.download_file(file_url, folder, file_index, total_files)
+                while self.is_running and self._active_downloads >= concurrency.limit:
+                    slot_freed.clear()
+                    await slot_freed.wait()
+                self._active_downloads += 1
+                slot_taken = True
+                scheduler_slot = await scheduler.acquire_async(
+                    self.scheduler_owner, lambda: self.is_running
+                )
+                if not scheduler_slot:
+                    continue  # stopped while waiting; finally cleans up
+                if isinstance(file_url, SegmentJob):
+                    # Helper token: fetch byte ranges of a large file that
+                    # another worker is downloading in segments.
+                    await file_url.work()
+                else:
+                    await self.download_file(
+                        file_url,
+                        folder,
+                        file_index,
+                        self.feed.total() if self.feed is not None else total_files,
+                    )
             except asyncio.CancelledError:
                 return  # finally still runs → task_done()
             except Exception as e:
@@ -2016,11 +2298,65 @@ class CreatorDownloadThread(QThread):
                     "ERROR",
                 )
             finally:
+                if scheduler_slot:
+                    scheduler.release(self.scheduler_owner)
+                if slot_taken:
+                    self._active_downloads -= 1
+                    slot_freed.set()
                 queue.task_done()
 
+    def _queue_streamed_posts(self, queue, posts):
+        """Put posts taken from the feed on the worker queue."""
+        hashes = []
+        for post_id, file_urls in posts:
+            if post_id in self.post_files_map:
+                self.post_files_map[post_id].extend(file_urls)
+            for file_url in file_urls:
+                self.files_to_posts_map[file_url] = post_id
+                self._wanted_files.add(file_url)
+                queue.put_nowait((len(self.files_to_download), file_url))
+                self.files_to_download.append(file_url)
+                hashes.append(hashlib.md5(file_url.encode()).hexdigest())
+        self._known_entries.update(self.hash_db.lookup_many(hashes))
+
+    async def _pump_feed(self, queue, depth):
+        """Move prepared posts from the feed into *queue* until it is exhausted.
+
+        The queue is topped up to about *depth* files; the rest wait in the
+        feed, which holds preparation back once it is full.
+        """
+        loop = asyncio.get_running_loop()
+        arrived = asyncio.Event()
+
+        def wake():
+            try:
+                loop.call_soon_threadsafe(arrived.set)
+            except RuntimeError:
+                pass  # the loop closed meanwhile
+
+        feed = self.feed
+        feed.set_consumer_wakeup(wake)
+        self._feed_wakeup = wake
+        try:
+            while self.is_running and not feed.exhausted():
+                posts = feed.take(depth - queue.qsize())
+                if posts:
+                    self._queue_streamed_posts(queue, posts)
+                    continue
+                # A wake() from another thread runs on the loop only once
+                # this coroutine awaits, so it cannot be lost to clear().
+                arrived.clear()
+                await arrived.wait()
+        finally:
+            self._feed_wakeup = None
+            feed.set_consumer_wakeup(None)
+
     def run(self):
+        feed = self.feed
         try:
             if not self.is_running:
+                if feed is not None:
+                    feed.close()
                 return
             self._safe_emit(
                 self.log,
@@ -2040,6 +2376,8 @@ class CreatorDownloadThread(QThread):
                 pass
             # Ensure we exit cleanly
             self.is_running = False
+            if feed is not None:
+                feed.close()  # never leave preparation waiting for room
             return
         total_posts = len(self.selected_posts)
         self._safe_emit(
@@ -2070,42 +2408,94 @@ class CreatorDownloadThread(QThread):
         )
 
         total_files = len(self.files_to_download)
-        self._safe_emit(
-            self.log,
-            translate(
-                "log_info", translate("total_selected_files_to_download", total_files)
-            ),
-            "INFO",
-        )
+        if feed is None:
+            self._safe_emit(
+                self.log,
+                translate(
+                    "log_info",
+                    translate("total_selected_files_to_download", total_files),
+                ),
+                "INFO",
+            )
+        else:
+            self._safe_emit(
+                self.log,
+                translate("log_info", translate("streaming_prepared_files")),
+                "INFO",
+            )
 
-        if total_files > 0:
+        if total_files > 0 or feed is not None:
             loop = asyncio.new_event_loop()
             asyncio.set_event_loop(loop)
             try:
                 queue = asyncio.Queue()
                 for i, file_url in enumerate(self.files_to_download):
                     queue.put_nowait((i, file_url))
+                self._download_queue = queue
+                self._wanted_files = set(self.files_to_download)
+                self._known_entries = self.hash_db.lookup_many(
+                    [
+                        hashlib.md5(file_url.encode()).hexdigest()
+                        for file_url in self.files_to_download
+                    ],
+                )
+                retry_schedule = RetrySchedule()
+                self._retry_schedule = retry_schedule
+                self._download_attempts = {}
+                self._slot_freed = asyncio.Event()
+
+                async def requeue_due_retries():
+                    while self.is_running:
+                        for item in retry_schedule.pop_due():
+                            queue.put_nowait(item)
+                        next_due = retry_schedule.next_due_in()
+                        await asyncio.sleep(min(next_due or 0.25, 0.25))
 
                 async def main():
+                    await self._open_aiohttp_session()
+                    self._safe_emit(self.concurrency_changed, self.concurrency.limit)
                     tasks = [
                         loop.create_task(
                             self.download_worker(queue, creator_folder, total_files)
                         )
-                        for _ in range(self.max_concurrent)
+                        for _ in range(self.concurrency.max_limit)
                     ]
-                    # Wait for all queued items to be processed, but
-                    # periodically check for cancellation so we don't
-                    # block forever when workers stop consuming.
-                    while self.is_running:
-                        try:
-                            await asyncio.wait_for(queue.join(), timeout=0.5)
-                            break  # All items processed
-                        except asyncio.TimeoutError:
-                            continue
-                    # Cancel idle workers still waiting on queue.get()
-                    for t in tasks:
-                        t.cancel()
-                    await asyncio.gather(*tasks, return_exceptions=True)
+                    tasks.append(loop.create_task(requeue_due_retries()))
+                    pump = None
+                    if feed is not None:
+                        pump = loop.create_task(
+                            self._pump_feed(queue, 2 * self.concurrency.max_limit)
+                        )
+                        tasks.append(pump)
+
+                    def settled():
+                        # No file waits out a backoff or is still to come.
+                        return not len(retry_schedule) and (pump is None or pump.done())
+
+                    try:
+                        # Wait for all queued items to be processed, but
+                        # periodically check for cancellation so we don't
+                        # block forever when workers stop consuming.  Files
+                        # waiting out a retry backoff are not in the queue,
+                        # so the run is only done once the schedule is empty.
+                        draining = False
+                        while self.is_running:
+                            if not draining and queue.empty() and settled():
+                                draining = True
+                                self._safe_emit(self.draining)
+                            try:
+                                await asyncio.wait_for(queue.join(), timeout=0.5)
+                            except asyncio.TimeoutError:
+                                continue
+                            if settled():
+                                break  # All items processed
+                            await asyncio.sleep(0.1)
+                        # Cancel idle workers still waiting on queue.get()
+                        for t in tasks:
+                            t.cancel()
+                        await asyncio.gather(*tasks, return_exceptions=True)
+                    finally:
+                        await self._close_aiohttp_session()
 
                 loop.run_until_complete(main())
             except Exception as e:
@@ -2117,12 +2507,18 @@ class CreatorDownloadThread(QThread):
                     "ERROR",
                 )
             finally:
+                self._retry_schedule = None
+                self._known_entries = {}
+                self._wanted_files = None
+                if feed is not None:
+                    feed.close()
                 if not loop.is_closed():
                     loop.run_until_complete(loop.shutdown_asyncgens())
                     # Wait for asyncio.to_thread() executor threads to finish
                     # so no thread outlives the QThread C++ object.
                     loop.run_until_complete(loop.shutdown_default_executor())
                     loop.close()
+                self.hash_db.try_flush()
         else:
             self._safe_emit(
                 self.log,
@@ -2130,6 +2526,9 @@ class CreatorDownloadThread(QThread):
                 "WARNING",
             )
 
+        if self.sync_update is not None:
+            self.sync_update.save()
+
         # Log summary of failed files
         if self.failed_files:
             self._safe_emit(
@@ -2443,6 +2842,10 @@ class CreatorDownloaderTab(QWidget):
         self.other_files_dir = self._parent.other_files_folder if self._parent else ""
         self.current_creator_url = None
         self.all_files_map = {}
+        # creator_url -> {post_id: listing record} from post detection
+        self.post_records_map = {}
+        # creator_url -> SyncUpdate of an incremental scan (see creator_sync)
+        self.sync_updates_map = {}
         self.checked_urls = {}
         self.current_file_index = -1
         self.active_threads = []
@@ -2460,6 +2863,8 @@ class CreatorDownloaderTab(QWidget):
         self.post_population_thread = None
         self.filter_thread = None
         self.file_preparation_thread = None
+        # DownloadFeed of the creator being prepared and downloaded at once.
+        self._creator_feed = None
         self.checkbox_toggle_thread = None
         self._cancellation_thread = None
         self.post_titles_map = {}
@@ -2474,6 +2879,17 @@ class CreatorDownloaderTab(QWidget):
         self.fast_mode = False
         self._fast_mode_downloading = False
         self._fast_mode_pending_urls: list[str] = []
+        # Pipelined fast mode: creators detected and prepared ahead of the
+        # one downloading, their prefetch threads, and the creator whose
+        # download waits for its prefetch to finish.
+        self._fast_mode_pipeline = FastModePipeline(0)
+        self._fast_mode_prefetch_threads = []
+        self._fast_mode_waiting_url = None
+        # Download threads of earlier creators still finishing their last
+        # files while the next creator downloads, and whether the batch
+        # end waits for them.
+        self._fast_mode_tail_threads = []
+        self._fast_mode_finish_pending = False
         os.makedirs(self.cache_dir, exist_ok=True)
         os.makedirs(self.other_files_dir, exist_ok=True)
         self.setup_ui()
@@ -2494,6 +2910,13 @@ class CreatorDownloaderTab(QWidget):
             api_request_max_retries=self._parent.settings_tab.get_api_request_max_retries(),
             simultaneous_downloads=self._parent.settings_tab.get_simultaneous_downloads(),
             settings_tab=self._parent.settings_tab,
+            download_engine=self._parent.settings_tab.get_download_engine(),
+            segmented_threshold_mb=self._parent.settings_tab.get_segmented_download_threshold_mb(),
+            segmented_segments=self._parent.settings_tab.get_segmented_download_segments(),
+            listing_prep=self._parent.settings_tab.is_creator_listing_prep_enabled(),
+            incremental_sync=self._parent.settings_tab.is_creator_incremental_sync_enabled(),
+            skip_completed=self._parent.settings_tab.is_creator_skip_completed_enabled(),
+            stream_prep=self._parent.settings_tab.is_creator_stream_prep_enabled(),
         )
 
     def setup_ui(self):
@@ -2675,6 +3098,10 @@ class CreatorDownloaderTab(QWidget):
         )
         self.creator_overall_progress.setRange(0, 100)
         creator_progress_layout.addWidget(self.creator_overall_progress)
+        # Effective download concurrency (moves at runtime in adaptive mode)
+        self.creator_concurrency_label = QLabel()
+        self.creator_concurrency_label.setStyleSheet("color: white;")
+        creator_progress_layout.addWidget(self.creator_concurrency_label)
         left_layout.addLayout(creator_progress_layout)
 
         # Console
@@ -3102,6 +3529,8 @@ class CreatorDownloaderTab(QWidget):
                         self.post_url_map = {}
                         self.checked_urls = {}
                         self.all_files_map = {}
+                        self.post_records_map = {}
+                        self.sync_updates_map = {}
                         self.current_creator_url = None
                         self.previous_selected_widget = None
                         self.update_checked_posts()
@@ -3202,9 +3631,15 @@ class CreatorDownloaderTab(QWidget):
         # Disable UI elements during fetching
         self.set_fetching_ui_state(True)
 
+        thread_settings = self._create_thread_settings()
         self.post_detection_thread = PostDetectionThread(
-            url, self.post_titles_map, self._create_thread_settings()
+            url, self.post_titles_map, thread_settings
         )
+        incremental_sync = thread_settings.incremental_sync
+        if incremental_sync and self.other_files_dir:
+            self.post_detection_thread.sync_db = open_completion_db(
+                self.other_files_dir, self._parent.download_folder
+            )
         self.post_detection_thread.finished.connect(self.on_post_detection_finished)
         self.post_detection_thread.posts_batch.connect(self.on_posts_batch_received)
         self.post_detection_thread.log.connect(self.append_log_to_console)
@@ -3223,6 +3658,12 @@ class CreatorDownloaderTab(QWidget):
         # Only update if we haven't been receiving incremental batches
         if self.current_creator_url not in self.all_files_map:
             self.all_files_map[self.current_creator_url] = detected_posts
+        post_records = self.post_detection_thread.post_records
+        if post_records:
+            self.post_records_map[self.current_creator_url] = post_records
+        self.sync_updates_map[self.current_creator_url] = (
+            self.post_detection_thread.sync_update
+        )
         # Ensure all_detected_posts is set (should already be set from batches)
         if not self.all_detected_posts:
             self.all_detected_posts = detected_posts
@@ -3550,6 +3991,10 @@ class CreatorDownloaderTab(QWidget):
         # Fast mode: auto-detect and download all creators in queue
         if self.fast_mode:
             self._fast_mode_pending_urls = [url for url, _ in self.creator_queue]
+            self._fast_mode_stop_pipeline()
+            self._fast_mode_pipeline = FastModePipeline(
+                self._parent.settings_tab.get_creator_fast_mode_lookahead()
+            )
             self._fast_mode_downloading = True
             self.downloading = True
             self.set_downloading_ui_state(True)
@@ -3621,7 +4066,12 @@ class CreatorDownloaderTab(QWidget):
     def _fast_mode_process_next(self):
         """Process the next creator URL in the fast mode queue."""
         if not self._fast_mode_pending_urls:
+            if self._fast_mode_tail_threads:
+                # The batch ends once the earlier creators finish too.
+                self._fast_mode_finish_pending = True
+                return
             self._fast_mode_downloading = False
+            self._fast_mode_stop_pipeline()
             self.append_log_to_console(
                 translate("log_info", translate("fast_mode_batch_complete")),
                 "INFO",
@@ -3639,33 +4089,183 @@ class CreatorDownloaderTab(QWidget):
             ),
             "INFO",
         )
+        state, prepared = self._fast_mode_pipeline.take(url)
+        self._fast_mode_prefetch()
+        if state == PREPARING:
+            # Started by on_creator_prefetched once its preparation is done.
+            self._fast_mode_waiting_url = url
+            return
+        if state == READY and prepared is not None:
+            self._fast_mode_start_prepared(prepared)
+            return
         # This triggers post detection → on_post_population_finished
         # which will call _fast_mode_auto_download when _fast_mode_downloading is True
         self.check_creator_from_queue(url)
 
-    def _fast_mode_auto_download(self):
-        """Called after post population in fast-mode to auto-select all and download."""
-        if not self.current_creator_url:
+    def _fast_mode_prefetch(self):
+        """Start preparing the upcoming creators the lookahead allows."""
+        if not self._fast_mode_downloading:
+            return
+        for url in self._fast_mode_pipeline.to_prepare(self._fast_mode_pending_urls):
+            thread = CreatorPrefetchThread(
+                url,
+                self.post_titles_map,
+                self.creator_ext_checks,
+                self.creator_main_check.isChecked(),
+                self.creator_attachments_check.isChecked(),
+                self.creator_content_check.isChecked(),
+                self._create_thread_settings(),
+                other_files_dir=self.other_files_dir,
+                download_folder=self._parent.download_folder,
+            )
+            thread.log.connect(self.append_log_to_console)
+            thread.prepared.connect(self.on_creator_prefetched)
+            thread.finished.connect(
+                lambda t=thread: self._fast_mode_forget_prefetch_thread(t)
+            )
+            self._fast_mode_prefetch_threads.append(thread)
             self.append_log_to_console(
-                translate("log_warning", translate("no_creator_viewed")), "WARNING"
+                translate("log_info", translate("fast_mode_prefetching", url)), "INFO"
+            )
+            thread.start()
+
+    def _fast_mode_forget_prefetch_thread(self, thread):
+        if thread in self._fast_mode_prefetch_threads:
+            self._fast_mode_prefetch_threads.remove(thread)
+        try:
+            thread.deleteLater()
+        except RuntimeError:
+            pass
+
+    def _fast_mode_stop_pipeline(self):
+        """Stop every prefetch and drop the prepared creators."""
+        for thread in self._fast_mode_prefetch_threads:
+            thread.stop()
+        self._fast_mode_pipeline.clear()
+        self._fast_mode_waiting_url = None
+        self._fast_mode_finish_pending = False
+
+    def on_creator_download_draining(self, thread):
+        """Start the next prepared creator while *thread* finishes its files.
+
+        The draining thread leaves ``active_threads`` and the tab's progress
+        counters, which move on to the next creator; the shared download
+        scheduler hands it and the next creator's workers slots from the
+        same global pool.
+        """
+        if not self._fast_mode_downloading or thread not in self.active_threads:
+            return
+        if not self._fast_mode_pending_urls:
+            return
+        next_url = self._fast_mode_pending_urls[0]
+        if not self._fast_mode_pipeline.is_ready(next_url):
+            return
+        url = self.current_creator_url
+        self.active_threads.remove(thread)
+        self._fast_mode_tail_threads.append(thread)
+        for signal in (
+            thread.file_progress,
+            thread.transfer_progress,
+            thread.file_completed,
+            thread.post_completed,
+            thread.finished,
+            thread.concurrency_changed,
+            thread.draining,
+        ):
+            try:
+                signal.disconnect()
+            except TypeError:
+                pass
+        thread.post_completed.connect(
+            lambda post_id: self.append_log_to_console(
+                translate("log_info", translate("post_fully_downloaded", post_id)),
+                "INFO",
             )
+        )
+        thread.finished.connect(lambda: self._fast_mode_tail_finished(thread, url))
+        self.append_log_to_console(
+            translate(
+                "log_info", translate("fast_mode_overlap_started", url, next_url)
+            ),
+            "INFO",
+        )
+        # The tab's per-creator state now belongs to the next creator.
+        self.total_files_to_download = 0
+        self.completed_files.clear()
+        self.failed_files.clear()
+        self.completed_posts.clear()
+        self.file_preparation_thread = None
+        self._creator_feed = None
+        self._fast_mode_remove_creator_url(url)
+        self._fast_mode_process_next()
+
+    def _fast_mode_tail_finished(self, thread, url):
+        """Forget a creator download that finished behind the next one."""
+        if thread in self._fast_mode_tail_threads:
+            self._fast_mode_tail_threads.remove(thread)
+        self.append_log_to_console(
+            translate("log_info", translate("fast_mode_overlap_finished", url)),
+            "INFO",
+        )
+        try:
+            if thread.isRunning():
+                thread.wait(5000)
+            thread.deleteLater()
+        except RuntimeError:
+            pass
+        if not self._fast_mode_tail_threads and self._fast_mode_finish_pending:
+            self._fast_mode_finish_pending = False
             self._fast_mode_process_next()
+
+    def _fast_mode_stop_tail_threads(self):
+        """Hand finishing creator downloads back to the cancellation path."""
+        self.active_threads.extend(self._fast_mode_tail_threads)
+        self._fast_mode_tail_threads = []
+
+    def on_creator_prefetched(self, url, prepared):
+        """Buffer a creator prepared ahead; start it if its turn has come."""
+        if not self._fast_mode_downloading:
+            return
+        self._fast_mode_pipeline.prepared(url, prepared)
+        if prepared is None:
+            self.append_log_to_console(
+                translate("log_warning", translate("fast_mode_prefetch_fallback", url)),
+                "WARNING",
+            )
+        if self._fast_mode_waiting_url != url:
             return
+        self._fast_mode_waiting_url = None
+        _, prepared = self._fast_mode_pipeline.take(url)
+        self._fast_mode_prefetch()
+        if prepared is not None:
+            self._fast_mode_start_prepared(prepared)
+        else:
+            self.check_creator_from_queue(url)
 
+    def _fast_mode_start_prepared(self, prepared):
+        """Download a creator whose posts and files were prepared ahead."""
+        url = prepared.url
+        self.current_creator_url = url
+        self.checked_urls.clear()
+        self.filtered_posts = []
+        self.post_url_map = {}
+        self.creator_post_list.clear()
+        self.post_widget_cache.clear()
+        self.previous_selected_widget = None
+        self.all_files_map[url] = prepared.detected_posts
+        if prepared.post_records:
+            self.post_records_map[url] = prepared.post_records
+        self.sync_updates_map[url] = prepared.sync_update
+        self.all_detected_posts = list(prepared.detected_posts)
         if not self.all_detected_posts:
             self.append_log_to_console(
-                translate(
-                    "log_warning",
-                    translate("fast_mode_no_posts_found", self.current_creator_url),
-                ),
+                translate("log_warning", translate("fast_mode_no_posts_found", url)),
                 "WARNING",
             )
-            self._fast_mode_remove_creator_url(self.current_creator_url)
+            self._fast_mode_remove_creator_url(url)
             self._fast_mode_process_next()
             return
-
-        # Auto-select ALL posts
-        for post_title, (post_id, thumbnail_url) in self.all_detected_posts:
+        for _, (post_id, _) in self.all_detected_posts:
             self.checked_urls[post_id] = True
         self.posts_to_download = [
             post_id for _, (post_id, _) in self.all_detected_posts
@@ -3673,16 +4273,18 @@ class CreatorDownloaderTab(QWidget):
         self.append_log_to_console(
             translate(
                 "log_info",
-                translate(
-                    "fast_mode_auto_selected",
-                    len(self.posts_to_download),
-                    self.current_creator_url,
-                ),
+                translate("fast_mode_auto_selected", len(self.posts_to_download), url),
             ),
             "INFO",
         )
+        self._reset_download_progress()
+        self.completed_posts.update(prepared.skipped_posts)
+        self.on_file_preparation_finished(
+            [url], prepared.files_to_download, prepared.files_to_posts_map
+        )
 
-        # Set up download state
+    def _reset_download_progress(self):
+        """Reset the progress display and counters for a creator download."""
         if self._parent and hasattr(self._parent, "status_label"):
             self._parent.status_label.setText(translate("preparing_files"))
         self.creator_download_btn.setEnabled(False)
@@ -3702,6 +4304,48 @@ class CreatorDownloaderTab(QWidget):
         self.update_progress_bar_style()
         self.background_task_label.setText(translate("preparing_files"))
         self.background_task_progress.setRange(0, 100)
+
+    def _fast_mode_auto_download(self):
+        """Called after post population in fast-mode to auto-select all and download."""
+        if not self.current_creator_url:
+            self.append_log_to_console(
+                translate("log_warning", translate("no_creator_viewed")), "WARNING"
+            )
+            self._fast_mode_process_next()
+            return
+
+        if not self.all_detected_posts:
+            self.append_log_to_console(
+                translate(
+                    "log_warning",
+                    translate("fast_mode_no_posts_found", self.current_creator_url),
+                ),
+                "WARNING",
+            )
+            self._fast_mode_remove_creator_url(self.current_creator_url)
+            self._fast_mode_process_next()
+            return
+
+        # Auto-select ALL posts
+        for post_title, (post_id, thumbnail_url) in self.all_detected_posts:
+            self.checked_urls[post_id] = True
+        self.posts_to_download = [
+            post_id for _, (post_id, _) in self.all_detected_posts
+        ]
+        self.append_log_to_console(
+            translate(
+                "log_info",
+                translate(
+                    "fast_mode_auto_selected",
+                    len(self.posts_to_download),
+                    self.current_creator_url,
+                ),
+            ),
+            "INFO",
+        )
+
+        # Set up download state
+        self._reset_download_progress()
         self.background_task_progress.setValue(0)
 
         urls = [self.current_creator_url]
@@ -3760,6 +4404,7 @@ class CreatorDownloaderTab(QWidget):
             self.creator_download_finished()
             return
 
+        thread_settings = self._create_thread_settings()
         self.file_preparation_thread = FilePreparationThread(
             post_ids,
             self.all_files_map,
@@ -3767,19 +4412,91 @@ class CreatorDownloaderTab(QWidget):
             self.creator_main_check.isChecked(),
             self.creator_attachments_check.isChecked(),
             self.creator_content_check.isChecked(),
-            self._create_thread_settings(),
+            thread_settings,
             max_concurrent=5,
+            post_records=self.post_records_map.get(self.current_creator_url),
+        )
+        self.file_preparation_thread.sync_update = self.sync_updates_map.get(
+            self.current_creator_url
         )
+        skip_completed = thread_settings.skip_completed
+        if skip_completed and self.other_files_dir:
+            self.file_preparation_thread.completion_db = open_completion_db(
+                self.other_files_dir, self._parent.download_folder
+            )
+        feed = None
+        if self._stream_preparation(thread_settings):
+            feed = DownloadFeed()
+            self.file_preparation_thread.feed = feed
+        self._creator_feed = feed
         self.file_preparation_thread.progress.connect(self.update_background_progress)
-        self.file_preparation_thread.finished.connect(
-            lambda files, files_map: self.on_file_preparation_finished(
-                urls, files, files_map
+        if feed is not None:
+            self.file_preparation_thread.finished.connect(
+                lambda files, files_map: self.on_streamed_preparation_finished()
+            )
+        else:
+            self.file_preparation_thread.finished.connect(
+                lambda files, files_map: self.on_file_preparation_finished(
+                    urls, files, files_map
+                )
             )
-        )
         self.file_preparation_thread.log.connect(self.append_log_to_console)
         self.file_preparation_thread.error.connect(self.on_file_preparation_error)
         self.active_threads.append(self.file_preparation_thread)
         self.file_preparation_thread.start()
+        if feed is not None:
+            self.total_files_to_download = 0
+            self.start_creator_download_thread(urls, [], {}, feed)
+
+    def _stream_preparation(self, settings):
+        """Return True to download the creator's files while preparing them."""
+        if not settings.stream_prep:
+            return False
+        # {total_files} is only known once every post has been prepared.
+        template = self._parent.settings_tab.get_creator_filename_template()
+        return "{total_files}" not in template
+
+    def on_streamed_preparation_finished(self):
+        """Wrap up a preparation whose files were streamed to the download."""
+        skipped_posts = self.file_preparation_thread.skipped_posts
+        if skipped_posts:
+            self.completed_posts.update(skipped_posts)
+        feed = self._creator_feed
+        if feed is not None:
+            self.total_files_to_download = feed.total()
+        self.append_log_to_console(
+            translate(
+                "log_debug",
+                translate("prepared_files_for_download", self.total_files_to_download),
+            ),
+            "INFO",
+        )
+        self.background_task_progress.setRange(0, 100)
+        self.background_task_progress.setValue(0)
+        self.background_task_label.setText(translate("idle"))
+        self.update_overall_progress()
+        # The feed is closed right after this signal; let the thread exit so
+        # the download's cleanup does not find it still running.
+        thread = self.file_preparation_thread
+        try:
+            if thread is not None and thread.isRunning():
+                thread.wait(5000)
+        except RuntimeError:
+            pass
+        self.cleanup_file_preparation_thread()
+
+    def _completion_selection_key(self):
+        """Return the post completion selection key of the current filters."""
+        return selection_key(
+            [
+                ext
+                for ext, checkbox in self.creator_ext_checks.items()
+                if checkbox.isChecked()
+            ],
+            self.creator_main_check.isChecked(),
+            self.creator_attachments_check.isChecked(),
+            self.creator_content_check.isChecked(),
+        )
 
     def cleanup_file_preparation_thread(self):
         """Clean up the file preparation thread after it finishes."""
@@ -3795,7 +4512,12 @@ class CreatorDownloaderTab(QWidget):
         self.background_task_progress.setValue(value)
 
     def on_file_preparation_finished(self, urls, files_to_download, files_to_posts_map):
+        self._creator_feed = None
         self.total_files_to_download = len(files_to_download)
+        # Posts skipped as already complete count as completed.
+        skipped_posts = self.file_preparation_thread.skipped_posts
+        if skipped_posts:
+            self.completed_posts.update(skipped_posts)
         self.append_log_to_console(
             translate(
                 "log_debug",
@@ -3814,6 +4536,15 @@ class CreatorDownloaderTab(QWidget):
             self.process_next_creator(urls[1:] if len(urls) > 1 else [])
             return
 
+        self.start_creator_download_thread(urls, files_to_download, files_to_posts_map)
+
+    def start_creator_download_thread(
+        self, urls, files_to_download, files_to_posts_map, feed=None
+    ):
+        """Start the download of ``urls[0]``; the rest follow once it is done.
+
+        With a *feed*, the files arrive from a preparation still running.
+        """
         url = urls[0]
         url = url.rstrip("/")
         remaining_urls = urls[1:]
@@ -3860,11 +4591,24 @@ class CreatorDownloaderTab(QWidget):
             settings.simultaneous_downloads,
             download_text=self.creator_download_text_check.isChecked(),
         )
+        thread.selection_key = self._completion_selection_key()
+        thread.sync_update = self.sync_updates_map.get(self.current_creator_url)
+        if feed is not None:
+            thread.feed = feed
+            # No file tells the creator's domain yet.
+            thread.domain_config = get_domain_config(url)
+        configure_download_scheduler(
+            self._parent.settings_tab, settings.simultaneous_downloads
+        )
         thread.file_progress.connect(self.update_creator_file_progress)
+        thread.transfer_progress.connect(self.update_creator_transfer)
         thread.file_completed.connect(self.update_file_completion)
         thread.post_completed.connect(self.update_post_completion)
         thread.log.connect(self.append_log_to_console)
+        thread.concurrency_changed.connect(self.update_creator_concurrency)
         thread.finished.connect(lambda: self.cleanup_thread(thread, remaining_urls))
+        if self._fast_mode_downloading and self._fast_mode_pipeline.lookahead:
+            thread.draining.connect(lambda: self.on_creator_download_draining(thread))
         self.active_threads.append(thread)
         thread.start()
 
@@ -3966,6 +4710,9 @@ class CreatorDownloaderTab(QWidget):
         except RuntimeError:
             pass  # C++ object already deleted
 
+        feed = self._creator_feed
+        if feed is not None:
+            self.total_files_to_download = feed.total()
         # Check if all files for the current creator have been attempted
         if (
             self.total_files_to_download > 0
@@ -4007,6 +4754,12 @@ class CreatorDownloaderTab(QWidget):
                 self.process_next_creator(remaining_urls)
             else:
                 self.creator_download_finished()
+        elif feed is not None and not feed.total() and not self.active_threads:
+            # A streamed creator whose preparation found nothing to download.
+            self.append_log_to_console(
+                translate("log_warning", translate("no_files_detected")), "WARNING"
+            )
+            self.process_next_creator(remaining_urls)
         elif not self.active_threads and not remaining_urls:
             self.append_log_to_console(
                 translate("log_debug", translate("no_more_active_threads")), "INFO"
@@ -4051,6 +4804,8 @@ class CreatorDownloaderTab(QWidget):
         # Stop fast-mode processing loop
         self._fast_mode_downloading = False
         self._fast_mode_pending_urls.clear()
+        self._fast_mode_stop_pipeline()
+        self._fast_mode_stop_tail_threads()
 
         if not self.active_threads:
             self.append_log_to_console(
@@ -4165,6 +4920,7 @@ class CreatorDownloaderTab(QWidget):
         self.downloading = False
         self._fast_mode_downloading = False
         self._fast_mode_pending_urls.clear()
+        self._fast_mode_stop_pipeline()
         self.set_downloading_ui_state(False)
         self.total_files_to_download = 0
         self.completed_files.clear()
@@ -4175,12 +4931,18 @@ class CreatorDownloaderTab(QWidget):
         self.background_task_progress.setValue(0)
         self.background_task_label.setText(translate("idle"))
         self.file_preparation_thread = None
+        self._creator_feed = None
         self.post_detection_thread = None
         self.post_population_thread = None
         self.filter_thread = None
         self.checkbox_toggle_thread = None
         self.validation_thread = None
 
+    def update_creator_concurrency(self, limit):
+        self.creator_concurrency_label.setText(
+            translate("effective_concurrency", limit)
+        )
+
     def update_creator_file_progress(self, file_index, progress):
         if self.current_file_index == file_index or self.current_file_index == -1:
             self.current_file_index = file_index
@@ -4189,6 +4951,19 @@ class CreatorDownloaderTab(QWidget):
                 translate("file_progress", progress)
             )
 
+    def update_creator_transfer(self, snapshot):
+        """Add the throughput and time left to the tracked file's progress."""
+        if self.current_file_index not in snapshot.files:
+            return
+        self.creator_file_progress_label.setText(
+            translate(
+                "file_progress_rate",
+                snapshot.percent(self.current_file_index),
+                format_bytes(snapshot.throughput),
+                format_duration(snapshot.eta),
+            )
+        )
+
     def update_file_completion(self, file_index, file_url, success, file_path=""):
         """Update file completion status and check overall progress."""
         with self.completed_files_lock, self.failed_files_lock:
@@ -4227,9 +5002,15 @@ class CreatorDownloaderTab(QWidget):
                         ),
                         "INFO",
                     )
+            # While files are streamed from preparation, the total grows
+            # and is only final once the feed is closed.
+            feed = self._creator_feed
+            if feed is not None:
+                self.total_files_to_download = feed.total()
             self.update_overall_progress()
             if (
-                self.total_files_to_download > 0
+                (feed is None or feed.closed)
+                and self.total_files_to_download > 0
                 and len(self.completed_files) + len(self.failed_files)
                 >= self.total_files_to_download
             ):
@@ -4378,6 +5159,7 @@ class CreatorDownloaderTab(QWidget):
         self.background_task_progress.setValue(0)
         self.background_task_label.setText(translate("idle"))
         self.file_preparation_thread = None
+        self._creator_feed = None
         self.post_detection_thread = None
         self.post_population_thread = None
         self.filter_thread = None
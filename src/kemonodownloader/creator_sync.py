@@ -0,0 +1,178 @@
+"""
+creator_sync.py
+===============
+Incremental creator detection.
+
+Re-checking a creator used to walk its whole listing, 50 posts per
+request, even when only a couple of posts were new since the last check.
+After a complete scan ``PostDetectionThread`` records the newest post it
+saw (id and ``published`` timestamp) in ``HashDB``'s ``creator_sync``
+table.  With incremental sync enabled, the next scan walks the listing,
+which is ordered newest first, and stops at the first page whose posts
+are all at least as old as that marker: everything beyond it was already
+seen.  A routine re-check of a large creator then costs one or two page
+requests.
+
+The marker is only advanced by a scan that reached the end of the listing
+or a page of known posts, so a scan interrupted half way never hides the
+posts it did not get to.  Nor does the scan itself save it: it returns a
+``SyncUpdate`` holding the posts newer than the old marker.  Preparation
+settles the posts it skips as complete or finds without files, the
+download thread settles each post whose files all arrived, and ``save``
+moves the marker only past posts that were settled.  A cancelled or
+failed download therefore leaves its posts to be found again by the next
+scan.
+"""
+
+from __future__ import annotations
+
+import sqlite3
+import threading
+from typing import Iterable, List, NamedTuple, Optional, Set
+
+# ---------------------------------------------------------------------------
+# State
+# ---------------------------------------------------------------------------
+
+
+class SyncMarker(NamedTuple):
+    """The newest post seen for a creator."""
+
+    post_id: str
+    published: str
+
+
+def post_published(post: dict) -> str:
+    """Return the ISO timestamp a listing record is ordered by, or ``""``."""
+    return str(post.get("published") or post.get("added") or "")
+
+
+def load_marker(hash_db, service: str, creator_id: str) -> Optional[SyncMarker]:
+    """Return the stored marker of a creator, or ``None`` without one."""
+    sync_state = getattr(hash_db, "sync_state", None)
+    if sync_state is None:
+        return None
+    state = sync_state(service, creator_id)
+    if not isinstance(state, dict) or not state.get("newest_post_id"):
+        return None
+    return SyncMarker(state["newest_post_id"], state.get("newest_published", ""))
+
+
+def save_marker(hash_db, service: str, creator_id: str, marker: SyncMarker) -> None:
+    """Persist *marker* for a creator, if *hash_db* keeps sync state.
+
+    A database error only costs the next scan its shortcut.
+    """
+    store_sync_state = getattr(hash_db, "store_sync_state", None)
+    if store_sync_state is None:
+        return
+    try:
+        store_sync_state(service, creator_id, marker.post_id, marker.published)
+    except sqlite3.Error:
+        pass
+
+
+# ---------------------------------------------------------------------------
+# Listing checks
+# ---------------------------------------------------------------------------
+
+
+def is_known_post(post: dict, marker: SyncMarker) -> bool:
+    """Return True when *post* is no newer than the post *marker* records."""
+    if str(post.get("id")) == marker.post_id:
+        return True
+    published = post_published(post)
+    # ISO 8601 timestamps of one format compare correctly as strings.
+    return bool(published and marker.published and published <= marker.published)
+
+
+def page_is_known(posts: Iterable, marker: Optional[SyncMarker]) -> bool:
+    """Return True when every post on a listing page is already known."""
+    if marker is None:
+        return False
+    records = [p for p in posts if isinstance(p, dict) and p.get("id")]
+    return bool(records) and all(is_known_post(p, marker) for p in records)
+
+
+def newest_marker(
+    posts: Iterable, previous: Optional[SyncMarker] = None
+) -> Optional[SyncMarker]:
+    """Return the marker of the newest post in *posts* (or *previous*)."""
+    newest = previous
+    for post in posts:
+        if not isinstance(post, dict) or not post.get("id"):
+            continue
+        published = post_published(post)
+        if newest is None or published > newest.published:
+            newest = SyncMarker(str(post["id"]), published)
+    return newest
+
+
+# ---------------------------------------------------------------------------
+# Deferred marker updates
+# ---------------------------------------------------------------------------
+
+
+class SyncUpdate:
+    """Marker advance of one complete scan, applied as its posts are done.
+
+    *posts* are the listing records newer than *previous*.  ``settle`` may
+    be called from any thread; ``save`` stores the newest marker that
+    hides no unsettled post and can be called any number of times.
+    """
+
+    def __init__(
+        self,
+        hash_db,
+        service: str,
+        creator_id: str,
+        previous: Optional[SyncMarker],
+        posts: Iterable[dict],
+    ):
+        self.hash_db = hash_db
+        self.service = service
+        self.creator_id = creator_id
+        self.previous = previous
+        self.posts: List[dict] = [
+            p
+            for p in posts
+            if isinstance(p, dict)
+            and p.get("id")
+            and (previous is None or not is_known_post(p, previous))
+        ]
+        self._settled: Set[str] = set()
+        self._lock = threading.Lock()
+
+    def settle(self, post_ids: Iterable) -> None:
+        """Mark posts as done: downloaded, skipped as complete, or empty."""
+        with self._lock:
+            self._settled.update(str(post_id) for post_id in post_ids)
+
+    def marker(self) -> Optional[SyncMarker]:
+        """Return the newest marker that still leaves every unsettled post new."""
+        with self._lock:
+            settled = set(self._settled)
+        # A post without a timestamp is only ever known by its own id.
+        cutoff = min(
+            (
+                post_published(p)
+                for p in self.posts
+                if str(p["id"]) not in settled and post_published(p)
+            ),
+            default=None,
+        )
+        return newest_marker(
+            (
+                p
+                for p in self.posts
+                if str(p["id"]) in settled
+                and (cutoff is None or post_published(p) < cutoff)
+            ),
+            self.previous,
+        )
+
+    def save(self) -> None:
+        """Persist the marker when the settled posts moved it forward."""
+        marker = self.marker()
+        if marker is not None and marker != self.previous:
+            save_marker(self.hash_db, self.service, self.creator_id, marker)
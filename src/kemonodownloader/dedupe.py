@@ -0,0 +1,127 @@
+"""
+dedupe.py
+=========
+Content-addressed deduplication of downloads.
+
+Kemono and Coomer serve every file from ``/data/ab/cd/<sha256>.<ext>``, so
+the hash of a file's content is known from its URL before anything is
+downloaded.  ``HashDB`` indexes that hash for every file it records, which
+lets the downloaders recognise an attachment that is already somewhere in
+the library even when it was reposted under another name (the ``?f=``
+part of the URL) or in another post.
+
+Such a file is materialised from the local copy instead of being fetched:
+
+1. a hardlink (no extra space, instant) when both paths are on the same
+   filesystem and it supports links;
+2. a reflink/clone (copy-on-write, instant) where the filesystem supports
+   it (Linux ``FICLONE`` on Btrfs, XFS, ...);
+3. a plain copy otherwise.
+
+The result is written under a temporary name and moved into place, so a
+failure never leaves a partial file at the target path.
+"""
+
+from __future__ import annotations
+
+import os
+import shutil
+import sys
+from typing import Optional
+
+from kemonodownloader.hash_db import file_unchanged
+from kemonodownloader.segmented import server_sha256
+
+# ---------------------------------------------------------------------------
+# Constants
+# ---------------------------------------------------------------------------
+
+LINK_HARDLINK = "hardlink"
+LINK_REFLINK = "reflink"
+LINK_COPY = "copy"
+
+TEMP_SUFFIX = ".dedupe"
+
+# ioctl request number of FICLONE (linux/fs.h).
+_FICLONE = 0x40049409
+
+
+# ---------------------------------------------------------------------------
+# Lookup
+# ---------------------------------------------------------------------------
+
+
+def find_local_copy(hash_db, file_url: str, target_path: str) -> Optional[dict]:
+    """Return a recorded, unchanged file with the content of *file_url*.
+
+    Returns ``None`` when the URL carries no content hash, nothing with that
+    content is recorded (or the hash database cannot be searched), or every
+    recorded copy has since changed or disappeared.  *target_path* itself is
+    never returned.
+    """
+    content_sha256 = server_sha256(file_url)
+    content_entries = getattr(hash_db, "content_entries", None)
+    if not content_sha256 or content_entries is None:
+        return None
+    target = os.path.abspath(target_path)
+    for entry in content_entries(content_sha256):
+        if os.path.abspath(entry["file_path"]) == target:
+            continue
+        if file_unchanged(hash_db, entry["url_hash"], entry):
+            return entry
+    return None
+
+
+# ---------------------------------------------------------------------------
+# Materialising
+# ---------------------------------------------------------------------------
+
+
+def _reflink(source: str, target: str) -> bool:
+    if not sys.platform.startswith("linux"):
+        return False
+    try:
+        import fcntl
+    except ImportError:
+        return False
+    try:
+        with open(source, "rb") as src, open(target, "wb") as dst:
+            fcntl.ioctl(dst.fileno(), _FICLONE, src.fileno())
+        return True
+    except OSError:
+        try:
+            os.remove(target)
+        except OSError:
+            pass
+        return False
+
+
+def link_or_copy(source: str, target: str) -> str:
+    """Create *target* with the content of *source*; return how it was made.
+
+    Tries a hardlink, then a reflink, then a copy.  Raises ``OSError`` when
+    even the copy fails.
+    """
+    temp_path = target + TEMP_SUFFIX
+    try:
+        os.remove(temp_path)
+    except OSError:
+        pass
+    try:
+        os.link(source, temp_path)
+        mode = LINK_HARDLINK
+    except OSError:
+        if _reflink(source, temp_path):
+            mode = LINK_REFLINK
+        else:
+            shutil.copyfile(source, temp_path)
+            mode = LINK_COPY
+    try:
+        os.replace(temp_path, target)
+    except OSError:
+        try:
+            os.remove(temp_path)
+        except OSError:
+            pass
+        raise
+    return mode
@@ -0,0 +1,158 @@
+"""
+deep_verify.py
+==============
+Opt-in background re-hashing of files the downloaders skipped.
+
+When a URL is already recorded in ``HashDB`` the downloaders decide that
+the file on disk is unchanged from a ``stat`` (size, mtime, inode; see
+``hash_db.file_unchanged``) instead of re-reading it.  That misses silent
+corruption that keeps the metadata intact, so users who want the stronger
+guarantee can enable deep verification: every skipped file is handed to
+``DeepVerifier``, which hashes it on its own daemon thread and drops the
+hash-database entry when the content no longer matches, so the file is
+downloaded again on the next run.
+
+The verifier never blocks the download queue: ``submit`` only appends to a
+list, and hashing pauses briefly between chunks so it yields disk and CPU
+time to active downloads.  The worker thread exits when the list is empty
+and is started again by the next ``submit``.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import threading
+import time
+from collections import deque
+from typing import Any, Callable, Deque, NamedTuple, Optional
+
+# ---------------------------------------------------------------------------
+# Constants
+# ---------------------------------------------------------------------------
+
+VERIFY_CHUNK_SIZE = 1024 * 1024
+# Pause between chunks; keeps verification from competing with downloads.
+VERIFY_CHUNK_PAUSE = 0.005
+
+
+class VerifyJob(NamedTuple):
+    hash_db: Any
+    url_hash: str
+    file_path: str
+    file_hash: str
+    on_mismatch: Optional[Callable[[str], None]] = None
+
+
+# ---------------------------------------------------------------------------
+# Verifier
+# ---------------------------------------------------------------------------
+
+
+class DeepVerifier:
+    """Hashes submitted files one at a time on a low-priority daemon thread."""
+
+    def __init__(
+        self,
+        chunk_size: int = VERIFY_CHUNK_SIZE,
+        chunk_pause: float = VERIFY_CHUNK_PAUSE,
+    ):
+        self.chunk_size = chunk_size
+        self.chunk_pause = chunk_pause
+        self._lock = threading.Lock()
+        self._jobs: Deque[VerifyJob] = deque()
+        self._queued: set = set()
+        self._worker: Optional[threading.Thread] = None
+        self._generation = 0
+
+    def submit(
+        self,
+        hash_db,
+        url_hash: str,
+        file_path: str,
+        file_hash: str,
+        on_mismatch: Optional[Callable[[str], None]] = None,
+    ) -> None:
+        """Queue *file_path* for verification against *file_hash*."""
+        with self._lock:
+            if file_path in self._queued:
+                return
+            self._queued.add(file_path)
+            self._jobs.append(
+                VerifyJob(hash_db, url_hash, file_path, file_hash, on_mismatch)
+            )
+            if self._worker is None:
+                self._worker = threading.Thread(
+                    target=self._run, args=(self._generation,), daemon=True
+                )
+                self._worker.start()
+
+    def pending(self) -> int:
+        """Number of files waiting for, or undergoing, verification."""
+        with self._lock:
+            return len(self._queued)
+
+    def wait_idle(self, timeout: float = 30.0) -> bool:
+        """Poll until every submitted file has been verified."""
+        deadline = time.monotonic() + timeout
+        while self.pending():
+            if time.monotonic() >= deadline:
+                return False
+            time.sleep(0.01)
+        return True
+
+    def clear(self) -> None:
+        """Drop queued jobs and detach the running worker."""
+        with self._lock:
+            self._jobs.clear()
+            self._queued.clear()
+            self._worker = None
+            self._generation += 1
+
+    def _run(self, generation: int) -> None:
+        while True:
+            with self._lock:
+                if generation != self._generation:
+                    return
+                if not self._jobs:
+                    self._worker = None
+                    return
+                job = self._jobs.popleft()
+            try:
+                self._verify(job, generation)
+            finally:
+                with self._lock:
+                    if generation == self._generation:
+                        self._queued.discard(job.file_path)
+
+    def _verify(self, job: VerifyJob, generation: int) -> None:
+        hasher = hashlib.md5()
+        try:
+            with open(job.file_path, "rb") as f:
+                for chunk in iter(lambda: f.read(self.chunk_size), b""):
+                    if generation != self._generation:
+                        return
+                    hasher.update(chunk)
+                    if self.chunk_pause:
+                        time.sleep(self.chunk_pause)
+        except OSError:
+            # A missing file is caught by the next download's lookup.
+            return
+        if hasher.hexdigest() == job.file_hash:
+            return
+        try:
+            job.hash_db.delete(job.url_hash)
+        except Exception:
+            pass
+        if job.on_mismatch is not None:
+            try:
+                job.on_mismatch(job.file_path)
+            except Exception:
+                pass
+
+
+_verifier = DeepVerifier()
+
+
+def get_deep_verifier() -> DeepVerifier:
+    """Return the process-wide verifier shared by all download threads."""
+    return _verifier
@@ -0,0 +1,1902 @@
+"""
+download_core.py
+================
+Qt-free detection, preparation and download of creators and posts.
+
+The download engines of the GUI are ``QThread`` subclasses that report
+through ``pyqtSignal``, so nothing could run without PyQt6 and a display.
+This module holds the parts of the pipeline that need neither, shared by
+the GUI threads and by the command line (``cli``):
+
+* **URLs** - ``parse_creator_url`` / ``parse_post_url``.
+* **Detection** - ``DownloadCore.detect_posts`` walks a creator's
+  listing, probing the API endpoint forms and fetching the remaining
+  pages concurrently once the profile reports the post count;
+  ``detect_post_files`` picks the main file, attachments and content
+  images of a post record.
+* **Naming** - the filename template and folder strategy of the creator
+  downloader (``split_file_name``, ``render_file_name``,
+  ``creator_folder_for``, ``target_folder_for``).
+* **API** - listing pages and creator profiles through a ``requests``
+  session (``fetch_listing_page``, ``fetch_post_count``,
+  ``fetch_creator_name``).
+* **Downloads** - ``DownloadCore`` walks creators and posts end to end on
+  plain worker threads: resumable ``.part`` transfers behind the shared
+  connection gate, the hash database for already downloaded and
+  duplicate files, and post completion records.  The per-file steps
+  (``intact_download``, ``adopt_local_copy``, ``transfer_to_part``,
+  ``complete_part``) are the ones the GUI's creator downloader runs too.
+
+Post fetches and file transfers are made one attempt at a time: a failed
+attempt returns ``RetryLater`` and the item waits out its backoff on a
+``RetrySchedule``, so no worker sleeps.  The GUI's detection and
+preparation threads run on a ``DownloadCore`` subclass of their own.
+
+Progress is reported to a ``DownloadListener``; every method of the base
+class is a no-op, so callers override only the events they need.  The
+listener is called from worker threads.
+
+Importing this module never imports Qt.
+"""
+
+from __future__ import annotations
+
+import gzip
+import hashlib
+import json
+import os
+import re
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import (
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    NamedTuple,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+)
+from urllib.parse import parse_qs, urlparse
+
+import requests
+from bs4 import BeautifulSoup
+
+from kemonodownloader.api_cache import CachingAdapter
+from kemonodownloader.connection_gate import get_connection_gate
+from kemonodownloader.creator_sync import SyncUpdate, load_marker, page_is_known
+from kemonodownloader.dedupe import find_local_copy, link_or_copy
+from kemonodownloader.domain_config import clean_file_url, get_domain_config
+from kemonodownloader.endpoint_cache import (
+    build_page_url,
+    get_endpoint_cache,
+    ordered_forms,
+)
+from kemonodownloader.hash_db import file_unchanged
+from kemonodownloader.kd_language import translate
+from kemonodownloader.post_completion import (
+    completed_post_ids,
+    record_post_complete,
+    selection_key,
+)
+from kemonodownloader.rate_limiter import cancellable, get_rate_limiter, host_of
+from kemonodownloader.resumable import (
+    DownloadCancelled,
+    IncompleteDownloadError,
+    StreamHasher,
+    existing_offset,
+    finalize_part,
+    part_path_for,
+    plan_resume,
+    range_headers,
+)
+from kemonodownloader.retry_schedule import RetryLater, RetrySchedule, backoff_delay
+
+# ---------------------------------------------------------------------------
+# Constants
+# ---------------------------------------------------------------------------
+
+# File types offered by the creator downloader, all enabled by default.
+DEFAULT_EXTENSIONS = (
+    ".jpg",
+    ".png",
+    ".zip",
+    ".mp4",
+    ".gif",
+    ".pdf",
+    ".7z",
+    ".mp3",
+    ".wav",
+    ".flac",
+    ".var",
+    ".rar",
+    ".mov",
+    ".docx",
+    ".psd",
+    ".clip",
+    ".jpe",
+    ".webp",
+)
+
+DEFAULT_TEMPLATE = "{post_id}_{orig_name}"
+
+PER_POST = "per_post"
+SINGLE_FOLDER = "single_folder"
+BY_FILE_TYPE = "by_file_type"
+FOLDER_STRATEGIES = (PER_POST, SINGLE_FOLDER, BY_FILE_TYPE)
+
+PAGE_SIZE = 50
+DEFAULT_MAX_PAGES = 200
+DEFAULT_WORKERS = 4
+DEFAULT_MAX_RETRIES = 3
+CHUNK_SIZE = 64 * 1024
+
+# Files a post can be listed with as its thumbnail.
+THUMBNAIL_EXTENSIONS = (".jpg", ".jpeg", ".png", ".gif", ".webp")
+
+DEFAULT_USER_AGENT = (
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
+    "AppleWebKit/537.36 (KHTML, like Gecko) "
+    "Chrome/131.0.0.0 Safari/537.36"
+)
+
+LogCallback = Callable[[str, str], None]
+
+# Indexes of DownloadCore's counters, in DownloadSummary order.
+_DOWNLOADED, _SKIPPED, _FAILED = range(3)
+
+
+# ---------------------------------------------------------------------------
+# Events
+# ---------------------------------------------------------------------------
+
+
+class DownloadListener:
+    """Receives the events of a ``DownloadCore``; override what you need."""
+
+    def log(self, message: str, level: str) -> None:
+        """A log line; *level* is ``DEBUG``, ``INFO``, ``WARNING`` or ``ERROR``."""
+
+    def page_detected(self, url: str, posts: List[dict]) -> None:
+        """The records of one listing page of *url*, in offset order."""
+
+    def posts_detected(self, url: str, posts: List[Tuple[str, str]]) -> None:
+        """The ``(post_id, title)`` pairs found for the creator at *url*."""
+
+    def throttled(self, url: str) -> None:
+        """A request to *url* was answered with 429 Too Many Requests."""
+
+    def file_progress(self, file_url: str, downloaded: int, total: int) -> None:
+        """Bytes of *file_url* on disk so far; *total* is 0 when unknown."""
+
+    def file_completed(self, file_url: str, success: bool, file_path: str) -> None:
+        """A file was downloaded, found on disk, or given up on."""
+
+    def post_completed(self, post_id: str) -> None:
+        """Every file of a post was downloaded."""
+
+
+# ---------------------------------------------------------------------------
+# URLs
+# ---------------------------------------------------------------------------
+
+
+class CreatorRef(NamedTuple):
+    """A creator URL: ``.../{service}/user/{creator_id}[?o=..&q=..]``."""
+
+    service: str
+    creator_id: str
+    search_query: Optional[str] = None
+    # Set when the URL names a single listing page.
+    offset: Optional[int] = None
+
+
+class PostRef(NamedTuple):
+    """A post URL: ``.../{service}/user/{creator_id}/post/{post_id}``."""
+
+    service: str
+    creator_id: str
+    post_id: str
+
+
+def _path_parts(url: str) -> List[str]:
+    return [part for part in urlparse(url.strip()).path.split("/") if part]
+
+
+def parse_creator_url(url: str) -> Optional[CreatorRef]:
+    """Return the creator *url* names, or ``None`` for any other URL."""
+    parts = _path_parts(url)
+    if len(parts) < 3 or parts[-2] != "user":
+        return None
+    query = parse_qs(urlparse(url.strip()).query)
+    offset = None
+    offset_param = query.get("o", [None])[0]
+    if offset_param:
+        try:
+            offset = max(0, int(offset_param))
+        except ValueError:
+            offset = None
+    return CreatorRef(parts[-3], parts[-1], query.get("q", [None])[0], offset)
+
+
+def parse_post_url(url: str) -> Optional[PostRef]:
+    """Return the post *url* names, or ``None`` for any other URL."""
+    parts = _path_parts(url)
+    if len(parts) < 5 or parts[-4] != "user" or parts[-2] != "post":
+        return None
+    return PostRef(parts[-5], parts[-3], parts[-1])
+
+
+# ---------------------------------------------------------------------------
+# Detection
+# ---------------------------------------------------------------------------
+
+
+def sanitize_filename(name, max_length=100):
+    """Sanitize a filename by removing invalid characters, trailing dots, and limiting length."""
+    if not name:
+        return "unnamed"
+    # Remove invalid characters
+    sanitized = re.sub(r'[<>:"/\\|?*]', "_", name)
+    # Replace spaces with underscores
+    sanitized = sanitized.replace(" ", "_")
+    # Remove multiple consecutive underscores
+    sanitized = re.sub(r"_+", "_", sanitized)
+    # Remove trailing dots (Windows compatibility)
+    sanitized = sanitized.rstrip(".")
+    # Remove leading dots to avoid hidden/unsafe filenames
+    sanitized = sanitized.lstrip(".")
+    # Trim leading/trailing underscores
+    sanitized = sanitized.strip("_")
+    # Limit length
+    if len(sanitized) > max_length:
+        sanitized = sanitized[:max_length].rstrip(".").strip("_")
+    # Ensure non-empty
+    return sanitized if sanitized else "unnamed"
+
+
+def _effective_extension(file_path: str, file_name: str) -> str:
+    name_ext = os.path.splitext(file_name)[1].lower()
+    path_ext = os.path.splitext(file_path)[1].lower()
+    return name_ext if name_ext else path_ext
+
+
+def _extension_allowed(ext: str, allowed_extensions: Iterable[str]) -> bool:
+    # The JPG/JPEG option is stored as ".jpg" and covers both spellings.
+    if ".jpg" in allowed_extensions and ext in (".jpg", ".jpeg"):
+        return True
+    return ext in allowed_extensions
+
+
+def detect_post_files(
+    post: dict,
+    allowed_extensions: Iterable[str],
+    domain_config: Dict[str, str],
+    main: bool = True,
+    attachments: bool = True,
+    content: bool = True,
+    log: Optional[LogCallback] = None,
+) -> List[Tuple[str, str]]:
+    """Return the ``(file_name, file_url)`` pairs of *post* to download.
+
+    *main*, *attachments* and *content* select the main file, the
+    attachments and the images embedded in the post body.  Duplicates are
+    dropped, keeping the first occurrence.
+    """
+    allowed_extensions = list(allowed_extensions)
+
+    def emit(key, *args):
+        if log is not None:
+            log(translate("log_debug", translate(key, *args)), "INFO")
+
+    files_to_download = []
+    emit("detecting_files_for_post", allowed_extensions)
+
+    # Main file detection
+    if main and "file" in post and post["file"] and "path" in post["file"]:
+        file_path = post["file"]["path"]
+        file_name = post["file"].get("name", "")
+        file_ext = _effective_extension(file_path, file_name)
+        file_url = clean_file_url(file_path, domain_config)
+        if "f=" not in file_url and file_name:
+            file_url += f"?f={file_name}"
+        emit("checking_main_file", file_name, file_ext)
+        if _extension_allowed(file_ext, allowed_extensions):
+            emit("added_main_file", file_name)
+            files_to_download.append((file_name, file_url))
+
+    # Attachments detection
+    if attachments and "attachments" in post:
+        for attachment in post["attachments"]:
+            if not isinstance(attachment, dict) or "path" not in attachment:
+                continue
+            attachment_path = attachment["path"]
+            attachment_name = attachment.get("name", "")
+            attachment_ext = _effective_extension(attachment_path, attachment_name)
+            attachment_url = clean_file_url(attachment_path, domain_config)
+            if "f=" not in attachment_url and attachment_name:
+                attachment_url += f"?f={attachment_name}"
+            emit("checking_attachment", attachment_name, attachment_ext)
+            if _extension_allowed(attachment_ext, allowed_extensions):
+                emit("added_attachment", attachment_name)
+                files_to_download.append((attachment_name, attachment_url))
+
+    # Content images detection
+    if content and "content" in post and post["content"]:
+        soup = BeautifulSoup(post["content"], "html.parser")
+        for img in soup.select("img[src]"):
+            img_url = clean_file_url(str(img.get("src")), domain_config)
+            img_ext = os.path.splitext(img_url)[1].lower()
+            img_name = os.path.basename(img_url)
+            emit("checking_content_image", img_name, img_ext)
+            if _extension_allowed(img_ext, allowed_extensions):
+                emit("added_content_image", img_name)
+                files_to_download.append((img_name, img_url))
+
+    emit("total_files_detected", len(files_to_download))
+    return list(dict.fromkeys(files_to_download))
+
+
+def listing_record_usable(
+    post: Optional[dict], main: bool, attachments: bool, content: bool
+) -> bool:
+    """Return True when a listing record carries every field detection reads."""
+    if not isinstance(post, dict):
+        return False
+    if main and "file" not in post:
+        return False
+    if attachments and not isinstance(post.get("attachments"), list):
+        return False
+    if content and "content" not in post:
+        return False
+    return True
+
+
+def post_entry(
+    post: dict, domain_config: Dict[str, str]
+) -> Tuple[str, Tuple[object, Optional[str]]]:
+    """Return the ``(title, (post_id, thumbnail_url))`` entry listing *post*.
+
+    The thumbnail is the main file when it is an image, else the first image
+    attachment, else the main file whatever its type.
+    """
+    post_id = post.get("id")
+    title = post.get("title", f"Post {post_id}")
+    thumbnail_url = None
+    if "file" in post and post["file"] and "path" in post["file"]:
+        if post["file"]["path"].lower().endswith(THUMBNAIL_EXTENSIONS):
+            thumbnail_url = clean_file_url(post["file"]["path"], domain_config)
+    if not thumbnail_url and "attachments" in post:
+        for attachment in post["attachments"]:
+            if (
+                isinstance(attachment, dict)
+                and "path" in attachment
+                and attachment["path"].lower().endswith(THUMBNAIL_EXTENSIONS)
+            ):
+                thumbnail_url = clean_file_url(attachment["path"], domain_config)
+                break
+    if not thumbnail_url and "file" in post and post["file"] and "path" in post["file"]:
+        thumbnail_url = clean_file_url(post["file"]["path"], domain_config)
+    return (title, (post_id, thumbnail_url))
+
+
+# ---------------------------------------------------------------------------
+# Naming
+# ---------------------------------------------------------------------------
+
+
+def split_file_name(file_url: str) -> Tuple[str, str]:
+    """Return ``(original_name, extension)`` of the file *file_url* serves."""
+    raw_filename = (
+        file_url.split("f=")[-1]
+        if "f=" in file_url
+        else file_url.split("/")[-1].split("?")[0]
+    )
+    return os.path.splitext(raw_filename)[0], os.path.splitext(raw_filename)[1]
+
+
+def render_file_name(template: Optional[str], context: dict) -> Optional[str]:
+    """Return *template* formatted with *context*, or ``None`` when it fails.
+
+    An empty template selects ``DEFAULT_TEMPLATE``.
+    """
+    try:
+        return (template or DEFAULT_TEMPLATE).format(**context)
+    except Exception:
+        return None
+
+
+def creator_folder_for(folder: str, creator_id, creator_name) -> str:
+    """Return the creator's folder, which *folder* may already be."""
+    creator_folder_name = f"{creator_id}_{creator_name or creator_id}"
+    norm_folder = os.path.normpath(folder)
+    if os.path.basename(norm_folder) == creator_folder_name:
+        return norm_folder
+    return os.path.join(folder, creator_folder_name)
+
+
+def target_folder_for(
+    creator_folder: str, strategy: str, post_id, post_title: str, file_ext: str
+) -> str:
+    """Return the folder a file lands in under the folder *strategy*.
+
+    *post_title* must already be sanitized.
+    """
+    if strategy == SINGLE_FOLDER:
+        return creator_folder
+    if strategy == BY_FILE_TYPE:
+        ext_folder = (file_ext.lstrip(".") or "other").lower()
+        return os.path.join(creator_folder, ext_folder)
+    return os.path.join(creator_folder, f"{post_id}_{post_title}")
+
+
+# ---------------------------------------------------------------------------
+# API
+# ---------------------------------------------------------------------------
+
+
+def request_headers(
+    domain_config: Dict[str, str],
+    user_agent: str = DEFAULT_USER_AGENT,
+    accept_language: str = "en-US,en;q=0.9",
+) -> Dict[str, str]:
+    """Return the headers API and file requests to a domain are sent with."""
+    return {
+        "User-Agent": user_agent,
+        "Referer": domain_config["referer"],
+        "Accept": "text/css",
+        "Accept-Language": accept_language,
+        "Accept-Encoding": "gzip, deflate",
+        "Connection": "keep-alive",
+    }
+
+
+def create_session(proxies: Optional[Dict[str, str]] = None) -> requests.Session:
+    """Return a session paced by the shared rate limiter and API cache."""
+    session = requests.Session()
+    # The environment/registry proxy lookup is not thread-safe on Windows;
+    # proxies are passed explicitly instead.
+    session.trust_env = False
+    adapter = CachingAdapter(
+        pool_connections=10, pool_maxsize=10, max_retries=3, pool_block=False
+    )
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    if proxies:
+        session.proxies.update(proxies)
+    return session
+
+
+def decode_json(response):
+    """Return the JSON body of *response*, gunzipping it when needed."""
+    content = response.content
+    if content[:2] == b"\x1f\x8b":
+        content = gzip.decompress(content)
+    return json.loads(content.decode("utf-8") or "null")
+
+
+def fetch_listing_page(
+    session,
+    headers: Dict[str, str],
+    domain_config: Dict[str, str],
+    service: str,
+    creator_id: str,
+    offset: int,
+    page_size: int = PAGE_SIZE,
+    search_query: Optional[str] = None,
+    should_continue: Optional[Callable[[], bool]] = None,
+) -> Optional[list]:
+    """Fetch one listing page; return its posts, or None when it failed.
+
+    Uses the endpoint form cached for this domain/service and only probes
+    the others when that form fails.
+    """
+    endpoint_cache = get_endpoint_cache()
+    domain = domain_config["domain"]
+    for form in ordered_forms(endpoint_cache.get(domain, service)):
+        if should_continue is not None and not should_continue():
+            return None
+        page_url = build_page_url(
+            form, domain_config, service, creator_id, offset, page_size, search_query
+        )
+        try:
+            response = session.get(page_url, headers=headers, timeout=15)
+            if response.status_code != 200:
+                continue
+            posts_data = decode_json(response)
+        except (requests.RequestException, ValueError, EOFError, gzip.BadGzipFile):
+            continue
+        if posts_data is None:
+            posts_data = []
+        if isinstance(posts_data, dict):
+            posts_data = posts_data.get("posts", posts_data.get("data"))
+        if isinstance(posts_data, list):
+            endpoint_cache.remember(domain, service, form)
+            return posts_data
+    return None
+
+
+def fetch_post_count(
+    session,
+    headers: Dict[str, str],
+    domain_config: Dict[str, str],
+    service: str,
+    creator_id: str,
+) -> Optional[int]:
+    """Return the creator's post count from the profile, or None."""
+    profile_url = f"{domain_config['api_base']}/{service}/user/{creator_id}/profile"
+    try:
+        response = session.get(profile_url, headers=headers, timeout=15)
+        if response.status_code != 200:
+            return None
+        profile = decode_json(response)
+    except Exception:
+        return None
+    if not isinstance(profile, dict):
+        return None
+    post_count = profile.get("post_count")
+    if isinstance(post_count, bool) or not isinstance(post_count, (int, str)):
+        return None
+    try:
+        return max(0, int(post_count))
+    except ValueError:
+        return None
+
+
+def fetch_creator_name(
+    session,
+    headers: Dict[str, str],
+    domain_config: Dict[str, str],
+    service: str,
+    creator_id: str,
+) -> Optional[str]:
+    """Return the creator's display name from the profile, or None."""
+    profile_url = f"{domain_config['api_base']}/{service}/user/{creator_id}/profile"
+    try:
+        response = session.get(profile_url, headers=headers, timeout=15)
+        if response.status_code != 200:
+            return None
+        profile = decode_json(response)
+    except (requests.RequestException, ValueError, EOFError, gzip.BadGzipFile):
+        return None
+    if not isinstance(profile, dict) or not profile.get("name"):
+        return None
+    return str(profile["name"])
+
+
+# ---------------------------------------------------------------------------
+# Downloads
+# ---------------------------------------------------------------------------
+
+
+class FileJob(NamedTuple):
+    """One file of a prepared post and where it is saved."""
+
+    url: str
+    folder: str
+    filename: str
+    service: str
+    creator_id: str
+    post_id: str
+
+
+class DownloadSummary(NamedTuple):
+    downloaded: int
+    skipped: int
+    failed: int
+
+
+# The steps below are shared by ``DownloadCore`` and the GUI's
+# ``CreatorDownloadThread``, which wrap them in their own retry loops and
+# report through a listener or Qt signals respectively.
+
+
+def intact_download(
+    hash_db,
+    url_hash: str,
+    entry: Optional[dict] = None,
+    on_size_mismatch: Optional[Callable[[str, int, int], None]] = None,
+) -> Optional[dict]:
+    """Return the record of *url_hash* when its file is still on disk, intact.
+
+    *entry* is the record when the caller already looked it up.  A file
+    whose size differs from the recorded one is reported to
+    ``on_size_mismatch(path, actual, expected)`` and not returned, so it
+    is downloaded again.
+    """
+    if entry is None:
+        entry = hash_db.lookup(url_hash)
+    if not entry or not os.path.exists(entry["file_path"]):
+        return None
+    actual_size = os.path.getsize(entry["file_path"])
+    expected_size = entry.get("file_size", 0)
+    if expected_size > 0 and actual_size != expected_size:
+        if on_size_mismatch is not None:
+            on_size_mismatch(entry["file_path"], actual_size, expected_size)
+        return None
+    if not file_unchanged(hash_db, url_hash, entry):
+        return None
+    return entry
+
+
+def adopt_local_copy(
+    hash_db,
+    local_copy: dict,
+    file_url: str,
+    url_hash: str,
+    full_path: str,
+    service: str,
+    creator_id: str,
+    post_id: str,
+) -> str:
+    """Put the library file *local_copy* at *full_path* and record it.
+
+    Returns how it was placed (see ``link_or_copy``); raises ``OSError``
+    when it could not be.
+    """
+    mode = link_or_copy(local_copy["file_path"], full_path)
+    hash_db.store(
+        url_hash,
+        full_path,
+        local_copy["file_hash"],
+        file_url,
+        os.path.getsize(full_path),
+        service=service,
+        creator_id=creator_id,
+        post_id=post_id,
+    )
+    return mode
+
+
+def transfer_to_part(
+    session,
+    file_url: str,
+    headers: Dict[str, str],
+    part_path: str,
+    hasher: StreamHasher,
+    should_continue: Callable[[], bool],
+    gate=None,
+    on_headers: Optional[Callable[[], None]] = None,
+    on_plan: Optional[Callable] = None,
+    on_chunk: Optional[Callable[[int, int], None]] = None,
+    chunk_size: int = CHUNK_SIZE,
+) -> Tuple[int, int]:
+    """Stream *file_url* into *part_path*; return ``(expected, on_disk)``.
+
+    Resumes from the bytes already in the part with a Range request, behind
+    the connection *gate* (the shared one by default).  ``on_headers()``
+    runs once the response headers arrived, ``on_plan(plan, headers)``
+    before the body is streamed (it may raise to refuse the transfer) and
+    ``on_chunk(downloaded, total)`` after every chunk.  Raises
+    ``DownloadCancelled`` once *should_continue* returns False.
+    """
+    offset = existing_offset(part_path)
+    if gate is None:
+        gate = get_connection_gate()
+    with gate.establishing(file_url, should_continue) as ok:
+        if not ok or not should_continue():
+            raise DownloadCancelled(f"Download of {file_url} cancelled")
+        with cancellable(should_continue):
+            response = session.get(
+                file_url,
+                headers=range_headers(headers, offset),
+                stream=True,
+                timeout=(30, 30),
+            )
+    if on_headers is not None:
+        on_headers()
+    try:
+        plan = plan_resume(
+            getattr(response, "status_code", 200), response.headers, offset, part_path
+        )
+        hasher.resume(part_path, plan.offset)
+        if plan.complete:
+            return plan.total_size, plan.offset
+        response.raise_for_status()
+        if on_plan is not None:
+            on_plan(plan, response.headers)
+        downloaded_size = plan.offset
+        with open(part_path, plan.mode) as file_handle:
+            for chunk in response.iter_content(chunk_size=chunk_size):
+                if not should_continue():
+                    raise DownloadCancelled(f"Download of {file_url} cancelled")
+                if chunk:
+                    file_handle.write(chunk)
+                    hasher.update(chunk)
+                    downloaded_size += len(chunk)
+                    if on_chunk is not None:
+                        on_chunk(downloaded_size, plan.total_size)
+        return plan.total_size, downloaded_size
+    finally:
+        response.close()
+
+
+def complete_part(
+    hash_db,
+    part_path: str,
+    full_path: str,
+    hasher: StreamHasher,
+    file_url: str,
+    url_hash: str,
+    file_size: int,
+    downloaded_size: int,
+    service: str,
+    creator_id: str,
+    post_id: str,
+    log: Optional[LogCallback] = None,
+) -> None:
+    """Move a finished part to *full_path* and record it in *hash_db*.
+
+    Raises ``IncompleteDownloadError`` when fewer or more bytes than
+    expected arrived.  A short part is kept for the next attempt to
+    resume; a part larger than the file can never be valid and is removed.
+    """
+    if file_size > 0 and downloaded_size != file_size:
+        if log is not None:
+            log(
+                translate(
+                    "log_warning",
+                    translate(
+                        "size_mismatch_error", downloaded_size, file_size, file_url
+                    ),
+                ),
+                "WARNING",
+            )
+        if downloaded_size > file_size and os.path.exists(part_path):
+            try:
+                os.remove(part_path)
+                if log is not None:
+                    log(
+                        translate(
+                            "log_info", translate("deleted_incomplete_file", part_path)
+                        ),
+                        "INFO",
+                    )
+            except OSError as e:
+                if log is not None:
+                    log(
+                        translate(
+                            "log_error",
+                            translate(
+                                "failed_to_delete_incomplete_file", part_path, str(e)
+                            ),
+                        ),
+                        "ERROR",
+                    )
+        raise IncompleteDownloadError(
+            f"Size mismatch: downloaded {downloaded_size} bytes, "
+            f"expected {file_size} bytes"
+        )
+    finalize_part(part_path, full_path)
+    if hash_db is not None:
+        hash_db.store(
+            url_hash,
+            full_path,
+            hasher.digest_for(full_path),
+            file_url,
+            os.path.getsize(full_path),
+            service=service,
+            creator_id=creator_id,
+            post_id=post_id,
+        )
+
+
+class CoreSettings:
+    """Options of a ``DownloadCore`` run."""
+
+    def __init__(
+        self,
+        download_dir: str,
+        extensions: Iterable[str] = DEFAULT_EXTENSIONS,
+        main: bool = True,
+        attachments: bool = True,
+        content: bool = True,
+        template: str = DEFAULT_TEMPLATE,
+        folder_strategy: str = PER_POST,
+        auto_rename: bool = False,
+        workers: int = DEFAULT_WORKERS,
+        max_retries: int = DEFAULT_MAX_RETRIES,
+        listing_prep: bool = False,
+        incremental: bool = False,
+        max_pages: int = DEFAULT_MAX_PAGES,
+        skip_completed: bool = True,
+        proxies: Optional[Dict[str, str]] = None,
+        user_agent: str = DEFAULT_USER_AGENT,
+    ):
+        self.download_dir = download_dir
+        self.extensions = [ext.lower() for ext in extensions]
+        self.main = main
+        self.attachments = attachments
+        self.content = content
+        self.template = template or DEFAULT_TEMPLATE
+        self.folder_strategy = folder_strategy
+        self.auto_rename = auto_rename
+        self.workers = max(1, workers)
+        self.max_retries = max(1, max_retries)
+        # Prepare posts from their listing records when those are complete,
+        # instead of fetching every post (fast mode).
+        self.listing_prep = listing_prep
+        # Stop detection at the newest post of the last complete scan.
+        self.incremental = incremental
+        # Listing pages walked per creator at most.
+        self.max_pages = max_pages
+        # Drop posts whose files were all downloaded by an earlier run.
+        self.skip_completed = skip_completed
+        self.proxies = proxies
+        self.user_agent = user_agent
+
+
+class DownloadCore:
+    """Detects, prepares and downloads creators and posts without Qt.
+
+    *hash_db* is a ``HashDB`` (or ``None`` to keep no records).  ``run``
+    blocks until every URL is done or ``stop`` is called, which may be
+    done from any thread.
+    """
+
+    RETRY_BASE_DELAY = 1.0
+    # Pause between two listing pages of the sequential walk.
+    PAGE_DELAY = 0.5
+    # Pages fetched at once when the profile reports the creator's post
+    # count; requests still go through the shared per-host rate limiter.
+    PARALLEL_PAGE_WORKERS = 4
+
+    def __init__(self, settings: CoreSettings, listener=None, hash_db=None):
+        self.settings = settings
+        self.listener = listener if listener is not None else DownloadListener()
+        self.hash_db = hash_db
+        self.is_running = True
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._counts = [0, 0, 0]
+        self._post_counters: Dict[str, int] = {}
+
+    def stop(self) -> None:
+        self.is_running = False
+
+    def _log(self, message: str, level: str = "INFO") -> None:
+        self.listener.log(message, level)
+
+    def _count(self, outcome: int) -> None:
+        with self._lock:
+            self._counts[outcome] += 1
+
+    def session(self) -> requests.Session:
+        """Return this thread's session (threads never share one)."""
+        session = getattr(self._local, "session", None)
+        if session is None:
+            session = create_session(self.settings.proxies)
+            self._local.session = session
+        return session
+
+    def headers(self, domain_config: Dict[str, str]) -> Dict[str, str]:
+        return request_headers(domain_config, self.settings.user_agent)
+
+    @property
+    def selection(self) -> str:
+        settings = self.settings
+        return selection_key(
+            settings.extensions, settings.main, settings.attachments, settings.content
+        )
+
+    def _run_queue(self, items: Iterable, attempt: Callable) -> list:
+        """Run ``attempt(item, number)`` for every item on the worker threads.
+
+        An attempt returning ``RetryLater`` is put on a ``RetrySchedule``
+        and submitted again, with the next number, once its delay is over,
+        so no worker sleeps through a backoff.  Returns the final results
+        in *items* order; an item still waiting when the core is stopped
+        gives ``None``.
+        """
+        items = list(items)
+        results: list = [None] * len(items)
+        attempts = [1] * len(items)
+        schedule = RetrySchedule()
+        with ThreadPoolExecutor(max_workers=self.settings.workers) as pool:
+            pending = {
+                pool.submit(attempt, item, 1): index for index, item in enumerate(items)
+            }
+            while pending or len(schedule):
+                if not self.is_running:
+                    schedule.clear()
+                for index in schedule.pop_due():
+                    future = pool.submit(attempt, items[index], attempts[index])
+                    pending[future] = index
+                next_due = schedule.next_due_in()
+                timeout = None if next_due is None else min(next_due, 0.25)
+                if not pending:
+                    if timeout:
+                        time.sleep(timeout)
+                    continue
+                done, _ = wait(pending, timeout=timeout, return_when=FIRST_COMPLETED)
+                for future in done:
+                    index = pending.pop(future)
+                    result = future.result()
+                    if isinstance(result, RetryLater):
+                        attempts[index] += 1
+                        schedule.schedule(index, result.delay)
+                    else:
+                        results[index] = result
+        return results
+
+    # ------------------------------------------------------------------
+    # Entry points
+    # ------------------------------------------------------------------
+
+    def run(self, urls: Iterable[str]) -> DownloadSummary:
+        """Download every creator and post URL in *urls*, in order."""
+        for url in urls:
+            if not self.is_running:
+                break
+            url = url.strip()
+            if parse_post_url(url) is not None:
+                self.download_post(url)
+            elif parse_creator_url(url) is not None:
+                self.download_creator(url)
+            else:
+                self._log(
+                    translate("log_error", translate("unsupported_url", url)), "ERROR"
+                )
+                self._count(_FAILED)
+        if self.hash_db is not None:
+            self.hash_db.try_flush()
+        with self._lock:
+            return DownloadSummary(*self._counts)
+
+    def download_creator(self, url: str) -> None:
+        ref = parse_creator_url(url)
+        if ref is None:
+            return
+        domain_config = get_domain_config(url)
+        headers = self.headers(domain_config)
+        creator_name = (
+            fetch_creator_name(
+                self.session(), headers, domain_config, ref.service, ref.creator_id
+            )
+            or ref.creator_id
+        )
+        posts, sync_update = self.detect_posts(url, ref, domain_config)
+        if not self.is_running:
+            return
+        self.listener.posts_detected(
+            url,
+            [
+                (str(post["id"]), post.get("title") or f"Post {post['id']}")
+                for post in posts
+            ],
+        )
+        if self.settings.skip_completed and self.hash_db is not None and posts:
+            done = completed_post_ids(
+                self.hash_db,
+                ref.service,
+                ref.creator_id,
+                self.selection,
+                {str(post["id"]): post for post in posts},
+            )
+            if done:
+                posts = [post for post in posts if str(post["id"]) not in done]
+                self._log(
+                    translate(
+                        "log_info", translate("completed_posts_skipped", len(done))
+                    )
+                )
+                if sync_update is not None:
+                    sync_update.settle(done)
+        prepared = self.prepare_posts(ref.service, ref.creator_id, domain_config, posts)
+        completed = self.download_prepared(
+            domain_config, ref.service, ref.creator_id, creator_name, prepared
+        )
+        if sync_update is not None:
+            sync_update.settle(completed)
+            sync_update.save()
+
+    def download_post(self, url: str) -> None:
+        ref = parse_post_url(url)
+        if ref is None:
+            return
+        domain_config = get_domain_config(url)
+        headers = self.headers(domain_config)
+        creator_name = (
+            fetch_creator_name(
+                self.session(), headers, domain_config, ref.service, ref.creator_id
+            )
+            or ref.creator_id
+        )
+        prepared = self.prepare_posts(
+            ref.service, ref.creator_id, domain_config, [{"id": ref.post_id}]
+        )
+        if prepared:
+            self.download_prepared(
+                domain_config, ref.service, ref.creator_id, creator_name, prepared
+            )
+
+    # ------------------------------------------------------------------
+    # Detection
+    # ------------------------------------------------------------------
+
+    def _request_page(
+        self, ref: CreatorRef, domain_config: Dict[str, str], offset: int, more: bool
+    ):
+        """Return the response serving the listing page at *offset*, or None.
+
+        The endpoint form that last worked for this domain/service is tried
+        first; the other forms are only probed when it fails.  *more* is
+        True once earlier pages had posts, so a failure likely marks the end.
+        """
+        endpoint_cache = get_endpoint_cache()
+        domain = domain_config["domain"]
+        headers = self.headers(domain_config)
+        for form in ordered_forms(endpoint_cache.get(domain, ref.service)):
+            if not self.is_running:
+                return None
+            page_url = build_page_url(
+                form,
+                domain_config,
+                ref.service,
+                ref.creator_id,
+                offset,
+                PAGE_SIZE,
+                ref.search_query,
+            )
+            self._log(
+                translate("log_debug", translate("trying_endpoint", page_url)), "DEBUG"
+            )
+            try:
+                response = self.session().get(page_url, headers=headers, timeout=15)
+            except requests.RequestException as e:
+                key = (
+                    "endpoint_unavailable_likely_end"
+                    if more
+                    else "endpoint_error_with_exception"
+                )
+                self._log(
+                    translate("log_debug", translate(key, page_url, str(e))), "DEBUG"
+                )
+                continue
+            if response.status_code == 200:
+                endpoint_cache.remember(domain, ref.service, form)
+                self._log(
+                    translate("log_info", translate("endpoint_successful", page_url))
+                )
+                return response
+            if more:
+                message = translate(
+                    "endpoint_returned_status_likely_end",
+                    response.status_code,
+                    page_url,
+                )
+            else:
+                message = translate(
+                    "endpoint_failed_with_status", page_url, response.status_code
+                )
+            self._log(translate("log_debug", message), "DEBUG")
+        return None
+
+    def fetch_page(
+        self, ref: CreatorRef, domain_config: Dict[str, str], offset: int
+    ) -> Optional[list]:
+        """Fetch one listing page; return its posts, or None when it failed."""
+        if not self.is_running:
+            return None
+        return fetch_listing_page(
+            self.session(),
+            self.headers(domain_config),
+            domain_config,
+            ref.service,
+            ref.creator_id,
+            offset,
+            PAGE_SIZE,
+            ref.search_query,
+            should_continue=lambda: self.is_running,
+        )
+
+    def detect_pages_in_parallel(
+        self,
+        url: str,
+        ref: CreatorRef,
+        domain_config: Dict[str, str],
+        start_offset: int,
+        page_count: int,
+        all_posts: list,
+    ) -> Tuple[int, bool]:
+        """Fetch *page_count* pages concurrently and report them in offset order.
+
+        Pages are handed to ``page_detected`` strictly in offset order, so
+        listeners see the same sequence as in the sequential walk.  Returns
+        ``(pages_done, finished)``; ``finished`` is False when a page failed
+        or the last page was full (the profile count may be stale), and the
+        caller continues sequentially from the first page not yet reported.
+        """
+        offsets = [start_offset + i * PAGE_SIZE for i in range(page_count)]
+        pool = ThreadPoolExecutor(
+            max_workers=self.PARALLEL_PAGE_WORKERS, thread_name_prefix="pages"
+        )
+        futures = [
+            pool.submit(self.fetch_page, ref, domain_config, offset)
+            for offset in offsets
+        ]
+        pages_done = 0
+        finished = False
+        failed = False
+        try:
+            while pages_done < len(offsets) and self.is_running:
+                offset = offsets[pages_done]
+                try:
+                    posts_data = futures[pages_done].result()
+                except Exception:
+                    posts_data = None
+                if posts_data is None:
+                    if not self.is_running:
+                        break
+                    # Hand the failed page to the sequential walk, which
+                    # retries it with its full endpoint logging.
+                    self._log(
+                        translate(
+                            "log_warning",
+                            translate("page_fetch_failed_at_offset", offset),
+                        ),
+                        "WARNING",
+                    )
+                    failed = True
+                    break
+                pages_done += 1
+                self._log(
+                    translate(
+                        "log_debug",
+                        translate("fetched_posts_at_offset", len(posts_data), offset),
+                    ),
+                    "DEBUG",
+                )
+                records = [
+                    post
+                    for post in posts_data
+                    if isinstance(post, dict) and post.get("id")
+                ]
+                all_posts.extend(records)
+                if records:
+                    self.listener.page_detected(url, records)
+                if len(posts_data) < PAGE_SIZE:
+                    finished = True
+                    break
+        finally:
+            # Queued pages are dropped; requests in flight are waited for so
+            # none outlives the walk.
+            pool.shutdown(wait=True, cancel_futures=True)
+
+        unused = len(offsets) - pages_done - failed
+        if unused and not finished:
+            self._log(
+                translate(
+                    "log_debug",
+                    translate("parallel_pages_unused", unused, offsets[-unused]),
+                ),
+                "DEBUG",
+            )
+        return pages_done, finished
+
+    def detect_posts(
+        self, url: str, ref: CreatorRef, domain_config: Dict[str, str]
+    ) -> Tuple[list, Optional[SyncUpdate]]:
+        """Return the listing records of the creator at *url*, newest first.
+
+        Pages are walked in offset order and reported to ``page_detected``
+        as they arrive.  The second item is the ``SyncUpdate`` of a
+        complete incremental scan, to be saved once its posts are
+        downloaded, or ``None``.
+        """
+        service, creator_id = ref.service, ref.creator_id
+        search_query = ref.search_query
+        single_page_target = ref.offset is not None
+        self._log(translate("log_info", translate("checking_creator_with_url", url)))
+        self._log(
+            translate(
+                "log_debug",
+                translate("parsed_url_service_creator", service, creator_id),
+            )
+        )
+        base_api_url = f"{domain_config['api_base']}/{service}/user/{creator_id}"
+        self._log(translate("log_debug", translate("base_api_url", base_api_url)))
+        if single_page_target:
+            self._log(
+                translate(
+                    "log_info",
+                    f"Validation started with specific offset: {ref.offset}",
+                )
+            )
+        if search_query:
+            self._log(translate("log_info", f"Search query detected: {search_query}"))
+
+        # Incremental sync compares pages with the newest post of the last
+        # complete scan; searches and single pages always run in full.
+        incremental = (
+            self.settings.incremental
+            and self.hash_db is not None
+            and not search_query
+            and not single_page_target
+        )
+        marker = None
+        if incremental:
+            marker = load_marker(self.hash_db, service, creator_id)
+            if marker is not None:
+                self._log(
+                    translate(
+                        "log_info",
+                        translate(
+                            "incremental_sync_from",
+                            creator_id,
+                            marker.post_id,
+                            marker.published,
+                        ),
+                    )
+                )
+        # Set once the listing end, or a page of known posts, is reached.
+        scan_complete = False
+
+        all_posts: list = []
+        offset = ref.offset or 0
+        max_pages = self.settings.max_pages
+        page = 1
+        while page <= max_pages and self.is_running:
+            response = self._request_page(ref, domain_config, offset, bool(all_posts))
+            if not self.is_running:
+                break
+            if response is None:
+                if all_posts:
+                    self._log(
+                        translate(
+                            "log_info",
+                            translate("reached_last_page", creator_id, len(all_posts)),
+                        )
+                    )
+                    scan_complete = True
+                else:
+                    self._log(
+                        translate(
+                            "log_error",
+                            translate("all_api_endpoints_failed", creator_id),
+                        ),
+                        "ERROR",
+                    )
+                break
+
+            response_text = ""
+            try:
+                if response.content[:2] == b"\x1f\x8b":
+                    try:
+                        response_text = gzip.decompress(response.content).decode(
+                            "utf-8"
+                        )
+                        self._log(
+                            translate(
+                                "log_debug",
+                                translate("successfully_decompressed_gzipped_response"),
+                            ),
+                            "DEBUG",
+                        )
+                    except (gzip.BadGzipFile, UnicodeDecodeError, EOFError) as e:
+                        self._log(
+                            translate(
+                                "log_warning",
+                                translate("gzip_decompression_failed", str(e)),
+                            ),
+                            "WARNING",
+                        )
+                        response_text = getattr(response, "text", "")
+                else:
+                    response_text = getattr(response, "text", "")
+
+                if not response_text.strip():
+                    self._log(
+                        translate(
+                            "log_info", translate("empty_response_at_offset", offset)
+                        )
+                    )
+                    scan_complete = True
+                    break
+
+                if not self.is_running:
+                    break
+
+                posts_data = json.loads(response_text)
+            except (json.JSONDecodeError, UnicodeDecodeError) as e:
+                self._log(
+                    translate(
+                        "log_error", translate("failed_to_parse_response", str(e))
+                    ),
+                    "ERROR",
+                )
+                self._log(
+                    translate(
+                        "log_debug",
+                        translate(
+                            "response_content_first_500_chars",
+                            (response_text or "")[:500],
+                        ),
+                    ),
+                    "DEBUG",
+                )
+                break
+
+            if not isinstance(posts_data, list):
+                # Sometimes the API returns an object with a posts array
+                if isinstance(posts_data, dict) and "posts" in posts_data:
+                    posts_data = posts_data["posts"]
+                elif isinstance(posts_data, dict) and "data" in posts_data:
+                    posts_data = posts_data["data"]
+                elif isinstance(posts_data, dict):
+                    self._log(
+                        translate(
+                            "log_error",
+                            translate(
+                                "unexpected_response_structure",
+                                (
+                                    list(posts_data.keys())
+                                    if posts_data
+                                    else "empty dict"
+                                ),
+                            ),
+                        ),
+                        "ERROR",
+                    )
+                    break
+                else:
+                    self._log(
+                        translate(
+                            "log_error",
+                            translate("invalid_posts_data_type", type(posts_data)),
+                        ),
+                        "ERROR",
+                    )
+                    break
+
+            self._log(
+                translate(
+                    "log_debug",
+                    translate("fetched_posts_at_offset", len(posts_data), offset),
+                ),
+                "DEBUG",
+            )
+            if 0 < len(posts_data) < PAGE_SIZE:
+                self._log(
+                    translate(
+                        "log_info",
+                        translate(
+                            "received_less_than_page_size", len(posts_data), PAGE_SIZE
+                        ),
+                    )
+                )
+
+            if not posts_data:
+                self._log(
+                    translate("log_info", translate("no_more_posts_at_offset", offset))
+                )
+                scan_complete = True
+                break
+
+            records = [
+                post for post in posts_data if isinstance(post, dict) and post.get("id")
+            ]
+            for post in records:
+                title = post.get("title", f"Post {post['id']}")
+                self._log(
+                    translate(
+                        "log_debug", translate("post_id_and_title", post["id"], title)
+                    ),
+                    "DEBUG",
+                )
+            all_posts.extend(records)
+            if records:
+                self.listener.page_detected(url, records)
+
+            # The listing is newest first: once a whole page was seen by the
+            # last complete scan, so was everything after it.
+            if page_is_known(posts_data, marker):
+                self._log(
+                    translate(
+                        "log_info",
+                        translate("incremental_sync_stopped", offset, len(all_posts)),
+                    )
+                )
+                scan_complete = True
+                break
+
+            # A URL naming a single page (its offset) stops after that page.
+            if single_page_target:
+                self._log(
+                    translate("log_info", "Single page request satisfied, stopping.")
+                )
+                break
+
+            if len(posts_data) < PAGE_SIZE:
+                self._log(
+                    translate(
+                        "log_info",
+                        translate(
+                            "last_page_reached_with_counts",
+                            len(posts_data),
+                            PAGE_SIZE,
+                            len(all_posts),
+                        ),
+                    )
+                )
+                scan_complete = True
+                break
+
+            offset += PAGE_SIZE
+            page += 1
+
+            # The first page was full, so the endpoint form is known and
+            # there is more to fetch.  With the profile's post count every
+            # remaining offset is known up front and the pages can be
+            # fetched concurrently.  A search query changes the number of
+            # matches, and an incremental sync expects to stop within a
+            # page or two, so both keep the sequential walk.
+            if page == 2 and not search_query and marker is None:
+                post_count = fetch_post_count(
+                    self.session(),
+                    self.headers(domain_config),
+                    domain_config,
+                    service,
+                    creator_id,
+                )
+                remaining_pages = (
+                    -(-(post_count - offset) // PAGE_SIZE) if post_count else 0
+                )
+                page_count = min(remaining_pages, max_pages - 1)
+                if page_count > 1:
+                    self._log(
+                        translate(
+                            "log_info",
+                            translate(
+                                "parallel_page_detection",
+                                post_count,
+                                page_count,
+                                self.PARALLEL_PAGE_WORKERS,
+                            ),
+                        )
+                    )
+                    pages_done, finished = self.detect_pages_in_parallel(
+                        url, ref, domain_config, offset, page_count, all_posts
+                    )
+                    if finished:
+                        scan_complete = True
+                        break
+                    offset += pages_done * PAGE_SIZE
+                    page += pages_done
+                    continue
+
+            time.sleep(self.PAGE_DELAY)
+
+        if not self.is_running:
+            return all_posts, None
+        sync_update = None
+        if incremental and scan_complete:
+            sync_update = SyncUpdate(
+                self.hash_db, service, creator_id, marker, all_posts
+            )
+        self._log(
+            translate(
+                "log_info",
+                translate("total_posts_fetched_for_creator", url, len(all_posts)),
+            )
+        )
+        return all_posts, sync_update
+
+    # ------------------------------------------------------------------
+    # Preparation
+    # ------------------------------------------------------------------
+
+    def detect_files(
+        self, post: dict, domain_config: Dict[str, str]
+    ) -> List[Tuple[str, str]]:
+        settings = self.settings
+        return detect_post_files(
+            post,
+            settings.extensions,
+            domain_config,
+            main=settings.main,
+            attachments=settings.attachments,
+            content=settings.content,
+        )
+
+    def fetch_post_attempt(
+        self,
+        service: str,
+        creator_id: str,
+        post_id,
+        domain_config: Dict[str, str],
+        attempt: int = 1,
+    ) -> Union[dict, RetryLater, None]:
+        """Make attempt *attempt* at fetching the record of a post.
+
+        Returns the record, ``None`` once the post cannot be had, or
+        ``RetryLater`` when the attempt failed and may be made again; the
+        caller requeues the post rather than sleeping.
+        """
+        api_url = (
+            f"{domain_config['api_base']}/{service}/user/{creator_id}/post/{post_id}"
+        )
+        max_retries = self.settings.max_retries
+        try:
+            response = self.session().get(
+                api_url, headers=self.headers(domain_config), timeout=30
+            )
+            if response.status_code != 200:
+                if response.status_code == 429 and attempt < max_retries:
+                    self._log(
+                        translate(
+                            "log_warning",
+                            translate("rate_limit_hit", api_url, attempt, max_retries),
+                        ),
+                        "WARNING",
+                    )
+                    # The shared limiter has already paused every worker
+                    # talking to this host; the next request waits it out.
+                    self.listener.throttled(api_url)
+                    host = host_of(api_url)
+                    backoff = get_rate_limiter().backoff_remaining(host)
+                    if backoff > 0:
+                        self._log(
+                            translate(
+                                "log_info",
+                                translate("rate_limit_backoff", host, backoff),
+                            )
+                        )
+                    return RetryLater(
+                        max(backoff, backoff_delay(attempt, self.RETRY_BASE_DELAY))
+                    )
+                self._log(
+                    translate(
+                        "log_error",
+                        translate("failed_to_fetch_api", api_url, response.status_code),
+                    ),
+                    "ERROR",
+                )
+                return None
+            post_data = response.json()
+            post = (
+                post_data
+                if isinstance(post_data, dict) and "post" not in post_data
+                else post_data.get("post", {})
+            )
+            if not isinstance(post, dict):
+                raise ValueError(translate("no_valid_post_data"))
+        except Exception as e:
+            if attempt >= max_retries:
+                self._log(
+                    translate(
+                        "log_error",
+                        translate(
+                            "error_fetching_post_max_attempts",
+                            post_id,
+                            max_retries,
+                            str(e),
+                        ),
+                    ),
+                    "ERROR",
+                )
+                return None
+            self._log(
+                translate(
+                    "log_warning",
+                    translate(
+                        "error_fetching_post", post_id, attempt, max_retries, str(e)
+                    ),
+                ),
+                "WARNING",
+            )
+            delay = backoff_delay(attempt, self.RETRY_BASE_DELAY)
+            self._log(
+                translate("log_info", translate("trying_again_in", f"{delay:.1f}"))
+            )
+            return RetryLater(delay)
+        self._log(
+            translate(
+                "log_debug",
+                translate("post_data_for_id", post_id, json.dumps(post, indent=2)),
+            )
+        )
+        return post
+
+    def prepare_posts(
+        self, service: str, creator_id: str, domain_config, posts: list
+    ) -> List[Tuple[dict, List[Tuple[str, str]]]]:
+        """Return ``(post, files)`` for every post whose record could be read.
+
+        Posts are fetched on the worker threads unless their listing record
+        can be used as is (``listing_prep``).
+        """
+        settings = self.settings
+
+        def prepare(post, attempt):
+            if not self.is_running:
+                return None
+            if not (
+                settings.listing_prep
+                and listing_record_usable(
+                    post, settings.main, settings.attachments, settings.content
+                )
+            ):
+                fetched = self.fetch_post_attempt(
+                    service, creator_id, str(post["id"]), domain_config, attempt
+                )
+                if isinstance(fetched, RetryLater):
+                    return fetched
+                if fetched is None:
+                    self._count(_FAILED)
+                    return None
+                post = fetched
+            return post, self.detect_files(post, domain_config)
+
+        results = self._run_queue(posts, prepare)
+        return [result for result in results if result is not None]
+
+    def file_jobs(
+        self,
+        service: str,
+        creator_id: str,
+        creator_name: str,
+        prepared: List[Tuple[dict, List[Tuple[str, str]]]],
+    ) -> List[FileJob]:
+        """Name every prepared file with the template and folder strategy."""
+        settings = self.settings
+        creator_folder = creator_folder_for(
+            settings.download_dir, creator_id, sanitize_filename(creator_name)
+        )
+        total_files = sum(len(files) for _, files in prepared)
+        jobs: List[FileJob] = []
+        for post, files in prepared:
+            post_id = str(post.get("id"))
+            post_title = sanitize_filename(post.get("title") or f"Post_{post_id}")
+            for file_name, file_url in files:
+                original_name, file_ext = split_file_name(file_url)
+                context = {
+                    "post_id": post_id,
+                    "post_title": post_title,
+                    "orig_name": sanitize_filename(original_name),
+                    "ext": file_ext.lstrip("."),
+                    "creator_name": sanitize_filename(creator_name),
+                    "creator_id": creator_id,
+                    "file_index": len(jobs) + 1,
+                    "total_files": total_files,
+                }
+                formatted = render_file_name(settings.template, context)
+                if formatted is None:
+                    self._log(
+                        translate(
+                            "log_warning",
+                            translate("filename_template_error", settings.template),
+                        ),
+                        "WARNING",
+                    )
+                    formatted = f"{context['post_id']}_{context['orig_name']}"
+                if settings.auto_rename:
+                    counter = self._post_counters.get(post_id, 0) + 1
+                    self._post_counters[post_id] = counter
+                    formatted = f"{counter}_{formatted}"
+                filename = f"{sanitize_filename(formatted)}{file_ext}"
+                folder = target_folder_for(
+                    creator_folder,
+                    settings.folder_strategy,
+                    post_id,
+                    post_title,
+                    file_ext,
+                )
+                jobs.append(
+                    FileJob(file_url, folder, filename, service, creator_id, post_id)
+                )
+        return jobs
+
+    def download_prepared(
+        self,
+        domain_config,
+        service: str,
+        creator_id: str,
+        creator_name: str,
+        prepared: List[Tuple[dict, List[Tuple[str, str]]]],
+    ) -> Set[str]:
+        """Download the files of *prepared* posts on the worker threads.
+
+        Returns the ids of the posts whose files were all downloaded.
+        """
+        jobs = self.file_jobs(service, creator_id, creator_name, prepared)
+        remaining: Dict[str, int] = {}
+        failed_posts = set()
+        completed: Set[str] = set()
+        for job in jobs:
+            remaining[job.post_id] = remaining.get(job.post_id, 0) + 1
+        post_urls: Dict[str, List[str]] = {}
+        for job in jobs:
+            post_urls.setdefault(job.post_id, []).append(job.url)
+
+        def work(indexed_job, attempt):
+            index, job = indexed_job
+            success = self.download_file(job, domain_config, index, len(jobs), attempt)
+            if isinstance(success, RetryLater):
+                return success
+            with self._lock:
+                remaining[job.post_id] -= 1
+                if not success:
+                    failed_posts.add(job.post_id)
+                post_done = (
+                    remaining[job.post_id] == 0 and job.post_id not in failed_posts
+                )
+                if post_done:
+                    completed.add(job.post_id)
+            if post_done:
+                if self.hash_db is not None:
+                    record_post_complete(
+                        self.hash_db,
+                        service,
+                        creator_id,
+                        job.post_id,
+                        post_urls[job.post_id],
+                        self.selection,
+                    )
+                self.listener.post_completed(job.post_id)
+
+        self._run_queue(enumerate(jobs), work)
+        # Posts without files count as complete straight away.
+        for post, files in prepared:
+            if not files and self.is_running:
+                completed.add(str(post.get("id")))
+                self.listener.post_completed(str(post.get("id")))
+        return completed
+
+    # ------------------------------------------------------------------
+    # Files
+    # ------------------------------------------------------------------
+
+    def _finish(self, job: FileJob, success: bool, path: str, outcome: int) -> bool:
+        self._count(outcome)
+        self.listener.file_completed(job.url, success, path)
+        return success
+
+    def download_file(
+        self,
+        job: FileJob,
+        domain_config,
+        file_index: int = 0,
+        total_files: int = 1,
+        attempt: int = 1,
+    ) -> Union[bool, RetryLater]:
+        """Make attempt *attempt* at one file; return True once it is on disk.
+
+        A failed transfer that may be made again returns ``RetryLater``,
+        and the caller requeues the file.  Files already on disk are only
+        looked for on the first attempt.
+        """
+        if not self.is_running:
+            return False
+        full_path = os.path.join(job.folder, job.filename)
+        url_hash = hashlib.md5(job.url.encode()).hexdigest()
+        if attempt == 1:
+            found = self._find_existing(job, full_path, url_hash)
+            if found is not None:
+                return found
+            self._log(
+                translate(
+                    "log_info",
+                    translate(
+                        "starting_download",
+                        file_index + 1,
+                        total_files,
+                        job.url,
+                        job.folder,
+                    ),
+                )
+            )
+        part_path = part_path_for(job.folder, url_hash)
+        hasher = StreamHasher()
+        try:
+            file_size, downloaded_size = transfer_to_part(
+                self.session(),
+                job.url,
+                self.headers(domain_config),
+                part_path,
+                hasher,
+                lambda: self.is_running,
+                on_chunk=lambda downloaded, total: self.listener.file_progress(
+                    job.url, downloaded, total
+                ),
+            )
+            complete_part(
+                self.hash_db,
+                part_path,
+                full_path,
+                hasher,
+                job.url,
+                url_hash,
+                file_size,
+                downloaded_size,
+                job.service,
+                job.creator_id,
+                job.post_id,
+            )
+        except DownloadCancelled:
+            return self._finish(job, False, "", _FAILED)
+        except (requests.RequestException, IncompleteDownloadError, OSError) as e:
+            max_retries = self.settings.max_retries
+            if attempt < max_retries and self.is_running:
+                return RetryLater(backoff_delay(attempt, self.RETRY_BASE_DELAY))
+            self._log(
+                translate(
+                    "log_error",
+                    translate(
+                        "error_downloading_after_retries",
+                        job.url,
+                        max_retries,
+                        str(e),
+                    ),
+                ),
+                "ERROR",
+            )
+            return self._finish(job, False, "", _FAILED)
+        self._log(
+            translate("log_info", translate("successfully_downloaded", full_path))
+        )
+        return self._finish(job, True, full_path, _DOWNLOADED)
+
+    def _find_existing(
+        self, job: FileJob, full_path: str, url_hash: str
+    ) -> Optional[bool]:
+        """Create the folder of *job* and settle it when its file is on disk.
+
+        Returns the outcome once the job is settled, or ``None`` when the
+        file is to be downloaded.
+        """
+        try:
+            os.makedirs(job.folder, exist_ok=True)
+        except OSError as e:
+            self._log(
+                translate(
+                    "log_error",
+                    translate("failed_to_create_post_folder", job.folder, str(e)),
+                ),
+                "ERROR",
+            )
+            return self._finish(job, False, "", _FAILED)
+        if self.hash_db is not None:
+            entry = intact_download(self.hash_db, url_hash)
+            if entry is not None:
+                self._log(
+                    translate(
+                        "log_info",
+                        translate(
+                            "file_already_downloaded", job.filename, entry["file_path"]
+                        ),
+                    )
+                )
+                return self._finish(job, True, entry["file_path"], _SKIPPED)
+            local_copy = find_local_copy(self.hash_db, job.url, full_path)
+            if local_copy is not None:
+                try:
+                    mode = adopt_local_copy(
+                        self.hash_db,
+                        local_copy,
+                        job.url,
+                        url_hash,
+                        full_path,
+                        job.service,
+                        job.creator_id,
+                        job.post_id,
+                    )
+                except OSError:
+                    pass
+                else:
+                    self._log(
+                        translate(
+                            "log_info",
+                            translate(
+                                "content_dedupe_reused",
+                                full_path,
+                                local_copy["file_path"],
+                                mode,
+                            ),
+                        )
+                    )
+                    return self._finish(job, True, full_path, _SKIPPED)
+        return None
@@ -0,0 +1,174 @@
+"""
+download_feed.py
+================
+Streaming hand-off of prepared files from preparation to download.
+
+The creator tab used to wait for ``FilePreparationThread`` to prepare
+every selected post before it started a ``CreatorDownloadThread`` with the
+complete file list: nothing was downloaded until the last post's JSON had
+arrived.
+
+With a ``DownloadFeed`` both threads start together.  Preparation puts
+each post's files on the feed as soon as they are detected, and the
+download thread moves them into its worker queue as workers free up.
+Posts are handed over whole, so the download thread always knows every
+file of a post before the first one completes.  The feed is bounded:
+while it holds ``capacity`` files or more, preparation takes no new post
+(see ``PrepPool``'s *has_room*), so a slow download never lets
+preparation pile up the whole creator in memory.
+
+Each side registers a wake-up callback; the feed calls the consumer's
+when files arrive or the feed is closed, and the producer's when files
+are taken.  Callbacks run on the calling thread and must only schedule
+work (e.g. ``loop.call_soon_threadsafe``, or ``Wakeup.set`` for a thread
+that waits outside an event loop).  A plain ``Lock`` guards the buffer,
+for the same Windows / Python 3.14 reasons as the download threads.
+"""
+
+from __future__ import annotations
+
+import threading
+from collections import deque
+from typing import Callable, Deque, Iterable, List, Optional, Set, Tuple
+
+# ---------------------------------------------------------------------------
+# Constants
+# ---------------------------------------------------------------------------
+
+# Files waiting in the feed before preparation holds back.
+DEFAULT_CAPACITY = 500
+
+
+# ---------------------------------------------------------------------------
+# Feed
+# ---------------------------------------------------------------------------
+
+
+class DownloadFeed:
+    """Bounded, thread-safe queue of ``(post_id, file_urls)`` posts."""
+
+    def __init__(self, capacity: int = DEFAULT_CAPACITY):
+        self.capacity = max(1, int(capacity))
+        self._lock = threading.Lock()
+        self._posts: Deque[Tuple[str, List[str]]] = deque()
+        self._pending = 0  # files in _posts
+        self._seen: Set[str] = set()
+        self._closed = False
+        self._on_data: Optional[Callable[[], None]] = None
+        self._on_space: Optional[Callable[[], None]] = None
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._pending
+
+    def set_consumer_wakeup(self, callback: Optional[Callable[[], None]]) -> None:
+        """Call *callback* whenever files arrive or the feed is closed."""
+        with self._lock:
+            self._on_data = callback
+
+    def set_producer_wakeup(self, callback: Optional[Callable[[], None]]) -> None:
+        """Call *callback* whenever files are taken from the feed."""
+        with self._lock:
+            self._on_space = callback
+
+    def put(self, post_id: str, file_urls: Iterable[str]) -> int:
+        """Add the files of one post; return how many were new.
+
+        Files already put (by this or another post) are ignored, like the
+        duplicates the full preparation drops.
+        """
+        with self._lock:
+            if self._closed:
+                return 0
+            added = []
+            for file_url in file_urls:
+                if file_url in self._seen:
+                    continue
+                self._seen.add(file_url)
+                added.append(file_url)
+            if added:
+                self._posts.append((post_id, added))
+                self._pending += len(added)
+            callback = self._on_data if added else None
+        if callback is not None:
+            callback()
+        return len(added)
+
+    def has_room(self) -> bool:
+        """Return True while the feed holds fewer than ``capacity`` files."""
+        with self._lock:
+            return self._closed or self._pending < self.capacity
+
+    def take(self, limit: int) -> List[Tuple[str, List[str]]]:
+        """Remove and return whole posts, oldest first.
+
+        Posts are taken while their files fit in *limit*; a positive
+        *limit* always takes at least one post, however many files it has.
+        """
+        taken: List[Tuple[str, List[str]]] = []
+        with self._lock:
+            count = 0
+            while self._posts and limit > 0:
+                size = len(self._posts[0][1])
+                if taken and count + size > limit:
+                    break
+                taken.append(self._posts.popleft())
+                count += size
+                if count >= limit:
+                    break
+            self._pending -= count
+            callback = self._on_space if taken else None
+        if callback is not None:
+            callback()
+        return taken
+
+    def close(self) -> None:
+        """Mark the end of the stream; files already put are still taken."""
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            callbacks = [self._on_data, self._on_space]
+        for callback in callbacks:
+            if callback is not None:
+                callback()
+
+    @property
+    def closed(self) -> bool:
+        with self._lock:
+            return self._closed
+
+    def exhausted(self) -> bool:
+        """Return True once the feed is closed and every file was taken."""
+        with self._lock:
+            return self._closed and not self._posts
+
+    def total(self) -> int:
+        """Return the number of distinct files put so far."""
+        with self._lock:
+            return len(self._seen)
+
+
+class Wakeup:
+    """Wake-up flag for a thread that blocks outside an event loop.
+
+    ``set`` may be called from any thread, any number of times; ``wait``
+    returns as soon as ``set`` was called since the previous ``wait``.  A
+    held ``Lock`` stands in for ``threading.Event``.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._lock.acquire()
+
+    def set(self) -> None:
+        try:
+            self._lock.release()
+        except RuntimeError:
+            pass  # already set
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """Wait until woken, or up to *timeout* seconds; return True when woken."""
+        if timeout is None:
+            return self._lock.acquire()
+        return self._lock.acquire(timeout=timeout)
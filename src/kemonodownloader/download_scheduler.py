@@ -0,0 +1,178 @@
+"""
+download_scheduler.py
+=====================
+Process-wide download slots shared by every download thread.
+
+Each ``CreatorDownloadThread`` (and each post ``DownloadThread``) limits
+only its own workers, so the configured number of simultaneous downloads
+was a per-thread figure: a creator with three huge files left most of it
+idle until its last file finished, and the creator and post tabs could
+together exceed it.
+
+``DownloadScheduler`` hands out download slots to every thread in the
+process.  A worker takes one of its thread's own slots as before and then
+a slot from the scheduler, which enforces:
+
+* a global cap on downloads running at once, across all threads;
+* an optional cap per owner (a creator, or a single post), so one large
+  creator cannot take every slot while another is queued behind it.
+
+Waiting workers are served first come, first served, except that a worker
+whose owner is at its cap never holds up the owners behind it.  Pipelined
+fast mode starts the next creator's download while the current one
+finishes its last files (see ``CreatorDownloaderTab``), so slots freed by
+the tail of one creator are picked up by the next one at once.
+
+Waiting uses short sleeps under a plain ``Lock`` instead of
+``threading.Condition``/``Semaphore``, for the same Windows / Python 3.14
+reasons as the download threads.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from typing import Callable, Dict, Optional
+
+# ---------------------------------------------------------------------------
+# Constants
+# ---------------------------------------------------------------------------
+
+DEFAULT_GLOBAL_LIMIT = 20
+# 0 leaves owners limited by the global cap only.
+DEFAULT_OWNER_LIMIT = 0
+_POLL_INTERVAL = 0.05
+
+
+# ---------------------------------------------------------------------------
+# Scheduler
+# ---------------------------------------------------------------------------
+
+
+class DownloadScheduler:
+    """Global and per-owner download slots with first-come ordering."""
+
+    def __init__(
+        self,
+        global_limit: int = DEFAULT_GLOBAL_LIMIT,
+        owner_limit: int = DEFAULT_OWNER_LIMIT,
+    ):
+        self._lock = threading.Lock()
+        self.global_limit = max(1, int(global_limit))
+        self.owner_limit = max(0, int(owner_limit))
+        self._owner_limits: Dict[str, int] = {}
+        self._active: Dict[str, int] = {}
+        # ticket -> owner of every waiting acquire, in arrival order.
+        self._waiting: Dict[int, str] = {}
+        self._next_ticket = 0
+
+    def configure(self, global_limit: int, owner_limit: int = 0) -> None:
+        """Set the global cap and the default per-owner cap (0 = none)."""
+        with self._lock:
+            self.global_limit = max(1, int(global_limit))
+            self.owner_limit = max(0, int(owner_limit))
+
+    def set_owner_limit(self, owner: str, limit: Optional[int]) -> None:
+        """Override the cap of one owner; ``None`` restores the default."""
+        with self._lock:
+            if limit is None:
+                self._owner_limits.pop(owner, None)
+            else:
+                self._owner_limits[owner] = max(0, int(limit))
+
+    def _owner_has_room(self, owner: str) -> bool:
+        limit = self._owner_limits.get(owner, self.owner_limit)
+        return not limit or self._active.get(owner, 0) < limit
+
+    def _grant(self, owner: str, ticket: Optional[int]) -> bool:
+        if sum(self._active.values()) >= self.global_limit:
+            return False
+        if not self._owner_has_room(owner):
+            return False
+        for waiting_ticket, waiting_owner in self._waiting.items():
+            if waiting_ticket == ticket:
+                break
+            if waiting_owner != owner and self._owner_has_room(waiting_owner):
+                return False  # an earlier waiter goes first
+        self._active[owner] = self._active.get(owner, 0) + 1
+        if ticket is not None:
+            self._waiting.pop(ticket, None)
+        return True
+
+    def try_acquire(self, owner: str) -> bool:
+        """Take a slot for *owner* if one is free right now."""
+        with self._lock:
+            return self._grant(owner, None)
+
+    def _enqueue(self, owner: str) -> int:
+        with self._lock:
+            ticket = self._next_ticket
+            self._next_ticket += 1
+            self._waiting[ticket] = owner
+            return ticket
+
+    def _try_ticket(self, owner: str, ticket: int) -> bool:
+        with self._lock:
+            return self._grant(owner, ticket)
+
+    def _dequeue(self, ticket: int) -> None:
+        with self._lock:
+            self._waiting.pop(ticket, None)
+
+    def acquire(
+        self, owner: str, should_continue: Optional[Callable[[], bool]] = None
+    ) -> bool:
+        """Wait for a slot; return False if *should_continue* turned false."""
+        ticket = self._enqueue(owner)
+        try:
+            while should_continue is None or should_continue():
+                if self._try_ticket(owner, ticket):
+                    return True
+                time.sleep(_POLL_INTERVAL)
+            return False
+        finally:
+            self._dequeue(ticket)
+
+    async def acquire_async(
+        self, owner: str, should_continue: Optional[Callable[[], bool]] = None
+    ) -> bool:
+        """Like :meth:`acquire`, sleeping on the event loop."""
+        ticket = self._enqueue(owner)
+        try:
+            while should_continue is None or should_continue():
+                if self._try_ticket(owner, ticket):
+                    return True
+                await asyncio.sleep(_POLL_INTERVAL)
+            return False
+        finally:
+            self._dequeue(ticket)
+
+    def release(self, owner: str) -> None:
+        """Return a slot taken for *owner*."""
+        with self._lock:
+            count = self._active.get(owner, 0) - 1
+            if count > 0:
+                self._active[owner] = count
+            else:
+                self._active.pop(owner, None)
+
+    def active(self, owner: Optional[str] = None) -> int:
+        """Return the slots in use by *owner*, or by everyone."""
+        with self._lock:
+            if owner is None:
+                return sum(self._active.values())
+            return self._active.get(owner, 0)
+
+    def waiting(self) -> int:
+        """Return the number of workers waiting for a slot."""
+        with self._lock:
+            return len(self._waiting)
+
+
+_scheduler = DownloadScheduler()
+
+
+def get_download_scheduler() -> DownloadScheduler:
+    """Return the scheduler shared by every download thread in the process."""
+    return _scheduler
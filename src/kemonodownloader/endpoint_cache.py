@@ -0,0 +1,176 @@
+"""
+endpoint_cache.py
+=================
+Remembers which creator post-listing endpoint form works per domain/service.
+
+The creator listing API has been served under several URL shapes over
+time, so ``PostDetectionThread`` and ``ThumbnailDetectionThread`` try a
+list of forms in order.  Without memory every page of every creator pays
+the failing round-trips again whenever the first form is broken.
+
+``EndpointCache`` records the form that last answered for a
+``(domain, service)`` pair.  ``ordered_forms`` puts it first, so each page
+goes straight to the known-good form; the others are only probed again
+after it fails, and whichever form answers then replaces the entry.
+
+The cache is process-wide (``get_endpoint_cache``).  When a path is set
+with ``set_path`` it is also persisted as a small JSON file, so a restart
+skips the probing as well.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import threading
+from typing import Dict, List, Optional, Sequence, Tuple
+
+# ---------------------------------------------------------------------------
+# Endpoint forms
+# ---------------------------------------------------------------------------
+
+FORM_POSTS = "posts"  # {api_base}/{service}/user/{id}/posts?o=
+FORM_LEGACY = "legacy"  # {api_base}/{service}/user/{id}?o=
+FORM_NO_V1 = "no_v1"  # {base_url}/api/{service}/user/{id}?o=
+FORM_OFFSET_LIMIT = "offset_limit"  # {api_base}/{service}/user/{id}?offset=&limit=
+
+ALL_FORMS = (FORM_POSTS, FORM_LEGACY, FORM_NO_V1, FORM_OFFSET_LIMIT)
+
+ENDPOINT_CACHE_FILENAME = "endpoint_cache.json"
+
+
+def build_page_url(
+    form: str,
+    domain_config: dict,
+    service: str,
+    creator_id: str,
+    offset: int,
+    page_size: int = 50,
+    search_query: Optional[str] = None,
+) -> str:
+    """Return the listing URL for one page in the given endpoint *form*."""
+    base_api_url = f"{domain_config['api_base']}/{service}/user/{creator_id}"
+    if form == FORM_OFFSET_LIMIT:
+        query = f"?offset={offset}&limit={page_size}"
+    else:
+        query = f"?o={offset}"
+    if search_query:
+        query += f"&q={search_query}"
+
+    if form == FORM_POSTS:
+        return f"{base_api_url}/posts{query}"
+    if form == FORM_NO_V1:
+        return f"{domain_config['base_url']}/api/{service}/user/{creator_id}{query}"
+    if form in (FORM_LEGACY, FORM_OFFSET_LIMIT):
+        return f"{base_api_url}{query}"
+    raise ValueError(f"Unknown endpoint form: {form}")
+
+
+def ordered_forms(
+    preferred: Optional[str], forms: Sequence[str] = ALL_FORMS
+) -> List[str]:
+    """Return *forms* with *preferred* moved to the front (when it is one)."""
+    if preferred is None or preferred not in forms:
+        return list(forms)
+    return [preferred] + [f for f in forms if f != preferred]
+
+
+# ---------------------------------------------------------------------------
+# Cache
+# ---------------------------------------------------------------------------
+
+
+class EndpointCache:
+    """Thread-safe ``(domain, service) -> endpoint form`` map."""
+
+    def __init__(self, path: Optional[str] = None):
+        self._lock = threading.Lock()
+        self._forms: Dict[Tuple[str, str], str] = {}
+        self._path: Optional[str] = None
+        if path:
+            self.set_path(path)
+
+    @property
+    def path(self) -> Optional[str]:
+        return self._path
+
+    def set_path(self, path: Optional[str]) -> None:
+        """Persist the cache at *path* (``None`` keeps it in memory only).
+
+        Entries already stored at *path* are loaded; in-memory entries win.
+        """
+        with self._lock:
+            self._path = path
+            if path:
+                for key, form in self._load(path).items():
+                    self._forms.setdefault(key, form)
+
+    def get(self, domain: str, service: str) -> Optional[str]:
+        with self._lock:
+            return self._forms.get((domain, service))
+
+    def remember(self, domain: str, service: str, form: str) -> None:
+        """Record *form* as working for ``(domain, service)``."""
+        with self._lock:
+            if self._forms.get((domain, service)) == form:
+                return
+            self._forms[(domain, service)] = form
+            self._save()
+
+    def forget(self, domain: str, service: str) -> None:
+        with self._lock:
+            if self._forms.pop((domain, service), None) is not None:
+                self._save()
+
+    def clear(self) -> None:
+        """Drop every entry and stop persisting (used by tests)."""
+        with self._lock:
+            self._forms.clear()
+            self._path = None
+
+    # -- persistence -------------------------------------------------------
+
+    @staticmethod
+    def _load(path: str) -> Dict[Tuple[str, str], str]:
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        entries: Dict[Tuple[str, str], str] = {}
+        if isinstance(data, dict):
+            for key, form in data.items():
+                domain, sep, service = str(key).partition("|")
+                if sep and form in ALL_FORMS:
+                    entries[(domain, service)] = form
+        return entries
+
+    def _save(self) -> None:
+        """Write the entries to disk; the caller holds ``_lock``."""
+        if not self._path:
+            return
+        data = {
+            f"{domain}|{service}": form
+            for (domain, service), form in self._forms.items()
+        }
+        tmp_path = self._path + ".tmp"
+        try:
+            os.makedirs(os.path.dirname(self._path) or ".", exist_ok=True)
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(data, f, indent=2, sort_keys=True)
+            os.replace(tmp_path, self._path)
+        except OSError:
+            # Losing the on-disk copy only costs a re-probe next session.
+            pass
+
+
+# ---------------------------------------------------------------------------
+# Process-wide instance
+# ---------------------------------------------------------------------------
+
+_cache = EndpointCache()
+
+
+def get_endpoint_cache() -> EndpointCache:
+    """Return the endpoint cache shared by all detection threads."""
+    return _cache
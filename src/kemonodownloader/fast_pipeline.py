@@ -0,0 +1,128 @@
+"""
+fast_pipeline.py
+================
+Lookahead bookkeeping for pipelined fast mode.
+
+Fast mode used to handle its creator queue strictly one creator at a
+time: detect posts, prepare files, download, then move on.  The API sat
+idle while files downloaded, and the download slots sat idle while the
+next creator was detected.
+
+With a lookahead of *n*, the creator tab detects and prepares the next
+*n* creators in the background (``CreatorPrefetchThread``) while the
+current one downloads.  Their results wait in a buffer that holds at most
+*n* creators, counting those still being prepared, so a slow download can
+never let detection race arbitrarily far ahead.  When a download
+finishes, the next creator starts straight from the buffer; if its
+preparation is still running, it starts as soon as that finishes.
+
+``FastModePipeline`` only tracks which creators are being prepared or
+ready; the queue of pending creators stays with the tab.  It is used from
+the GUI thread alone and needs no locking.  A lookahead of 0 keeps the
+serial behaviour.
+"""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple
+
+# ---------------------------------------------------------------------------
+# Constants
+# ---------------------------------------------------------------------------
+
+DEFAULT_LOOKAHEAD = 1
+MAX_LOOKAHEAD = 8
+
+# States returned by FastModePipeline.take().
+READY = "ready"
+PREPARING = "preparing"
+NOT_STARTED = "not_started"
+
+
+# ---------------------------------------------------------------------------
+# Results
+# ---------------------------------------------------------------------------
+
+
+class PreparedCreator(NamedTuple):
+    """Detected posts and prepared files of one creator."""
+
+    url: str
+    detected_posts: list
+    post_records: dict
+    files_to_download: list
+    files_to_posts_map: dict
+    skipped_posts: set
+    # creator_sync.SyncUpdate of an incremental scan, or None.
+    sync_update: Any = None
+
+
+# ---------------------------------------------------------------------------
+# Pipeline
+# ---------------------------------------------------------------------------
+
+
+class FastModePipeline:
+    """Track the creators prepared ahead of the one downloading."""
+
+    def __init__(self, lookahead: int = DEFAULT_LOOKAHEAD):
+        self.lookahead = max(0, min(int(lookahead), MAX_LOOKAHEAD))
+        self._preparing: set = set()
+        # url -> PreparedCreator, or None when preparing it failed.
+        self._ready: "OrderedDict[str, Optional[PreparedCreator]]" = OrderedDict()
+
+    def clear(self) -> None:
+        """Forget every creator being prepared or ready."""
+        self._preparing.clear()
+        self._ready.clear()
+
+    def to_prepare(self, pending: List[str]) -> List[str]:
+        """Return the creators of *pending* to start preparing now.
+
+        Only the first ``lookahead`` pending creators are considered, and
+        the buffer never holds more than ``lookahead`` creators, prepared
+        or preparing.  The result is marked as preparing.
+        """
+        # Results of creators taken out of the queue would never be used.
+        for url in [u for u in self._ready if u not in pending]:
+            del self._ready[url]
+        started = []
+        for url in pending[: self.lookahead]:
+            if len(self._preparing) + len(self._ready) >= self.lookahead:
+                break
+            if url in self._preparing or url in self._ready:
+                continue
+            self._preparing.add(url)
+            started.append(url)
+        return started
+
+    def prepared(self, url: str, result: Optional[PreparedCreator]) -> None:
+        """Store the result of preparing *url* (``None`` on failure)."""
+        if url not in self._preparing:
+            return  # clear() dropped it meanwhile
+        self._preparing.discard(url)
+        self._ready[url] = result
+
+    def take(self, url: str) -> Tuple[str, Optional[PreparedCreator]]:
+        """Return ``(state, result)`` for a creator about to be downloaded.
+
+        ``READY`` hands over (and forgets) the result, which is ``None``
+        when preparing failed; ``PREPARING`` means the result is still on
+        its way; ``NOT_STARTED`` means the creator was not prepared ahead.
+        """
+        if url in self._ready:
+            return READY, self._ready.pop(url)
+        if url in self._preparing:
+            return PREPARING, None
+        return NOT_STARTED, None
+
+    def is_ready(self, url: str) -> bool:
+        """Return True when *url* was prepared successfully and waits."""
+        return self._ready.get(url) is not None
+
+    def buffered(self) -> Dict[str, bool]:
+        """Return ``{url: is_ready}`` of every creator in the buffer."""
+        state = {url: False for url in self._preparing}
+        state.update({url: True for url in self._ready})
+        return state
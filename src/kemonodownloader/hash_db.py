@@ -2,13 +2,155 @@
 
 Replaces the old file_hashes.json approach with a proper SQLite database
 for better concurrent access, data integrity, and performance.
+
+Each entry also records the file's mtime and inode when it was written, so
+deciding that an already downloaded file is unchanged costs one ``stat``
+instead of re-hashing its content (see ``file_unchanged``).
+
+Kemono and Coomer data URLs name the file after the SHA-256 of its content
+(``/data/ab/cd/<sha256>.<ext>``).  That hash is stored with every entry and
+indexed, so ``content_entries`` finds a file already in the library under
+any name or post before a single byte is downloaded (see ``dedupe``).
+
+Every thread reads through its own persistent connection (WAL lets them
+run concurrently), while writes share one connection.  ``store`` does not
+touch the database at all: entries are queued and committed in batched
+transactions by a short-lived background flusher, once enough have queued
+or after a short interval, and by ``try_flush``, which the downloaders
+call when they finish or are cancelled.  Lookups consult the queue first, so a
+stored entry is visible immediately.
+
+The schema is versioned through ``PRAGMA user_version``.  Version 2 records
+where each file came from (service, creator, post) and when, and indexes
+those columns and the content hashes so reverse queries do not scan the
+table.  Paths under the library directory (*base_dir*) are stored relative
+to it and resolved on read, so moving the library keeps every entry valid.
+Older databases are upgraded in place: new columns are added without
+rewriting the table, and the indexes are built and absolute paths rebased
+on a background thread, so opening a large library does not wait for a
+table scan per index.  Version 3 adds ``creator_sync``, the newest post seen
+per creator, which lets creator detection stop at already known posts
+(see ``creator_sync``).  Version 4 adds ``post_completion``: the file set
+of every post whose files were all downloaded and verified, so file
+preparation can drop such posts without fetching them again.  Version 5
+adds ``row_migrations``, the library directories whose rows have already
+been rebased, so the row walk runs once per library instead of on every
+start.
 """
 
 import json
 import os
 import sqlite3
 import threading
-from typing import Optional
+import time
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from kemonodownloader.resumable import md5_file
+from kemonodownloader.segmented import server_sha256
+
+# Columns added after the original schema, with their SQL definitions.
+_ADDED_COLUMNS = {
+    "file_size": "INTEGER NOT NULL DEFAULT 0",
+    "file_mtime": "REAL NOT NULL DEFAULT 0",
+    "file_inode": "INTEGER NOT NULL DEFAULT 0",
+    "content_sha256": "TEXT NOT NULL DEFAULT ''",
+    "service": "TEXT NOT NULL DEFAULT ''",
+    "creator_id": "TEXT NOT NULL DEFAULT ''",
+    "post_id": "TEXT NOT NULL DEFAULT ''",
+    "downloaded_at": "REAL NOT NULL DEFAULT 0",
+}
+
+# Current schema version, stored in PRAGMA user_version.
+SCHEMA_VERSION = 5
+
+# Columns with a secondary index (idx_file_hashes_<column>).
+_INDEXED_COLUMNS = (
+    "content_sha256",
+    "file_hash",
+    "service",
+    "creator_id",
+    "post_id",
+    "downloaded_at",
+)
+
+
+def _index_statement(column: str) -> str:
+    return (
+        f"CREATE INDEX IF NOT EXISTS idx_file_hashes_{column} "
+        f"ON file_hashes ({column})"
+    )
+
+
+# Entry fields, in the column order used by every query below.
+_ENTRY_FIELDS = (
+    "file_path",
+    "file_hash",
+    "url",
+    "file_size",
+    "file_mtime",
+    "file_inode",
+    "content_sha256",
+    "service",
+    "creator_id",
+    "post_id",
+    "downloaded_at",
+)
+_ENTRY_COLUMNS = ", ".join(_ENTRY_FIELDS)
+
+# Queued stores are committed once this many are waiting...
+WRITE_BATCH_SIZE = 256
+# ...or once the flusher has waited this long (seconds).
+WRITE_FLUSH_INTERVAL = 0.5
+# Host parameters per ``lookup_many`` query (SQLite's historic limit is 999).
+LOOKUP_CHUNK_SIZE = 500
+# Rows examined per transaction while rebasing absolute paths.
+REBASE_BATCH_SIZE = 500
+
+# (db_path, base_dir) pairs whose absolute paths have been rebased in this
+# process, so every download thread does not rescan the table.
+_rebased: set = set()
+_rebased_lock = threading.Lock()
+
+
+def stat_matches(entry: dict, st: os.stat_result) -> bool:
+    """Return True when *st* still describes the file recorded in *entry*.
+
+    Size and mtime must both match; the inode is compared only when both
+    sides know it (some filesystems report 0).  Entries stored before the
+    stat columns existed have no mtime and never match.
+    """
+    if not entry.get("file_mtime"):
+        return False
+    if entry.get("file_size", 0) != st.st_size:
+        return False
+    if entry["file_mtime"] != st.st_mtime:
+        return False
+    inode = entry.get("file_inode", 0)
+    return not (inode and st.st_ino and inode != st.st_ino)
+
+
+def file_unchanged(hash_db, url_hash: str, entry: dict) -> bool:
+    """Return True when the file of *entry* still holds the stored content.
+
+    A size/mtime/inode comparison decides when the entry carries stat data.
+    Older entries are hashed once in chunks; when the content matches, their
+    stat data is recorded so later checks stay cheap.
+    """
+    path = entry["file_path"]
+    try:
+        st = os.stat(path)
+    except OSError:
+        return False
+    if stat_matches(entry, st):
+        return True
+    if entry.get("file_size", 0) and entry["file_size"] != st.st_size:
+        return False
+    if md5_file(path) != entry["file_hash"]:
+        return False
+    update_stat = getattr(hash_db, "update_stat", None)
+    if update_stat is not None:
+        update_stat(url_hash, st.st_mtime, st.st_ino)
+    return True
 
 
 class HashDB:
@@ -20,64 +162,271 @@ class HashDB:
 
     DB_FILENAME = "file_hashes.db"
 
-    def __init__(self, directory: str):
+    def __init__(
+        self,
+        directory: str,
+        base_dir: Optional[str] = None,
+        batch_size: int = WRITE_BATCH_SIZE,
+        flush_interval: float = WRITE_FLUSH_INTERVAL,
+    ):
         """Initialise the hash database.
 
         Parameters
         ----------
         directory:
             Directory where the database file will be stored.
+        base_dir:
+            Library directory; paths below it are stored relative to it.
+        batch_size:
+            Number of queued stores that triggers an immediate commit.
+        flush_interval:
+            Seconds a queued store waits for the background flusher.
         """
         os.makedirs(directory, exist_ok=True)
         self.db_path = os.path.join(directory, self.DB_FILENAME)
+        self.base_dir = os.path.abspath(base_dir) if base_dir else None
+        self.batch_size = max(1, batch_size)
+        self.flush_interval = flush_interval
+        # Guards the queue, the reader registry and the flusher handle.
         self._lock = threading.Lock()
+        # Serialises everything that runs on the shared write connection.
+        self._write_lock = threading.Lock()
+        self._local = threading.local()
+        self._readers: Dict[int, Tuple[threading.Thread, sqlite3.Connection]] = {}
+        self._writer: Optional[sqlite3.Connection] = None
+        self._pending: Dict[str, dict] = {}
+        self._flusher: Optional[threading.Thread] = None
         self._init_db()
         self._migrate_json(directory)
+        self._start_rebase()
 
     # ------------------------------------------------------------------
     # Internal helpers
     # ------------------------------------------------------------------
 
-    def _get_connection(self) -> sqlite3.Connection:
-        """Create a new connection (one per call – safe for threads)."""
-        conn = sqlite3.connect(self.db_path, timeout=30)
+    def _connect(self) -> sqlite3.Connection:
+        # check_same_thread is off so ``close`` can close every connection;
+        # each one is still only used by the thread that owns it.
+        conn = sqlite3.connect(self.db_path, timeout=30, check_same_thread=False)
         conn.execute("PRAGMA journal_mode=WAL")
         conn.execute("PRAGMA synchronous=NORMAL")
         conn.row_factory = sqlite3.Row
         return conn
 
-    def _init_db(self) -> None:
-        """Create table if not yet present and run schema migrations."""
+    def _get_connection(self) -> sqlite3.Connection:
+        """Return the calling thread's read connection, opening it once."""
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            return conn
+        conn = self._connect()
+        current = threading.current_thread()
         with self._lock:
-            conn = self._get_connection()
-            try:
-                conn.execute(
-                    """
-                    CREATE TABLE IF NOT EXISTS file_hashes (
-                        url_hash   TEXT PRIMARY KEY,
-                        file_path  TEXT NOT NULL,
-                        file_hash  TEXT NOT NULL,
-                        url        TEXT NOT NULL,
-                        file_size  INTEGER NOT NULL DEFAULT 0
-                    )
-                    """
+            # Connections of threads that have exited are closed here, so
+            # short-lived worker threads do not accumulate open handles.
+            for ident, (thread, reader) in list(self._readers.items()):
+                if not thread.is_alive():
+                    reader.close()
+                    del self._readers[ident]
+            self._readers[current.ident or 0] = (current, conn)
+        self._local.conn = conn
+        return conn
+
+    def _get_writer(self) -> sqlite3.Connection:
+        """Return the write connection; the caller holds ``_write_lock``."""
+        if self._writer is None:
+            self._writer = self._connect()
+        return self._writer
+
+    def _init_db(self) -> None:
+        """Create the table if not yet present and upgrade older schemas.
+
+        Only cheap steps run here: ``ADD COLUMN`` with a constant default
+        does not rewrite the table.  Rows are updated later, in batches, by
+        ``migrate_rows``.
+        """
+        with self._write_lock:
+            conn = self._get_writer()
+            version = conn.execute("PRAGMA user_version").fetchone()[0]
+            if version >= SCHEMA_VERSION:
+                return
+            existing = conn.execute(
+                "SELECT 1 FROM sqlite_master "
+                "WHERE type = 'table' AND name = 'file_hashes'"
+            ).fetchone()
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS file_hashes (
+                    url_hash   TEXT PRIMARY KEY,
+                    file_path  TEXT NOT NULL,
+                    file_hash  TEXT NOT NULL,
+                    url        TEXT NOT NULL,
+                    file_size  INTEGER NOT NULL DEFAULT 0,
+                    file_mtime REAL NOT NULL DEFAULT 0,
+                    file_inode INTEGER NOT NULL DEFAULT 0,
+                    content_sha256 TEXT NOT NULL DEFAULT '',
+                    service    TEXT NOT NULL DEFAULT '',
+                    creator_id TEXT NOT NULL DEFAULT '',
+                    post_id    TEXT NOT NULL DEFAULT '',
+                    downloaded_at REAL NOT NULL DEFAULT 0
                 )
-                conn.commit()
-                # Migrate: add file_size column for databases created before
-                # this column existed.  PRAGMA table_info returns one row per
-                # column; if file_size is absent we add it.
-                columns = {
-                    row[1]
-                    for row in conn.execute("PRAGMA table_info(file_hashes)").fetchall()
-                }
-                if "file_size" not in columns:
+                """
+            )
+            # Migrate: add columns for databases created before they
+            # existed.  PRAGMA table_info returns one row per column;
+            # any column that is absent is added.
+            columns = {
+                row[1]
+                for row in conn.execute("PRAGMA table_info(file_hashes)").fetchall()
+            }
+            for name, definition in _ADDED_COLUMNS.items():
+                if name not in columns:
                     conn.execute(
-                        "ALTER TABLE file_hashes "
-                        "ADD COLUMN file_size INTEGER NOT NULL DEFAULT 0"
+                        f"ALTER TABLE file_hashes ADD COLUMN {name} {definition}"
+                    )
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS creator_sync (
+                    service          TEXT NOT NULL,
+                    creator_id       TEXT NOT NULL,
+                    newest_post_id   TEXT NOT NULL DEFAULT '',
+                    newest_published TEXT NOT NULL DEFAULT '',
+                    synced_at        REAL NOT NULL DEFAULT 0,
+                    PRIMARY KEY (service, creator_id)
+                )
+                """
+            )
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS post_completion (
+                    service      TEXT NOT NULL,
+                    creator_id   TEXT NOT NULL,
+                    post_id      TEXT NOT NULL,
+                    file_urls    TEXT NOT NULL DEFAULT '[]',
+                    selection    TEXT NOT NULL DEFAULT '',
+                    verified     INTEGER NOT NULL DEFAULT 0,
+                    completed_at REAL NOT NULL DEFAULT 0,
+                    PRIMARY KEY (service, creator_id, post_id)
+                )
+                """
+            )
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS row_migrations (
+                    base_dir    TEXT PRIMARY KEY,
+                    migrated_at REAL NOT NULL DEFAULT 0
+                )
+                """
+            )
+            if not existing:
+                # Indexing an empty table is free; existing rows are
+                # indexed by build_indexes on the background thread.
+                for column in _INDEXED_COLUMNS:
+                    conn.execute(_index_statement(column))
+            conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+            conn.commit()
+
+    def _start_rebase(self) -> None:
+        """Run ``migrate_rows`` on a daemon thread, once per process."""
+        key = (self.db_path, self.base_dir)
+        with _rebased_lock:
+            if key in _rebased:
+                return
+            _rebased.add(key)
+        threading.Thread(target=self._run_rebase, daemon=True).start()
+
+    def _run_rebase(self) -> None:
+        try:
+            self.build_indexes()
+            if not self.rows_migrated():
+                self.migrate_rows()
+                self._mark_rows_migrated()
+        except sqlite3.Error:
+            # Rows left as they are still resolve; retried next start.
+            with _rebased_lock:
+                _rebased.discard((self.db_path, self.base_dir))
+
+    def build_indexes(self) -> int:
+        """Create the secondary indexes that are missing; return how many.
+
+        Each index is built in its own transaction, so queued stores are
+        committed in between.  Queries work without them, only slower.
+        """
+        built = 0
+        for column in _INDEXED_COLUMNS:
+            with self._write_lock:
+                conn = self._get_writer()
+                exists = conn.execute(
+                    "SELECT 1 FROM sqlite_master WHERE type = 'index' AND name = ?",
+                    (f"idx_file_hashes_{column}",),
+                ).fetchone()
+                if exists:
+                    continue
+                with conn:
+                    conn.execute(_index_statement(column))
+                built += 1
+            time.sleep(0)
+        return built
+
+    def rows_migrated(self) -> bool:
+        """Return True once ``migrate_rows`` has completed for ``base_dir``."""
+        conn = self._get_connection()
+        row = conn.execute(
+            "SELECT 1 FROM row_migrations WHERE base_dir = ?", (self.base_dir or "",)
+        ).fetchone()
+        return row is not None
+
+    def _mark_rows_migrated(self) -> None:
+        with self._write_lock:
+            conn = self._get_writer()
+            with conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO row_migrations (base_dir, migrated_at) "
+                    "VALUES (?, ?)",
+                    (self.base_dir or "", time.time()),
+                )
+
+    def migrate_rows(self, batch_size: int = REBASE_BATCH_SIZE) -> int:
+        """Bring rows written by older versions up to date; return how many.
+
+        Absolute paths under ``base_dir`` become relative, and rows stored
+        before content hashes were recorded get the one from their URL.
+        Rows are walked by rowid, one short transaction per *batch_size*,
+        so downloads keep writing while an existing library is upgraded.
+        """
+        changed = 0
+        last_rowid = 0
+        while True:
+            with self._write_lock:
+                conn = self._get_writer()
+                rows = conn.execute(
+                    "SELECT rowid, file_path, url, content_sha256 FROM file_hashes "
+                    "WHERE rowid > ? ORDER BY rowid LIMIT ?",
+                    (last_rowid, batch_size),
+                ).fetchall()
+                if not rows:
+                    return changed
+                last_rowid = rows[-1]["rowid"]
+                updates = []
+                for row in rows:
+                    file_path = self._to_stored(row["file_path"])
+                    content_sha256 = row["content_sha256"] or (
+                        server_sha256(row["url"]) or ""
                     )
-                    conn.commit()
-            finally:
-                conn.close()
+                    if (file_path, content_sha256) != (
+                        row["file_path"],
+                        row["content_sha256"],
+                    ):
+                        updates.append((file_path, content_sha256, row["rowid"]))
+                if updates:
+                    with conn:
+                        conn.executemany(
+                            "UPDATE file_hashes SET file_path = ?, "
+                            "content_sha256 = ? WHERE rowid = ?",
+                            updates,
+                        )
+                    changed += len(updates)
+            # Let queued stores in between batches.
+            time.sleep(0)
 
     def _migrate_json(self, directory: str) -> None:
         """One-time migration: import data from legacy ``file_hashes.json``."""
@@ -89,27 +438,26 @@ class HashDB:
                 data = json.load(fh)
             if not isinstance(data, dict) or not data:
                 return
-            with self._lock:
-                conn = self._get_connection()
-                try:
-                    for url_hash, entry in data.items():
-                        conn.execute(
-                            """
-                            INSERT OR IGNORE INTO file_hashes
-                            (url_hash, file_path, file_hash, url, file_size)
-                            VALUES (?, ?, ?, ?, ?)
-                            """,
-                            (
-                                url_hash,
-                                entry.get("file_path", ""),
-                                entry.get("file_hash", ""),
-                                entry.get("url", ""),
-                                entry.get("file_size", 0),
-                            ),
-                        )
-                    conn.commit()
-                finally:
-                    conn.close()
+            with self._write_lock:
+                conn = self._get_writer()
+                for url_hash, entry in data.items():
+                    conn.execute(
+                        """
+                        INSERT OR IGNORE INTO file_hashes
+                        (url_hash, file_path, file_hash, url, file_size,
+                         content_sha256)
+                        VALUES (?, ?, ?, ?, ?, ?)
+                        """,
+                        (
+                            url_hash,
+                            self._to_stored(entry.get("file_path", "")),
+                            entry.get("file_hash", ""),
+                            entry.get("url", ""),
+                            entry.get("file_size", 0),
+                            server_sha256(entry.get("url", "")) or "",
+                        ),
+                    )
+                conn.commit()
             # Rename the old JSON so it is not re-imported
             backup_path = json_path + ".migrated"
             try:
@@ -119,6 +467,48 @@ class HashDB:
         except (json.JSONDecodeError, IOError, OSError):
             pass
 
+    def _to_stored(self, file_path: str) -> str:
+        """Return *file_path* relative to ``base_dir`` when it lies below it."""
+        if not self.base_dir or not file_path or not os.path.isabs(file_path):
+            return file_path
+        try:
+            relative = os.path.relpath(file_path, self.base_dir)
+        except ValueError:
+            # Different drive on Windows.
+            return file_path
+        if relative == os.curdir or relative.split(os.sep)[0] == os.pardir:
+            return file_path
+        return relative
+
+    def _resolve(self, file_path: str) -> str:
+        """Return the absolute form of a stored *file_path*."""
+        if self.base_dir and file_path and not os.path.isabs(file_path):
+            return os.path.join(self.base_dir, file_path)
+        return file_path
+
+    def _entry(self, row) -> dict:
+        entry = {field: row[field] for field in _ENTRY_FIELDS}
+        entry["file_path"] = self._resolve(entry["file_path"])
+        return entry
+
+    def _start_flusher(self) -> None:
+        """Start the background flusher; the caller holds ``_lock``."""
+        if self._flusher is None:
+            self._flusher = threading.Thread(target=self._run_flusher, daemon=True)
+            self._flusher.start()
+
+    def _run_flusher(self) -> None:
+        while True:
+            time.sleep(self.flush_interval)
+            if not self.try_flush():
+                with self._lock:
+                    self._flusher = None
+                return
+            with self._lock:
+                if not self._pending:
+                    self._flusher = None
+                    return
+
     # ------------------------------------------------------------------
     # Public API
     # ------------------------------------------------------------------
@@ -127,26 +517,86 @@ class HashDB:
         """Return the stored entry for *url_hash*, or ``None``.
 
         Returns a dict with keys ``file_path``, ``file_hash``, ``url``,
-        ``file_size``.
+        ``file_size``, ``file_mtime``, ``file_inode``, ``content_sha256``.
         """
         with self._lock:
-            conn = self._get_connection()
-            try:
-                row = conn.execute(
-                    "SELECT file_path, file_hash, url, file_size "
-                    "FROM file_hashes WHERE url_hash = ?",
-                    (url_hash,),
-                ).fetchone()
-                if row:
-                    return {
-                        "file_path": row["file_path"],
-                        "file_hash": row["file_hash"],
-                        "url": row["url"],
-                        "file_size": row["file_size"],
-                    }
-                return None
-            finally:
-                conn.close()
+            queued = self._pending.get(url_hash)
+        if queued is not None:
+            return dict(queued)
+        row = (
+            self._get_connection()
+            .execute(
+                f"SELECT {_ENTRY_COLUMNS} FROM file_hashes WHERE url_hash = ?",
+                (url_hash,),
+            )
+            .fetchone()
+        )
+        return self._entry(row) if row else None
+
+    def lookup_many(self, url_hashes: Iterable[str]) -> Dict[str, dict]:
+        """Return ``{url_hash: entry}`` for every recorded hash in *url_hashes*.
+
+        Hashes that are not recorded are absent from the result.  A whole
+        creator's file list is checked in a handful of queries instead of
+        one ``lookup`` per file.
+        """
+        wanted = list(dict.fromkeys(url_hashes))
+        with self._lock:
+            queued = {h: dict(self._pending[h]) for h in wanted if h in self._pending}
+        missing = [h for h in wanted if h not in queued]
+        conn = self._get_connection()
+        found: Dict[str, dict] = {}
+        for start in range(0, len(missing), LOOKUP_CHUNK_SIZE):
+            chunk = missing[start : start + LOOKUP_CHUNK_SIZE]
+            placeholders = ", ".join("?" * len(chunk))
+            rows = conn.execute(
+                f"SELECT url_hash, {_ENTRY_COLUMNS} FROM file_hashes "
+                f"WHERE url_hash IN ({placeholders})",
+                chunk,
+            ).fetchall()
+            for row in rows:
+                found[row["url_hash"]] = self._entry(row)
+        found.update(queued)
+        return found
+
+    def _entries_where(self, criteria: Dict[str, str]) -> List[dict]:
+        """Return entries whose columns equal *criteria*, queued ones included.
+
+        Each dict carries the ``lookup`` keys plus ``url_hash``.
+        """
+        clause = " AND ".join(f"{column} = ?" for column in criteria)
+        rows = (
+            self._get_connection()
+            .execute(
+                f"SELECT url_hash, {_ENTRY_COLUMNS} FROM file_hashes WHERE {clause}",
+                tuple(criteria.values()),
+            )
+            .fetchall()
+        )
+        entries = {row["url_hash"]: self._entry(row) for row in rows}
+        with self._lock:
+            for url_hash, queued in self._pending.items():
+                if all(queued[column] == value for column, value in criteria.items()):
+                    entries[url_hash] = dict(queued)
+                else:
+                    entries.pop(url_hash, None)
+        return [dict(entry, url_hash=url_hash) for url_hash, entry in entries.items()]
+
+    def content_entries(self, content_sha256: str) -> List[dict]:
+        """Return every entry whose content has SHA-256 *content_sha256*."""
+        if not content_sha256:
+            return []
+        return self._entries_where({"content_sha256": content_sha256})
+
+    def file_hash_entries(self, file_hash: str) -> List[dict]:
+        """Return every entry whose file has MD5 *file_hash*."""
+        if not file_hash:
+            return []
+        return self._entries_where({"file_hash": file_hash})
+
+    def creator_entries(self, service: str, creator_id: str) -> List[dict]:
+        """Return every entry downloaded for *creator_id* on *service*."""
+        return self._entries_where({"service": service, "creator_id": creator_id})
 
     def store(
         self,
@@ -155,22 +605,117 @@ class HashDB:
         file_hash: str,
         url: str,
         file_size: int = 0,
+        file_mtime: Optional[float] = None,
+        file_inode: Optional[int] = None,
+        content_sha256: Optional[str] = None,
+        service: str = "",
+        creator_id: str = "",
+        post_id: str = "",
+        downloaded_at: Optional[float] = None,
     ) -> None:
-        """Insert or replace an entry."""
-        with self._lock:
-            conn = self._get_connection()
+        """Queue an entry to be inserted or replaced.
+
+        *file_mtime* and *file_inode* default to an ``os.stat`` of
+        *file_path* taken now, i.e. the file just written; when it cannot
+        be stat'ed they are stored as 0 and the next ``file_unchanged``
+        check falls back to hashing the content.  *content_sha256* defaults
+        to the hash embedded in *url*, if any, and *downloaded_at* to now.
+
+        The entry is visible to lookups at once and committed with the
+        next batch; call ``flush`` to commit it now.
+        """
+        if content_sha256 is None:
+            content_sha256 = server_sha256(url) or ""
+        if downloaded_at is None:
+            downloaded_at = time.time()
+        if file_mtime is None or file_inode is None:
             try:
+                st = os.stat(file_path)
+                stat_mtime, stat_inode = st.st_mtime, st.st_ino
+            except OSError:
+                stat_mtime, stat_inode = 0.0, 0
+            if file_mtime is None:
+                file_mtime = stat_mtime
+            if file_inode is None:
+                file_inode = stat_inode
+        entry = {
+            "file_path": file_path,
+            "file_hash": file_hash,
+            "url": url,
+            "file_size": file_size,
+            "file_mtime": file_mtime,
+            "file_inode": file_inode,
+            "content_sha256": content_sha256,
+            "service": service,
+            "creator_id": creator_id,
+            "post_id": post_id,
+            "downloaded_at": downloaded_at,
+        }
+        with self._lock:
+            self._pending[url_hash] = entry
+            batch_full = len(self._pending) >= self.batch_size
+            if not batch_full:
+                self._start_flusher()
+        if batch_full:
+            self.flush()
+
+    def flush(self) -> int:
+        """Commit every queued store in one transaction; return how many."""
+        with self._write_lock:
+            with self._lock:
+                batch = list(self._pending.items())
+            if not batch:
+                return 0
+            conn = self._get_writer()
+            with conn:
+                conn.executemany(
+                    f"INSERT OR REPLACE INTO file_hashes (url_hash, {_ENTRY_COLUMNS}) "
+                    f"VALUES (?{', ?' * len(_ENTRY_FIELDS)})",
+                    [
+                        (
+                            url_hash,
+                            self._to_stored(entry["file_path"]),
+                            *(entry[field] for field in _ENTRY_FIELDS[1:]),
+                        )
+                        for url_hash, entry in batch
+                    ],
+                )
+            with self._lock:
+                # Entries re-stored while the batch was being written stay
+                # queued for the next one.
+                for url_hash, entry in batch:
+                    if self._pending.get(url_hash) is entry:
+                        del self._pending[url_hash]
+            return len(batch)
+
+    def try_flush(self) -> bool:
+        """Like ``flush``, but a database error leaves the entries queued.
+
+        Returns False when the commit failed; the next store or flush
+        retries it.
+        """
+        try:
+            self.flush()
+        except sqlite3.Error:
+            return False
+        return True
+
+    def pending(self) -> int:
+        """Number of stores queued but not yet committed."""
+        with self._lock:
+            return len(self._pending)
+
+    def update_stat(self, url_hash: str, file_mtime: float, file_inode: int) -> None:
+        """Record the current mtime and inode of an entry's file."""
+        self.flush()
+        with self._write_lock:
+            conn = self._get_writer()
+            with conn:
                 conn.execute(
-                    """
-                    INSERT OR REPLACE INTO file_hashes
-                    (url_hash, file_path, file_hash, url, file_size)
-                    VALUES (?, ?, ?, ?, ?)
-                    """,
-                    (url_hash, file_path, file_hash, url, file_size),
+                    "UPDATE file_hashes SET file_mtime = ?, file_inode = ? "
+                    "WHERE url_hash = ?",
+                    (file_mtime, file_inode, url_hash),
                 )
-                conn.commit()
-            finally:
-                conn.close()
 
     def contains(self, url_hash: str) -> bool:
         """Check whether *url_hash* already exists."""
@@ -178,51 +723,167 @@ class HashDB:
 
     def count(self) -> int:
         """Return total number of stored hashes."""
-        with self._lock:
-            conn = self._get_connection()
-            try:
-                row = conn.execute("SELECT COUNT(*) AS cnt FROM file_hashes").fetchone()
-                return row["cnt"] if row else 0
-            finally:
-                conn.close()
+        self.flush()
+        row = (
+            self._get_connection()
+            .execute("SELECT COUNT(*) AS cnt FROM file_hashes")
+            .fetchone()
+        )
+        return row["cnt"] if row else 0
 
     def all_entries(self) -> dict:
-        """Return all entries as ``{url_hash: {file_path, file_hash, url, file_size}}``."""
-        with self._lock:
-            conn = self._get_connection()
-            try:
-                rows = conn.execute(
-                    "SELECT url_hash, file_path, file_hash, url, file_size "
-                    "FROM file_hashes"
-                ).fetchall()
-                return {
-                    row["url_hash"]: {
-                        "file_path": row["file_path"],
-                        "file_hash": row["file_hash"],
-                        "url": row["url"],
-                        "file_size": row["file_size"],
-                    }
-                    for row in rows
-                }
-            finally:
-                conn.close()
+        """Return all entries as ``{url_hash: {file_path, file_hash, url, file_size,
+        file_mtime, file_inode, content_sha256}}``."""
+        self.flush()
+        rows = (
+            self._get_connection()
+            .execute(f"SELECT url_hash, {_ENTRY_COLUMNS} FROM file_hashes")
+            .fetchall()
+        )
+        return {row["url_hash"]: self._entry(row) for row in rows}
 
     def delete(self, url_hash: str) -> None:
         """Remove a single entry by *url_hash*."""
-        with self._lock:
-            conn = self._get_connection()
-            try:
+        with self._write_lock:
+            with self._lock:
+                self._pending.pop(url_hash, None)
+            conn = self._get_writer()
+            with conn:
                 conn.execute("DELETE FROM file_hashes WHERE url_hash = ?", (url_hash,))
-                conn.commit()
-            finally:
-                conn.close()
 
     def clear(self) -> None:
         """Remove **all** entries."""
-        with self._lock:
-            conn = self._get_connection()
-            try:
+        with self._write_lock:
+            with self._lock:
+                self._pending.clear()
+            conn = self._get_writer()
+            with conn:
                 conn.execute("DELETE FROM file_hashes")
-                conn.commit()
-            finally:
-                conn.close()
+
+    def sync_state(self, service: str, creator_id: str) -> Optional[dict]:
+        """Return the stored sync state of a creator, or ``None``.
+
+        The dict has keys ``newest_post_id``, ``newest_published`` and
+        ``synced_at``.
+        """
+        row = (
+            self._get_connection()
+            .execute(
+                "SELECT newest_post_id, newest_published, synced_at "
+                "FROM creator_sync WHERE service = ? AND creator_id = ?",
+                (service, creator_id),
+            )
+            .fetchone()
+        )
+        return dict(row) if row else None
+
+    def store_sync_state(
+        self,
+        service: str,
+        creator_id: str,
+        newest_post_id: str,
+        newest_published: str,
+    ) -> None:
+        """Record the newest post seen by a complete scan of a creator."""
+        with self._write_lock:
+            conn = self._get_writer()
+            with conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO creator_sync (service, creator_id, "
+                    "newest_post_id, newest_published, synced_at) "
+                    "VALUES (?, ?, ?, ?, ?)",
+                    (
+                        service,
+                        creator_id,
+                        newest_post_id,
+                        newest_published,
+                        time.time(),
+                    ),
+                )
+
+    def mark_post_complete(
+        self,
+        service: str,
+        creator_id: str,
+        post_id: str,
+        file_urls: Iterable[str],
+        selection: str,
+        verified: bool = True,
+    ) -> None:
+        """Record that every file of a post was downloaded.
+
+        *selection* identifies the file filters the set was chosen with; a
+        post only counts as complete for the same selection.
+        """
+        with self._write_lock:
+            conn = self._get_writer()
+            with conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO post_completion (service, creator_id, "
+                    "post_id, file_urls, selection, verified, completed_at) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    (
+                        service,
+                        creator_id,
+                        str(post_id),
+                        json.dumps(sorted(file_urls)),
+                        selection,
+                        int(verified),
+                        time.time(),
+                    ),
+                )
+
+    def completed_posts(self, service: str, creator_id: str) -> Dict[str, dict]:
+        """Return ``{post_id: record}`` of a creator's completed posts.
+
+        Each record has ``file_urls`` (list), ``selection``, ``verified``
+        (bool) and ``completed_at``.
+        """
+        rows = (
+            self._get_connection()
+            .execute(
+                "SELECT post_id, file_urls, selection, verified, completed_at "
+                "FROM post_completion WHERE service = ? AND creator_id = ?",
+                (service, creator_id),
+            )
+            .fetchall()
+        )
+        return {
+            row["post_id"]: {
+                "file_urls": json.loads(row["file_urls"]),
+                "selection": row["selection"],
+                "verified": bool(row["verified"]),
+                "completed_at": row["completed_at"],
+            }
+            for row in rows
+        }
+
+    def clear_post_completion(
+        self, service: str, creator_id: str, post_id: str
+    ) -> None:
+        """Forget the completion record of a post."""
+        with self._write_lock:
+            conn = self._get_writer()
+            with conn:
+                conn.execute(
+                    "DELETE FROM post_completion "
+                    "WHERE service = ? AND creator_id = ? AND post_id = ?",
+                    (service, creator_id, str(post_id)),
+                )
+
+    def close(self) -> None:
+        """Commit queued stores and close every connection.
+
+        The database stays usable; connections are reopened on demand.
+        """
+        self.flush()
+        with self._write_lock:
+            if self._writer is not None:
+                self._writer.close()
+                self._writer = None
+            with self._lock:
+                readers = list(self._readers.values())
+                self._readers.clear()
+        for _thread, conn in readers:
+            conn.close()
+        self._local = threading.local()
@@ -460,6 +460,12 @@ class KDLanguage:
                 "korean": "감지된 총 파일 수: {0}",
                 "chinese-simplified": "检测到的文件总数：{0}",
             },
+            "listing_prep_summary": {
+                "english": "Prepared {0} posts from listing data; fetching {1} posts individually",
+                "japanese": "{0} 件の投稿を一覧データから準備しました。{1} 件は個別に取得します",
+                "korean": "{0}개 게시물을 목록 데이터로 준비했습니다. {1}개는 개별적으로 가져옵니다",
+                "chinese-simplified": "已从列表数据准备 {0} 个帖子；{1} 个帖子将单独获取",
+            },
             "total_files_to_download": {
                 "english": "Total files to download: {0}",
                 "japanese": "ダウンロードするファイルの合計：{0}",
@@ -538,6 +544,12 @@ class KDLanguage:
                 "korean": "{0}에 대한 속도 제한에 도달했습니다 (시도 {1}/{2}). 재시도 중...",
                 "chinese-simplified": "{0} 的速率限制已达到（尝试 {1}/{2}）。正在重试...",
             },
+            "rate_limit_backoff": {
+                "english": "Pausing all requests to {0} for {1:.1f}s as requested by the server",
+                "japanese": "サーバーの要求により{0}へのすべてのリクエストを{1:.1f}秒間停止します",
+                "korean": "서버 요청에 따라 {0}에 대한 모든 요청을 {1:.1f}초 동안 일시 중지합니다",
+                "chinese-simplified": "根据服务器要求，暂停对 {0} 的所有请求 {1:.1f} 秒",
+            },
             "failed_to_fetch_api": {
                 "english": "Failed to fetch {0} - Status code: {1}",
                 "japanese": "{0} の取得に失敗しました - ステータスコード：{1}",
@@ -563,11 +575,17 @@ class KDLanguage:
                 "chinese-simplified": "获取帖子 {0} 出错（尝试 {1}/{2}）：{3}。正在重试...",
             },
             "trying_again_in": {
-                "english": "Trying again in {0}",
+                "english": "Trying again in {0}s",
                 "japanese": "{0}秒後に再試行します",
                 "korean": "{0}초 후에 다시 시도합니다",
                 "chinese-simplified": "{0}秒后再次尝试",
             },
+            "retry_scheduled": {
+                "english": "Retrying {0} in {1:.1f}s; continuing with other files",
+                "japanese": "{1:.1f}秒後に {0} を再試行します。その間に他のファイルを続行します",
+                "korean": "{1:.1f}초 후에 {0}을(를) 다시 시도합니다. 그동안 다른 파일을 계속 진행합니다",
+                "chinese-simplified": "将在 {1:.1f} 秒后重试 {0}，期间继续下载其他文件",
+            },
             "allowed_extensions_for_download": {
                 "english": "Allowed extensions for download: {0}",
                 "japanese": "ダウンロードの許可された拡張子：{0}",
@@ -580,6 +598,24 @@ class KDLanguage:
                 "korean": "선택한 게시물에 대해 일치하는 크리에이터 URL을 찾을 수 없습니다.",
                 "chinese-simplified": "未找到与所选帖子匹配的创建者URL。",
             },
+            "parallel_page_detection": {
+                "english": "Creator has {0} posts; fetching {1} pages with {2} parallel requests",
+                "japanese": "クリエイターの投稿数は{0}件です。{1}ページを{2}件の並列リクエストで取得します",
+                "korean": "크리에이터의 게시물은 {0}개입니다. {1}개 페이지를 {2}개의 병렬 요청으로 가져옵니다",
+                "chinese-simplified": "创作者共有 {0} 个帖子；正在以 {2} 个并行请求获取 {1} 页",
+            },
+            "page_fetch_failed_at_offset": {
+                "english": "Parallel fetch of posts at offset {0} failed; continuing sequentially",
+                "japanese": "オフセット{0}の投稿の並列取得に失敗しました。順次取得に切り替えます",
+                "korean": "오프셋 {0}의 게시물 병렬 가져오기에 실패했습니다. 순차적으로 계속합니다",
+                "chinese-simplified": "并行获取偏移量 {0} 处的帖子失败；改为顺序获取",
+            },
+            "parallel_pages_unused": {
+                "english": "{0} parallel page request(s) from offset {1} were cancelled or left unused",
+                "japanese": "オフセット{1}以降の{0}件の並列ページリクエストはキャンセルされたか使用されませんでした",
+                "korean": "오프셋 {1}부터의 병렬 페이지 요청 {0}개가 취소되었거나 사용되지 않았습니다",
+                "chinese-simplified": "偏移量 {1} 起的 {0} 个并行页面请求已取消或未使用",
+            },
             "fetched_posts_at_offset": {
                 "english": "Fetched {0} posts at offset {1}",
                 "japanese": "オフセット {1} で {0} 件の投稿を取得しました",
@@ -856,6 +892,60 @@ class KDLanguage:
                 "korean": "파일 이름 템플릿 형식 지정에 실패하여 폴백을 사용합니다: {0}",
                 "chinese-simplified": "文件名模板格式化失败，使用回退: {0}",
             },
+            "creator_listing_prep": {
+                "english": "Prepare Files from Listing Data:",
+                "japanese": "一覧データからファイルを準備:",
+                "korean": "목록 데이터로 파일 준비:",
+                "chinese-simplified": "从列表数据准备文件:",
+            },
+            "creator_incremental_sync": {
+                "english": "Only Check New Posts When Re-checking a Creator:",
+                "japanese": "クリエイター再確認時に新しい投稿のみを確認:",
+                "korean": "크리에이터 재확인 시 새 게시물만 확인:",
+                "chinese-simplified": "重新检查创作者时仅检查新帖子:",
+            },
+            "incremental_sync_from": {
+                "english": "Incremental sync: newest known post of {0} is {1} ({2})",
+                "japanese": "増分同期: {0} の既知の最新投稿は {1}（{2}）です",
+                "korean": "증분 동기화: {0}의 알려진 최신 게시물은 {1} ({2})입니다",
+                "chinese-simplified": "增量同步：{0} 已知的最新帖子为 {1}（{2}）",
+            },
+            "incremental_sync_stopped": {
+                "english": "Page at offset {0} has only known posts; stopping after {1} posts",
+                "japanese": "オフセット {0} のページは既知の投稿のみのため、{1} 件で停止します",
+                "korean": "오프셋 {0} 페이지에는 알려진 게시물만 있어 {1}개 게시물 후 중지합니다",
+                "chinese-simplified": "偏移量 {0} 的页面仅包含已知帖子；在 {1} 个帖子后停止",
+            },
+            "creator_fast_mode_lookahead": {
+                "english": "Fast Mode Creators Prepared Ahead:",
+                "japanese": "高速モードで事前に準備するクリエイター数:",
+                "korean": "빠른 모드에서 미리 준비할 크리에이터 수:",
+                "chinese-simplified": "快速模式提前准备的创作者数:",
+            },
+            "creator_skip_completed": {
+                "english": "Skip Posts Already Downloaded Completely:",
+                "japanese": "完全にダウンロード済みの投稿をスキップ:",
+                "korean": "이미 완전히 다운로드한 게시물 건너뛰기:",
+                "chinese-simplified": "跳过已完整下载的帖子:",
+            },
+            "creator_stream_prep": {
+                "english": "Download While Preparing Files:",
+                "japanese": "ファイル準備中にダウンロードを開始:",
+                "korean": "파일 준비 중 다운로드 시작:",
+                "chinese-simplified": "准备文件时即开始下载:",
+            },
+            "streaming_prepared_files": {
+                "english": "Downloading files as their posts are prepared",
+                "japanese": "投稿の準備が済んだファイルから順にダウンロードしています",
+                "korean": "게시물이 준비되는 대로 파일을 다운로드합니다",
+                "chinese-simplified": "帖子准备完成后立即下载其文件",
+            },
+            "completed_posts_skipped": {
+                "english": "Skipped {0} posts whose files were all downloaded before",
+                "japanese": "ファイルがすべてダウンロード済みの投稿 {0} 件をスキップしました",
+                "korean": "파일을 모두 다운로드한 게시물 {0}개를 건너뛰었습니다",
+                "chinese-simplified": "已跳过 {0} 个文件均已下载的帖子",
+            },
             "folder_strategy": {
                 "english": "Folder Structure",
                 "japanese": "フォルダ構造",
@@ -904,6 +994,12 @@ class KDLanguage:
                 "korean": "다운로드된 크기({0}바이트)가 예상 크기({1}바이트)와 일치하지 않습니다: {2}",
                 "chinese-simplified": "下载大小（{0}字节）与预期大小（{1}字节）不匹配：{2}",
             },
+            "download_cancelled_part_kept": {
+                "english": "Download of {0} cancelled; the partial file is kept to resume later",
+                "japanese": "{0}のダウンロードをキャンセルしました。部分ファイルは後で再開するために保持されます",
+                "korean": "{0} 다운로드가 취소되었습니다. 나중에 이어받을 수 있도록 부분 파일을 보관합니다",
+                "chinese-simplified": "已取消 {0} 的下载；保留部分文件以便稍后继续",
+            },
             "deleted_incomplete_file": {
                 "english": "Deleted incomplete file: {0}",
                 "japanese": "不完全なファイルを削除しました：{0}",
@@ -1121,6 +1217,12 @@ class KDLanguage:
                 "korean": "파일 진행률 {0}%",
                 "chinese-simplified": "文件进度 {0}%",
             },
+            "file_progress_rate": {
+                "english": "File Progress {0}% · {1}/s · {2} left",
+                "japanese": "ファイル進捗 {0}% · {1}/s · 残り {2}",
+                "korean": "파일 진행률 {0}% · {1}/s · {2} 남음",
+                "chinese-simplified": "文件进度 {0}% · {1}/s · 剩余 {2}",
+            },
             "overall_progress": {
                 "english": "Overall Progress ({0}/{1} files, {2}/{3} posts)",
                 "japanese": "全体の進捗 ({0}/{1} ファイル, {2}/{3} 投稿)",
@@ -1249,6 +1351,186 @@ class KDLanguage:
                 "korean": "동시 다운로드:",
                 "chinese-simplified": "并行下载数:",
             },
+            "download_engine": {
+                "english": "Download Engine:",
+                "japanese": "ダウンロードエンジン:",
+                "korean": "다운로드 엔진:",
+                "chinese-simplified": "下载引擎:",
+            },
+            "download_engine_requests": {
+                "english": "Standard (requests)",
+                "japanese": "標準 (requests)",
+                "korean": "표준 (requests)",
+                "chinese-simplified": "标准 (requests)",
+            },
+            "download_engine_aiohttp": {
+                "english": "Native async (aiohttp)",
+                "japanese": "ネイティブ非同期 (aiohttp)",
+                "korean": "네이티브 비동기 (aiohttp)",
+                "chinese-simplified": "原生异步 (aiohttp)",
+            },
+            "aiohttp_engine_enabled": {
+                "english": "Using the aiohttp download engine",
+                "japanese": "aiohttpダウンロードエンジンを使用しています",
+                "korean": "aiohttp 다운로드 엔진을 사용 중입니다",
+                "chinese-simplified": "正在使用 aiohttp 下载引擎",
+            },
+            "aiohttp_engine_socks_fallback": {
+                "english": "SOCKS proxies need the aiohttp_socks package for the aiohttp engine; falling back to the standard engine",
+                "japanese": "aiohttpエンジンでSOCKSプロキシを使用するにはaiohttp_socksパッケージが必要です。標準エンジンに切り替えます",
+                "korean": "aiohttp 엔진에서 SOCKS 프록시를 사용하려면 aiohttp_socks 패키지가 필요합니다. 표준 엔진으로 전환합니다",
+                "chinese-simplified": "aiohttp 引擎使用 SOCKS 代理需要 aiohttp_socks 包，已回退到标准引擎",
+            },
+            "segmented_download_threshold": {
+                "english": "Segment Files Larger Than (MB, 0 = off):",
+                "japanese": "分割ダウンロードするファイルサイズ (MB、0 = 無効):",
+                "korean": "분할 다운로드 파일 크기 (MB, 0 = 끔):",
+                "chinese-simplified": "分段下载的文件大小 (MB，0 = 关闭):",
+            },
+            "segmented_download_segments": {
+                "english": "Segments per Large File:",
+                "japanese": "大きなファイルの分割数:",
+                "korean": "대용량 파일당 분할 수:",
+                "chinese-simplified": "大文件分段数:",
+            },
+            "adaptive_concurrency": {
+                "english": "Adapt Concurrency Automatically:",
+                "japanese": "同時実行数を自動調整:",
+                "korean": "동시 작업 수 자동 조절:",
+                "chinese-simplified": "自动调整并发数:",
+            },
+            "adaptive_min_concurrency": {
+                "english": "Minimum Concurrency (adaptive):",
+                "japanese": "最小同時実行数（自動調整）:",
+                "korean": "최소 동시 작업 수 (자동 조절):",
+                "chinese-simplified": "最小并发数（自动调整）:",
+            },
+            "deep_verify_enabled": {
+                "english": "Re-verify Skipped Files in Background:",
+                "japanese": "スキップしたファイルをバックグラウンドで再検証:",
+                "korean": "건너뛴 파일을 백그라운드에서 재검증:",
+                "chinese-simplified": "在后台重新校验已跳过的文件:",
+            },
+            "deep_verify_mismatch": {
+                "english": "Background verification: {0} no longer matches its recorded hash; it will be downloaded again next time",
+                "japanese": "バックグラウンド検証: {0} は記録されたハッシュと一致しません。次回再ダウンロードされます",
+                "korean": "백그라운드 검증: {0}이(가) 기록된 해시와 일치하지 않습니다. 다음에 다시 다운로드됩니다",
+                "chinese-simplified": "后台校验：{0} 与记录的哈希不一致，下次将重新下载",
+            },
+            "adaptive_max_concurrency": {
+                "english": "Maximum Concurrency (adaptive):",
+                "japanese": "最大同時実行数（自動調整）:",
+                "korean": "최대 동시 작업 수 (자동 조절):",
+                "chinese-simplified": "最大并发数（自动调整）:",
+            },
+            "per_creator_download_limit": {
+                "english": "Max Downloads per Creator (0 = no limit):",
+                "japanese": "クリエイターごとの最大ダウンロード数（0 = 無制限）:",
+                "korean": "크리에이터당 최대 다운로드 수 (0 = 제한 없음):",
+                "chinese-simplified": "每个创作者的最大下载数（0 = 不限）:",
+            },
+            "connection_setup_width": {
+                "english": "Connection Setups at Once per Host (0 = auto):",
+                "japanese": "ホストごとの同時接続確立数（0 = 自動）:",
+                "korean": "호스트당 동시 연결 설정 수 (0 = 자동):",
+                "chinese-simplified": "每个主机同时建立的连接数（0 = 自动）:",
+            },
+            "unsupported_url": {
+                "english": "Not a creator or post URL, skipping: {0}",
+                "japanese": "クリエイターまたは投稿の URL ではないためスキップします: {0}",
+                "korean": "크리에이터 또는 게시물 URL이 아니므로 건너뜁니다: {0}",
+                "chinese-simplified": "不是创作者或帖子 URL，已跳过: {0}",
+            },
+            "cli_summary": {
+                "english": "Done: {0} downloaded, {1} already present, {2} failed",
+                "japanese": "完了: ダウンロード {0} 件、既存 {1} 件、失敗 {2} 件",
+                "korean": "완료: 다운로드 {0}개, 이미 있음 {1}개, 실패 {2}개",
+                "chinese-simplified": "完成: 已下载 {0} 个，已存在 {1} 个，失败 {2} 个",
+            },
+            "cli_next_run": {
+                "english": "Next sync in {0} seconds",
+                "japanese": "次の同期まで {0} 秒",
+                "korean": "{0}초 후 다음 동기화",
+                "chinese-simplified": "{0} 秒后进行下一次同步",
+            },
+            "fast_mode_overlap_started": {
+                "english": "Fast Mode: {0} is finishing its last files; starting {1}",
+                "japanese": "高速モード: {0} は最後のファイルを処理中です。{1} を開始します",
+                "korean": "빠른 모드: {0}이(가) 마지막 파일을 처리하는 중입니다. {1}을(를) 시작합니다",
+                "chinese-simplified": "快速模式：{0} 正在完成最后的文件；开始 {1}",
+            },
+            "fast_mode_overlap_finished": {
+                "english": "Fast Mode: finished the last files of {0}",
+                "japanese": "高速モード: {0} の最後のファイルが完了しました",
+                "korean": "빠른 모드: {0}의 마지막 파일을 완료했습니다",
+                "chinese-simplified": "快速模式：{0} 的最后文件已完成",
+            },
+            "effective_concurrency": {
+                "english": "Concurrent downloads: {0}",
+                "japanese": "同時ダウンロード数: {0}",
+                "korean": "동시 다운로드 수: {0}",
+                "chinese-simplified": "并发下载数: {0}",
+            },
+            "effective_concurrency_changed": {
+                "english": "Adaptive concurrency adjusted to {0}",
+                "japanese": "同時実行数を{0}に自動調整しました",
+                "korean": "동시 작업 수를 {0}(으)로 자동 조절했습니다",
+                "chinese-simplified": "并发数已自动调整为 {0}",
+            },
+            "segmented_download_started": {
+                "english": "Downloading {0} in {1} segments ({2} remaining)",
+                "japanese": "{0}を{1}個のセグメントでダウンロードしています（残り{2}）",
+                "korean": "{0}을(를) {1}개 세그먼트로 다운로드 중 (남은 세그먼트 {2})",
+                "chinese-simplified": "正在以 {1} 个分段下载 {0}（剩余 {2}）",
+            },
+            "segment_failed_retrying": {
+                "english": "Segment {0}-{1} of {2} failed, attempt {3}/{4}: {5}",
+                "japanese": "{2}のセグメント{0}-{1}が失敗しました、試行{3}/{4}：{5}",
+                "korean": "{2}의 세그먼트 {0}-{1} 실패, 시도 {3}/{4}: {5}",
+                "chinese-simplified": "{2} 的分段 {0}-{1} 失败，尝试 {3}/{4}: {5}",
+            },
+            "segment_failed": {
+                "english": "Segment {0}-{1} failed after {2} attempts: {3}",
+                "japanese": "セグメント{0}-{1}は{2}回の試行後に失敗しました：{3}",
+                "korean": "세그먼트 {0}-{1}이(가) {2}번 시도 후 실패했습니다: {3}",
+                "chinese-simplified": "分段 {0}-{1} 在 {2} 次尝试后失败: {3}",
+            },
+            "segmented_hash_mismatch": {
+                "english": "SHA-256 of the assembled file {0} does not match the server hash (got {1})",
+                "japanese": "結合したファイル{0}のSHA-256がサーバーのハッシュと一致しません（{1}）",
+                "korean": "조합된 파일 {0}의 SHA-256이 서버 해시와 일치하지 않습니다 ({1})",
+                "chinese-simplified": "合并后的文件 {0} 的 SHA-256 与服务器哈希不匹配（{1}）",
+            },
+            "api_cache_settings": {
+                "english": "API Cache Settings",
+                "japanese": "APIキャッシュ設定",
+                "korean": "API 캐시 설정",
+                "chinese-simplified": "API 缓存设置",
+            },
+            "api_cache_enabled": {
+                "english": "Cache API Responses on Disk:",
+                "japanese": "APIレスポンスをディスクにキャッシュ:",
+                "korean": "API 응답을 디스크에 캐시:",
+                "chinese-simplified": "在磁盘上缓存 API 响应:",
+            },
+            "api_cache_ttl_hours": {
+                "english": "Post Data Cache Lifetime (hours):",
+                "japanese": "投稿データのキャッシュ有効期間（時間）:",
+                "korean": "게시물 데이터 캐시 유지 시간 (시간):",
+                "chinese-simplified": "帖子数据缓存有效期（小时）:",
+            },
+            "api_cache_max_mb": {
+                "english": "Maximum Cache Size (MB):",
+                "japanese": "最大キャッシュサイズ (MB):",
+                "korean": "최대 캐시 크기 (MB):",
+                "chinese-simplified": "最大缓存大小 (MB):",
+            },
+            "api_cache_offline": {
+                "english": "Offline Mode (use cached API data only):",
+                "japanese": "オフラインモード（キャッシュ済みAPIデータのみ使用）:",
+                "korean": "오프라인 모드 (캐시된 API 데이터만 사용):",
+                "chinese-simplified": "离线模式（仅使用已缓存的 API 数据）:",
+            },
             "retry_settings": {
                 "english": "Retry Settings",
                 "japanese": "リトライ設定",
@@ -1976,6 +2258,18 @@ class KDLanguage:
                 "korean": "파일 {0}이(가) 이미 {1}에 다운로드되었습니다. 건너뜁니다.",
                 "chinese-simplified": "文件 {0} 已在 {1} 下载，跳过。",
             },
+            "content_dedupe_reused": {
+                "english": "Reused {1} for {0} ({2}) instead of downloading it again",
+                "japanese": "再ダウンロードせずに {1} を {0} に再利用しました（{2}）",
+                "korean": "다시 다운로드하지 않고 {1}을(를) {0}에 재사용했습니다 ({2})",
+                "chinese-simplified": "已复用 {1} 作为 {0}（{2}），无需重新下载",
+            },
+            "content_dedupe_failed": {
+                "english": "Could not reuse {0} for {1}: {2}. Downloading instead.",
+                "japanese": "{0} を {1} に再利用できませんでした: {2}。代わりにダウンロードします。",
+                "korean": "{0}을(를) {1}에 재사용할 수 없습니다: {2}. 대신 다운로드합니다.",
+                "chinese-simplified": "无法将 {0} 复用为 {1}：{2}。改为下载。",
+            },
             "starting_download": {
                 "english": "Starting download of file {0}/{1}: {2} to {3}",
                 "japanese": "ファイル {0}/{1} のダウンロードを開始: {2} を {3} に",
@@ -3548,6 +3842,12 @@ class KDLanguage:
                 "korean": "게시물 처리 중: {0}, 남은 URL: {1}",
                 "chinese-simplified": "正在处理投稿: {0}，剩余URL: {1}",
             },
+            "processing_post_batch": {
+                "english": "Downloading {0} files from {1} posts together",
+                "japanese": "{1} 件の投稿の {0} 個のファイルをまとめてダウンロード中",
+                "korean": "{1}개 게시물의 파일 {0}개를 함께 다운로드하는 중",
+                "chinese-simplified": "正在同时下载 {1} 个投稿的 {0} 个文件",
+            },
             "terminated_thread": {
                 "english": "Terminated thread: {0}",
                 "japanese": "スレッドを終了しました: {0}",
@@ -3676,6 +3976,24 @@ class KDLanguage:
                 "korean": "빠른 모드: 크리에이터 {0}의 게시물을 찾을 수 없습니다. 건너뜁니다.",
                 "chinese-simplified": "快速模式：未找到创作者 {0} 的帖子，跳过。",
             },
+            "fast_mode_prefetching": {
+                "english": "Fast Mode: preparing creator {0} ahead of its download",
+                "japanese": "高速モード: ダウンロードに先立ってクリエイター {0} を準備しています",
+                "korean": "빠른 모드: 다운로드에 앞서 크리에이터 {0}을(를) 준비하는 중",
+                "chinese-simplified": "快速模式：正在提前准备创作者 {0}",
+            },
+            "fast_mode_prefetch_failed": {
+                "english": "Fast Mode: preparing creator {0} ahead failed: {1}",
+                "japanese": "高速モード: クリエイター {0} の事前準備に失敗しました: {1}",
+                "korean": "빠른 모드: 크리에이터 {0} 사전 준비 실패: {1}",
+                "chinese-simplified": "快速模式：提前准备创作者 {0} 失败：{1}",
+            },
+            "fast_mode_prefetch_fallback": {
+                "english": "Fast Mode: creator {0} could not be prepared ahead; it will be checked when its turn comes",
+                "japanese": "高速モード: クリエイター {0} を事前に準備できませんでした。順番が来たときに確認します",
+                "korean": "빠른 모드: 크리에이터 {0}을(를) 미리 준비하지 못했습니다. 차례가 되면 확인합니다",
+                "chinese-simplified": "快速模式：无法提前准备创作者 {0}，将在轮到它时检查",
+            },
             "fast_mode_auto_selected": {
                 "english": "Fast Mode: auto-selected {0} post(s) for {1}.",
                 "japanese": "高速モード: {1} の {0} 件の投稿を自動選択しました。",
@@ -41,6 +41,23 @@ class SettingsTab(QWidget):
             "base_folder_name": "Kemono Downloader",
             "base_directory": self.get_default_base_directory(),
             "simultaneous_downloads": 5,
+            "download_engine": "requests",  # "requests", "aiohttp"
+            "segmented_download_threshold_mb": 100,  # 0 disables segmenting
+            "segmented_download_segments": 4,
+            "adaptive_concurrency": False,  # AIMD between the min/max below
+            "adaptive_min_concurrency": 2,
+            "adaptive_max_concurrency": 20,
+            # Download slots one creator may hold at once; 0 = no cap
+            "per_creator_download_limit": 0,
+            # Connections set up at once per host; 0 = platform default
+            # (one at a time on Windows)
+            "connection_setup_width": 0,
+            # Re-hash already downloaded files in the background when skipping
+            "deep_verify_enabled": False,
+            "api_cache_enabled": True,  # on-disk cache of API responses
+            "api_cache_ttl_hours": 24,
+            "api_cache_max_mb": 256,
+            "api_cache_offline": False,  # answer API requests from the cache only
             "auto_check_updates": True,
             "language": "english",
             "creator_posts_max_attempts": 200,
@@ -54,6 +71,16 @@ class SettingsTab(QWidget):
             # Creator downloader filename/folder customization
             "creator_filename_template": "{post_id}_{orig_name}",
             "creator_folder_strategy": "per_post",  # per_post|single_folder|by_file_type
+            # Detect files from the listing records instead of one request per post
+            "creator_listing_prep": True,
+            # Stop re-checking a creator at the first page of known posts
+            "creator_incremental_sync": False,
+            # Skip posts an earlier run downloaded completely
+            "creator_skip_completed": False,
+            # Creators fast mode detects and prepares while one downloads
+            "creator_fast_mode_lookahead": 1,
+            # Start downloading a creator's files while the rest are prepared
+            "creator_stream_prep": True,
             # Font setting
             "font": "JetBrains Mono",  # "JetBrains Mono", "Poppins"
         }
@@ -97,6 +124,71 @@ class SettingsTab(QWidget):
             self.default_settings["simultaneous_downloads"],
             type=int,
         )
+        settings_dict["download_engine"] = self.qsettings.value(
+            "download_engine",
+            self.default_settings.get("download_engine", "requests"),
+            type=str,
+        )
+        settings_dict["segmented_download_threshold_mb"] = self.qsettings.value(
+            "segmented_download_threshold_mb",
+            self.default_settings.get("segmented_download_threshold_mb", 100),
+            type=int,
+        )
+        settings_dict["segmented_download_segments"] = self.qsettings.value(
+            "segmented_download_segments",
+            self.default_settings.get("segmented_download_segments", 4),
+            type=int,
+        )
+        settings_dict["adaptive_concurrency"] = self.qsettings.value(
+            "adaptive_concurrency",
+            self.default_settings.get("adaptive_concurrency", False),
+            type=bool,
+        )
+        settings_dict["adaptive_min_concurrency"] = self.qsettings.value(
+            "adaptive_min_concurrency",
+            self.default_settings.get("adaptive_min_concurrency", 2),
+            type=int,
+        )
+        settings_dict["adaptive_max_concurrency"] = self.qsettings.value(
+            "adaptive_max_concurrency",
+            self.default_settings.get("adaptive_max_concurrency", 20),
+            type=int,
+        )
+        settings_dict["per_creator_download_limit"] = self.qsettings.value(
+            "per_creator_download_limit",
+            self.default_settings.get("per_creator_download_limit", 0),
+            type=int,
+        )
+        settings_dict["connection_setup_width"] = self.qsettings.value(
+            "connection_setup_width",
+            self.default_settings.get("connection_setup_width", 0),
+            type=int,
+        )
+        settings_dict["deep_verify_enabled"] = self.qsettings.value(
+            "deep_verify_enabled",
+            self.default_settings.get("deep_verify_enabled", False),
+            type=bool,
+        )
+        settings_dict["api_cache_enabled"] = self.qsettings.value(
+            "api_cache_enabled",
+            self.default_settings.get("api_cache_enabled", True),
+            type=bool,
+        )
+        settings_dict["api_cache_ttl_hours"] = self.qsettings.value(
+            "api_cache_ttl_hours",
+            self.default_settings.get("api_cache_ttl_hours", 24),
+            type=int,
+        )
+        settings_dict["api_cache_max_mb"] = self.qsettings.value(
+            "api_cache_max_mb",
+            self.default_settings.get("api_cache_max_mb", 256),
+            type=int,
+        )
+        settings_dict["api_cache_offline"] = self.qsettings.value(
+            "api_cache_offline",
+            self.default_settings.get("api_cache_offline", False),
+            type=bool,
+        )
         settings_dict["auto_check_updates"] = self.qsettings.value(
             "auto_check_updates", self.default_settings["auto_check_updates"], type=bool
         )
@@ -149,6 +241,31 @@ class SettingsTab(QWidget):
             self.default_settings.get("creator_folder_strategy", "per_post"),
             type=str,
         )
+        settings_dict["creator_listing_prep"] = self.qsettings.value(
+            "creator_listing_prep",
+            self.default_settings.get("creator_listing_prep", True),
+            type=bool,
+        )
+        settings_dict["creator_incremental_sync"] = self.qsettings.value(
+            "creator_incremental_sync",
+            self.default_settings.get("creator_incremental_sync", False),
+            type=bool,
+        )
+        settings_dict["creator_skip_completed"] = self.qsettings.value(
+            "creator_skip_completed",
+            self.default_settings.get("creator_skip_completed", False),
+            type=bool,
+        )
+        settings_dict["creator_fast_mode_lookahead"] = self.qsettings.value(
+            "creator_fast_mode_lookahead",
+            self.default_settings.get("creator_fast_mode_lookahead", 1),
+            type=int,
+        )
+        settings_dict["creator_stream_prep"] = self.qsettings.value(
+            "creator_stream_prep",
+            self.default_settings.get("creator_stream_prep", True),
+            type=bool,
+        )
         # Font setting
         settings_dict["font"] = self.qsettings.value(
             "font", self.default_settings.get("font", "JetBrains Mono"), type=str
@@ -161,6 +278,51 @@ class SettingsTab(QWidget):
         self.qsettings.setValue(
             "simultaneous_downloads", self.settings["simultaneous_downloads"]
         )
+        self.qsettings.setValue(
+            "download_engine", self.settings.get("download_engine", "requests")
+        )
+        self.qsettings.setValue(
+            "segmented_download_threshold_mb",
+            self.settings.get("segmented_download_threshold_mb", 100),
+        )
+        self.qsettings.setValue(
+            "segmented_download_segments",
+            self.settings.get("segmented_download_segments", 4),
+        )
+        self.qsettings.setValue(
+            "adaptive_concurrency", self.settings.get("adaptive_concurrency", False)
+        )
+        self.qsettings.setValue(
+            "adaptive_min_concurrency",
+            self.settings.get("adaptive_min_concurrency", 2),
+        )
+        self.qsettings.setValue(
+            "adaptive_max_concurrency",
+            self.settings.get("adaptive_max_concurrency", 20),
+        )
+        self.qsettings.setValue(
+            "per_creator_download_limit",
+            self.settings.get("per_creator_download_limit", 0),
+        )
+        self.qsettings.setValue(
+            "connection_setup_width",
+            self.settings.get("connection_setup_width", 0),
+        )
+        self.qsettings.setValue(
+            "deep_verify_enabled", self.settings.get("deep_verify_enabled", False)
+        )
+        self.qsettings.setValue(
+            "api_cache_enabled", self.settings.get("api_cache_enabled", True)
+        )
+        self.qsettings.setValue(
+            "api_cache_ttl_hours", self.settings.get("api_cache_ttl_hours", 24)
+        )
+        self.qsettings.setValue(
+            "api_cache_max_mb", self.settings.get("api_cache_max_mb", 256)
+        )
+        self.qsettings.setValue(
+            "api_cache_offline", self.settings.get("api_cache_offline", False)
+        )
         self.qsettings.setValue(
             "auto_check_updates", self.settings["auto_check_updates"]
         )
@@ -189,6 +351,25 @@ class SettingsTab(QWidget):
             "creator_folder_strategy",
             self.settings.get("creator_folder_strategy", "per_post"),
         )
+        self.qsettings.setValue(
+            "creator_listing_prep", self.settings.get("creator_listing_prep", True)
+        )
+        self.qsettings.setValue(
+            "creator_incremental_sync",
+            self.settings.get("creator_incremental_sync", False),
+        )
+        self.qsettings.setValue(
+            "creator_skip_completed",
+            self.settings.get("creator_skip_completed", False),
+        )
+        self.qsettings.setValue(
+            "creator_fast_mode_lookahead",
+            self.settings.get("creator_fast_mode_lookahead", 1),
+        )
+        self.qsettings.setValue(
+            "creator_stream_prep",
+            self.settings.get("creator_stream_prep", True),
+        )
         # Font setting
         self.qsettings.setValue(
             "font",
@@ -270,6 +451,146 @@ class SettingsTab(QWidget):
         self.download_spinbox.valueChanged.connect(self.update_simultaneous_downloads)
         download_layout.addWidget(self.download_spinbox, 0, 2)
 
+        self.download_engine_label = QLabel()
+        download_layout.addWidget(self.download_engine_label, 1, 0)
+        self.download_engine_combo = QComboBox()
+        self.download_engine_combo.setStyleSheet("padding: 5px; border-radius: 5px;")
+        self.update_download_engine_combo()
+        self.download_engine_combo.currentIndexChanged.connect(
+            lambda idx: self.update_temp_setting(
+                "download_engine", self.download_engine_combo.itemData(idx)
+            )
+        )
+        download_layout.addWidget(self.download_engine_combo, 1, 1, 1, 2)
+
+        self.segmented_threshold_label = QLabel()
+        download_layout.addWidget(self.segmented_threshold_label, 2, 0)
+        self.segmented_threshold_spinbox = QSpinBox()
+        self.segmented_threshold_spinbox.setRange(0, 100000)
+        self.segmented_threshold_spinbox.setValue(
+            self.temp_settings.get("segmented_download_threshold_mb", 100)
+        )
+        self.segmented_threshold_spinbox.setStyleSheet(
+            "padding: 5px; border-radius: 5px;"
+        )
+        self.segmented_threshold_spinbox.valueChanged.connect(
+            lambda value: self.update_temp_setting(
+                "segmented_download_threshold_mb", value
+            )
+        )
+        download_layout.addWidget(self.segmented_threshold_spinbox, 2, 1, 1, 2)
+
+        self.segmented_segments_label = QLabel()
+        download_layout.addWidget(self.segmented_segments_label, 3, 0)
+        self.segmented_segments_spinbox = QSpinBox()
+        self.segmented_segments_spinbox.setRange(2, 16)
+        self.segmented_segments_spinbox.setValue(
+            self.temp_settings.get("segmented_download_segments", 4)
+        )
+        self.segmented_segments_spinbox.setStyleSheet(
+            "padding: 5px; border-radius: 5px;"
+        )
+        self.segmented_segments_spinbox.valueChanged.connect(
+            lambda value: self.update_temp_setting("segmented_download_segments", value)
+        )
+        download_layout.addWidget(self.segmented_segments_spinbox, 3, 1, 1, 2)
+
+        self.adaptive_concurrency_label = QLabel()
+        download_layout.addWidget(self.adaptive_concurrency_label, 4, 0)
+        self.adaptive_concurrency_checkbox = QCheckBox()
+        self.adaptive_concurrency_checkbox.setChecked(
+            self.temp_settings.get("adaptive_concurrency", False)
+        )
+        self.adaptive_concurrency_checkbox.setStyleSheet(
+            "QCheckBox::indicator { width: 16px; height: 16px; }"
+            "QCheckBox::indicator:unchecked { background: #2A3B5A; border: 1px solid #4A5B7A; }"
+            "QCheckBox::indicator:checked { background: #4A6B9A; border: 1px solid #5A7BA9; }"
+        )
+        self.adaptive_concurrency_checkbox.stateChanged.connect(
+            lambda state: self.update_temp_setting(
+                "adaptive_concurrency", state == Qt.CheckState.Checked.value
+            )
+        )
+        download_layout.addWidget(self.adaptive_concurrency_checkbox, 4, 1, 1, 2)
+
+        self.adaptive_min_concurrency_label = QLabel()
+        download_layout.addWidget(self.adaptive_min_concurrency_label, 5, 0)
+        self.adaptive_min_concurrency_spinbox = QSpinBox()
+        self.adaptive_min_concurrency_spinbox.setRange(1, 50)
+        self.adaptive_min_concurrency_spinbox.setValue(
+            self.temp_settings.get("adaptive_min_concurrency", 2)
+        )
+        self.adaptive_min_concurrency_spinbox.setStyleSheet(
+            "padding: 5px; border-radius: 5px;"
+        )
+        self.adaptive_min_concurrency_spinbox.valueChanged.connect(
+            lambda value: self.update_temp_setting("adaptive_min_concurrency", value)
+        )
+        download_layout.addWidget(self.adaptive_min_concurrency_spinbox, 5, 1, 1, 2)
+
+        self.adaptive_max_concurrency_label = QLabel()
+        download_layout.addWidget(self.adaptive_max_concurrency_label, 6, 0)
+        self.adaptive_max_concurrency_spinbox = QSpinBox()
+        self.adaptive_max_concurrency_spinbox.setRange(1, 50)
+        self.adaptive_max_concurrency_spinbox.setValue(
+            self.temp_settings.get("adaptive_max_concurrency", 20)
+        )
+        self.adaptive_max_concurrency_spinbox.setStyleSheet(
+            "padding: 5px; border-radius: 5px;"
+        )
+        self.adaptive_max_concurrency_spinbox.valueChanged.connect(
+            lambda value: self.update_temp_setting("adaptive_max_concurrency", value)
+        )
+        download_layout.addWidget(self.adaptive_max_concurrency_spinbox, 6, 1, 1, 2)
+
+        self.per_creator_download_limit_label = QLabel()
+        download_layout.addWidget(self.per_creator_download_limit_label, 7, 0)
+        self.per_creator_download_limit_spinbox = QSpinBox()
+        self.per_creator_download_limit_spinbox.setRange(0, 50)
+        self.per_creator_download_limit_spinbox.setValue(
+            self.temp_settings.get("per_creator_download_limit", 0)
+        )
+        self.per_creator_download_limit_spinbox.setStyleSheet(
+            "padding: 5px; border-radius: 5px;"
+        )
+        self.per_creator_download_limit_spinbox.valueChanged.connect(
+            lambda value: self.update_temp_setting("per_creator_download_limit", value)
+        )
+        download_layout.addWidget(self.per_creator_download_limit_spinbox, 7, 1, 1, 2)
+
+        self.connection_setup_width_label = QLabel()
+        download_layout.addWidget(self.connection_setup_width_label, 8, 0)
+        self.connection_setup_width_spinbox = QSpinBox()
+        self.connection_setup_width_spinbox.setRange(0, 64)
+        self.connection_setup_width_spinbox.setValue(
+            self.temp_settings.get("connection_setup_width", 0)
+        )
+        self.connection_setup_width_spinbox.setStyleSheet(
+            "padding: 5px; border-radius: 5px;"
+        )
+        self.connection_setup_width_spinbox.valueChanged.connect(
+            lambda value: self.update_temp_setting("connection_setup_width", value)
+        )
+        download_layout.addWidget(self.connection_setup_width_spinbox, 8, 1, 1, 2)
+
+        self.deep_verify_label = QLabel()
+        download_layout.addWidget(self.deep_verify_label, 9, 0)
+        self.deep_verify_checkbox = QCheckBox()
+        self.deep_verify_checkbox.setChecked(
+            self.temp_settings.get("deep_verify_enabled", False)
+        )
+        self.deep_verify_checkbox.setStyleSheet(
+            "QCheckBox::indicator { width: 16px; height: 16px; }"
+            "QCheckBox::indicator:unchecked { background: #2A3B5A; border: 1px solid #4A5B7A; }"
+            "QCheckBox::indicator:checked { background: #4A6B9A; border: 1px solid #5A7BA9; }"
+        )
+        self.deep_verify_checkbox.stateChanged.connect(
+            lambda state: self.update_temp_setting(
+                "deep_verify_enabled", state == Qt.CheckState.Checked.value
+            )
+        )
+        download_layout.addWidget(self.deep_verify_checkbox, 9, 1, 1, 2)
+
         self.download_group.setLayout(download_layout)
         layout.addWidget(self.download_group)
 
@@ -343,6 +664,78 @@ class SettingsTab(QWidget):
         self.retry_group.setLayout(retry_layout)
         layout.addWidget(self.retry_group)
 
+        # API Cache Settings Group
+        self.api_cache_group = QGroupBox()
+        self.api_cache_group.setStyleSheet(
+            "QGroupBox { color: white; font-weight: bold; padding: 10px; }"
+        )
+        api_cache_layout = QGridLayout()
+
+        self.api_cache_enabled_label = QLabel()
+        api_cache_layout.addWidget(self.api_cache_enabled_label, 0, 0)
+        self.api_cache_enabled_checkbox = QCheckBox()
+        self.api_cache_enabled_checkbox.setChecked(
+            self.temp_settings.get("api_cache_enabled", True)
+        )
+        self.api_cache_enabled_checkbox.setStyleSheet(
+            "QCheckBox::indicator { width: 16px; height: 16px; }"
+            "QCheckBox::indicator:unchecked { background: #2A3B5A; border: 1px solid #4A5B7A; }"
+            "QCheckBox::indicator:checked { background: #4A6B9A; border: 1px solid #5A7BA9; }"
+        )
+        self.api_cache_enabled_checkbox.stateChanged.connect(
+            lambda state: self.update_temp_setting(
+                "api_cache_enabled", state == Qt.CheckState.Checked.value
+            )
+        )
+        api_cache_layout.addWidget(self.api_cache_enabled_checkbox, 0, 1)
+
+        self.api_cache_ttl_label = QLabel()
+        api_cache_layout.addWidget(self.api_cache_ttl_label, 1, 0)
+        self.api_cache_ttl_spinbox = QSpinBox()
+        self.api_cache_ttl_spinbox.setRange(0, 24 * 30)
+        self.api_cache_ttl_spinbox.setValue(
+            self.temp_settings.get("api_cache_ttl_hours", 24)
+        )
+        self.api_cache_ttl_spinbox.setStyleSheet("padding: 5px; border-radius: 5px;")
+        self.api_cache_ttl_spinbox.valueChanged.connect(
+            lambda value: self.update_temp_setting("api_cache_ttl_hours", value)
+        )
+        api_cache_layout.addWidget(self.api_cache_ttl_spinbox, 1, 1)
+
+        self.api_cache_max_mb_label = QLabel()
+        api_cache_layout.addWidget(self.api_cache_max_mb_label, 2, 0)
+        self.api_cache_max_mb_spinbox = QSpinBox()
+        self.api_cache_max_mb_spinbox.setRange(1, 10240)
+        self.api_cache_max_mb_spinbox.setValue(
+            self.temp_settings.get("api_cache_max_mb", 256)
+        )
+        self.api_cache_max_mb_spinbox.setStyleSheet("padding: 5px; border-radius: 5px;")
+        self.api_cache_max_mb_spinbox.valueChanged.connect(
+            lambda value: self.update_temp_setting("api_cache_max_mb", value)
+        )
+        api_cache_layout.addWidget(self.api_cache_max_mb_spinbox, 2, 1)
+
+        self.api_cache_offline_label = QLabel()
+        api_cache_layout.addWidget(self.api_cache_offline_label, 3, 0)
+        self.api_cache_offline_checkbox = QCheckBox()
+        self.api_cache_offline_checkbox.setChecked(
+            self.temp_settings.get("api_cache_offline", False)
+        )
+        self.api_cache_offline_checkbox.setStyleSheet(
+            "QCheckBox::indicator { width: 16px; height: 16px; }"
+            "QCheckBox::indicator:unchecked { background: #2A3B5A; border: 1px solid #4A5B7A; }"
+            "QCheckBox::indicator:checked { background: #4A6B9A; border: 1px solid #5A7BA9; }"
+        )
+        self.api_cache_offline_checkbox.stateChanged.connect(
+            lambda state: self.update_temp_setting(
+                "api_cache_offline", state == Qt.CheckState.Checked.value
+            )
+        )
+        api_cache_layout.addWidget(self.api_cache_offline_checkbox, 3, 1)
+
+        self.api_cache_group.setLayout(api_cache_layout)
+        layout.addWidget(self.api_cache_group)
+
         # Creator downloader customization group
         self.creator_custom_group = QGroupBox()
         self.creator_custom_group.setStyleSheet(
@@ -443,6 +836,93 @@ class SettingsTab(QWidget):
         )
         creator_custom_layout.addWidget(self.creator_folder_strategy_combo, 1, 1)
 
+        self.creator_listing_prep_label = QLabel()
+        creator_custom_layout.addWidget(self.creator_listing_prep_label, 2, 0)
+        self.creator_listing_prep_checkbox = QCheckBox()
+        self.creator_listing_prep_checkbox.setChecked(
+            self.temp_settings.get("creator_listing_prep", True)
+        )
+        self.creator_listing_prep_checkbox.setStyleSheet(
+            "QCheckBox::indicator { width: 16px; height: 16px; }"
+            "QCheckBox::indicator:unchecked { background: #2A3B5A; border: 1px solid #4A5B7A; }"
+            "QCheckBox::indicator:checked { background: #4A6B9A; border: 1px solid #5A7BA9; }"
+        )
+        self.creator_listing_prep_checkbox.stateChanged.connect(
+            lambda state: self.update_temp_setting(
+                "creator_listing_prep", state == Qt.CheckState.Checked.value
+            )
+        )
+        creator_custom_layout.addWidget(self.creator_listing_prep_checkbox, 2, 1)
+
+        self.creator_incremental_sync_label = QLabel()
+        creator_custom_layout.addWidget(self.creator_incremental_sync_label, 3, 0)
+        self.creator_incremental_sync_checkbox = QCheckBox()
+        self.creator_incremental_sync_checkbox.setChecked(
+            self.temp_settings.get("creator_incremental_sync", False)
+        )
+        self.creator_incremental_sync_checkbox.setStyleSheet(
+            "QCheckBox::indicator { width: 16px; height: 16px; }"
+            "QCheckBox::indicator:unchecked { background: #2A3B5A; border: 1px solid #4A5B7A; }"
+            "QCheckBox::indicator:checked { background: #4A6B9A; border: 1px solid #5A7BA9; }"
+        )
+        self.creator_incremental_sync_checkbox.stateChanged.connect(
+            lambda state: self.update_temp_setting(
+                "creator_incremental_sync", state == Qt.CheckState.Checked.value
+            )
+        )
+        creator_custom_layout.addWidget(self.creator_incremental_sync_checkbox, 3, 1)
+
+        self.creator_skip_completed_label = QLabel()
+        creator_custom_layout.addWidget(self.creator_skip_completed_label, 4, 0)
+        self.creator_skip_completed_checkbox = QCheckBox()
+        self.creator_skip_completed_checkbox.setChecked(
+            self.temp_settings.get("creator_skip_completed", False)
+        )
+        self.creator_skip_completed_checkbox.setStyleSheet(
+            "QCheckBox::indicator { width: 16px; height: 16px; }"
+            "QCheckBox::indicator:unchecked { background: #2A3B5A; border: 1px solid #4A5B7A; }"
+            "QCheckBox::indicator:checked { background: #4A6B9A; border: 1px solid #5A7BA9; }"
+        )
+        self.creator_skip_completed_checkbox.stateChanged.connect(
+            lambda state: self.update_temp_setting(
+                "creator_skip_completed", state == Qt.CheckState.Checked.value
+            )
+        )
+        creator_custom_layout.addWidget(self.creator_skip_completed_checkbox, 4, 1)
+
+        self.creator_fast_mode_lookahead_label = QLabel()
+        creator_custom_layout.addWidget(self.creator_fast_mode_lookahead_label, 5, 0)
+        self.creator_fast_mode_lookahead_spinbox = QSpinBox()
+        self.creator_fast_mode_lookahead_spinbox.setRange(0, 8)
+        self.creator_fast_mode_lookahead_spinbox.setValue(
+            self.temp_settings.get("creator_fast_mode_lookahead", 1)
+        )
+        self.creator_fast_mode_lookahead_spinbox.setStyleSheet(
+            "padding: 5px; border-radius: 5px;"
+        )
+        self.creator_fast_mode_lookahead_spinbox.valueChanged.connect(
+            lambda value: self.update_temp_setting("creator_fast_mode_lookahead", value)
+        )
+        creator_custom_layout.addWidget(self.creator_fast_mode_lookahead_spinbox, 5, 1)
+
+        self.creator_stream_prep_label = QLabel()
+        creator_custom_layout.addWidget(self.creator_stream_prep_label, 6, 0)
+        self.creator_stream_prep_checkbox = QCheckBox()
+        self.creator_stream_prep_checkbox.setChecked(
+            self.temp_settings.get("creator_stream_prep", True)
+        )
+        self.creator_stream_prep_checkbox.setStyleSheet(
+            "QCheckBox::indicator { width: 16px; height: 16px; }"
+            "QCheckBox::indicator:unchecked { background: #2A3B5A; border: 1px solid #4A5B7A; }"
+            "QCheckBox::indicator:checked { background: #4A6B9A; border: 1px solid #5A7BA9; }"
+        )
+        self.creator_stream_prep_checkbox.stateChanged.connect(
+            lambda state: self.update_temp_setting(
+                "creator_stream_prep", state == Qt.CheckState.Checked.value
+            )
+        )
+        creator_custom_layout.addWidget(self.creator_stream_prep_checkbox, 6, 1)
+
         self.creator_custom_group.setLayout(creator_custom_layout)
         layout.addWidget(self.creator_custom_group)
 
@@ -742,6 +1222,23 @@ class SettingsTab(QWidget):
         # Initialize Tor button states
         self.update_tor_button_states()
 
+    def update_download_engine_combo(self):
+        """(Re)populate the download engine combo with translated labels."""
+        current_engine = self.temp_settings.get("download_engine", "requests")
+        self.download_engine_combo.blockSignals(True)
+        self.download_engine_combo.clear()
+        self.download_engine_combo.addItem(
+            translate("download_engine_requests"), "requests"
+        )
+        self.download_engine_combo.addItem(
+            translate("download_engine_aiohttp"), "aiohttp"
+        )
+        for i in range(self.download_engine_combo.count()):
+            if self.download_engine_combo.itemData(i) == current_engine:
+                self.download_engine_combo.setCurrentIndex(i)
+                break
+        self.download_engine_combo.blockSignals(False)
+
     def update_language_combo(self):
         self.language_combo.blockSignals(True)
         current_language = self.temp_settings["language"]
@@ -1226,6 +1723,31 @@ class SettingsTab(QWidget):
         self.directory_input.setText(self.temp_settings["base_directory"])
         self.download_slider.setValue(self.temp_settings["simultaneous_downloads"])
         self.download_spinbox.setValue(self.temp_settings["simultaneous_downloads"])
+        self.update_download_engine_combo()
+        self.segmented_threshold_spinbox.setValue(
+            self.temp_settings.get("segmented_download_threshold_mb", 100)
+        )
+        self.segmented_segments_spinbox.setValue(
+            self.temp_settings.get("segmented_download_segments", 4)
+        )
+        self.adaptive_concurrency_checkbox.setChecked(
+            self.temp_settings.get("adaptive_concurrency", False)
+        )
+        self.adaptive_min_concurrency_spinbox.setValue(
+            self.temp_settings.get("adaptive_min_concurrency", 2)
+        )
+        self.adaptive_max_concurrency_spinbox.setValue(
+            self.temp_settings.get("adaptive_max_concurrency", 20)
+        )
+        self.per_creator_download_limit_spinbox.setValue(
+            self.temp_settings.get("per_creator_download_limit", 0)
+        )
+        self.connection_setup_width_spinbox.setValue(
+            self.temp_settings.get("connection_setup_width", 0)
+        )
+        self.deep_verify_checkbox.setChecked(
+            self.temp_settings.get("deep_verify_enabled", False)
+        )
         self.auto_update_checkbox.setChecked(self.temp_settings["auto_check_updates"])
         self.creator_posts_max_attempts_spinbox.setValue(
             self.temp_settings["creator_posts_max_attempts"]
@@ -1239,6 +1761,33 @@ class SettingsTab(QWidget):
         self.api_request_max_retries_spinbox.setValue(
             self.temp_settings["api_request_max_retries"]
         )
+        self.api_cache_enabled_checkbox.setChecked(
+            self.temp_settings.get("api_cache_enabled", True)
+        )
+        self.api_cache_ttl_spinbox.setValue(
+            self.temp_settings.get("api_cache_ttl_hours", 24)
+        )
+        self.api_cache_max_mb_spinbox.setValue(
+            self.temp_settings.get("api_cache_max_mb", 256)
+        )
+        self.api_cache_offline_checkbox.setChecked(
+            self.temp_settings.get("api_cache_offline", False)
+        )
+        self.creator_listing_prep_checkbox.setChecked(
+            self.temp_settings.get("creator_listing_prep", True)
+        )
+        self.creator_incremental_sync_checkbox.setChecked(
+            self.temp_settings.get("creator_incremental_sync", False)
+        )
+        self.creator_skip_completed_checkbox.setChecked(
+            self.temp_settings.get("creator_skip_completed", False)
+        )
+        self.creator_fast_mode_lookahead_spinbox.setValue(
+            self.temp_settings.get("creator_fast_mode_lookahead", 1)
+        )
+        self.creator_stream_prep_checkbox.setChecked(
+            self.temp_settings.get("creator_stream_prep", True)
+        )
 
         # Update proxy settings
         self.use_proxy_checkbox.blockSignals(True)
@@ -1280,6 +1829,24 @@ class SettingsTab(QWidget):
 
         self.download_group.setTitle(translate("download_settings"))
         self.simultaneous_downloads_label.setText(translate("simultaneous_downloads"))
+        self.download_engine_label.setText(translate("download_engine"))
+        self.update_download_engine_combo()
+        self.segmented_threshold_label.setText(
+            translate("segmented_download_threshold")
+        )
+        self.segmented_segments_label.setText(translate("segmented_download_segments"))
+        self.adaptive_concurrency_label.setText(translate("adaptive_concurrency"))
+        self.adaptive_min_concurrency_label.setText(
+            translate("adaptive_min_concurrency")
+        )
+        self.adaptive_max_concurrency_label.setText(
+            translate("adaptive_max_concurrency")
+        )
+        self.per_creator_download_limit_label.setText(
+            translate("per_creator_download_limit")
+        )
+        self.connection_setup_width_label.setText(translate("connection_setup_width"))
+        self.deep_verify_label.setText(translate("deep_verify_enabled"))
 
         self.retry_group.setTitle(translate("retry_settings"))
         self.creator_posts_max_attempts_label.setText(
@@ -1291,12 +1858,27 @@ class SettingsTab(QWidget):
         )
         self.api_request_max_retries_label.setText(translate("api_request_max_retries"))
 
+        self.api_cache_group.setTitle(translate("api_cache_settings"))
+        self.api_cache_enabled_label.setText(translate("api_cache_enabled"))
+        self.api_cache_ttl_label.setText(translate("api_cache_ttl_hours"))
+        self.api_cache_max_mb_label.setText(translate("api_cache_max_mb"))
+        self.api_cache_offline_label.setText(translate("api_cache_offline"))
+
         self.update_group.setTitle(translate("update_settings"))
 
         # Creator downloader customization texts
         self.creator_custom_group.setTitle(translate("creator_downloader_settings"))
         self.creator_custom_label.setText(translate("filename_template"))
         self.creator_folder_strategy_label.setText(translate("folder_strategy"))
+        self.creator_listing_prep_label.setText(translate("creator_listing_prep"))
+        self.creator_incremental_sync_label.setText(
+            translate("creator_incremental_sync")
+        )
+        self.creator_skip_completed_label.setText(translate("creator_skip_completed"))
+        self.creator_fast_mode_lookahead_label.setText(
+            translate("creator_fast_mode_lookahead")
+        )
+        self.creator_stream_prep_label.setText(translate("creator_stream_prep"))
 
         # Update template presets display (support language change)
         try:
@@ -1400,6 +1982,33 @@ class SettingsTab(QWidget):
     def get_simultaneous_downloads(self):
         return self.settings["simultaneous_downloads"]
 
+    def get_download_engine(self):
+        return self.settings.get("download_engine", "requests")
+
+    def get_segmented_download_threshold_mb(self):
+        return self.settings.get("segmented_download_threshold_mb", 100)
+
+    def get_segmented_download_segments(self):
+        return self.settings.get("segmented_download_segments", 4)
+
+    def is_adaptive_concurrency_enabled(self):
+        return self.settings.get("adaptive_concurrency", False)
+
+    def get_adaptive_min_concurrency(self):
+        return self.settings.get("adaptive_min_concurrency", 2)
+
+    def get_adaptive_max_concurrency(self):
+        return self.settings.get("adaptive_max_concurrency", 20)
+
+    def get_per_creator_download_limit(self):
+        return self.settings.get("per_creator_download_limit", 0)
+
+    def get_connection_setup_width(self):
+        return self.settings.get("connection_setup_width", 0)
+
+    def is_deep_verify_enabled(self):
+        return self.settings.get("deep_verify_enabled", False)
+
     def is_auto_check_updates_enabled(self):
         return self.settings["auto_check_updates"]
 
@@ -1415,12 +2024,39 @@ class SettingsTab(QWidget):
     def get_api_request_max_retries(self):
         return self.settings["api_request_max_retries"]
 
+    def is_api_cache_enabled(self):
+        return self.settings.get("api_cache_enabled", True)
+
+    def get_api_cache_ttl_hours(self):
+        return self.settings.get("api_cache_ttl_hours", 24)
+
+    def get_api_cache_max_mb(self):
+        return self.settings.get("api_cache_max_mb", 256)
+
+    def is_api_cache_offline(self):
+        return self.settings.get("api_cache_offline", False)
+
     def get_creator_filename_template(self):
         return self.settings.get("creator_filename_template", "{post_id}_{orig_name}")
 
     def get_creator_folder_strategy(self):
         return self.settings.get("creator_folder_strategy", "per_post")
 
+    def is_creator_listing_prep_enabled(self):
+        return self.settings.get("creator_listing_prep", True)
+
+    def is_creator_incremental_sync_enabled(self):
+        return self.settings.get("creator_incremental_sync", False)
+
+    def is_creator_skip_completed_enabled(self):
+        return self.settings.get("creator_skip_completed", False)
+
+    def get_creator_fast_mode_lookahead(self):
+        return self.settings.get("creator_fast_mode_lookahead", 1)
+
+    def is_creator_stream_prep_enabled(self):
+        return self.settings.get("creator_stream_prep", True)
+
     def get_font(self):
         return self.settings.get("font", "JetBrains Mono")
 
@@ -4,6 +4,7 @@ import concurrent.futures
 import hashlib
 import os
 import re
+import threading
 import time
 import urllib.parse
 from typing import Dict, List, Optional, Tuple
@@ -31,10 +32,22 @@ from PyQt6.QtWidgets import (
     QWidget,
 )
 
-from kemonodownloader.creator_downloader import get_session
+from kemonodownloader.concurrency import is_throttled_error
+from kemonodownloader.creator_downloader import (
+    create_concurrency_controller,
+    get_session,
+)
 from kemonodownloader.domain_config import get_domain_config
+from kemonodownloader.endpoint_cache import (
+    FORM_LEGACY,
+    FORM_POSTS,
+    build_page_url,
+    get_endpoint_cache,
+)
 from kemonodownloader.kd_language import translate
 from kemonodownloader.post_downloader import MediaPreviewModal
+from kemonodownloader.progress import ProgressAggregator
+from kemonodownloader.rate_limiter import cancellable
 
 SUPPORTED_THUMBNAIL_EXTS = (".jpg", ".jpeg", ".png", ".gif", ".webp")
 
@@ -130,6 +143,9 @@ class ThumbnailDetectionThread(QThread):
     log_message = pyqtSignal(str)
     error_occurred = pyqtSignal(str)
 
+    # Listing forms probed for creator URLs, in order of preference.
+    CREATOR_ENDPOINT_FORMS = (FORM_POSTS, FORM_LEGACY)
+
     def __init__(self, urls: List[str], mode: str, settings_tab=None):
         super().__init__()
         self.urls = urls
@@ -147,6 +163,8 @@ class ThumbnailDetectionThread(QThread):
         session = get_session(self.settings_tab)
         from kemonodownloader.post_downloader import get_headers
 
+        endpoint_cache = get_endpoint_cache()
+
         for url in self.urls:
             if self.is_cancelled:
                 break
@@ -223,34 +241,40 @@ class ThumbnailDetectionThread(QThread):
                 )
                 offset = 0
 
-                endpoints = [
-                    f"https://{domain}/api/v1/{service}/user/{user_id}/posts",
-                    f"https://{domain}/api/v1/{service}/user/{user_id}",
-                ]
-
-                working_endpoint = endpoints[0]
-                for ep in endpoints:
-                    try:
-                        test_res = session.get(
-                            f"{ep}?o=0", headers=req_headers, timeout=10
-                        )
-                        if test_res.status_code == 200:
-                            test_json = test_res.json()
-                            if isinstance(test_json, list):
-                                working_endpoint = ep
-                                break
-                    except Exception:
-                        pass
+                # Skip the probe when an earlier detection (of any creator on
+                # this domain/service) already found the working form; probe
+                # again only if that form stops answering.
+                working_form = endpoint_cache.get(domain, service)
+                probed = working_form not in self.CREATOR_ENDPOINT_FORMS
+                if probed:
+                    working_form = self._probe_creator_endpoint(
+                        session, domain_cfg, domain, service, user_id, req_headers
+                    )
 
                 while not self.is_cancelled:
-                    api_url = f"{working_endpoint}?o={offset}"
+                    api_url = build_page_url(
+                        working_form, domain_cfg, service, user_id, offset
+                    )
                     try:
                         res = session.get(api_url, headers=req_headers, timeout=15)
+                        if res.status_code != 200 and offset == 0 and not probed:
+                            probed = True
+                            endpoint_cache.forget(domain, service)
+                            working_form = self._probe_creator_endpoint(
+                                session,
+                                domain_cfg,
+                                domain,
+                                service,
+                                user_id,
+                                req_headers,
+                            )
+                            continue
                         if res.status_code != 200:
                             break
                         posts = res.json()
                         if not isinstance(posts, list) or not posts:
                             break
+                        endpoint_cache.remember(domain, service, working_form)
 
                         batch_items = []
                         for post in posts:
@@ -280,6 +304,32 @@ class ThumbnailDetectionThread(QThread):
 
         self.detection_finished.emit(all_detected)
 
+    def _probe_creator_endpoint(
+        self,
+        session,
+        domain_cfg: dict,
+        domain: str,
+        service: str,
+        user_id: str,
+        req_headers: dict,
+    ) -> str:
+        """Return the first creator listing form that answers with a list."""
+        for form in self.CREATOR_ENDPOINT_FORMS:
+            try:
+                test_res = session.get(
+                    build_page_url(form, domain_cfg, service, user_id, 0),
+                    headers=req_headers,
+                    timeout=10,
+                )
+                if test_res.status_code == 200:
+                    test_json = test_res.json()
+                    if isinstance(test_json, list):
+                        get_endpoint_cache().remember(domain, service, form)
+                        return form
+            except Exception:
+                pass
+        return self.CREATOR_ENDPOINT_FORMS[0]
+
     def _fetch_creator_name(
         self, session, domain: str, service: str, user_id: str, req_headers: dict
     ) -> str:
@@ -364,6 +414,16 @@ class ThumbnailDownloadThread(QThread):
         self.simultaneous_downloads = max(1, simultaneous_downloads)
         self.skip_existing = skip_existing
         self.settings_tab = settings_tab
+        self.concurrency = create_concurrency_controller(
+            settings_tab,
+            self.simultaneous_downloads,
+            on_change=lambda limit: self.log_message.emit(
+                translate("effective_concurrency_changed", limit)
+            ),
+        )
+        # Chunks are reported to the aggregator, which publishes the bytes
+        # of the thumbnails in flight at most every 100 ms.
+        self.progress = ProgressAggregator(self._publish_progress)
         self.folder_strategy = folder_strategy
         self.auto_rename = auto_rename
         self.download_text = download_text
@@ -379,6 +439,10 @@ class ThumbnailDownloadThread(QThread):
     def cancel(self):
         self.is_cancelled = True
 
+    def _publish_progress(self, snapshot):
+        if snapshot.bytes_total > 0:
+            self.file_progress_updated.emit(snapshot.bytes_done, snapshot.bytes_total)
+
     def _get_save_path(
         self,
         title: str,
@@ -666,7 +730,12 @@ class ThumbnailDownloadThread(QThread):
             }
 
             try:
-                res = session.get(thumb_url, headers=headers, timeout=20, stream=True)
+                started = time.monotonic()
+                with cancellable(lambda: not self.is_cancelled):
+                    res = session.get(
+                        thumb_url, headers=headers, timeout=20, stream=True
+                    )
+                ttfb = time.monotonic() - started
                 res.raise_for_status()
 
                 total_bytes = int(res.headers.get("content-length", 0))
@@ -686,8 +755,8 @@ class ThumbnailDownloadThread(QThread):
                             hasher.update(chunk)
                             downloaded_bytes += len(chunk)
                             if total_bytes > 0:
-                                self.file_progress_updated.emit(
-                                    downloaded_bytes, total_bytes
+                                self.progress.update(
+                                    filepath, downloaded_bytes, total_bytes
                                 )
 
                 if os.path.exists(filepath):
@@ -700,19 +769,44 @@ class ThumbnailDownloadThread(QThread):
                     except Exception:
                         pass
 
+                self.concurrency.record_success(downloaded_bytes, ttfb)
                 self.log_message.emit(f"Downloaded: {out_filename}")
                 self.file_completed.emit(title, filepath)
                 return True
 
             except Exception as e:
+                self.concurrency.record_failure(throttled=is_throttled_error(e))
                 self.log_message.emit(f"Failed download ({thumb_url}): {str(e)}")
                 return False
+            finally:
+                self.progress.finish(filepath)
+
+        # The pool is sized for the controller's upper bound; each task
+        # waits for one of the currently allowed slots (Lock polling, as in
+        # the other download threads) so an adaptive limit applies mid-run.
+        slot_lock = threading.Lock()
+        active_slots = [0]
+
+        def download_in_slot(sub_item) -> bool:
+            while True:
+                with slot_lock:
+                    if active_slots[0] < self.concurrency.limit:
+                        active_slots[0] += 1
+                        break
+                if self.is_cancelled:
+                    return False
+                time.sleep(0.05)
+            try:
+                return download_single(sub_item)
+            finally:
+                with slot_lock:
+                    active_slots[0] -= 1
 
         with concurrent.futures.ThreadPoolExecutor(
-            max_workers=self.simultaneous_downloads
+            max_workers=self.concurrency.max_limit
         ) as executor:
             futures = [
-                executor.submit(download_single, item) for item in flattened_items
+                executor.submit(download_in_slot, item) for item in flattened_items
             ]
             for future in concurrent.futures.as_completed(futures):
                 if self.is_cancelled:
@@ -0,0 +1,147 @@
+"""
+post_completion.py
+==================
+Skips posts whose files were all downloaded in an earlier run.
+
+``FilePreparationThread`` used to fetch the JSON of every selected post,
+and ``CreatorDownloadThread`` then looked up every file in ``HashDB``, even
+for posts that an earlier run had finished completely.  Re-running fast
+mode over a long creator list cost tens of thousands of requests to
+conclude that nothing was new.
+
+When every file of a post has been downloaded (or confirmed on disk), the
+download thread now records the post in ``HashDB``'s ``post_completion``
+table, together with its file set and the file selection (extensions and
+categories) it was chosen with.  Preparation loads each creator's records
+in one query and drops a post before any network call when it was
+completed with the same selection and all of its files still pass the
+``stat`` check of ``hash_db.stat_matches``.  A post whose files went
+missing loses its record and is prepared as usual, and so is a post whose
+listing record says it was edited after it was completed.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import sqlite3
+from datetime import datetime, timezone
+from typing import Dict, Iterable, Optional, Set, Tuple
+from urllib.parse import urlparse
+
+from kemonodownloader.hash_db import stat_matches
+
+# ---------------------------------------------------------------------------
+# Keys
+# ---------------------------------------------------------------------------
+
+
+def selection_key(
+    allowed_extensions: Iterable[str], main: bool, attachments: bool, content: bool
+) -> str:
+    """Return a stable key for the file filters a post's files were chosen by."""
+    return json.dumps(
+        [sorted(ext.lower() for ext in allowed_extensions), main, attachments, content]
+    )
+
+
+def creator_key(creator_url: str) -> Optional[Tuple[str, str]]:
+    """Return ``(service, creator_id)`` of a ``.../{service}/user/{id}`` URL."""
+    parts = urlparse(creator_url).path.strip("/").split("/")
+    if len(parts) < 3 or parts[-2] != "user":
+        return None
+    return parts[-3], parts[-1]
+
+
+# ---------------------------------------------------------------------------
+# Records
+# ---------------------------------------------------------------------------
+
+
+def files_on_disk(hash_db, file_urls: Iterable[str]) -> bool:
+    """Return True when every URL has an entry whose file is unchanged."""
+    url_hashes = [hashlib.md5(url.encode()).hexdigest() for url in file_urls]
+    entries = hash_db.lookup_many(url_hashes)
+    for url_hash in url_hashes:
+        entry = entries.get(url_hash)
+        if entry is None:
+            return False
+        try:
+            st = os.stat(entry["file_path"])
+        except OSError:
+            return False
+        if not stat_matches(entry, st):
+            return False
+    return True
+
+
+def edited_after(post: Optional[dict], completed_at: float) -> bool:
+    """Return True when a listing record was edited after *completed_at*.
+
+    The API reports naive ISO timestamps in UTC.  Records without a
+    readable ``edited`` field are never considered edited.
+    """
+    if not isinstance(post, dict) or not post.get("edited"):
+        return False
+    try:
+        edited = datetime.fromisoformat(str(post["edited"]))
+    except ValueError:
+        return False
+    if edited.tzinfo is None:
+        edited = edited.replace(tzinfo=timezone.utc)
+    return edited.timestamp() > (completed_at or 0)
+
+
+def completed_post_ids(
+    hash_db,
+    service: str,
+    creator_id: str,
+    selection: str,
+    listing_records: Optional[Dict[str, dict]] = None,
+) -> Set[str]:
+    """Return the ids of a creator's posts that need no preparation.
+
+    Only local work: one query for the creator's records, one bulk lookup
+    and a ``stat`` per file.  Records whose files changed are dropped.
+    *listing_records* (post id to listing record), when known, excludes
+    posts edited since they were completed.
+    """
+    completed_posts = getattr(hash_db, "completed_posts", None)
+    if completed_posts is None:
+        return set()
+    try:
+        records = completed_posts(service, creator_id)
+    except sqlite3.Error:
+        return set()
+    if not isinstance(records, dict):
+        return set()
+    done = set()
+    for post_id, record in records.items():
+        if not record["verified"] or record["selection"] != selection:
+            continue
+        if edited_after((listing_records or {}).get(post_id), record["completed_at"]):
+            continue
+        if files_on_disk(hash_db, record["file_urls"]):
+            done.add(post_id)
+        else:
+            hash_db.clear_post_completion(service, creator_id, post_id)
+    return done
+
+
+def record_post_complete(
+    hash_db,
+    service: str,
+    creator_id: str,
+    post_id: str,
+    file_urls: Iterable[str],
+    selection: str,
+) -> None:
+    """Record a finished post, if *hash_db* keeps completion records."""
+    mark_post_complete = getattr(hash_db, "mark_post_complete", None)
+    if mark_post_complete is None:
+        return
+    try:
+        mark_post_complete(service, creator_id, post_id, list(file_urls), selection)
+    except sqlite3.Error:
+        pass
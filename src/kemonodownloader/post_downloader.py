@@ -5,7 +5,6 @@ import importlib as _importlib
 import json
 import locale
 import os
-import re
 import threading
 import time
 from typing import Optional
@@ -42,13 +41,39 @@ from PyQt6.QtWidgets import (
     QWidget,
 )
 
-from kemonodownloader.creator_downloader import get_session
+from kemonodownloader.concurrency import is_throttled_error
+from kemonodownloader.connection_gate import get_connection_gate
+from kemonodownloader.creator_downloader import (
+    configure_download_scheduler,
+    create_concurrency_controller,
+    get_session,
+)
+from kemonodownloader.dedupe import find_local_copy, link_or_copy
+from kemonodownloader.deep_verify import get_deep_verifier
 from kemonodownloader.domain_config import (
     clean_file_url,
     get_domain_config,
     get_domains,
 )
-from kemonodownloader.hash_db import HashDB
+from kemonodownloader.download_core import (
+    DEFAULT_EXTENSIONS,
+    detect_post_files,
+    sanitize_filename,
+)
+from kemonodownloader.download_scheduler import get_download_scheduler
+from kemonodownloader.hash_db import HashDB, file_unchanged
+from kemonodownloader.prep_pool import PrepPool
+from kemonodownloader.progress import ProgressAggregator, format_bytes, format_duration
+from kemonodownloader.rate_limiter import cancellable
+from kemonodownloader.resumable import (
+    IncompleteDownloadError,
+    StreamHasher,
+    existing_offset,
+    finalize_part,
+    part_path_for,
+    plan_resume,
+    range_headers,
+)
 
 # Resolve translations dynamically at call time so tests can monkeypatch
 # the runtime translation function in `kemonodownloader.kd_language`.
@@ -837,68 +862,10 @@ class PostDetectionThread(QThread):
             return None
 
     def detect_files(self, post):
-        detected_files = []
-        allowed_extensions = [
-            ".jpg",
-            ".jpeg",
-            ".png",
-            ".gif",
-            ".zip",
-            ".mp4",
-            ".pdf",
-            ".7z",
-            ".mp3",
-            ".wav",
-            ".flac",
-            ".var",
-            ".rar",
-            ".mov",
-            ".docx",
-            ".psd",
-            ".clip",
-            ".jpe",
-            ".webp",
-        ]
-
-        def get_effective_extension(file_path, file_name):
-            name_ext = os.path.splitext(file_name)[1].lower()
-            path_ext = os.path.splitext(file_path)[1].lower()
-            return name_ext if name_ext else path_ext
-
-        if "file" in post and post["file"] and "path" in post["file"]:
-            file_path = post["file"]["path"]
-            file_name = post["file"].get("name", "")
-            file_ext = get_effective_extension(file_path, file_name)
-            file_url = clean_file_url(file_path, self.domain_config)
-            if "f=" not in file_url and file_name:
-                file_url += f"?f={file_name}"
-            if file_ext in allowed_extensions:
-                detected_files.append((file_name, file_url))
-
-        if "attachments" in post:
-            for attachment in post["attachments"]:
-                if isinstance(attachment, dict) and "path" in attachment:
-                    attachment_path = attachment["path"]
-                    attachment_name = attachment.get("name", "")
-                    attachment_ext = get_effective_extension(
-                        attachment_path, attachment_name
-                    )
-                    attachment_url = clean_file_url(attachment_path, self.domain_config)
-                    if "f=" not in attachment_url and attachment_name:
-                        attachment_url += f"?f={attachment_name}"
-                    if attachment_ext in allowed_extensions:
-                        detected_files.append((attachment_name, attachment_url))
-
-        if "content" in post and post["content"]:
-            soup = BeautifulSoup(post["content"], "html.parser")
-            for img in soup.select("img[src]"):
-                img_url = clean_file_url(img["src"], self.domain_config)
-                img_ext = os.path.splitext(img_url)[1].lower()
-                img_name = os.path.basename(img_url)
-                if img_ext in allowed_extensions:
-                    detected_files.append((img_name, img_url))
-
-        return list(dict.fromkeys(detected_files))
+        # The post tab offers every file type, so JPEG is listed on its own.
+        return detect_post_files(
+            post, DEFAULT_EXTENSIONS + (".jpeg",), self.domain_config
+        )
 
 
 class FilePreparationThread(QThread):
@@ -924,12 +891,19 @@ class FilePreparationThread(QThread):
         self.file_url_map = file_url_map
         self.settings = settings
         self.max_concurrent = max_concurrent
+        self.concurrency = create_concurrency_controller(
+            getattr(settings, "settings_tab", None), max_concurrent
+        )
         self.is_running = True
         self.url = url
         self.domain_config = get_domain_config(url)
+        self._prep_pool = None
 
     def stop(self):
         self.is_running = False
+        pool = getattr(self, "_prep_pool", None)
+        if pool is not None:
+            pool.stop()
         self.log.emit(
             translate("log_info", "FilePreparationThread cancellation initiated"),
             "INFO",
@@ -1199,81 +1173,45 @@ class FilePreparationThread(QThread):
         completed_posts = 0
 
         # Build list of post_ids to process
+        wanted = set(self.post_ids)
         post_id_list = [
             post_id
             for post_url, posts in self.all_files_map.items()
             for _, post_id in posts
-            if post_id in self.post_ids
+            if post_id in wanted
         ]
 
-        # Use pure Lock + polling instead of Semaphore/Event to avoid
-        # Condition.notify() access violations on Python 3.14 + Windows.
-        slot_lock = threading.Lock()
-        active_slots = [0]
-        results_lock = threading.Lock()
-        workers = []
-
-        def _worker(pid):
-            """Fetch post data in a daemon thread."""
+        def _prepared(pid, result):
+            nonlocal completed_posts
+            if result:
+                pid_result, detected_files = result
+                for file_name, file_url in detected_files:
+                    try:
+                        self.log.emit(
+                            translate(
+                                "log_debug",
+                                f"Detected file: {file_name} from {file_url}",
+                            ),
+                            "INFO",
+                        )
+                    except RuntimeError:
+                        pass
+                    files_to_download.append(file_url)
+                    files_to_posts_map[file_url] = pid_result
+            completed_posts += 1
+            progress = min(int((completed_posts / total_posts) * 100), 100)
             try:
-                if not self.is_running:
-                    return
-                result = self.fetch_post_data(pid)
-                if result and self.is_running:
-                    pid_result, detected_files = result
-                    with results_lock:
-                        for file_name, file_url in detected_files:
-                            try:
-                                self.log.emit(
-                                    translate(
-                                        "log_debug",
-                                        f"Detected file: {file_name} from {file_url}",
-                                    ),
-                                    "INFO",
-                                )
-                            except RuntimeError:
-                                pass
-                            files_to_download.append(file_url)
-                            files_to_posts_map[file_url] = pid_result
-            except Exception:
-                pass  # fetch_post_data handles its own logging
-            finally:
-                with slot_lock:
-                    active_slots[0] -= 1
-                    nonlocal completed_posts
-                    completed_posts += 1
-                progress = min(int((completed_posts / total_posts) * 100), 100)
-                try:
-                    self.progress.emit(progress)
-                except RuntimeError:
-                    pass
-
-        for pid in post_id_list:
-            if not self.is_running:
-                break
-            # Wait for a concurrency slot using pure Lock polling
-            while True:
-                with slot_lock:
-                    if active_slots[0] < self.max_concurrent:
-                        active_slots[0] += 1
-                        break
-                if not self.is_running:
-                    break
-                time.sleep(0.05)
-            if not self.is_running:
-                break
-            t = threading.Thread(target=_worker, args=(pid,), daemon=True)
-            t.start()
-            workers.append(t)
-
-        # Wait for all workers so none outlive the QThread C++ object.
-        # Thread.join() internally uses Event.wait() which triggers
-        # Condition.notify() access violations on Python 3.14 + Windows,
-        # so poll is_alive() instead.
-        _deadline = time.monotonic() + 30
-        for w in workers:
-            while w.is_alive() and time.monotonic() < _deadline:
-                time.sleep(0.05)
+                self.progress.emit(progress)
+            except RuntimeError:
+                pass
+
+        # fetch_post_data runs on a bounded pool; results arrive one at a
+        # time on this thread (see prep_pool).
+        self._prep_pool = PrepPool(
+            self.concurrency, self.fetch_post_data, _prepared, lambda: self.is_running
+        )
+        self._prep_pool.run(post_id_list)
+        self._prep_pool = None
 
         if self.is_running:
             files_to_download = list(dict.fromkeys(files_to_download))
@@ -1293,35 +1231,15 @@ class FilePreparationThread(QThread):
             )
 
 
-def sanitize_filename(name, max_length=100):
-    """Sanitize a filename by removing invalid characters, trailing dots, and limiting length."""
-    if not name:
-        return "unnamed"
-    # Remove invalid characters
-    sanitized = re.sub(r'[<>:"/\\|?*]', "_", name)
-    # Replace spaces with underscores
-    sanitized = sanitized.replace(" ", "_")
-    # Remove multiple consecutive underscores
-    sanitized = re.sub(r"_+", "_", sanitized)
-    # Remove trailing dots (Windows compatibility)
-    sanitized = sanitized.rstrip(".")
-    # Remove leading dots to avoid hidden/unsafe filenames
-    sanitized = sanitized.lstrip(".")
-    # Trim leading/trailing underscores
-    sanitized = sanitized.strip("_")
-    # Limit length
-    if len(sanitized) > max_length:
-        sanitized = sanitized[:max_length].rstrip(".").strip("_")
-    # Ensure non-empty
-    return sanitized if sanitized else "unnamed"
-
-
 class DownloadThread(QThread):
     file_progress = pyqtSignal(int, int)
     file_completed = pyqtSignal(int, str, bool)
     post_completed = pyqtSignal(str)
     log = pyqtSignal(str, str)
     finished = pyqtSignal()
+    concurrency_changed = pyqtSignal(int)  # effective number of download slots
+    # ProgressSnapshot of all transfers in flight, at most every 100 ms.
+    transfer_progress = pyqtSignal(object)
 
     def __init__(
         self,
@@ -1347,10 +1265,19 @@ class DownloadThread(QThread):
         self.console = console
         self.is_running = True
         self.other_files_dir = other_files_dir
-        self.hash_db = HashDB(self.other_files_dir)
+        self.hash_db = HashDB(self.other_files_dir, base_dir=download_folder or None)
         self.max_concurrent = max_concurrent
+        self.concurrency = create_concurrency_controller(
+            getattr(settings, "settings_tab", None),
+            max_concurrent,
+            on_change=self._on_concurrency_changed,
+        )
+        # Chunks are reported to the aggregator, which publishes one
+        # coalesced snapshot per interval instead of a signal per chunk.
+        self.progress = ProgressAggregator(self._publish_progress)
         self.post_id = post_id
         self.service = self.extract_service_from_url(url)
+        self.creator_id = ""  # Set by fetch_post_info
         self.post_files_map = self.build_post_files_map()
         self.completed_files = set()
         self.post_title = None  # Store post title
@@ -1359,12 +1286,14 @@ class DownloadThread(QThread):
         self.post_content = ""
         # Lock for thread-safe access to shared data
         self.completed_files_lock = threading.Lock()
-        # Lock to serialize SSL connection establishment across workers.
-        # On Windows + Python 3.14, concurrent SSL handshakes / reads in
-        # OpenSSL trigger native access-violation crashes.  Serialising
-        # only the session.get() call (which does SSL + redirects) while
-        # allowing concurrent body streaming avoids the problem.
-        self._ssl_lock = threading.Lock()
+        # Connection setup (session.get(): TLS handshake, redirects and
+        # headers) holds a slot of the process-wide gate: serialised on
+        # Windows, where concurrent OpenSSL handshakes crash Python 3.14,
+        # and limited per host elsewhere.  Bodies stream concurrently.
+        self.connection_gate = get_connection_gate()
+        # Downloads also hold a slot of the process-wide scheduler, shared
+        # with the creator downloader.
+        self.scheduler = get_download_scheduler()
         # Flag set when the C++ QThread wrapper is about to be destroyed.
         # Workers check this before emitting signals to avoid accessing
         # a deleted C++ object.
@@ -1373,13 +1302,26 @@ class DownloadThread(QThread):
     def fetch_post_info(self):
         """Fetch post title."""
         self.url = self.url.rstrip("/")
-        parts = self.url.split("/")
-        if len(parts) < 7 or self.domain_config["domain"] not in self.url:
+        info = self.request_post_info(self.url)
+        if info is None:
+            return
+        self.creator_id, self.post_title, content = info
+        if content is not None:
+            self.post_content = content
+
+    def request_post_info(self, url):
+        """Return ``(creator_id, title, content)`` of a post URL.
+
+        Returns None for a malformed URL.  When the API request fails the
+        title falls back to ``Post_<id>`` and the content is None.
+        """
+        parts = url.split("/")
+        if len(parts) < 7 or self.domain_config["domain"] not in url:
             self.log.emit(
                 translate("log_error", "Invalid URL format for fetching post info"),
                 "ERROR",
             )
-            return
+            return None
         service, creator_id, post_id = parts[-5], parts[-3], parts[-1]
         api_url = f"{self.domain_config['api_base']}/{service}/user/{creator_id}/post/{post_id}"
         try:
@@ -1391,22 +1333,18 @@ class DownloadThread(QThread):
                     if isinstance(post_data, dict) and "post" not in post_data
                     else post_data.get("post", {})
                 )
-                self.post_title = sanitize_filename(
-                    post.get("title", f"Post_{post_id}")
-                )
-                self.post_content = post.get("content", "")
-            else:
-                self.log.emit(
-                    translate("log_error", translate("failed_fetch_post_title")),
-                    "ERROR",
-                )
-                self.post_title = f"Post_{post_id}"
+                title = sanitize_filename(post.get("title", f"Post_{post_id}"))
+                return creator_id, title, post.get("content", "")
+            self.log.emit(
+                translate("log_error", translate("failed_fetch_post_title")),
+                "ERROR",
+            )
         except Exception as e:
             self.log.emit(
                 translate("log_error", translate("error_fetching_post_info", str(e))),
                 "ERROR",
             )
-            self.post_title = f"Post_{post_id}"
+        return creator_id, f"Post_{post_id}", None
 
     def make_robust_request(self, url, max_retries=None):
         if max_retries is None:
@@ -1461,13 +1399,45 @@ class DownloadThread(QThread):
                 post_files_map[post_id].append(file_url)
         return post_files_map
 
+    def post_context(self, post_id):
+        """Return ``(service, creator_id, title)`` of the post *post_id*."""
+        return self.service, getattr(self, "creator_id", ""), self.post_title
+
+    def file_number(self, file_url, file_index):
+        """Return the 1-based number auto-rename gives *file_url*."""
+        return file_index + 1
+
+    def scheduler_owner(self, file_url):
+        """Return the download scheduler owner of *file_url*."""
+        return f"{self.service}/{self.creator_id or self.post_id}"
+
     def stop(self):
         self.is_running = False
         self._destroyed = True
+        self.hash_db.try_flush()
         self.log.emit(
             translate("log_info", "DownloadThread cancellation initiated"), "INFO"
         )
 
+    def _on_concurrency_changed(self, limit):
+        if self._destroyed:
+            return
+        try:
+            self.concurrency_changed.emit(limit)
+        except RuntimeError:
+            pass
+
+    def _publish_progress(self, snapshot):
+        """Hand a coalesced progress snapshot to the GUI thread."""
+        if self._destroyed:
+            return
+        try:
+            for file_index in snapshot.changed:
+                self.file_progress.emit(file_index, snapshot.percent(file_index))
+            self.transfer_progress.emit(snapshot)
+        except RuntimeError:
+            pass
+
     def download_file(self, file_url, folder, file_index, total_files):
         if not self.is_running or file_url not in self.selected_files:
             if not self._destroyed:
@@ -1483,8 +1453,9 @@ class DownloadThread(QThread):
             return
 
         post_id = self.files_to_posts_map.get(file_url, self.post_id)
-        service_folder = os.path.join(folder, self.service)
-        post_folder_name = f"{post_id}_{self.post_title}"
+        service, creator_id, post_title = self.post_context(post_id)
+        service_folder = os.path.join(folder, service)
+        post_folder_name = f"{post_id}_{post_title}"
         post_folder = os.path.join(service_folder, post_folder_name)
         os.makedirs(post_folder, exist_ok=True)
 
@@ -1498,10 +1469,14 @@ class DownloadThread(QThread):
         if hasattr(self, "auto_rename") and self.auto_rename:
             file_extension = os.path.splitext(filename)[1]
             base_name = os.path.splitext(filename)[0]
-            filename = f"{file_index + 1}_{base_name}{file_extension}"
+            number = self.file_number(file_url, file_index)
+            filename = f"{number}_{base_name}{file_extension}"
 
         full_path = os.path.join(post_folder, filename.replace("/", "_"))
         url_hash = hashlib.md5(file_url.encode()).hexdigest()
+        # Stream into a resumable .part file keyed by the URL hash; it is
+        # moved to full_path only once the size has been validated.
+        part_path = part_path_for(post_folder, url_hash)
 
         entry = self.hash_db.lookup(url_hash)
         if entry:
@@ -1530,27 +1505,91 @@ class DownloadThread(QThread):
                         ),
                         "INFO",
                     )
-                else:
-                    with open(existing_path, "rb") as f:
-                        file_hash = hashlib.md5(f.read()).hexdigest()
-                    if file_hash == entry["file_hash"]:
-                        self.log.emit(
-                            translate(
-                                "log_info",
+                elif file_unchanged(self.hash_db, url_hash, entry):
+                    settings_tab = getattr(self.settings, "settings_tab", None)
+                    if (
+                        settings_tab is not None
+                        and settings_tab.is_deep_verify_enabled()
+                    ):
+                        get_deep_verifier().submit(
+                            self.hash_db,
+                            url_hash,
+                            existing_path,
+                            entry["file_hash"],
+                            on_mismatch=lambda path: self.log.emit(
                                 translate(
-                                    "file_already_downloaded",
-                                    filename,
-                                    existing_path,
+                                    "log_warning",
+                                    translate("deep_verify_mismatch", path),
                                 ),
+                                "WARNING",
                             ),
-                            "INFO",
                         )
-                        self.file_progress.emit(file_index, 100)
-                        self.file_completed.emit(file_index, file_url, True)
-                        with self.completed_files_lock:
-                            self.completed_files.add(file_url)
-                        self.check_post_completion(file_url)
-                        return
+                    self.log.emit(
+                        translate(
+                            "log_info",
+                            translate(
+                                "file_already_downloaded",
+                                filename,
+                                existing_path,
+                            ),
+                        ),
+                        "INFO",
+                    )
+                    self.file_progress.emit(file_index, 100)
+                    self.file_completed.emit(file_index, file_url, True)
+                    with self.completed_files_lock:
+                        self.completed_files.add(file_url)
+                    self.check_post_completion(file_url)
+                    return
+
+        # The same content may already be in the library under another name
+        # or post; reuse it instead of fetching it again.
+        local_copy = find_local_copy(self.hash_db, file_url, full_path)
+        if local_copy is not None:
+            try:
+                mode = link_or_copy(local_copy["file_path"], full_path)
+            except OSError as e:
+                self.log.emit(
+                    translate(
+                        "log_warning",
+                        translate(
+                            "content_dedupe_failed",
+                            local_copy["file_path"],
+                            full_path,
+                            str(e),
+                        ),
+                    ),
+                    "WARNING",
+                )
+            else:
+                self.hash_db.store(
+                    url_hash,
+                    full_path,
+                    local_copy["file_hash"],
+                    file_url,
+                    os.path.getsize(full_path),
+                    service=service,
+                    creator_id=creator_id,
+                    post_id=post_id,
+                )
+                self.log.emit(
+                    translate(
+                        "log_info",
+                        translate(
+                            "content_dedupe_reused",
+                            full_path,
+                            local_copy["file_path"],
+                            mode,
+                        ),
+                    ),
+                    "INFO",
+                )
+                self.file_progress.emit(file_index, 100)
+                self.file_completed.emit(file_index, file_url, True)
+                with self.completed_files_lock:
+                    self.completed_files.add(file_url)
+                self.check_post_completion(file_url)
+                return
 
         self.log.emit(
             translate(
@@ -1571,56 +1610,60 @@ class DownloadThread(QThread):
             if not self.is_running:
                 return
             response = None
+            started = time.monotonic()
+            hasher = StreamHasher()
             try:
-                # Serialize SSL connection establishment to prevent
-                # concurrent SSL access violations on Windows.
-                with self._ssl_lock:
-                    if not self.is_running:
+                offset = existing_offset(part_path)
+                gate = getattr(self, "connection_gate", None) or get_connection_gate()
+                with gate.establishing(file_url, lambda: self.is_running) as ok:
+                    if not ok or not self.is_running:
                         return
-                    response = get_session(self.settings.settings_tab).get(
-                        file_url,
-                        headers=get_headers(),
-                        stream=True,
-                        timeout=(30, 30),
-                    )
+                    with cancellable(lambda: self.is_running):
+                        response = get_session(self.settings.settings_tab).get(
+                            file_url,
+                            headers=range_headers(get_headers(), offset),
+                            stream=True,
+                            timeout=(30, 30),
+                        )
+                ttfb = time.monotonic() - started
                 # After headers are received each thread has its own
                 # SSL connection and can stream data concurrently.
-                response.raise_for_status()
-                header = response.headers.get("content-length")
-                try:
-                    file_size = int(header) if header is not None else 0
-                except Exception:
-                    file_size = 0
-                downloaded_size = 0
+                plan = plan_resume(
+                    getattr(response, "status_code", 200),
+                    response.headers,
+                    offset,
+                    part_path,
+                )
+                file_size = plan.total_size
+                downloaded_size = plan.offset
+                hasher.resume(part_path, plan.offset)
                 was_interrupted = False
 
-                with open(full_path, "wb") as f:
-                    for chunk in response.iter_content(chunk_size=8192):
-                        if not self.is_running:
-                            self.log.emit(
-                                translate(
-                                    "log_warning",
-                                    translate("download_interrupted", file_url),
-                                ),
-                                "WARNING",
-                            )
-                            was_interrupted = True
-                            break
-                        if chunk:
-                            f.write(chunk)
-                            downloaded_size += len(chunk)
-                            if file_size > 0:
-                                progress = int((downloaded_size / file_size) * 100)
-                            else:
-                                progress = 0
-                            self.file_progress.emit(file_index, min(progress, 100))
+                if not plan.complete:
+                    response.raise_for_status()
+                    self.progress.begin(file_index, plan.offset, file_size)
+                    with open(part_path, plan.mode) as f:
+                        for chunk in response.iter_content(chunk_size=8192):
+                            if not self.is_running:
+                                self.log.emit(
+                                    translate(
+                                        "log_warning",
+                                        translate("download_interrupted", file_url),
+                                    ),
+                                    "WARNING",
+                                )
+                                was_interrupted = True
+                                break
+                            if chunk:
+                                f.write(chunk)
+                                hasher.update(chunk)
+                                downloaded_size += len(chunk)
+                                self.progress.update(
+                                    file_index, downloaded_size, file_size
+                                )
 
                 if was_interrupted:
-                    if os.path.exists(full_path):
-                        try:
-                            os.remove(full_path)
-                        except OSError:
-                            pass
+                    # Keep the .part so the next attempt can resume it.
                     return
 
                 # Validate downloaded size matches content-length
@@ -1629,14 +1672,15 @@ class DownloadThread(QThread):
                         "size_mismatch_error", downloaded_size, file_size, file_url
                     )
                     self.log.emit(translate("log_warning", error_msg), "WARNING")
-                    # Delete incomplete file
-                    if os.path.exists(full_path):
+                    # A short transfer is kept and resumed on the next attempt;
+                    # a part larger than the remote file can never be valid.
+                    if downloaded_size > file_size and os.path.exists(part_path):
                         try:
-                            os.remove(full_path)
+                            os.remove(part_path)
                             self.log.emit(
                                 translate(
                                     "log_info",
-                                    translate("deleted_incomplete_file", full_path),
+                                    translate("deleted_incomplete_file", part_path),
                                 ),
                                 "INFO",
                             )
@@ -1646,23 +1690,31 @@ class DownloadThread(QThread):
                                     "log_error",
                                     translate(
                                         "failed_to_delete_incomplete_file",
-                                        full_path,
+                                        part_path,
                                         str(e),
                                     ),
                                 ),
                                 "ERROR",
                             )
                     # Raise exception to trigger retry
-                    raise Exception(
+                    raise IncompleteDownloadError(
                         f"Size mismatch: downloaded {downloaded_size} bytes, expected {file_size} bytes"
                     )
 
-                with open(full_path, "rb") as f:
-                    file_hash = hashlib.md5(f.read()).hexdigest()
+                finalize_part(part_path, full_path)
+                file_hash = hasher.digest_for(full_path)
                 actual_file_size = os.path.getsize(full_path)
                 self.hash_db.store(
-                    url_hash, full_path, file_hash, file_url, actual_file_size
+                    url_hash,
+                    full_path,
+                    file_hash,
+                    file_url,
+                    actual_file_size,
+                    service=service,
+                    creator_id=creator_id,
+                    post_id=post_id,
                 )
+                self.concurrency.record_success(downloaded_size, ttfb)
                 self.log.emit(
                     translate(
                         "log_info", translate("successfully_downloaded", full_path)
@@ -1676,6 +1728,7 @@ class DownloadThread(QThread):
                 return
 
             except Exception as e:
+                self.concurrency.record_failure(throttled=is_throttled_error(e))
                 if attempt == max_retries:
                     self.log.emit(
                         translate(
@@ -1723,6 +1776,7 @@ class DownloadThread(QThread):
                         time.sleep(1)
                     continue
             finally:
+                self.progress.finish(file_index)
                 if response is not None:
                     try:
                         response.close()
@@ -1750,12 +1804,40 @@ class DownloadThread(QThread):
                     "INFO",
                 )
 
+    def save_post_text(self, service_folder, post_id, post_title, content):
+        """Write the text of a post to ``desc.txt`` in its folder."""
+        try:
+            soup = BeautifulSoup(content, "html.parser")
+            text = soup.get_text(separator="\n\n")
+            post_folder = os.path.join(service_folder, f"{post_id}_{post_title}")
+            os.makedirs(post_folder, exist_ok=True)
+            desc_path = os.path.join(post_folder, "desc.txt")
+            if not os.path.exists(desc_path):
+                with open(desc_path, "w", encoding="utf-8") as f:
+                    f.write(text)
+                self.log.emit(
+                    translate(
+                        "log_info",
+                        translate("saved_post_description", post_id),
+                    ),
+                    "INFO",
+                )
+        except Exception as e:
+            self.log.emit(
+                translate(
+                    "log_warning",
+                    translate("failed_save_post_description", post_id, str(e)),
+                ),
+                "WARNING",
+            )
+
     def run(self):
         self.log.emit(
             translate("log_info", f"DownloadThread started with URL: {self.url}"),
             "INFO",
         )
         self.fetch_post_info()  # Fetch post title before starting
+        self.concurrency_changed.emit(self.concurrency.limit)
         service_folder = os.path.join(self.download_folder, self.service)
         os.makedirs(service_folder, exist_ok=True)
         self.log.emit(
@@ -1764,31 +1846,9 @@ class DownloadThread(QThread):
 
         # Save post text if enabled
         if self.download_text and self.post_content:
-            try:
-                soup = BeautifulSoup(self.post_content, "html.parser")
-                text = soup.get_text(separator="\n\n")
-                post_folder_name = f"{self.post_id}_{self.post_title}"
-                post_folder = os.path.join(service_folder, post_folder_name)
-                os.makedirs(post_folder, exist_ok=True)
-                desc_path = os.path.join(post_folder, "desc.txt")
-                if not os.path.exists(desc_path):
-                    with open(desc_path, "w", encoding="utf-8") as f:
-                        f.write(text)
-                    self.log.emit(
-                        translate(
-                            "log_info",
-                            translate("saved_post_description", self.post_id),
-                        ),
-                        "INFO",
-                    )
-            except Exception as e:
-                self.log.emit(
-                    translate(
-                        "log_warning",
-                        translate("failed_save_post_description", self.post_id, str(e)),
-                    ),
-                    "WARNING",
-                )
+            self.save_post_text(
+                service_folder, self.post_id, self.post_title, self.post_content
+            )
 
         total_files = len(self.selected_files)
         self.log.emit(
@@ -1805,8 +1865,9 @@ class DownloadThread(QThread):
             slot_lock = threading.Lock()
             active_slots = [0]
             workers = []  # keep refs so we can join
+            scheduler = getattr(self, "scheduler", None)
 
-            def _worker(file_url, folder, idx, total):
+            def _worker(file_url, folder, idx, total, owner):
                 """Download worker."""
                 try:
                     if not self.is_running:
@@ -1822,6 +1883,8 @@ class DownloadThread(QThread):
                         except RuntimeError:
                             pass
                 finally:
+                    if scheduler is not None:
+                        scheduler.release(owner)
                     with slot_lock:
                         active_slots[0] -= 1
 
@@ -1831,7 +1894,7 @@ class DownloadThread(QThread):
                 # Wait for a concurrency slot using pure Lock polling
                 while True:
                     with slot_lock:
-                        if active_slots[0] < self.max_concurrent:
+                        if active_slots[0] < self.concurrency.limit:
                             active_slots[0] += 1
                             break
                     if not self.is_running:
@@ -1839,9 +1902,16 @@ class DownloadThread(QThread):
                     time.sleep(0.05)
                 if not self.is_running:
                     break
+                owner = self.scheduler_owner(file_url)
+                if scheduler is not None and not scheduler.acquire(
+                    owner, lambda: self.is_running
+                ):
+                    with slot_lock:
+                        active_slots[0] -= 1
+                    break
                 t = threading.Thread(
                     target=_worker,
-                    args=(file_url, self.download_folder, i, total_files),
+                    args=(file_url, self.download_folder, i, total_files, owner),
                     daemon=True,
                 )
                 t.start()
@@ -1856,6 +1926,7 @@ class DownloadThread(QThread):
             for w in workers:
                 while w.is_alive() and time.monotonic() < _deadline:
                     time.sleep(0.05)
+            self.hash_db.try_flush()
         else:
             self.log.emit(
                 translate(
@@ -1871,6 +1942,120 @@ class DownloadThread(QThread):
         self.finished.emit()
 
 
+class PostBatchDownloadThread(DownloadThread):
+    """Download the files of several posts through one worker pool.
+
+    ``DownloadThread`` handles a single post, so a queue of small posts was
+    downloaded one post at a time.  This thread takes the prepared files of
+    every queued post at once; each post keeps its own folder, auto-rename
+    numbering and ``post_completed`` signal.  Post titles are fetched by
+    the workers the first time a post's file comes up.
+    """
+
+    def __init__(
+        self,
+        post_urls,
+        download_folder,
+        selected_files,
+        files_to_posts_map,
+        console,
+        other_files_dir,
+        settings,
+        max_concurrent=5,
+        auto_rename=False,
+        download_text=False,
+    ):
+        self.post_urls = {
+            post_id: url.rstrip("/") for post_id, url in post_urls.items()
+        }
+        first_post_id, first_url = next(iter(self.post_urls.items()))
+        super().__init__(
+            first_url,
+            download_folder,
+            selected_files,
+            files_to_posts_map,
+            console,
+            other_files_dir,
+            first_post_id,
+            settings,
+            max_concurrent,
+            auto_rename,
+            download_text,
+        )
+        # post_id -> [service, creator_id, title]; the title is filled in
+        # by the first worker that downloads a file of the post.
+        self.post_info = {}
+        for post_id, url in self.post_urls.items():
+            parts = url.split("/")
+            creator_id = parts[-3] if len(parts) >= 7 else ""
+            service = self.extract_service_from_url(url)
+            self.post_info[post_id] = [service, creator_id, None]
+        self.post_info_lock = threading.Lock()
+        self.post_locks = {post_id: threading.Lock() for post_id in self.post_urls}
+        # Auto-rename numbers files within their own post, as DownloadThread
+        # does for a single post.
+        self.file_numbers = {}
+        counts = {}
+        for file_url in self.selected_files:
+            post_id = self.files_to_posts_map.get(file_url)
+            counts[post_id] = counts.get(post_id, 0) + 1
+            self.file_numbers[file_url] = counts[post_id]
+
+    def build_post_files_map(self):
+        post_files_map = {post_id: [] for post_id in self.post_urls}
+        for file_url in self.selected_files:
+            post_id = self.files_to_posts_map.get(file_url)
+            if post_id in post_files_map:
+                post_files_map[post_id].append(file_url)
+        return post_files_map
+
+    def fetch_post_info(self):
+        """Post info is fetched per post by the workers."""
+
+    def ensure_post_info(self, post_id, folder):
+        """Fetch the title of *post_id* once and save its text if enabled."""
+        lock = self.post_locks.get(post_id)
+        if lock is None:
+            return
+        with lock:
+            with self.post_info_lock:
+                if self.post_info[post_id][2] is not None:
+                    return
+            info = self.request_post_info(self.post_urls[post_id])
+            service, creator_id, _ = self.post_info[post_id]
+            if info is None:
+                title, content = f"Post_{post_id}", None
+            else:
+                creator_id, title, content = info
+            with self.post_info_lock:
+                self.post_info[post_id] = [service, creator_id, title]
+            if self.download_text and content:
+                self.save_post_text(
+                    os.path.join(folder, service), post_id, title, content
+                )
+
+    def post_context(self, post_id):
+        with self.post_info_lock:
+            service, creator_id, title = self.post_info.get(
+                post_id, (self.service, "", None)
+            )
+        return service, creator_id, title or f"Post_{post_id}"
+
+    def file_number(self, file_url, file_index):
+        return self.file_numbers.get(file_url, file_index + 1)
+
+    def scheduler_owner(self, file_url):
+        post_id = self.files_to_posts_map.get(file_url, self.post_id)
+        service, creator_id, _ = self.post_context(post_id)
+        return f"{service}/{creator_id or post_id}"
+
+    def download_file(self, file_url, folder, file_index, total_files):
+        if self.is_running:
+            post_id = self.files_to_posts_map.get(file_url, self.post_id)
+            self.ensure_post_info(post_id, folder)
+        super().download_file(file_url, folder, file_index, total_files)
+
+
 class LogsWindow(QDialog):
     def __init__(self, parent_console, parent=None):
         super().__init__(parent)
@@ -2123,6 +2308,10 @@ class PostDownloaderTab(QWidget):
         )
         self.post_overall_progress.setRange(0, 100)
         post_progress_layout.addWidget(self.post_overall_progress)
+        # Effective download concurrency (moves at runtime in adaptive mode)
+        self.post_concurrency_label = QLabel()
+        self.post_concurrency_label.setStyleSheet("color: white;")
+        post_progress_layout.addWidget(self.post_concurrency_label)
         left_layout.addLayout(post_progress_layout)
 
         # Console
@@ -3234,6 +3423,10 @@ class PostDownloaderTab(QWidget):
             self.process_next_post(urls[1:] if len(urls) > 1 else [])
             return
 
+        if self.download_all_links.isChecked() and len(urls) > 1:
+            self.start_batch_download(urls, checked_files, files_to_posts_map)
+            return
+
         url = urls[0]
         url = url.rstrip("/")
         remaining_urls = urls[1:] if len(urls) > 1 else []
@@ -3247,6 +3440,9 @@ class PostDownloaderTab(QWidget):
         settings = self._create_thread_settings()
         max_concurrent = settings.simultaneous_downloads
         auto_rename = self.auto_rename_checkbox.isChecked()
+        configure_download_scheduler(
+            getattr(self.parent, "settings_tab", None), max_concurrent
+        )
         self.thread = DownloadThread(
             url,
             self.parent.download_folder,
@@ -3262,14 +3458,57 @@ class PostDownloaderTab(QWidget):
         )
         self.active_threads.append(self.thread)
         self.thread.file_progress.connect(self.update_file_progress)
+        self.thread.transfer_progress.connect(self.update_transfer_progress)
         self.thread.file_completed.connect(self.update_file_completion)
         self.thread.post_completed.connect(self.update_post_completion)
         self.thread.log.connect(self.append_log_to_console)
+        self.thread.concurrency_changed.connect(self.update_post_concurrency)
         self.thread.finished.connect(
             lambda: self.cleanup_thread(self.thread, remaining_urls)
         )
         self.thread.start()
 
+    def start_batch_download(self, urls, checked_files, files_to_posts_map):
+        """Download the prepared files of every post in *urls* together."""
+        post_urls = {}
+        for url in urls:
+            for _, post_id in self.all_files_map.get(url, []):
+                post_urls.setdefault(post_id, url)
+        self.append_log_to_console(
+            translate(
+                "log_info",
+                translate("processing_post_batch", len(checked_files), len(post_urls)),
+            ),
+            "INFO",
+        )
+        settings = self._create_thread_settings()
+        max_concurrent = settings.simultaneous_downloads
+        configure_download_scheduler(
+            getattr(self.parent, "settings_tab", None), max_concurrent
+        )
+        thread = PostBatchDownloadThread(
+            post_urls,
+            self.parent.download_folder,
+            checked_files,
+            files_to_posts_map,
+            self.post_console,
+            self.other_files_dir,
+            settings,
+            max_concurrent,
+            self.auto_rename_checkbox.isChecked(),
+            download_text=self.post_download_text_check.isChecked(),
+        )
+        self.thread = thread
+        self.active_threads.append(thread)
+        thread.file_progress.connect(self.update_file_progress)
+        thread.transfer_progress.connect(self.update_transfer_progress)
+        thread.file_completed.connect(self.update_file_completion)
+        thread.post_completed.connect(self.update_post_completion)
+        thread.log.connect(self.append_log_to_console)
+        thread.concurrency_changed.connect(self.update_post_concurrency)
+        thread.finished.connect(lambda: self.cleanup_thread(thread, []))
+        thread.start()
+
     def on_file_preparation_error(self, error_message):
         # Include the raw error text to ensure tests that inspect message
         # contents can find the provided string even if `translate` is mocked.
@@ -3394,12 +3633,28 @@ class PostDownloaderTab(QWidget):
             self.background_task_progress.setValue(0)
             self.background_task_label.setText(translate("idle"))
 
+    def update_post_concurrency(self, limit):
+        self.post_concurrency_label.setText(translate("effective_concurrency", limit))
+
     def update_file_progress(self, file_index, progress):
         if self.current_file_index == file_index or self.current_file_index == -1:
             self.current_file_index = file_index
             self.post_file_progress.setValue(progress)
             self.post_file_progress_label.setText(translate("file_progress", progress))
 
+    def update_transfer_progress(self, snapshot):
+        """Add the throughput and time left to the tracked file's progress."""
+        if self.current_file_index not in snapshot.files:
+            return
+        self.post_file_progress_label.setText(
+            translate(
+                "file_progress_rate",
+                snapshot.percent(self.current_file_index),
+                format_bytes(snapshot.throughput),
+                format_duration(snapshot.eta),
+            )
+        )
+
     def update_file_completion(self, file_index, file_url, success):
         if success:
             if file_url not in self.completed_files:
@@ -0,0 +1,187 @@
+"""
+prep_pool.py
+============
+Bounded worker pool for file preparation.
+
+``FilePreparationThread`` fetched every post on a raw ``threading.Thread``
+of its own, gated by a loop that polled a slot counter every 50 ms, and
+then waited for the workers for at most 30 seconds: posts still in flight
+after that were silently left out of the result.
+
+``PrepPool`` runs the blocking per-post fetches on a ``ThreadPoolExecutor``
+of ``concurrency.max_limit`` threads, driven by a private asyncio event
+loop:
+
+* worker tasks take posts from a queue, and at most ``concurrency.limit``
+  of them fetch at once, so an adaptive limit can move mid-run;
+* a fetch returning :class:`RetryLater` is put back on the queue by a loop
+  timer once its backoff is over, without holding a slot meanwhile;
+* the run ends when every post has produced its final result, or at once
+  when :meth:`PrepPool.stop` is called.  Fetches already running are
+  always waited for, so no worker thread outlives the pool.
+
+An optional *has_room* callable holds back new fetches while it returns
+False, e.g. while a ``DownloadFeed`` is full; whoever frees the room calls
+:meth:`PrepPool.wake` so the workers look again.
+
+Nothing polls: idle workers and the waiting caller sleep in the event
+loop.  The loop is only touched from its own thread, except by ``stop``
+and ``wake``, which go through ``call_soon_threadsafe``.  Results are handed to
+*on_result* on the pool's thread, one at a time, so callers need no lock
+around the data they collect.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Iterable, Optional
+
+from kemonodownloader.retry_schedule import RetryLater
+
+# ---------------------------------------------------------------------------
+# Pool
+# ---------------------------------------------------------------------------
+
+
+class PrepPool:
+    """Fetch items on a bounded number of threads until all are done."""
+
+    def __init__(
+        self,
+        concurrency,
+        fetch: Callable[[Any], Any],
+        on_result: Callable[[Any, Any], None],
+        should_continue: Callable[[], bool] = lambda: True,
+        has_room: Optional[Callable[[], bool]] = None,
+    ):
+        self.concurrency = concurrency
+        self.fetch = fetch
+        self.on_result = on_result
+        self.should_continue = should_continue
+        self.has_room = has_room
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._done: Optional[asyncio.Event] = None
+        self._slots: Optional[asyncio.Condition] = None
+
+    def run(self, items: Iterable[Any]) -> None:
+        """Fetch every item; return once all results were delivered."""
+        items = list(items)
+        if not items or not self.should_continue():
+            return
+        workers = max(1, int(getattr(self.concurrency, "max_limit", 1)))
+        loop = asyncio.new_event_loop()
+        loop.set_default_executor(
+            ThreadPoolExecutor(max_workers=workers, thread_name_prefix="prep")
+        )
+        self._loop = loop
+        try:
+            loop.run_until_complete(self._run(items, workers))
+        finally:
+            self._loop = None
+            # Wait for fetches still running so no thread outlives the pool.
+            loop.run_until_complete(loop.shutdown_default_executor())
+            loop.close()
+
+    def stop(self) -> None:
+        """End :meth:`run` without waiting for the queued items."""
+        loop, done = self._loop, self._done
+        if loop is None or done is None:
+            return
+        try:
+            loop.call_soon_threadsafe(done.set)
+        except RuntimeError:
+            pass  # the loop closed meanwhile
+
+    def wake(self) -> None:
+        """Make waiting workers check *has_room* again; thread-safe."""
+        loop = self._loop
+        if loop is None:
+            return
+        try:
+            loop.call_soon_threadsafe(self._notify)
+        except RuntimeError:
+            pass  # the loop closed meanwhile
+
+    def _notify(self) -> None:
+        slots = self._slots
+        if slots is None:
+            return
+
+        async def notify() -> None:
+            async with slots:
+                slots.notify_all()
+
+        asyncio.ensure_future(notify())
+
+    async def _run(self, items, workers: int) -> None:
+        loop = asyncio.get_running_loop()
+        queue: asyncio.Queue = asyncio.Queue()
+        for item in items:
+            queue.put_nowait(item)
+        done = asyncio.Event()
+        self._done = done
+        slots = asyncio.Condition()
+        self._slots = slots
+        state = {"active": 0, "remaining": len(items)}
+
+        def limit() -> int:
+            return max(1, int(getattr(self.concurrency, "limit", workers)))
+
+        def can_start() -> bool:
+            if state["active"] >= limit():
+                return False
+            return self.has_room is None or self.has_room()
+
+        async def worker() -> None:
+            while True:
+                item = await queue.get()
+                async with slots:
+                    await slots.wait_for(can_start)
+                    state["active"] += 1
+                result = None
+                try:
+                    if self.should_continue():
+                        result = await self._fetch(item)
+                finally:
+                    async with slots:
+                        state["active"] -= 1
+                        slots.notify_all()
+                if isinstance(result, RetryLater) and self.should_continue():
+                    loop.call_later(result.delay, queue.put_nowait, item)
+                    continue
+                if isinstance(result, RetryLater):
+                    result = None
+                try:
+                    if self.should_continue():
+                        self.on_result(item, result)
+                except Exception:
+                    pass  # on_result reports its own errors
+                state["remaining"] -= 1
+                if state["remaining"] <= 0:
+                    done.set()
+
+        tasks = [loop.create_task(worker()) for _ in range(workers)]
+        try:
+            await done.wait()
+        finally:
+            self._done = None
+            self._slots = None
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def _fetch(self, item):
+        started = time.monotonic()
+        try:
+            result = await asyncio.to_thread(self.fetch, item)
+        except Exception:
+            result = None  # fetch handles its own logging
+        if isinstance(result, RetryLater):
+            return result
+        if result:
+            self.concurrency.record_success(ttfb=time.monotonic() - started)
+        else:
+            self.concurrency.record_failure()
+        return result
@@ -0,0 +1,232 @@
+"""
+progress.py
+===========
+Coalesced, rate-limited transfer progress.
+
+The download threads used to emit a Qt signal for every 8 KiB chunk of
+every worker.  At line rate with many workers that is tens of thousands
+of cross-thread signals per second, all queued on the GUI thread, which
+then spends its time repainting a progress bar instead of handling
+input.
+
+``ProgressAggregator`` is updated by the workers instead.  ``update``
+stores the file's byte counts in a per-file slot (plain attribute stores,
+no lock on the hot path) and only calls *publish* when the publishing
+interval has passed, so the GUI receives at most one ``ProgressSnapshot``
+per interval (10 Hz by default) however many chunks arrive.  A snapshot
+holds the bytes of every file in flight, the totals, the smoothed
+throughput and the estimated time left.
+
+Publishing is claimed with a non-blocking ``Lock.acquire``: a worker that
+finds another one publishing goes back to its download.  No
+``threading.Event``/``Condition`` is used, for the same Windows / Python
+3.14 reasons as the download threads.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from typing import Callable, Dict, Hashable, List, NamedTuple, Optional, Tuple
+
+# ---------------------------------------------------------------------------
+# Constants
+# ---------------------------------------------------------------------------
+
+# Seconds between two published snapshots (10 Hz).
+DEFAULT_INTERVAL = 0.1
+# Weight of the newest interval in the smoothed throughput.
+SMOOTHING = 0.3
+
+_UNITS = ("B", "KB", "MB", "GB", "TB")
+
+
+# ---------------------------------------------------------------------------
+# Snapshot
+# ---------------------------------------------------------------------------
+
+
+class ProgressSnapshot(NamedTuple):
+    """Transfer state of one aggregator at one point in time.
+
+    *files* maps each file in flight to ``(downloaded, total)`` bytes, with
+    a total of 0 when the server did not send one; *changed* lists the
+    files updated since the previous snapshot.  *bytes_done* and
+    *bytes_total* add up the files whose total is known.  *throughput* is
+    in bytes per second and *eta* in seconds, ``None`` while unknown.
+    """
+
+    files: Dict[Hashable, Tuple[int, int]]
+    changed: Tuple[Hashable, ...]
+    bytes_done: int
+    bytes_total: int
+    throughput: float
+    eta: Optional[float]
+
+    def percent(self, key: Hashable) -> int:
+        """Return the progress of *key* in percent (0 when unknown)."""
+        downloaded, total = self.files.get(key, (0, 0))
+        if total <= 0:
+            return 0
+        return min(int(downloaded * 100 / total), 100)
+
+
+def format_bytes(count: float) -> str:
+    """Return *count* bytes as a short human-readable size (``"1.5 MB"``)."""
+    value = float(count)
+    for unit in _UNITS[:-1]:
+        if abs(value) < 1024:
+            return f"{value:.0f} {unit}" if unit == "B" else f"{value:.1f} {unit}"
+        value /= 1024
+    return f"{value:.1f} {_UNITS[-1]}"
+
+
+def format_duration(seconds: Optional[float]) -> str:
+    """Return *seconds* as ``m:ss`` or ``h:mm:ss``; ``--:--`` when unknown."""
+    if seconds is None:
+        return "--:--"
+    minutes, secs = divmod(int(round(seconds)), 60)
+    hours, minutes = divmod(minutes, 60)
+    if hours:
+        return f"{hours}:{minutes:02d}:{secs:02d}"
+    return f"{minutes}:{secs:02d}"
+
+
+# ---------------------------------------------------------------------------
+# Aggregator
+# ---------------------------------------------------------------------------
+
+
+class _FileSlot:
+    """Counters of one file, written only by the worker downloading it."""
+
+    __slots__ = ("downloaded", "total", "baseline", "dirty")
+
+    def __init__(self, downloaded: int, total: int, baseline: int):
+        self.downloaded = downloaded
+        self.total = total
+        # Bytes already on disk when the transfer started (resumed parts),
+        # which do not count towards the throughput.
+        self.baseline = baseline
+        self.dirty = True
+
+
+class ProgressAggregator:
+    """Collects per-file progress and publishes it at a fixed rate.
+
+    *publish* is called with a ``ProgressSnapshot`` from whichever worker
+    thread crosses the interval deadline; it must only hand the snapshot
+    on (emit a queued signal, print a line), never block.
+    """
+
+    def __init__(
+        self,
+        publish: Callable[[ProgressSnapshot], None],
+        interval: float = DEFAULT_INTERVAL,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self._publish = publish
+        self.interval = interval
+        self._clock = clock
+        self._files: Dict[Hashable, _FileSlot] = {}
+        self._lock = threading.Lock()
+        self._publishing = threading.Lock()
+        self._deadline = float("-inf")
+        # Bytes moved by transfers that already finished.
+        self._finished_bytes = 0
+        self._sample_time: Optional[float] = None
+        self._sample_bytes = 0
+        self._throughput = 0.0
+
+    def begin(self, key: Hashable, offset: int = 0, total: int = 0) -> None:
+        """Start tracking *key*, resumed at *offset* of *total* bytes.
+
+        Calling ``update`` for an unknown key starts it from 0; ``begin``
+        only matters for resumed transfers, so their existing bytes are
+        not counted as throughput.
+        """
+        with self._lock:
+            self._files[key] = _FileSlot(offset, total, offset)
+
+    def update(self, key: Hashable, downloaded: int, total: int = 0) -> None:
+        """Record that *key* has *downloaded* of *total* bytes.
+
+        Cheap enough to call for every chunk: the snapshot is only built
+        and published when the interval has passed.
+        """
+        slot = self._files.get(key)
+        if slot is None:
+            with self._lock:
+                slot = self._files.setdefault(key, _FileSlot(0, total, 0))
+        slot.downloaded = downloaded
+        slot.total = total
+        slot.dirty = True
+        if self._clock() >= self._deadline and self._publishing.acquire(False):
+            try:
+                now = self._clock()
+                if now >= self._deadline:
+                    self._deadline = now + self.interval
+                    self._publish(self._take(now, consume=True))
+            finally:
+                self._publishing.release()
+
+    def finish(self, key: Hashable) -> None:
+        """Stop tracking *key*; its transferred bytes stay in the throughput."""
+        with self._lock:
+            slot = self._files.pop(key, None)
+            if slot is not None:
+                self._finished_bytes += max(slot.downloaded - slot.baseline, 0)
+
+    def flush(self) -> None:
+        """Publish a snapshot now, regardless of the interval."""
+        with self._publishing:
+            now = self._clock()
+            self._deadline = now + self.interval
+            self._publish(self._take(now, consume=True))
+
+    def snapshot(self) -> ProgressSnapshot:
+        """Return the current state without publishing it."""
+        return self._take(self._clock(), consume=False)
+
+    def _take(self, now: float, consume: bool) -> ProgressSnapshot:
+        with self._lock:
+            slots = list(self._files.items())
+            transferred = self._finished_bytes
+        files = {}
+        changed: List[Hashable] = []
+        bytes_done = bytes_total = 0
+        for key, slot in slots:
+            downloaded, total = slot.downloaded, slot.total
+            files[key] = (downloaded, total)
+            transferred += max(downloaded - slot.baseline, 0)
+            if total > 0:
+                bytes_done += min(downloaded, total)
+                bytes_total += total
+            if slot.dirty:
+                changed.append(key)
+                if consume:
+                    slot.dirty = False
+        throughput = self._throughput
+        if consume:
+            throughput = self._sample(now, transferred)
+        eta = None
+        if throughput > 0 and bytes_total > 0:
+            eta = (bytes_total - bytes_done) / throughput
+        return ProgressSnapshot(
+            files, tuple(changed), bytes_done, bytes_total, throughput, eta
+        )
+
+    def _sample(self, now: float, transferred: int) -> float:
+        """Fold the bytes moved since the last snapshot into the throughput."""
+        if self._sample_time is None:
+            self._sample_time, self._sample_bytes = now, transferred
+            return self._throughput
+        elapsed = now - self._sample_time
+        if elapsed <= 0:
+            return self._throughput
+        rate = (transferred - self._sample_bytes) / elapsed
+        if self._throughput:
+            rate = SMOOTHING * rate + (1 - SMOOTHING) * self._throughput
+        self._throughput = rate
+        self._sample_time, self._sample_bytes = now, transferred
+        return rate
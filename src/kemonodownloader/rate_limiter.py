@@ -0,0 +1,333 @@
+"""
+rate_limiter.py
+===============
+Process-wide, per-host request rate limiting.
+
+Post detection, file preparation, thumbnail loading and both downloaders
+all talk to the same few API and data hosts from many worker threads at
+once.  Without coordination one worker that trips a ``429 Too Many
+Requests`` keeps sleeping on its own while the other nineteen carry on and
+trip it again.  ``HostRateLimiter`` gives every request one shared view of
+each host:
+
+* A token bucket per host paces API request starts (``rate`` per second
+  with a ``burst`` allowance).  File downloads from the data hosts are not
+  paced: they are already bounded by the download slots and the connection
+  gate, and a token per file would throttle folders of small files to a
+  few files per second.
+* A ``429`` (or a ``503`` carrying ``Retry-After``) pauses *every* caller
+  for that host until the ``Retry-After`` time, or an exponential backoff
+  when the header is absent, and halves the host's rate.
+* Successful responses ramp the rate back up to its base value in small
+  additive steps.
+
+Every request, paced or not, waits out a host's backoff and reports its
+response, so a ``429`` from a data host still pauses that host's downloads.
+
+``RateLimitedAdapter`` plugs the shared limiter into ``requests`` sessions
+(see ``creator_downloader.get_session``), so every call site that uses
+those sessions is covered.  The aiohttp engine calls ``acquire_async`` and
+``record_response`` directly.
+
+A host in backoff can hold a request for up to ``MAX_BACKOFF`` seconds.
+Requests sent inside ``cancellable(should_continue)`` stop waiting once
+``should_continue()`` turns False and raise ``RequestCancelled``, so
+stopping a download does not hang its thread for the rest of the backoff.
+
+Waiters sleep until their reservation (or the backoff) is due, then
+re-check in case another worker recorded a new backoff meanwhile.  A waiter
+with a cancellation hook wakes at least every ``_CANCEL_CHECK_INTERVAL``
+seconds, since nothing can interrupt a plain sleep; the host state sits
+under a plain ``Lock`` rather than ``threading.Condition``, for the same
+Windows / Python 3.14 reasons documented in the download threads.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from contextlib import contextmanager
+from email.utils import parsedate_to_datetime
+from typing import Callable, Dict, Iterator, Optional
+from urllib.parse import urlparse
+
+from requests.adapters import HTTPAdapter  # type: ignore[import]
+from requests.exceptions import RequestException  # type: ignore[import]
+
+# ---------------------------------------------------------------------------
+# Constants
+# ---------------------------------------------------------------------------
+
+DEFAULT_RATE = 8.0  # API request starts per second, per host
+DEFAULT_BURST = 16
+MIN_RATE = 0.5
+# Fraction of the base rate restored by each successful response.
+RECOVERY_STEP = 0.05
+# Backoff used when a 429 carries no Retry-After, doubled per consecutive 429.
+DEFAULT_BACKOFF = 5.0
+MAX_BACKOFF = 120.0
+# Longest single sleep of a waiter that can be cancelled, so stopping a
+# download is noticed well within a long backoff.
+_CANCEL_CHECK_INTERVAL = 1.0
+
+
+def parse_retry_after(value, now: Optional[float] = None) -> Optional[float]:
+    """Return the delay in seconds requested by a ``Retry-After`` value.
+
+    Accepts both the delta-seconds and the HTTP-date forms.  Returns
+    ``None`` when the value is missing or malformed.
+    """
+    if value is None:
+        return None
+    text = str(value).strip()
+    if not text:
+        return None
+    try:
+        return max(0.0, float(text))
+    except ValueError:
+        pass
+    try:
+        when = parsedate_to_datetime(text)
+    except (TypeError, ValueError, IndexError):
+        return None
+    if when is None:
+        return None
+    current = time.time() if now is None else now
+    return max(0.0, when.timestamp() - current)
+
+
+def host_of(url: str) -> str:
+    """Return the lower-cased host name used as the limiter key for *url*."""
+    return (urlparse(url).hostname or "").lower()
+
+
+def is_api_url(url: str) -> bool:
+    """Return True when *url* points at the JSON API rather than a file."""
+    return "/api/" in urlparse(url).path
+
+
+class _HostState:
+    __slots__ = ("rate", "tokens", "updated", "blocked_until", "consecutive_429")
+
+    def __init__(self, rate: float, burst: float, now: float):
+        self.rate = rate
+        self.tokens = burst
+        self.updated = now
+        self.blocked_until = 0.0
+        self.consecutive_429 = 0
+
+
+class HostRateLimiter:
+    """Token-bucket rate limiter keyed by host, with shared 429 backoff."""
+
+    def __init__(
+        self,
+        rate: float = DEFAULT_RATE,
+        burst: float = DEFAULT_BURST,
+        min_rate: float = MIN_RATE,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        self.base_rate = float(rate)
+        self.burst = float(burst)
+        self.min_rate = float(min_rate)
+        self._clock = clock
+        self._sleep = sleep
+        self._hosts: Dict[str, _HostState] = {}
+        self._lock = threading.Lock()
+
+    # -- bookkeeping -------------------------------------------------------
+
+    def _state(self, host: str, now: float) -> _HostState:
+        state = self._hosts.get(host)
+        if state is None:
+            state = _HostState(self.base_rate, self.burst, now)
+            self._hosts[host] = state
+        return state
+
+    def _refill(self, state: _HostState, now: float) -> None:
+        elapsed = max(0.0, now - state.updated)
+        state.tokens = min(self.burst, state.tokens + elapsed * state.rate)
+        state.updated = now
+
+    def reserve(self, host: str, paced: bool = True) -> float:
+        """Take a token for *host* and return how long the caller must wait.
+
+        The bucket may go negative; later callers then queue up behind the
+        reservation instead of all waking at the same moment.  With
+        ``paced=False`` no token is taken and only a backoff is waited out.
+        """
+        with self._lock:
+            now = self._clock()
+            state = self._state(host, now)
+            if not paced:
+                return max(0.0, state.blocked_until - now)
+            self._refill(state, now)
+            state.tokens -= 1.0
+            delay = -state.tokens / state.rate if state.tokens < 0 else 0.0
+            return max(delay, state.blocked_until - now)
+
+    def backoff_remaining(self, host: str) -> float:
+        """Seconds until requests to *host* are allowed again (0 if not paused)."""
+        with self._lock:
+            state = self._hosts.get(host)
+            if state is None:
+                return 0.0
+            return max(0.0, state.blocked_until - self._clock())
+
+    def current_rate(self, host: str) -> float:
+        with self._lock:
+            state = self._hosts.get(host)
+            return state.rate if state is not None else self.base_rate
+
+    def record_response(self, host: str, status_code, retry_after=None) -> float:
+        """Update *host* from a response and return the backoff it triggered.
+
+        ``429`` always backs off; ``503`` only when the server sent
+        ``Retry-After``.  Any other status counts as a success and ramps
+        the rate back towards its base value.
+        """
+        delay = parse_retry_after(retry_after)
+        throttled = status_code == 429 or (status_code == 503 and delay is not None)
+        with self._lock:
+            now = self._clock()
+            state = self._state(host, now)
+            self._refill(state, now)
+            if not throttled:
+                state.consecutive_429 = 0
+                if state.rate < self.base_rate:
+                    state.rate = min(
+                        self.base_rate, state.rate + self.base_rate * RECOVERY_STEP
+                    )
+                return 0.0
+            state.consecutive_429 += 1
+            if delay is None:
+                delay = DEFAULT_BACKOFF * (2 ** (state.consecutive_429 - 1))
+            delay = min(delay, MAX_BACKOFF)
+            state.blocked_until = max(state.blocked_until, now + delay)
+            state.rate = max(self.min_rate, state.rate / 2)
+            state.tokens = min(state.tokens, 0.0)
+            return delay
+
+    # -- waiting -----------------------------------------------------------
+
+    def _remaining(self, host: str, deadline: float) -> float:
+        with self._lock:
+            state = self._hosts.get(host)
+            blocked_until = state.blocked_until if state is not None else 0.0
+            return max(deadline, blocked_until) - self._clock()
+
+    def _next_sleep(
+        self,
+        host: str,
+        deadline: float,
+        should_continue: Optional[Callable[[], bool]],
+    ) -> float:
+        """Return how long to sleep before the next check, 0 to stop waiting."""
+        remaining = self._remaining(host, deadline)
+        if remaining <= 0:
+            return 0.0
+        if should_continue is None:
+            return remaining
+        if not should_continue():
+            return 0.0
+        return min(remaining, _CANCEL_CHECK_INTERVAL)
+
+    def acquire(
+        self,
+        host: str,
+        should_continue: Optional[Callable[[], bool]] = None,
+        paced: bool = True,
+    ) -> float:
+        """Block until a request to *host* may start; return the time waited.
+
+        A backoff recorded by another worker while this one is waiting
+        extends the wait.  Returns early when ``should_continue()`` turns
+        False.
+        """
+        start = self._clock()
+        deadline = start + self.reserve(host, paced)
+        while True:
+            delay = self._next_sleep(host, deadline, should_continue)
+            if delay <= 0:
+                break
+            self._sleep(delay)
+        return self._clock() - start
+
+    async def acquire_async(
+        self,
+        host: str,
+        should_continue: Optional[Callable[[], bool]] = None,
+        paced: bool = True,
+    ) -> float:
+        """Coroutine version of ``acquire`` for the aiohttp engine."""
+        start = self._clock()
+        deadline = start + self.reserve(host, paced)
+        while True:
+            delay = self._next_sleep(host, deadline, should_continue)
+            if delay <= 0:
+                break
+            await asyncio.sleep(delay)
+        return self._clock() - start
+
+    def reset(self) -> None:
+        """Forget all per-host state (used by tests)."""
+        with self._lock:
+            self._hosts.clear()
+
+
+# ---------------------------------------------------------------------------
+# Process-wide instance
+# ---------------------------------------------------------------------------
+
+_limiter = HostRateLimiter()
+# Cancellation hook of the requests sent by the current thread.
+_local = threading.local()
+
+
+def get_rate_limiter() -> HostRateLimiter:
+    """Return the limiter shared by every HTTP call site in the process."""
+    return _limiter
+
+
+class RequestCancelled(RequestException):
+    """A request was abandoned while it waited for its host's rate limit."""
+
+
+@contextmanager
+def cancellable(should_continue: Callable[[], bool]) -> Iterator[None]:
+    """Let requests sent by this thread stop waiting when cancelled.
+
+    Inside the block ``RateLimitedAdapter`` passes *should_continue* to
+    ``HostRateLimiter.acquire`` and raises ``RequestCancelled`` instead of
+    sending when it has turned False.
+    """
+    previous = getattr(_local, "should_continue", None)
+    _local.should_continue = should_continue
+    try:
+        yield
+    finally:
+        _local.should_continue = previous
+
+
+class RateLimitedAdapter(HTTPAdapter):
+    """``HTTPAdapter`` that paces API requests through the shared limiter.
+
+    File requests are not paced but still wait out their host's backoff.
+    """
+
+    def send(self, request, *args, **kwargs):
+        limiter = get_rate_limiter()
+        host = host_of(request.url)
+        should_continue = getattr(_local, "should_continue", None)
+        limiter.acquire(host, should_continue, paced=is_api_url(request.url))
+        if should_continue is not None and not should_continue():
+            raise RequestCancelled(
+                f"Request to {host} cancelled while rate limited", request=request
+            )
+        response = super().send(request, *args, **kwargs)
+        limiter.record_response(
+            host, response.status_code, response.headers.get("Retry-After")
+        )
+        return response
@@ -0,0 +1,261 @@
+"""
+resumable.py
+============
+Helpers for resumable downloads using ``.part`` files and HTTP ranges.
+
+File bodies are streamed into ``<folder>/<url_hash>.part`` rather than the
+final path.  When a transfer fails, is cancelled, or the application is
+restarted, the bytes already on disk are kept and the next attempt asks the
+server for the remainder with ``Range: bytes=N-``.  The reply is validated
+before anything is appended:
+
+* ``206`` with a ``Content-Range`` starting at ``N`` → append to the part.
+* ``200`` (server ignored the range) → truncate the part and start over.
+* ``416`` whose ``Content-Range`` total equals ``N`` → the part is already
+  complete.
+* Anything inconsistent → the part is discarded and the attempt is retried
+  from zero.
+
+The part is named after the URL hash rather than the final filename so that
+auto-rename numbering or template changes between runs can never resume the
+wrong file.  Once the size has been validated the part is atomically moved
+to its final path with ``finalize_part``.
+
+The MD5 recorded in the hash database is computed while the body streams
+in (``StreamHasher``) instead of re-reading the finished file.  A resumed
+transfer first feeds the kept prefix of the part through the hasher in
+fixed-size chunks, so memory stays bounded by the chunk size either way.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+from typing import Dict, NamedTuple, Optional
+
+# ---------------------------------------------------------------------------
+# Constants
+# ---------------------------------------------------------------------------
+
+PART_SUFFIX = ".part"
+HASH_CHUNK_SIZE = 1024 * 1024
+
+
+class IncompleteDownloadError(Exception):
+    """The transfer stopped short of the expected size, or the server reply
+    could not be used to resume it.
+
+    Retryable: the next attempt resumes from whatever is left on disk.
+    """
+
+
+class DownloadCancelled(Exception):
+    """The transfer was stopped by its caller; the ``.part`` file is kept.
+
+    Not an error: the next run resumes from the bytes already on disk.
+    """
+
+
+class ContentRange(NamedTuple):
+    start: Optional[int]
+    end: Optional[int]
+    total: Optional[int]
+
+
+class ResumePlan(NamedTuple):
+    """How to consume a (possibly ranged) response.
+
+    ``offset`` is the number of bytes already on disk that are kept,
+    ``total_size`` the expected final size (0 when unknown) and
+    ``complete`` is True when the part already holds the whole file.
+    """
+
+    offset: int
+    total_size: int
+    complete: bool = False
+
+    @property
+    def mode(self) -> str:
+        return "ab" if self.offset > 0 else "wb"
+
+
+# ---------------------------------------------------------------------------
+# Part file handling
+# ---------------------------------------------------------------------------
+
+
+def part_path_for(folder: str, url_hash: str) -> str:
+    """Return the ``.part`` path used for *url_hash* inside *folder*."""
+    return os.path.join(folder, f"{url_hash}{PART_SUFFIX}")
+
+
+def existing_offset(part_path: str) -> int:
+    """Return the number of bytes already downloaded into *part_path*."""
+    try:
+        return os.stat(part_path).st_size
+    except OSError:
+        return 0
+
+
+def discard_part(part_path: str) -> None:
+    """Remove *part_path*, ignoring a missing file."""
+    try:
+        os.remove(part_path)
+    except FileNotFoundError:
+        pass
+
+
+def finalize_part(part_path: str, full_path: str) -> None:
+    """Atomically move a completed part to its final location.
+
+    A missing part is ignored; the caller's subsequent read of *full_path*
+    reports a file that genuinely does not exist.
+    """
+    try:
+        os.replace(part_path, full_path)
+    except FileNotFoundError:
+        pass
+
+
+# ---------------------------------------------------------------------------
+# Content hashing
+# ---------------------------------------------------------------------------
+
+
+def hash_file(
+    path: str, *hashers, limit: Optional[int] = None, chunk_size: int = HASH_CHUNK_SIZE
+) -> None:
+    """Feed the first *limit* bytes of *path* (all of it by default) to every
+    hasher in one chunked pass."""
+    remaining = limit
+    with open(path, "rb") as f:
+        while remaining is None or remaining > 0:
+            size = chunk_size if remaining is None else min(chunk_size, remaining)
+            chunk = f.read(size)
+            if not chunk:
+                break
+            for hasher in hashers:
+                hasher.update(chunk)
+            if remaining is not None:
+                remaining -= len(chunk)
+
+
+def md5_file(path: str) -> str:
+    """Return the MD5 hex digest of *path*, read in fixed-size chunks."""
+    hasher = hashlib.md5()
+    hash_file(path, hasher)
+    return hasher.hexdigest()
+
+
+class StreamHasher:
+    """MD5 of a download, updated with each chunk as it is written.
+
+    ``size`` counts the bytes hashed so far; ``digest_for`` falls back to a
+    chunked pass over the file when it does not match what ended up on
+    disk (for example when the body was written by another path).
+    """
+
+    def __init__(self):
+        self._md5 = hashlib.md5()
+        self.size = 0
+
+    def update(self, chunk: bytes) -> None:
+        self._md5.update(chunk)
+        self.size += len(chunk)
+
+    def resume(self, part_path: str, offset: int) -> None:
+        """Restart from the *offset* bytes of *part_path* kept for a resume."""
+        self._md5 = hashlib.md5()
+        self.size = 0
+        if offset > 0:
+            hash_file(part_path, self, limit=offset)
+
+    def hexdigest(self) -> str:
+        return self._md5.hexdigest()
+
+    def digest_for(self, path: str) -> str:
+        """Return the MD5 of the finished file at *path*."""
+        if self.size == os.path.getsize(path):
+            return self.hexdigest()
+        return md5_file(path)
+
+
+# ---------------------------------------------------------------------------
+# HTTP helpers
+# ---------------------------------------------------------------------------
+
+
+def range_headers(headers: Dict[str, str], offset: int) -> Dict[str, str]:
+    """Return a copy of *headers* requesting the bytes from *offset* onwards.
+
+    Ranged requests ask for the identity encoding so byte offsets refer to
+    the stored file rather than a compressed representation.
+    """
+    request_headers = dict(headers)
+    if offset > 0:
+        request_headers["Range"] = f"bytes={offset}-"
+        request_headers["Accept-Encoding"] = "identity"
+    return request_headers
+
+
+def _to_int(value) -> int:
+    try:
+        return int(value) if value is not None else 0
+    except (TypeError, ValueError):
+        return 0
+
+
+def parse_content_range(value: Optional[str]) -> Optional[ContentRange]:
+    """Parse a ``Content-Range`` header value.
+
+    ``"bytes 100-199/1000"`` → ``ContentRange(100, 199, 1000)``;
+    ``"bytes */1000"`` → ``ContentRange(None, None, 1000)``; an unknown
+    total (``*``) is returned as ``None``.  Returns ``None`` when the value
+    cannot be parsed.
+    """
+    if not value:
+        return None
+    unit, _, spec = str(value).strip().partition(" ")
+    if unit.lower() != "bytes" or "/" not in spec:
+        return None
+    span, _, total_text = spec.strip().partition("/")
+    try:
+        total = None if total_text.strip() == "*" else int(total_text)
+        if span.strip() == "*":
+            return ContentRange(None, None, total)
+        start_text, _, end_text = span.partition("-")
+        return ContentRange(int(start_text), int(end_text), total)
+    except ValueError:
+        return None
+
+
+def plan_resume(status_code, headers, offset: int, part_path: str) -> ResumePlan:
+    """Decide how to write the body of a response to a ranged request.
+
+    Raises ``IncompleteDownloadError`` (after discarding the part) when the
+    reply cannot be reconciled with the bytes on disk.  Error statuses other
+    than 416 are left for the caller's ``raise_for_status``.
+    """
+    content_length = _to_int(headers.get("content-length"))
+    if offset > 0:
+        if status_code == 206:
+            content_range = parse_content_range(headers.get("content-range"))
+            if content_range is None or content_range.start != offset:
+                discard_part(part_path)
+                raise IncompleteDownloadError(
+                    f"Server returned an unexpected range for offset {offset}"
+                )
+            total = content_range.total or (
+                offset + content_length if content_length else 0
+            )
+            return ResumePlan(offset, total)
+        if status_code == 416:
+            content_range = parse_content_range(headers.get("content-range"))
+            if content_range is not None and content_range.total == offset:
+                return ResumePlan(offset, offset, complete=True)
+            discard_part(part_path)
+            raise IncompleteDownloadError(
+                f"Partial file of {offset} bytes does not match the remote file"
+            )
+    # Fresh download, or the server ignored the range: start from zero.
+    return ResumePlan(0, content_length)
@@ -0,0 +1,105 @@
+"""
+retry_schedule.py
+=================
+Deferred retries for failed work items.
+
+File preparation and file downloads used to retry a failed item inside
+the worker that ran it, sleeping between attempts.  The worker's
+concurrency slot stayed taken for the whole backoff, so one flaky file
+could hold a slot for minutes while healthy items queued behind it.
+
+Instead, a failed item is handed to a ``RetrySchedule`` with a not-before
+time (``backoff_delay``: exponential backoff with jitter) and the worker
+moves straight on to the next ready item.  The owner of the work queue
+moves due items back onto it (``pop_due``) and only considers the run
+finished once the schedule is empty as well.
+
+``RetryLater`` is the value a single attempt returns to ask for such a
+retry instead of raising or sleeping itself.
+"""
+
+from __future__ import annotations
+
+import heapq
+import itertools
+import random
+import threading
+import time
+from typing import Any, Callable, List, NamedTuple, Optional, Tuple
+
+# ---------------------------------------------------------------------------
+# Backoff
+# ---------------------------------------------------------------------------
+
+DEFAULT_BASE_DELAY = 1.0
+DEFAULT_MAX_DELAY = 60.0
+
+
+def backoff_delay(
+    attempt: int,
+    base: float = DEFAULT_BASE_DELAY,
+    cap: float = DEFAULT_MAX_DELAY,
+    rand: Callable[[], float] = random.random,
+) -> float:
+    """Return the delay before retrying after failed attempt number *attempt*.
+
+    The window doubles with every attempt (``base * 2 ** (attempt - 1)``,
+    capped at *cap*) and the delay is drawn from its upper half, so
+    retries of items that failed together spread out without ever
+    collapsing to zero.
+    """
+    window = min(cap, base * (2 ** max(0, attempt - 1)))
+    return window / 2 + rand() * window / 2
+
+
+class RetryLater(NamedTuple):
+    """Returned by a single attempt that should be retried after *delay*."""
+
+    delay: float
+
+
+# ---------------------------------------------------------------------------
+# Schedule
+# ---------------------------------------------------------------------------
+
+
+class RetrySchedule:
+    """Thread-safe set of items waiting for their not-before time."""
+
+    def __init__(self, clock: Callable[[], float] = time.monotonic):
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._heap: List[Tuple[float, int, Any]] = []
+        self._counter = itertools.count()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._heap)
+
+    def schedule(self, item: Any, delay: float) -> None:
+        """Make *item* available again after *delay* seconds."""
+        with self._lock:
+            heapq.heappush(
+                self._heap,
+                (self._clock() + max(0.0, delay), next(self._counter), item),
+            )
+
+    def pop_due(self) -> List[Any]:
+        """Remove and return every item whose time has come, soonest first."""
+        due = []
+        with self._lock:
+            now = self._clock()
+            while self._heap and self._heap[0][0] <= now:
+                due.append(heapq.heappop(self._heap)[2])
+        return due
+
+    def next_due_in(self) -> Optional[float]:
+        """Seconds until the next item is due (``None`` when empty)."""
+        with self._lock:
+            if not self._heap:
+                return None
+            return max(0.0, self._heap[0][0] - self._clock())
+
+    def clear(self) -> None:
+        with self._lock:
+            self._heap.clear()
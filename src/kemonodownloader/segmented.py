@@ -0,0 +1,297 @@
+"""
+segmented.py
+============
+Segmented (multi-connection) range downloading for large files.
+
+A single slow connection to a data server caps the speed of a multi-GB
+attachment no matter how much bandwidth is free.  When the first response
+for a file advertises ``Accept-Ranges: bytes`` and a ``Content-Length`` at
+or above the configured threshold, the download is split into N byte
+ranges that are fetched concurrently into one preallocated file:
+
+* ``split_ranges`` divides the file into inclusive ``(start, end)`` ranges.
+* ``SegmentedFile`` owns the preallocated ``<url_hash>.segmented`` file and a
+  small JSON sidecar recording finished ranges, so an interrupted segmented
+  download resumes with only the missing ranges on the next run.
+* ``SegmentJob`` hands ranges out to whoever asks: the worker that owns the
+  file and any idle download workers that picked up one of the job's helper
+  tokens from the shared queue.  Because the owner also claims ranges, a job
+  always completes even when no helper ever runs.
+
+Once every range is written the file is verified as a whole (size, and the
+SHA-256 embedded in ``/data/ab/cd/<sha256>.<ext>`` URLs when present) before
+the caller moves it into place.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+import os
+import re
+import threading
+from collections import deque
+from typing import Awaitable, Callable, Deque, Dict, List, Optional, Set, Tuple
+from urllib.parse import urlparse
+
+from kemonodownloader.resumable import IncompleteDownloadError, parse_content_range
+
+# ---------------------------------------------------------------------------
+# Constants
+# ---------------------------------------------------------------------------
+
+SEGMENTED_SUFFIX = ".segmented"
+STATE_SUFFIX = ".segmented.json"
+
+# Never split a file into segments smaller than this.
+MIN_SEGMENT_SIZE = 1024 * 1024
+
+_SHA256_RE = re.compile(r"^[0-9a-f]{64}$")
+
+Range = Tuple[int, int]
+
+
+class SegmentedDownloadRequired(Exception):
+    """Raised by the single-stream path when the response qualifies for a
+    segmented download.  Carries the total size from ``Content-Length``."""
+
+    def __init__(self, total_size: int):
+        super().__init__(f"Segmented download required for {total_size} bytes")
+        self.total_size = total_size
+
+
+class SegmentFailedError(Exception):
+    """A segment exhausted its retries; the file download has failed.
+
+    Finished ranges stay on disk so a later run resumes the rest.
+    """
+
+
+# ---------------------------------------------------------------------------
+# Planning helpers
+# ---------------------------------------------------------------------------
+
+
+def should_segment(
+    headers, total_size: int, threshold_bytes: int, segment_count: int
+) -> bool:
+    """Return True when a response of *total_size* bytes should be segmented."""
+    if threshold_bytes <= 0 or segment_count < 2 or total_size < threshold_bytes:
+        return False
+    accept_ranges = str(headers.get("accept-ranges") or "").lower()
+    return accept_ranges == "bytes" and total_size >= 2 * MIN_SEGMENT_SIZE
+
+
+def split_ranges(total_size: int, segment_count: int) -> List[Range]:
+    """Split ``[0, total_size)`` into at most *segment_count* inclusive ranges."""
+    if total_size <= 0:
+        return []
+    count = max(1, min(segment_count, total_size // MIN_SEGMENT_SIZE))
+    size = -(-total_size // count)  # ceiling division
+    return [
+        (start, min(start + size, total_size) - 1)
+        for start in range(0, total_size, size)
+    ]
+
+
+def segment_range_headers(headers: Dict[str, str], start: int, end: int) -> dict:
+    """Return a copy of *headers* requesting the inclusive range start-end."""
+    request_headers = dict(headers)
+    request_headers["Range"] = f"bytes={start}-{end}"
+    request_headers["Accept-Encoding"] = "identity"
+    return request_headers
+
+
+def check_segment_response(status_code, headers, start: int) -> None:
+    """Ensure a ranged reply really starts at *start*.
+
+    Raises ``SegmentFailedError`` when the server ignored the range, since
+    retrying the same request would not help.
+    """
+    if status_code != 206:
+        raise SegmentFailedError(
+            f"Server ignored the byte range request (status {status_code})"
+        )
+    content_range = parse_content_range(headers.get("content-range"))
+    if content_range is None or content_range.start != start:
+        raise IncompleteDownloadError(
+            f"Server returned an unexpected range for offset {start}"
+        )
+
+
+def server_sha256(url: str) -> Optional[str]:
+    """Return the SHA-256 embedded in a ``/data/ab/cd/<sha256>.<ext>`` URL."""
+    path = urlparse(url).path
+    stem = os.path.splitext(os.path.basename(path))[0].lower()
+    return stem if _SHA256_RE.match(stem) else None
+
+
+def sha256_file(path: str, chunk_size: int = 1024 * 1024) -> str:
+    """Hash *path* with SHA-256 in fixed-size chunks."""
+    hasher = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            hasher.update(chunk)
+    return hasher.hexdigest()
+
+
+def segmented_paths(folder: str, url_hash: str) -> Tuple[str, str]:
+    """Return ``(data_path, state_path)`` for *url_hash* inside *folder*."""
+    base = os.path.join(folder, url_hash)
+    return base + SEGMENTED_SUFFIX, base + STATE_SUFFIX
+
+
+# ---------------------------------------------------------------------------
+# Preallocated target file
+# ---------------------------------------------------------------------------
+
+
+class SegmentedFile:
+    """Preallocated file written concurrently by several range fetchers."""
+
+    def __init__(self, data_path: str, state_path: str, total_size: int, ranges):
+        self.data_path = data_path
+        self.state_path = state_path
+        self.total_size = total_size
+        self.ranges: List[Range] = [tuple(r) for r in ranges]  # type: ignore[misc]
+        self.done: Set[Range] = set()
+        self._lock = threading.Lock()
+
+    def prepare(self) -> None:
+        """Reuse a matching earlier attempt, or preallocate a fresh file."""
+        state = self._load_state()
+        if (
+            state is not None
+            and state.get("total_size") == self.total_size
+            and [tuple(r) for r in state.get("ranges", [])] == self.ranges
+            and os.path.exists(self.data_path)
+            and os.path.getsize(self.data_path) == self.total_size
+        ):
+            self.done = {tuple(r) for r in state.get("done", [])}  # type: ignore[misc]
+            return
+        self.done = set()
+        self._preallocate()
+        self._save_state()
+
+    def pending(self) -> List[Range]:
+        return [r for r in self.ranges if r not in self.done]
+
+    def completed_bytes(self) -> int:
+        return sum(end - start + 1 for start, end in self.done)
+
+    def mark_done(self, segment: Range) -> None:
+        with self._lock:
+            self.done.add(tuple(segment))  # type: ignore[arg-type]
+            self._save_state()
+
+    def is_complete(self) -> bool:
+        return (
+            all(r in self.done for r in self.ranges)
+            and os.path.exists(self.data_path)
+            and os.path.getsize(self.data_path) == self.total_size
+        )
+
+    def finalize(self, target_path: str) -> None:
+        """Move the finished data file to *target_path* and drop the state."""
+        os.replace(self.data_path, target_path)
+        self._remove(self.state_path)
+
+    def discard(self) -> None:
+        self._remove(self.data_path)
+        self._remove(self.state_path)
+
+    # -- internals ---------------------------------------------------------
+
+    def _preallocate(self) -> None:
+        with open(self.data_path, "wb") as f:
+            try:
+                os.posix_fallocate(f.fileno(), 0, self.total_size)  # type: ignore[attr-defined]
+            except (AttributeError, OSError):
+                f.truncate(self.total_size)
+
+    def _load_state(self) -> Optional[dict]:
+        try:
+            with open(self.state_path, "r", encoding="utf-8") as f:
+                state = json.load(f)
+        except (OSError, ValueError):
+            return None
+        return state if isinstance(state, dict) else None
+
+    def _save_state(self) -> None:
+        state = {
+            "total_size": self.total_size,
+            "ranges": [list(r) for r in self.ranges],
+            "done": sorted(list(r) for r in self.done),
+        }
+        tmp_path = self.state_path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(state, f)
+        os.replace(tmp_path, self.state_path)
+
+    @staticmethod
+    def _remove(path: str) -> None:
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+
+
+# ---------------------------------------------------------------------------
+# Work distribution
+# ---------------------------------------------------------------------------
+
+
+class SegmentJob:
+    """Distributes the pending ranges of one file between workers.
+
+    ``fetch_segment(start, end)`` downloads one range (with its own retries)
+    and raises when it ultimately fails.  All methods run on the owning
+    event loop, so plain counters are sufficient.
+    """
+
+    def __init__(
+        self,
+        segmented_file: SegmentedFile,
+        fetch_segment: Callable[[int, int], Awaitable[None]],
+    ):
+        self.segmented_file = segmented_file
+        self.fetch_segment = fetch_segment
+        self.error: Optional[BaseException] = None
+        self._pending: Deque[Range] = deque(segmented_file.pending())
+        self._in_flight = 0
+        self._finished = asyncio.Event()
+        self._update_finished()
+
+    @property
+    def helper_count(self) -> int:
+        """Number of helper tokens worth queueing (the owner takes one range)."""
+        return max(0, len(self._pending) - 1)
+
+    async def work(self) -> None:
+        """Claim and fetch ranges until none are left or one has failed."""
+        while self.error is None and self._pending:
+            segment = self._pending.popleft()
+            self._in_flight += 1
+            try:
+                await self.fetch_segment(*segment)
+                self.segmented_file.mark_done(segment)
+            except BaseException as e:  # noqa: BLE001 - re-raised via self.error
+                if self.error is None:
+                    self.error = e
+                if isinstance(e, asyncio.CancelledError):
+                    raise
+            finally:
+                self._in_flight -= 1
+                self._update_finished()
+
+    async def run(self) -> None:
+        """Owner entry point: help out, then wait for in-flight helpers."""
+        await self.work()
+        await self._finished.wait()
+        if self.error is not None:
+            raise self.error
+
+    def _update_finished(self) -> None:
+        if self._in_flight == 0 and (self.error is not None or not self._pending):
+            self._finished.set()
@@ -2,6 +2,7 @@ import gc
 import os
 import sys
 from pathlib import Path
+from types import SimpleNamespace
 
 import pytest
 
@@ -61,6 +62,30 @@ def isolated_settings(tmp_path):
     settings.clear()
 
 
+@pytest.fixture()
+def settings_tab(tmp_path, monkeypatch, isolated_settings):
+    """Return a real ``SettingsTab`` holding the default settings.
+
+    It is backed by the isolated QSettings, so the user's configuration is
+    neither read nor written; tests change ``settings_tab.settings`` for the
+    values they need.
+    """
+    from kemonodownloader import kd_settings
+
+    monkeypatch.setattr(kd_settings, "QSettings", lambda *args: isolated_settings)
+    base = tmp_path / "base"
+    parent = SimpleNamespace(
+        base_folder=str(base),
+        download_folder=str(base / "Downloads"),
+        cache_folder=str(base / "Cache"),
+        other_files_folder=str(base / "Other Files"),
+        ensure_folders_exist=lambda: None,
+        post_tab=SimpleNamespace(),
+        creator_tab=SimpleNamespace(),
+    )
+    return kd_settings.SettingsTab(parent)
+
+
 @pytest.fixture()
 def isolated_hash_dir(tmp_path):
     """Return a temp directory suitable for HashDB tests."""
@@ -133,3 +158,33 @@ def cleanup_qt_threads_after_test():
             app.processEvents()
         except Exception:
             pass
+
+
+@pytest.fixture(autouse=True)
+def reset_endpoint_cache():
+    """Keep the process-wide endpoint cache from leaking between tests."""
+    from kemonodownloader.endpoint_cache import get_endpoint_cache
+
+    get_endpoint_cache().clear()
+    yield
+    get_endpoint_cache().clear()
+
+
+@pytest.fixture(autouse=True)
+def reset_api_cache():
+    """Keep the process-wide API response cache disabled between tests."""
+    from kemonodownloader.api_cache import get_api_cache
+
+    get_api_cache().configure(None, offline=False)
+    yield
+    get_api_cache().configure(None, offline=False)
+
+
+@pytest.fixture(autouse=True)
+def reset_deep_verifier():
+    """Drop background verification jobs left over from another test."""
+    from kemonodownloader.deep_verify import get_deep_verifier
+
+    get_deep_verifier().clear()
+    yield
+    get_deep_verifier().clear()
@@ -0,0 +1,244 @@
+import asyncio
+from types import SimpleNamespace
+
+import kemonodownloader.creator_downloader as cd
+from kemonodownloader.concurrency import (
+    AIMDConcurrency,
+    FixedConcurrency,
+    create_controller,
+    is_throttled_error,
+)
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def make_controller(initial=4, min_limit=2, max_limit=8, **kwargs):
+    clock = FakeClock()
+    changes = []
+    controller = AIMDConcurrency(
+        initial,
+        min_limit=min_limit,
+        max_limit=max_limit,
+        interval=1.0,
+        min_samples=2,
+        clock=clock,
+        on_change=changes.append,
+        **kwargs,
+    )
+    return controller, clock, changes
+
+
+def run_window(controller, clock, successes=2, failures=0, nbytes=1000, ttfb=0.1):
+    clock.now += 1.0
+    for _ in range(failures):
+        controller.record_failure()
+    for _ in range(successes):
+        controller.record_success(nbytes, ttfb)
+
+
+def test_fixed_controller_never_moves():
+    controller = FixedConcurrency(5)
+    controller.record_failure(throttled=True)
+    controller.record_success(100, 0.1)
+    assert controller.limit == controller.min_limit == controller.max_limit == 5
+    assert not controller.adaptive
+
+
+def test_create_controller_modes():
+    assert isinstance(create_controller(5), FixedConcurrency)
+    adaptive = create_controller(5, adaptive=True, min_limit=2, max_limit=10)
+    assert isinstance(adaptive, AIMDConcurrency)
+    assert adaptive.limit == 5
+    # The configured value is clamped into the adaptive bounds.
+    assert create_controller(30, adaptive=True, max_limit=10).limit == 10
+
+
+def test_additive_increase_while_throughput_holds():
+    controller, clock, changes = make_controller()
+    run_window(controller, clock)
+    run_window(controller, clock)
+    assert controller.limit == 6
+    assert changes == [5, 6]
+
+
+def test_increase_stops_at_max_limit():
+    controller, clock, _ = make_controller(initial=7, max_limit=8)
+    for _ in range(5):
+        run_window(controller, clock)
+    assert controller.limit == 8
+
+
+def test_no_increase_when_throughput_drops():
+    controller, clock, _ = make_controller()
+    run_window(controller, clock, nbytes=10_000)
+    assert controller.limit == 5
+    run_window(controller, clock, nbytes=1_000)
+    assert controller.limit == 5
+
+
+def test_error_rate_halves_limit():
+    controller, clock, changes = make_controller(initial=8)
+    run_window(controller, clock, successes=2, failures=2)
+    assert controller.limit == 4
+    assert changes == [4]
+
+
+def test_decrease_respects_min_limit():
+    controller, clock, _ = make_controller(initial=3, min_limit=2)
+    run_window(controller, clock, successes=0, failures=3)
+    run_window(controller, clock, successes=0, failures=3)
+    assert controller.limit == 2
+
+
+def test_slow_first_byte_halves_limit():
+    controller, clock, _ = make_controller(initial=6)
+    run_window(controller, clock, ttfb=0.1)
+    assert controller.limit == 7
+    run_window(controller, clock, ttfb=1.0)
+    assert controller.limit == 3
+
+
+def test_throttled_failure_cuts_immediately_once_per_interval():
+    controller, clock, changes = make_controller(initial=8)
+    controller.record_failure(throttled=True)
+    controller.record_failure(throttled=True)
+    assert controller.limit == 4
+    clock.now += 1.0
+    controller.record_failure(throttled=True)
+    assert controller.limit == 2
+    assert changes == [4, 2]
+
+
+def test_window_needs_enough_samples():
+    controller, clock, changes = make_controller()
+    clock.now += 5.0
+    controller.record_success(1000, 0.1)
+    assert controller.limit == 4
+    assert changes == []
+
+
+def test_is_throttled_error():
+    assert is_throttled_error(SimpleNamespace(status=429))
+    assert is_throttled_error(
+        SimpleNamespace(response=SimpleNamespace(status_code=429))
+    )
+    assert not is_throttled_error(SimpleNamespace(status=500))
+    assert not is_throttled_error(ValueError("boom"))
+
+
+def test_create_concurrency_controller_reads_settings_tab(settings_tab):
+    settings_tab.settings.update(
+        adaptive_concurrency=True,
+        adaptive_min_concurrency=3,
+        adaptive_max_concurrency=12,
+    )
+    controller = cd.create_concurrency_controller(settings_tab, 5)
+    assert isinstance(controller, AIMDConcurrency)
+    assert (controller.limit, controller.min_limit, controller.max_limit) == (5, 3, 12)
+
+
+def test_create_concurrency_controller_defaults_to_fixed(settings_tab):
+    assert isinstance(cd.create_concurrency_controller(None, 5), FixedConcurrency)
+    assert isinstance(
+        cd.create_concurrency_controller(settings_tab, 5), FixedConcurrency
+    )
+
+
+def make_download_thread(tmp_path, limit, download_file):
+    thread = cd.CreatorDownloadThread(
+        "fanbox",
+        "42",
+        str(tmp_path),
+        [],
+        [],
+        {},
+        None,
+        str(tmp_path / "other"),
+        {},
+        False,
+        cd.ThreadSettings(1, 1, 1, 1, limit, settings_tab=None),
+        limit,
+    )
+    thread.concurrency = FixedConcurrency(limit)
+    thread.download_file = download_file
+    return thread
+
+
+def test_download_worker_honours_current_limit(tmp_path):
+    active = []
+    peak = [0]
+
+    async def fake_download(file_url, folder, file_index, total_files):
+        active.append(file_url)
+        peak[0] = max(peak[0], len(active))
+        await asyncio.sleep(0.01)
+        active.remove(file_url)
+
+    thread = make_download_thread(tmp_path, 2, fake_download)
+
+    async def main():
+        queue = asyncio.Queue()
+        for i in range(8):
+            queue.put_nowait((i, f"u{i}"))
+        tasks = [
+            asyncio.create_task(thread.download_worker(queue, "/tmp", 8))
+            for _ in range(5)
+        ]
+        await queue.join()
+        thread.is_running = False
+        for t in tasks:
+            t.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    asyncio.run(main())
+    assert peak[0] == 2
+    assert thread._active_downloads == 0
+
+
+def test_waiting_worker_starts_as_soon_as_a_slot_frees(tmp_path):
+    started = []
+    release = {}
+
+    async def fake_download(file_url, folder, file_index, total_files):
+        started.append(file_url)
+        release[file_url] = asyncio.Event()
+        await release[file_url].wait()
+
+    thread = make_download_thread(tmp_path, 1, fake_download)
+
+    async def main():
+        queue = asyncio.Queue()
+        for i in range(2):
+            queue.put_nowait((i, f"u{i}"))
+        tasks = [
+            asyncio.create_task(thread.download_worker(queue, "/tmp", 2))
+            for _ in range(2)
+        ]
+        for _ in range(5):
+            await asyncio.sleep(0)
+        assert started == ["u0"]
+        release["u0"].set()
+        # No polling interval: the waiting worker runs within a few turns.
+        for _ in range(5):
+            await asyncio.sleep(0)
+        assert started == ["u0", "u1"]
+        release["u1"].set()
+        await queue.join()
+        for t in tasks:
+            t.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    asyncio.run(main())
+    assert thread._active_downloads == 0
+
+
+def test_fixed_controller_keeps_configured_value():
+    # Threads treated max_concurrent literally before the controller existed.
+    assert FixedConcurrency(0).limit == 0
+    assert FixedConcurrency(0).max_limit == 0
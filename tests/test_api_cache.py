@@ -0,0 +1,216 @@
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+import requests
+
+from kemonodownloader.api_cache import (
+    ACCESS_GRANULARITY,
+    OFFLINE_MISS_STATUS,
+    ApiResponseCache,
+    CachingAdapter,
+    get_api_cache,
+    is_api_url,
+)
+from kemonodownloader.rate_limiter import get_rate_limiter
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+class ApiHandler(BaseHTTPRequestHandler):
+    """Serves JSON with an ETag and honours ``If-None-Match``."""
+
+    hits: list = []
+
+    def do_GET(self):
+        type(self).hits.append((self.path, self.headers.get("If-None-Match")))
+        body = json.dumps({"path": self.path, "n": len(type(self).hits)}).encode()
+        etag = '"v1"'
+        if self.headers.get("If-None-Match") == etag:
+            self.send_response(304)
+            self.send_header("ETag", etag)
+            self.end_headers()
+            return
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("ETag", etag)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def server():
+    ApiHandler.hits = []
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), ApiHandler)
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    get_rate_limiter().reset()
+    yield f"http://127.0.0.1:{httpd.server_address[1]}"
+    httpd.shutdown()
+    httpd.server_close()
+    get_rate_limiter().reset()
+
+
+@pytest.fixture
+def cache(tmp_path, monkeypatch):
+    clock = FakeClock()
+    shared = get_api_cache()
+    monkeypatch.setattr(shared, "_clock", clock)
+    shared.configure(str(tmp_path / "api.db"), ttl=60, max_bytes=1 << 20)
+    shared.clock = clock
+    return shared
+
+
+@pytest.fixture
+def session():
+    s = requests.Session()
+    s.trust_env = False
+    s.mount("http://", CachingAdapter())
+    return s
+
+
+def test_is_api_url():
+    assert is_api_url("https://kemono.cr/api/v1/fanbox/user/1/post/2")
+    assert not is_api_url("https://n1.kemono.cr/data/ab/cd/file.png")
+
+
+def test_fresh_post_is_served_from_disk(server, cache, session):
+    url = f"{server}/api/v1/fanbox/user/1/post/2"
+    first = session.get(url)
+    second = session.get(url)
+
+    assert first.json() == second.json()
+    assert getattr(second, "from_cache", False)
+    assert len(ApiHandler.hits) == 1
+
+
+def test_stale_post_is_revalidated_with_etag(server, cache, session):
+    url = f"{server}/api/v1/fanbox/user/1/post/2"
+    first = session.get(url)
+    cache.clock.now += 61
+    second = session.get(url)
+
+    assert second.status_code == 200
+    assert second.json() == first.json()
+    assert ApiHandler.hits[1] == ("/api/v1/fanbox/user/1/post/2", '"v1"')
+    # The 304 restarts the TTL.
+    session.get(url)
+    assert len(ApiHandler.hits) == 2
+
+
+def test_listing_pages_are_always_revalidated(server, cache, session):
+    url = f"{server}/api/v1/fanbox/user/1/posts?o=0"
+    session.get(url)
+    session.get(url)
+
+    assert [etag for _, etag in ApiHandler.hits] == [None, '"v1"']
+
+
+def test_file_urls_and_disabled_cache_pass_through(server, cache, session):
+    session.get(f"{server}/data/ab/file.png")
+    session.get(f"{server}/data/ab/file.png")
+    assert len(ApiHandler.hits) == 2
+
+    cache.configure(None)
+    url = f"{server}/api/v1/fanbox/user/1/post/2"
+    session.get(url)
+    session.get(url)
+    assert len(ApiHandler.hits) == 4
+
+
+def test_offline_mode_answers_from_cache_only(server, cache, session):
+    url = f"{server}/api/v1/fanbox/user/1/post/2"
+    session.get(url)
+    cache.configure(cache.path, offline=True)
+    cache.clock.now += 10_000
+
+    assert session.get(url).status_code == 200
+    miss = session.get(f"{server}/api/v1/fanbox/user/1/post/3")
+    assert miss.status_code == OFFLINE_MISS_STATUS
+    assert len(ApiHandler.hits) == 1
+
+
+def test_least_recently_used_entries_are_evicted(tmp_path):
+    clock = FakeClock()
+    cache = ApiResponseCache(str(tmp_path / "api.db"), max_bytes=250, clock=clock)
+    for name in ("a", "b", "c"):
+        clock.now += 1
+        cache.store(f"https://x/api/post/{name}", 200, {}, b"x" * 100)
+    # "a" was evicted when "c" pushed the total past the cap.
+    assert cache.get("https://x/api/post/a") is None
+
+    clock.now += ACCESS_GRANULARITY
+    assert cache.get("https://x/api/post/b") is not None  # now most recent
+    clock.now += 1
+    cache.store("https://x/api/post/d", 200, {}, b"x" * 100)
+
+    assert cache.get("https://x/api/post/c") is None
+    assert cache.get("https://x/api/post/b") is not None
+    assert cache.total_size() == 200
+
+
+def test_repeated_hits_do_not_write(tmp_path):
+    clock = FakeClock()
+    cache = ApiResponseCache(str(tmp_path / "api.db"), clock=clock)
+    cache.store("https://x/api/post/1", 200, {}, b"{}")
+    conn = cache._connection()
+    changes = conn.total_changes
+
+    for _ in range(5):
+        clock.now += 1
+        assert cache.get("https://x/api/post/1") is not None
+    assert conn.total_changes == changes
+
+    clock.now += ACCESS_GRANULARITY
+    cache.get("https://x/api/post/1")
+    assert conn.total_changes == changes + 1
+
+
+def test_entries_persist_and_drop_encoding_headers(tmp_path):
+    path = str(tmp_path / "api.db")
+    ApiResponseCache(path).store(
+        "https://x/api/post/1",
+        200,
+        {"Content-Encoding": "gzip", "ETag": '"e"', "Last-Modified": "yesterday"},
+        b"{}",
+    )
+    entry = ApiResponseCache(path).get("https://x/api/post/1")
+
+    assert entry.body == b"{}"
+    assert entry.etag == '"e"'
+    assert entry.last_modified == "yesterday"
+    assert "Content-Encoding" not in entry.headers
+
+
+def test_each_thread_keeps_one_connection_and_reads_during_writes(tmp_path):
+    cache = ApiResponseCache(str(tmp_path / "api.db"))
+    cache.store("https://x/api/post/1", 200, {}, b"{}")
+    conn = cache._connection()
+    assert cache.get("https://x/api/post/1") is not None
+    assert cache._connection() is conn
+
+    found = []
+    with cache._write_lock:
+        # A lookup from another thread does not queue behind a writer.
+        reader = threading.Thread(
+            target=lambda: found.append(cache.get("https://x/api/post/1"))
+        )
+        reader.start()
+        reader.join(5)
+    assert found and found[0].body == b"{}"
+
+    cache.set_path(str(tmp_path / "other.db"))
+    assert cache._connection() is not conn
+    assert cache.get("https://x/api/post/1") is None
+    cache.close()
@@ -42,6 +42,18 @@ def mock_app_dependencies(monkeypatch):
         def is_auto_check_updates_enabled(self):
             return False
 
+        def is_api_cache_enabled(self):
+            return False
+
+        def get_api_cache_ttl_hours(self):
+            return 24
+
+        def get_api_cache_max_mb(self):
+            return 256
+
+        def is_api_cache_offline(self):
+            return False
+
         def refresh_ui(self):
             pass
 
@@ -18,11 +18,17 @@ import time
 from unittest.mock import patch
 
 try:
-    from kemonodownloader.creator_downloader import CreatorDownloadThread
+    from kemonodownloader.creator_downloader import (
+        CreatorDownloadThread,
+        ThreadSettings,
+    )
     from kemonodownloader.post_downloader import DownloadThread
 except ImportError:
     sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(__file__)), "src"))
-    from kemonodownloader.creator_downloader import CreatorDownloadThread
+    from kemonodownloader.creator_downloader import (
+        CreatorDownloadThread,
+        ThreadSettings,
+    )
     from kemonodownloader.post_downloader import DownloadThread
 
 
@@ -31,28 +37,6 @@ except ImportError:
 # ---------------------------------------------------------------------------
 
 
-class DummySettingsTab:
-    """Minimal settings tab used by both downloaders."""
-
-    def get_creator_filename_template(self):
-        return "{post_id}_{orig_name}"
-
-    def get_creator_folder_strategy(self):
-        return "per_post"
-
-
-class DummySettings:
-    """Minimal settings container."""
-
-    def __init__(self):
-        self.settings_tab = DummySettingsTab()
-        self.file_download_max_retries = 1
-        self.creator_posts_max_attempts = 1
-        self.post_data_max_retries = 1
-        self.api_request_max_retries = 1
-        self.simultaneous_downloads = 2
-
-
 FAKE_FILES = [f"https://kemono.cr/data/ab/{i:02x}/fake_{i}.jpg" for i in range(5)]
 
 FAKE_POST_MAP = {url: "p1" for url in FAKE_FILES}
@@ -62,7 +46,7 @@ FAKE_POST_TITLES = {
 }
 
 
-def _make_creator_thread(tmp_path, files=None, max_concurrent=3):
+def _make_creator_thread(tmp_path, settings_tab, files=None, max_concurrent=3):
     """Create a CreatorDownloadThread without network."""
     files = files if files is not None else FAKE_FILES
     t = CreatorDownloadThread(
@@ -76,7 +60,7 @@ def _make_creator_thread(tmp_path, files=None, max_concurrent=3):
         other_files_dir=str(tmp_path / "other"),
         post_titles_map=dict(FAKE_POST_TITLES),
         auto_rename_enabled=False,
-        settings=DummySettings(),
+        settings=ThreadSettings(1, 1, 1, 1, 2, settings_tab=settings_tab),
         max_concurrent=max_concurrent,
     )
     # Prevent real network calls
@@ -84,7 +68,7 @@ def _make_creator_thread(tmp_path, files=None, max_concurrent=3):
     return t
 
 
-def _make_post_thread(tmp_path, files=None, max_concurrent=3):
+def _make_post_thread(tmp_path, settings_tab, files=None, max_concurrent=3):
     """Create a post-downloader DownloadThread without network."""
     files = files if files is not None else FAKE_FILES
     t = DownloadThread(
@@ -95,7 +79,7 @@ def _make_post_thread(tmp_path, files=None, max_concurrent=3):
         console=None,
         other_files_dir=str(tmp_path / "other"),
         post_id="p1",
-        settings=DummySettings(),
+        settings=ThreadSettings(1, 1, 1, 1, 2, settings_tab=settings_tab),
         max_concurrent=max_concurrent,
     )
     # Prevent real network calls
@@ -123,28 +107,28 @@ async def _noop_async_download_file(self, *args, **kwargs):
 class TestCreatorCancelStress:
     """Rapid cancel/download cycling for CreatorDownloadThread."""
 
-    def test_cancel_before_start(self, tmp_path):
+    def test_cancel_before_start(self, tmp_path, settings_tab):
         """Cancel before start() — run() should exit immediately."""
-        t = _make_creator_thread(tmp_path)
+        t = _make_creator_thread(tmp_path, settings_tab)
         t.stop()
         # run() directly (no QThread::start) — should return instantly
         t.run()
         assert t._destroyed is True
         assert t.is_running is False
 
-    def test_cancel_immediately_after_start(self, tmp_path):
+    def test_cancel_immediately_after_start(self, tmp_path, settings_tab):
         """Start then stop() within microseconds."""
-        t = _make_creator_thread(tmp_path, files=[])
+        t = _make_creator_thread(tmp_path, settings_tab, files=[])
         t.start()
         t.stop()
         finished = t.wait(5000)
         assert finished is True
         assert t._destroyed is True
 
-    def test_rapid_start_cancel_cycles(self, tmp_path):
+    def test_rapid_start_cancel_cycles(self, tmp_path, settings_tab):
         """Create, start, cancel rapidly — 10 cycles without crash."""
         for _ in range(10):
-            t = _make_creator_thread(tmp_path, files=[])
+            t = _make_creator_thread(tmp_path, settings_tab, files=[])
             t.start()
             t.stop()
             finished = t.wait(5000)
@@ -155,9 +139,9 @@ class TestCreatorCancelStress:
         "kemonodownloader.creator_downloader.CreatorDownloadThread.download_file",
         new=_noop_async_download_file,
     )
-    def test_cancel_during_active_downloads(self, tmp_path):
+    def test_cancel_during_active_downloads(self, tmp_path, settings_tab):
         """Cancel while workers are actively downloading."""
-        t = _make_creator_thread(tmp_path, max_concurrent=2)
+        t = _make_creator_thread(tmp_path, settings_tab, max_concurrent=2)
         t.start()
         # Give workers a moment to start
         time.sleep(0.05)
@@ -170,19 +154,19 @@ class TestCreatorCancelStress:
         "kemonodownloader.creator_downloader.CreatorDownloadThread.download_file",
         new=_noop_async_download_file,
     )
-    def test_cancel_download_cancel_rapid_cycle(self, tmp_path):
+    def test_cancel_download_cancel_rapid_cycle(self, tmp_path, settings_tab):
         """Start → cancel → start → cancel rapid cycling with files."""
         for _ in range(5):
-            t = _make_creator_thread(tmp_path, max_concurrent=2)
+            t = _make_creator_thread(tmp_path, settings_tab, max_concurrent=2)
             t.start()
             time.sleep(0.01)
             t.stop()
             finished = t.wait(10000)
             assert finished is True
 
-    def test_destroyed_flag_prevents_signal_after_stop(self, tmp_path):
+    def test_destroyed_flag_prevents_signal_after_stop(self, tmp_path, settings_tab):
         """After stop(), _safe_emit must be a no-op."""
-        t = _make_creator_thread(tmp_path, files=[])
+        t = _make_creator_thread(tmp_path, settings_tab, files=[])
         received = []
         t.log.connect(lambda msg, lvl: received.append((msg, lvl)))
         t.stop()
@@ -190,9 +174,9 @@ class TestCreatorCancelStress:
         t._safe_emit(t.log, "should not arrive", "INFO")
         assert len(received) == 0
 
-    def test_no_qthread_destroyed_warning(self, tmp_path, capsys):
+    def test_no_qthread_destroyed_warning(self, tmp_path, settings_tab, capsys):
         """Verify no 'QThread: Destroyed while thread is still running' on stderr."""
-        t = _make_creator_thread(tmp_path, files=[])
+        t = _make_creator_thread(tmp_path, settings_tab, files=[])
         t.start()
         t.stop()
         t.wait(5000)
@@ -210,36 +194,36 @@ class TestCreatorCancelStress:
 class TestPostCancelStress:
     """Rapid cancel/download cycling for post_downloader DownloadThread."""
 
-    def test_cancel_before_start(self, tmp_path):
+    def test_cancel_before_start(self, tmp_path, settings_tab):
         """Cancel before start() — run() should exit cleanly."""
-        t = _make_post_thread(tmp_path)
+        t = _make_post_thread(tmp_path, settings_tab)
         t.stop()
         t.run()
         assert t._destroyed is True
         assert t.is_running is False
 
-    def test_cancel_immediately_after_start(self, tmp_path):
+    def test_cancel_immediately_after_start(self, tmp_path, settings_tab):
         """Start then stop() within microseconds."""
-        t = _make_post_thread(tmp_path, files=[])
+        t = _make_post_thread(tmp_path, settings_tab, files=[])
         t.start()
         t.stop()
         finished = t.wait(5000)
         assert finished is True
         assert t._destroyed is True
 
-    def test_rapid_start_cancel_cycles(self, tmp_path):
+    def test_rapid_start_cancel_cycles(self, tmp_path, settings_tab):
         """Create, start, cancel rapidly — 10 cycles without crash."""
         for _ in range(10):
-            t = _make_post_thread(tmp_path, files=[])
+            t = _make_post_thread(tmp_path, settings_tab, files=[])
             t.start()
             t.stop()
             finished = t.wait(5000)
             assert finished is True
             assert t._destroyed is True
 
-    def test_cancel_during_active_downloads(self, tmp_path):
+    def test_cancel_during_active_downloads(self, tmp_path, settings_tab):
         """Cancel while daemon workers are actively downloading."""
-        t = _make_post_thread(tmp_path, max_concurrent=2)
+        t = _make_post_thread(tmp_path, settings_tab, max_concurrent=2)
         # Patch download_file to simulate slow work
         t.download_file = lambda *a, **kw: time.sleep(0.05)
         t.start()
@@ -249,27 +233,27 @@ class TestPostCancelStress:
         assert finished is True
         assert t._destroyed is True
 
-    def test_cancel_download_cancel_rapid_cycle(self, tmp_path):
+    def test_cancel_download_cancel_rapid_cycle(self, tmp_path, settings_tab):
         """Start → cancel → start → cancel rapid cycling with files."""
         for _ in range(5):
-            t = _make_post_thread(tmp_path, max_concurrent=2, files=[])
+            t = _make_post_thread(tmp_path, settings_tab, max_concurrent=2, files=[])
             t.start()
             time.sleep(0.01)
             t.stop()
             finished = t.wait(5000)
             assert finished is True
 
-    def test_destroyed_flag_prevents_signal_after_stop(self, tmp_path):
+    def test_destroyed_flag_prevents_signal_after_stop(self, tmp_path, settings_tab):
         """After stop(), _safe_emit on the post thread is a no-op (via _destroyed)."""
-        t = _make_post_thread(tmp_path, files=[])
+        t = _make_post_thread(tmp_path, settings_tab, files=[])
         t.stop()
         # Direct emit should raise RuntimeError only if C++ is gone;
         # but _destroyed=True means workers won't even try.
         assert t._destroyed is True
 
-    def test_workers_join_before_run_returns(self, tmp_path):
+    def test_workers_join_before_run_returns(self, tmp_path, settings_tab):
         """Verify that all daemon worker threads have terminated after run() returns."""
-        t = _make_post_thread(tmp_path, max_concurrent=2, files=[])
+        t = _make_post_thread(tmp_path, settings_tab, max_concurrent=2, files=[])
         alive_before = threading.active_count()
         t.start()
         t.wait(5000)
@@ -288,26 +272,26 @@ class TestPostCancelStress:
 class TestMixedCancelStress:
     """Interleave creator and post cancel cycles to stress thread safety."""
 
-    def test_interleaved_cancel_cycles(self, tmp_path):
+    def test_interleaved_cancel_cycles(self, tmp_path, settings_tab):
         """Alternate between creator and post threads, cancelling each promptly."""
         for i in range(5):
             if i % 2 == 0:
-                t = _make_creator_thread(tmp_path, files=[])
+                t = _make_creator_thread(tmp_path, settings_tab, files=[])
             else:
-                t = _make_post_thread(tmp_path, files=[])
+                t = _make_post_thread(tmp_path, settings_tab, files=[])
             t.start()
             t.stop()
             finished = t.wait(5000)
             assert finished is True
 
-    def test_parallel_threads_with_cancel(self, tmp_path):
+    def test_parallel_threads_with_cancel(self, tmp_path, settings_tab):
         """Start multiple threads simultaneously, cancel all."""
         threads = []
         for i in range(4):
             if i % 2 == 0:
-                t = _make_creator_thread(tmp_path, files=[])
+                t = _make_creator_thread(tmp_path, settings_tab, files=[])
             else:
-                t = _make_post_thread(tmp_path, files=[])
+                t = _make_post_thread(tmp_path, settings_tab, files=[])
             t.start()
             threads.append(t)
 
@@ -0,0 +1,81 @@
+import threading
+import time
+
+import kemonodownloader.creator_downloader as cd
+from kemonodownloader.connection_gate import (
+    DEFAULT_WIDTH,
+    PER_HOST,
+    SERIAL,
+    ConnectionGate,
+    default_policy,
+    get_connection_gate,
+)
+
+A = "https://kemono.cr/data/a.jpg"
+A2 = "https://kemono.cr/data/b.jpg"
+B = "https://coomer.st/data/c.jpg"
+
+
+def give_up_after(tries):
+    left = [tries]
+
+    def should_continue():
+        left[0] -= 1
+        return left[0] >= 0
+
+    return should_continue
+
+
+def test_platform_default_serialises_only_on_windows():
+    assert default_policy("win32") == SERIAL
+    assert default_policy("linux") == PER_HOST
+    gate = ConnectionGate(platform="linux")
+    assert (gate.policy, gate.width) == (PER_HOST, DEFAULT_WIDTH)
+
+
+def test_serial_policy_holds_every_host():
+    gate = ConnectionGate(platform="win32")
+    held = gate.acquire(A)
+    assert held is not None
+    assert gate.acquire(B, give_up_after(2)) is None
+    held.release()
+    assert gate.acquire(B, give_up_after(2)) is not None
+
+
+def test_per_host_policy_limits_each_host_separately():
+    gate = ConnectionGate(width=2, platform="win32")
+    assert gate.policy == PER_HOST
+    first, second = gate.acquire(A), gate.acquire(A2)
+    assert first is not None and second is not None and first is not second
+    assert gate.acquire(A, give_up_after(2)) is None
+    assert gate.acquire(B, give_up_after(1)) is not None
+
+
+def test_waiter_gets_the_slot_once_it_is_released():
+    gate = ConnectionGate(width=1)
+    held = gate.acquire(A)
+    timer = threading.Timer(0.1, held.release)
+    timer.start()
+    started = time.monotonic()
+    with gate.establishing(A) as ok:
+        assert ok
+        assert time.monotonic() - started < 2
+    timer.join()
+    assert gate.acquire(A, give_up_after(1)) is not None
+
+
+def test_cancelled_waiter_does_not_connect():
+    gate = ConnectionGate(width=1)
+    gate.acquire(A)
+    with gate.establishing(A, give_up_after(1)) as ok:
+        assert not ok
+
+
+def test_download_scheduler_configuration_sets_the_width(settings_tab):
+    gate = get_connection_gate()
+    settings_tab.settings["connection_setup_width"] = 3
+    try:
+        cd.configure_download_scheduler(settings_tab, 5)
+        assert (gate.policy, gate.width) == (PER_HOST, 3)
+    finally:
+        gate.configure(0)
@@ -0,0 +1,246 @@
+import asyncio
+import hashlib
+import os
+import sys
+
+import pytest
+from aiohttp import web
+
+from kemonodownloader import aiohttp_engine
+from kemonodownloader.creator_downloader import CreatorDownloadThread, ThreadSettings
+from kemonodownloader.resumable import DownloadCancelled
+
+CONTENT = b"0123456789" * 2000
+
+
+async def _start_server(handler):
+    app = web.Application()
+    app.router.add_get("/files/{name}", handler)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = runner.addresses[0][1]
+    return runner, f"http://127.0.0.1:{port}"
+
+
+_real_sleep = asyncio.sleep
+
+
+async def _instant_sleep(delay, *args, **kwargs):
+    await _real_sleep(0)
+
+
+async def _ok_handler(request):
+    return web.Response(body=CONTENT, content_type="application/octet-stream")
+
+
+def make_settings(settings_tab, engine="aiohttp", retries=1, proxy=None):
+    if proxy:
+        settings_tab.settings.update(
+            use_proxy=True, proxy_type="custom", custom_proxy_url=proxy
+        )
+    return ThreadSettings(
+        creator_posts_max_attempts=1,
+        post_data_max_retries=1,
+        file_download_max_retries=retries,
+        api_request_max_retries=1,
+        simultaneous_downloads=2,
+        settings_tab=settings_tab,
+        download_engine=engine,
+    )
+
+
+def make_thread(tmp_path, file_url, settings):
+    download_folder = str(tmp_path / "downloads")
+    os.makedirs(download_folder, exist_ok=True)
+    return CreatorDownloadThread(
+        service="svc",
+        creator_id="creator123",
+        download_folder=download_folder,
+        selected_posts=["1"],
+        files_to_download=[file_url],
+        files_to_posts_map={file_url: "1"},
+        console=None,
+        other_files_dir=str(tmp_path / "other"),
+        post_titles_map={("svc", "creator123", "1"): "MyPost"},
+        auto_rename_enabled=False,
+        settings=settings,
+        max_concurrent=2,
+    )
+
+
+def _no_requests_session(settings_tab=None):
+    raise AssertionError("requests session must not be used by the aiohttp engine")
+
+
+def test_stream_to_file_writes_body_and_reports_sizes(tmp_path):
+    target = str(tmp_path / "out.bin")
+    progress = []
+
+    async def scenario():
+        runner, base = await _start_server(_ok_handler)
+        try:
+            session, proxy = aiohttp_engine.create_client_session(None, limit=2)
+            async with session:
+                return await aiohttp_engine.stream_to_file(
+                    session,
+                    f"{base}/files/a.bin",
+                    target,
+                    proxy=proxy,
+                    on_chunk=lambda done, total: progress.append((done, total)),
+                )
+        finally:
+            await runner.cleanup()
+
+    file_size, downloaded = asyncio.run(scenario())
+    assert file_size == len(CONTENT)
+    assert downloaded == len(CONTENT)
+    with open(target, "rb") as f:
+        assert f.read() == CONTENT
+    assert progress[-1] == (len(CONTENT), len(CONTENT))
+
+
+def test_stream_to_file_aborts_when_cancelled(tmp_path):
+    target = str(tmp_path / "out.bin")
+
+    async def scenario():
+        runner, base = await _start_server(_ok_handler)
+        try:
+            session, _ = aiohttp_engine.create_client_session(None)
+            async with session:
+                await aiohttp_engine.stream_to_file(
+                    session,
+                    f"{base}/files/a.bin",
+                    target,
+                    should_continue=lambda: False,
+                )
+        finally:
+            await runner.cleanup()
+
+    with pytest.raises(DownloadCancelled):
+        asyncio.run(scenario())
+
+
+def test_create_client_session_uses_http_proxy_per_request():
+    async def scenario():
+        session, proxy = aiohttp_engine.create_client_session(
+            {"http": "http://127.0.0.1:8080", "https": "http://127.0.0.1:8080"}
+        )
+        await session.close()
+        return proxy
+
+    assert asyncio.run(scenario()) == "http://127.0.0.1:8080"
+
+
+def test_create_client_session_socks_without_aiohttp_socks(monkeypatch):
+    monkeypatch.setitem(sys.modules, "aiohttp_socks", None)
+    assert aiohttp_engine.socks_supported() is False
+    with pytest.raises(aiohttp_engine.UnsupportedProxyError):
+        aiohttp_engine.create_client_session({"https": "socks5h://127.0.0.1:9050"})
+
+
+def test_is_socks_proxy():
+    assert aiohttp_engine.is_socks_proxy("socks5h://127.0.0.1:9050")
+    assert aiohttp_engine.is_socks_proxy("socks4://127.0.0.1:1080")
+    assert not aiohttp_engine.is_socks_proxy("http://127.0.0.1:8080")
+    assert not aiohttp_engine.is_socks_proxy(None)
+
+
+def test_aiohttp_engine_downloads_file_and_updates_hashdb(
+    monkeypatch, tmp_path, settings_tab
+):
+    monkeypatch.setattr(
+        "kemonodownloader.creator_downloader.get_session", _no_requests_session
+    )
+
+    async def scenario():
+        runner, base = await _start_server(_ok_handler)
+        file_url = f"{base}/files/pic.png"
+        thread = make_thread(tmp_path, file_url, make_settings(settings_tab))
+        try:
+            await thread._open_aiohttp_session()
+            assert thread._aio_session is not None
+            await thread.download_file(
+                file_url, thread.download_folder, 0, total_files=1
+            )
+        finally:
+            await thread._close_aiohttp_session()
+            await runner.cleanup()
+        return thread, file_url
+
+    thread, file_url = asyncio.run(scenario())
+    assert file_url in thread.completed_files
+    entry = thread.hash_db.lookup(hashlib.md5(file_url.encode()).hexdigest())
+    assert entry is not None
+    assert entry["file_hash"] == hashlib.md5(CONTENT).hexdigest()
+    assert entry["file_size"] == len(CONTENT)
+    assert thread._aio_session is None
+
+
+def test_aiohttp_engine_retries_server_errors(monkeypatch, tmp_path, settings_tab):
+    monkeypatch.setattr(
+        "kemonodownloader.creator_downloader.get_session", _no_requests_session
+    )
+    monkeypatch.setattr(
+        "kemonodownloader.creator_downloader.asyncio.sleep",
+        _instant_sleep,
+    )
+    calls = {"n": 0}
+
+    async def flaky_handler(request):
+        calls["n"] += 1
+        if calls["n"] == 1:
+            return web.Response(status=503)
+        return web.Response(body=CONTENT)
+
+    async def scenario():
+        runner, base = await _start_server(flaky_handler)
+        file_url = f"{base}/files/pic.png"
+        thread = make_thread(tmp_path, file_url, make_settings(settings_tab, retries=3))
+        try:
+            await thread._open_aiohttp_session()
+            await thread.download_file(
+                file_url, thread.download_folder, 0, total_files=1
+            )
+        finally:
+            await thread._close_aiohttp_session()
+            await runner.cleanup()
+        return thread, file_url
+
+    thread, file_url = asyncio.run(scenario())
+    assert calls["n"] == 2
+    assert file_url in thread.completed_files
+    assert file_url not in thread.failed_files
+
+
+def test_aiohttp_engine_falls_back_for_socks_without_support(
+    monkeypatch, tmp_path, settings_tab
+):
+    monkeypatch.setitem(sys.modules, "aiohttp_socks", None)
+    settings = make_settings(settings_tab, proxy="socks5h://127.0.0.1:9050")
+    thread = make_thread(tmp_path, "https://kemono.cr/files/a.png", settings)
+    logs = []
+    thread.log.connect(lambda msg, level: logs.append(level))
+
+    asyncio.run(thread._open_aiohttp_session())
+
+    assert thread._aio_session is None
+    assert thread.download_engine == "requests"
+    assert "WARNING" in logs
+
+
+def test_requests_engine_does_not_open_aiohttp_session(tmp_path, settings_tab):
+    thread = make_thread(
+        tmp_path,
+        "https://kemono.cr/files/a.png",
+        make_settings(settings_tab, engine="requests"),
+    )
+    asyncio.run(thread._open_aiohttp_session())
+    assert thread._aio_session is None
+
+
+def test_thread_defaults_to_requests_engine_for_legacy_settings(tmp_path):
+    settings = ThreadSettings(1, 1, 1, 1, 1, settings_tab=None)
+    thread = make_thread(tmp_path, "https://kemono.cr/files/a.png", settings)
+    assert thread.download_engine == "requests"
@@ -97,17 +97,9 @@ def test_detect_files_main_attachments_and_content(qapp):
     assert any("pic.webp" in f[0] or "pic.webp" in f[1] for f in files3)
 
 
-def test_generate_filename_and_folder_variants(qapp, tmp_path):
+def test_generate_filename_and_folder_variants(qapp, tmp_path, settings_tab):
     # Minimal settings object exposing settings_tab methods
-    class SettingsTab:
-        def get_creator_filename_template(self):
-            return "{post_id}_{orig_name}"
-
-        def get_creator_folder_strategy(self):
-            return "per_post"
-
-    class Settings:
-        settings_tab = SettingsTab()
+    settings = cd.ThreadSettings(1, 1, 1, 1, 1, settings_tab=settings_tab)
 
     download_folder = str(tmp_path)
     selected_posts = ["111"]
@@ -126,7 +118,7 @@ def test_generate_filename_and_folder_variants(qapp, tmp_path):
         str(tmp_path),
         post_titles_map,
         True,
-        Settings(),
+        settings,
         1,
     )
 
@@ -227,7 +219,7 @@ def test_fetch_and_detect_files_retry(monkeypatch):
 
     def fake_get_session(tab=None):
         class S:
-            def get(self, url, headers=None):
+            def get(self, url, headers=None, timeout=None):
                 calls["count"] += 1
                 if calls["count"] == 1:
                     return FakeResp429()
@@ -257,7 +249,7 @@ def test_fetch_and_detect_files_retry(monkeypatch):
     assert res is not None and res[0] == "9"
 
 
-def test_download_text_sync_writes_file(monkeypatch, qapp, tmp_path):
+def test_download_text_sync_writes_file(monkeypatch, qapp, tmp_path, settings_tab):
     # Fake session returning a post with HTML content
     class FakeResp:
         status_code = 200
@@ -274,11 +266,7 @@ def test_download_text_sync_writes_file(monkeypatch, qapp, tmp_path):
 
     monkeypatch.setattr(cd, "get_session", fake_get_session)
 
-    class SettingsTab:
-        pass
-
-    class Settings:
-        settings_tab = SettingsTab()
+    settings = cd.ThreadSettings(1, 1, 1, 1, 1, settings_tab=settings_tab)
 
     download_folder = str(tmp_path)
     thread = cd.CreatorDownloadThread(
@@ -292,7 +280,7 @@ def test_download_text_sync_writes_file(monkeypatch, qapp, tmp_path):
         download_folder,
         {},
         True,
-        Settings(),
+        settings,
         1,
     )
 
@@ -306,13 +294,9 @@ def test_download_text_sync_writes_file(monkeypatch, qapp, tmp_path):
     assert "Hello" in data
 
 
-def test_creator_download_thread_run_no_files(qapp, tmp_path):
+def test_creator_download_thread_run_no_files(qapp, tmp_path, settings_tab):
     # Ensure run() handles case with no files (logs and exits cleanly)
-    class SettingsTab:
-        pass
-
-    class Settings:
-        settings_tab = SettingsTab()
+    settings = cd.ThreadSettings(1, 1, 1, 1, 1, settings_tab=settings_tab)
 
     download_folder = str(tmp_path)
     thread = cd.CreatorDownloadThread(
@@ -326,7 +310,7 @@ def test_creator_download_thread_run_no_files(qapp, tmp_path):
         download_folder,
         {},
         True,
-        Settings(),
+        settings,
         1,
     )
     # Avoid network calls
@@ -335,12 +319,8 @@ def test_creator_download_thread_run_no_files(qapp, tmp_path):
     thread.run()
 
 
-def test_check_post_completion_emits(qapp):
-    class SettingsTab:
-        pass
-
-    class Settings:
-        settings_tab = SettingsTab()
+def test_check_post_completion_emits(qapp, settings_tab):
+    settings = cd.ThreadSettings(1, 1, 1, 1, 1, settings_tab=settings_tab)
 
     thread = cd.CreatorDownloadThread(
         "svc",
@@ -353,7 +333,7 @@ def test_check_post_completion_emits(qapp):
         "/tmp",
         {},
         True,
-        Settings(),
+        settings,
         1,
     )
     thread.post_files_map = {"p1": ["u1", "u2"]}
@@ -363,15 +343,11 @@ def test_check_post_completion_emits(qapp):
     thread.check_post_completion("u1")
     assert "p1" in signalled
 
-    def test_download_file_hash_lookup_shortcircuit(qapp, tmp_path):
+    def test_download_file_hash_lookup_shortcircuit(qapp, tmp_path, settings_tab):
         import asyncio
         import hashlib
 
-        class SettingsTab:
-            pass
-
-        class Settings:
-            settings_tab = SettingsTab()
+        settings = cd.ThreadSettings(1, 1, 1, 1, 1, settings_tab=settings_tab)
 
         # Create a small file to represent an already-downloaded file
         file_path = tmp_path / "existing.dat"
@@ -393,7 +369,7 @@ def test_check_post_completion_emits(qapp):
             str(tmp_path),
             {("svc", "creator", "1"): "Title"},
             True,
-            Settings(),
+            settings,
             1,
         )
 
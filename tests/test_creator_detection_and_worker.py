@@ -7,6 +7,7 @@ from kemonodownloader.creator_downloader import (
     CreatorDownloadThread,
     FilePreparationThread,
     PostDetectionThread,
+    ThreadSettings,
 )
 
 
@@ -69,7 +70,7 @@ def test_detect_files_collects_main_attachments_content():
             return self._v
 
     creator_ext_checks = {".png": CB(True), ".jpg": CB(True), ".gif": CB(True)}
-    settings = SimpleNamespace(settings_tab=None)
+    settings = ThreadSettings(1, 1, 1, 1, 1, settings_tab=None)
 
     thread = FilePreparationThread(
         post_ids=["1"],
@@ -100,7 +101,7 @@ def test_detect_files_collects_main_attachments_content():
 
 def test_download_worker_processes_one(tmp_path):
     file_url = "https://kemono.cr/files/x.png"
-    settings = SimpleNamespace(settings_tab=None, file_download_max_retries=1)
+    settings = ThreadSettings(1, 1, 1, 1, 1, settings_tab=None)
     thread = CreatorDownloadThread(
         service="svc",
         creator_id="creator123",
@@ -137,7 +138,7 @@ def test_download_worker_processes_one(tmp_path):
 
 def test_download_text_sync_writes_file(monkeypatch, tmp_path):
     file_url = "https://kemono.cr/files/x.png"
-    settings = SimpleNamespace(settings_tab=None)
+    settings = ThreadSettings(1, 1, 1, 1, 1, settings_tab=None)
     thread = CreatorDownloadThread(
         service="svc",
         creator_id="creator123",
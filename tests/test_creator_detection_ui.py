@@ -21,6 +21,8 @@ class FakeSignal:
 
 class FakePostDetectionThread:
     def __init__(self, url, post_titles_map, settings):
+        self.post_records = {}
+        self.sync_update = None
         self.finished = FakeSignal()
         self.posts_batch = FakeSignal()
         self.log = FakeSignal()
@@ -34,30 +36,29 @@ class FakePostDetectionThread:
         self.finished.emit(sample)
 
 
-def make_parent(tmp_path):
+def make_parent(tmp_path, settings_tab):
     parent = SimpleNamespace()
     parent.cache_folder = str(tmp_path / "cache")
     parent.other_files_folder = str(tmp_path / "other")
     parent.download_folder = str(tmp_path / "dl")
-    parent.settings_tab = None
     parent.ensure_folders_exist = lambda: None
     parent.post_tab = SimpleNamespace()
     parent.creator_tab = SimpleNamespace()
-    # settings_tab must provide a settings_applied signal with connect()
-    parent.settings_tab = SimpleNamespace()
-    parent.settings_tab.settings_applied = FakeSignal()
-    parent.settings_tab.language_changed = FakeSignal()
-    # Provide minimal getters used by CreatorDownloaderTab._create_thread_settings
-    parent.settings_tab.get_creator_posts_max_attempts = lambda: 1
-    parent.settings_tab.get_post_data_max_retries = lambda: 1
-    parent.settings_tab.get_file_download_max_retries = lambda: 1
-    parent.settings_tab.get_api_request_max_retries = lambda: 1
-    parent.settings_tab.get_simultaneous_downloads = lambda: 1
+    settings_tab.settings.update(
+        creator_posts_max_attempts=1,
+        post_data_max_retries=1,
+        file_download_max_retries=1,
+        api_request_max_retries=1,
+        simultaneous_downloads=1,
+    )
+    parent.settings_tab = settings_tab
     return parent
 
 
-def test_check_creator_from_queue_triggers_detection(monkeypatch, tmp_path):
-    parent = make_parent(tmp_path)
+def test_check_creator_from_queue_triggers_detection(
+    monkeypatch, tmp_path, settings_tab
+):
+    parent = make_parent(tmp_path, settings_tab)
     tab = cd.CreatorDownloaderTab(parent)
 
     # Prevent modal dialogs
@@ -1,6 +1,5 @@
 import asyncio
 import hashlib
-from types import SimpleNamespace
 
 import requests
 
@@ -11,7 +10,7 @@ from kemonodownloader.creator_downloader import (
 )
 
 
-def test_get_domain_config_from_files_choice(tmp_path):
+def test_get_domain_config_from_files_choice(tmp_path, settings_tab):
     # When files_to_download present, domain derived from first URL
     url = "https://coomer.st/files/x.png"
     t = CreatorDownloadThread(
@@ -25,7 +24,7 @@ def test_get_domain_config_from_files_choice(tmp_path):
         str(tmp_path),
         {},
         False,
-        ThreadSettings(1, 1, 1, 1, 1, settings_tab=SimpleNamespace()),
+        ThreadSettings(1, 1, 1, 1, 1, settings_tab=settings_tab),
     )
     dom = t._get_domain_config_from_files()
     assert dom["domain"] == "coomer.st"
@@ -42,13 +41,13 @@ def test_get_domain_config_from_files_choice(tmp_path):
         str(tmp_path),
         {},
         False,
-        ThreadSettings(1, 1, 1, 1, 1, settings_tab=SimpleNamespace()),
+        ThreadSettings(1, 1, 1, 1, 1, settings_tab=settings_tab),
     )
     dom2 = t2._get_domain_config_from_files()
     assert dom2["domain"] == "kemono.cr"
 
 
-def test_build_post_files_map_filters(tmp_path):
+def test_build_post_files_map_filters(tmp_path, settings_tab):
     file1 = "u1"
     file2 = "u2"
     t = CreatorDownloadThread(
@@ -62,19 +61,19 @@ def test_build_post_files_map_filters(tmp_path):
         str(tmp_path),
         {},
         False,
-        ThreadSettings(1, 1, 1, 1, 1, settings_tab=SimpleNamespace()),
+        ThreadSettings(1, 1, 1, 1, 1, settings_tab=settings_tab),
     )
     pfm = t.post_files_map
     assert "1" in pfm and file1 in pfm["1"]
     assert "2" in pfm and pfm["2"] == []
 
 
-def test_fetch_creator_and_post_info_populates(monkeypatch, tmp_path):
+def test_fetch_creator_and_post_info_populates(monkeypatch, tmp_path, settings_tab):
     service = "svc"
     creator_id = "C"
     post_id = "42"
 
-    settings = ThreadSettings(1, 1, 1, 1, 1, settings_tab=SimpleNamespace())
+    settings = ThreadSettings(1, 1, 1, 1, 1, settings_tab=settings_tab)
     t = CreatorDownloadThread(
         service,
         creator_id,
@@ -118,12 +117,12 @@ def test_fetch_creator_and_post_info_populates(monkeypatch, tmp_path):
     assert key in t.post_titles_map
 
 
-def test_download_post_text_if_needed_writes_desc(monkeypatch, tmp_path):
+def test_download_post_text_if_needed_writes_desc(monkeypatch, tmp_path, settings_tab):
     service = "svc"
     creator_id = "C"
     post_id = "10"
 
-    settings = ThreadSettings(1, 1, 1, 1, 1, settings_tab=SimpleNamespace())
+    settings = ThreadSettings(1, 1, 1, 1, 1, settings_tab=settings_tab)
     t = CreatorDownloadThread(
         service,
         creator_id,
@@ -159,11 +158,11 @@ def test_download_post_text_if_needed_writes_desc(monkeypatch, tmp_path):
     assert (dest / f"desc_{post_id}.txt").exists()
 
 
-def test_download_file_no_content_length_and_store(monkeypatch, tmp_path):
+def test_download_file_no_content_length_and_store(monkeypatch, tmp_path, settings_tab):
     file_url = "https://kemono.cr/files/nocl.png"
     post_id = "1"
 
-    settings = ThreadSettings(1, 1, 1, 1, 1, settings_tab=SimpleNamespace())
+    settings = ThreadSettings(1, 1, 1, 1, 1, settings_tab=settings_tab)
     settings.file_download_max_retries = 1
     t = CreatorDownloadThread(
         "svc",
@@ -200,29 +199,20 @@ def test_download_file_no_content_length_and_store(monkeypatch, tmp_path):
         "kemonodownloader.creator_downloader.get_session", lambda *a, **k: FakeSession()
     )
 
-    stored = {}
-
-    class FakeHashDB:
-        def lookup(self, h):
-            return None
-
-        def store(self, url_hash, full_path, file_hash, file_url, size):
-            stored[url_hash] = full_path
-
-    t.hash_db = FakeHashDB()
-
     asyncio.run(t.download_file(file_url, str(tmp_path), 0, 1))
 
     assert file_url in t.completed_files
     url_hash = hashlib.md5(file_url.encode()).hexdigest()
-    assert url_hash in stored
+    assert t.hash_db.lookup(url_hash) is not None
 
 
-def test_download_file_request_exception_records_failure(monkeypatch, tmp_path):
+def test_download_file_request_exception_records_failure(
+    monkeypatch, tmp_path, settings_tab
+):
     file_url = "https://kemono.cr/files/fail.png"
     post_id = "1"
 
-    settings = ThreadSettings(1, 1, 1, 1, 1, settings_tab=SimpleNamespace())
+    settings = ThreadSettings(1, 1, 1, 1, 1, settings_tab=settings_tab)
     settings.file_download_max_retries = 1
     t = CreatorDownloadThread(
         "svc",
@@ -251,7 +241,7 @@ def test_download_file_request_exception_records_failure(monkeypatch, tmp_path):
     assert file_url in t.failed_files
 
 
-def test_run_full_download_cycle(monkeypatch, tmp_path):
+def test_run_full_download_cycle(monkeypatch, tmp_path, settings_tab):
     # Set up several files with different behaviors
     base = "https://kemono.cr/files/"
     ok1 = base + "ok1.png"
@@ -261,7 +251,7 @@ def test_run_full_download_cycle(monkeypatch, tmp_path):
 
     post_id = "p"
 
-    settings = ThreadSettings(1, 1, 2, 1, 2, settings_tab=SimpleNamespace())
+    settings = ThreadSettings(1, 1, 2, 1, 2, settings_tab=settings_tab)
     settings.file_download_max_retries = 2
 
     files = [ok1, ok2, mismatch, bad]
@@ -325,18 +315,6 @@ def test_run_full_download_cycle(monkeypatch, tmp_path):
         "kemonodownloader.creator_downloader.get_session", lambda *a, **k: S()
     )
 
-    # Fake HashDB which returns no existing entries
-    stored = {}
-
-    class FakeHashDB:
-        def lookup(self, h):
-            return None
-
-        def store(self, url_hash, full_path, file_hash, file_url, size):
-            stored[url_hash] = full_path
-
-    t.hash_db = FakeHashDB()
-
     # Capture logs (avoid Qt signals)
     t._safe_emit = lambda sig, *a, **k: None
 
@@ -1,5 +1,4 @@
 import asyncio
-from types import SimpleNamespace
 
 import requests
 
@@ -26,9 +25,7 @@ def make_thread(tmp_path, file_url, other_dir=None, settings_retries=2):
     service = "kemono"
     creator_id = "9"
     other = other_dir or str(tmp_path / "other")
-    settings = SimpleNamespace(
-        settings_tab=None, file_download_max_retries=settings_retries
-    )
+    settings = cd.ThreadSettings(1, 1, settings_retries, 1, 1, settings_tab=None)
     t = cd.CreatorDownloadThread(
         service,
         creator_id,
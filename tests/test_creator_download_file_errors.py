@@ -1,5 +1,4 @@
 import asyncio
-from types import SimpleNamespace
 from unittest.mock import MagicMock
 
 import requests
@@ -30,7 +29,7 @@ def make_thread_for_download(tmp_path, settings=None):
 
 
 def test_download_file_makedirs_failure(tmp_path, monkeypatch):
-    settings = SimpleNamespace(file_download_max_retries=1, settings_tab=None)
+    settings = cd.ThreadSettings(1, 1, 1, 1, 1, settings_tab=None)
     t = make_thread_for_download(tmp_path, settings=settings)
     file_url = "https://kemono.cr/media/1.png?f=file.png"
     t.files_to_download = [file_url]
@@ -48,7 +47,7 @@ def test_download_file_makedirs_failure(tmp_path, monkeypatch):
 
 
 def test_download_file_requests_exception(monkeypatch, tmp_path):
-    settings = SimpleNamespace(file_download_max_retries=1, settings_tab=None)
+    settings = cd.ThreadSettings(1, 1, 1, 1, 1, settings_tab=None)
     t = make_thread_for_download(tmp_path, settings=settings)
     file_url = "https://kemono.cr/media/2.png?f=file2.png"
     t.files_to_download = [file_url]
@@ -1,6 +1,5 @@
 import asyncio
 import hashlib
-from types import SimpleNamespace
 
 from PyQt6.QtWidgets import QTextEdit
 
@@ -11,13 +10,13 @@ from kemonodownloader.creator_downloader import (
 )
 
 
-def test_generate_filename_fallback_on_bad_template(tmp_path):
+def test_generate_filename_fallback_on_bad_template(tmp_path, settings_tab):
     file_url = "https://kemono.cr/files/123?f=my image.jpg"
     post_id = "1"
     service = "svc"
     creator_id = "42"
 
-    settings = ThreadSettings(1, 1, 1, 1, 1, settings_tab=SimpleNamespace())
+    settings = ThreadSettings(1, 1, 1, 1, 1, settings_tab=settings_tab)
     console = QTextEdit()
     post_titles_map = {(service, creator_id, post_id): "My Post"}
 
@@ -37,11 +36,7 @@ def test_generate_filename_fallback_on_bad_template(tmp_path):
     )
 
     # Install a bad template that will raise during formatting
-    bad_tab = SimpleNamespace(
-        get_creator_filename_template=lambda: "{nope}",
-        get_creator_folder_strategy=lambda: "per_post",
-    )
-    thread.settings.settings_tab = bad_tab
+    settings_tab.settings["creator_filename_template"] = "{nope}"
 
     target_folder, filename = thread.generate_filename_and_folder(
         file_url,
@@ -57,7 +52,7 @@ def test_generate_filename_fallback_on_bad_template(tmp_path):
     assert sanitize_filename("my image") in filename
 
 
-def test_download_file_uses_hashdb_entry_and_skips_download(tmp_path):
+def test_download_file_uses_hashdb_entry_and_skips_download(tmp_path, settings_tab):
     file_url = "https://kemono.cr/files/keep.jpg"
     post_id = "1"
     service = "svc"
@@ -69,7 +64,7 @@ def test_download_file_uses_hashdb_entry_and_skips_download(tmp_path):
     md5 = hashlib.md5(existing.read_bytes()).hexdigest()
     size = existing.stat().st_size
 
-    settings = ThreadSettings(1, 1, 1, 1, 1, settings_tab=SimpleNamespace())
+    settings = ThreadSettings(1, 1, 1, 1, 1, settings_tab=settings_tab)
     console = QTextEdit()
     post_titles_map = {(service, creator_id, post_id): "Title"}
 
@@ -104,13 +99,15 @@ def test_download_file_uses_hashdb_entry_and_skips_download(tmp_path):
     assert file_url in thread.completed_files
 
 
-def test_download_file_size_mismatch_deletes_incomplete(monkeypatch, tmp_path):
+def test_download_file_size_mismatch_deletes_incomplete(
+    monkeypatch, tmp_path, settings_tab
+):
     file_url = "https://kemono.cr/files/bad.jpg"
     post_id = "1"
     service = "svc"
     creator_id = "42"
 
-    settings = ThreadSettings(1, 1, 1, 1, 1, settings_tab=SimpleNamespace())
+    settings = ThreadSettings(1, 1, 1, 1, 1, settings_tab=settings_tab)
     # Set file_download_max_retries to 1 to fail fast
     settings.file_download_max_retries = 1
     console = QTextEdit()
@@ -159,9 +156,9 @@ def test_download_file_size_mismatch_deletes_incomplete(monkeypatch, tmp_path):
     assert file_url in thread.failed_files
 
 
-def test_run_emits_no_files_warning(tmp_path):
+def test_run_emits_no_files_warning(tmp_path, settings_tab):
     # If there are no files to download, run() should log a warning via thread.log
-    settings = ThreadSettings(1, 1, 1, 1, 1, settings_tab=SimpleNamespace())
+    settings = ThreadSettings(1, 1, 1, 1, 1, settings_tab=settings_tab)
     console = QTextEdit()
     thread = CreatorDownloadThread(
         "svc",
@@ -1,14 +1,7 @@
-from types import SimpleNamespace
-
 from kemonodownloader.creator_downloader import CreatorDownloadThread, ThreadSettings
 
 
-def make_settings():
-    settings_tab = SimpleNamespace(
-        get_creator_filename_template=lambda: None,
-        get_creator_folder_strategy=lambda: "per_post",
-        get_proxy_settings=lambda: None,
-    )
+def make_settings(settings_tab):
     return ThreadSettings(
         creator_posts_max_attempts=1,
         post_data_max_retries=1,
@@ -19,7 +12,7 @@ def make_settings():
     )
 
 
-def test_check_post_completion_triggers_post_completed(tmp_path):
+def test_check_post_completion_triggers_post_completed(tmp_path, settings_tab):
     download_folder = str(tmp_path / "pc_d")
     other_files_dir = str(tmp_path / "pc_o")
 
@@ -28,7 +21,7 @@ def test_check_post_completion_triggers_post_completed(tmp_path):
     files = [u1, u2]
     files_map = {u1: "post1", u2: "post1"}
 
-    settings = make_settings()
+    settings = make_settings(settings_tab)
 
     thread = CreatorDownloadThread(
         service="svc",
@@ -12,7 +12,7 @@ def test_download_size_mismatch_deletion_raises(monkeypatch, tmp_path):
     other_dir = str(tmp_path / "other")
     os.makedirs(other_dir, exist_ok=True)
 
-    settings = SimpleNamespace(settings_tab=None, file_download_max_retries=1)
+    settings = cd.ThreadSettings(1, 1, 1, 1, 1, settings_tab=None)
 
     thread = cd.CreatorDownloadThread(
         service="kemono",
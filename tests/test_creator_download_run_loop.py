@@ -1,15 +1,9 @@
 import types
-from types import SimpleNamespace
 
 from kemonodownloader.creator_downloader import CreatorDownloadThread, ThreadSettings
 
 
-def make_settings():
-    settings_tab = SimpleNamespace(
-        get_creator_filename_template=lambda: None,
-        get_creator_folder_strategy=lambda: "per_post",
-        get_proxy_settings=lambda: None,
-    )
+def make_settings(settings_tab):
     return ThreadSettings(
         creator_posts_max_attempts=1,
         post_data_max_retries=1,
@@ -20,13 +14,13 @@ def make_settings():
     )
 
 
-def test_creator_download_run_processes_queue(monkeypatch, tmp_path):
+def test_creator_download_run_processes_queue(monkeypatch, tmp_path, settings_tab):
     download_folder = str(tmp_path / "run_d")
     other_files_dir = str(tmp_path / "run_o")
 
     files = [f"https://kemono.cr/files/{i}.png" for i in range(3)]
 
-    settings = make_settings()
+    settings = make_settings(settings_tab)
 
     thread = CreatorDownloadThread(
         service="svc",
@@ -6,13 +6,15 @@ from types import SimpleNamespace
 from kemonodownloader.creator_downloader import CreatorDownloadThread, ThreadSettings
 
 
-def test_fetch_creator_and_post_info_profile_failure_logs(monkeypatch, tmp_path):
+def test_fetch_creator_and_post_info_profile_failure_logs(
+    monkeypatch, tmp_path, settings_tab
+):
     service = "svc"
     creator_id = "42"
     post_id = "1"
     file_url = "https://kemono.cr/files/1.jpg"
 
-    settings = ThreadSettings(1, 1, 1, 1, 1, settings_tab=SimpleNamespace())
+    settings = ThreadSettings(1, 1, 1, 1, 1, settings_tab=settings_tab)
     console = SimpleNamespace()  # not used in this test
     post_titles_map = {}
 
@@ -66,13 +68,13 @@ def test_fetch_creator_and_post_info_profile_failure_logs(monkeypatch, tmp_path)
     )
 
 
-def test_download_worker_exception_is_logged(monkeypatch, tmp_path):
+def test_download_worker_exception_is_logged(monkeypatch, tmp_path, settings_tab):
     service = "svc"
     creator_id = "42"
     post_id = "1"
     file_url = "https://kemono.cr/files/1.jpg"
 
-    settings = ThreadSettings(1, 1, 1, 1, 1, settings_tab=SimpleNamespace())
+    settings = ThreadSettings(1, 1, 1, 1, 1, settings_tab=settings_tab)
     console = SimpleNamespace()
     thread = CreatorDownloadThread(
         service,
@@ -119,11 +121,11 @@ def test_download_worker_exception_is_logged(monkeypatch, tmp_path):
     )
 
 
-def test_run_handles_creator_folder_oserror(monkeypatch, tmp_path):
+def test_run_handles_creator_folder_oserror(monkeypatch, tmp_path, settings_tab):
     service = "svc"
     creator_id = "42"
     post_id = "1"
-    settings = ThreadSettings(1, 1, 1, 1, 1, settings_tab=SimpleNamespace())
+    settings = ThreadSettings(1, 1, 1, 1, 1, settings_tab=settings_tab)
     console = SimpleNamespace()
 
     thread = CreatorDownloadThread(
@@ -168,14 +170,14 @@ def test_run_handles_creator_folder_oserror(monkeypatch, tmp_path):
     )
 
 
-def test_check_post_completion_emits(monkeypatch, tmp_path):
+def test_check_post_completion_emits(monkeypatch, tmp_path, settings_tab):
     service = "svc"
     creator_id = "42"
     post_id = "1"
     file1 = "f1"
     file2 = "f2"
 
-    settings = ThreadSettings(1, 1, 1, 1, 1, settings_tab=SimpleNamespace())
+    settings = ThreadSettings(1, 1, 1, 1, 1, settings_tab=settings_tab)
     console = SimpleNamespace()
     thread = CreatorDownloadThread(
         service,
@@ -4,10 +4,10 @@ from types import SimpleNamespace
 from kemonodownloader import creator_downloader as cd
 
 
-def make_thread(tmp_path, settings_tab=None, auto_rename=False):
+def make_thread(tmp_path, settings_tab, auto_rename=False):
     files = ["https://ex.org/files/f=example.png"]
     files_map = {files[0]: "42"}
-    settings = SimpleNamespace(settings_tab=settings_tab)
+    settings = cd.ThreadSettings(1, 1, 1, 1, 1, settings_tab=settings_tab)
     console = SimpleNamespace()
     t = cd.CreatorDownloadThread(
         service="svc",
@@ -26,13 +26,9 @@ def make_thread(tmp_path, settings_tab=None, auto_rename=False):
     return t
 
 
-def test_generate_filename_and_folder_strategies(tmp_path):
+def test_generate_filename_and_folder_strategies(tmp_path, settings_tab):
     # Default strategy (per_post)
-    settings_tab = SimpleNamespace(
-        get_creator_filename_template=lambda: "{post_id}_{orig_name}",
-        get_creator_folder_strategy=lambda: "per_post",
-    )
-    t = make_thread(tmp_path, settings_tab=settings_tab, auto_rename=False)
+    t = make_thread(tmp_path, settings_tab, auto_rename=False)
     folder, filename = t.generate_filename_and_folder(
         "https://ex.org/files/f=example.png", str(tmp_path), 0, 1, "42", "A Title"
     )
@@ -42,7 +38,7 @@ def test_generate_filename_and_folder_strategies(tmp_path):
     assert folder.endswith(os.path.join(f"creator1_{t.creator_name}", "42_Post_42"))
 
     # single_folder strategy
-    settings_tab.get_creator_folder_strategy = lambda: "single_folder"
+    settings_tab.settings["creator_folder_strategy"] = "single_folder"
     t.settings.settings_tab = settings_tab
     folder2, _ = t.generate_filename_and_folder(
         "https://ex.org/files/f=example.png", str(tmp_path), 0, 1, "42", "A Title"
@@ -50,7 +46,7 @@ def test_generate_filename_and_folder_strategies(tmp_path):
     assert os.path.basename(folder2) == f"creator1_{t.creator_name}"
 
     # by_file_type strategy
-    settings_tab.get_creator_folder_strategy = lambda: "by_file_type"
+    settings_tab.settings["creator_folder_strategy"] = "by_file_type"
     t.settings.settings_tab = settings_tab
     folder3, _ = t.generate_filename_and_folder(
         "https://ex.org/files/f=example.png", str(tmp_path), 0, 1, "42", "A Title"
@@ -58,13 +54,10 @@ def test_generate_filename_and_folder_strategies(tmp_path):
     assert os.path.basename(folder3) == "png"
 
 
-def test_generate_filename_template_fallback(tmp_path):
+def test_generate_filename_template_fallback(tmp_path, settings_tab):
     # Template that will raise during formatting
-    settings_tab = SimpleNamespace(
-        get_creator_filename_template=lambda: "{nonexistent_field}",
-        get_creator_folder_strategy=lambda: "per_post",
-    )
-    t = make_thread(tmp_path, settings_tab=settings_tab)
+    settings_tab.settings["creator_filename_template"] = "{nonexistent_field}"
+    t = make_thread(tmp_path, settings_tab)
     folder, filename = t.generate_filename_and_folder(
         "https://ex.org/files/f=example.png", str(tmp_path), 0, 1, "42", "OK"
     )
@@ -72,9 +65,9 @@ def test_generate_filename_template_fallback(tmp_path):
     assert filename.startswith("42_")
 
 
-def test_get_desc_folder_for_post(tmp_path):
-    settings_tab = SimpleNamespace(get_creator_folder_strategy=lambda: "by_file_type")
-    t = make_thread(tmp_path, settings_tab=settings_tab)
+def test_get_desc_folder_for_post(tmp_path, settings_tab):
+    settings_tab.settings["creator_folder_strategy"] = "by_file_type"
+    t = make_thread(tmp_path, settings_tab)
     creator_folder = os.path.normpath(str(tmp_path / "creator"))
     d = t.get_desc_folder_for_post(creator_folder, "42", "Title")
     assert d.endswith(
@@ -82,13 +75,9 @@ def test_get_desc_folder_for_post(tmp_path):
     ) or d.endswith(os.path.join(creator_folder, "txt"))
 
 
-def test_download_text_sync_writes_file(monkeypatch, tmp_path):
-    settings_tab = SimpleNamespace(
-        get_creator_filename_template=lambda: "{post_id}_{orig_name}",
-        get_creator_folder_strategy=lambda: "per_post",
-    )
+def test_download_text_sync_writes_file(monkeypatch, tmp_path, settings_tab):
 
-    t = make_thread(tmp_path, settings_tab=settings_tab)
+    t = make_thread(tmp_path, settings_tab)
 
     # Fake session to return HTML content in post
     class FakeResp:
@@ -114,16 +103,16 @@ def test_download_text_sync_writes_file(monkeypatch, tmp_path):
     assert "Some" in content
 
 
-def test_safe_emit_ignores_when_destroyed(tmp_path):
-    t = make_thread(tmp_path)
+def test_safe_emit_ignores_when_destroyed(tmp_path, settings_tab):
+    t = make_thread(tmp_path, settings_tab)
     # mark destroyed and ensure no exception
     t._destroyed = True
     # should not raise
     t._safe_emit(t.log, "ignored")
 
 
-def test_download_file_skips_when_not_running(tmp_path):
-    t = make_thread(tmp_path)
+def test_download_file_skips_when_not_running(tmp_path, settings_tab):
+    t = make_thread(tmp_path, settings_tab)
     t.is_running = False
     # Should return quickly without raising (async method)
     import asyncio
@@ -131,12 +120,8 @@ def test_download_file_skips_when_not_running(tmp_path):
     asyncio.run(t.download_file(t.files_to_download[0], str(tmp_path), 0, 1))
 
 
-def test_auto_rename_prefix_increments(tmp_path):
-    settings_tab = SimpleNamespace(
-        get_creator_filename_template=lambda: "{post_id}_{orig_name}",
-        get_creator_folder_strategy=lambda: "per_post",
-    )
-    t = make_thread(tmp_path, settings_tab=settings_tab, auto_rename=True)
+def test_auto_rename_prefix_increments(tmp_path, settings_tab):
+    t = make_thread(tmp_path, settings_tab, auto_rename=True)
     folder, fn1 = t.generate_filename_and_folder(
         "https://ex.org/files/f=example.png", str(tmp_path), 0, 1, "42", "Title"
     )
@@ -147,12 +132,8 @@ def test_auto_rename_prefix_increments(tmp_path):
     assert fn2.startswith("2_")
 
 
-def test_download_post_text_if_needed_calls_once(monkeypatch, tmp_path):
-    settings_tab = SimpleNamespace(
-        get_creator_filename_template=lambda: "{post_id}_{orig_name}",
-        get_creator_folder_strategy=lambda: "per_post",
-    )
-    t = make_thread(tmp_path, settings_tab=settings_tab)
+def test_download_post_text_if_needed_calls_once(monkeypatch, tmp_path, settings_tab):
+    t = make_thread(tmp_path, settings_tab)
 
     called = {"n": 0}
 
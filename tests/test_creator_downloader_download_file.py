@@ -1,6 +1,5 @@
 import asyncio
 import hashlib
-from types import SimpleNamespace
 
 from kemonodownloader import creator_downloader as cd
 
@@ -30,7 +29,7 @@ def test_download_file_skips_existing_hash(tmp_path):
         def store(self, *a, **k):
             pass
 
-    settings = SimpleNamespace(settings_tab=None, file_download_max_retries=1)
+    settings = cd.ThreadSettings(1, 1, 1, 1, 1, settings_tab=None)
 
     t = cd.CreatorDownloadThread(
         "service",
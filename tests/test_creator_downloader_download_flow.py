@@ -32,32 +32,15 @@ class FakeSession:
         return self._response
 
 
-def test_download_file_success_writes_and_stores(tmp_path, monkeypatch):
+def test_download_file_success_writes_and_stores(tmp_path, monkeypatch, settings_tab):
     # Prepare fake file content split into chunks
     chunks = [b"hello", b" ", b"world"]
     fake_resp = FakeResponse(chunks)
     fake_session = FakeSession(fake_resp)
     monkeypatch.setattr(cd, "get_session", lambda settings_tab: fake_session)
 
-    stored = {}
-
-    class FakeHashDB:
-        def lookup(self, h):
-            return None
-
-        def store(self, url_hash, file_path, file_hash, file_url, file_size):
-            stored.update(
-                {
-                    "url_hash": url_hash,
-                    "file_path": file_path,
-                    "file_hash": file_hash,
-                    "file_url": file_url,
-                    "file_size": file_size,
-                }
-            )
-
     file_url = "https://kemono.cr/files/hi.txt"
-    settings = SimpleNamespace(settings_tab=None, file_download_max_retries=1)
+    settings = cd.ThreadSettings(1, 1, 1, 1, 1, settings_tab=settings_tab)
     t = cd.CreatorDownloadThread(
         "service",
         "creator",
@@ -71,7 +54,6 @@ def test_download_file_success_writes_and_stores(tmp_path, monkeypatch):
         False,
         settings,
     )
-    t.hash_db = FakeHashDB()
     t.domain_config = {
         "api_base": "https://kemono.cr/api",
         "referer": "https://kemono.cr",
@@ -83,6 +65,7 @@ def test_download_file_success_writes_and_stores(tmp_path, monkeypatch):
     asyncio.run(t.download_file(file_url, str(dest_folder), 0, 1))
 
     # File should exist and hash should have been stored
+    stored = t.hash_db.lookup(hashlib.md5(file_url.encode()).hexdigest())
     assert stored
     assert os.path.exists(stored["file_path"]) is True
     # Validate stored file hash matches file contents
@@ -38,8 +38,7 @@ def make_thread(tmp_path, settings=None):
         other_files_dir=str(tmp_path / "other"),
         post_titles_map={},
         auto_rename_enabled=False,
-        settings=settings
-        or SimpleNamespace(settings_tab=None, file_download_max_retries=1),
+        settings=settings or cd.ThreadSettings(1, 1, 1, 1, 1),
         max_concurrent=1,
     )
     t.hash_db = DummyHashDB(str(tmp_path / "other"))
@@ -47,7 +46,7 @@ def make_thread(tmp_path, settings=None):
 
 
 def test_fetch_creator_and_post_info_success(monkeypatch, tmp_path):
-    settings = SimpleNamespace(settings_tab=None)
+    settings = cd.ThreadSettings(1, 1, 1, 1, 1, settings_tab=None)
     t, file_url = make_thread(tmp_path, settings=settings)
     # Provide domain config used by fetch_creator_and_post_info
     t.domain_config = {"api_base": "https://api.test", "referer": "https://test"}
@@ -73,7 +72,7 @@ def test_fetch_creator_and_post_info_success(monkeypatch, tmp_path):
 
 
 def test_fetch_creator_and_post_info_failure(monkeypatch, tmp_path):
-    settings = SimpleNamespace(settings_tab=None)
+    settings = cd.ThreadSettings(1, 1, 1, 1, 1, settings_tab=None)
     t, file_url = make_thread(tmp_path, settings=settings)
     t.domain_config = {"api_base": "https://api.test", "referer": "https://test"}
 
@@ -1,5 +1,4 @@
 import asyncio
-import contextlib
 import hashlib
 import os
 import threading
@@ -78,45 +77,39 @@ def test_auto_rename_counter_per_post():
     assert f2.startswith("2_")
 
 
+def make_thread(tmp_path, file_url):
+    thread = cd.CreatorDownloadThread(
+        service="fanbox",
+        creator_id="42",
+        download_folder=str(tmp_path),
+        selected_posts=["101"],
+        files_to_download=[file_url],
+        files_to_posts_map={file_url: "101"},
+        console=None,
+        other_files_dir=str(tmp_path / "other"),
+        post_titles_map={("fanbox", "42", "101"): "Title"},
+        auto_rename_enabled=False,
+        settings=cd.ThreadSettings(1, 1, 1, 1, 1, settings_tab=None),
+        max_concurrent=1,
+    )
+    thread.creator_name = "Creator"
+    thread.generate_filename_and_folder = (
+        lambda file_url, folder, file_index, total_files, post_id, post_title: (
+            str(tmp_path),
+            os.path.basename(file_url),
+        )
+    )
+    return thread
+
+
 def test_download_file_deletion_failure(monkeypatch, tmp_path):
     file_url = "http://example.com/out.bin"
 
-    dummy = SimpleNamespace()
-    dummy.service = "fanbox"
-    dummy.creator_id = "42"
-    dummy.post_titles_map = {("fanbox", "42", "101"): "Title"}
-    dummy.creator_name = "Creator"
-    dummy.auto_rename_enabled = False
-    dummy.post_file_counters = {}
-    dummy.post_file_counters_lock = threading.Lock()
-    dummy.settings = SimpleNamespace(settings_tab=None, file_download_max_retries=1)
-    dummy.files_to_download = [file_url]
-    dummy.files_to_posts_map = {file_url: "101"}
-    dummy.domain_config = {"referer": "https://kemono.cr/"}
-    dummy.is_running = True
-    dummy.hash_db = SimpleNamespace(lookup=lambda h: None, store=lambda *a, **k: None)
-    dummy.failed_files = {}
-    dummy.failed_files_lock = contextlib.nullcontext()
-    dummy.completed_files = set()
-    dummy.completed_files_lock = contextlib.nullcontext()
-    dummy._ssl_lock = contextlib.nullcontext()
-    dummy._safe_emit = lambda signal, *args: signal.emit(*args)
-    dummy.log = SimpleNamespace(emit=lambda *a, **k: None)
-    dummy.file_progress = SimpleNamespace(emit=lambda *a, **k: None)
+    thread = make_thread(tmp_path, file_url)
     completed = []
-    dummy.file_completed = SimpleNamespace(
+    thread.file_completed = SimpleNamespace(
         emit=lambda idx, url, ok: completed.append((idx, url, ok))
     )
-    dummy.check_post_completion = lambda url: None
-    dummy.download_text = False
-
-    # generate filename
-    dummy.generate_filename_and_folder = (
-        lambda file_url, folder, file_index, total_files, post_id, post_title: (
-            str(tmp_path),
-            "out.bin",
-        )
-    )
 
     class FakeResp:
         def __init__(self):
@@ -146,11 +139,9 @@ def test_download_file_deletion_failure(monkeypatch, tmp_path):
         os, "remove", lambda p: (_ for _ in ()).throw(OSError("cant delete"))
     )
 
-    asyncio.run(
-        cd.CreatorDownloadThread.download_file(dummy, file_url, str(tmp_path), 0, 1)
-    )
+    asyncio.run(thread.download_file(file_url, str(tmp_path), 0, 1))
 
-    assert file_url in dummy.failed_files
+    assert file_url in thread.failed_files
 
 
 def test_preview_thread_cached_jpg(tmp_path):
@@ -182,43 +173,11 @@ def test_preview_thread_cached_jpg(tmp_path):
 def test_download_file_success(monkeypatch, tmp_path):
     file_url = "http://example.com/success.bin"
 
-    dummy = SimpleNamespace()
-    dummy.service = "fanbox"
-    dummy.creator_id = "42"
-    dummy.post_titles_map = {("fanbox", "42", "101"): "Title"}
-    dummy.creator_name = "Creator"
-    dummy.auto_rename_enabled = False
-    dummy.post_file_counters = {}
-    dummy.post_file_counters_lock = threading.Lock()
-    dummy.settings = SimpleNamespace(settings_tab=None, file_download_max_retries=1)
-    dummy.files_to_download = [file_url]
-    dummy.files_to_posts_map = {file_url: "101"}
-    dummy.domain_config = {"referer": "https://kemono.cr/"}
-    dummy.is_running = True
-    stored = []
-    dummy.hash_db = SimpleNamespace(
-        lookup=lambda h: None, store=lambda *a, **k: stored.append(a)
-    )
-    dummy.failed_files = {}
-    dummy.failed_files_lock = contextlib.nullcontext()
-    dummy.completed_files = set()
-    dummy.completed_files_lock = contextlib.nullcontext()
-    dummy._ssl_lock = contextlib.nullcontext()
-    dummy._safe_emit = lambda signal, *args: signal.emit(*args)
-    dummy.log = SimpleNamespace(emit=lambda *a, **k: None)
-    dummy.file_progress = SimpleNamespace(emit=lambda *a, **k: None)
+    thread = make_thread(tmp_path, file_url)
     completed = []
-    dummy.file_completed = SimpleNamespace(
+    thread.file_completed = SimpleNamespace(
         emit=lambda idx, url, ok: completed.append((idx, url, ok))
     )
-    dummy.check_post_completion = lambda url: None
-    dummy.download_text = False
-    dummy.generate_filename_and_folder = (
-        lambda file_url, folder, file_index, total_files, post_id, post_title: (
-            str(tmp_path),
-            "success.bin",
-        )
-    )
 
     class FakeResp:
         def __init__(self):
@@ -244,15 +203,14 @@ def test_download_file_success(monkeypatch, tmp_path):
 
     monkeypatch.setattr(cd, "get_session", lambda s=None: FakeSession())
 
-    asyncio.run(
-        cd.CreatorDownloadThread.download_file(dummy, file_url, str(tmp_path), 0, 1)
-    )
-    assert not dummy.failed_files, dummy.failed_files
+    asyncio.run(thread.download_file(file_url, str(tmp_path), 0, 1))
+    assert not thread.failed_files, thread.failed_files
     full_path = os.path.join(str(tmp_path), "success.bin")
     assert os.path.exists(full_path), "Downloaded file should exist"
     with open(full_path, "rb") as f:
         assert f.read() == b"hello"
-    assert stored
+    url_hash = hashlib.md5(file_url.encode()).hexdigest()
+    assert thread.hash_db.lookup(url_hash)
     assert any(c for c in completed if c[1] == file_url and c[2] is True)
 
 
@@ -260,37 +218,7 @@ def test_download_file_retry_exhaustion(monkeypatch, tmp_path):
     import requests
 
     file_url = "http://example.com/fail.bin"
-    dummy = SimpleNamespace()
-    dummy.service = "fanbox"
-    dummy.creator_id = "42"
-    dummy.post_titles_map = {("fanbox", "42", "101"): "Title"}
-    dummy.creator_name = "Creator"
-    dummy.auto_rename_enabled = False
-    dummy.post_file_counters = {}
-    dummy.post_file_counters_lock = threading.Lock()
-    dummy.settings = SimpleNamespace(settings_tab=None, file_download_max_retries=1)
-    dummy.files_to_download = [file_url]
-    dummy.files_to_posts_map = {file_url: "101"}
-    dummy.domain_config = {"referer": "https://kemono.cr/"}
-    dummy.is_running = True
-    dummy.hash_db = SimpleNamespace(lookup=lambda h: None, store=lambda *a, **k: None)
-    dummy.failed_files = {}
-    dummy.failed_files_lock = contextlib.nullcontext()
-    dummy.completed_files = set()
-    dummy.completed_files_lock = contextlib.nullcontext()
-    dummy._ssl_lock = contextlib.nullcontext()
-    dummy._safe_emit = lambda signal, *args: signal.emit(*args)
-    dummy.log = SimpleNamespace(emit=lambda *a, **k: None)
-    dummy.file_progress = SimpleNamespace(emit=lambda *a, **k: None)
-    dummy.file_completed = SimpleNamespace(emit=lambda *a, **k: None)
-    dummy.check_post_completion = lambda url: None
-    dummy.download_text = False
-    dummy.generate_filename_and_folder = (
-        lambda file_url, folder, file_index, total_files, post_id, post_title: (
-            str(tmp_path),
-            "fail.bin",
-        )
-    )
+    thread = make_thread(tmp_path, file_url)
 
     def raise_req(*a, **k):
         raise requests.RequestException("down")
@@ -301,15 +229,12 @@ def test_download_file_retry_exhaustion(monkeypatch, tmp_path):
 
     monkeypatch.setattr(cd, "get_session", lambda s=None: Sess())
     # run
-    asyncio.run(
-        cd.CreatorDownloadThread.download_file(dummy, file_url, str(tmp_path), 0, 1)
-    )
-    assert file_url in dummy.failed_files
+    asyncio.run(thread.download_file(file_url, str(tmp_path), 0, 1))
+    assert file_url in thread.failed_files
 
 
-def test_download_worker_consumes_queue():
-    dummy = SimpleNamespace()
-    dummy.is_running = True
+def test_download_worker_consumes_queue(tmp_path):
+    thread = make_thread(tmp_path, "u1")
 
     calls = []
 
@@ -317,16 +242,14 @@ def test_download_worker_consumes_queue():
         calls.append((file_index, file_url))
         await asyncio.sleep(0)
 
-    dummy.download_file = fake_download
+    thread.download_file = fake_download
 
     async def main():
         q = asyncio.Queue()
         await q.put((0, "u1"))
-        t = asyncio.create_task(
-            cd.CreatorDownloadThread.download_worker(dummy, q, "/tmp", 1)
-        )
+        t = asyncio.create_task(thread.download_worker(q, "/tmp", 1))
         await q.join()
-        dummy.is_running = False
+        thread.is_running = False
         t.cancel()
         await asyncio.gather(t, return_exceptions=True)
 
@@ -80,7 +80,7 @@ def test_get_desc_folder_for_post(tmp_path):
 def test_file_preparation_detect_files():
     # Test the detect_files helper with main file, attachments and content images
 
-    settings = SimpleNamespace()
+    settings = cd.ThreadSettings(1, 1, 1, 1, 1)
     # enable all detection checks
     fpt = cd.FilePreparationThread([], {}, {}, True, True, True, settings)
     post = {
@@ -146,7 +146,7 @@ def test_post_detection_thread_plain_and_gzipped(monkeypatch):
     monkeypatch.setattr(cd, "get_session", lambda s=None: fake_get())
 
     post_titles_map = {}
-    settings = SimpleNamespace(settings_tab=None, creator_posts_max_attempts=1)
+    settings = cd.ThreadSettings(1, 1, 1, 1, 1, settings_tab=None)
     thread = cd.PostDetectionThread(
         "https://kemono.cr/user/42", post_titles_map, settings
     )
@@ -171,55 +171,42 @@ def test_post_detection_thread_plain_and_gzipped(monkeypatch):
     )
 
 
-def test_download_file_skips_when_hash_matches(tmp_path, monkeypatch):
-    # Prepare dummy instance attributes
-    dummy = SimpleNamespace()
-    dummy.service = "fanbox"
-    dummy.creator_id = "42"
-    dummy.post_titles_map = {("fanbox", "42", "101"): "Title"}
-    dummy.creator_name = "Creator"
-    dummy.auto_rename_enabled = False
-    dummy.post_file_counters_lock = None
-    dummy.post_file_counters = {}
-    dummy.settings = SimpleNamespace(settings_tab=None, file_download_max_retries=1)
-    dummy.files_to_download = ["http://example.com/file.jpg"]
-    dummy.files_to_posts_map = {"http://example.com/file.jpg": "101"}
-    dummy.is_running = True
-    dummy.hash_db = SimpleNamespace()
+def test_download_file_skips_when_hash_matches(tmp_path):
+    file_url = "http://example.com/file.jpg"
+    thread = cd.CreatorDownloadThread(
+        service="fanbox",
+        creator_id="42",
+        download_folder=str(tmp_path),
+        selected_posts=["101"],
+        files_to_download=[file_url],
+        files_to_posts_map={file_url: "101"},
+        console=None,
+        other_files_dir=str(tmp_path / "other"),
+        post_titles_map={("fanbox", "42", "101"): "Title"},
+        auto_rename_enabled=False,
+        settings=cd.ThreadSettings(1, 1, 1, 1, 1, settings_tab=None),
+        max_concurrent=1,
+    )
+    thread.creator_name = "Creator"
 
-    # Create an existing file with known contents
+    # Create an existing file with known contents and register it
     existing = tmp_path / "existing.jpg"
     existing.write_bytes(b"hello")
     existing_hash = hashlib.md5(b"hello").hexdigest()
-    dummy.hash_db.lookup = lambda h: {
-        "file_path": str(existing),
-        "file_hash": existing_hash,
-        "file_size": 5,
-    }
-    dummy.hash_db.store = lambda *a, **k: None
+    url_hash = hashlib.md5(file_url.encode()).hexdigest()
+    thread.hash_db.store(url_hash, str(existing), existing_hash, file_url, 5)
 
     # Capture emits
     emitted = {"progress": [], "completed": []}
-    dummy.file_progress = SimpleNamespace(
+    thread.file_progress = SimpleNamespace(
         emit=lambda i, p: emitted["progress"].append((i, p))
     )
-    dummy.file_completed = SimpleNamespace(
+    thread.file_completed = SimpleNamespace(
         emit=lambda idx, url, ok: emitted["completed"].append((idx, url, ok))
     )
-    dummy.log = SimpleNamespace(emit=lambda *a, **k: None)
-    import contextlib
-
-    dummy.completed_files_lock = contextlib.nullcontext()
-    dummy.completed_files = set()
-    dummy.completed_files = set()
-    dummy.check_post_completion = lambda url: None
 
-    dummy.download_text = False
-    # provide _safe_emit helper used by the method
-    dummy._safe_emit = lambda signal, *args: signal.emit(*args)
-
-    # Monkeypatch generate_filename_and_folder to avoid filesystem complexity
-    dummy.generate_filename_and_folder = (
+    # Patch generate_filename_and_folder to avoid filesystem complexity
+    thread.generate_filename_and_folder = (
         lambda file_url, folder, file_index, total_files, post_id, post_title: (
             str(tmp_path),
             "existing.jpg",
@@ -227,11 +214,7 @@ def test_download_file_skips_when_hash_matches(tmp_path, monkeypatch):
     )
 
     # Run the async download_file
-    asyncio.run(
-        cd.CreatorDownloadThread.download_file(
-            dummy, "http://example.com/file.jpg", str(tmp_path), 0, 1
-        )
-    )
+    asyncio.run(thread.download_file(file_url, str(tmp_path), 0, 1))
 
     # Should have recorded a completed emit with success True
     assert any(c for c in emitted["completed"] if c[2] is True)
@@ -274,7 +257,7 @@ def test_detect_files_main_attachments_content():
         creator_main_check=True,
         creator_attachments_check=True,
         creator_content_check=True,
-        settings=SimpleNamespace(settings_tab=None),
+        settings=cd.ThreadSettings(1, 1, 1, 1, 1, settings_tab=None),
         max_concurrent=1,
     )
 
@@ -339,17 +322,11 @@ def test_filter_and_checkbox_toggle_and_population_threads():
     assert pop_captured["list"][0][0] == "T"
 
 
-def test_creator_generate_filename_and_desc_folder(tmp_path, monkeypatch):
+def test_creator_generate_filename_and_desc_folder(tmp_path, monkeypatch, settings_tab):
     service = "kemono"
     creator_id = "42"
     other_dir = str(tmp_path / "other")
-    # Minimal settings object exposing expected interface
-    settings = SimpleNamespace(
-        settings_tab=SimpleNamespace(
-            get_creator_filename_template=lambda: "{post_id}_{orig_name}",
-            get_creator_folder_strategy=lambda: "per_post",
-        )
-    )
+    settings = cd.ThreadSettings(1, 1, 1, 1, 1, settings_tab=settings_tab)
 
     post_titles = {(service, creator_id, "1"): "Cool Post"}
 
@@ -406,7 +383,7 @@ def test_download_text_sync_writes_file(tmp_path, monkeypatch):
     service = "kemono"
     creator_id = "99"
     other_dir = str(tmp_path / "other2")
-    settings = SimpleNamespace(settings_tab=None)
+    settings = cd.ThreadSettings(1, 1, 1, 1, 1, settings_tab=None)
     thread = cd.CreatorDownloadThread(
         service,
         creator_id,
@@ -429,24 +406,14 @@ def test_download_text_sync_writes_file(tmp_path, monkeypatch):
     assert os.path.exists(os.path.join(post_folder, "desc_1.txt"))
 
 
-def test_generate_filename_strategies_and_download_text_dup(tmp_path, monkeypatch):
+def test_generate_filename_strategies_and_download_text_dup(
+    tmp_path, monkeypatch, settings_tab
+):
     service = "kemono"
     creator_id = "42"
     other_dir = str(tmp_path / "otherb")
-    # settings with different folder strategies
-    settings_single = SimpleNamespace(
-        settings_tab=SimpleNamespace(
-            get_creator_filename_template=lambda: "{post_id}_{orig_name}",
-            get_creator_folder_strategy=lambda: "single_folder",
-        )
-    )
-
-    settings_bytype = SimpleNamespace(
-        settings_tab=SimpleNamespace(
-            get_creator_filename_template=lambda: "{post_id}_{orig_name}",
-            get_creator_folder_strategy=lambda: "by_file_type",
-        )
-    )
+    settings = cd.ThreadSettings(1, 1, 1, 1, 1, settings_tab=settings_tab)
+    settings_tab.settings["creator_folder_strategy"] = "single_folder"
 
     post_titles = {(service, creator_id, "1"): "Cool Post"}
 
@@ -461,7 +428,7 @@ def test_generate_filename_strategies_and_download_text_dup(tmp_path, monkeypatc
         other_dir,
         post_titles,
         False,
-        settings_single,
+        settings,
         max_concurrent=1,
         download_text=False,
     )
@@ -475,6 +442,8 @@ def test_generate_filename_strategies_and_download_text_dup(tmp_path, monkeypatc
     )
     assert os.path.basename(folder_single).startswith("42_")
 
+    settings_tab.settings["creator_folder_strategy"] = "by_file_type"
+
     t2 = cd.CreatorDownloadThread(
         service,
         creator_id,
@@ -486,7 +455,7 @@ def test_generate_filename_strategies_and_download_text_dup(tmp_path, monkeypatc
         other_dir,
         post_titles,
         False,
-        settings_bytype,
+        settings,
         max_concurrent=1,
         download_text=False,
     )
@@ -520,7 +489,7 @@ def test_generate_filename_strategies_and_download_text_dup(tmp_path, monkeypatc
         other_dir,
         post_titles,
         False,
-        settings_single,
+        settings,
         max_concurrent=1,
         download_text=True,
     )
@@ -534,7 +503,7 @@ def test_fetch_creator_and_post_info_populates_titles(tmp_path, monkeypatch):
     service = "kemono"
     creator_id = "77"
     other_dir = str(tmp_path / "otherc")
-    settings = SimpleNamespace(settings_tab=None)
+    settings = cd.ThreadSettings(1, 1, 1, 1, 1, settings_tab=None)
 
     # Fake responses for profile and post
     class ProfileResp:
@@ -633,7 +602,7 @@ def test_get_session_thread_local_and_socks(monkeypatch):
 def test_generate_filename_and_folder_and_auto_rename(tmp_path, qapp, monkeypatch):
     # Monkeypatch HashDB to avoid filesystem DB interactions
     class DummyHashDB:
-        def __init__(self, other_files_dir):
+        def __init__(self, other_files_dir, base_dir=None):
             pass
 
         def lookup(self, *a, **k):
@@ -659,7 +628,7 @@ def test_generate_filename_and_folder_and_auto_rename(tmp_path, qapp, monkeypatc
         other_files_dir=str(tmp_path / "other"),
         post_titles_map={},
         auto_rename_enabled=True,
-        settings=None,
+        settings=cd.ThreadSettings(1, 1, 1, 1, 1),
         max_concurrent=1,
         download_text=False,
     )
@@ -686,24 +655,10 @@ def test_generate_filename_and_folder_and_auto_rename(tmp_path, qapp, monkeypatc
     assert filename2.startswith("2_")
 
 
-def test_get_desc_folder_for_post_respects_strategy(tmp_path, qapp, monkeypatch):
-    class DummyHashDB:
-        def __init__(self, other_files_dir):
-            pass
-
-        def lookup(self, *a, **k):
-            return None
-
-        def store(self, *a, **k):
-            return None
-
-    monkeypatch.setattr(cd, "HashDB", DummyHashDB)
-
-    class Settings:
-        def __init__(self, strat):
-            self.settings_tab = SimpleNamespace(
-                get_creator_folder_strategy=lambda: strat
-            )
+def test_get_desc_folder_for_post_respects_strategy(tmp_path, qapp, settings_tab):
+    def settings_for(strategy):
+        settings_tab.settings["creator_folder_strategy"] = strategy
+        return cd.ThreadSettings(1, 1, 1, 1, 1, settings_tab=settings_tab)
 
     th = cd.CreatorDownloadThread(
         service="fanbox",
@@ -716,7 +671,7 @@ def test_get_desc_folder_for_post_respects_strategy(tmp_path, qapp, monkeypatch)
         other_files_dir=str(tmp_path / "other"),
         post_titles_map={},
         auto_rename_enabled=False,
-        settings=Settings("per_post"),
+        settings=settings_for("per_post"),
         max_concurrent=1,
         download_text=False,
     )
@@ -736,7 +691,7 @@ def test_get_desc_folder_for_post_respects_strategy(tmp_path, qapp, monkeypatch)
         other_files_dir=str(tmp_path / "other"),
         post_titles_map={},
         auto_rename_enabled=False,
-        settings=Settings("by_file_type"),
+        settings=settings_for("by_file_type"),
         max_concurrent=1,
         download_text=False,
     )
@@ -754,7 +709,7 @@ def test_get_desc_folder_for_post_respects_strategy(tmp_path, qapp, monkeypatch)
         other_files_dir=str(tmp_path / "other"),
         post_titles_map={},
         auto_rename_enabled=False,
-        settings=Settings("single_folder"),
+        settings=settings_for("single_folder"),
         max_concurrent=1,
         download_text=False,
     )
@@ -12,7 +12,7 @@ class DummySignal:
         self._fn = fn
 
 
-def make_parent(tmp_path):
+def make_parent(tmp_path, settings_tab):
     parent = QWidget()
     parent.cache_folder = str(tmp_path / "cache")
     parent.other_files_folder = str(tmp_path / "other")
@@ -21,17 +21,14 @@ def make_parent(tmp_path):
     os.makedirs(parent.other_files_folder, exist_ok=True)
     os.makedirs(parent.download_folder, exist_ok=True)
 
-    st = SimpleNamespace()
-    st.get_creator_posts_max_attempts = lambda: 1
-    st.get_post_data_max_retries = lambda: 1
-    st.get_file_download_max_retries = lambda: 1
-    st.get_api_request_max_retries = lambda: 1
-    st.get_simultaneous_downloads = lambda: 1
-    st.get_creator_filename_template = lambda: None
-    st.get_creator_folder_strategy = lambda: "per_post"
-    st.settings_applied = SimpleNamespace(connect=lambda f: None)
-    st.language_changed = SimpleNamespace(connect=lambda f: None)
-    parent.settings_tab = st
+    settings_tab.settings.update(
+        creator_posts_max_attempts=1,
+        post_data_max_retries=1,
+        file_download_max_retries=1,
+        api_request_max_retries=1,
+        simultaneous_downloads=1,
+    )
+    parent.settings_tab = settings_tab
 
     class Tabs:
         def __init__(self):
@@ -60,12 +57,12 @@ def make_parent(tmp_path):
     return parent
 
 
-def make_tab(tmp_path):
-    return cd.CreatorDownloaderTab(make_parent(tmp_path))
+def make_tab(tmp_path, settings_tab):
+    return cd.CreatorDownloaderTab(make_parent(tmp_path, settings_tab))
 
 
-def test_refresh_ui_resets_progress_when_not_downloading(tmp_path):
-    tab = make_tab(tmp_path)
+def test_refresh_ui_resets_progress_when_not_downloading(tmp_path, settings_tab):
+    tab = make_tab(tmp_path, settings_tab)
     tab.downloading = False
     tab.creator_file_progress.setValue(77)
     tab.creator_overall_progress.setValue(66)
@@ -87,8 +84,8 @@ def test_refresh_ui_resets_progress_when_not_downloading(tmp_path):
     assert tab.background_task_label.text() != "busy"
 
 
-def test_add_creator_to_queue_validation_in_progress_warns(tmp_path):
-    tab = make_tab(tmp_path)
+def test_add_creator_to_queue_validation_in_progress_warns(tmp_path, settings_tab):
+    tab = make_tab(tmp_path, settings_tab)
     tab.creator_url_input.setText("https://kemono.cr/fanbox/user/1")
     tab.validation_thread = SimpleNamespace(isRunning=lambda: True)
     logs = []
@@ -100,8 +97,8 @@ def test_add_creator_to_queue_validation_in_progress_warns(tmp_path):
     assert any(level == "WARNING" for _, level in logs)
 
 
-def test_cleanup_validation_thread_removes_thread(tmp_path):
-    tab = make_tab(tmp_path)
+def test_cleanup_validation_thread_removes_thread(tmp_path, settings_tab):
+    tab = make_tab(tmp_path, settings_tab)
     deleted = []
     fake_thread = SimpleNamespace(deleteLater=lambda: deleted.append(True))
     tab.validation_thread = fake_thread
@@ -114,8 +111,8 @@ def test_cleanup_validation_thread_removes_thread(tmp_path):
     assert deleted
 
 
-def test_check_creator_from_queue_invalid_type(tmp_path):
-    tab = make_tab(tmp_path)
+def test_check_creator_from_queue_invalid_type(tmp_path, settings_tab):
+    tab = make_tab(tmp_path, settings_tab)
     logs = []
     tab.append_log_to_console = lambda msg, level: logs.append((msg, level))
 
@@ -124,8 +121,8 @@ def test_check_creator_from_queue_invalid_type(tmp_path):
     assert any(level == "ERROR" for _, level in logs)
 
 
-def test_check_creator_from_queue_warns_when_detection_running(tmp_path):
-    tab = make_tab(tmp_path)
+def test_check_creator_from_queue_warns_when_detection_running(tmp_path, settings_tab):
+    tab = make_tab(tmp_path, settings_tab)
     url = "https://kemono.cr/fanbox/user/1"
     tab.creator_queue = [(url, False)]
     tab.post_detection_thread = SimpleNamespace(isRunning=lambda: True)
@@ -137,8 +134,8 @@ def test_check_creator_from_queue_warns_when_detection_running(tmp_path):
     assert any(level == "WARNING" for _, level in logs)
 
 
-def test_start_creator_download_fast_mode_initializes_batch(tmp_path):
-    tab = make_tab(tmp_path)
+def test_start_creator_download_fast_mode_initializes_batch(tmp_path, settings_tab):
+    tab = make_tab(tmp_path, settings_tab)
     tab.fast_mode = True
     tab.creator_queue = [
         ("https://kemono.cr/fanbox/user/1", False),
@@ -158,8 +155,10 @@ def test_start_creator_download_fast_mode_initializes_batch(tmp_path):
     assert calls
 
 
-def test_start_creator_download_no_creator_viewed_calls_finished(tmp_path):
-    tab = make_tab(tmp_path)
+def test_start_creator_download_no_creator_viewed_calls_finished(
+    tmp_path, settings_tab
+):
+    tab = make_tab(tmp_path, settings_tab)
     tab.fast_mode = False
     tab.creator_queue = [("https://kemono.cr/fanbox/user/1", False)]
     tab.posts_to_download = ["101"]
@@ -173,8 +172,8 @@ def test_start_creator_download_no_creator_viewed_calls_finished(tmp_path):
     assert called
 
 
-def test_fast_mode_process_next_empty_finishes(tmp_path):
-    tab = make_tab(tmp_path)
+def test_fast_mode_process_next_empty_finishes(tmp_path, settings_tab):
+    tab = make_tab(tmp_path, settings_tab)
     tab._fast_mode_pending_urls = []
     tab._fast_mode_downloading = True
     tab.downloading = True
@@ -188,8 +187,8 @@ def test_fast_mode_process_next_empty_finishes(tmp_path):
     assert states and states[-1] is False
 
 
-def test_fast_mode_auto_download_no_creator_processes_next(tmp_path):
-    tab = make_tab(tmp_path)
+def test_fast_mode_auto_download_no_creator_processes_next(tmp_path, settings_tab):
+    tab = make_tab(tmp_path, settings_tab)
     tab.current_creator_url = None
     calls = []
     tab._fast_mode_process_next = lambda: calls.append(True)
@@ -199,8 +198,8 @@ def test_fast_mode_auto_download_no_creator_processes_next(tmp_path):
     assert calls
 
 
-def test_fast_mode_auto_download_no_posts_removes_and_next(tmp_path):
-    tab = make_tab(tmp_path)
+def test_fast_mode_auto_download_no_posts_removes_and_next(tmp_path, settings_tab):
+    tab = make_tab(tmp_path, settings_tab)
     tab.current_creator_url = "https://kemono.cr/fanbox/user/1"
     tab.all_detected_posts = []
     removed = []
@@ -214,8 +213,8 @@ def test_fast_mode_auto_download_no_posts_removes_and_next(tmp_path):
     assert called
 
 
-def test_prepare_files_for_download_in_progress_warns(tmp_path):
-    tab = make_tab(tmp_path)
+def test_prepare_files_for_download_in_progress_warns(tmp_path, settings_tab):
+    tab = make_tab(tmp_path, settings_tab)
     tab.file_preparation_thread = SimpleNamespace(isRunning=lambda: True)
     logs = []
     tab.append_log_to_console = lambda msg, level: logs.append((msg, level))
@@ -225,8 +224,8 @@ def test_prepare_files_for_download_in_progress_warns(tmp_path):
     assert any(level == "WARNING" for _, level in logs)
 
 
-def test_prepare_files_for_download_no_posts_available(tmp_path):
-    tab = make_tab(tmp_path)
+def test_prepare_files_for_download_no_posts_available(tmp_path, settings_tab):
+    tab = make_tab(tmp_path, settings_tab)
     tab.current_creator_url = "https://kemono.cr/fanbox/user/1"
     tab.posts_to_download = ["999"]
     tab.all_files_map = {
@@ -241,8 +240,8 @@ def test_prepare_files_for_download_no_posts_available(tmp_path):
     assert tab.background_task_progress.value() == 0
 
 
-def test_cleanup_file_preparation_thread_removes_thread(tmp_path):
-    tab = make_tab(tmp_path)
+def test_cleanup_file_preparation_thread_removes_thread(tmp_path, settings_tab):
+    tab = make_tab(tmp_path, settings_tab)
     deleted = []
     fake = SimpleNamespace(deleteLater=lambda: deleted.append(True))
     tab.file_preparation_thread = fake
@@ -255,11 +254,16 @@ def test_cleanup_file_preparation_thread_removes_thread(tmp_path):
     assert deleted
 
 
-def test_on_file_preparation_finished_no_files_detected_moves_next(tmp_path):
-    tab = make_tab(tmp_path)
+def test_on_file_preparation_finished_no_files_detected_moves_next(
+    tmp_path, settings_tab
+):
+    tab = make_tab(tmp_path, settings_tab)
     moved = []
     tab.process_next_creator = lambda urls: moved.append(urls)
 
+    tab.file_preparation_thread = cd.FilePreparationThread(
+        [], {}, {}, True, True, True, tab._create_thread_settings()
+    )
     tab.on_file_preparation_finished(
         ["https://kemono.cr/fanbox/user/1", "https://kemono.cr/fanbox/user/2"],
         [],
@@ -269,8 +273,8 @@ def test_on_file_preparation_finished_no_files_detected_moves_next(tmp_path):
     assert moved == [["https://kemono.cr/fanbox/user/2"]]
 
 
-def test_fast_mode_remove_creator_url_updates_queue(tmp_path):
-    tab = make_tab(tmp_path)
+def test_fast_mode_remove_creator_url_updates_queue(tmp_path, settings_tab):
+    tab = make_tab(tmp_path, settings_tab)
     tab.creator_queue = [
         ("https://kemono.cr/fanbox/user/1/", False),
         ("https://kemono.cr/fanbox/user/2", False),
@@ -285,8 +289,8 @@ def test_fast_mode_remove_creator_url_updates_queue(tmp_path):
     assert updated
 
 
-def test_update_post_completion_fast_mode_removes_creator(tmp_path):
-    tab = make_tab(tmp_path)
+def test_update_post_completion_fast_mode_removes_creator(tmp_path, settings_tab):
+    tab = make_tab(tmp_path, settings_tab)
     tab.fast_mode = True
     tab.current_creator_url = "https://kemono.cr/fanbox/user/1"
     tab.total_posts_to_download = 1
@@ -300,8 +304,8 @@ def test_update_post_completion_fast_mode_removes_creator(tmp_path):
     assert removed == ["https://kemono.cr/fanbox/user/1"]
 
 
-def test_toggle_check_all_all_in_progress_warns(tmp_path):
-    tab = make_tab(tmp_path)
+def test_toggle_check_all_all_in_progress_warns(tmp_path, settings_tab):
+    tab = make_tab(tmp_path, settings_tab)
     tab.checkbox_toggle_thread = SimpleNamespace(isRunning=lambda: True)
     logs = []
     tab.append_log_to_console = lambda msg, level: logs.append((msg, level))
@@ -311,8 +315,8 @@ def test_toggle_check_all_all_in_progress_warns(tmp_path):
     assert any(level == "WARNING" for _, level in logs)
 
 
-def test_toggle_check_all_all_starts_worker(tmp_path, monkeypatch):
-    tab = make_tab(tmp_path)
+def test_toggle_check_all_all_starts_worker(tmp_path, monkeypatch, settings_tab):
+    tab = make_tab(tmp_path, settings_tab)
     tab.all_detected_posts = [("Post", ("1", None))]
 
     class FakeToggleThread:
@@ -336,8 +340,8 @@ def test_toggle_check_all_all_starts_worker(tmp_path, monkeypatch):
     assert tab.active_threads
 
 
-def test_toggle_checkbox_state_no_post_id_logs_error(tmp_path):
-    tab = make_tab(tmp_path)
+def test_toggle_checkbox_state_no_post_id_logs_error(tmp_path, settings_tab):
+    tab = make_tab(tmp_path, settings_tab)
     logs = []
     tab.append_log_to_console = lambda msg, level: logs.append((msg, level))
 
@@ -347,8 +351,8 @@ def test_toggle_checkbox_state_no_post_id_logs_error(tmp_path):
     assert tab.background_task_progress.value() == 0
 
 
-def test_update_current_preview_url_widget_and_none(tmp_path):
-    tab = make_tab(tmp_path)
+def test_update_current_preview_url_widget_and_none(tmp_path, settings_tab):
+    tab = make_tab(tmp_path, settings_tab)
 
     item_with_widget = QListWidgetItem()
     item_with_widget.setData(Qt.ItemDataRole.UserRole, "https://example.com/a.jpg")
@@ -373,8 +377,10 @@ def test_update_current_preview_url_widget_and_none(tmp_path):
     assert tab.creator_view_button.isEnabled() is False
 
 
-def test_add_creators_from_file_logs_error_processing_url(tmp_path, monkeypatch):
-    tab = make_tab(tmp_path)
+def test_add_creators_from_file_logs_error_processing_url(
+    tmp_path, monkeypatch, settings_tab
+):
+    tab = make_tab(tmp_path, settings_tab)
     links = tmp_path / "links.txt"
     links.write_text("https://kemono.cr/fanbox/user/1\n")
 
@@ -397,8 +403,8 @@ def test_add_creators_from_file_logs_error_processing_url(tmp_path, monkeypatch)
     assert any(level == "ERROR" for _, level in logs)
 
 
-def test_cleanup_thread_all_files_attempted_finishes_and_clears(tmp_path):
-    tab = make_tab(tmp_path)
+def test_cleanup_thread_all_files_attempted_finishes_and_clears(tmp_path, settings_tab):
+    tab = make_tab(tmp_path, settings_tab)
 
     class FakeThread:
         def __init__(self, running=False):
@@ -438,8 +444,10 @@ def test_cleanup_thread_all_files_attempted_finishes_and_clears(tmp_path):
     assert lingering.terminated is True
 
 
-def test_cancel_creator_download_fetching_path_filters_selected_posts(tmp_path):
-    tab = make_tab(tmp_path)
+def test_cancel_creator_download_fetching_path_filters_selected_posts(
+    tmp_path, settings_tab
+):
+    tab = make_tab(tmp_path, settings_tab)
     tab.active_threads = [SimpleNamespace()]
 
     stopped = []
@@ -499,8 +507,8 @@ def test_cancellation_thread_runtimeerror_during_termination_logs_warning(monkey
     assert any(level == "WARNING" for _, level in logs)
 
 
-def test_start_creator_download_no_posts_selected_warns(tmp_path):
-    tab = make_tab(tmp_path)
+def test_start_creator_download_no_posts_selected_warns(tmp_path, settings_tab):
+    tab = make_tab(tmp_path, settings_tab)
     tab.fast_mode = False
     tab.creator_queue = [("https://kemono.cr/fanbox/user/1", False)]
     tab.posts_to_download = []
@@ -512,8 +520,8 @@ def test_start_creator_download_no_posts_selected_warns(tmp_path):
     assert any(level == "WARNING" for _, level in logs)
 
 
-def test_on_post_detection_error_without_cache_resets_fetch_ui(tmp_path):
-    tab = make_tab(tmp_path)
+def test_on_post_detection_error_without_cache_resets_fetch_ui(tmp_path, settings_tab):
+    tab = make_tab(tmp_path, settings_tab)
     tab.current_creator_url = "https://kemono.cr/fanbox/user/1"
     tab.all_files_map = {}
     cleaned = []
@@ -529,8 +537,8 @@ def test_on_post_detection_error_without_cache_resets_fetch_ui(tmp_path):
     assert tab.background_task_progress.value() == 0
 
 
-def test_view_current_item_non_image_logs_warning(tmp_path):
-    tab = make_tab(tmp_path)
+def test_view_current_item_non_image_logs_warning(tmp_path, settings_tab):
+    tab = make_tab(tmp_path, settings_tab)
     tab.current_preview_url = "https://example.com/file.zip"
     logs = []
     tab.append_log_to_console = lambda msg, level: logs.append((msg, level))
@@ -540,8 +548,8 @@ def test_view_current_item_non_image_logs_warning(tmp_path):
     assert any(level == "WARNING" for _, level in logs)
 
 
-def test_on_selection_changed_updates_widget_style(tmp_path):
-    tab = make_tab(tmp_path)
+def test_on_selection_changed_updates_widget_style(tmp_path, settings_tab):
+    tab = make_tab(tmp_path, settings_tab)
     tab.post_url_map["Post A"] = ("101", None)
     tab.add_list_item("Post A", None, True)
     item = tab.creator_post_list.item(0)
@@ -552,8 +560,8 @@ def test_on_selection_changed_updates_widget_style(tmp_path):
     assert tab.previous_selected_widgets
 
 
-def test_append_log_to_console_updates_visible_logs_window(tmp_path):
-    tab = make_tab(tmp_path)
+def test_append_log_to_console_updates_visible_logs_window(tmp_path, settings_tab):
+    tab = make_tab(tmp_path, settings_tab)
     updates = []
     tab.logs_window = SimpleNamespace(
         isVisible=lambda: True,
@@ -565,8 +573,10 @@ def test_append_log_to_console_updates_visible_logs_window(tmp_path):
     assert updates
 
 
-def test_add_creators_from_file_empty_selection_returns(tmp_path, monkeypatch):
-    tab = make_tab(tmp_path)
+def test_add_creators_from_file_empty_selection_returns(
+    tmp_path, monkeypatch, settings_tab
+):
+    tab = make_tab(tmp_path, settings_tab)
     monkeypatch.setattr(cd.QFileDialog, "getOpenFileName", lambda *a, **k: ("", ""))
 
     tab.add_creators_from_file()
@@ -575,9 +585,9 @@ def test_add_creators_from_file_empty_selection_returns(tmp_path, monkeypatch):
 
 
 def test_add_creators_from_file_read_error_logs_and_shows_critical(
-    tmp_path, monkeypatch
+    tmp_path, monkeypatch, settings_tab
 ):
-    tab = make_tab(tmp_path)
+    tab = make_tab(tmp_path, settings_tab)
     links = tmp_path / "links.txt"
     links.write_text("https://kemono.cr/fanbox/user/1\n")
 
@@ -641,8 +651,8 @@ def test_cancellation_thread_stop_and_wait_runtime_paths(monkeypatch):
     assert any(level == "WARNING" for _, level in logs)
 
 
-def test_show_fast_mode_info_calls_information(tmp_path, monkeypatch):
-    tab = make_tab(tmp_path)
+def test_show_fast_mode_info_calls_information(tmp_path, monkeypatch, settings_tab):
+    tab = make_tab(tmp_path, settings_tab)
     called = {}
     monkeypatch.setattr(
         cd.QMessageBox,
@@ -655,8 +665,10 @@ def test_show_fast_mode_info_calls_information(tmp_path, monkeypatch):
     assert called.get("ok") is True
 
 
-def test_add_multiple_creators_to_queue_skips_blank_lines(tmp_path, monkeypatch):
-    tab = make_tab(tmp_path)
+def test_add_multiple_creators_to_queue_skips_blank_lines(
+    tmp_path, monkeypatch, settings_tab
+):
+    tab = make_tab(tmp_path, settings_tab)
     tab.creator_multi_url_input.setPlainText("\nhttps://kemono.cr/fanbox/user/123\n")
     monkeypatch.setattr(cd, "get_domain_config", lambda url: {"domain": "kemono.cr"})
 
@@ -666,8 +678,8 @@ def test_add_multiple_creators_to_queue_skips_blank_lines(tmp_path, monkeypatch)
     assert tab.creator_queue[0][0].endswith("/123")
 
 
-def test_create_view_handler_calls_check_creator_from_queue(tmp_path):
-    tab = make_tab(tmp_path)
+def test_create_view_handler_calls_check_creator_from_queue(tmp_path, settings_tab):
+    tab = make_tab(tmp_path, settings_tab)
     called = []
     tab.check_creator_from_queue = lambda url: called.append(url)
     handler = tab.create_view_handler("https://kemono.cr/fanbox/user/9", False)
@@ -677,8 +689,10 @@ def test_create_view_handler_calls_check_creator_from_queue(tmp_path):
     assert called == ["https://kemono.cr/fanbox/user/9"]
 
 
-def test_create_remove_handler_not_found_logs_warning(tmp_path, monkeypatch):
-    tab = make_tab(tmp_path)
+def test_create_remove_handler_not_found_logs_warning(
+    tmp_path, monkeypatch, settings_tab
+):
+    tab = make_tab(tmp_path, settings_tab)
     tab.creator_queue = [("https://kemono.cr/fanbox/user/1", False)]
     logs = []
     tab.append_log_to_console = lambda msg, level: logs.append((msg, level))
@@ -692,8 +706,8 @@ def test_create_remove_handler_not_found_logs_warning(tmp_path, monkeypatch):
     assert any(level == "WARNING" for _, level in logs)
 
 
-def test_on_post_detection_finished_sets_map_and_detected_posts(tmp_path):
-    tab = make_tab(tmp_path)
+def test_on_post_detection_finished_sets_map_and_detected_posts(tmp_path, settings_tab):
+    tab = make_tab(tmp_path, settings_tab)
     tab.current_creator_url = "https://kemono.cr/fanbox/user/1"
     tab.all_files_map = {}
     tab.all_detected_posts = []
@@ -701,6 +715,9 @@ def test_on_post_detection_finished_sets_map_and_detected_posts(tmp_path):
     tab.start_population_thread = lambda posts: started.append(posts)
     detected_posts = [("Title", ("101", None))]
 
+    tab.post_detection_thread = cd.PostDetectionThread(
+        tab.current_creator_url, {}, tab._create_thread_settings()
+    )
     tab.on_post_detection_finished(detected_posts)
 
     assert tab.all_files_map[tab.current_creator_url] == detected_posts
@@ -708,8 +725,10 @@ def test_on_post_detection_finished_sets_map_and_detected_posts(tmp_path):
     assert started == [detected_posts]
 
 
-def test_on_post_population_finished_fast_mode_triggers_auto_download(tmp_path):
-    tab = make_tab(tmp_path)
+def test_on_post_population_finished_fast_mode_triggers_auto_download(
+    tmp_path, settings_tab
+):
+    tab = make_tab(tmp_path, settings_tab)
     tab.current_creator_url = "https://kemono.cr/fanbox/user/1"
     tab.creator_queue = [(tab.current_creator_url, False)]
     tab._fast_mode_downloading = True
@@ -724,8 +743,8 @@ def test_on_post_population_finished_fast_mode_triggers_auto_download(tmp_path):
     assert called == [True]
 
 
-def test_start_creator_download_no_queue_warns(tmp_path):
-    tab = make_tab(tmp_path)
+def test_start_creator_download_no_queue_warns(tmp_path, settings_tab):
+    tab = make_tab(tmp_path, settings_tab)
     logs = []
     tab.append_log_to_console = lambda msg, level: logs.append((msg, level))
 
@@ -734,16 +753,18 @@ def test_start_creator_download_no_queue_warns(tmp_path):
     assert any(level == "WARNING" for _, level in logs)
 
 
-def test_update_background_progress_sets_progress_value(tmp_path):
-    tab = make_tab(tmp_path)
+def test_update_background_progress_sets_progress_value(tmp_path, settings_tab):
+    tab = make_tab(tmp_path, settings_tab)
 
     tab.update_background_progress(42)
 
     assert tab.background_task_progress.value() == 42
 
 
-def test_on_file_preparation_finished_splits_query_from_service(tmp_path, monkeypatch):
-    tab = make_tab(tmp_path)
+def test_on_file_preparation_finished_splits_query_from_service(
+    tmp_path, monkeypatch, settings_tab
+):
+    tab = make_tab(tmp_path, settings_tab)
     tab.posts_to_download = ["101"]
     tab.total_posts_to_download = 1
     created = {}
@@ -753,16 +774,21 @@ def test_on_file_preparation_finished_splits_query_from_service(tmp_path, monkey
             created["service"] = service
             created["creator_id"] = creator_id
             self.file_progress = DummySignal()
+            self.transfer_progress = DummySignal()
             self.file_completed = DummySignal()
             self.post_completed = DummySignal()
             self.log = DummySignal()
             self.finished = DummySignal()
+            self.concurrency_changed = DummySignal()
 
         def start(self):
             created["started"] = True
 
     monkeypatch.setattr(cd, "CreatorDownloadThread", FakeCreatorDownloadThread)
 
+    tab.file_preparation_thread = cd.FilePreparationThread(
+        [], {}, {}, True, True, True, tab._create_thread_settings()
+    )
     tab.on_file_preparation_finished(
         ["https://kemono.cr/fanbox?token=abc/user/42"],
         ["https://kemono.cr/files/a.jpg"],
@@ -774,8 +800,8 @@ def test_on_file_preparation_finished_splits_query_from_service(tmp_path, monkey
     assert created["started"] is True
 
 
-def test_cleanup_thread_transfers_non_dict_mapping(tmp_path):
-    tab = make_tab(tmp_path)
+def test_cleanup_thread_transfers_non_dict_mapping(tmp_path, settings_tab):
+    tab = make_tab(tmp_path, settings_tab)
 
     class FakeThread:
         failed_files = [("u1", "err1")]
@@ -799,8 +825,8 @@ def test_cleanup_thread_transfers_non_dict_mapping(tmp_path):
     assert tab.failed_files.get("u1") == "err1"
 
 
-def test_cleanup_thread_ignores_first_transfer_exception(tmp_path):
-    tab = make_tab(tmp_path)
+def test_cleanup_thread_ignores_first_transfer_exception(tmp_path, settings_tab):
+    tab = make_tab(tmp_path, settings_tab)
 
     class FakeThread:
         failed_files = [("bad",)]
@@ -821,8 +847,8 @@ def test_cleanup_thread_ignores_first_transfer_exception(tmp_path):
     tab.cleanup_thread(FakeThread(), ["next"])
 
 
-def test_cleanup_thread_active_thread_wait_and_runtime_delete(tmp_path):
-    tab = make_tab(tmp_path)
+def test_cleanup_thread_active_thread_wait_and_runtime_delete(tmp_path, settings_tab):
+    tab = make_tab(tmp_path, settings_tab)
     waited = []
 
     class FakeThread:
@@ -849,8 +875,10 @@ def test_cleanup_thread_active_thread_wait_and_runtime_delete(tmp_path):
     assert tab.failed_files.get("u2") == "err2"
 
 
-def test_cleanup_thread_runtime_during_lingering_termination_processes_next(tmp_path):
-    tab = make_tab(tmp_path)
+def test_cleanup_thread_runtime_during_lingering_termination_processes_next(
+    tmp_path, settings_tab
+):
+    tab = make_tab(tmp_path, settings_tab)
 
     class MainThread:
         failed_files = {"done": "err"}
@@ -890,8 +918,8 @@ def test_cleanup_thread_runtime_during_lingering_termination_processes_next(tmp_
     assert moved == [["u2"]]
 
 
-def test_cleanup_thread_preserves_new_non_dict_failures(tmp_path):
-    tab = make_tab(tmp_path)
+def test_cleanup_thread_preserves_new_non_dict_failures(tmp_path, settings_tab):
+    tab = make_tab(tmp_path, settings_tab)
 
     class FakeThread:
         failed_files = [("existing", "new-err"), ("new", "err")]
@@ -915,8 +943,10 @@ def test_cleanup_thread_preserves_new_non_dict_failures(tmp_path):
     assert tab.failed_files["new"] == "err"
 
 
-def test_update_file_completion_all_attempted_and_reset_current_file(tmp_path):
-    tab = make_tab(tmp_path)
+def test_update_file_completion_all_attempted_and_reset_current_file(
+    tmp_path, settings_tab
+):
+    tab = make_tab(tmp_path, settings_tab)
     tab.total_files_to_download = 1
     tab.current_file_index = 0
     called = []
@@ -929,8 +959,8 @@ def test_update_file_completion_all_attempted_and_reset_current_file(tmp_path):
     assert tab.creator_file_progress.value() == 0
 
 
-def test_creator_download_finished_fast_mode_safety_removal(tmp_path):
-    tab = make_tab(tmp_path)
+def test_creator_download_finished_fast_mode_safety_removal(tmp_path, settings_tab):
+    tab = make_tab(tmp_path, settings_tab)
     tab.fast_mode = True
     tab.current_creator_url = "https://kemono.cr/fanbox/user/1"
     removed = []
@@ -944,8 +974,10 @@ def test_creator_download_finished_fast_mode_safety_removal(tmp_path):
     assert states and states[-1] is False
 
 
-def test_creator_download_finished_fast_mode_processes_next_and_returns(tmp_path):
-    tab = make_tab(tmp_path)
+def test_creator_download_finished_fast_mode_processes_next_and_returns(
+    tmp_path, settings_tab
+):
+    tab = make_tab(tmp_path, settings_tab)
     tab._fast_mode_downloading = True
     called = []
     tab._fast_mode_process_next = lambda: called.append(True)
@@ -956,8 +988,10 @@ def test_creator_download_finished_fast_mode_processes_next_and_returns(tmp_path
     assert called == [True]
 
 
-def test_expand_logs_creates_and_focuses_existing_window(tmp_path, monkeypatch):
-    tab = make_tab(tmp_path)
+def test_expand_logs_creates_and_focuses_existing_window(
+    tmp_path, monkeypatch, settings_tab
+):
+    tab = make_tab(tmp_path, settings_tab)
     events = []
 
     class FakeLogsWindow:
@@ -989,8 +1023,8 @@ def test_expand_logs_creates_and_focuses_existing_window(tmp_path, monkeypatch):
     assert events == ["show", "raise", "activate", "update"]
 
 
-def test_toggle_check_all_in_progress_logs_warning(tmp_path):
-    tab = make_tab(tmp_path)
+def test_toggle_check_all_in_progress_logs_warning(tmp_path, settings_tab):
+    tab = make_tab(tmp_path, settings_tab)
     tab.checkbox_toggle_thread = SimpleNamespace(isRunning=lambda: True)
     logs = []
     tab.append_log_to_console = lambda msg, level: logs.append((msg, level))
@@ -1000,8 +1034,8 @@ def test_toggle_check_all_in_progress_logs_warning(tmp_path):
     assert any(level == "WARNING" for _, level in logs)
 
 
-def test_filter_items_in_progress_logs_warning(tmp_path):
-    tab = make_tab(tmp_path)
+def test_filter_items_in_progress_logs_warning(tmp_path, settings_tab):
+    tab = make_tab(tmp_path, settings_tab)
     tab.filter_thread = SimpleNamespace(isRunning=lambda: True)
     logs = []
     tab.append_log_to_console = lambda msg, level: logs.append((msg, level))
@@ -1011,8 +1045,10 @@ def test_filter_items_in_progress_logs_warning(tmp_path):
     assert any(level == "WARNING" for _, level in logs)
 
 
-def test_update_checked_posts_adds_checked_ids_for_current_creator(tmp_path):
-    tab = make_tab(tmp_path)
+def test_update_checked_posts_adds_checked_ids_for_current_creator(
+    tmp_path, settings_tab
+):
+    tab = make_tab(tmp_path, settings_tab)
     tab.current_creator_url = "https://kemono.cr/fanbox/user/1"
     tab.all_files_map = {tab.current_creator_url: [("Post", ("101", None))]}
     tab.checked_urls = {"101": True, "202": True}
@@ -1022,8 +1058,8 @@ def test_update_checked_posts_adds_checked_ids_for_current_creator(tmp_path):
     assert tab.posts_to_download == ["101"]
 
 
-def test_on_filter_finished_resets_page_when_out_of_range(tmp_path):
-    tab = make_tab(tmp_path)
+def test_on_filter_finished_resets_page_when_out_of_range(tmp_path, settings_tab):
+    tab = make_tab(tmp_path, settings_tab)
     tab.current_page = 3
     tab.posts_per_page = 50
     tab.display_current_page = lambda: None
@@ -1035,8 +1071,10 @@ def test_on_filter_finished_resets_page_when_out_of_range(tmp_path):
     assert tab.current_page == 1
 
 
-def test_toggle_checkbox_state_single_item_path_uses_cached_widget(tmp_path):
-    tab = make_tab(tmp_path)
+def test_toggle_checkbox_state_single_item_path_uses_cached_widget(
+    tmp_path, settings_tab
+):
+    tab = make_tab(tmp_path, settings_tab)
     tab.current_creator_url = "https://kemono.cr/fanbox/user/1"
     tab.all_files_map = {tab.current_creator_url: [("Post A", ("101", None))]}
     tab.checked_urls = {"101": False}
@@ -1048,8 +1086,8 @@ def test_toggle_checkbox_state_single_item_path_uses_cached_widget(tmp_path):
     assert tab.checked_urls["101"] is True
 
 
-def test_get_widget_for_post_title_cached_and_missing(tmp_path):
-    tab = make_tab(tmp_path)
+def test_get_widget_for_post_title_cached_and_missing(tmp_path, settings_tab):
+    tab = make_tab(tmp_path, settings_tab)
     tab.post_url_map["Post A"] = ("101", None)
     tab.add_list_item("Post A", None, False)
 
@@ -1057,8 +1095,8 @@ def test_get_widget_for_post_title_cached_and_missing(tmp_path):
     assert tab.get_widget_for_post_title("Missing") is None
 
 
-def test_view_current_item_image_opens_modal(tmp_path, monkeypatch):
-    tab = make_tab(tmp_path)
+def test_view_current_item_image_opens_modal(tmp_path, monkeypatch, settings_tab):
+    tab = make_tab(tmp_path, settings_tab)
     tab.current_preview_url = "https://example.com/a.jpg"
     called = []
 
@@ -1076,8 +1114,10 @@ def test_view_current_item_image_opens_modal(tmp_path, monkeypatch):
     assert called and called[-1] == "exec"
 
 
-def test_on_selection_changed_ignores_runtimeerror_from_stale_widget(tmp_path):
-    tab = make_tab(tmp_path)
+def test_on_selection_changed_ignores_runtimeerror_from_stale_widget(
+    tmp_path, settings_tab
+):
+    tab = make_tab(tmp_path, settings_tab)
 
     class BadWidget:
         def setStyleSheet(self, _style):
@@ -1090,8 +1130,8 @@ def test_on_selection_changed_ignores_runtimeerror_from_stale_widget(tmp_path):
     assert isinstance(tab.previous_selected_widgets, list)
 
 
-def test_add_creators_from_file_skips_empty_lines(tmp_path, monkeypatch):
-    tab = make_tab(tmp_path)
+def test_add_creators_from_file_skips_empty_lines(tmp_path, monkeypatch, settings_tab):
+    tab = make_tab(tmp_path, settings_tab)
     links = tmp_path / "links_empty.txt"
     links.write_text("\nhttps://kemono.cr/fanbox/user/77\n")
     monkeypatch.setattr(
@@ -1138,8 +1178,10 @@ def test_cancellation_thread_outer_runtimeerror_logs_warning():
     assert any(level == "WARNING" for _, level in logs)
 
 
-def test_add_multiple_creators_to_queue_internal_blank_line(tmp_path, monkeypatch):
-    tab = make_tab(tmp_path)
+def test_add_multiple_creators_to_queue_internal_blank_line(
+    tmp_path, monkeypatch, settings_tab
+):
+    tab = make_tab(tmp_path, settings_tab)
     tab.creator_multi_url_input.setPlainText(
         "https://kemono.cr/fanbox/user/11\n\nhttps://kemono.cr/fanbox/user/22"
     )
@@ -1150,8 +1192,8 @@ def test_add_multiple_creators_to_queue_internal_blank_line(tmp_path, monkeypatc
     assert len(tab.creator_queue) == 2
 
 
-def test_cleanup_thread_outer_failed_files_exception_is_ignored(tmp_path):
-    tab = make_tab(tmp_path)
+def test_cleanup_thread_outer_failed_files_exception_is_ignored(tmp_path, settings_tab):
+    tab = make_tab(tmp_path, settings_tab)
 
     class BadFailedFilesThread:
         @property
@@ -1173,8 +1215,10 @@ def test_cleanup_thread_outer_failed_files_exception_is_ignored(tmp_path):
     tab.cleanup_thread(BadFailedFilesThread(), ["next"])
 
 
-def test_cleanup_thread_second_transfer_inner_exception_is_ignored(tmp_path):
-    tab = make_tab(tmp_path)
+def test_cleanup_thread_second_transfer_inner_exception_is_ignored(
+    tmp_path, settings_tab
+):
+    tab = make_tab(tmp_path, settings_tab)
 
     class BadMappingThread:
         failed_files = [("broken",)]
@@ -1196,8 +1240,10 @@ def test_cleanup_thread_second_transfer_inner_exception_is_ignored(tmp_path):
     tab.cleanup_thread(thread, ["next"])
 
 
-def test_cleanup_thread_second_transfer_outer_exception_is_ignored(tmp_path):
-    tab = make_tab(tmp_path)
+def test_cleanup_thread_second_transfer_outer_exception_is_ignored(
+    tmp_path, settings_tab
+):
+    tab = make_tab(tmp_path, settings_tab)
 
     class FlakyFailedFilesThread:
         def __init__(self):
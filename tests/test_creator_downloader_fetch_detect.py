@@ -37,7 +37,7 @@ def test_fetch_and_detect_files_success(monkeypatch):
     fake_session = FakeSession([FakeResponse(200, post_payload)])
     monkeypatch.setattr(cd, "get_session", lambda settings_tab: fake_session)
 
-    settings = SimpleNamespace(post_data_max_retries=1, settings_tab=None)
+    settings = cd.ThreadSettings(1, 1, 1, 1, 1, settings_tab=None)
 
     class C:
         def __init__(self, checked=True):
@@ -66,7 +66,7 @@ def test_fetch_and_detect_files_rate_limit_retry(monkeypatch):
     # Avoid sleeping delays
     monkeypatch.setattr(cd, "time", SimpleNamespace(sleep=lambda s: None))
 
-    settings = SimpleNamespace(post_data_max_retries=2, settings_tab=None)
+    settings = cd.ThreadSettings(1, 2, 1, 1, 1, settings_tab=None)
 
     class C:
         def __init__(self, checked=True):
@@ -90,7 +90,7 @@ def test_download_text_sync_writes_file(monkeypatch, tmp_path):
     fake_session = FakeSession([FakeResponse(200, post_payload)])
     monkeypatch.setattr(cd, "get_session", lambda settings_tab: fake_session)
 
-    settings = SimpleNamespace(settings_tab=None)
+    settings = cd.ThreadSettings(1, 1, 1, 1, 1, settings_tab=None)
     t = cd.CreatorDownloadThread(
         "service",
         "creator",
@@ -1,5 +1,4 @@
 import os
-from types import SimpleNamespace
 
 from kemonodownloader.creator_downloader import (
     CreatorDownloadThread,
@@ -8,12 +7,9 @@ from kemonodownloader.creator_downloader import (
 )
 
 
-def make_settings_with_strategy(strategy, template=None):
-    settings_tab = SimpleNamespace(
-        get_creator_filename_template=lambda: template,
-        get_creator_folder_strategy=lambda: strategy,
-        get_proxy_settings=lambda: None,
-    )
+def make_settings_with_strategy(settings_tab, strategy, template=None):
+    settings_tab.settings["creator_filename_template"] = template
+    settings_tab.settings["creator_folder_strategy"] = strategy
     return ThreadSettings(
         creator_posts_max_attempts=1,
         post_data_max_retries=1,
@@ -24,7 +20,7 @@ def make_settings_with_strategy(strategy, template=None):
     )
 
 
-def test_generate_filename_and_folder_autorename_and_strategies(tmp_path):
+def test_generate_filename_and_folder_autorename_and_strategies(tmp_path, settings_tab):
     download_folder = str(tmp_path / "downloads")
     other_files_dir = str(tmp_path / "other")
     os.makedirs(download_folder, exist_ok=True)
@@ -35,7 +31,7 @@ def test_generate_filename_and_folder_autorename_and_strategies(tmp_path):
     files_to_posts_map = {file_url: "1"}
 
     # Per-post strategy with auto-rename
-    settings = make_settings_with_strategy("per_post", template=None)
+    settings = make_settings_with_strategy(settings_tab, "per_post", template=None)
     thread = CreatorDownloadThread(
         service="svc",
         creator_id="creator123",
@@ -64,7 +60,7 @@ def test_generate_filename_and_folder_autorename_and_strategies(tmp_path):
     assert os.path.basename(target_folder) == expected_post_folder
 
     # Single-folder strategy places desc in creator folder
-    settings2 = make_settings_with_strategy("single_folder")
+    settings2 = make_settings_with_strategy(settings_tab, "single_folder")
     thread2 = CreatorDownloadThread(
         service="svc",
         creator_id="creator123",
@@ -91,7 +87,7 @@ def test_generate_filename_and_folder_autorename_and_strategies(tmp_path):
     )
 
 
-def test_template_fallback_on_error(tmp_path):
+def test_template_fallback_on_error(tmp_path, settings_tab):
     download_folder = str(tmp_path / "downloads3")
     other_files_dir = str(tmp_path / "other3")
     os.makedirs(download_folder, exist_ok=True)
@@ -103,7 +99,7 @@ def test_template_fallback_on_error(tmp_path):
 
     # Provide a broken template that will raise during formatting
     settings = make_settings_with_strategy(
-        "per_post", template="{nonexistent}_{post_id}"
+        settings_tab, "per_post", template="{nonexistent}_{post_id}"
     )
     thread = CreatorDownloadThread(
         service="svc",
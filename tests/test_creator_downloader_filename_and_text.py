@@ -1,15 +1,11 @@
 import os
-from types import SimpleNamespace
 
 from kemonodownloader.creator_downloader import CreatorDownloadThread, ThreadSettings
 
 
-def make_settings(strategy=None, template=None):
-    settings_tab = SimpleNamespace(
-        get_creator_filename_template=lambda: template,
-        get_creator_folder_strategy=lambda: strategy or "per_post",
-        get_proxy_settings=lambda: None,
-    )
+def make_settings(settings_tab, strategy=None, template=None):
+    settings_tab.settings["creator_filename_template"] = template
+    settings_tab.settings["creator_folder_strategy"] = strategy or "per_post"
     return ThreadSettings(
         creator_posts_max_attempts=1,
         post_data_max_retries=1,
@@ -20,7 +16,7 @@ def make_settings(strategy=None, template=None):
     )
 
 
-def test_generate_filename_and_folder_strategies(tmp_path):
+def test_generate_filename_and_folder_strategies(tmp_path, settings_tab):
     download_folder = str(tmp_path / "out")
     other_files_dir = str(tmp_path / "other")
     os.makedirs(download_folder, exist_ok=True)
@@ -31,7 +27,7 @@ def test_generate_filename_and_folder_strategies(tmp_path):
     files_to_posts_map = {file_url: "1"}
 
     # Default per_post
-    settings = make_settings()
+    settings = make_settings(settings_tab)
     thread = CreatorDownloadThread(
         service="svc",
         creator_id="creator123",
@@ -55,7 +51,7 @@ def test_generate_filename_and_folder_strategies(tmp_path):
     assert filename.endswith(".png")
 
     # single_folder strategy
-    settings = make_settings(strategy="single_folder")
+    settings = make_settings(settings_tab, strategy="single_folder")
     thread.settings = settings
     target_folder_sf, _ = thread.generate_filename_and_folder(
         file_url, download_folder, 0, 1, "1", "MyPost"
@@ -66,7 +62,7 @@ def test_generate_filename_and_folder_strategies(tmp_path):
     )
 
     # by_file_type strategy
-    settings = make_settings(strategy="by_file_type")
+    settings = make_settings(settings_tab, strategy="by_file_type")
     thread.settings = settings
     target_folder_bt, _ = thread.generate_filename_and_folder(
         file_url, download_folder, 0, 1, "1", "MyPost"
@@ -74,7 +70,7 @@ def test_generate_filename_and_folder_strategies(tmp_path):
     assert os.path.basename(target_folder_bt) == "png"
 
 
-def test_auto_rename_prefix_increments(tmp_path):
+def test_auto_rename_prefix_increments(tmp_path, settings_tab):
     download_folder = str(tmp_path / "out2")
     other_files_dir = str(tmp_path / "other2")
     os.makedirs(download_folder, exist_ok=True)
@@ -84,7 +80,7 @@ def test_auto_rename_prefix_increments(tmp_path):
     files_to_download = [file_url]
     files_to_posts_map = {file_url: "1"}
 
-    settings = make_settings()
+    settings = make_settings(settings_tab)
     thread = CreatorDownloadThread(
         service="svc",
         creator_id="creator123",
@@ -111,7 +107,7 @@ def test_auto_rename_prefix_increments(tmp_path):
     assert fname2.startswith("2_")
 
 
-def test_template_error_fallback(tmp_path):
+def test_template_error_fallback(tmp_path, settings_tab):
     download_folder = str(tmp_path / "out3")
     other_files_dir = str(tmp_path / "other3")
     os.makedirs(download_folder, exist_ok=True)
@@ -122,7 +118,7 @@ def test_template_error_fallback(tmp_path):
     files_to_posts_map = {file_url: "1"}
 
     # Template references missing key -> fallback should be used
-    settings = make_settings(template="{nonexistent}")
+    settings = make_settings(settings_tab, template="{nonexistent}")
     thread = CreatorDownloadThread(
         service="svc",
         creator_id="creator123",
@@ -150,7 +146,7 @@ def test_template_error_fallback(tmp_path):
     )
 
 
-def test_download_text_sync_writes_description(monkeypatch, tmp_path):
+def test_download_text_sync_writes_description(monkeypatch, tmp_path, settings_tab):
     download_folder = str(tmp_path / "out4")
     other_files_dir = str(tmp_path / "other4")
     os.makedirs(download_folder, exist_ok=True)
@@ -160,7 +156,7 @@ def test_download_text_sync_writes_description(monkeypatch, tmp_path):
     files_to_download = [file_url]
     files_to_posts_map = {file_url: "1"}
 
-    settings = make_settings()
+    settings = make_settings(settings_tab)
     thread = CreatorDownloadThread(
         service="svc",
         creator_id="creator123",
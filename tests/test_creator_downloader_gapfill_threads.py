@@ -1,4 +1,5 @@
 import asyncio
+import contextlib
 import gzip
 import json
 import os
@@ -7,7 +8,7 @@ from types import SimpleNamespace
 
 from PyQt6.QtWidgets import QWidget
 
-from kemonodownloader import creator_downloader as cd
+from kemonodownloader import creator_downloader as cd, download_core
 
 
 class Recorder:
@@ -92,7 +93,7 @@ def test_preview_thread_unexpected_exception_path(monkeypatch, tmp_path):
 
 
 def test_post_detection_stop_and_early_run_return():
-    settings = SimpleNamespace(creator_posts_max_attempts=1, settings_tab=None)
+    settings = cd.ThreadSettings(1, 1, 1, 1, 1, settings_tab=None)
     thread = cd.PostDetectionThread("https://kemono.cr/fanbox/user/1", {}, settings)
 
     thread.stop()
@@ -102,7 +103,7 @@ def test_post_detection_stop_and_early_run_return():
 
 
 def test_post_detection_top_level_exception_emits_error(monkeypatch):
-    settings = SimpleNamespace(creator_posts_max_attempts=1, settings_tab=None)
+    settings = cd.ThreadSettings(1, 1, 1, 1, 1, settings_tab=None)
     thread = cd.PostDetectionThread("https://kemono.cr/fanbox/user/1", {}, settings)
     logs = []
     errors = []
@@ -131,7 +132,7 @@ def test_post_detection_invalid_offset_logs_warning(monkeypatch):
         lambda settings_tab=None: SimpleNamespace(get=lambda *a, **k: Resp()),
     )
 
-    settings = SimpleNamespace(creator_posts_max_attempts=1, settings_tab=None)
+    settings = cd.ThreadSettings(1, 1, 1, 1, 1, settings_tab=None)
     thread = cd.PostDetectionThread(
         "https://kemono.cr/fanbox/user/1?o=abc", {}, settings
     )
@@ -176,7 +177,7 @@ def test_post_detection_likely_end_branch_after_first_page(monkeypatch):
     monkeypatch.setattr(cd, "get_session", lambda *a, **k: sess)
     monkeypatch.setattr(cd.time, "sleep", lambda _s: None)
 
-    settings = SimpleNamespace(creator_posts_max_attempts=2, settings_tab=None)
+    settings = cd.ThreadSettings(2, 1, 1, 1, 1, settings_tab=None)
     thread = cd.PostDetectionThread("https://kemono.cr/fanbox/user/1", {}, settings)
     out = []
     thread.finished = SimpleNamespace(emit=lambda posts: out.append(posts))
@@ -198,7 +199,7 @@ def test_post_detection_returns_if_stopped_after_success(monkeypatch):
         text = payload
         content = payload.encode("utf-8")
 
-    settings = SimpleNamespace(creator_posts_max_attempts=1, settings_tab=None)
+    settings = cd.ThreadSettings(1, 1, 1, 1, 1, settings_tab=None)
     thread = cd.PostDetectionThread("https://kemono.cr/fanbox/user/1", {}, settings)
 
     def fake_get(*a, **k):
@@ -234,7 +235,7 @@ def test_post_detection_empty_response_breaks(monkeypatch):
         lambda settings_tab=None: SimpleNamespace(get=lambda *a, **k: Resp()),
     )
 
-    settings = SimpleNamespace(creator_posts_max_attempts=1, settings_tab=None)
+    settings = cd.ThreadSettings(1, 1, 1, 1, 1, settings_tab=None)
     thread = cd.PostDetectionThread("https://kemono.cr/fanbox/user/1", {}, settings)
     finished = []
     thread.finished = SimpleNamespace(emit=lambda posts: finished.append(posts))
@@ -265,8 +266,9 @@ def test_post_detection_stops_before_json_parse(monkeypatch):
         "translate",
         lambda key, *args: f"{key}:{'|'.join(str(a) for a in args)}",
     )
+    monkeypatch.setattr(download_core, "translate", cd.translate)
 
-    settings = SimpleNamespace(creator_posts_max_attempts=1, settings_tab=None)
+    settings = cd.ThreadSettings(1, 1, 1, 1, 1, settings_tab=None)
     thread = cd.PostDetectionThread("https://kemono.cr/fanbox/user/1", {}, settings)
 
     def log_emit(msg, level):
@@ -299,7 +301,7 @@ def test_post_detection_data_key_branch(monkeypatch):
     )
 
     post_titles_map = {}
-    settings = SimpleNamespace(creator_posts_max_attempts=1, settings_tab=None)
+    settings = cd.ThreadSettings(1, 1, 1, 1, 1, settings_tab=None)
     thread = cd.PostDetectionThread(
         "https://kemono.cr/fanbox/user/1", post_titles_map, settings
     )
@@ -325,7 +327,7 @@ def test_post_detection_invalid_posts_data_type(monkeypatch):
         lambda settings_tab=None: SimpleNamespace(get=lambda *a, **k: Resp()),
     )
 
-    settings = SimpleNamespace(creator_posts_max_attempts=1, settings_tab=None)
+    settings = cd.ThreadSettings(1, 1, 1, 1, 1, settings_tab=None)
     thread = cd.PostDetectionThread("https://kemono.cr/fanbox/user/1", {}, settings)
     thread.finished = SimpleNamespace(emit=lambda *a, **k: None)
     thread.posts_batch = SimpleNamespace(emit=lambda *a, **k: None)
@@ -357,8 +359,9 @@ def test_post_detection_skips_invalid_posts_and_sets_file_thumbnail(monkeypatch)
         "translate",
         lambda key, *args: f"{key}:{'|'.join(str(a) for a in args)}",
     )
+    monkeypatch.setattr(download_core, "translate", cd.translate)
 
-    settings = SimpleNamespace(creator_posts_max_attempts=1, settings_tab=None)
+    settings = cd.ThreadSettings(1, 1, 1, 1, 1, settings_tab=None)
     thread = cd.PostDetectionThread("https://kemono.cr/fanbox/user/1", {}, settings)
     batches = []
     finished = []
@@ -394,7 +397,7 @@ def test_post_detection_single_page_target(monkeypatch):
         lambda settings_tab=None: SimpleNamespace(get=lambda *a, **k: Resp()),
     )
 
-    settings = SimpleNamespace(creator_posts_max_attempts=2, settings_tab=None)
+    settings = cd.ThreadSettings(2, 1, 1, 1, 1, settings_tab=None)
     thread = cd.PostDetectionThread("https://kemono.cr/fanbox/user/1?o=0", {}, settings)
     thread.finished = SimpleNamespace(emit=lambda *a, **k: None)
     thread.posts_batch = SimpleNamespace(emit=lambda *a, **k: None)
@@ -420,7 +423,7 @@ def test_post_detection_offset_increment_path(monkeypatch):
         lambda settings_tab=None: SimpleNamespace(get=lambda *a, **k: Resp()),
     )
 
-    settings = SimpleNamespace(creator_posts_max_attempts=1, settings_tab=None)
+    settings = cd.ThreadSettings(1, 1, 1, 1, 1, settings_tab=None)
     thread = cd.PostDetectionThread("https://kemono.cr/fanbox/user/1", {}, settings)
     thread.finished = SimpleNamespace(emit=lambda *a, **k: None)
     thread.posts_batch = SimpleNamespace(emit=lambda *a, **k: None)
@@ -446,13 +449,13 @@ def test_file_prep_fetch_detect_cleans_query_parts(monkeypatch):
         status_code = 500
 
     class Sess:
-        def get(self, url, headers=None):
+        def get(self, url, headers=None, timeout=None):
             called["url"] = url
             return Resp()
 
     monkeypatch.setattr(cd, "get_session", lambda *a, **k: Sess())
 
-    settings = SimpleNamespace(post_data_max_retries=1, settings_tab=None)
+    settings = cd.ThreadSettings(1, 1, 1, 1, 1, settings_tab=None)
     t = cd.FilePreparationThread([], {}, {}, True, True, True, settings)
     t.log = SimpleNamespace(emit=lambda *a, **k: None)
 
@@ -469,13 +472,13 @@ def test_file_prep_fetch_detect_unknown_service_fallback(monkeypatch):
         status_code = 500
 
     class Sess:
-        def get(self, url, headers=None):
+        def get(self, url, headers=None, timeout=None):
             called["url"] = url
             return Resp()
 
     monkeypatch.setattr(cd, "get_session", lambda *a, **k: Sess())
 
-    settings = SimpleNamespace(post_data_max_retries=1, settings_tab=None)
+    settings = cd.ThreadSettings(1, 1, 1, 1, 1, settings_tab=None)
     t = cd.FilePreparationThread([], {}, {}, True, True, True, settings)
     t.log = SimpleNamespace(emit=lambda *a, **k: None)
 
@@ -495,7 +498,7 @@ def test_file_prep_fetch_detect_exception_retries(monkeypatch):
     )
     monkeypatch.setattr(cd.time, "sleep", lambda _s: None)
 
-    settings = SimpleNamespace(post_data_max_retries=2, settings_tab=None)
+    settings = cd.ThreadSettings(1, 2, 1, 1, 1, settings_tab=None)
     t = cd.FilePreparationThread([], {}, {}, True, True, True, settings)
     t.log = SimpleNamespace(emit=lambda *a, **k: None)
 
@@ -503,7 +506,7 @@ def test_file_prep_fetch_detect_exception_retries(monkeypatch):
 
 
 def test_file_prep_run_no_matching_creator_urls_emits_empty_result():
-    settings = SimpleNamespace(post_data_max_retries=1, settings_tab=None)
+    settings = cd.ThreadSettings(1, 1, 1, 1, 1, settings_tab=None)
     t = cd.FilePreparationThread(
         ["1"],
         {"https://kemono.cr/fanbox/user/1": [("Title", ("2", None))]},
@@ -525,7 +528,7 @@ def test_file_prep_run_no_matching_creator_urls_emits_empty_result():
 
 
 def test_file_prep_run_stop_before_loop_breaks_wait(monkeypatch):
-    settings = SimpleNamespace(post_data_max_retries=1, settings_tab=None)
+    settings = cd.ThreadSettings(1, 1, 1, 1, 1, settings_tab=None)
     checks = {".jpg": SimpleNamespace(isChecked=lambda: True)}
     all_files_map = {"https://kemono.cr/fanbox/user/1": [("Title", ("1", None))]}
     t = cd.FilePreparationThread(
@@ -539,21 +542,23 @@ def test_file_prep_run_stop_before_loop_breaks_wait(monkeypatch):
         max_concurrent=0,
     )
     t.log = SimpleNamespace(emit=lambda *a, **k: None)
-    t.finished = SimpleNamespace(emit=lambda *a, **k: None)
-    t.fetch_and_detect_files = lambda *_a, **_k: ("1", [])
+    finished = []
+    t.finished = SimpleNamespace(emit=lambda *a, **k: finished.append(a))
 
-    def sleepy(_s):
-        t.is_running = False
+    def fetch(*_a, **_k):
+        t.stop()
+        return ("1", [])
 
-    monkeypatch.setattr(cd.time, "sleep", sleepy)
+    t.fetch_and_detect_files = fetch
 
     t.run()
 
     assert t.is_running is False
+    assert finished == []
 
 
 def test_file_prep_run_progress_emit_runtimeerror(monkeypatch):
-    settings = SimpleNamespace(post_data_max_retries=1, settings_tab=None)
+    settings = cd.ThreadSettings(1, 1, 1, 1, 1, settings_tab=None)
     checks = {".jpg": SimpleNamespace(isChecked=lambda: True)}
     all_files_map = {"https://kemono.cr/fanbox/user/1": [("Title", ("1", None))]}
     t = cd.FilePreparationThread(
@@ -620,7 +625,7 @@ def test_download_text_sync_returns_when_description_exists(monkeypatch, tmp_pat
         other_files_dir=str(tmp_path / "other"),
         post_titles_map={},
         auto_rename_enabled=False,
-        settings=SimpleNamespace(settings_tab=None),
+        settings=cd.ThreadSettings(1, 1, 1, 1, 1, settings_tab=None),
         max_concurrent=1,
         download_text=False,
     )
@@ -652,7 +657,7 @@ def test_download_text_sync_exception_logs_warning(monkeypatch, tmp_path):
         other_files_dir=str(tmp_path / "other"),
         post_titles_map={},
         auto_rename_enabled=False,
-        settings=SimpleNamespace(settings_tab=None),
+        settings=cd.ThreadSettings(1, 1, 1, 1, 1, settings_tab=None),
         max_concurrent=1,
         download_text=False,
     )
@@ -665,26 +670,25 @@ def test_download_text_sync_exception_logs_warning(monkeypatch, tmp_path):
     assert logs
 
 
-def test_download_worker_handles_cancellederror_from_download_file():
-    dummy = SimpleNamespace(is_running=True)
+def test_download_worker_handles_cancellederror_from_download_file(tmp_path):
+    thread = _make_creator_thread(tmp_path, "u1")
 
     async def fail_download(*_a, **_k):
         raise asyncio.CancelledError()
 
-    dummy.download_file = fail_download
-    dummy._safe_emit = lambda *a, **k: None
-    dummy.log = SimpleNamespace(emit=lambda *a, **k: None)
+    thread.download_file = fail_download
+    thread._safe_emit = lambda *a, **k: None
 
     async def main():
         q = asyncio.Queue()
         await q.put((0, "u1"))
-        await cd.CreatorDownloadThread.download_worker(dummy, q, "/tmp", 1)
+        await thread.download_worker(q, "/tmp", 1)
 
     asyncio.run(main())
 
 
 def test_validation_thread_stop_and_early_run_return():
-    settings = SimpleNamespace(api_request_max_retries=1, settings_tab=None)
+    settings = cd.ThreadSettings(1, 1, 1, 1, 1, settings_tab=None)
     t = cd.ValidationThread("https://kemono.cr/fanbox/user/1", settings)
     t.stop()
     t.run()
@@ -703,7 +707,7 @@ def test_validation_thread_non_200_retry_branch(monkeypatch):
     )
     monkeypatch.setattr(cd.time, "sleep", lambda _s: None)
 
-    settings = SimpleNamespace(api_request_max_retries=2, settings_tab=None)
+    settings = cd.ThreadSettings(1, 1, 1, 2, 1, settings_tab=None)
     t = cd.ValidationThread("https://kemono.cr/fanbox/user/1", settings)
     t.log = SimpleNamespace(emit=lambda *a, **k: None)
     out = []
@@ -726,7 +730,7 @@ def test_validation_thread_request_exception_retry_branch(monkeypatch):
     )
     monkeypatch.setattr(cd.time, "sleep", lambda _s: None)
 
-    settings = SimpleNamespace(api_request_max_retries=2, settings_tab=None)
+    settings = cd.ThreadSettings(1, 1, 1, 2, 1, settings_tab=None)
     t = cd.ValidationThread("https://kemono.cr/fanbox/user/1", settings)
     t.log = SimpleNamespace(emit=lambda *a, **k: None)
     out = []
@@ -801,7 +805,7 @@ def test_creator_module_import_executes_locale_and_windows_branches(monkeypatch)
 
 
 def test_post_detection_nested_emit_failures_are_ignored(monkeypatch):
-    settings = SimpleNamespace(creator_posts_max_attempts=1, settings_tab=None)
+    settings = cd.ThreadSettings(1, 1, 1, 1, 1, settings_tab=None)
     thread = cd.PostDetectionThread("https://kemono.cr/fanbox/user/1", {}, settings)
     monkeypatch.setattr(
         cd, "urlparse", lambda *_a, **_k: (_ for _ in ()).throw(ValueError("bad"))
@@ -829,7 +833,7 @@ def test_post_detection_fallback_creator_id_query_split(monkeypatch):
         lambda settings_tab=None: SimpleNamespace(get=lambda *a, **k: Resp()),
     )
 
-    settings = SimpleNamespace(creator_posts_max_attempts=1, settings_tab=None)
+    settings = cd.ThreadSettings(1, 1, 1, 1, 1, settings_tab=None)
     thread = cd.PostDetectionThread("https://kemono.cr/user/1?foo=bar", {}, settings)
     thread.log = SimpleNamespace(emit=lambda *a, **k: None)
     thread.error = SimpleNamespace(emit=lambda *a, **k: None)
@@ -851,7 +855,7 @@ def test_post_detection_returns_when_stopped_inside_alt_url_loop(monkeypatch):
         lambda settings_tab=None: SimpleNamespace(get=lambda *a, **k: Resp()),
     )
 
-    settings = SimpleNamespace(creator_posts_max_attempts=1, settings_tab=None)
+    settings = cd.ThreadSettings(1, 1, 1, 1, 1, settings_tab=None)
     thread = cd.PostDetectionThread("https://kemono.cr/fanbox/user/1", {}, settings)
 
     def log_emit(_msg, level):
@@ -880,7 +884,7 @@ def test_post_detection_final_fallback_thumbnail_path(monkeypatch):
         lambda settings_tab=None: SimpleNamespace(get=lambda *a, **k: Resp()),
     )
 
-    settings = SimpleNamespace(creator_posts_max_attempts=1, settings_tab=None)
+    settings = cd.ThreadSettings(1, 1, 1, 1, 1, settings_tab=None)
     thread = cd.PostDetectionThread("https://kemono.cr/fanbox/user/1", {}, settings)
     out = []
     thread.finished = SimpleNamespace(emit=lambda posts_out: out.append(posts_out))
@@ -895,7 +899,9 @@ def test_post_detection_final_fallback_thumbnail_path(monkeypatch):
 
 
 def test_file_prep_stop_and_run_early_return():
-    t = cd.FilePreparationThread([], {}, {}, True, True, True, SimpleNamespace())
+    t = cd.FilePreparationThread(
+        [], {}, {}, True, True, True, cd.ThreadSettings(1, 1, 1, 1, 1)
+    )
     t.stop()
     t.run()
     assert t.is_running is False
@@ -903,40 +909,34 @@ def test_file_prep_stop_and_run_early_return():
 
 def test_file_prep_worker_returns_when_stopped_before_fetch(monkeypatch):
     checks = {".jpg": SimpleNamespace(isChecked=lambda: True)}
-    all_files_map = {"https://kemono.cr/fanbox/user/1": [("Title", ("1", None))]}
+    all_files_map = {
+        "https://kemono.cr/fanbox/user/1": [("T1", ("1", None)), ("T2", ("2", None))]
+    }
     t = cd.FilePreparationThread(
-        ["1"],
+        ["1", "2"],
         all_files_map,
         checks,
         True,
         True,
         True,
-        SimpleNamespace(post_data_max_retries=1, settings_tab=None),
+        cd.ThreadSettings(1, 1, 1, 1, 1, settings_tab=None),
         max_concurrent=1,
     )
     t.log = SimpleNamespace(emit=lambda *a, **k: None)
     t.progress = SimpleNamespace(emit=lambda *a, **k: None)
     t.finished = SimpleNamespace(emit=lambda *a, **k: None)
-    called = {"fetch": 0}
-    t.fetch_and_detect_files = lambda *_a, **_k: called.__setitem__("fetch", 1)
+    fetched = []
 
-    class ImmediateThread:
-        def __init__(self, target, args=(), daemon=False):
-            self.target = target
-            self.args = args
-
-        def start(self):
-            t.is_running = False
-            self.target(*self.args)
-
-        def is_alive(self):
-            return False
+    def fetch(pid, _curl):
+        fetched.append(pid)
+        t.is_running = False
+        return (pid, [])
 
-    monkeypatch.setattr(cd.threading, "Thread", ImmediateThread)
+    t.fetch_and_detect_files = fetch
 
     t.run()
 
-    assert called["fetch"] == 0
+    assert fetched == ["1"]
 
 
 def test_file_prep_worker_runtimeerror_from_log_emit_is_ignored(monkeypatch):
@@ -949,7 +949,7 @@ def test_file_prep_worker_runtimeerror_from_log_emit_is_ignored(monkeypatch):
         True,
         True,
         True,
-        SimpleNamespace(post_data_max_retries=1, settings_tab=None),
+        cd.ThreadSettings(1, 1, 1, 1, 1, settings_tab=None),
         max_concurrent=1,
     )
     monkeypatch.setattr(
@@ -964,26 +964,16 @@ def test_file_prep_worker_runtimeerror_from_log_emit_is_ignored(monkeypatch):
 
     t.log = SimpleNamespace(emit=log_emit)
     t.progress = SimpleNamespace(emit=lambda *a, **k: None)
-    t.finished = SimpleNamespace(emit=lambda *a, **k: None)
+    finished = []
+    t.finished = SimpleNamespace(emit=lambda *a, **k: finished.append(a))
     t.fetch_and_detect_files = lambda *_a, **_k: ("1", [("f.jpg", "u")])
 
-    class ImmediateThread:
-        def __init__(self, target, args=(), daemon=False):
-            self.target = target
-            self.args = args
-
-        def start(self):
-            self.target(*self.args)
-
-        def is_alive(self):
-            return False
-
-    monkeypatch.setattr(cd.threading, "Thread", ImmediateThread)
-
     t.run()
 
+    assert finished == [(["u"], {"u": "1"})]
+
 
-def test_file_prep_worker_exception_is_ignored(monkeypatch):
+def test_file_prep_worker_exception_is_ignored():
     checks = {".jpg": SimpleNamespace(isChecked=lambda: True)}
     all_files_map = {"https://kemono.cr/fanbox/user/1": [("Title", ("1", None))]}
     t = cd.FilePreparationThread(
@@ -993,31 +983,21 @@ def test_file_prep_worker_exception_is_ignored(monkeypatch):
         True,
         True,
         True,
-        SimpleNamespace(post_data_max_retries=1, settings_tab=None),
+        cd.ThreadSettings(1, 1, 1, 1, 1, settings_tab=None),
         max_concurrent=1,
     )
     t.log = SimpleNamespace(emit=lambda *a, **k: None)
     t.progress = SimpleNamespace(emit=lambda *a, **k: None)
-    t.finished = SimpleNamespace(emit=lambda *a, **k: None)
+    finished = []
+    t.finished = SimpleNamespace(emit=lambda *a, **k: finished.append(a))
     t.fetch_and_detect_files = lambda *_a, **_k: (_ for _ in ()).throw(ValueError("x"))
 
-    class ImmediateThread:
-        def __init__(self, target, args=(), daemon=False):
-            self.target = target
-            self.args = args
-
-        def start(self):
-            self.target(*self.args)
-
-        def is_alive(self):
-            return False
-
-    monkeypatch.setattr(cd.threading, "Thread", ImmediateThread)
-
     t.run()
 
+    assert finished == [([], {})]
 
-def test_file_prep_wait_polling_sleep_path(monkeypatch):
+
+def test_file_prep_waits_for_workers_without_polling(monkeypatch):
     checks = {".jpg": SimpleNamespace(isChecked=lambda: True)}
     all_files_map = {"https://kemono.cr/fanbox/user/1": [("Title", ("1", None))]}
     t = cd.FilePreparationThread(
@@ -1027,32 +1007,21 @@ def test_file_prep_wait_polling_sleep_path(monkeypatch):
         True,
         True,
         True,
-        SimpleNamespace(post_data_max_retries=1, settings_tab=None),
+        cd.ThreadSettings(1, 1, 1, 1, 1, settings_tab=None),
         max_concurrent=1,
     )
     t.log = SimpleNamespace(emit=lambda *a, **k: None)
     t.progress = SimpleNamespace(emit=lambda *a, **k: None)
-    t.finished = SimpleNamespace(emit=lambda *a, **k: None)
-    t.fetch_and_detect_files = lambda *_a, **_k: ("1", [])
-
-    class PollingThread:
-        def __init__(self, target, args=(), daemon=False):
-            self.calls = 0
-
-        def start(self):
-            return None
-
-        def is_alive(self):
-            self.calls += 1
-            return self.calls == 1
-
+    finished = []
+    t.finished = SimpleNamespace(emit=lambda *a, **k: finished.append(a))
+    t.fetch_and_detect_files = lambda *_a, **_k: ("1", [("f.jpg", "u")])
     sleeps = []
-    monkeypatch.setattr(cd.threading, "Thread", PollingThread)
     monkeypatch.setattr(cd.time, "sleep", lambda s: sleeps.append(s))
 
     t.run()
 
-    assert 0.05 in sleeps
+    assert sleeps == []
+    assert finished == [(["u"], {"u": "1"})]
 
 
 def test_file_prep_run_breaks_at_loop_start_when_stopped(monkeypatch):
@@ -1070,35 +1039,26 @@ def test_file_prep_run_breaks_at_loop_start_when_stopped(monkeypatch):
         True,
         True,
         True,
-        SimpleNamespace(post_data_max_retries=1, settings_tab=None),
+        cd.ThreadSettings(1, 1, 1, 1, 1, settings_tab=None),
         max_concurrent=1,
     )
     t.log = SimpleNamespace(emit=lambda *a, **k: None)
     t.progress = SimpleNamespace(emit=lambda *a, **k: None)
     t.finished = SimpleNamespace(emit=lambda *a, **k: None)
-    t.fetch_and_detect_files = lambda *_a, **_k: ("1", [])
+    fetched = []
 
-    class ImmediateThread:
-        calls = 0
-
-        def __init__(self, target, args=(), daemon=False):
-            self.target = target
-            self.args = args
-
-        def start(self):
-            ImmediateThread.calls += 1
-            self.target(*self.args)
-            if ImmediateThread.calls == 1:
-                t.is_running = False
-
-        def is_alive(self):
-            return False
+    def fetch(pid, _curl):
+        fetched.append(pid)
+        if len(fetched) == 1:
+            t.is_running = False
+        return (pid, [])
 
-    monkeypatch.setattr(cd.threading, "Thread", ImmediateThread)
+    t.fetch_and_detect_files = fetch
 
     t.run()
 
     assert t.is_running is False
+    assert fetched == ["1"]
 
 
 def _make_creator_thread(tmp_path, file_url, download_text=False):
@@ -1113,7 +1073,7 @@ def _make_creator_thread(tmp_path, file_url, download_text=False):
         other_files_dir=str(tmp_path / "other"),
         post_titles_map={("fanbox", "1", "p1"): "Title"},
         auto_rename_enabled=False,
-        settings=SimpleNamespace(file_download_max_retries=1, settings_tab=None),
+        settings=cd.ThreadSettings(1, 1, 1, 1, 1, settings_tab=None),
         max_concurrent=1,
         download_text=download_text,
     )
@@ -1159,14 +1119,13 @@ def test_download_file_cancellation_before_connection(monkeypatch, tmp_path):
     file_url = "https://kemono.cr/files/stop.bin"
     thread = _make_creator_thread(tmp_path, file_url, download_text=False)
 
-    class CancelOnEnterLock:
-        def __enter__(self):
+    class CancellingGate:
+        @contextlib.contextmanager
+        def establishing(self, url, should_continue=None):
             thread.is_running = False
+            yield should_continue()
 
-        def __exit__(self, exc_type, exc, tb):
-            return False
-
-    thread._ssl_lock = CancelOnEnterLock()
+    thread.connection_gate = CancellingGate()
     monkeypatch.setattr(
         cd,
         "get_session",
@@ -3,23 +3,6 @@ import os
 from kemonodownloader import creator_downloader as cd
 
 
-class DummySettingsTab:
-    def __init__(self, template=None, strategy=None):
-        self._template = template
-        self._strategy = strategy
-
-    def get_creator_filename_template(self):
-        return self._template
-
-    def get_creator_folder_strategy(self):
-        return self._strategy
-
-
-class DummySettings:
-    def __init__(self, settings_tab):
-        self.settings_tab = settings_tab
-
-
 def test_sanitize_filename_various():
     assert cd.sanitize_filename("") == "unnamed"
     assert cd.sanitize_filename("...hidden") == "hidden"
@@ -42,11 +25,8 @@ def test_get_user_agent_fallback(monkeypatch):
     monkeypatch.setattr(cd, "UserAgent", orig_UserAgent)
 
 
-def test_generate_filename_and_folder(tmp_path):
-    settings_tab = DummySettingsTab(
-        template="{post_id}_{orig_name}", strategy="per_post"
-    )
-    settings = DummySettings(settings_tab)
+def test_generate_filename_and_folder(tmp_path, settings_tab):
+    settings = cd.ThreadSettings(1, 1, 1, 1, 1, settings_tab=settings_tab)
     service = "fanbox"
     creator_id = "123"
     download_folder = str(tmp_path)
@@ -103,11 +83,9 @@ def test_generate_filename_and_folder(tmp_path):
     assert fn1 != fn2
 
 
-def test_generate_folder_strategies(tmp_path):
-    settings_tab = DummySettingsTab(
-        template="{post_id}_{orig_name}", strategy="by_file_type"
-    )
-    settings = DummySettings(settings_tab)
+def test_generate_folder_strategies(tmp_path, settings_tab):
+    settings_tab.settings["creator_folder_strategy"] = "by_file_type"
+    settings = cd.ThreadSettings(1, 1, 1, 1, 1, settings_tab=settings_tab)
     service = "fanbox"
     creator_id = "123"
     download_folder = str(tmp_path)
@@ -145,8 +123,7 @@ def test_generate_folder_strategies(tmp_path):
     )
 
     # single_folder strategy
-    settings_tab2 = DummySettingsTab(template=None, strategy="single_folder")
-    settings2 = DummySettings(settings_tab2)
+    settings_tab.settings["creator_folder_strategy"] = "single_folder"
     thread2 = cd.CreatorDownloadThread(
         service,
         creator_id,
@@ -158,7 +135,7 @@ def test_generate_folder_strategies(tmp_path):
         other_files_dir,
         post_titles_map,
         auto_rename_enabled=False,
-        settings=settings2,
+        settings=settings,
         max_concurrent=1,
     )
     thread2.creator_name = "Creator Name"
@@ -250,10 +227,6 @@ def test_creator_fetch_creator_and_post_info_and_download_text(tmp_path, monkeyp
         def get_creator_folder_strategy(self):
             return "per_post"
 
-    class DummySettings:
-        def __init__(self):
-            self.settings_tab = None
-
     service = "fanbox"
     creator_id = "123"
     download_folder = str(tmp_path / "dl")
@@ -275,7 +248,7 @@ def test_creator_fetch_creator_and_post_info_and_download_text(tmp_path, monkeyp
         other_files_dir,
         post_titles_map,
         auto_rename_enabled=False,
-        settings=DummySettings(),
+        settings=cd.ThreadSettings(1, 1, 1, 1, 1),
         max_concurrent=1,
     )
 
@@ -337,10 +310,6 @@ def test_creator_download_thread_uses_hash_db_entry(tmp_path):
     file_hash = _hash.md5(file_content).hexdigest()
     file_url = "https://kemono.cr/files/orig_creator.jpg"
 
-    class DummySettings:
-        file_download_max_retries = 1
-        settings_tab = None
-
     thread = cd.CreatorDownloadThread(
         service="fanbox",
         creator_id="123",
@@ -352,7 +321,7 @@ def test_creator_download_thread_uses_hash_db_entry(tmp_path):
         other_files_dir=str(tmp_path / "other"),
         post_titles_map={},
         auto_rename_enabled=False,
-        settings=DummySettings(),
+        settings=cd.ThreadSettings(1, 1, 1, 1, 1),
         max_concurrent=1,
     )
 
@@ -384,11 +353,6 @@ def test_creator_download_thread_uses_hash_db_entry(tmp_path):
 
 
 def test_creator_run_no_files_emits_finished(tmp_path):
-    class DummySettings:
-        file_download_max_retries = 1
-        post_data_max_retries = 1
-        settings_tab = None
-
     thread = cd.CreatorDownloadThread(
         service="fanbox",
         creator_id="123",
@@ -400,7 +364,7 @@ def test_creator_run_no_files_emits_finished(tmp_path):
         other_files_dir=str(tmp_path / "other"),
         post_titles_map={},
         auto_rename_enabled=False,
-        settings=DummySettings(),
+        settings=cd.ThreadSettings(1, 1, 1, 1, 1),
         max_concurrent=1,
     )
 
@@ -436,7 +400,7 @@ def test_detect_files_main_attachments_content(tmp_path):
         ".jpg": FakeCheckbox(True),
         ".gif": FakeCheckbox(True),
     }
-    settings = DummySettings(None)
+    settings = cd.ThreadSettings(1, 1, 1, 1, 1, settings_tab=None)
     fthread = cd.FilePreparationThread(
         post_ids=[],
         all_files_map={},
@@ -491,10 +455,6 @@ def test_download_file_size_mismatch_deletes_incomplete_and_marks_failed(
 ):
 
     # Settings with a single retry (1 attempt)
-    class DummySettings:
-        file_download_max_retries = 1
-        settings_tab = None
-
     file_url = "https://kemono.cr/files/partial.jpg"
     service = "fanbox"
     creator_id = "123"
@@ -517,7 +477,7 @@ def test_download_file_size_mismatch_deletes_incomplete_and_marks_failed(
         other_files_dir=other_files_dir,
         post_titles_map=post_titles_map,
         auto_rename_enabled=False,
-        settings=DummySettings(),
+        settings=cd.ThreadSettings(1, 1, 1, 1, 1),
         max_concurrent=1,
     )
     thread.creator_name = "Creator Name"
@@ -570,10 +530,6 @@ def test_download_file_retries_and_succeeds(monkeypatch, tmp_path):
 
     import requests as _req
 
-    class DummySettings:
-        file_download_max_retries = 2
-        settings_tab = None
-
     file_url = "https://kemono.cr/files/retry.jpg"
     service = "fanbox"
     creator_id = "123"
@@ -596,7 +552,7 @@ def test_download_file_retries_and_succeeds(monkeypatch, tmp_path):
         other_files_dir=other_files_dir,
         post_titles_map=post_titles_map,
         auto_rename_enabled=False,
-        settings=DummySettings(),
+        settings=cd.ThreadSettings(1, 1, 2, 1, 1),
         max_concurrent=1,
     )
     thread.creator_name = "Creator Name"
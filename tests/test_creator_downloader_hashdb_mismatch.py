@@ -1,7 +1,6 @@
 import asyncio
 import hashlib
 import os
-from types import SimpleNamespace
 
 import requests
 
@@ -13,12 +12,7 @@ class FakeSessionAlwaysError:
         raise requests.RequestException("network failure")
 
 
-def make_settings(tmp_path):
-    settings_tab = SimpleNamespace(
-        get_creator_filename_template=lambda: None,
-        get_creator_folder_strategy=lambda: "per_post",
-        get_proxy_settings=lambda: None,
-    )
+def make_settings(settings_tab, tmp_path):
     return ThreadSettings(
         creator_posts_max_attempts=1,
         post_data_max_retries=1,
@@ -29,7 +23,7 @@ def make_settings(tmp_path):
     )
 
 
-def test_hash_db_size_mismatch_triggers_redownload(monkeypatch, tmp_path):
+def test_hash_db_size_mismatch_triggers_redownload(monkeypatch, tmp_path, settings_tab):
     download_folder = str(tmp_path / "downloads_h")
     other_files_dir = str(tmp_path / "other_h")
     os.makedirs(download_folder, exist_ok=True)
@@ -39,7 +33,7 @@ def test_hash_db_size_mismatch_triggers_redownload(monkeypatch, tmp_path):
     files_to_download = [file_url]
     files_to_posts_map = {file_url: "9"}
 
-    settings = make_settings(tmp_path)
+    settings = make_settings(settings_tab, tmp_path)
 
     thread = CreatorDownloadThread(
         service="svc",
@@ -9,19 +9,7 @@ from kemonodownloader.creator_downloader import (
 )
 
 
-class FakeSettingsTab:
-    def __init__(self, template=None, strategy="per_post"):
-        self._template = template
-        self._strategy = strategy
-
-    def get_creator_filename_template(self):
-        return self._template
-
-    def get_creator_folder_strategy(self):
-        return self._strategy
-
-
-def test_sanitize_filename_basic():
+def test_sanitize_filename_basic(settings_tab):
     assert sanitize_filename("") == "unnamed"
     assert sanitize_filename(None) == "unnamed"
     s = ' bad<>:"/\\|?* name... '
@@ -31,11 +19,16 @@ def test_sanitize_filename_basic():
     assert not out.startswith(".")
 
 
-def _make_thread(tmp_path, template=None, strategy="per_post", auto_rename=False):
+def _make_thread(
+    tmp_path, settings_tab, template=None, strategy="per_post", auto_rename=False
+):
     files = ["https://kemono.cr/files/abc.png"]
     files_map = {files[0]: "1"}
     post_titles = {("kemono", "123", "1"): "PostTitle"}
-    settings = SimpleNamespace(settings_tab=FakeSettingsTab(template, strategy))
+    if template is not None:
+        settings_tab.settings["creator_filename_template"] = template
+    settings_tab.settings["creator_folder_strategy"] = strategy
+    settings = cd.ThreadSettings(1, 1, 1, 1, 1, settings_tab=settings_tab)
     t = CreatorDownloadThread(
         "kemono",
         "123",
@@ -53,8 +46,8 @@ def _make_thread(tmp_path, template=None, strategy="per_post", auto_rename=False
     return t
 
 
-def test_generate_filename_default(tmp_path):
-    t = _make_thread(tmp_path)
+def test_generate_filename_default(tmp_path, settings_tab):
+    t = _make_thread(tmp_path, settings_tab)
     target_folder, final_filename = t.generate_filename_and_folder(
         t.files_to_download[0], str(tmp_path), 0, 1, "1", "PostTitle"
     )
@@ -62,8 +55,8 @@ def test_generate_filename_default(tmp_path):
     assert "1_" in final_filename or "PostTitle" in target_folder
 
 
-def test_generate_filename_auto_rename(tmp_path):
-    t = _make_thread(tmp_path, auto_rename=True)
+def test_generate_filename_auto_rename(tmp_path, settings_tab):
+    t = _make_thread(tmp_path, settings_tab, auto_rename=True)
     t.auto_rename_enabled = True
     f1 = t.generate_filename_and_folder(
         t.files_to_download[0], str(tmp_path), 0, 2, "1", "PostTitle"
@@ -75,36 +68,35 @@ def test_generate_filename_auto_rename(tmp_path):
     assert f1.startswith("1_") and f2.startswith("2_")
 
 
-def test_generate_filename_custom_template(tmp_path):
+def test_generate_filename_custom_template(tmp_path, settings_tab):
     template = "{creator_id}_{post_id}_{orig_name}_{file_index}_{total_files}"
-    t = _make_thread(tmp_path, template=template)
+    t = _make_thread(tmp_path, settings_tab, template=template)
     folder, fname = t.generate_filename_and_folder(
         t.files_to_download[0], str(tmp_path), 0, 3, "1", "PostTitle"
     )
     assert "123_1" in fname
 
 
-def test_generate_filename_malformed_template_fallback(tmp_path):
-    t = _make_thread(tmp_path, template="{nonexistent_key}")
+def test_generate_filename_malformed_template_fallback(tmp_path, settings_tab):
+    t = _make_thread(tmp_path, settings_tab, template="{nonexistent_key}")
     folder, fname = t.generate_filename_and_folder(
         t.files_to_download[0], str(tmp_path), 0, 1, "1", "PostTitle"
     )
     assert fname.startswith("1_")  # fallback to safe default
 
 
-def test_get_desc_folder_for_post(tmp_path):
-    t = _make_thread(tmp_path)
-    t.settings = SimpleNamespace(settings_tab=FakeSettingsTab(None, "single_folder"))
+def test_get_desc_folder_for_post(tmp_path, settings_tab):
+    t = _make_thread(tmp_path, settings_tab, strategy="single_folder")
     desc = t.get_desc_folder_for_post(str(tmp_path), "1", "PostTitle")
     assert desc == os.path.normpath(str(tmp_path))
-    t.settings.settings_tab = FakeSettingsTab(None, "by_file_type")
+    settings_tab.settings["creator_folder_strategy"] = "by_file_type"
     desc2 = t.get_desc_folder_for_post(str(tmp_path), "1", "PostTitle")
     assert os.path.basename(desc2) in ("txt", "txt")
 
 
 def test_detect_files_main_and_attachments_and_content():
     # Setup a FilePreparationThread and a sample post with main/attachments/content
-    settings = SimpleNamespace(settings_tab=None)
+    settings = cd.ThreadSettings(1, 1, 1, 1, 1, settings_tab=None)
 
     class C:
         def __init__(self, checked=True):
@@ -130,9 +122,9 @@ def test_detect_files_main_and_attachments_and_content():
     assert any(n.endswith(".zip") or n.endswith(".png") for n in names)
 
 
-def test_generate_filename_strategies_and_creator_folder(tmp_path):
+def test_generate_filename_strategies_and_creator_folder(tmp_path, settings_tab):
     # single_folder strategy
-    t = _make_thread(tmp_path, template=None, strategy="single_folder")
+    t = _make_thread(tmp_path, settings_tab, template=None, strategy="single_folder")
     t.creator_name = "CreatorName"
     target, fname = t.generate_filename_and_folder(
         t.files_to_download[0], str(tmp_path), 0, 1, "1", "PostTitle"
@@ -144,7 +136,7 @@ def test_generate_filename_strategies_and_creator_folder(tmp_path):
     )
 
     # by_file_type strategy
-    t2 = _make_thread(tmp_path, template=None, strategy="by_file_type")
+    t2 = _make_thread(tmp_path, settings_tab, template=None, strategy="by_file_type")
     t2.creator_name = "CreatorName"
     target2, fname2 = t2.generate_filename_and_folder(
         t2.files_to_download[0], str(tmp_path), 0, 1, "1", "PostTitle"
@@ -154,7 +146,7 @@ def test_generate_filename_strategies_and_creator_folder(tmp_path):
     # folder already contains creator folder
     creator_folder = str(tmp_path / f"{t.creator_id}_{t.creator_name}")
     os.makedirs(creator_folder, exist_ok=True)
-    t3 = _make_thread(tmp_path)
+    t3 = _make_thread(tmp_path, settings_tab)
     t3.creator_name = "CreatorName"
     target3, fname3 = t3.generate_filename_and_folder(
         t3.files_to_download[0], creator_folder, 0, 1, "1", "PostTitle"
@@ -179,9 +171,7 @@ def test_fetch_creator_and_post_info_success(monkeypatch, tmp_path):
 
     monkeypatch.setattr(cd, "get_session", lambda settings_tab: FakeSession())
 
-    settings = SimpleNamespace(
-        settings_tab=None, file_download_max_retries=1, post_data_max_retries=1
-    )
+    settings = cd.ThreadSettings(1, 1, 1, 1, 1, settings_tab=None)
     file_url = "https://kemono.cr/files/abc.png"
     t = cd.CreatorDownloadThread(
         "service",
@@ -49,7 +49,7 @@ def test_validation_thread_success_and_fail(monkeypatch):
             get=lambda url, headers=None, timeout=None: FakeResp()
         ),
     )
-    settings = SimpleNamespace(settings_tab=None, api_request_max_retries=1)
+    settings = cd.ThreadSettings(1, 1, 1, 1, 1, settings_tab=None)
     vt = cd.ValidationThread("https://kemono.cr/user/1", settings)
     res = {}
     vt.result = SimpleNamespace(emit=lambda v: res.setdefault("ok", v))
@@ -103,49 +103,25 @@ def test_preview_thread_error(monkeypatch):
 
 
 def test_creator_download_thread_run_no_files(monkeypatch, tmp_path):
-    # Create a minimal dummy instance to call run() and exercise the no-files branch
-    dummy = SimpleNamespace()
-    dummy.service = "fanbox"
-    dummy.creator_id = "42"
-    dummy.download_folder = str(tmp_path)
-    dummy.selected_posts = []
-    dummy.files_to_download = []
-    dummy.files_to_posts_map = {}
-    dummy.console = None
-    dummy.other_files_dir = str(tmp_path)
-    dummy.post_titles_map = {}
-    dummy.auto_rename_enabled = False
-    dummy.settings = SimpleNamespace(settings_tab=None, file_download_max_retries=1)
-    dummy.max_concurrent = 2
-    dummy.is_running = True
-    dummy.hash_db = SimpleNamespace()
-    dummy.post_file_counters_lock = SimpleNamespace(
-        __enter__=lambda s: None, __exit__=lambda s, a, b, c: None
-    )
-    dummy.post_file_counters = {}
-    dummy.failed_files = {}
-    dummy.failed_files_lock = SimpleNamespace(
-        __enter__=lambda s: None, __exit__=lambda s, a, b, c: None
-    )
-    dummy.completed_files = set()
-    dummy.completed_files_lock = SimpleNamespace(
-        __enter__=lambda s: None, __exit__=lambda s, a, b, c: None
-    )
-    dummy.fetched_texts_lock = SimpleNamespace(
-        __enter__=lambda s: None, __exit__=lambda s, a, b, c: None
-    )
-    dummy.fetched_texts = set()
-    dummy._ssl_lock = SimpleNamespace(
-        __enter__=lambda s: None, __exit__=lambda s, a, b, c: None
+    # Run a real thread with nothing selected to exercise the no-files branch
+    thread = cd.CreatorDownloadThread(
+        service="fanbox",
+        creator_id="42",
+        download_folder=str(tmp_path),
+        selected_posts=[],
+        files_to_download=[],
+        files_to_posts_map={},
+        console=None,
+        other_files_dir=str(tmp_path),
+        post_titles_map={},
+        auto_rename_enabled=False,
+        settings=cd.ThreadSettings(1, 1, 1, 1, 1, settings_tab=None),
+        max_concurrent=2,
     )
-    dummy._destroyed = False
-    # no-op methods used in run
-    dummy.fetch_creator_and_post_info = lambda: None
-    dummy._safe_emit = lambda sig, *a: None
-    dummy.check_post_completion = lambda url: None
+    monkeypatch.setattr(thread, "fetch_creator_and_post_info", lambda: None)
 
     # Call run - should take the no-files branch and not raise
-    cd.CreatorDownloadThread.run(dummy)
+    thread.run()
 
 
 class DummySignal:
@@ -159,11 +135,9 @@ class DummySignal:
 
 
 def test_validation_thread_invalid_url():
-    class DummySettings:
-        api_request_max_retries = 1
-        settings_tab = None
-
-    t = cd.ValidationThread("https://kemono.cr/bad/link", DummySettings())
+    t = cd.ValidationThread(
+        "https://kemono.cr/bad/link", cd.ThreadSettings(1, 1, 1, 1, 1)
+    )
     t.log = DummySignal()
     t.result = DummySignal()
     t.run()
@@ -172,10 +146,6 @@ def test_validation_thread_invalid_url():
 
 
 def test_validation_thread_success(monkeypatch):
-    class DummySettings:
-        api_request_max_retries = 1
-        settings_tab = None
-
     class FakeResp:
         status_code = 200
 
@@ -188,7 +158,9 @@ def test_validation_thread_success(monkeypatch):
 
     monkeypatch.setattr(cd, "get_session", lambda settings_tab=None: FakeSession())
 
-    t = cd.ValidationThread("https://kemono.cr/user/abc", DummySettings())
+    t = cd.ValidationThread(
+        "https://kemono.cr/user/abc", cd.ThreadSettings(1, 1, 1, 1, 1)
+    )
     t.log = DummySignal()
     t.result = DummySignal()
     t.run()
@@ -196,18 +168,8 @@ def test_validation_thread_success(monkeypatch):
     assert t.result.last_args == (True,)
 
 
-def test_get_desc_folder_for_post_strategies(tmp_path):
-    class DummySettingsTab:
-        def __init__(self, strat):
-            self._s = strat
-
-        def get_creator_folder_strategy(self):
-            return self._s
-
-    class DummySettings:
-        def __init__(self, st):
-            self.settings_tab = st
-
+def test_get_desc_folder_for_post_strategies(tmp_path, settings_tab):
+    settings = cd.ThreadSettings(1, 1, 1, 1, 1, settings_tab=settings_tab)
     service = "fanbox"
     creator_id = "123"
     download_folder = str(tmp_path / "dl")
@@ -219,7 +181,7 @@ def test_get_desc_folder_for_post_strategies(tmp_path):
     post_titles_map = {}
 
     # by_file_type -> should return 'txt' subfolder
-    s_tab = DummySettingsTab("by_file_type")
+    settings_tab.settings["creator_folder_strategy"] = "by_file_type"
     thread = cd.CreatorDownloadThread(
         service,
         creator_id,
@@ -231,7 +193,7 @@ def test_get_desc_folder_for_post_strategies(tmp_path):
         other_files_dir,
         post_titles_map,
         auto_rename_enabled=False,
-        settings=DummySettings(s_tab),
+        settings=settings,
         max_concurrent=1,
     )
     creator_folder = os.path.normpath(str(tmp_path / "creator"))
@@ -239,7 +201,7 @@ def test_get_desc_folder_for_post_strategies(tmp_path):
     assert res.endswith(os.path.join("creator", "txt")) or res.endswith("txt")
 
     # single_folder -> return creator_folder
-    s_tab2 = DummySettingsTab("single_folder")
+    settings_tab.settings["creator_folder_strategy"] = "single_folder"
     thread2 = cd.CreatorDownloadThread(
         service,
         creator_id,
@@ -251,7 +213,7 @@ def test_get_desc_folder_for_post_strategies(tmp_path):
         other_files_dir,
         post_titles_map,
         auto_rename_enabled=False,
-        settings=DummySettings(s_tab2),
+        settings=settings,
         max_concurrent=1,
     )
     res2 = thread2.get_desc_folder_for_post(creator_folder, "1", "Title")
@@ -259,10 +221,6 @@ def test_get_desc_folder_for_post_strategies(tmp_path):
 
 
 def test_check_post_completion_emits_post_completed():
-    class DummySettings:
-        file_download_max_retries = 1
-        settings_tab = None
-
     file_url = "file://one"
     thread = cd.CreatorDownloadThread(
         service="fanbox",
@@ -275,7 +233,7 @@ def test_check_post_completion_emits_post_completed():
         other_files_dir=str(os.getcwd()),
         post_titles_map={},
         auto_rename_enabled=False,
-        settings=DummySettings(),
+        settings=cd.ThreadSettings(1, 1, 1, 1, 1),
         max_concurrent=1,
     )
     thread.post_files_map = {"1": [file_url]}
@@ -288,10 +246,6 @@ def test_check_post_completion_emits_post_completed():
 
 
 def test_download_post_text_if_needed_calls_once(tmp_path):
-    class DummySettings:
-        file_download_max_retries = 1
-        settings_tab = None
-
     thread = cd.CreatorDownloadThread(
         service="fanbox",
         creator_id="123",
@@ -303,7 +257,7 @@ def test_download_post_text_if_needed_calls_once(tmp_path):
         other_files_dir=str(tmp_path / "other"),
         post_titles_map={},
         auto_rename_enabled=False,
-        settings=DummySettings(),
+        settings=cd.ThreadSettings(1, 1, 1, 1, 1),
         max_concurrent=1,
     )
 
@@ -389,7 +343,7 @@ def test_preview_thread_uses_cache(tmp_path):
 
 
 def test_validation_thread_detects_invalid_url():
-    settings = SimpleNamespace(settings_tab=None)
+    settings = cd.ThreadSettings(1, 1, 1, 1, 1, settings_tab=None)
     vt = cd.ValidationThread("https://kemono.cr/bad", settings)
     captured = {}
 
@@ -465,7 +419,7 @@ def test_fetch_and_detect_files_handles_rate_limit(monkeypatch):
             return Fake429()
 
     # Use small max attempts to keep test fast
-    settings = SimpleNamespace(post_data_max_retries=2, settings_tab=None)
+    settings = cd.ThreadSettings(1, 2, 1, 1, 1, settings_tab=None)
     t = cd.FilePreparationThread(
         [], {}, {}, True, True, True, settings, max_concurrent=1
     )
@@ -482,7 +436,7 @@ def test_download_file_short_circuit_with_hash(tmp_path):
     service = "kemono"
     creator_id = "8"
     other_dir = str(tmp_path / "hdb")
-    settings = SimpleNamespace(settings_tab=None)
+    settings = cd.ThreadSettings(1, 1, 1, 1, 1, settings_tab=None)
 
     file_url = "https://kemono.cr/media/file.bin"
     thread = cd.CreatorDownloadThread(
@@ -519,7 +473,7 @@ def make_gzipped_json(obj):
 
 
 def test_post_detection_thread_handles_gzipped_posts(qapp, monkeypatch):
-    settings = SimpleNamespace(creator_posts_max_attempts=1, settings_tab=None)
+    settings = cd.ThreadSettings(1, 1, 1, 1, 1, settings_tab=None)
     post_titles_map = {}
     url = "https://kemono.cr/fanbox/user/123"
 
@@ -545,7 +499,7 @@ def test_post_detection_thread_handles_gzipped_posts(qapp, monkeypatch):
 
 
 def test_post_detection_thread_handles_posts_key_and_data_key(qapp, monkeypatch):
-    settings = SimpleNamespace(creator_posts_max_attempts=1, settings_tab=None)
+    settings = cd.ThreadSettings(1, 1, 1, 1, 1, settings_tab=None)
     post_titles_map = {}
     url = "https://kemono.cr/fanbox/user/123"
 
@@ -590,7 +544,7 @@ def test_file_preparation_detect_files_various_cases():
         creator_main_check=True,
         creator_attachments_check=True,
         creator_content_check=True,
-        settings=SimpleNamespace(post_data_max_retries=1),
+        settings=cd.ThreadSettings(1, 1, 1, 1, 1),
     )
 
     domain_config = {"base_url": "https://kemono.cr"}
@@ -612,7 +566,7 @@ def test_file_preparation_detect_files_various_cases():
 def test_fetch_and_detect_files_success(monkeypatch, tmp_path):
     # Prepare a FilePreparationThread with checkbox-like objects
     checks = {".jpg": SimpleNamespace(isChecked=lambda: True)}
-    settings = SimpleNamespace(post_data_max_retries=1, settings_tab=None)
+    settings = cd.ThreadSettings(1, 1, 1, 1, 1, settings_tab=None)
     t = cd.FilePreparationThread(
         post_ids=[],
         all_files_map={},
@@ -658,7 +612,7 @@ def test_download_text_sync_writes_file(monkeypatch, tmp_path):
     )
 
     class DummyHashDB:
-        def __init__(self, other_files_dir):
+        def __init__(self, other_files_dir, base_dir=None):
             pass
 
         def lookup(self, *a, **k):
@@ -680,7 +634,7 @@ def test_download_text_sync_writes_file(monkeypatch, tmp_path):
         other_files_dir=str(tmp_path / "other"),
         post_titles_map={},
         auto_rename_enabled=False,
-        settings=SimpleNamespace(settings_tab=None),
+        settings=cd.ThreadSettings(1, 1, 1, 1, 1, settings_tab=None),
         max_concurrent=1,
         download_text=False,
     )
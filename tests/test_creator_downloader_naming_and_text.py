@@ -4,21 +4,16 @@ from types import SimpleNamespace
 from kemonodownloader import creator_downloader as cd
 
 
-def make_thread(tmp_path, template=None, strategy=None, auto_rename=True):
+def make_thread(tmp_path, settings_tab, template=None, strategy=None, auto_rename=True):
     download_folder = str(tmp_path / "dl")
     other_files = str(tmp_path / "other")
     os.makedirs(download_folder, exist_ok=True)
     os.makedirs(other_files, exist_ok=True)
 
-    settings_tab = SimpleNamespace()
-    settings_tab.get_creator_filename_template = lambda: template
-    settings_tab.get_creator_folder_strategy = lambda: strategy
-    # Provide other settings used by ThreadSettings if accessed
-    settings_tab.get_creator_posts_max_attempts = lambda: 1
-    settings_tab.get_post_data_max_retries = lambda: 1
-    settings_tab.get_file_download_max_retries = lambda: 1
-    settings_tab.get_api_request_max_retries = lambda: 1
-    settings_tab.get_simultaneous_downloads = lambda: 1
+    if template is not None:
+        settings_tab.settings["creator_filename_template"] = template
+    if strategy is not None:
+        settings_tab.settings["creator_folder_strategy"] = strategy
 
     # Create a ThreadSettings object expected by CreatorDownloadThread
     settings = cd.ThreadSettings(
@@ -55,8 +50,10 @@ def make_thread(tmp_path, template=None, strategy=None, auto_rename=True):
     return thread
 
 
-def test_generate_filename_and_folder_default(tmp_path):
-    thread = make_thread(tmp_path, template=None, strategy=None, auto_rename=True)
+def test_generate_filename_and_folder_default(tmp_path, settings_tab):
+    thread = make_thread(
+        tmp_path, settings_tab, template=None, strategy=None, auto_rename=True
+    )
 
     # First file: should apply auto-rename prefix 1_
     target_folder, filename = thread.generate_filename_and_folder(
@@ -75,29 +72,29 @@ def test_generate_filename_and_folder_default(tmp_path):
     assert filename2.startswith("2_")
 
 
-def test_get_desc_folder_for_post_strategies(tmp_path):
+def test_get_desc_folder_for_post_strategies(tmp_path, settings_tab):
     # per_post
-    thread = make_thread(tmp_path, strategy="per_post")
+    thread = make_thread(tmp_path, settings_tab, strategy="per_post")
     # get_desc_folder_for_post expects the creator_folder (download root + creator folder)
     creator_folder = os.path.join(str(tmp_path / "dl"), "1_1")
     desc = thread.get_desc_folder_for_post(creator_folder, "p1", "T1")
     assert desc.endswith(os.path.join("1_1", "p1_T1"))
 
     # single_folder
-    thread = make_thread(tmp_path, strategy="single_folder")
+    thread = make_thread(tmp_path, settings_tab, strategy="single_folder")
     creator_folder = os.path.join(str(tmp_path / "dl"), "1_1")
     desc = thread.get_desc_folder_for_post(creator_folder, "p1", "T1")
     assert os.path.normpath(desc) == os.path.normpath(creator_folder)
 
     # by_file_type
-    thread = make_thread(tmp_path, strategy="by_file_type")
+    thread = make_thread(tmp_path, settings_tab, strategy="by_file_type")
     creator_folder = os.path.join(str(tmp_path / "dl"), "1_1")
     desc = thread.get_desc_folder_for_post(creator_folder, "p1", "T1")
     assert desc.endswith(os.path.join("1_1", "txt"))
 
 
-def test__download_text_sync_writes_file(monkeypatch, tmp_path):
-    thread = make_thread(tmp_path)
+def test__download_text_sync_writes_file(monkeypatch, tmp_path, settings_tab):
+    thread = make_thread(tmp_path, settings_tab)
 
     class FakeResp:
         status_code = 200
@@ -174,8 +171,8 @@ def test_post_detection_thread_successful_parsing(monkeypatch):
     assert posts_emitted or finished
 
 
-def test_download_file_short_circuits_when_hash_matches(tmp_path):
-    thread = make_thread(tmp_path)
+def test_download_file_short_circuits_when_hash_matches(tmp_path, settings_tab):
+    thread = make_thread(tmp_path, settings_tab)
 
     file_url = thread.files_to_download[0]
     # Create an existing file and register it in the hash DB
@@ -200,8 +197,8 @@ def test_download_file_short_circuits_when_hash_matches(tmp_path):
     assert file_url in thread.completed_files
 
 
-def test_download_file_makedirs_failure(monkeypatch, tmp_path):
-    thread = make_thread(tmp_path)
+def test_download_file_makedirs_failure(monkeypatch, tmp_path, settings_tab):
+    thread = make_thread(tmp_path, settings_tab)
     file_url = thread.files_to_download[0]
 
     # Make os.makedirs raise OSError to simulate filesystem permission error
@@ -223,8 +220,10 @@ def test_download_file_makedirs_failure(monkeypatch, tmp_path):
     assert captured and captured[-1][2] is False
 
 
-def test_download_file_size_mismatch_triggers_failure(monkeypatch, tmp_path):
-    thread = make_thread(tmp_path)
+def test_download_file_size_mismatch_triggers_failure(
+    monkeypatch, tmp_path, settings_tab
+):
+    thread = make_thread(tmp_path, settings_tab)
     file_url = thread.files_to_download[0]
 
     class FakeResp:
@@ -256,8 +255,8 @@ def test_download_file_size_mismatch_triggers_failure(monkeypatch, tmp_path):
     assert file_url in thread.failed_files
 
 
-def test_download_file_request_exception_retries(monkeypatch, tmp_path):
-    thread = make_thread(tmp_path)
+def test_download_file_request_exception_retries(monkeypatch, tmp_path, settings_tab):
+    thread = make_thread(tmp_path, settings_tab)
     file_url = thread.files_to_download[0]
 
     import requests
@@ -306,9 +305,13 @@ def test_cancellation_thread_signals_stop_and_finishes():
     assert finished
 
 
-def test_generate_filename_template_fallback(tmp_path):
+def test_generate_filename_template_fallback(tmp_path, settings_tab):
     thread = make_thread(
-        tmp_path, template="{post_id:{bad}}", strategy=None, auto_rename=False
+        tmp_path,
+        settings_tab,
+        template="{post_id:{bad}}",
+        strategy=None,
+        auto_rename=False,
     )
     logs = []
     thread.log = SimpleNamespace(emit=lambda msg, level: logs.append((msg, level)))
@@ -319,8 +322,10 @@ def test_generate_filename_template_fallback(tmp_path):
     assert logs, "Expected a log warning when template formatting fails"
 
 
-def test_fetch_creator_and_post_info_success(monkeypatch, tmp_path):
-    thread = make_thread(tmp_path, template=None, strategy=None, auto_rename=False)
+def test_fetch_creator_and_post_info_success(monkeypatch, tmp_path, settings_tab):
+    thread = make_thread(
+        tmp_path, settings_tab, template=None, strategy=None, auto_rename=False
+    )
     # Ensure per-post titles are fetched by clearing map and using selected_posts
     thread.post_titles_map = {}
     thread.selected_posts = ["p1"]
@@ -348,8 +353,8 @@ def test_fetch_creator_and_post_info_success(monkeypatch, tmp_path):
     assert thread.post_titles_map.get(key) == cd.sanitize_filename("Fetched Title")
 
 
-def test_download_worker_processes_queue(monkeypatch, tmp_path):
-    thread = make_thread(tmp_path)
+def test_download_worker_processes_queue(monkeypatch, tmp_path, settings_tab):
+    thread = make_thread(tmp_path, settings_tab)
     processed = []
 
     async def fake_download(file_url, folder, file_index, total_files):
@@ -373,8 +378,8 @@ def test_download_worker_processes_queue(monkeypatch, tmp_path):
     assert processed and processed[0] == thread.files_to_download[0]
 
 
-def test_check_post_completion_emits_post_completed(tmp_path):
-    thread = make_thread(tmp_path)
+def test_check_post_completion_emits_post_completed(tmp_path, settings_tab):
+    thread = make_thread(tmp_path, settings_tab)
     file1, file2 = thread.files_to_download[0], thread.files_to_download[1]
     thread.post_files_map = {"p1": [file1, file2]}
     thread.completed_files = set([file1])
@@ -387,8 +392,10 @@ def test_check_post_completion_emits_post_completed(tmp_path):
     assert collected == ["p1"]
 
 
-def test_creator_download_thread_run_processes_all_files(monkeypatch, tmp_path):
-    thread = make_thread(tmp_path)
+def test_creator_download_thread_run_processes_all_files(
+    monkeypatch, tmp_path, settings_tab
+):
+    thread = make_thread(tmp_path, settings_tab)
     # Replace signal-like attributes to avoid Qt interactions
     thread.log = SimpleNamespace(emit=lambda *a, **k: None)
     thread.file_progress = SimpleNamespace(emit=lambda *a, **k: None)
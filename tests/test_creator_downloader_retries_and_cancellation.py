@@ -1,6 +1,5 @@
 import asyncio
 import os
-from types import SimpleNamespace
 
 from kemonodownloader.creator_downloader import CreatorDownloadThread, ThreadSettings
 
@@ -68,12 +67,7 @@ class FakeSessionCancel:
         return FakeResponseCancel(self._chunks, self._thread_ref)
 
 
-def make_settings():
-    settings_tab = SimpleNamespace(
-        get_creator_filename_template=lambda: None,
-        get_creator_folder_strategy=lambda: "per_post",
-        get_proxy_settings=lambda: None,
-    )
+def make_settings(settings_tab):
     return ThreadSettings(
         creator_posts_max_attempts=1,
         post_data_max_retries=1,
@@ -84,7 +78,9 @@ def make_settings():
     )
 
 
-def test_size_mismatch_deletes_incomplete_and_records_failure(monkeypatch, tmp_path):
+def test_size_mismatch_keeps_part_and_records_failure(
+    monkeypatch, tmp_path, settings_tab
+):
     download_folder = str(tmp_path / "d_mismatch")
     other_files_dir = str(tmp_path / "other_mismatch")
     os.makedirs(download_folder, exist_ok=True)
@@ -103,7 +99,7 @@ def test_size_mismatch_deletes_incomplete_and_records_failure(monkeypatch, tmp_p
         lambda settings_tab=None: FakeSessionMismatch(chunks, header_size),
     )
 
-    settings = make_settings()
+    settings = make_settings(settings_tab)
     thread = CreatorDownloadThread(
         service="svc",
         creator_id="creator123",
@@ -126,16 +122,19 @@ def test_size_mismatch_deletes_incomplete_and_records_failure(monkeypatch, tmp_p
     msg = thread.failed_files[file_url]
     assert "Size mismatch" in msg or "size mismatch" in msg.lower()
 
-    # Ensure no file artifacts remain under download_folder
+    # Only the resumable .part file remains; the final file is never created
     found_files = []
     for root, dirs, files in os.walk(download_folder):
         for f in files:
             found_files.append(os.path.join(root, f))
-    assert len(found_files) == 0
+    assert len(found_files) == 1
+    assert found_files[0].endswith(".part")
+    with open(found_files[0], "rb") as fh:
+        assert fh.read() == b"abc"
 
 
-def test_cancellation_during_streaming_deletes_incomplete_and_records_failure(
-    monkeypatch, tmp_path
+def test_cancellation_during_streaming_keeps_part_and_records_failure(
+    monkeypatch, tmp_path, settings_tab
 ):
     download_folder = str(tmp_path / "d_cancel")
     other_files_dir = str(tmp_path / "other_cancel")
@@ -148,7 +147,7 @@ def test_cancellation_during_streaming_deletes_incomplete_and_records_failure(
 
     chunks = [b"first", b"second"]
 
-    settings = make_settings()
+    settings = make_settings(settings_tab)
     thread = CreatorDownloadThread(
         service="svc",
         creator_id="creator123",
@@ -177,9 +176,59 @@ def test_cancellation_during_streaming_deletes_incomplete_and_records_failure(
     assert file_url not in thread.completed_files
     assert file_url in thread.failed_files
 
-    # Ensure no file artifacts remain under download_folder
+    # Only the .part file is left behind so a restart can resume it
     found_files = []
     for root, dirs, files in os.walk(download_folder):
         for f in files:
             found_files.append(os.path.join(root, f))
-    assert len(found_files) == 0
+    assert all(f.endswith(".part") for f in found_files)
+
+    # A cancel is reported as such, not as an unexpected error
+    assert thread.failed_files[file_url] == f"Download of {file_url} cancelled"
+
+
+class FailingSession:
+    def get(self, *args, **kwargs):
+        raise ValueError("boom")
+
+
+def test_unexpected_error_never_deletes_the_final_file(
+    monkeypatch, tmp_path, settings_tab
+):
+    download_folder = str(tmp_path / "d_unexpected")
+    other_files_dir = str(tmp_path / "other_unexpected")
+    os.makedirs(other_files_dir, exist_ok=True)
+    file_url = "https://kemono.cr/files/keep.png"
+
+    settings = make_settings(settings_tab)
+    thread = CreatorDownloadThread(
+        service="svc",
+        creator_id="creator123",
+        download_folder=download_folder,
+        selected_posts=["1"],
+        files_to_download=[file_url],
+        files_to_posts_map={file_url: "1"},
+        console=None,
+        other_files_dir=other_files_dir,
+        post_titles_map={("svc", "creator123", "1"): "MyPost"},
+        auto_rename_enabled=False,
+        settings=settings,
+        download_text=False,
+    )
+    monkeypatch.setattr(
+        "kemonodownloader.creator_downloader.get_session",
+        lambda settings_tab=None: FailingSession(),
+    )
+    target_folder, filename = thread.generate_filename_and_folder(
+        file_url, download_folder, 0, 1, "1", "MyPost"
+    )
+    os.makedirs(target_folder)
+    final_path = os.path.join(target_folder, filename)
+    with open(final_path, "wb") as fh:
+        fh.write(b"finished earlier")
+
+    asyncio.run(thread.download_file(file_url, download_folder, 0, total_files=1))
+
+    assert "boom" in thread.failed_files[file_url]
+    with open(final_path, "rb") as fh:
+        assert fh.read() == b"finished earlier"
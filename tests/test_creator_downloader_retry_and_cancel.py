@@ -1,6 +1,5 @@
 import asyncio
 import os
-from types import SimpleNamespace
 
 import requests
 
@@ -12,12 +11,7 @@ class FakeSessionAlwaysError:
         raise requests.RequestException("network failure")
 
 
-def make_settings(tmp_path):
-    settings_tab = SimpleNamespace(
-        get_creator_filename_template=lambda: None,
-        get_creator_folder_strategy=lambda: "per_post",
-        get_proxy_settings=lambda: None,
-    )
+def make_settings(settings_tab, tmp_path):
     return ThreadSettings(
         creator_posts_max_attempts=1,
         post_data_max_retries=1,
@@ -28,7 +22,7 @@ def make_settings(tmp_path):
     )
 
 
-def test_download_file_retries_records_failure(monkeypatch, tmp_path):
+def test_download_file_retries_records_failure(monkeypatch, tmp_path, settings_tab):
     """If all download attempts raise RequestException, the file should be recorded as failed."""
     download_folder = str(tmp_path / "downloads")
     other_files_dir = str(tmp_path / "other")
@@ -39,7 +33,7 @@ def test_download_file_retries_records_failure(monkeypatch, tmp_path):
     files_to_download = [file_url]
     files_to_posts_map = {file_url: "1"}
 
-    settings = make_settings(tmp_path)
+    settings = make_settings(settings_tab, tmp_path)
 
     # Monkeypatch get_session to return a session that always errors
     monkeypatch.setattr(
@@ -70,7 +64,7 @@ def test_download_file_retries_records_failure(monkeypatch, tmp_path):
     assert file_url not in thread.completed_files
 
 
-def test_run_returns_immediately_when_stopped(tmp_path):
+def test_run_returns_immediately_when_stopped(tmp_path, settings_tab):
     """Calling stop() before run() should cause run() to exit without performing work."""
     download_folder = str(tmp_path / "downloads2")
     other_files_dir = str(tmp_path / "other2")
@@ -81,7 +75,7 @@ def test_run_returns_immediately_when_stopped(tmp_path):
     files_to_download = [file_url]
     files_to_posts_map = {file_url: "2"}
 
-    settings = make_settings(tmp_path)
+    settings = make_settings(settings_tab, tmp_path)
 
     thread = CreatorDownloadThread(
         service="kemono",
@@ -1,12 +1,10 @@
-from types import SimpleNamespace
-
 from kemonodownloader import creator_downloader as cd
 
 
 def test_creator_download_thread_run_with_fake_workers(tmp_path, monkeypatch):
     # Prepare a thread with one file to download
     file_url = "https://kemono.cr/files/runfile.png"
-    settings = SimpleNamespace(settings_tab=None, file_download_max_retries=1)
+    settings = cd.ThreadSettings(1, 1, 1, 1, 1, settings_tab=None)
     t = cd.CreatorDownloadThread(
         "service",
         "creator",
@@ -1,7 +1,6 @@
 import asyncio
 import hashlib
 import os
-from types import SimpleNamespace
 
 from kemonodownloader.creator_downloader import CreatorDownloadThread, ThreadSettings
 
@@ -31,12 +30,7 @@ class FakeSession:
         return FakeResponse(self._chunks)
 
 
-def make_settings(tmp_path):
-    settings_tab = SimpleNamespace(
-        get_creator_filename_template=lambda: None,
-        get_creator_folder_strategy=lambda: "per_post",
-        get_proxy_settings=lambda: None,
-    )
+def make_settings(settings_tab, tmp_path):
     return ThreadSettings(
         creator_posts_max_attempts=1,
         post_data_max_retries=1,
@@ -47,7 +41,9 @@ def make_settings(tmp_path):
     )
 
 
-def test_streamed_download_writes_file_and_updates_hashdb(monkeypatch, tmp_path):
+def test_streamed_download_writes_file_and_updates_hashdb(
+    monkeypatch, tmp_path, settings_tab
+):
     download_folder = str(tmp_path / "dstream")
     other_files_dir = str(tmp_path / "otherstream")
     os.makedirs(download_folder, exist_ok=True)
@@ -66,7 +62,7 @@ def test_streamed_download_writes_file_and_updates_hashdb(monkeypatch, tmp_path)
         lambda settings_tab=None: FakeSession(chunks),
     )
 
-    settings = make_settings(tmp_path)
+    settings = make_settings(settings_tab, tmp_path)
 
     thread = CreatorDownloadThread(
         service="svc",
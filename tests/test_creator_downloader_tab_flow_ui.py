@@ -26,6 +26,8 @@ class FakePostDetectionThread:
         self.url = url
         self.post_titles_map = post_titles_map
         self.settings = settings
+        self.post_records = {}
+        self.sync_update = None
         self.finished = FakeSignal()
         self.posts_batch = FakeSignal()
         self.log = FakeSignal()
@@ -85,14 +87,7 @@ def test_check_creator_from_queue_flow(qtbot, monkeypatch, tmp_path):
     monkeypatch.setattr(
         cd.CreatorDownloaderTab,
         "_create_thread_settings",
-        lambda self: SimpleNamespace(
-            creator_posts_max_attempts=1,
-            post_data_max_retries=1,
-            file_download_max_retries=1,
-            api_request_max_retries=1,
-            simultaneous_downloads=1,
-            settings_tab=None,
-        ),
+        lambda self: cd.ThreadSettings(1, 1, 1, 1, 1, settings_tab=None),
     )
 
     parent = make_parent(tmp_path)
@@ -11,7 +11,7 @@ class DummySignal:
         self._fn = fn
 
 
-def make_parent(tmp_path):
+def make_parent(tmp_path, settings_tab):
     parent = QWidget()
     parent.cache_folder = str(tmp_path / "cache")
     parent.other_files_folder = str(tmp_path / "other")
@@ -20,17 +20,14 @@ def make_parent(tmp_path):
     os.makedirs(parent.other_files_folder, exist_ok=True)
     os.makedirs(parent.download_folder, exist_ok=True)
 
-    st = SimpleNamespace()
-    st.get_creator_posts_max_attempts = lambda: 1
-    st.get_post_data_max_retries = lambda: 1
-    st.get_file_download_max_retries = lambda: 1
-    st.get_api_request_max_retries = lambda: 1
-    st.get_simultaneous_downloads = lambda: 1
-    st.get_creator_filename_template = lambda: None
-    st.get_creator_folder_strategy = lambda: "per_post"
-    st.settings_applied = SimpleNamespace(connect=lambda f: None)
-    st.language_changed = SimpleNamespace(connect=lambda f: None)
-    parent.settings_tab = st
+    settings_tab.settings.update(
+        creator_posts_max_attempts=1,
+        post_data_max_retries=1,
+        file_download_max_retries=1,
+        api_request_max_retries=1,
+        simultaneous_downloads=1,
+    )
+    parent.settings_tab = settings_tab
 
     class Tabs:
         def __init__(self):
@@ -59,12 +56,14 @@ def make_parent(tmp_path):
     return parent
 
 
-def make_tab(tmp_path):
-    return cd.CreatorDownloaderTab(make_parent(tmp_path))
+def make_tab(tmp_path, settings_tab):
+    return cd.CreatorDownloaderTab(make_parent(tmp_path, settings_tab))
 
 
-def test_fast_mode_process_next_with_pending_calls_check_creator(tmp_path):
-    tab = make_tab(tmp_path)
+def test_fast_mode_process_next_with_pending_calls_check_creator(
+    tmp_path, settings_tab
+):
+    tab = make_tab(tmp_path, settings_tab)
     tab._fast_mode_pending_urls = ["https://kemono.cr/fanbox/user/1", "u2"]
 
     called = []
@@ -76,8 +75,8 @@ def test_fast_mode_process_next_with_pending_calls_check_creator(tmp_path):
     assert tab._fast_mode_pending_urls == ["u2"]
 
 
-def test_fast_mode_auto_download_with_posts_prepares_files(tmp_path):
-    tab = make_tab(tmp_path)
+def test_fast_mode_auto_download_with_posts_prepares_files(tmp_path, settings_tab):
+    tab = make_tab(tmp_path, settings_tab)
     tab.current_creator_url = "https://kemono.cr/fanbox/user/1"
     tab.all_detected_posts = [("Post A", ("101", None)), ("Post B", ("102", None))]
 
@@ -92,8 +91,8 @@ def test_fast_mode_auto_download_with_posts_prepares_files(tmp_path):
     assert prepared == [["https://kemono.cr/fanbox/user/1"]]
 
 
-def test_prepare_files_for_download_starts_thread(tmp_path, monkeypatch):
-    tab = make_tab(tmp_path)
+def test_prepare_files_for_download_starts_thread(tmp_path, monkeypatch, settings_tab):
+    tab = make_tab(tmp_path, settings_tab)
     tab.current_creator_url = "https://kemono.cr/fanbox/user/1"
     tab.posts_to_download = ["101"]
     tab.all_files_map = {
@@ -129,9 +128,9 @@ def test_prepare_files_for_download_starts_thread(tmp_path, monkeypatch):
 
 
 def test_on_file_preparation_finished_starts_download_thread_and_strips_query(
-    tmp_path, monkeypatch
+    tmp_path, monkeypatch, settings_tab
 ):
-    tab = make_tab(tmp_path)
+    tab = make_tab(tmp_path, settings_tab)
     tab.posts_to_download = ["101"]
     tab.total_posts_to_download = 1
 
@@ -159,10 +158,12 @@ def test_on_file_preparation_finished_starts_download_thread_and_strips_query(
             created["download_folder"] = download_folder
             created["files"] = files_to_download
             self.file_progress = DummySignal()
+            self.transfer_progress = DummySignal()
             self.file_completed = DummySignal()
             self.post_completed = DummySignal()
             self.log = DummySignal()
             self.finished = DummySignal()
+            self.concurrency_changed = DummySignal()
             self.started = False
 
         def start(self):
@@ -171,6 +172,9 @@ def test_on_file_preparation_finished_starts_download_thread_and_strips_query(
 
     monkeypatch.setattr(cd, "CreatorDownloadThread", FakeCreatorDownloadThread)
 
+    tab.file_preparation_thread = cd.FilePreparationThread(
+        [], {}, {}, True, True, True, tab._create_thread_settings()
+    )
     tab.on_file_preparation_finished(
         ["https://kemono.cr/fanbox/user/42?q=abc"],
         ["https://kemono.cr/files/a.jpg"],
@@ -182,8 +186,8 @@ def test_on_file_preparation_finished_starts_download_thread_and_strips_query(
     assert created["started"] is True
 
 
-def test_on_file_preparation_error_resets_and_finishes(tmp_path):
-    tab = make_tab(tmp_path)
+def test_on_file_preparation_error_resets_and_finishes(tmp_path, settings_tab):
+    tab = make_tab(tmp_path, settings_tab)
     cleaned = []
     finished = []
     tab.cleanup_file_preparation_thread = lambda: cleaned.append(True)
@@ -196,8 +200,8 @@ def test_on_file_preparation_error_resets_and_finishes(tmp_path):
     assert tab.background_task_progress.value() == 0
 
 
-def test_process_next_creator_no_remaining_finishes(tmp_path):
-    tab = make_tab(tmp_path)
+def test_process_next_creator_no_remaining_finishes(tmp_path, settings_tab):
+    tab = make_tab(tmp_path, settings_tab)
     called = []
     tab.creator_download_finished = lambda: called.append(True)
 
@@ -206,8 +210,10 @@ def test_process_next_creator_no_remaining_finishes(tmp_path):
     assert called
 
 
-def test_process_next_creator_with_remaining_resets_and_prepares(tmp_path):
-    tab = make_tab(tmp_path)
+def test_process_next_creator_with_remaining_resets_and_prepares(
+    tmp_path, settings_tab
+):
+    tab = make_tab(tmp_path, settings_tab)
     tab.completed_files = {"f1"}
     tab.completed_posts = {"p1"}
 
@@ -221,8 +227,8 @@ def test_process_next_creator_with_remaining_resets_and_prepares(tmp_path):
     assert prepared == [["u1", "u2"]]
 
 
-def test_cleanup_thread_waiting_branch_keeps_running_state(tmp_path):
-    tab = make_tab(tmp_path)
+def test_cleanup_thread_waiting_branch_keeps_running_state(tmp_path, settings_tab):
+    tab = make_tab(tmp_path, settings_tab)
 
     class FakeThread:
         def __init__(self):
@@ -251,8 +257,10 @@ def test_cleanup_thread_waiting_branch_keeps_running_state(tmp_path):
     assert called == []
 
 
-def test_cancel_creator_download_starts_cancellation_thread(tmp_path, monkeypatch):
-    tab = make_tab(tmp_path)
+def test_cancel_creator_download_starts_cancellation_thread(
+    tmp_path, monkeypatch, settings_tab
+):
+    tab = make_tab(tmp_path, settings_tab)
     tab.active_threads = [SimpleNamespace()]
     tab.post_detection_thread = None
 
@@ -274,8 +282,8 @@ def test_cancel_creator_download_starts_cancellation_thread(tmp_path, monkeypatc
     assert tab._cancellation_thread.started is True
 
 
-def test_on_cancellation_finished_runtimeerror_branch(tmp_path):
-    tab = make_tab(tmp_path)
+def test_on_cancellation_finished_runtimeerror_branch(tmp_path, settings_tab):
+    tab = make_tab(tmp_path, settings_tab)
 
     class BadDeleteThread:
         def isRunning(self):
@@ -1,5 +1,4 @@
 import os
-from types import SimpleNamespace
 from unittest.mock import MagicMock
 
 import kemonodownloader.creator_downloader as cd
@@ -23,14 +22,14 @@ def make_thread(tmp_path, settings=None, auto_rename=False, post_titles_map=None
         str(other),
         post_titles_map,
         auto_rename,
-        settings,
+        settings or cd.ThreadSettings(1, 1, 1, 1, 1),
         max_concurrent=1,
     )
     return t
 
 
 def test_generate_filename_and_folder_default(tmp_path):
-    t = make_thread(tmp_path, settings=None, auto_rename=False)
+    t = make_thread(tmp_path, auto_rename=False)
     t.creator_name = "Alice"
     key = (t.service, t.creator_id, "p1")
     t.post_titles_map[key] = "My Post"
@@ -45,15 +44,12 @@ def test_generate_filename_and_folder_default(tmp_path):
     assert os.path.basename(folder) == "p1_My_Post"
 
 
-def test_generate_filename_single_folder_and_template(tmp_path):
-    class MockST:
-        def get_creator_filename_template(self):
-            return "{creator_name}_{post_id}_{orig_name}"
-
-        def get_creator_folder_strategy(self):
-            return "single_folder"
-
-    settings = SimpleNamespace(settings_tab=MockST())
+def test_generate_filename_single_folder_and_template(tmp_path, settings_tab):
+    settings_tab.settings["creator_filename_template"] = (
+        "{creator_name}_{post_id}_{orig_name}"
+    )
+    settings_tab.settings["creator_folder_strategy"] = "single_folder"
+    settings = cd.ThreadSettings(1, 1, 1, 1, 1, settings_tab=settings_tab)
     t = make_thread(tmp_path, settings=settings, auto_rename=True)
     t.creator_name = "Bob"
     file_url = "https://kemono.cr/media/1.jpg?f=file.jpg"
@@ -68,20 +64,14 @@ def test_generate_filename_single_folder_and_template(tmp_path):
     assert filename.startswith("1_")
 
 
-def test_get_desc_folder_for_post_strategies(tmp_path):
-    class MockST:
-        def __init__(self, strat):
-            self._s = strat
-
-        def get_creator_folder_strategy(self):
-            return self._s
-
+def test_get_desc_folder_for_post_strategies(tmp_path, settings_tab):
     for strat, expected_tail in [
         ("by_file_type", os.path.join("", "txt")),
         ("single_folder", ""),
         ("per_post", "p1_Title"),
     ]:
-        settings = SimpleNamespace(settings_tab=MockST(strat))
+        settings_tab.settings["creator_folder_strategy"] = strat
+        settings = cd.ThreadSettings(1, 1, 1, 1, 1, settings_tab=settings_tab)
         t = make_thread(tmp_path, settings=settings)
         creator_folder = os.path.normpath(str(tmp_path / "dl" / "42_Alice"))
         desc = t.get_desc_folder_for_post(creator_folder, "p1", "Title")
@@ -93,8 +83,8 @@ def test_get_desc_folder_for_post_strategies(tmp_path):
             assert desc.endswith(os.path.join("42_Alice", "p1_Title"))
 
 
-def test__download_text_sync_writes_file(tmp_path, monkeypatch):
-    settings = SimpleNamespace(settings_tab=SimpleNamespace())
+def test__download_text_sync_writes_file(tmp_path, monkeypatch, settings_tab):
+    settings = cd.ThreadSettings(1, 1, 1, 1, 1, settings_tab=settings_tab)
     t = make_thread(tmp_path, settings=settings)
     t.domain_config = cd.get_domain_config("https://kemono.cr/")
 
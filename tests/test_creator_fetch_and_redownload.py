@@ -8,12 +8,7 @@ import requests
 from kemonodownloader.creator_downloader import CreatorDownloadThread, ThreadSettings
 
 
-def make_settings():
-    settings_tab = SimpleNamespace(
-        get_creator_filename_template=lambda: None,
-        get_creator_folder_strategy=lambda: "per_post",
-        get_proxy_settings=lambda: None,
-    )
+def make_settings(settings_tab):
     return ThreadSettings(
         creator_posts_max_attempts=1,
         post_data_max_retries=1,
@@ -24,8 +19,8 @@ def make_settings():
     )
 
 
-def test_fetch_creator_and_post_info_populates(monkeypatch):
-    settings = make_settings()
+def test_fetch_creator_and_post_info_populates(monkeypatch, settings_tab):
+    settings = make_settings(settings_tab)
     file_url = "https://kemono.cr/files/x.png"
     files_to_download = [file_url]
     files_to_posts_map = {file_url: "1"}
@@ -75,8 +70,8 @@ def test_fetch_creator_and_post_info_populates(monkeypatch):
     assert key in thread.post_titles_map
 
 
-def test_fetch_creator_and_post_info_handles_errors(monkeypatch):
-    settings = make_settings()
+def test_fetch_creator_and_post_info_handles_errors(monkeypatch, settings_tab):
+    settings = make_settings(settings_tab)
     file_url = "https://kemono.cr/files/x.png"
     files_to_download = [file_url]
     files_to_posts_map = {file_url: "1"}
@@ -113,7 +108,9 @@ def test_fetch_creator_and_post_info_handles_errors(monkeypatch):
     assert key in thread.post_titles_map
 
 
-def test_download_file_size_mismatch_triggers_redownload(monkeypatch, tmp_path):
+def test_download_file_size_mismatch_triggers_redownload(
+    monkeypatch, tmp_path, settings_tab
+):
     download_folder = str(tmp_path / "dl")
     other_files_dir = str(tmp_path / "other")
     os.makedirs(download_folder, exist_ok=True)
@@ -123,7 +120,7 @@ def test_download_file_size_mismatch_triggers_redownload(monkeypatch, tmp_path):
     files_to_download = [file_url]
     files_to_posts_map = {file_url: "1"}
 
-    settings = make_settings()
+    settings = make_settings(settings_tab)
     thread = CreatorDownloadThread(
         service="svc",
         creator_id="creator123",
@@ -145,27 +142,11 @@ def test_download_file_size_mismatch_triggers_redownload(monkeypatch, tmp_path):
         f.write(b"olddata")
     actual_size = os.path.getsize(existing_path)
 
-    class FakeHashDB:
-        def __init__(self):
-            self.store_calls = {}
-
-        def lookup(self, url_hash):
-            # Return an entry that claims a different expected size/hash
-            return {
-                "file_path": existing_path,
-                "file_hash": "differenthash",
-                "file_size": actual_size + 10,
-            }
-
-        def store(self, url_hash, path, file_hash, file_url, file_size):
-            self.store_calls[url_hash] = {
-                "file_path": path,
-                "file_hash": file_hash,
-                "file_size": file_size,
-            }
-
-    fake_db = FakeHashDB()
-    thread.hash_db = fake_db
+    url_hash = hashlib.md5(file_url.encode()).hexdigest()
+    # Record an entry that claims a different expected size/hash
+    thread.hash_db.store(
+        url_hash, existing_path, "differenthash", file_url, actual_size + 10
+    )
 
     # Fake download response with different content
     class FakeResp:
@@ -200,12 +181,13 @@ def test_download_file_size_mismatch_triggers_redownload(monkeypatch, tmp_path):
     asyncio.run(thread.download_file(file_url, download_folder, 0, total_files=1))
 
     # Should have stored a new hash entry and marked completed
-    url_hash = hashlib.md5(file_url.encode()).hexdigest()
     assert file_url in thread.completed_files
-    assert url_hash in fake_db.store_calls
+    assert thread.hash_db.lookup(url_hash)["file_hash"] != "differenthash"
 
 
-def test_download_file_makedirs_failure_records_error(monkeypatch, tmp_path):
+def test_download_file_makedirs_failure_records_error(
+    monkeypatch, tmp_path, settings_tab
+):
     download_folder = str(tmp_path / "dl2")
     other_files_dir = str(tmp_path / "other2")
     os.makedirs(download_folder, exist_ok=True)
@@ -215,7 +197,7 @@ def test_download_file_makedirs_failure_records_error(monkeypatch, tmp_path):
     files_to_download = [file_url]
     files_to_posts_map = {file_url: "1"}
 
-    settings = make_settings()
+    settings = make_settings(settings_tab)
     thread = CreatorDownloadThread(
         service="svc",
         creator_id="creator123",
@@ -249,7 +231,9 @@ def test_download_file_makedirs_failure_records_error(monkeypatch, tmp_path):
     assert file_url in thread.failed_files
 
 
-def test_download_file_request_exception_records_failure(monkeypatch, tmp_path):
+def test_download_file_request_exception_records_failure(
+    monkeypatch, tmp_path, settings_tab
+):
     download_folder = str(tmp_path / "dl3")
     other_files_dir = str(tmp_path / "other3")
     os.makedirs(download_folder, exist_ok=True)
@@ -259,7 +243,7 @@ def test_download_file_request_exception_records_failure(monkeypatch, tmp_path):
     files_to_download = [file_url]
     files_to_posts_map = {file_url: "1"}
 
-    settings = make_settings()
+    settings = make_settings(settings_tab)
     thread = CreatorDownloadThread(
         service="svc",
         creator_id="creator123",
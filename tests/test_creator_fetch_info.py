@@ -1,5 +1,3 @@
-from types import SimpleNamespace
-
 from kemonodownloader.creator_downloader import (
     CreatorDownloadThread,
     ThreadSettings,
@@ -30,12 +28,7 @@ class FakeSession:
         return FakeResponse({}, 404)
 
 
-def make_settings():
-    settings_tab = SimpleNamespace(
-        get_creator_filename_template=lambda: None,
-        get_creator_folder_strategy=lambda: "per_post",
-        get_proxy_settings=lambda: None,
-    )
+def make_settings(settings_tab):
     return ThreadSettings(
         creator_posts_max_attempts=1,
         post_data_max_retries=1,
@@ -46,14 +39,14 @@ def make_settings():
     )
 
 
-def test_fetch_creator_and_post_info_populates(monkeypatch, tmp_path):
+def test_fetch_creator_and_post_info_populates(monkeypatch, tmp_path, settings_tab):
     download_folder = str(tmp_path / "out")
     other_files_dir = str(tmp_path / "other")
     file_url = "https://kemono.cr/files/x.png"
     files_to_download = [file_url]
     files_to_posts_map = {file_url: "1"}
 
-    settings = make_settings()
+    settings = make_settings(settings_tab)
     thread = CreatorDownloadThread(
         service="svc",
         creator_id="creator123",
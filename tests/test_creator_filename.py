@@ -1,33 +1,14 @@
 import os
 
-from kemonodownloader.creator_downloader import CreatorDownloadThread
+from kemonodownloader.creator_downloader import CreatorDownloadThread, ThreadSettings
 
 
-class MockSettingsTab:
-    def __init__(
-        self, template="{post_title}-{post_id}-{orig_name}", strategy="per_post"
-    ):
-        self._template = template
-        self._strategy = strategy
-
-    def get_creator_filename_template(self):
-        return self._template
-
-    def get_creator_folder_strategy(self):
-        return self._strategy
-
-
-class MockThreadSettings:
-    def __init__(self, settings_tab=None):
-        self.settings_tab = settings_tab
-
-
-def make_thread(auto_rename=False, template=None, strategy=None):
-    settings_tab = MockSettingsTab(
-        template if template is not None else "{post_id}_{orig_name}",
-        strategy if strategy is not None else "per_post",
-    )
-    settings = MockThreadSettings(settings_tab)
+def make_thread(settings_tab, auto_rename=False, template=None, strategy=None):
+    if template is not None:
+        settings_tab.settings["creator_filename_template"] = template
+    if strategy is not None:
+        settings_tab.settings["creator_folder_strategy"] = strategy
+    settings = ThreadSettings(1, 1, 1, 1, 1, settings_tab=settings_tab)
     # minimal init
     t = CreatorDownloadThread(
         service="patreon",
@@ -49,8 +30,10 @@ def make_thread(auto_rename=False, template=None, strategy=None):
     return t
 
 
-def test_filename_template_applies_and_sanitizes():
-    t = make_thread(auto_rename=False, template="{post_title}-{post_id}-{orig_name}")
+def test_filename_template_applies_and_sanitizes(settings_tab):
+    t = make_thread(
+        settings_tab, auto_rename=False, template="{post_title}-{post_id}-{orig_name}"
+    )
     folder, filename = t.generate_filename_and_folder(
         "https://kemono.cr/media/abc/image.jpg", "/downloads", 0, 1, "1", "My Post"
     )
@@ -62,8 +45,8 @@ def test_filename_template_applies_and_sanitizes():
     assert expected in os.path.normpath(folder)
 
 
-def test_auto_rename_prefix_and_counter():
-    t = make_thread(auto_rename=True, template="{orig_name}")
+def test_auto_rename_prefix_and_counter(settings_tab):
+    t = make_thread(settings_tab, auto_rename=True, template="{orig_name}")
     # call twice for same post to get counter increment
     folder1, filename1 = t.generate_filename_and_folder(
         "https://kemono.cr/media/abc/file.png", "/downloads", 0, 2, "1", "My Post"
@@ -75,15 +58,15 @@ def test_auto_rename_prefix_and_counter():
     assert filename2.startswith("2_")
 
 
-def test_folder_strategy_single_and_by_type():
-    t_single = make_thread(strategy="single_folder")
+def test_folder_strategy_single_and_by_type(settings_tab):
+    t_single = make_thread(settings_tab, strategy="single_folder")
     folder_s, fn_s = t_single.generate_filename_and_folder(
         "https://kemono.cr/media/abc/file.mp4", "/downloads", 0, 1, "1", "My Post"
     )
     assert folder_s.endswith("creator123_Creator Name")
     assert "/1_My_Post" not in folder_s
 
-    t_type = make_thread(strategy="by_file_type")
+    t_type = make_thread(settings_tab, strategy="by_file_type")
     folder_t, fn_t = t_type.generate_filename_and_folder(
         "https://kemono.cr/media/abc/file.mp4", "/downloads", 0, 1, "1", "My Post"
     )
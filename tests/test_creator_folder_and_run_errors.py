@@ -4,12 +4,7 @@ from types import SimpleNamespace
 from kemonodownloader.creator_downloader import CreatorDownloadThread, ThreadSettings
 
 
-def make_settings():
-    settings_tab = SimpleNamespace(
-        get_creator_filename_template=lambda: None,
-        get_creator_folder_strategy=lambda: "per_post",
-        get_proxy_settings=lambda: None,
-    )
+def make_settings(settings_tab):
     return ThreadSettings(
         creator_posts_max_attempts=1,
         post_data_max_retries=1,
@@ -20,7 +15,7 @@ def make_settings():
     )
 
 
-def test_generate_filename_respects_existing_creator_folder(tmp_path):
+def test_generate_filename_respects_existing_creator_folder(tmp_path, settings_tab):
     base = str(tmp_path / "base")
     os.makedirs(base, exist_ok=True)
 
@@ -28,7 +23,7 @@ def test_generate_filename_respects_existing_creator_folder(tmp_path):
     files_to_download = [file_url]
     files_to_posts_map = {file_url: "1"}
 
-    settings = make_settings()
+    settings = make_settings(settings_tab)
     thread = CreatorDownloadThread(
         service="svc",
         creator_id="creator123",
@@ -59,12 +54,12 @@ def test_generate_filename_respects_existing_creator_folder(tmp_path):
     ) or target_folder.startswith(folder_arg)
 
 
-def test_run_handles_makedirs_oserror(monkeypatch, tmp_path):
+def test_run_handles_makedirs_oserror(monkeypatch, tmp_path, settings_tab):
     base = str(tmp_path / "out_error")
     files_to_download = []
     files_to_posts_map = {}
 
-    settings = make_settings()
+    settings = make_settings(settings_tab)
     thread = CreatorDownloadThread(
         service="svc",
         creator_id="creator123",
@@ -1,22 +1,9 @@
 import os
 
-from kemonodownloader.creator_downloader import CreatorDownloadThread
+from kemonodownloader.creator_downloader import CreatorDownloadThread, ThreadSettings
 
 
-class DummySettingsTab:
-    def get_creator_filename_template(self):
-        return "{post_id}_{orig_name}"
-
-    def get_creator_folder_strategy(self):
-        return "per_post"
-
-
-class DummySettings:
-    def __init__(self):
-        self.settings_tab = DummySettingsTab()
-
-
-def test_creator_folder_not_duplicated():
+def test_creator_folder_not_duplicated(settings_tab):
     t = CreatorDownloadThread(
         "patreon",
         "17913091",
@@ -28,7 +15,7 @@ def test_creator_folder_not_duplicated():
         "/tmp/other",
         {},
         auto_rename_enabled=False,
-        settings=DummySettings(),
+        settings=ThreadSettings(1, 1, 1, 1, 1, settings_tab=settings_tab),
         max_concurrent=1,
     )
     t.creator_name = "jtveemo"
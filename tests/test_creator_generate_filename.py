@@ -4,11 +4,10 @@ from types import SimpleNamespace
 from kemonodownloader.creator_downloader import CreatorDownloadThread, ThreadSettings
 
 
-def make_settings(template=None, strategy="per_post"):
-    settings_tab = SimpleNamespace(
-        get_creator_filename_template=lambda: template,
-        get_creator_folder_strategy=lambda: strategy,
-    )
+def make_settings(settings_tab, template=None, strategy="per_post"):
+    if template is not None:
+        settings_tab.settings["creator_filename_template"] = template
+    settings_tab.settings["creator_folder_strategy"] = strategy
     return ThreadSettings(
         creator_posts_max_attempts=1,
         post_data_max_retries=1,
@@ -40,9 +39,9 @@ def make_thread(file_url, tmp_path, settings, auto_rename=False):
     return thread
 
 
-def test_generate_filename_default(tmp_path):
+def test_generate_filename_default(tmp_path, settings_tab):
     file_url = "https://kemono.cr/files/image.png"
-    settings = make_settings()
+    settings = make_settings(settings_tab)
     thread = make_thread(file_url, tmp_path, settings, auto_rename=False)
 
     target_folder, filename = thread.generate_filename_and_folder(
@@ -54,9 +53,9 @@ def test_generate_filename_default(tmp_path):
     assert filename == "1_image.png"
 
 
-def test_generate_filename_auto_rename(tmp_path):
+def test_generate_filename_auto_rename(tmp_path, settings_tab):
     file_url = "https://kemono.cr/files/image.png"
-    settings = make_settings()
+    settings = make_settings(settings_tab)
     thread = make_thread(file_url, tmp_path, settings, auto_rename=True)
 
     target_folder, filename = thread.generate_filename_and_folder(
@@ -67,9 +66,9 @@ def test_generate_filename_auto_rename(tmp_path):
     assert filename == "1_1_image.png"
 
 
-def test_generate_filename_single_folder_strategy(tmp_path):
+def test_generate_filename_single_folder_strategy(tmp_path, settings_tab):
     file_url = "https://kemono.cr/files/image.png"
-    settings = make_settings(strategy="single_folder")
+    settings = make_settings(settings_tab, strategy="single_folder")
     thread = make_thread(file_url, tmp_path, settings, auto_rename=False)
 
     target_folder, filename = thread.generate_filename_and_folder(
@@ -81,10 +80,10 @@ def test_generate_filename_single_folder_strategy(tmp_path):
     assert filename == "1_image.png"
 
 
-def test_generate_filename_bad_template_falls_back(tmp_path):
+def test_generate_filename_bad_template_falls_back(tmp_path, settings_tab):
     file_url = "https://kemono.cr/files/image.png"
     # Template references nonexistent keys and will raise during format
-    settings = make_settings(template="{nonexistent}")
+    settings = make_settings(settings_tab, template="{nonexistent}")
     thread = make_thread(file_url, tmp_path, settings, auto_rename=False)
 
     target_folder, filename = thread.generate_filename_and_folder(
@@ -95,24 +94,24 @@ def test_generate_filename_bad_template_falls_back(tmp_path):
     assert filename == "1_image.png"
 
 
-def test_get_desc_folder_variants(tmp_path):
+def test_get_desc_folder_variants(tmp_path, settings_tab):
     file_url = "https://kemono.cr/files/image.png"
 
     # by_file_type -> txt subfolder
-    settings = make_settings(strategy="by_file_type")
+    settings = make_settings(settings_tab, strategy="by_file_type")
     thread = make_thread(file_url, tmp_path, settings)
     creator_folder = os.path.join(str(tmp_path), "creator123_Alice")
     got = thread.get_desc_folder_for_post(creator_folder, "1", "My Post")
     assert got == os.path.join(creator_folder, "txt")
 
     # single_folder -> return creator folder itself
-    settings = make_settings(strategy="single_folder")
+    settings = make_settings(settings_tab, strategy="single_folder")
     thread = make_thread(file_url, tmp_path, settings)
     got = thread.get_desc_folder_for_post(creator_folder, "1", "My Post")
     assert got == creator_folder
 
     # per_post -> creator_folder/post_id_post_title
-    settings = make_settings(strategy="per_post")
+    settings = make_settings(settings_tab, strategy="per_post")
     thread = make_thread(file_url, tmp_path, settings)
     got = thread.get_desc_folder_for_post(creator_folder, "1", "My Post")
     assert got == os.path.join(creator_folder, "1_My_Post")
@@ -26,13 +26,12 @@ def _make_thread(tmp_path, settings, auto_rename=False):
     return t
 
 
-def test_generate_filename_single_folder(tmp_path):
-    settings = SimpleNamespace(
-        settings_tab=SimpleNamespace(
-            get_creator_filename_template=lambda: "{post_id}_{orig_name}_{file_index}",
-            get_creator_folder_strategy=lambda: "single_folder",
-        )
+def test_generate_filename_single_folder(tmp_path, settings_tab):
+    settings_tab.settings.update(
+        creator_filename_template="{post_id}_{orig_name}_{file_index}",
+        creator_folder_strategy="single_folder",
     )
+    settings = cd.ThreadSettings(1, 1, 1, 1, 1, settings_tab=settings_tab)
 
     t = _make_thread(tmp_path, settings)
     file_url = "https://kemono.cr/files/abc.jpg"
@@ -45,13 +44,12 @@ def test_generate_filename_single_folder(tmp_path):
     assert filename.startswith("1_abc_1")
 
 
-def test_generate_filename_by_file_type(tmp_path):
-    settings = SimpleNamespace(
-        settings_tab=SimpleNamespace(
-            get_creator_filename_template=lambda: "{post_id}_{orig_name}",
-            get_creator_folder_strategy=lambda: "by_file_type",
-        )
+def test_generate_filename_by_file_type(tmp_path, settings_tab):
+    settings_tab.settings.update(
+        creator_filename_template="{post_id}_{orig_name}",
+        creator_folder_strategy="by_file_type",
     )
+    settings = cd.ThreadSettings(1, 1, 1, 1, 1, settings_tab=settings_tab)
 
     t = _make_thread(tmp_path, settings)
     file_url = "https://kemono.cr/files/f.jpg"
@@ -63,13 +61,12 @@ def test_generate_filename_by_file_type(tmp_path):
     assert filename == "1_f.jpg"
 
 
-def test_auto_rename_prefix_increments(tmp_path):
-    settings = SimpleNamespace(
-        settings_tab=SimpleNamespace(
-            get_creator_filename_template=lambda: "{orig_name}",
-            get_creator_folder_strategy=lambda: "per_post",
-        )
+def test_auto_rename_prefix_increments(tmp_path, settings_tab):
+    settings_tab.settings.update(
+        creator_filename_template="{orig_name}",
+        creator_folder_strategy="per_post",
     )
+    settings = cd.ThreadSettings(1, 1, 1, 1, 1, settings_tab=settings_tab)
 
     t = _make_thread(tmp_path, settings, auto_rename=True)
     file_url = "https://kemono.cr/files/pic.png"
@@ -84,14 +81,13 @@ def test_auto_rename_prefix_increments(tmp_path):
     assert filename2.startswith("2_")
 
 
-def test_template_error_fallback(tmp_path):
+def test_template_error_fallback(tmp_path, settings_tab):
     # Template uses unknown placeholder -> should fallback
-    settings = SimpleNamespace(
-        settings_tab=SimpleNamespace(
-            get_creator_filename_template=lambda: "{does_not_exist}",
-            get_creator_folder_strategy=lambda: "per_post",
-        )
+    settings_tab.settings.update(
+        creator_filename_template="{does_not_exist}",
+        creator_folder_strategy="per_post",
     )
+    settings = cd.ThreadSettings(1, 1, 1, 1, 1, settings_tab=settings_tab)
 
     t = _make_thread(tmp_path, settings)
     file_url = "https://kemono.cr/files/x.txt"
@@ -102,13 +98,12 @@ def test_template_error_fallback(tmp_path):
     assert filename.startswith("1_")
 
 
-def test_creator_folder_already_in_path(tmp_path):
-    settings = SimpleNamespace(
-        settings_tab=SimpleNamespace(
-            get_creator_filename_template=lambda: "{post_id}_{orig_name}",
-            get_creator_folder_strategy=lambda: "single_folder",
-        )
+def test_creator_folder_already_in_path(tmp_path, settings_tab):
+    settings_tab.settings.update(
+        creator_filename_template="{post_id}_{orig_name}",
+        creator_folder_strategy="single_folder",
     )
+    settings = cd.ThreadSettings(1, 1, 1, 1, 1, settings_tab=settings_tab)
 
     t = _make_thread(tmp_path, settings)
     base = str(tmp_path / "base" / "42_Creator")
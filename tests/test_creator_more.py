@@ -6,16 +6,9 @@ import requests
 from kemonodownloader import creator_downloader as cd
 
 
-def test_generate_filename_template_fallback(qapp, tmp_path):
-    class SettingsTab:
-        def get_creator_filename_template(self):
-            return "{nonexistent}"
-
-        def get_creator_folder_strategy(self):
-            return "per_post"
-
-    class Settings:
-        settings_tab = SettingsTab()
+def test_generate_filename_template_fallback(qapp, tmp_path, settings_tab):
+    settings_tab.settings["creator_filename_template"] = "{nonexistent}"
+    settings = cd.ThreadSettings(1, 1, 1, 1, 1, settings_tab=settings_tab)
 
     thread = cd.CreatorDownloadThread(
         "svc",
@@ -28,7 +21,7 @@ def test_generate_filename_template_fallback(qapp, tmp_path):
         str(tmp_path),
         {("svc", "creator", "1"): "Title"},
         True,
-        Settings(),
+        settings,
         1,
     )
 
@@ -41,13 +34,9 @@ def test_generate_filename_template_fallback(qapp, tmp_path):
     )
 
 
-def test_get_desc_folder_for_post_variants(qapp, tmp_path):
-    class SettingsTab:
-        def get_creator_folder_strategy(self):
-            return "by_file_type"
-
-    class Settings:
-        settings_tab = SettingsTab()
+def test_get_desc_folder_for_post_variants(qapp, tmp_path, settings_tab):
+    settings_tab.settings["creator_folder_strategy"] = "by_file_type"
+    settings = cd.ThreadSettings(1, 1, 1, 1, 1, settings_tab=settings_tab)
 
     thread = cd.CreatorDownloadThread(
         "svc",
@@ -60,7 +49,7 @@ def test_get_desc_folder_for_post_variants(qapp, tmp_path):
         str(tmp_path),
         {},
         True,
-        Settings(),
+        settings,
         1,
     )
 
@@ -70,23 +59,18 @@ def test_get_desc_folder_for_post_variants(qapp, tmp_path):
     assert os.path.basename(d) == "txt"
 
     # single_folder
-    thread.settings.settings_tab.get_creator_folder_strategy = lambda: "single_folder"
+    settings_tab.settings["creator_folder_strategy"] = "single_folder"
     d2 = thread.get_desc_folder_for_post(creator_folder, "1", "Title")
     assert d2 == os.path.normpath(creator_folder)
 
     # per_post
-    thread.settings.settings_tab.get_creator_folder_strategy = lambda: "per_post"
+    settings_tab.settings["creator_folder_strategy"] = "per_post"
     d3 = thread.get_desc_folder_for_post(creator_folder, "2", "Some Post")
     assert os.path.basename(d3).startswith("2_")
 
 
-def test_download_file_folder_creation_error(monkeypatch, qapp, tmp_path):
-    class SettingsTab:
-        pass
-
-    class Settings:
-        settings_tab = SettingsTab()
-        file_download_max_retries = 1
+def test_download_file_folder_creation_error(monkeypatch, qapp, tmp_path, settings_tab):
+    settings = cd.ThreadSettings(1, 1, 1, 1, 1, settings_tab=settings_tab)
 
     download_folder = str(tmp_path)
     file_url = "https://kemono.cr/path/fail.dat"
@@ -102,7 +86,7 @@ def test_download_file_folder_creation_error(monkeypatch, qapp, tmp_path):
         str(tmp_path),
         {("svc", "creator", "1"): "Title"},
         True,
-        Settings(),
+        settings,
         1,
     )
 
@@ -124,13 +108,10 @@ def test_download_file_folder_creation_error(monkeypatch, qapp, tmp_path):
     assert file_url in thread.failed_files
 
 
-def test_download_file_request_exception_retries(monkeypatch, qapp, tmp_path):
-    class SettingsTab:
-        pass
-
-    class Settings:
-        settings_tab = SettingsTab()
-        file_download_max_retries = 1
+def test_download_file_request_exception_retries(
+    monkeypatch, qapp, tmp_path, settings_tab
+):
+    settings = cd.ThreadSettings(1, 1, 1, 1, 1, settings_tab=settings_tab)
 
     download_folder = str(tmp_path)
     file_url = "https://kemono.cr/path/noresp.dat"
@@ -146,7 +127,7 @@ def test_download_file_request_exception_retries(monkeypatch, qapp, tmp_path):
         str(tmp_path),
         {("svc", "creator", "1"): "Title"},
         True,
-        Settings(),
+        settings,
         1,
     )
 
@@ -171,7 +152,7 @@ def test_download_file_request_exception_retries(monkeypatch, qapp, tmp_path):
     assert file_url in thread.failed_files
 
 
-def test_tab_update_file_completion_reads_thread_error(qapp, tmp_path):
+def test_tab_update_file_completion_reads_thread_error(qapp, tmp_path, settings_tab):
     parent = type("P", (), {})()
     parent.cache_folder = str(tmp_path)
     parent.other_files_folder = str(tmp_path)
@@ -180,11 +161,7 @@ def test_tab_update_file_completion_reads_thread_error(qapp, tmp_path):
     tab = cd.CreatorDownloaderTab(parent)
 
     # Create a real CreatorDownloadThread and set a failed_files mapping
-    class SettingsTab:
-        pass
-
-    class Settings:
-        settings_tab = SettingsTab()
+    settings = cd.ThreadSettings(1, 1, 1, 1, 1, settings_tab=settings_tab)
 
     file_url = "https://kemono.cr/x.dat"
     thread = cd.CreatorDownloadThread(
@@ -198,7 +175,7 @@ def test_tab_update_file_completion_reads_thread_error(qapp, tmp_path):
         str(tmp_path),
         {},
         True,
-        Settings(),
+        settings,
         1,
     )
     thread.failed_files[file_url] = "boom"
@@ -7,12 +7,7 @@ import requests
 from kemonodownloader.creator_downloader import CreatorDownloadThread, ThreadSettings
 
 
-def make_settings():
-    settings_tab = SimpleNamespace(
-        get_creator_filename_template=lambda: None,
-        get_creator_folder_strategy=lambda: "per_post",
-        get_proxy_settings=lambda: None,
-    )
+def make_settings(settings_tab):
     return ThreadSettings(
         creator_posts_max_attempts=1,
         post_data_max_retries=1,
@@ -23,7 +18,7 @@ def make_settings():
     )
 
 
-def test_request_exception_records_failure(monkeypatch, tmp_path):
+def test_request_exception_records_failure(monkeypatch, tmp_path, settings_tab):
     download_folder = str(tmp_path / "req_fail")
     other_files_dir = str(tmp_path / "other_req")
     os.makedirs(download_folder, exist_ok=True)
@@ -41,7 +36,7 @@ def test_request_exception_records_failure(monkeypatch, tmp_path):
         lambda settings_tab=None: SimpleNamespace(get=bad_get),
     )
 
-    settings = make_settings()
+    settings = make_settings(settings_tab)
     thread = CreatorDownloadThread(
         service="svc",
         creator_id="creator123",
@@ -63,13 +58,13 @@ def test_request_exception_records_failure(monkeypatch, tmp_path):
     assert "network error" in thread.failed_files[file_url]
 
 
-def test_download_post_text_only_once(monkeypatch, tmp_path):
+def test_download_post_text_only_once(monkeypatch, tmp_path, settings_tab):
     download_folder = str(tmp_path / "dt_once")
     other_files_dir = str(tmp_path / "other_dt")
     os.makedirs(download_folder, exist_ok=True)
     os.makedirs(other_files_dir, exist_ok=True)
 
-    settings = make_settings()
+    settings = make_settings(settings_tab)
     thread = CreatorDownloadThread(
         service="svc",
         creator_id="creator123",
@@ -116,7 +111,7 @@ def test_download_post_text_only_once(monkeypatch, tmp_path):
     assert os.path.exists(os.path.join(post_folder, "desc_1.txt"))
 
 
-def test_redownload_when_hash_size_mismatch(monkeypatch, tmp_path):
+def test_redownload_when_hash_size_mismatch(monkeypatch, tmp_path, settings_tab):
     download_folder = str(tmp_path / "rd_mismatch")
     other_files_dir = str(tmp_path / "other_rd")
     os.makedirs(download_folder, exist_ok=True)
@@ -163,7 +158,7 @@ def test_redownload_when_hash_size_mismatch(monkeypatch, tmp_path):
         ),
     )
 
-    settings = make_settings()
+    settings = make_settings(settings_tab)
     thread = CreatorDownloadThread(
         service="svc",
         creator_id="creator123",
@@ -185,11 +180,11 @@ def test_redownload_when_hash_size_mismatch(monkeypatch, tmp_path):
     assert getattr(fake_db, "stored", False) is True
 
 
-def test_get_desc_folder_for_post_various_strategies(tmp_path):
+def test_get_desc_folder_for_post_various_strategies(tmp_path, settings_tab):
     base = str(tmp_path / "base_desc")
     os.makedirs(base, exist_ok=True)
 
-    settings = make_settings()
+    settings = make_settings(settings_tab)
     thread = CreatorDownloadThread(
         service="svc",
         creator_id="creator123",
@@ -49,12 +49,9 @@ def test_post_detection_handles_gzipped_response(monkeypatch):
     assert ("service", "123", "1") in post_titles_map
 
 
-def test_generate_filename_by_file_type_and_creator_folder(tmp_path):
+def test_generate_filename_by_file_type_and_creator_folder(tmp_path, settings_tab):
     file_url = "https://kemono.cr/files/photo.png"
-    settings_tab = SimpleNamespace(
-        get_creator_filename_template=lambda: None,
-        get_creator_folder_strategy=lambda: "by_file_type",
-    )
+    settings_tab.settings["creator_folder_strategy"] = "by_file_type"
     settings = ThreadSettings(
         creator_posts_max_attempts=1,
         post_data_max_retries=1,
@@ -1,6 +1,5 @@
 import hashlib
 import os
-from types import SimpleNamespace
 
 from kemonodownloader.creator_downloader import CreatorDownloadThread, ThreadSettings
 
@@ -50,28 +49,7 @@ class FakeSessionMulti:
         return FakeAPIResponse({}, 404)
 
 
-class FakeHashDB:
-    def __init__(self):
-        self.store_calls = {}
-        self.lookup_map = {}
-
-    def lookup(self, url_hash):
-        return self.lookup_map.get(url_hash)
-
-    def store(self, url_hash, path, file_hash, file_url, file_size):
-        self.store_calls[url_hash] = {
-            "file_path": path,
-            "file_hash": file_hash,
-            "file_size": file_size,
-        }
-
-
-def make_settings():
-    settings_tab = SimpleNamespace(
-        get_creator_filename_template=lambda: None,
-        get_creator_folder_strategy=lambda: "per_post",
-        get_proxy_settings=lambda: None,
-    )
+def make_settings(settings_tab):
     return ThreadSettings(
         creator_posts_max_attempts=1,
         post_data_max_retries=1,
@@ -82,7 +60,7 @@ def make_settings():
     )
 
 
-def test_creator_run_downloads_all_files(monkeypatch, tmp_path):
+def test_creator_run_downloads_all_files(monkeypatch, tmp_path, settings_tab):
     download_folder = str(tmp_path / "out_run")
     other_files_dir = str(tmp_path / "other_run")
     os.makedirs(download_folder, exist_ok=True)
@@ -105,7 +83,7 @@ def test_creator_run_downloads_all_files(monkeypatch, tmp_path):
         lambda settings_tab=None: fake_session,
     )
 
-    settings = make_settings()
+    settings = make_settings(settings_tab)
     thread = CreatorDownloadThread(
         service="svc",
         creator_id="creator123",
@@ -122,20 +100,16 @@ def test_creator_run_downloads_all_files(monkeypatch, tmp_path):
         download_text=False,
     )
 
-    # Inject fake HashDB
-    fake_db = FakeHashDB()
-    thread.hash_db = fake_db
-
     # Run the full thread run loop synchronously
     thread.run()
 
     assert file1 in thread.completed_files
     assert file2 in thread.completed_files
     # HashDB should have stored entries for both files
-    assert len(fake_db.store_calls) == 2
+    assert thread.hash_db.count() == 2
 
 
-def test_creator_skips_existing_hash_entry(monkeypatch, tmp_path):
+def test_creator_skips_existing_hash_entry(monkeypatch, tmp_path, settings_tab):
     download_folder = str(tmp_path / "out_run2")
     other_files_dir = str(tmp_path / "other_run2")
     os.makedirs(download_folder, exist_ok=True)
@@ -153,7 +127,7 @@ def test_creator_skips_existing_hash_entry(monkeypatch, tmp_path):
     with open(existing_path, "rb") as f:
         file_hash = hashlib.md5(f.read()).hexdigest()
 
-    settings = make_settings()
+    settings = make_settings(settings_tab)
     thread = CreatorDownloadThread(
         service="svc",
         creator_id="creator123",
@@ -178,15 +152,9 @@ def test_creator_skips_existing_hash_entry(monkeypatch, tmp_path):
         ),
     )
 
-    fake_db = FakeHashDB()
-    # Return entry matching existing file
+    # Record an entry matching the existing file
     url_hash = hashlib.md5(file_url.encode()).hexdigest()
-    fake_db.lookup_map[url_hash] = {
-        "file_path": existing_path,
-        "file_hash": file_hash,
-        "file_size": actual_size,
-    }
-    thread.hash_db = fake_db
+    thread.hash_db.store(url_hash, existing_path, file_hash, file_url, actual_size)
 
     # Call download_file which should detect existing file and skip download
     import asyncio
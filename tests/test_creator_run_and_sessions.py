@@ -2,6 +2,7 @@ from types import SimpleNamespace
 
 from kemonodownloader.creator_downloader import (
     CreatorDownloadThread,
+    ThreadSettings,
     _thread_local,
     get_session,
 )
@@ -10,7 +11,7 @@ from kemonodownloader.creator_downloader import (
 def test_check_post_completion_emits(tmp_path):
     file_url1 = "https://kemono.cr/files/a.png"
     file_url2 = "https://kemono.cr/files/b.png"
-    settings = SimpleNamespace(settings_tab=None)
+    settings = ThreadSettings(1, 1, 1, 1, 1, settings_tab=None)
     thread = CreatorDownloadThread(
         service="svc",
         creator_id="creator123",
@@ -43,7 +44,7 @@ def test_check_post_completion_emits(tmp_path):
 
 def test_creator_run_executes_download_loop(tmp_path):
     file_url = "https://kemono.cr/files/x.png"
-    settings = SimpleNamespace(settings_tab=None, file_download_max_retries=1)
+    settings = ThreadSettings(1, 1, 1, 1, 1, settings_tab=None)
     thread = CreatorDownloadThread(
         service="svc",
         creator_id="creator123",
@@ -14,11 +14,6 @@ class DummySignal:
 
 
 def test_creator_download_thread_run_loop(monkeypatch, tmp_path):
-    class DummySettings:
-        file_download_max_retries = 1
-        settings_tab = None
-        simultaneous_downloads = 1
-
     file_url = "https://kemono.cr/files/a.jpg"
     thread = cd.CreatorDownloadThread(
         service="fanbox",
@@ -31,7 +26,7 @@ def test_creator_download_thread_run_loop(monkeypatch, tmp_path):
         other_files_dir=str(tmp_path / "other"),
         post_titles_map={},
         auto_rename_enabled=False,
-        settings=DummySettings(),
+        settings=cd.ThreadSettings(1, 1, 1, 1, 1),
         max_concurrent=1,
     )
 
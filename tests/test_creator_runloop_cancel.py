@@ -5,7 +5,7 @@ import kemonodownloader.creator_downloader as cd
 
 
 def _make_thread_for_runloop(tmp_path):
-    settings = SimpleNamespace(settings_tab=None, file_download_max_retries=1)
+    settings = cd.ThreadSettings(1, 1, 1, 1, 1, settings_tab=None)
     t = cd.CreatorDownloadThread(
         service="kemono",
         creator_id="1",
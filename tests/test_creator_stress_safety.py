@@ -1,20 +1,7 @@
-from kemonodownloader.creator_downloader import CreatorDownloadThread
+from kemonodownloader.creator_downloader import CreatorDownloadThread, ThreadSettings
 
 
-class DummySettingsTab:
-    def get_creator_filename_template(self):
-        return "{post_id}_{orig_name}"
-
-    def get_creator_folder_strategy(self):
-        return "per_post"
-
-
-class DummySettings:
-    def __init__(self):
-        self.settings_tab = DummySettingsTab()
-
-
-def test_stress_run_reduced_concurrency_does_not_crash(tmp_path):
+def test_stress_run_reduced_concurrency_does_not_crash(tmp_path, settings_tab):
     # This is a lightweight stress test that launches the download thread with
     # multiple workers but avoids network by giving no files. It ensures run() does
     # not crash immediately under threaded asyncio execution.
@@ -29,7 +16,7 @@ def test_stress_run_reduced_concurrency_does_not_crash(tmp_path):
         other_files_dir=str(tmp_path),
         post_titles_map={},
         auto_rename_enabled=False,
-        settings=DummySettings(),
+        settings=ThreadSettings(1, 1, 1, 1, 1, settings_tab=settings_tab),
         max_concurrent=2,
     )
     try:
@@ -0,0 +1,145 @@
+import json
+import time
+from types import SimpleNamespace
+
+import pytest
+
+import kemonodownloader.creator_downloader as cd
+from kemonodownloader.creator_sync import (
+    SyncMarker,
+    SyncUpdate,
+    load_marker,
+    newest_marker,
+    page_is_known,
+)
+from kemonodownloader.hash_db import HashDB
+
+_real_sleep = time.sleep
+
+
+class Resp:
+    def __init__(self, status_code=200, payload=None):
+        self.status_code = status_code
+        self.text = json.dumps(payload if payload is not None else [])
+        self.content = self.text.encode("utf-8")
+
+
+class NewestFirstListing:
+    """Fake listing of *total* posts, newest (highest id) first."""
+
+    def __init__(self, total):
+        self.total = total
+        self.page_urls = []
+
+    def get(self, url, **kwargs):
+        if url.endswith("/profile"):
+            return Resp(200, {"post_count": self.total})
+        self.page_urls.append(url)
+        offset = int(url.split("o=")[1].split("&")[0])
+        ids = range(self.total - 1 - offset, max(-1, self.total - 1 - offset - 50), -1)
+        posts = [
+            {"id": str(i), "title": f"Post {i}", "published": f"2024-01-01T{i:08d}"}
+            for i in ids
+        ]
+        return Resp(200, posts)
+
+
+@pytest.fixture(autouse=True)
+def short_sleeps(monkeypatch):
+    monkeypatch.setattr(cd.time, "sleep", lambda s: _real_sleep(min(s, 0.005)))
+
+
+def detect(monkeypatch, listing, db, incremental=True):
+    monkeypatch.setattr(cd, "get_session", lambda settings_tab=None: listing)
+    settings = cd.ThreadSettings(500, 1, 1, 1, 1, incremental_sync=incremental)
+    thread = cd.PostDetectionThread(
+        "https://kemono.cr/fanbox/user/1", {}, settings, sync_db=db
+    )
+    finished = []
+    thread.posts_batch = SimpleNamespace(emit=lambda batch: None)
+    thread.finished = SimpleNamespace(emit=finished.append)
+    thread.log = SimpleNamespace(emit=lambda *a: None)
+    thread.error = SimpleNamespace(emit=lambda *a: None)
+    thread.run()
+    return {entry[1][0] for entry in finished[0]}, thread.sync_update
+
+
+def test_page_is_known_only_when_every_post_is_old():
+    marker = SyncMarker("10", "2024-05-01T00:00:00")
+    old = {"id": "9", "published": "2024-04-01T00:00:00"}
+    new = {"id": "11", "published": "2024-06-01T00:00:00"}
+
+    assert page_is_known([old, {"id": "10"}], marker)
+    assert not page_is_known([new, old], marker)
+    assert not page_is_known([], marker)
+    assert not page_is_known([old], None)
+
+
+def test_newest_marker_keeps_the_latest_post():
+    posts = [
+        {"id": "2", "published": "2024-02-01"},
+        {"id": "3", "added": "2024-03-01"},
+        {"id": "1", "published": "2024-01-01"},
+    ]
+    assert newest_marker(posts) == SyncMarker("3", "2024-03-01")
+    previous = SyncMarker("9", "2025-01-01")
+    assert newest_marker(posts, previous) == previous
+
+
+def test_resync_stops_at_first_page_of_known_posts(monkeypatch, tmp_path):
+    db = HashDB(str(tmp_path / "db"))
+    listing = NewestFirstListing(5000)
+    found, update = detect(monkeypatch, listing, db)
+    assert len(found) == 5000
+    update.settle(found)
+    update.save()
+    assert load_marker(db, "fanbox", "1") == SyncMarker("4999", "2024-01-01T00004999")
+
+    listing = NewestFirstListing(5002)
+    found, update = detect(monkeypatch, listing, db)
+
+    assert {"5000", "5001"} <= found
+    assert len(listing.page_urls) == 2
+    update.settle(found)
+    update.save()
+    assert load_marker(db, "fanbox", "1").post_id == "5001"
+
+
+def test_marker_is_not_saved_by_detection_alone(monkeypatch, tmp_path):
+    db = HashDB(str(tmp_path / "db"))
+    db.store_sync_state("fanbox", "1", "99", "2024-01-01T00000099")
+    found, update = detect(monkeypatch, NewestFirstListing(120), db)
+
+    assert {"100", "119"} <= found
+    update.save()
+    assert load_marker(db, "fanbox", "1").post_id == "99"
+
+
+def test_marker_stops_below_the_oldest_unfinished_post(tmp_path):
+    db = HashDB(str(tmp_path / "db"))
+    previous = SyncMarker("1", "2024-01-01")
+    posts = [
+        {"id": "4", "published": "2024-01-04"},
+        {"id": "3", "published": "2024-01-03"},
+        {"id": "2", "published": "2024-01-02"},
+        {"id": "1", "published": "2024-01-01"},
+    ]
+    update = SyncUpdate(db, "fanbox", "1", previous, posts)
+
+    update.settle(["4", "2"])
+    assert update.marker() == SyncMarker("2", "2024-01-02")
+    update.settle(["3"])
+    assert update.marker() == SyncMarker("4", "2024-01-04")
+    update.save()
+    assert load_marker(db, "fanbox", "1") == SyncMarker("4", "2024-01-04")
+
+
+def test_full_scan_when_incremental_sync_is_off(monkeypatch, tmp_path):
+    db = HashDB(str(tmp_path / "db"))
+    db.store_sync_state("fanbox", "1", "199", "2024-01-01T00000199")
+    listing = NewestFirstListing(200)
+
+    found, update = detect(monkeypatch, listing, db, incremental=False)
+    assert len(found) == 200
+    assert update is None
+    assert load_marker(db, "fanbox", "1").post_id == "199"
@@ -3,28 +3,27 @@ from types import SimpleNamespace
 from kemonodownloader import creator_downloader as cd
 
 
-def make_parent(tmp_path):
+def make_parent(tmp_path, settings_tab):
     parent = SimpleNamespace()
     parent.cache_folder = str(tmp_path / "cache")
     parent.other_files_folder = str(tmp_path / "other")
     parent.download_folder = str(tmp_path / "dl")
-    st = SimpleNamespace()
-    st.settings_applied = SimpleNamespace(connect=lambda cb: None)
-    st.language_changed = SimpleNamespace(connect=lambda cb: None)
-    st.get_creator_posts_max_attempts = lambda: 1
-    st.get_post_data_max_retries = lambda: 1
-    st.get_file_download_max_retries = lambda: 1
-    st.get_api_request_max_retries = lambda: 1
-    st.get_simultaneous_downloads = lambda: 1
-    parent.settings_tab = st
+    settings_tab.settings.update(
+        creator_posts_max_attempts=1,
+        post_data_max_retries=1,
+        file_download_max_retries=1,
+        api_request_max_retries=1,
+        simultaneous_downloads=1,
+    )
+    parent.settings_tab = settings_tab
     parent.ensure_folders_exist = lambda: None
     parent.post_tab = SimpleNamespace()
     parent.creator_tab = SimpleNamespace()
     return parent
 
 
-def test_detection_to_population_flow(tmp_path, monkeypatch):
-    parent = make_parent(tmp_path)
+def test_detection_to_population_flow(tmp_path, monkeypatch, settings_tab):
+    parent = make_parent(tmp_path, settings_tab)
     tab = cd.CreatorDownloaderTab(parent)
 
     class FakeSignal:
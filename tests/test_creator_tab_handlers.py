@@ -11,29 +11,27 @@ class SimpleSignal:
         return None
 
 
-def make_parent(tmp_path):
+def make_parent(tmp_path, settings_tab):
     parent = SimpleNamespace()
     parent.cache_folder = str(tmp_path / "cache")
     parent.other_files_folder = str(tmp_path / "other")
     parent.download_folder = str(tmp_path / "dl")
-    # Minimal settings_tab with required getters and connectable signals
-    st = SimpleNamespace()
-    st.settings_applied = SimpleSignal()
-    st.language_changed = SimpleSignal()
-    st.get_creator_posts_max_attempts = lambda: 1
-    st.get_post_data_max_retries = lambda: 1
-    st.get_file_download_max_retries = lambda: 1
-    st.get_api_request_max_retries = lambda: 1
-    st.get_simultaneous_downloads = lambda: 1
-    parent.settings_tab = st
+    settings_tab.settings.update(
+        creator_posts_max_attempts=1,
+        post_data_max_retries=1,
+        file_download_max_retries=1,
+        api_request_max_retries=1,
+        simultaneous_downloads=1,
+    )
+    parent.settings_tab = settings_tab
     parent.ensure_folders_exist = lambda: None
     parent.post_tab = SimpleNamespace()
     parent.creator_tab = SimpleNamespace()
     return parent
 
 
-def test_create_remove_handler_removes_url(monkeypatch, tmp_path):
-    parent = make_parent(tmp_path)
+def test_create_remove_handler_removes_url(monkeypatch, tmp_path, settings_tab):
+    parent = make_parent(tmp_path, settings_tab)
     tab = cd.CreatorDownloaderTab(parent)
 
     url = "https://kemono.cr/user/xyz"
@@ -51,8 +49,8 @@ def test_create_remove_handler_removes_url(monkeypatch, tmp_path):
     assert all(item[0] != url for item in tab.creator_queue)
 
 
-def test_add_creator_to_queue_validates_and_adds(monkeypatch, tmp_path):
-    parent = make_parent(tmp_path)
+def test_add_creator_to_queue_validates_and_adds(monkeypatch, tmp_path, settings_tab):
+    parent = make_parent(tmp_path, settings_tab)
     tab = cd.CreatorDownloaderTab(parent)
 
     # Fake ValidationThread to immediately emit a successful result
@@ -4,15 +4,13 @@ from unittest.mock import MagicMock
 import kemonodownloader.creator_downloader as cd
 
 
-def test_template_bad_placeholder_fallsback_and_logs(tmp_path, qapp):
+def test_template_bad_placeholder_fallsback_and_logs(tmp_path, qapp, settings_tab):
     """If the user-provided filename template raises during formatting,
     the code should log a warning and fall back to a safe default."""
     file_url = "https://kemono.cr/files/foo.png"
-    settings_tab = SimpleNamespace(
-        get_creator_filename_template=lambda: "{post_id}_{nonexistent}",
-        get_creator_folder_strategy=lambda: "per_post",
-    )
-    settings = SimpleNamespace(settings_tab=settings_tab)
+    settings_tab.settings["creator_filename_template"] = "{post_id}_{nonexistent}"
+    settings_tab.settings["creator_folder_strategy"] = "per_post"
+    settings = cd.ThreadSettings(1, 1, 1, 1, 1, settings_tab=settings_tab)
 
     post_titles = {("svc", "creator123", "1"): "My Post"}
 
@@ -43,15 +41,13 @@ def test_template_bad_placeholder_fallsback_and_logs(tmp_path, qapp):
     assert th.log.emit.called
 
 
-def test_template_format_exception_with_autorename_prefix(tmp_path, qapp):
+def test_template_format_exception_with_autorename_prefix(tmp_path, qapp, settings_tab):
     """When auto-rename is enabled and template formatting fails,
     the auto-rename counter should still be applied to the fallback name."""
     file_url = "https://kemono.cr/files/bar.jpg"
-    settings_tab = SimpleNamespace(
-        get_creator_filename_template=lambda: "{missing_field}",
-        get_creator_folder_strategy=lambda: "per_post",
-    )
-    settings = SimpleNamespace(settings_tab=settings_tab)
+    settings_tab.settings["creator_filename_template"] = "{missing_field}"
+    settings_tab.settings["creator_folder_strategy"] = "per_post"
+    settings = cd.ThreadSettings(1, 1, 1, 1, 1, settings_tab=settings_tab)
 
     post_titles = {("svc", "creatorX", "42"): "Some Post"}
 
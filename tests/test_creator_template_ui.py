@@ -1,6 +1,6 @@
 from PyQt6.QtWidgets import QMessageBox
 
-from kemonodownloader.creator_downloader import CreatorDownloadThread
+from kemonodownloader.creator_downloader import CreatorDownloadThread, ThreadSettings
 from kemonodownloader.kd_settings import SettingsTab
 
 
@@ -35,18 +35,9 @@ def test_template_presets_and_custom(qapp, monkeypatch):
         st.deleteLater()
 
 
-def test_invalid_template_falls_back_and_logs(qapp):
+def test_invalid_template_falls_back_and_logs(qapp, settings_tab):
     # Create a thread-like object to test formatting
-    class DummySettingsTab:
-        def get_creator_filename_template(self):
-            return "{unknown_field}"
-
-        def get_creator_folder_strategy(self):
-            return "per_post"
-
-    class DummySettings:
-        def __init__(self):
-            self.settings_tab = DummySettingsTab()
+    settings_tab.settings["creator_filename_template"] = "{unknown_field}"
 
     t = CreatorDownloadThread(
         "patreon",
@@ -59,7 +50,7 @@ def test_invalid_template_falls_back_and_logs(qapp):
         "/tmp/other",
         {},
         auto_rename_enabled=False,
-        settings=DummySettings(),
+        settings=ThreadSettings(1, 1, 1, 1, 1, settings_tab=settings_tab),
         max_concurrent=1,
     )
     t.creator_name = "Creator Name"
@@ -8,12 +8,7 @@ from kemonodownloader.creator_downloader import (
 )
 
 
-def make_settings():
-    settings_tab = SimpleNamespace(
-        get_creator_filename_template=lambda: None,
-        get_creator_folder_strategy=lambda: "per_post",
-        get_proxy_settings=lambda: None,
-    )
+def make_settings(settings_tab):
     return ThreadSettings(
         creator_posts_max_attempts=1,
         post_data_max_retries=1,
@@ -24,8 +19,8 @@ def make_settings():
     )
 
 
-def test_validation_thread_success(monkeypatch):
-    settings = make_settings()
+def test_validation_thread_success(monkeypatch, settings_tab):
+    settings = make_settings(settings_tab)
     url = "https://kemono.cr/user/creatorid"
     thread = ValidationThread(url, settings)
 
@@ -48,8 +43,8 @@ def test_validation_thread_success(monkeypatch):
     assert getattr(thread, "_result", False) is True
 
 
-def test_validation_thread_invalid_url():
-    settings = make_settings()
+def test_validation_thread_invalid_url(settings_tab):
+    settings = make_settings(settings_tab)
     url = "https://example.com/invalid"
     thread = ValidationThread(url, settings)
 
@@ -60,8 +55,8 @@ def test_validation_thread_invalid_url():
     assert getattr(thread, "_result", False) is False
 
 
-def test_download_worker_invokes_download_file(monkeypatch):
-    settings = make_settings()
+def test_download_worker_invokes_download_file(monkeypatch, settings_tab):
+    settings = make_settings(settings_tab)
     td = CreatorDownloadThread(
         service="svc",
         creator_id="creator",
@@ -104,8 +99,8 @@ def test_download_worker_invokes_download_file(monkeypatch):
     assert called.get("url") == "https://kemono.cr/files/x.png"
 
 
-def test_safe_emit_ignores_when_destroyed():
-    settings = make_settings()
+def test_safe_emit_ignores_when_destroyed(settings_tab):
+    settings = make_settings(settings_tab)
     td = CreatorDownloadThread(
         service="svc",
         creator_id="creator",
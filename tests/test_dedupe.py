@@ -0,0 +1,117 @@
+import asyncio
+import hashlib
+import os
+from types import SimpleNamespace
+
+import requests
+
+import kemonodownloader.creator_downloader as cd
+import kemonodownloader.dedupe as dedupe
+from kemonodownloader.dedupe import (
+    LINK_COPY,
+    LINK_HARDLINK,
+    find_local_copy,
+    link_or_copy,
+)
+from kemonodownloader.hash_db import HashDB
+
+SHA = "b" * 64
+DATA_URL = f"https://kemono.cr/data/bb/bb/{SHA}.png"
+
+
+def record(db, path, content, url=DATA_URL):
+    path.write_bytes(content)
+    url_hash = hashlib.md5(url.encode()).hexdigest()
+    db.store(url_hash, str(path), hashlib.md5(content).hexdigest(), url, len(content))
+    return url_hash
+
+
+def test_link_or_copy_prefers_a_hardlink(tmp_path):
+    source = tmp_path / "source.bin"
+    source.write_bytes(b"content")
+    target = tmp_path / "target.bin"
+
+    assert link_or_copy(str(source), str(target)) == LINK_HARDLINK
+    assert os.path.samefile(source, target)
+    assert not os.path.exists(str(target) + dedupe.TEMP_SUFFIX)
+
+
+def test_link_or_copy_falls_back_to_a_copy(tmp_path, monkeypatch):
+    source = tmp_path / "source.bin"
+    source.write_bytes(b"content")
+    target = tmp_path / "target.bin"
+    target.write_bytes(b"stale")
+
+    def no_link(src, dst):
+        raise OSError("cross-device link")
+
+    monkeypatch.setattr(dedupe.os, "link", no_link)
+    monkeypatch.setattr(dedupe, "_reflink", lambda src, dst: False)
+
+    assert link_or_copy(str(source), str(target)) == LINK_COPY
+    assert target.read_bytes() == b"content"
+    assert not os.path.samefile(source, target)
+
+
+def test_find_local_copy_skips_changed_and_target_files(tmp_path):
+    db = HashDB(str(tmp_path / "db"))
+    changed = tmp_path / "changed.png"
+    record(db, changed, b"content", url=DATA_URL + "?f=changed.png")
+    changed.write_bytes(b"edited!")
+    target = tmp_path / "target.png"
+    record(db, target, b"content", url=DATA_URL + "?f=target.png")
+
+    assert find_local_copy(db, DATA_URL, str(target)) is None
+
+    intact = tmp_path / "intact.png"
+    record(db, intact, b"content", url=DATA_URL + "?f=intact.png")
+    assert find_local_copy(db, DATA_URL, str(target))["file_path"] == str(intact)
+    assert find_local_copy(db, "https://example.com/a.png", str(target)) is None
+    assert find_local_copy(SimpleNamespace(), DATA_URL, str(target)) is None
+
+
+def test_download_reuses_library_copy_without_a_request(
+    tmp_path, monkeypatch, settings_tab
+):
+    class NoSession:
+        def get(self, *args, **kwargs):
+            raise requests.RequestException("should not be called")
+
+    monkeypatch.setattr(cd, "get_session", lambda settings_tab=None: NoSession())
+    file_url = DATA_URL + "?f=repost.png"
+    download_folder = str(tmp_path / "downloads")
+    os.makedirs(download_folder)
+    settings = cd.ThreadSettings(
+        1,
+        1,
+        1,
+        1,
+        1,
+        settings_tab=settings_tab,
+    )
+    thread = cd.CreatorDownloadThread(
+        service="fanbox",
+        creator_id="c1",
+        download_folder=download_folder,
+        selected_posts=["2"],
+        files_to_download=[file_url],
+        files_to_posts_map={file_url: "2"},
+        console=None,
+        other_files_dir=str(tmp_path / "other"),
+        post_titles_map={},
+        auto_rename_enabled=False,
+        settings=settings,
+        download_text=False,
+    )
+    original = tmp_path / "original.png"
+    record(thread.hash_db, original, b"png bytes", url=DATA_URL + "?f=first.png")
+
+    asyncio.run(thread.download_file(file_url, download_folder, 0, 1))
+
+    assert file_url in thread.completed_files
+    assert file_url not in thread.failed_files
+    url_hash = hashlib.md5(file_url.encode()).hexdigest()
+    entry = thread.hash_db.lookup(url_hash)
+    assert entry["file_path"] != str(original)
+    with open(entry["file_path"], "rb") as f:
+        assert f.read() == b"png bytes"
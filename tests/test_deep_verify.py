@@ -0,0 +1,112 @@
+import asyncio
+import hashlib
+import os
+import threading
+
+from kemonodownloader.creator_downloader import CreatorDownloadThread, ThreadSettings
+from kemonodownloader.deep_verify import DeepVerifier, get_deep_verifier
+from kemonodownloader.hash_db import HashDB
+
+
+def store_file(tmp_path, content, recorded=None):
+    db = HashDB(str(tmp_path / "db"))
+    path = tmp_path / "file.bin"
+    path.write_bytes(content)
+    digest = hashlib.md5(recorded if recorded is not None else content).hexdigest()
+    db.store("k1", str(path), digest, "https://x/file.bin", len(content))
+    return db, str(path), digest
+
+
+def test_matching_file_keeps_its_entry(tmp_path):
+    db, path, digest = store_file(tmp_path, b"a" * 5000)
+    mismatches = []
+    verifier = DeepVerifier(chunk_size=1024, chunk_pause=0)
+
+    verifier.submit(db, "k1", path, digest, on_mismatch=mismatches.append)
+
+    assert verifier.wait_idle(5)
+    assert mismatches == []
+    assert db.lookup("k1") is not None
+
+
+def test_corrupted_file_loses_its_entry(tmp_path):
+    db, path, digest = store_file(tmp_path, b"a" * 5000, recorded=b"b" * 5000)
+    mismatches = []
+    verifier = DeepVerifier(chunk_size=1024, chunk_pause=0)
+
+    verifier.submit(db, "k1", path, digest, on_mismatch=mismatches.append)
+
+    assert verifier.wait_idle(5)
+    assert mismatches == [path]
+    assert db.lookup("k1") is None
+
+
+def test_duplicate_submissions_are_verified_once(tmp_path):
+    db, path, digest = store_file(tmp_path, b"a", recorded=b"b")
+    mismatches = []
+    verifier = DeepVerifier(chunk_pause=0)
+    # Hold the worker until every submission is in, otherwise it can finish
+    # the first job before the duplicates arrive.
+    held = threading.Lock()
+    held.acquire()
+    verify = verifier._verify
+
+    def held_verify(job, generation):
+        with held:
+            verify(job, generation)
+
+    verifier._verify = held_verify
+
+    verifier.clear()
+    for _ in range(3):
+        verifier.submit(db, "k1", path, digest, on_mismatch=mismatches.append)
+    held.release()
+
+    assert verifier.wait_idle(5)
+    assert mismatches == [path]
+
+
+def make_thread(settings_tab, tmp_path, file_url, deep_verify):
+    settings_tab.settings["deep_verify_enabled"] = deep_verify
+    settings = ThreadSettings(1, 1, 1, 1, 1, settings_tab=settings_tab)
+    return CreatorDownloadThread(
+        service="fanbox",
+        creator_id="c1",
+        download_folder=str(tmp_path / "downloads"),
+        selected_posts=["1"],
+        files_to_download=[file_url],
+        files_to_posts_map={file_url: "1"},
+        console=None,
+        other_files_dir=str(tmp_path / "other"),
+        post_titles_map={},
+        auto_rename_enabled=False,
+        settings=settings,
+        download_text=False,
+    )
+
+
+def skip_existing(settings_tab, tmp_path, deep_verify, monkeypatch):
+    file_url = "https://kemono.cr/data/ab/cd/file.bin"
+    thread = make_thread(settings_tab, tmp_path, file_url, deep_verify)
+    existing = tmp_path / "existing.bin"
+    existing.write_bytes(b"content")
+    url_hash = hashlib.md5(file_url.encode()).hexdigest()
+    thread.hash_db.store(
+        url_hash, str(existing), hashlib.md5(b"content").hexdigest(), file_url, 7
+    )
+    submitted = []
+    monkeypatch.setattr(
+        get_deep_verifier(), "submit", lambda *args, **kwargs: submitted.append(args)
+    )
+    os.makedirs(thread.download_folder, exist_ok=True)
+
+    asyncio.run(thread.download_file(file_url, thread.download_folder, 0, 1))
+
+    assert file_url in thread.completed_files
+    return submitted
+
+
+def test_skipped_file_is_queued_only_when_enabled(tmp_path, monkeypatch, settings_tab):
+    assert skip_existing(settings_tab, tmp_path / "off", False, monkeypatch) == []
+    submitted = skip_existing(settings_tab, tmp_path / "on", True, monkeypatch)
+    assert [args[2] for args in submitted] == [str(tmp_path / "on" / "existing.bin")]
@@ -1,26 +1,11 @@
 import os
 
-from kemonodownloader.creator_downloader import CreatorDownloadThread
+from kemonodownloader.creator_downloader import CreatorDownloadThread, ThreadSettings
 
 
-class DummySettingsTab:
-    def __init__(self, strategy="per_post"):
-        self._strategy = strategy
-
-    def get_creator_filename_template(self):
-        return "{post_id}_{orig_name}"
-
-    def get_creator_folder_strategy(self):
-        return self._strategy
-
-
-class DummySettings:
-    def __init__(self, strategy="per_post"):
-        self.settings_tab = DummySettingsTab(strategy)
-
-
-def make_thread(strategy="per_post"):
-    settings = DummySettings(strategy)
+def make_thread(settings_tab, strategy="per_post"):
+    settings_tab.settings["creator_folder_strategy"] = strategy
+    settings = ThreadSettings(1, 1, 1, 1, 1, settings_tab=settings_tab)
     t = CreatorDownloadThread(
         service="patreon",
         creator_id="12345",
@@ -39,22 +24,22 @@ def make_thread(strategy="per_post"):
     return t
 
 
-def test_desc_folder_per_post():
-    t = make_thread("per_post")
+def test_desc_folder_per_post(settings_tab):
+    t = make_thread(settings_tab, "per_post")
     creator_folder = os.path.join(t.download_folder, f"{t.creator_id}_{t.creator_name}")
     desc = t.get_desc_folder_for_post(creator_folder, "1", "My Post")
     assert desc.endswith(os.path.join("1_My_Post"))
 
 
-def test_desc_folder_single_folder():
-    t = make_thread("single_folder")
+def test_desc_folder_single_folder(settings_tab):
+    t = make_thread(settings_tab, "single_folder")
     creator_folder = os.path.join(t.download_folder, f"{t.creator_id}_{t.creator_name}")
     desc = t.get_desc_folder_for_post(creator_folder, "1", "My Post")
     assert desc == os.path.normpath(creator_folder)
 
 
-def test_desc_folder_by_file_type():
-    t = make_thread("by_file_type")
+def test_desc_folder_by_file_type(settings_tab):
+    t = make_thread(settings_tab, "by_file_type")
     creator_folder = os.path.join(t.download_folder, f"{t.creator_id}_{t.creator_name}")
     desc = t.get_desc_folder_for_post(creator_folder, "1", "My Post")
     assert desc.endswith(os.path.join("txt"))
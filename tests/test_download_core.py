@@ -0,0 +1,372 @@
+import hashlib
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+import requests
+from requests.structures import CaseInsensitiveDict
+
+from kemonodownloader import cli
+from kemonodownloader.creator_sync import load_marker
+from kemonodownloader.domain_config import get_domain_config
+from kemonodownloader.download_core import (
+    BY_FILE_TYPE,
+    SINGLE_FOLDER,
+    CoreSettings,
+    CreatorRef,
+    DownloadCore,
+    DownloadListener,
+    PostRef,
+    creator_folder_for,
+    detect_post_files,
+    parse_creator_url,
+    parse_post_url,
+    render_file_name,
+    target_folder_for,
+)
+from kemonodownloader.endpoint_cache import get_endpoint_cache
+from kemonodownloader.hash_db import HashDB
+
+CREATOR = "https://kemono.cr/fanbox/user/42"
+DOMAIN = get_domain_config(CREATOR)
+SRC = str(Path(__file__).parent.parent / "src")
+
+
+@pytest.fixture(autouse=True)
+def endpoint_cache():
+    cache = get_endpoint_cache()
+    path = cache.path
+    yield cache
+    cache.set_path(path)
+    cache.forget("kemono.cr", "fanbox")
+
+
+class FakeResponse:
+    def __init__(self, status_code=200, json_data=None, body=b"", headers=None):
+        self.status_code = status_code
+        self.body = body
+        self.headers = CaseInsensitiveDict(headers or {})
+        if json_data is not None:
+            self.body = json.dumps(json_data).encode()
+        elif "content-length" not in self.headers:
+            self.headers["content-length"] = str(len(body))
+
+    @property
+    def content(self):
+        return self.body
+
+    @property
+    def text(self):
+        return self.body.decode()
+
+    def json(self):
+        return json.loads(self.body)
+
+    def iter_content(self, chunk_size=1):
+        for start in range(0, len(self.body), chunk_size):
+            yield self.body[start : start + chunk_size]
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise requests.HTTPError(str(self.status_code), response=self)
+
+    def close(self):
+        pass
+
+
+class FakeSite:
+    """Serves a creator with two posts and their files."""
+
+    def __init__(self):
+        self.posts = {
+            "1": {
+                "id": "1",
+                "title": "First",
+                "file": {"path": "/aa/bb/one.png", "name": "one.png"},
+                "attachments": [{"path": "/cc/dd/two.zip", "name": "two.zip"}],
+                "content": "",
+            },
+            "2": {
+                "id": "2",
+                "title": "Second",
+                "file": {"path": "/ee/ff/three.jpeg", "name": "three.jpeg"},
+                "attachments": [],
+                "content": '<img src="/gg/hh/four.gif">',
+            },
+        }
+        self.files = {
+            "one.png": b"1" * 300,
+            "two.zip": b"2" * 70000,
+            "three.jpeg": b"3" * 10,
+            "four.gif": b"4" * 20,
+        }
+        self.requests = []
+
+    def get(self, url, headers=None, timeout=None, stream=False):
+        self.requests.append(url)
+        if "/api/" in url:
+            if url.endswith("/profile"):
+                return FakeResponse(json_data={"name": "Artist"})
+            if "/post/" in url:
+                post_id = url.rsplit("/", 1)[-1]
+                if post_id not in self.posts:
+                    return FakeResponse(404)
+                return FakeResponse(json_data={"post": self.posts[post_id]})
+            return FakeResponse(json_data=list(self.posts.values()))
+        name = url.split("f=")[-1] if "f=" in url else url.rsplit("/", 1)[-1]
+        body = self.files[name]
+        offset = int(headers.get("Range", "bytes=0-")[6:-1])
+        if offset:
+            return FakeResponse(
+                206,
+                body=body[offset:],
+                headers={
+                    "content-range": f"bytes {offset}-{len(body) - 1}/{len(body)}",
+                    "content-length": str(len(body) - offset),
+                },
+            )
+        return FakeResponse(body=body)
+
+
+class Recorder(DownloadListener):
+    def __init__(self):
+        self.completed = []
+        self.posts = []
+        self.detected = []
+
+    def file_completed(self, file_url, success, file_path):
+        self.completed.append((file_url, success, file_path))
+
+    def post_completed(self, post_id):
+        self.posts.append(post_id)
+
+    def posts_detected(self, url, posts):
+        self.detected.append(posts)
+
+
+def make_core(tmp_path, site, hash_db=None, **kwargs):
+    listener = Recorder()
+    core = DownloadCore(CoreSettings(str(tmp_path / "dl"), **kwargs), listener, hash_db)
+    core.session = lambda: site
+    core.RETRY_BASE_DELAY = 0.01
+    return core, listener
+
+
+def test_urls_are_parsed_without_a_domain_check():
+    assert parse_creator_url(CREATOR + "?o=50&q=cat") == CreatorRef(
+        "fanbox", "42", "cat", 50
+    )
+    assert parse_post_url(CREATOR + "/post/7/") == PostRef("fanbox", "42", "7")
+    assert parse_post_url(CREATOR) is None
+    assert parse_creator_url("https://kemono.cr/artists") is None
+
+
+def test_detection_applies_categories_and_file_types():
+    site = FakeSite()
+    logged = []
+    files = detect_post_files(
+        site.posts["2"],
+        [".jpg", ".gif"],
+        DOMAIN,
+        content=False,
+        log=lambda message, level: logged.append(level),
+    )
+    # ".jpg" covers .jpeg as well; content images were not asked for.
+    assert files == [("three.jpeg", "https://kemono.cr/ee/ff/three.jpeg?f=three.jpeg")]
+    assert logged and set(logged) == {"INFO"}
+
+
+def test_naming_helpers_follow_the_folder_strategy(tmp_path):
+    assert render_file_name("{post_id}_{nope}", {"post_id": 1}) is None
+    assert render_file_name("", {"post_id": 1, "orig_name": "a"}) == "1_a"
+    root = str(tmp_path / "42_Artist")
+    assert creator_folder_for(root, "42", "Artist") == os.path.normpath(root)
+    assert target_folder_for(root, SINGLE_FOLDER, "1", "T", ".png") == root
+    assert target_folder_for(root, BY_FILE_TYPE, "1", "T", "") == os.path.join(
+        root, "other"
+    )
+    assert target_folder_for(root, "per_post", "1", "T", ".png") == os.path.join(
+        root, "1_T"
+    )
+
+
+def test_creator_is_downloaded_then_skipped_on_the_next_run(tmp_path):
+    site = FakeSite()
+    hash_db = HashDB(str(tmp_path / "state"))
+    try:
+        core, listener = make_core(tmp_path, site, hash_db, listing_prep=True)
+        summary = core.run([CREATOR])
+
+        assert summary == (4, 0, 0)
+        assert sorted(listener.posts) == ["1", "2"]
+        assert [pid for pid, _ in listener.detected[0]] == ["1", "2"]
+        folder = tmp_path / "dl" / "42_Artist"
+        assert (folder / "1_First" / "1_two.zip").read_bytes() == site.files["two.zip"]
+        assert (folder / "2_Second" / "2_four.gif").exists()
+        # Listing records were complete, so no post was fetched on its own.
+        assert not [url for url in site.requests if "/post/" in url]
+
+        core, listener = make_core(tmp_path, site, hash_db, skip_completed=False)
+        assert core.run([CREATOR]) == (0, 4, 0)
+        assert len([url for url in site.requests if "/post/" in url]) == 2
+
+        # Both posts were completed, so the default run does not touch them.
+        core, listener = make_core(tmp_path, site, hash_db)
+        assert core.run([CREATOR]) == (0, 0, 0)
+    finally:
+        hash_db.close()
+
+
+def test_sync_marker_waits_for_failed_posts(tmp_path):
+    site = FakeSite()
+    site.posts["1"]["published"] = "2024-01-01T00:00:00"
+    site.posts["2"]["published"] = "2024-01-02T00:00:00"
+    files = site.files
+    site.files = {name: body for name, body in files.items() if name != "two.zip"}
+    get = site.get
+    site.get = lambda url, headers=None, timeout=None, stream=False: (
+        FakeResponse(404)
+        if url.endswith("two.zip")
+        else get(url, headers, timeout, stream)
+    )
+    hash_db = HashDB(str(tmp_path / "state"))
+    try:
+        core, _ = make_core(tmp_path, site, hash_db, incremental=True, max_retries=1)
+        assert core.run([CREATOR]).failed == 1
+        # Post 1 failed and is older than post 2, so neither is marked seen.
+        assert load_marker(hash_db, "fanbox", "42") is None
+
+        site.files = files
+        site.get = get
+        core, _ = make_core(tmp_path, site, hash_db, incremental=True)
+        assert core.run([CREATOR]).downloaded == 1
+        assert load_marker(hash_db, "fanbox", "42").post_id == "2"
+    finally:
+        hash_db.close()
+
+
+def test_file_of_the_wrong_size_is_downloaded_again(tmp_path):
+    site = FakeSite()
+    hash_db = HashDB(str(tmp_path / "state"))
+    try:
+        core, _ = make_core(tmp_path, site, hash_db)
+        assert core.run([CREATOR]) == (4, 0, 0)
+        saved = tmp_path / "dl" / "42_Artist" / "1_First" / "1_two.zip"
+        saved.write_bytes(b"truncated")
+
+        core, _ = make_core(tmp_path, site, hash_db, skip_completed=False)
+        assert core.run([CREATOR]) == (1, 3, 0)
+        assert saved.read_bytes() == site.files["two.zip"]
+    finally:
+        hash_db.close()
+
+
+def test_partial_file_is_resumed(tmp_path):
+    site = FakeSite()
+    post_url = CREATOR + "/post/1"
+    core, _ = make_core(
+        tmp_path, site, main=False, template="{orig_name}", folder_strategy="x"
+    )
+    jobs = core.file_jobs(
+        "fanbox", "42", "Artist", [(site.posts["1"], [("two.zip", "u")])]
+    )
+    os.makedirs(jobs[0].folder)
+    url = "https://kemono.cr/cc/dd/two.zip?f=two.zip"
+    part = Path(jobs[0].folder) / (hashlib.md5(url.encode()).hexdigest() + ".part")
+    part.write_bytes(site.files["two.zip"][:1000])
+
+    assert core.run([post_url]) == (1, 0, 0)
+    saved = Path(jobs[0].folder) / "two.zip"
+    assert saved.read_bytes() == site.files["two.zip"]
+    assert not part.exists()
+
+
+def test_failed_attempts_are_requeued_while_the_worker_moves_on(tmp_path):
+    site = FakeSite()
+    get = site.get
+    order = []
+
+    def flaky(url, headers=None, timeout=None, stream=False):
+        name = url.rsplit("/", 1)[-1]
+        order.append(name)
+        if name in ("1", "one.png?f=one.png") and order.count(name) == 1:
+            raise requests.ConnectionError("reset")
+        return get(url, headers, timeout, stream)
+
+    site.get = flaky
+    core, _ = make_core(tmp_path, site, workers=1)
+    core.RETRY_BASE_DELAY = 0.2
+    assert core.run([CREATOR]) == (4, 0, 0)
+
+    # With a single worker, post 2 was fetched while post 1 waited out its
+    # backoff, and the other files downloaded before one.png was retried.
+    assert [name for name in order if name in ("1", "2")] == ["1", "2", "1"]
+    files = [name.split("?")[0] for name in order if "." in name]
+    assert files[0] == files[-1] == "one.png"
+
+
+def test_missing_post_and_unknown_url_are_failures(tmp_path):
+    core, listener = make_core(tmp_path, FakeSite())
+    summary = core.run([CREATOR + "/post/99", "https://kemono.cr/artists"])
+    assert summary.failed == 2 and listener.completed == []
+
+
+def test_stopped_core_downloads_nothing(tmp_path):
+    site = FakeSite()
+    core, _ = make_core(tmp_path, site)
+    core.stop()
+    assert core.run([CREATOR]) == (0, 0, 0)
+    assert site.requests == []
+
+
+def test_cli_reads_input_files_and_options(tmp_path):
+    urls_file = tmp_path / "urls.txt"
+    urls_file.write_text(f"# creators\n{CREATOR}\n\n{CREATOR}\n{CREATOR}/post/1\n")
+    args = cli.build_parser().parse_args(
+        ["-i", str(urls_file), "--fast", "--ext", "png, .ZIP", "--no-content"]
+    )
+    assert cli.collect_urls(args) == [CREATOR, CREATOR + "/post/1"]
+    settings = cli.core_settings(args, str(tmp_path))
+    assert settings.extensions == [".png", ".zip"]
+    assert settings.listing_prep and settings.incremental
+    assert settings.main and not settings.content
+
+
+def test_cli_runs_a_sync_into_the_base_folder(tmp_path, monkeypatch):
+    site = FakeSite()
+    monkeypatch.setattr(DownloadCore, "session", lambda self: site)
+    status = cli.main(
+        [CREATOR + "/post/2", "--base-dir", str(tmp_path), "-q", "--jobs", "2"]
+    )
+    assert status == 0
+    downloads = tmp_path / "Kemono Downloader" / "Downloads" / "42_Artist"
+    assert (downloads / "2_Second" / "2_three.jpeg").exists()
+    assert (tmp_path / "Kemono Downloader" / "Other Files" / "file_hashes.db").exists()
+
+
+def test_command_line_never_imports_qt(tmp_path):
+    code = (
+        "import sys\n"
+        "from kemonodownloader.__main__ import main\n"
+        "sys.argv = ['kemonodownloader', '--help']\n"
+        "try:\n"
+        "    main()\n"
+        "except SystemExit as e:\n"
+        "    assert e.code == 0\n"
+        "print(sorted(m for m in sys.modules if m.startswith(('PyQt6', 'qtawesome'))))\n"
+    )
+    env = dict(os.environ, PYTHONPATH=SRC)
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        capture_output=True,
+        text=True,
+        env=env,
+        cwd=str(tmp_path),
+        timeout=120,
+    )
+    assert result.returncode == 0, result.stderr
+    assert "--fast" in result.stdout
+    assert result.stdout.strip().splitlines()[-1] == "[]"
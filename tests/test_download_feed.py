@@ -0,0 +1,361 @@
+import asyncio
+import os
+import threading
+import time
+
+from PyQt6.QtWidgets import QWidget
+
+import kemonodownloader.creator_downloader as cd
+from kemonodownloader.download_feed import DownloadFeed
+from kemonodownloader.prep_pool import PrepPool
+
+CREATOR = "https://kemono.cr/fanbox/user/42"
+
+
+class Concurrency:
+    def __init__(self, limit=1, max_limit=1):
+        self.limit = limit
+        self.max_limit = max_limit
+
+    def record_success(self, ttfb=None):
+        pass
+
+    def record_failure(self, throttled=False):
+        pass
+
+
+def test_posts_are_taken_whole_and_deduplicated():
+    feed = DownloadFeed(capacity=3)
+    assert feed.put("1", ["a", "b"]) == 2
+    assert feed.put("2", ["b", "c", "d"]) == 2  # "b" belongs to post 1
+    assert len(feed) == 4 and not feed.has_room()
+
+    # A post larger than the limit is still handed over whole.
+    assert feed.take(1) == [("1", ["a", "b"])]
+    assert feed.take(10) == [("2", ["c", "d"])]
+    assert feed.take(10) == [] and feed.total() == 4
+    assert not feed.exhausted()
+    feed.close()
+    assert feed.exhausted() and feed.put("3", ["e"]) == 0
+
+
+def test_wakeups_reach_both_sides():
+    feed = DownloadFeed(capacity=1)
+    calls = []
+    feed.set_consumer_wakeup(lambda: calls.append("data"))
+    feed.set_producer_wakeup(lambda: calls.append("space"))
+
+    feed.put("1", ["a"])
+    feed.take(5)
+    feed.close()
+    feed.close()
+
+    assert calls == ["data", "space", "data", "space"]
+    assert feed.has_room()
+
+
+def test_pool_holds_back_while_the_feed_is_full():
+    feed = DownloadFeed(capacity=2)
+    peak = [0]
+    received = []
+
+    def on_result(item, result):
+        feed.put(str(item), result)
+        peak[0] = max(peak[0], len(feed))
+
+    pool = PrepPool(
+        Concurrency(),
+        lambda item: [f"{item}-a", f"{item}-b"],
+        on_result,
+        has_room=feed.has_room,
+    )
+    feed.set_producer_wakeup(pool.wake)
+
+    def consume():
+        while not feed.exhausted():
+            received.extend(feed.take(1))
+            time.sleep(0.01)
+
+    consumer = threading.Thread(target=consume)
+    consumer.start()
+    pool.run(range(6))
+    feed.close()
+    consumer.join(5)
+
+    assert [post_id for post_id, _ in received] == [str(i) for i in range(6)]
+    assert peak[0] == 2
+
+
+def test_preparation_waits_for_room_until_files_are_taken():
+    thread = make_preparation(["1"])
+    thread.feed = DownloadFeed(capacity=1)
+    thread.feed.put("0", ["a"])
+    waited = []
+
+    def wait():
+        started = time.monotonic()
+        thread._wait_for_feed_room()
+        waited.append(time.monotonic() - started)
+
+    waiter = threading.Thread(target=wait)
+    waiter.start()
+    time.sleep(0.05)
+    thread.feed.take(1)
+    waiter.join(5)
+
+    # Woken by take() itself.
+    assert waited and waited[0] < 0.5
+    assert thread._feed_room is None
+
+    thread.feed.put("1", ["b"])
+    waiter = threading.Thread(target=thread._wait_for_feed_room)
+    waiter.start()
+    time.sleep(0.05)
+    thread.stop()
+    waiter.join(0.5)
+    assert not waiter.is_alive()
+
+
+def make_preparation(post_ids):
+    settings = cd.ThreadSettings(1, 1, 1, 1, 1, settings_tab=None)
+    all_files_map = {CREATOR: [(f"T{pid}", (pid, None)) for pid in post_ids]}
+    thread = cd.FilePreparationThread(
+        post_ids, all_files_map, {}, True, True, True, settings, max_concurrent=2
+    )
+    thread.fetch_and_detect_files = lambda pid, curl: (
+        pid,
+        [(f"{pid}.jpg", f"https://kemono.cr/data/{pid}.jpg?f={pid}.jpg")],
+    )
+    return thread
+
+
+def test_preparation_streams_posts_into_the_feed(qapp):
+    thread = make_preparation(["1", "2", "3"])
+    thread.feed = DownloadFeed()
+    finished = []
+    thread.finished.connect(lambda files, fmap: finished.append((files, fmap)))
+
+    thread.run()
+
+    assert finished == [([], {})]
+    assert thread.feed.exhausted() is False and thread.feed.closed
+    assert sorted(pid for pid, _ in thread.feed.take(10)) == ["1", "2", "3"]
+
+
+def test_preparation_closes_the_feed_without_work(qapp):
+    thread = make_preparation(["1"])
+    thread.all_files_map = {}
+    thread.feed = DownloadFeed()
+
+    thread.run()
+
+    assert thread.feed.exhausted()
+
+
+def make_download_thread(tmp_path, feed):
+    settings = cd.ThreadSettings(1, 1, 1, 1, 1, settings_tab=None)
+    thread = cd.CreatorDownloadThread(
+        "fanbox",
+        "42",
+        str(tmp_path),
+        ["1", "2"],
+        [],
+        {},
+        object(),
+        str(tmp_path),
+        {},
+        False,
+        settings,
+        2,
+    )
+    thread.feed = feed
+    thread.fetch_creator_and_post_info = lambda: setattr(
+        thread, "creator_name", "Creator"
+    )
+
+    async def fake_download_file(file_url, folder, file_index, total_files):
+        thread.completed_files.add(file_url)
+        thread.check_post_completion(file_url)
+
+    thread.download_file = fake_download_file
+    return thread
+
+
+def test_download_thread_downloads_files_while_they_are_prepared(qapp, tmp_path):
+    feed = DownloadFeed(capacity=2)
+    thread = make_download_thread(tmp_path, feed)
+    completed_posts = []
+    thread.post_completed.connect(completed_posts.append)
+
+    def prepare():
+        feed.put("1", ["https://kemono.cr/data/a.jpg", "https://kemono.cr/data/b.jpg"])
+        time.sleep(0.2)
+        feed.put("2", ["https://kemono.cr/data/c.jpg"])
+        feed.close()
+
+    producer = threading.Thread(target=prepare)
+    producer.start()
+    thread.run()
+    producer.join(5)
+
+    assert len(thread.completed_files) == 3
+    assert thread.post_files_map["1"] == [
+        "https://kemono.cr/data/a.jpg",
+        "https://kemono.cr/data/b.jpg",
+    ]
+    assert completed_posts == ["1", "2"]
+
+
+def test_feed_pump_waits_without_polling_until_woken(qapp, tmp_path):
+    feed = DownloadFeed()
+    thread = make_download_thread(tmp_path, feed)
+    thread._queue_streamed_posts = lambda queue, posts: thread.stop()
+    pumped = []
+
+    def pump():
+        asyncio.run(thread._pump_feed(asyncio.Queue(), 4))
+        pumped.append(True)
+
+    runner = threading.Thread(target=pump, daemon=True)
+    runner.start()
+    time.sleep(0.2)  # the open, empty feed leaves the pump waiting
+    assert not pumped
+
+    # Files arriving wake the pump; stop() ends it.
+    feed.put("1", ["https://kemono.cr/data/a.jpg"])
+    runner.join(5)
+    assert pumped and thread._feed_wakeup is None
+
+    thread = make_download_thread(tmp_path, DownloadFeed())
+    runner = threading.Thread(
+        target=lambda: asyncio.run(thread._pump_feed(asyncio.Queue(), 4)),
+        daemon=True,
+    )
+    runner.start()
+    time.sleep(0.2)
+    thread.stop()
+    runner.join(5)
+    assert not runner.is_alive()
+
+
+def test_stopped_download_thread_releases_the_feed(qapp, tmp_path, settings_tab):
+    feed = DownloadFeed(capacity=1)
+    thread = make_download_thread(tmp_path, feed)
+    thread.is_running = False
+
+    thread.run()
+
+    assert feed.closed and feed.has_room()
+
+
+class FakeSignal:
+    def __init__(self):
+        self.slots = []
+
+    def connect(self, slot, *args):
+        self.slots.append(slot)
+
+    def emit(self, *args):
+        for slot in self.slots:
+            slot(*args)
+
+
+class FakePreparation:
+    def __init__(self, *args, **kwargs):
+        self.feed = None
+        self.skipped_posts = {"3"}
+        for name in ("progress", "finished", "log", "error"):
+            setattr(self, name, FakeSignal())
+
+    def isRunning(self):
+        return False
+
+    def start(self):
+        pass
+
+    def deleteLater(self):
+        pass
+
+
+class FakeDownload(FakePreparation):
+    def __init__(self, *args, **kwargs):
+        super().__init__()
+        for name in (
+            "file_progress",
+            "transfer_progress",
+            "file_completed",
+            "post_completed",
+            "concurrency_changed",
+            "draining",
+        ):
+            setattr(self, name, FakeSignal())
+
+
+def make_tab(tmp_path, settings_tab, stream=True):
+    parent = QWidget()
+    parent.cache_folder = str(tmp_path / "cache")
+    parent.other_files_folder = str(tmp_path / "other")
+    parent.download_folder = str(tmp_path / "downloads")
+    for folder in (parent.cache_folder, parent.other_files_folder):
+        os.makedirs(folder, exist_ok=True)
+    settings_tab.settings.update(
+        creator_posts_max_attempts=1,
+        post_data_max_retries=1,
+        file_download_max_retries=1,
+        api_request_max_retries=1,
+        simultaneous_downloads=2,
+        creator_filename_template="{post_id}_{file_index}.{ext}",
+        creator_stream_prep=stream,
+    )
+    parent.settings_tab = settings_tab
+    tab = cd.CreatorDownloaderTab(parent)
+    tab._parent = parent
+    tab.current_creator_url = CREATOR
+    tab.all_files_map = {CREATOR: [("T1", ("1", None)), ("T2", ("2", None))]}
+    tab.posts_to_download = ["1", "2"]
+    return tab
+
+
+def test_tab_starts_download_with_preparation_and_waits_for_the_feed(
+    monkeypatch, tmp_path, settings_tab
+):
+    monkeypatch.setattr(cd, "FilePreparationThread", FakePreparation)
+    monkeypatch.setattr(cd, "CreatorDownloadThread", FakeDownload)
+    tab = make_tab(tmp_path, settings_tab)
+    finished = []
+    tab.creator_download_finished = lambda: finished.append(True)
+
+    tab.prepare_files_for_download([CREATOR])
+
+    prep = tab.file_preparation_thread
+    download = tab.active_threads[-1]
+    assert isinstance(download, FakeDownload)
+    assert download.feed is prep.feed is tab._creator_feed
+    assert download.domain_config["api_base"].startswith("https://kemono.cr")
+
+    # Every streamed file done so far is not the end of the creator.
+    prep.feed.put("1", ["https://kemono.cr/data/a.jpg"])
+    tab.update_file_completion(0, "https://kemono.cr/data/a.jpg", True)
+    assert finished == []
+
+    prep.feed.close()
+    prep.finished.emit([], {})
+    assert tab.total_files_to_download == 1
+    assert "3" in tab.completed_posts
+    assert tab.file_preparation_thread is None
+
+
+def test_tab_keeps_batch_preparation_when_total_files_is_templated(
+    monkeypatch, tmp_path, settings_tab
+):
+    monkeypatch.setattr(cd, "FilePreparationThread", FakePreparation)
+    monkeypatch.setattr(cd, "CreatorDownloadThread", FakeDownload)
+    tab = make_tab(tmp_path, settings_tab)
+    tab._parent.settings_tab.get_creator_filename_template = (
+        lambda: "{file_index}_of_{total_files}.{ext}"
+    )
+
+    tab.prepare_files_for_download([CREATOR])
+
+    assert tab.file_preparation_thread.feed is None
+    assert tab.active_threads == [tab.file_preparation_thread]
@@ -0,0 +1,172 @@
+import asyncio
+import os
+import threading
+import time
+from types import SimpleNamespace
+
+from PyQt6.QtWidgets import QWidget
+
+import kemonodownloader.creator_downloader as cd
+from kemonodownloader.download_scheduler import DownloadScheduler
+from kemonodownloader.fast_pipeline import FastModePipeline, PreparedCreator
+
+
+def test_global_limit_is_shared_by_every_owner():
+    scheduler = DownloadScheduler(global_limit=3)
+    assert scheduler.try_acquire("a") and scheduler.try_acquire("a")
+    assert scheduler.try_acquire("b")
+    assert not scheduler.try_acquire("c")
+
+    scheduler.release("a")
+    assert scheduler.try_acquire("c")
+    assert scheduler.active() == 3 and scheduler.active("a") == 1
+
+
+def test_owner_limit_and_overrides():
+    scheduler = DownloadScheduler(global_limit=10, owner_limit=2)
+    assert scheduler.try_acquire("a") and scheduler.try_acquire("a")
+    assert not scheduler.try_acquire("a")
+    scheduler.set_owner_limit("a", 3)
+    assert scheduler.try_acquire("a")
+    scheduler.set_owner_limit("a", None)
+    scheduler.release("a")
+    assert not scheduler.try_acquire("a")
+
+
+def test_waiters_are_served_in_order_unless_their_owner_is_full():
+    scheduler = DownloadScheduler(global_limit=2, owner_limit=1)
+    assert scheduler.try_acquire("a") and scheduler.try_acquire("b")
+    order = []
+
+    def wait(owner):
+        assert scheduler.acquire(owner)
+        order.append(owner)
+
+    # "a" waits first but is at its cap; "c" must not queue behind it.
+    first = threading.Thread(target=wait, args=("a",))
+    first.start()
+    while not scheduler.waiting():
+        time.sleep(0.01)
+    scheduler.release("b")
+    second = threading.Thread(target=wait, args=("c",))
+    second.start()
+    second.join(5)
+    assert order == ["c"]
+
+    scheduler.release("a")
+    first.join(5)
+    assert order == ["c", "a"] and scheduler.waiting() == 0
+
+
+def test_acquire_gives_up_when_stopped():
+    scheduler = DownloadScheduler(global_limit=1)
+    assert scheduler.try_acquire("a")
+    stop_at = time.monotonic() + 0.2
+
+    def running():
+        return time.monotonic() < stop_at
+
+    assert not asyncio.run(scheduler.acquire_async("b", running))
+    assert not scheduler.acquire("b", lambda: False)
+    assert scheduler.waiting() == 0 and scheduler.active() == 1
+
+
+def make_parent(tmp_path, settings_tab):
+    parent = QWidget()
+    parent.cache_folder = str(tmp_path / "cache")
+    parent.other_files_folder = str(tmp_path / "other")
+    parent.download_folder = str(tmp_path / "downloads")
+    for folder in (parent.cache_folder, parent.other_files_folder):
+        os.makedirs(folder, exist_ok=True)
+    parent.settings_tab = settings_tab
+
+    class Tabs:
+        def count(self):
+            return 1
+
+        def currentIndex(self):
+            return 0
+
+        def setTabEnabled(self, i, v):
+            pass
+
+    parent.tabs = Tabs()
+    parent.status_label = SimpleNamespace(setText=lambda s: None)
+    parent.animate_button = lambda b, v: None
+    parent.append_log_to_console = lambda *a, **k: None
+    return parent
+
+
+def make_thread(tmp_path):
+    return cd.CreatorDownloadThread(
+        "fanbox",
+        "0",
+        str(tmp_path / "downloads"),
+        [],
+        [],
+        {},
+        None,
+        str(tmp_path / "other"),
+        {},
+        False,
+        cd.ThreadSettings(1, 1, 1, 1, 1),
+        1,
+    )
+
+
+def make_tab(tmp_path, settings_tab, pending, ready):
+    tab = cd.CreatorDownloaderTab(make_parent(tmp_path, settings_tab))
+    tab._fast_mode_pipeline = FastModePipeline(1)
+    tab._fast_mode_pipeline.to_prepare(pending)
+    if ready:
+        tab._fast_mode_pipeline.prepared(
+            pending[0], PreparedCreator(pending[0], [], {}, [], {}, set())
+        )
+    tab._fast_mode_downloading = True
+    tab._fast_mode_pending_urls = list(pending)
+    tab.current_creator_url = "https://kemono.cr/fanbox/user/0"
+    tab.total_files_to_download = 5
+    tab.completed_files = {"x"}
+    tab.completed_posts = {"1"}
+    calls = []
+    tab._fast_mode_remove_creator_url = lambda url: calls.append(("remove", url))
+    tab._fast_mode_process_next = lambda: calls.append(("next",))
+    return tab, calls
+
+
+def test_next_creator_starts_while_the_current_one_drains(qapp, tmp_path, settings_tab):
+    tab, calls = make_tab(
+        tmp_path, settings_tab, ["https://kemono.cr/fanbox/user/1"], ready=True
+    )
+    thread = make_thread(tmp_path)
+    progress = []
+    thread.file_progress.connect(lambda *a: progress.append(a))
+    tab.active_threads.append(thread)
+
+    tab.on_creator_download_draining(thread)
+
+    assert tab.active_threads == [] and tab._fast_mode_tail_threads == [thread]
+    assert tab.total_files_to_download == 0
+    thread.file_progress.emit(0, 50)
+    assert progress == []  # the tab no longer follows the draining thread
+    assert calls == [("remove", "https://kemono.cr/fanbox/user/0"), ("next",)]
+
+    # The batch waits for the tail when the queue ran out meanwhile.
+    tab._fast_mode_finish_pending = True
+    thread.finished.emit()
+    assert tab._fast_mode_tail_threads == [] and calls[-1] == ("next",)
+    assert len(calls) == 3
+
+
+def test_draining_waits_until_the_next_creator_is_prepared(
+    qapp, tmp_path, settings_tab
+):
+    tab, calls = make_tab(
+        tmp_path, settings_tab, ["https://kemono.cr/fanbox/user/1"], ready=False
+    )
+    thread = make_thread(tmp_path)
+    tab.active_threads.append(thread)
+
+    tab.on_creator_download_draining(thread)
+
+    assert tab.active_threads == [thread] and calls == []
@@ -1768,7 +1768,7 @@ class TestPostDownloaderTab:
         mock_db.lookup.return_value = None
         mock_db.is_file_downloaded.return_value = False
         monkeypatch.setattr(
-            "kemonodownloader.post_downloader.HashDB", lambda *a: mock_db
+            "kemonodownloader.post_downloader.HashDB", lambda *a, **k: mock_db
         )
         monkeypatch.setattr(
             "kemonodownloader.post_downloader.get_domain_config",
@@ -1983,9 +1983,6 @@ class TestPostDownloaderTab:
             thread, "fetch_post_data", lambda pid: ("1", detected_files)
         )
 
-        # Mock Thread.start to run synchronously
-        monkeypatch.setattr(threading.Thread, "start", lambda s: s.run())
-
         monkeypatch.setattr(
             "kemonodownloader.post_downloader.translate", lambda k, *a: k
         )
@@ -4117,6 +4114,7 @@ class TestCreatorDownloaderTab:
         monkeypatch.setattr(
             "kemonodownloader.creator_downloader.CreatorDownloadThread", MagicMock()
         )
+        creator_tab.file_preparation_thread = MagicMock(skipped_posts=set())
         creator_tab.on_file_preparation_finished(urls, files, f2p)
         assert creator_tab.total_files_to_download == 1
 
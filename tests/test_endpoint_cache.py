@@ -0,0 +1,178 @@
+import json
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+
+import kemonodownloader.creator_downloader as cd
+import kemonodownloader.kd_thumbnaildl as kt
+from kemonodownloader.domain_config import get_domain_config
+from kemonodownloader.endpoint_cache import (
+    ALL_FORMS,
+    FORM_LEGACY,
+    FORM_NO_V1,
+    FORM_OFFSET_LIMIT,
+    FORM_POSTS,
+    EndpointCache,
+    build_page_url,
+    get_endpoint_cache,
+    ordered_forms,
+)
+
+CFG = get_domain_config("https://kemono.cr/fanbox/user/1")
+
+
+class Resp:
+    def __init__(self, status_code=200, payload=None):
+        self.status_code = status_code
+        text = json.dumps(payload if payload is not None else [])
+        self.content = text.encode("utf-8")
+        self.text = text
+
+    def json(self):
+        return json.loads(self.text)
+
+
+class LegacyOnlySession:
+    """Serves the listing only under the legacy ``/user/{id}?o=`` form."""
+
+    def __init__(self, pages):
+        self.pages = pages
+        self.urls = []
+
+    def get(self, url, **kwargs):
+        self.urls.append(url)
+        if "/posts" in url or "?o=" not in url or "/api/v1/" not in url:
+            return Resp(404)
+        offset = int(url.split("?o=")[1].split("&")[0])
+        return Resp(200, self.pages.get(offset, []))
+
+
+def make_posts(start, count):
+    return [{"id": str(i), "title": f"Post {i}"} for i in range(start, start + count)]
+
+
+def run_detection(url):
+    settings = cd.ThreadSettings(5, 1, 1, 1, 1)
+    thread = cd.PostDetectionThread(url, {}, settings)
+    for name in ("log", "posts_batch", "finished", "error"):
+        setattr(thread, name, SimpleNamespace(emit=MagicMock()))
+    thread.run()
+    return thread
+
+
+class TestBuildPageUrl:
+    def test_forms(self):
+        api = "https://kemono.cr/api/v1/fanbox/user/7"
+        assert build_page_url(FORM_POSTS, CFG, "fanbox", "7", 50) == (
+            f"{api}/posts?o=50"
+        )
+        assert build_page_url(FORM_LEGACY, CFG, "fanbox", "7", 0) == f"{api}?o=0"
+        assert build_page_url(FORM_NO_V1, CFG, "fanbox", "7", 0) == (
+            "https://kemono.cr/api/fanbox/user/7?o=0"
+        )
+        assert build_page_url(FORM_OFFSET_LIMIT, CFG, "fanbox", "7", 100) == (
+            f"{api}?offset=100&limit=50"
+        )
+
+    def test_search_query(self):
+        url = build_page_url(FORM_POSTS, CFG, "fanbox", "7", 0, search_query="cat")
+        assert url.endswith("/posts?o=0&q=cat")
+
+    def test_unknown_form(self):
+        with pytest.raises(ValueError):
+            build_page_url("bogus", CFG, "fanbox", "7", 0)
+
+
+def test_ordered_forms_moves_preferred_first():
+    assert ordered_forms(None) == list(ALL_FORMS)
+    assert ordered_forms("bogus") == list(ALL_FORMS)
+    assert ordered_forms(FORM_NO_V1)[0] == FORM_NO_V1
+    assert sorted(ordered_forms(FORM_NO_V1)) == sorted(ALL_FORMS)
+
+
+def test_cache_persists_to_disk(tmp_path):
+    path = str(tmp_path / "cache" / "endpoints.json")
+    cache = EndpointCache(path)
+    cache.remember("kemono.cr", "fanbox", FORM_LEGACY)
+
+    reloaded = EndpointCache(path)
+    assert reloaded.get("kemono.cr", "fanbox") == FORM_LEGACY
+    reloaded.forget("kemono.cr", "fanbox")
+    assert EndpointCache(path).get("kemono.cr", "fanbox") is None
+
+
+def test_cache_ignores_corrupt_file(tmp_path):
+    path = tmp_path / "endpoints.json"
+    path.write_text("{not json", encoding="utf-8")
+    assert EndpointCache(str(path)).get("kemono.cr", "fanbox") is None
+    path.write_text(json.dumps({"kemono.cr|fanbox": "bogus"}), encoding="utf-8")
+    assert EndpointCache(str(path)).get("kemono.cr", "fanbox") is None
+
+
+def test_detection_goes_straight_to_cached_form(monkeypatch):
+    session = LegacyOnlySession({0: make_posts(0, 50), 50: make_posts(50, 3)})
+    monkeypatch.setattr(cd, "get_session", lambda settings_tab=None: session)
+
+    run_detection("https://kemono.cr/fanbox/user/1")
+
+    # Page 0 probes /posts first, then every later page uses the legacy form.
+    listing_urls = [u for u in session.urls if "/profile" not in u]
+    assert listing_urls == [
+        "https://kemono.cr/api/v1/fanbox/user/1/posts?o=0",
+        "https://kemono.cr/api/v1/fanbox/user/1?o=0",
+        "https://kemono.cr/api/v1/fanbox/user/1?o=50",
+    ]
+    assert get_endpoint_cache().get("kemono.cr", "fanbox") == FORM_LEGACY
+
+    # Another creator on the same domain/service skips the probe entirely.
+    session.urls.clear()
+    run_detection("https://kemono.cr/fanbox/user/2")
+    assert session.urls[0] == "https://kemono.cr/api/v1/fanbox/user/2?o=0"
+
+
+def test_detection_reprobes_after_cached_form_fails(monkeypatch):
+    get_endpoint_cache().remember("kemono.cr", "fanbox", FORM_NO_V1)
+    session = LegacyOnlySession({0: make_posts(0, 3)})
+    monkeypatch.setattr(cd, "get_session", lambda settings_tab=None: session)
+
+    thread = run_detection("https://kemono.cr/fanbox/user/1")
+
+    assert session.urls[0] == "https://kemono.cr/api/fanbox/user/1?o=0"
+    assert get_endpoint_cache().get("kemono.cr", "fanbox") == FORM_LEGACY
+    thread.finished.emit.assert_called_once()
+    assert len(thread.finished.emit.call_args[0][0]) == 3
+
+
+def test_thumbnail_detection_uses_cached_form(monkeypatch):
+    session = LegacyOnlySession({0: make_posts(0, 2)})
+    monkeypatch.setattr(kt, "get_session", lambda settings_tab=None: session)
+    get_endpoint_cache().remember("kemono.cr", "fanbox", FORM_LEGACY)
+
+    thread = kt.ThumbnailDetectionThread(
+        ["https://kemono.cr/fanbox/user/1"], mode="creator"
+    )
+    thread.run()
+
+    listing_urls = [u for u in session.urls if "/profile" not in u]
+    assert listing_urls == ["https://kemono.cr/api/v1/fanbox/user/1?o=0"]
+
+
+def test_thumbnail_detection_reprobes_stale_entry(monkeypatch):
+    session = LegacyOnlySession({0: make_posts(0, 2)})
+    monkeypatch.setattr(kt, "get_session", lambda settings_tab=None: session)
+    get_endpoint_cache().remember("kemono.cr", "fanbox", FORM_POSTS)
+
+    thread = kt.ThumbnailDetectionThread(
+        ["https://kemono.cr/fanbox/user/1"], mode="creator"
+    )
+    thread.run()
+
+    listing_urls = [u for u in session.urls if "/profile" not in u]
+    assert listing_urls == [
+        "https://kemono.cr/api/v1/fanbox/user/1/posts?o=0",
+        "https://kemono.cr/api/v1/fanbox/user/1/posts?o=0",
+        "https://kemono.cr/api/v1/fanbox/user/1?o=0",
+        "https://kemono.cr/api/v1/fanbox/user/1?o=0",
+    ]
+    assert get_endpoint_cache().get("kemono.cr", "fanbox") == FORM_LEGACY
@@ -0,0 +1,188 @@
+from types import SimpleNamespace
+
+import kemonodownloader.creator_downloader as cd
+from kemonodownloader.fast_pipeline import (
+    NOT_STARTED,
+    PREPARING,
+    READY,
+    FastModePipeline,
+    PreparedCreator,
+)
+
+URLS = [f"https://kemono.cr/fanbox/user/{i}" for i in range(5)]
+
+
+def prepared(url, posts=("1",)):
+    detected = [(f"Post {pid}", (pid, None)) for pid in posts]
+    files = [f"https://kemono.cr/data/{pid}.jpg" for pid in posts]
+    return PreparedCreator(url, detected, {}, files, dict(zip(files, posts)), set())
+
+
+class TestFastModePipeline:
+    def test_buffer_holds_at_most_lookahead_creators(self):
+        pipeline = FastModePipeline(2)
+        assert pipeline.to_prepare(URLS) == URLS[:2]
+        assert pipeline.to_prepare(URLS) == []
+
+        pipeline.prepared(URLS[0], prepared(URLS[0]))
+        # A ready result still takes a place in the buffer.
+        assert pipeline.to_prepare(URLS) == []
+        assert pipeline.take(URLS[0])[0] == READY
+        assert pipeline.to_prepare(URLS[1:]) == [URLS[2]]
+        assert pipeline.buffered() == {URLS[1]: False, URLS[2]: False}
+
+    def test_take_states(self):
+        pipeline = FastModePipeline(1)
+        pipeline.to_prepare(URLS)
+        assert pipeline.take(URLS[0]) == (PREPARING, None)
+        assert pipeline.take(URLS[1]) == (NOT_STARTED, None)
+        pipeline.prepared(URLS[0], None)
+        assert pipeline.take(URLS[0]) == (READY, None)
+        assert pipeline.take(URLS[0]) == (NOT_STARTED, None)
+
+    def test_zero_lookahead_and_cleared_results(self):
+        assert FastModePipeline(0).to_prepare(URLS) == []
+        pipeline = FastModePipeline(1)
+        pipeline.to_prepare(URLS)
+        pipeline.clear()
+        pipeline.prepared(URLS[0], prepared(URLS[0]))
+        assert pipeline.buffered() == {}
+
+    def test_results_of_removed_creators_are_dropped(self):
+        pipeline = FastModePipeline(1)
+        pipeline.to_prepare(URLS)
+        pipeline.prepared(URLS[0], prepared(URLS[0]))
+        assert pipeline.to_prepare(URLS[1:]) == [URLS[1]]
+
+
+class FakeSignal:
+    def __init__(self):
+        self.slots = []
+
+    def connect(self, slot, *args):
+        self.slots.append(slot)
+
+    def emit(self, *args):
+        for slot in self.slots:
+            slot(*args)
+
+
+class FakeDetection:
+    def __init__(self, url, post_titles_map, settings):
+        self.finished = FakeSignal()
+        self.error = FakeSignal()
+        self.log = FakeSignal()
+        self.sync_update = None
+        self.post_records = {
+            str(i): {
+                "id": str(i),
+                "file": {"name": f"{i}.jpg", "path": f"/aa/{i}.jpg"},
+                "attachments": [],
+                "content": "",
+            }
+            for i in range(3)
+        }
+
+    def stop(self):
+        pass
+
+    def run(self):
+        self.finished.emit([(f"Post {pid}", (pid, None)) for pid in self.post_records])
+
+
+class Checked:
+    def isChecked(self):
+        return True
+
+
+def test_prefetch_thread_detects_and_prepares_without_the_tab(monkeypatch):
+    monkeypatch.setattr(cd, "PostDetectionThread", FakeDetection)
+    settings = cd.ThreadSettings(1, 1, 1, 1, 5)
+    thread = cd.CreatorPrefetchThread(
+        URLS[0], {}, {".jpg": Checked()}, True, True, True, settings
+    )
+
+    result = thread.prepare()
+
+    assert [pid for _, (pid, _) in result.detected_posts] == ["0", "1", "2"]
+    assert len(result.files_to_download) == 3
+    assert sorted(result.files_to_posts_map.values()) == ["0", "1", "2"]
+
+
+def test_prefetch_thread_reports_detection_errors(monkeypatch):
+    class FailingDetection(FakeDetection):
+        def run(self):
+            self.error.emit("boom")
+
+    monkeypatch.setattr(cd, "PostDetectionThread", FailingDetection)
+    settings = cd.ThreadSettings(1, 1, 1, 1, 5)
+    thread = cd.CreatorPrefetchThread(URLS[0], {}, {}, True, True, True, settings)
+    assert thread.prepare() is None
+
+
+def test_prefetch_thread_opens_the_completion_db_at_the_library(monkeypatch):
+    monkeypatch.setattr(cd, "PostDetectionThread", FakeDetection)
+    opened = []
+    monkeypatch.setattr(
+        cd, "open_completion_db", lambda *args: opened.append(args) or None
+    )
+    settings = cd.ThreadSettings(1, 1, 1, 1, 5, skip_completed=True)
+    thread = cd.CreatorPrefetchThread(
+        URLS[0],
+        {},
+        {".jpg": Checked()},
+        True,
+        True,
+        True,
+        settings,
+        other_files_dir="/hashes",
+        download_folder="/library",
+    )
+
+    assert len(thread.prepare().files_to_download) == 3
+    assert opened == [("/hashes", "/library")]
+
+
+def make_tab(pending, lookahead=1):
+    calls = []
+    tab = SimpleNamespace(
+        _fast_mode_pending_urls=list(pending),
+        _fast_mode_pipeline=FastModePipeline(lookahead),
+        _fast_mode_waiting_url=None,
+        _fast_mode_downloading=True,
+        append_log_to_console=lambda *a: None,
+        check_creator_from_queue=lambda url: calls.append(("check", url)),
+        _fast_mode_start_prepared=lambda p: calls.append(("start", p.url)),
+    )
+    tab._fast_mode_prefetch = lambda: calls.extend(
+        ("prefetch", url)
+        for url in tab._fast_mode_pipeline.to_prepare(tab._fast_mode_pending_urls)
+    )
+    return tab, calls
+
+
+def test_next_creator_is_prepared_while_the_current_one_runs():
+    tab, calls = make_tab(URLS[:3])
+
+    cd.CreatorDownloaderTab._fast_mode_process_next(tab)
+    assert calls == [("prefetch", URLS[1]), ("check", URLS[0])]
+
+    # The current creator finishes before its successor is prepared.
+    calls.clear()
+    cd.CreatorDownloaderTab._fast_mode_process_next(tab)
+    assert calls == [] and tab._fast_mode_waiting_url == URLS[1]
+
+    cd.CreatorDownloaderTab.on_creator_prefetched(tab, URLS[1], prepared(URLS[1]))
+    assert calls == [("prefetch", URLS[2]), ("start", URLS[1])]
+    assert tab._fast_mode_waiting_url is None
+
+
+def test_prepared_creator_starts_immediately_and_failures_fall_back():
+    tab, calls = make_tab(URLS[:3])
+    cd.CreatorDownloaderTab._fast_mode_process_next(tab)
+    cd.CreatorDownloaderTab.on_creator_prefetched(tab, URLS[1], None)
+    calls.clear()
+
+    cd.CreatorDownloaderTab._fast_mode_process_next(tab)
+
+    assert calls == [("prefetch", URLS[2]), ("check", URLS[1])]
@@ -8,7 +8,7 @@ def test_file_preparation_thread_run(monkeypatch, qapp):
     creator_url = "https://kemono.cr/user/creator"
     all_files_map = {creator_url: [("T1", ("p1", None)), ("T2", ("p2", None))]}
 
-    settings = type("S", (), {"post_data_max_retries": 1, "settings_tab": None})()
+    settings = cd.ThreadSettings(1, 1, 1, 1, 1, settings_tab=None)
 
     thread = cd.FilePreparationThread(
         ["p1", "p2"], all_files_map, {}, True, True, True, settings, max_concurrent=2
@@ -33,18 +33,15 @@ def test_file_preparation_thread_run(monkeypatch, qapp):
     assert all(v in fmap.values() for v in fmap.values() or [True])
 
 
-def test_creator_download_thread_run_simulated(monkeypatch, qapp, tmp_path):
+def test_creator_download_thread_run_simulated(
+    monkeypatch, qapp, tmp_path, settings_tab
+):
     # Simulate a CreatorDownloadThread run where download_file is fast and marks files complete
     download_folder = str(tmp_path)
     files = ["https://kemono.cr/1/a.jpg", "https://kemono.cr/1/b.jpg"]
     files_map = {files[0]: "1", files[1]: "1"}
 
-    class SettingsTab:
-        pass
-
-    class Settings:
-        settings_tab = SettingsTab()
-        file_download_max_retries = 1
+    settings = cd.ThreadSettings(1, 1, 1, 1, 1, settings_tab=settings_tab)
 
     thread = cd.CreatorDownloadThread(
         "svc",
@@ -57,7 +54,7 @@ def test_creator_download_thread_run_simulated(monkeypatch, qapp, tmp_path):
         download_folder,
         {("svc", "creator", "1"): "Title"},
         True,
-        Settings(),
+        settings,
         2,
     )
 
@@ -3,8 +3,11 @@
 import hashlib
 import json
 import os
+import threading
+import time
 
-from kemonodownloader.hash_db import HashDB
+from kemonodownloader import hash_db
+from kemonodownloader.hash_db import HashDB, file_unchanged
 
 
 class TestHashDBInit:
@@ -321,6 +324,393 @@ class TestHashDBSchemaMigration:
         db.store("new_key", "/new.jpg", "newhash", "https://new.url", 999)
         entry2 = db.lookup("new_key")
         assert entry2["file_size"] == 999
+        # Columns added later are migrated too and default to 0
+        assert entry["file_mtime"] == 0
+        assert entry["file_inode"] == 0
+
+
+class TestStatBasedSkipCheck:
+    """Test the stat-based unchanged-file check used on the skip path."""
+
+    def make_entry(self, isolated_hash_dir, tmp_path, content=b"x" * 1000):
+        db = HashDB(isolated_hash_dir)
+        test_file = tmp_path / "file.bin"
+        test_file.write_bytes(content)
+        db.store(
+            "k1",
+            str(test_file),
+            hashlib.md5(content).hexdigest(),
+            "http://example.com/file.bin",
+            len(content),
+        )
+        return db, test_file
+
+    def test_store_records_stat_of_written_file(self, isolated_hash_dir, tmp_path):
+        db, test_file = self.make_entry(isolated_hash_dir, tmp_path)
+        st = os.stat(test_file)
+        entry = db.lookup("k1")
+        assert entry["file_mtime"] == st.st_mtime
+        assert entry["file_inode"] == st.st_ino
+
+    def test_unchanged_file_is_not_read(self, isolated_hash_dir, tmp_path, monkeypatch):
+        db, _ = self.make_entry(isolated_hash_dir, tmp_path)
+
+        def fail(path):
+            raise AssertionError("content should not be hashed")
+
+        monkeypatch.setattr(hash_db, "md5_file", fail)
+        assert file_unchanged(db, "k1", db.lookup("k1"))
+
+    def test_touched_file_is_rehashed_and_restamped(self, isolated_hash_dir, tmp_path):
+        db, test_file = self.make_entry(isolated_hash_dir, tmp_path)
+        os.utime(test_file, (1_000_000, 1_000_000))
+
+        assert file_unchanged(db, "k1", db.lookup("k1"))
+        assert db.lookup("k1")["file_mtime"] == 1_000_000
+
+    def test_modified_file_is_detected(self, isolated_hash_dir, tmp_path):
+        db, test_file = self.make_entry(isolated_hash_dir, tmp_path)
+        test_file.write_bytes(b"y" * 1000)
+        os.utime(test_file, (1_000_000, 1_000_000))
+
+        assert not file_unchanged(db, "k1", db.lookup("k1"))
+
+    def test_entry_without_stat_data_falls_back_to_hash(
+        self, isolated_hash_dir, tmp_path
+    ):
+        db = HashDB(isolated_hash_dir)
+        test_file = tmp_path / "file.bin"
+        test_file.write_bytes(b"abc")
+        db.store("k1", str(test_file), "wrong", "u", 3, file_mtime=0, file_inode=0)
+        assert not file_unchanged(db, "k1", db.lookup("k1"))
+
+        db.store(
+            "k1",
+            str(test_file),
+            hashlib.md5(b"abc").hexdigest(),
+            "u",
+            3,
+            file_mtime=0,
+            file_inode=0,
+        )
+        assert file_unchanged(db, "k1", db.lookup("k1"))
+        assert db.lookup("k1")["file_mtime"] == os.stat(test_file).st_mtime
+
+    def test_missing_file_is_not_unchanged(self, isolated_hash_dir, tmp_path):
+        db, test_file = self.make_entry(isolated_hash_dir, tmp_path)
+        test_file.unlink()
+        assert not file_unchanged(db, "k1", db.lookup("k1"))
+
+
+SHA = "a" * 64
+
+
+class TestContentIndex:
+    """Entries are findable by the SHA-256 embedded in their data URL."""
+
+    def test_store_records_content_hash_from_url(self, isolated_hash_dir):
+        db = HashDB(isolated_hash_dir)
+        url = f"https://kemono.cr/data/aa/aa/{SHA}.jpg?f=one.jpg"
+        db.store("k1", "/one.jpg", "h1", url)
+        db.store("k2", "/two.jpg", "h1", f"https://kemono.cr/data/aa/aa/{SHA}.jpg")
+        db.store("k3", "/other.jpg", "h3", "https://example.com/other.jpg")
+
+        assert db.lookup("k1")["content_sha256"] == SHA
+        assert db.lookup("k3")["content_sha256"] == ""
+        entries = db.content_entries(SHA)
+        assert sorted(e["url_hash"] for e in entries) == ["k1", "k2"]
+        assert db.content_entries("") == []
+
+    def test_existing_rows_are_backfilled(self, isolated_hash_dir):
+        import sqlite3
+
+        os.makedirs(isolated_hash_dir, exist_ok=True)
+        conn = sqlite3.connect(os.path.join(isolated_hash_dir, "file_hashes.db"))
+        conn.execute(
+            "CREATE TABLE file_hashes (url_hash TEXT PRIMARY KEY, "
+            "file_path TEXT NOT NULL, file_hash TEXT NOT NULL, url TEXT NOT NULL)"
+        )
+        conn.executemany(
+            "INSERT INTO file_hashes VALUES (?, ?, ?, ?)",
+            [
+                ("k1", "/a.jpg", "h", f"https://kemono.cr/data/aa/aa/{SHA}.jpg"),
+                ("k2", "/b.jpg", "h", "https://example.com/b.jpg"),
+            ],
+        )
+        conn.commit()
+        conn.close()
+
+        db = HashDB(isolated_hash_dir)
+        db.migrate_rows()
+        assert [e["url_hash"] for e in db.content_entries(SHA)] == ["k1"]
+        assert db.lookup("k2")["content_sha256"] == ""
+
+
+def committed_count(directory):
+    import sqlite3
+
+    conn = sqlite3.connect(os.path.join(directory, HashDB.DB_FILENAME))
+    try:
+        return conn.execute("SELECT COUNT(*) FROM file_hashes").fetchone()[0]
+    finally:
+        conn.close()
+
+
+class TestWriteBehind:
+    """Stores are queued and committed in batches."""
+
+    def test_queued_store_is_visible_before_commit(self, isolated_hash_dir):
+        db = HashDB(isolated_hash_dir, flush_interval=60)
+        db.store("k1", "/a.jpg", "h1", "u1", 10)
+
+        assert db.pending() == 1
+        assert committed_count(isolated_hash_dir) == 0
+        assert db.lookup("k1")["file_hash"] == "h1"
+
+        assert db.flush() == 1
+        assert db.pending() == 0
+        assert committed_count(isolated_hash_dir) == 1
+
+    def test_full_batch_is_committed_by_the_storing_thread(self, isolated_hash_dir):
+        db = HashDB(isolated_hash_dir, batch_size=3, flush_interval=60)
+        for i in range(3):
+            db.store(f"k{i}", f"/{i}.jpg", "h", "u")
+
+        assert db.pending() == 0
+        assert committed_count(isolated_hash_dir) == 3
+
+    def test_background_flusher_commits_after_interval(self, isolated_hash_dir):
+        db = HashDB(isolated_hash_dir, flush_interval=0.01)
+        db.store("k1", "/a.jpg", "h1", "u1")
+
+        deadline = time.monotonic() + 5
+        while db.pending() and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert committed_count(isolated_hash_dir) == 1
+
+    def test_delete_drops_a_queued_store(self, isolated_hash_dir):
+        db = HashDB(isolated_hash_dir, flush_interval=60)
+        db.store("k1", "/a.jpg", "h1", "u1")
+        db.delete("k1")
+
+        assert db.lookup("k1") is None
+        assert db.flush() == 0
+
+    def test_close_commits_and_database_stays_usable(self, isolated_hash_dir):
+        db = HashDB(isolated_hash_dir, flush_interval=60)
+        db.store("k1", "/a.jpg", "h1", "u1")
+        db.close()
+
+        assert committed_count(isolated_hash_dir) == 1
+        assert db.lookup("k1")["file_path"] == "/a.jpg"
+
+
+class TestConnections:
+    """Each thread keeps one read connection."""
+
+    def test_thread_reuses_its_connection(self, isolated_hash_dir):
+        db = HashDB(isolated_hash_dir)
+        assert db._get_connection() is db._get_connection()
+
+        other = []
+        t = threading.Thread(target=lambda: other.append(db._get_connection()))
+        t.start()
+        t.join()
+        assert other[0] is not db._get_connection()
+
+    def test_connections_of_finished_threads_are_closed(self, isolated_hash_dir):
+        db = HashDB(isolated_hash_dir)
+        for _ in range(5):
+            t = threading.Thread(target=lambda: db.lookup("k"))
+            t.start()
+            t.join()
+        db.lookup("k")
+
+        assert len(db._readers) == 1
+
+
+class TestLookupMany:
+    """Bulk lookups return only recorded hashes."""
+
+    def test_returns_committed_and_queued_entries(self, isolated_hash_dir):
+        db = HashDB(isolated_hash_dir, flush_interval=60)
+        db.store("a", "/a.jpg", "ha", "ua", 1)
+        db.flush()
+        db.store("b", "/b.jpg", "hb", "ub", 2)
+
+        found = db.lookup_many(["a", "b", "missing", "a"])
+
+        assert set(found) == {"a", "b"}
+        assert found["a"]["file_size"] == 1
+        assert found["b"]["file_hash"] == "hb"
+
+    def test_more_hashes_than_one_query_allows(self, isolated_hash_dir, monkeypatch):
+        monkeypatch.setattr(hash_db, "LOOKUP_CHUNK_SIZE", 7)
+        db = HashDB(isolated_hash_dir)
+        for i in range(20):
+            db.store(f"k{i}", f"/{i}.jpg", "h", "u")
+        db.flush()
+
+        found = db.lookup_many(f"k{i}" for i in range(0, 40, 2))
+        assert sorted(found) == sorted(f"k{i}" for i in range(0, 20, 2))
+
+
+def stored_path(directory, url_hash):
+    import sqlite3
+
+    conn = sqlite3.connect(os.path.join(directory, HashDB.DB_FILENAME))
+    try:
+        return conn.execute(
+            "SELECT file_path FROM file_hashes WHERE url_hash = ?", (url_hash,)
+        ).fetchone()[0]
+    finally:
+        conn.close()
+
+
+class TestSchemaV2:
+    """Versioned schema with origin columns and library-relative paths."""
+
+    def test_new_database_is_indexed_and_versioned(self, isolated_hash_dir):
+        import sqlite3
+
+        HashDB(isolated_hash_dir)
+        conn = sqlite3.connect(os.path.join(isolated_hash_dir, HashDB.DB_FILENAME))
+        version = conn.execute("PRAGMA user_version").fetchone()[0]
+        indexes = {row[1] for row in conn.execute("PRAGMA index_list(file_hashes)")}
+        conn.close()
+
+        assert version == hash_db.SCHEMA_VERSION
+        for column in ("file_hash", "post_id", "creator_id", "service"):
+            assert f"idx_file_hashes_{column}" in indexes
+        assert "idx_file_hashes_downloaded_at" in indexes
+
+    def test_origin_columns_and_reverse_queries(self, isolated_hash_dir):
+        db = HashDB(isolated_hash_dir)
+        db.store(
+            "a", "/a.jpg", "h1", "ua", service="fanbox", creator_id="c1", post_id="p1"
+        )
+        db.store("b", "/b.jpg", "h1", "ub", service="fanbox", creator_id="c2")
+        db.flush()
+        db.store("c", "/c.jpg", "h2", "uc", service="fanbox", creator_id="c1")
+
+        entry = db.lookup("a")
+        assert (entry["service"], entry["creator_id"], entry["post_id"]) == (
+            "fanbox",
+            "c1",
+            "p1",
+        )
+        assert entry["downloaded_at"] > 0
+        assert {e["url_hash"] for e in db.file_hash_entries("h1")} == {"a", "b"}
+        assert {e["url_hash"] for e in db.creator_entries("fanbox", "c1")} == {
+            "a",
+            "c",
+        }
+
+    def test_library_paths_are_stored_relative(self, isolated_hash_dir, tmp_path):
+        library = tmp_path / "library"
+        inside = str(library / "creator" / "file.jpg")
+        outside = str(tmp_path / "elsewhere.jpg")
+        db = HashDB(isolated_hash_dir, base_dir=str(library))
+        db.store("in", inside, "h", "u")
+        db.store("out", outside, "h", "u")
+        db.flush()
+
+        assert stored_path(isolated_hash_dir, "in") == os.path.join(
+            "creator", "file.jpg"
+        )
+        assert stored_path(isolated_hash_dir, "out") == outside
+        assert db.lookup("in")["file_path"] == inside
+
+    def test_moved_library_resolves_against_new_base(self, isolated_hash_dir, tmp_path):
+        db = HashDB(isolated_hash_dir, base_dir=str(tmp_path / "old"))
+        db.store("k", str(tmp_path / "old" / "a" / "f.jpg"), "h", "u")
+        db.close()
+
+        moved = HashDB(isolated_hash_dir, base_dir=str(tmp_path / "new"))
+        assert moved.lookup("k")["file_path"] == str(tmp_path / "new" / "a" / "f.jpg")
+
+    def test_v1_database_is_upgraded_in_place(self, isolated_hash_dir, tmp_path):
+        import sqlite3
+
+        library = tmp_path / "library"
+        os.makedirs(isolated_hash_dir, exist_ok=True)
+        conn = sqlite3.connect(os.path.join(isolated_hash_dir, HashDB.DB_FILENAME))
+        conn.execute(
+            "CREATE TABLE file_hashes (url_hash TEXT PRIMARY KEY, "
+            "file_path TEXT NOT NULL, file_hash TEXT NOT NULL, url TEXT NOT NULL, "
+            "file_size INTEGER NOT NULL DEFAULT 0)"
+        )
+        conn.executemany(
+            "INSERT INTO file_hashes VALUES (?, ?, ?, ?, ?)",
+            [(f"k{i}", str(library / f"{i}.jpg"), "h", "u", 1) for i in range(7)],
+        )
+        conn.commit()
+        conn.close()
+
+        db = HashDB(isolated_hash_dir, base_dir=str(library))
+        assert db.lookup("k3")["post_id"] == ""
+        db.migrate_rows(batch_size=3)
+
+        assert stored_path(isolated_hash_dir, "k3") == "3.jpg"
+        assert db.lookup("k3")["file_path"] == str(library / "3.jpg")
+        assert db.migrate_rows() == 0
+
+    def test_rows_are_migrated_once_per_library(
+        self, isolated_hash_dir, tmp_path, monkeypatch
+    ):
+        monkeypatch.setattr(HashDB, "_start_rebase", lambda self: None)
+        walks = []
+        migrate_rows = HashDB.migrate_rows
+
+        def counting_migrate_rows(self, *args):
+            walks.append(self.base_dir)
+            return migrate_rows(self, *args)
+
+        monkeypatch.setattr(HashDB, "migrate_rows", counting_migrate_rows)
+        library = str(tmp_path / "library")
+        db = HashDB(isolated_hash_dir, base_dir=library)
+        assert not db.rows_migrated()
+
+        db._run_rebase()
+        HashDB(isolated_hash_dir, base_dir=library)._run_rebase()
+
+        assert walks == [library]
+        assert db.rows_migrated()
+        assert not HashDB(isolated_hash_dir, base_dir=str(tmp_path)).rows_migrated()
+
+    def test_upgrade_builds_indexes_in_the_background_step(
+        self, isolated_hash_dir, monkeypatch
+    ):
+        import sqlite3
+
+        os.makedirs(isolated_hash_dir, exist_ok=True)
+        path = os.path.join(isolated_hash_dir, HashDB.DB_FILENAME)
+        conn = sqlite3.connect(path)
+        conn.execute(
+            "CREATE TABLE file_hashes (url_hash TEXT PRIMARY KEY, "
+            "file_path TEXT NOT NULL, file_hash TEXT NOT NULL, url TEXT NOT NULL)"
+        )
+        conn.execute("INSERT INTO file_hashes VALUES ('k', '/a.jpg', 'h', 'u')")
+        conn.commit()
+        conn.close()
+        monkeypatch.setattr(HashDB, "_start_rebase", lambda self: None)
+
+        def indexes():
+            conn = sqlite3.connect(path)
+            try:
+                rows = conn.execute("PRAGMA index_list(file_hashes)")
+                return {row[1] for row in rows}
+            finally:
+                conn.close()
+
+        db = HashDB(isolated_hash_dir)
+        # Opening the database neither scans the table nor waits for indexes.
+        assert not {i for i in indexes() if i.startswith("idx_file_hashes_")}
+        assert db.lookup("k")["file_hash"] == "h"
+
+        assert db.build_indexes() == len(hash_db._INDEXED_COLUMNS)
+        assert "idx_file_hashes_post_id" in indexes()
+        assert db.build_indexes() == 0
 
 
 class TestHashDBEdgeCases:
@@ -0,0 +1,135 @@
+import json
+from types import SimpleNamespace
+
+import pytest
+
+import kemonodownloader.creator_downloader as cd
+from kemonodownloader.download_core import listing_record_usable
+
+CREATOR_URL = "https://kemono.cr/fanbox/user/1"
+
+
+def make_post(post_id, content=True):
+    post = {
+        "id": str(post_id),
+        "title": f"Post {post_id}",
+        "file": {"name": f"{post_id}.jpg", "path": f"/aa/{post_id}.jpg"},
+        "attachments": [{"name": f"{post_id}.zip", "path": f"/bb/{post_id}.zip"}],
+    }
+    if content:
+        post["content"] = f'<p><img src="/cc/{post_id}.png"></p>'
+    return post
+
+
+class Checked:
+    def __init__(self, checked=True):
+        self.checked = checked
+
+    def isChecked(self):
+        return self.checked
+
+
+class PostSession:
+    def __init__(self, full_posts):
+        self.full_posts = full_posts
+        self.fetched = []
+
+    def get(self, url, **kwargs):
+        post_id = url.rsplit("/", 1)[-1]
+        self.fetched.append(post_id)
+        payload = {"post": self.full_posts[post_id]}
+        return SimpleNamespace(status_code=200, json=lambda: payload)
+
+
+def run_prep(monkeypatch, records, listing_prep=True, content_check=True):
+    full_posts = {pid: make_post(pid) for pid in records}
+    session = PostSession(full_posts)
+    monkeypatch.setattr(cd, "get_session", lambda settings_tab=None: session)
+    settings = cd.ThreadSettings(1, 1, 1, 1, 5, listing_prep=listing_prep)
+    all_files_map = {CREATOR_URL: [(f"Post {pid}", (pid, None)) for pid in records]}
+    thread = cd.FilePreparationThread(
+        list(records),
+        all_files_map,
+        {ext: Checked() for ext in (".jpg", ".zip", ".png")},
+        True,
+        True,
+        content_check,
+        settings,
+        max_concurrent=3,
+        post_records=records,
+    )
+    result = []
+    thread.finished = SimpleNamespace(emit=lambda *a: result.append(a))
+    thread.log = SimpleNamespace(emit=lambda *a: None)
+    thread.progress = SimpleNamespace(emit=lambda *a: None)
+    thread.run()
+    files, files_map = result[0]
+    return session, files, files_map
+
+
+def test_complete_records_skip_post_requests(monkeypatch):
+    records = {str(i): make_post(i) for i in range(6)}
+    session, files, files_map = run_prep(monkeypatch, records)
+
+    assert session.fetched == []
+    assert len(files) == 18
+    assert files_map[files[0]] == "0"
+
+
+def test_listing_and_per_post_modes_detect_the_same_files(monkeypatch):
+    records = {str(i): make_post(i) for i in range(6)}
+    _, listing_files, listing_map = run_prep(monkeypatch, records)
+    session, fetched_files, fetched_map = run_prep(
+        monkeypatch, records, listing_prep=False
+    )
+
+    assert sorted(session.fetched) == sorted(records)
+    assert sorted(listing_files) == sorted(fetched_files)
+    assert listing_map == fetched_map
+
+
+def test_records_missing_fields_are_fetched(monkeypatch):
+    records = {str(i): make_post(i) for i in range(4)}
+    records["1"] = make_post(1, content=False)
+    del records["2"]["attachments"]
+
+    session, files, _ = run_prep(monkeypatch, records)
+
+    assert sorted(session.fetched) == ["1", "2"]
+    assert len(files) == 12
+
+
+def test_content_not_required_when_content_check_is_off(monkeypatch):
+    records = {str(i): make_post(i, content=False) for i in range(3)}
+    session, files, _ = run_prep(monkeypatch, records, content_check=False)
+
+    assert session.fetched == []
+    assert len(files) == 6
+
+
+@pytest.mark.parametrize("record", [None, "not-a-dict"])
+def test_listing_record_rejects_unusable_entries(record):
+    assert not listing_record_usable(record, True, True, True)
+
+
+def test_post_detection_keeps_listing_records(monkeypatch):
+    posts = [make_post(i) for i in range(3)]
+
+    class ListingSession:
+        def get(self, url, **kwargs):
+            body = json.dumps(posts if "o=0" in url else [])
+            return SimpleNamespace(
+                status_code=200,
+                text=body,
+                content=body.encode(),
+                json=lambda: json.loads(body),
+            )
+
+    monkeypatch.setattr(cd, "get_session", lambda settings_tab=None: ListingSession())
+    settings = cd.ThreadSettings(2, 1, 1, 1, 1)
+    thread = cd.PostDetectionThread(CREATOR_URL, {}, settings)
+    for name in ("log", "posts_batch", "finished", "error"):
+        setattr(thread, name, SimpleNamespace(emit=lambda *a: None))
+    thread.run()
+
+    assert thread.post_records == {post["id"]: post for post in posts}
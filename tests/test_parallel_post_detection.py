@@ -0,0 +1,165 @@
+import json
+import threading
+import time
+from types import SimpleNamespace
+
+import pytest
+
+import kemonodownloader.creator_downloader as cd
+from kemonodownloader.domain_config import get_domain_config
+from kemonodownloader.download_core import fetch_post_count
+
+_real_sleep = time.sleep
+
+
+class Resp:
+    def __init__(self, status_code=200, payload=None):
+        self.status_code = status_code
+        self.text = json.dumps(payload if payload is not None else [])
+        self.content = self.text.encode("utf-8")
+
+    def json(self):
+        return json.loads(self.text)
+
+
+class ListingSession:
+    """Fake API with *total* posts; early pages answer slowest."""
+
+    def __init__(self, total, post_count=None, failures=None):
+        self.total = total
+        self.post_count = total if post_count is None else post_count
+        # offset -> number of requests for that page that fail with a 500
+        self.failures = dict(failures or {})
+        self.urls = []
+        self.lock = threading.Lock()
+        self.in_flight = 0
+        self.peak = 0
+
+    def get(self, url, **kwargs):
+        with self.lock:
+            self.urls.append(url)
+        if url.endswith("/profile"):
+            if self.post_count is None:
+                return Resp(404)
+            return Resp(200, {"name": "Someone", "post_count": self.post_count})
+        offset = int(url.split("o=")[1].split("&")[0])
+        with self.lock:
+            if self.failures.get(offset):
+                self.failures[offset] -= 1
+                return Resp(500)
+            self.in_flight += 1
+            self.peak = max(self.peak, self.in_flight)
+        try:
+            _real_sleep(max(0.0, 0.03 - offset / 10000))
+            posts = [
+                {"id": str(i), "title": f"Post {i}"}
+                for i in range(offset, min(offset + 50, self.total))
+            ]
+            return Resp(200, posts)
+        finally:
+            with self.lock:
+                self.in_flight -= 1
+
+
+@pytest.fixture(autouse=True)
+def short_sleeps(monkeypatch):
+    monkeypatch.setattr(cd.time, "sleep", lambda s: _real_sleep(min(s, 0.005)))
+
+
+def run_detection(
+    monkeypatch, session, url="https://kemono.cr/fanbox/user/1", thread=None
+):
+    monkeypatch.setattr(cd, "get_session", lambda settings_tab=None: session)
+    settings = cd.ThreadSettings(200, 1, 1, 1, 1)
+    thread = thread or cd.PostDetectionThread(url, {}, settings)
+    batches, finished, logs = [], [], []
+    thread.posts_batch = SimpleNamespace(emit=batches.append)
+    thread.finished = SimpleNamespace(emit=finished.append)
+    thread.log = SimpleNamespace(emit=lambda msg, level: logs.append(msg))
+    thread.error = SimpleNamespace(emit=lambda *a: None)
+    thread.run()
+    return batches, finished, logs
+
+
+def emitted_ids(batches):
+    return [post_id for batch in batches for _, (post_id, _) in batch]
+
+
+def test_pages_fetched_concurrently_but_emitted_in_offset_order(monkeypatch):
+    session = ListingSession(total=430)
+    batches, finished, _ = run_detection(monkeypatch, session)
+
+    expected = [str(i) for i in range(430)]
+    assert emitted_ids(batches) == expected
+    assert [entry[1][0] for entry in finished[0]] == expected
+    assert session.peak > 1
+
+
+def test_stale_post_count_continues_sequentially(monkeypatch):
+    session = ListingSession(total=260, post_count=150)
+    batches, _, _ = run_detection(monkeypatch, session)
+
+    assert emitted_ids(batches) == [str(i) for i in range(260)]
+
+
+def test_failed_page_is_retried_by_sequential_walk(monkeypatch):
+    # Every endpoint form fails once, so the parallel fetch gives up on it.
+    session = ListingSession(total=330, failures={150: 4})
+    batches, _, logs = run_detection(monkeypatch, session)
+
+    assert emitted_ids(batches) == [str(i) for i in range(330)]
+    assert any("150" in msg and "sequential" in msg for msg in logs)
+    assert any("from offset 200" in msg and "unused" in msg for msg in logs)
+
+
+def test_stopped_parallel_fetch_reports_pages_left_behind(monkeypatch):
+    session = ListingSession(total=430)
+    settings = cd.ThreadSettings(200, 1, 1, 1, 1)
+    thread = cd.PostDetectionThread("https://kemono.cr/fanbox/user/1", {}, settings)
+    get = session.get
+
+    def get_then_stop(url, **kwargs):
+        if "o=100" in url:
+            thread.stop()
+        return get(url, **kwargs)
+
+    session.get = get_then_stop
+    batches, finished, logs = run_detection(monkeypatch, session, thread=thread)
+
+    assert finished == []
+    assert any("unused" in msg for msg in logs)
+    assert not [t for t in threading.enumerate() if t.name.startswith("pages")]
+
+
+def test_without_post_count_walks_sequentially(monkeypatch):
+    session = ListingSession(total=160)
+    session.post_count = None
+    batches, _, _ = run_detection(monkeypatch, session)
+
+    assert emitted_ids(batches) == [str(i) for i in range(160)]
+    assert session.peak == 1
+
+
+def test_single_page_creator_skips_profile_lookup(monkeypatch):
+    session = ListingSession(total=20)
+    batches, _, _ = run_detection(monkeypatch, session)
+
+    assert emitted_ids(batches) == [str(i) for i in range(20)]
+    assert not any(url.endswith("/profile") for url in session.urls)
+
+
+def test_search_query_keeps_sequential_walk(monkeypatch):
+    session = ListingSession(total=120)
+    run_detection(monkeypatch, session, url="https://kemono.cr/fanbox/user/1?q=cat")
+
+    assert not any(url.endswith("/profile") for url in session.urls)
+    assert session.peak == 1
+
+
+@pytest.mark.parametrize(
+    "profile", [[], {"post_count": "many"}, {"post_count": True}, {"name": "x"}]
+)
+def test_fetch_post_count_ignores_malformed_profiles(profile):
+    session = SimpleNamespace(get=lambda *a, **k: Resp(200, profile))
+    domain_config = get_domain_config("https://kemono.cr/fanbox/user/1")
+    assert fetch_post_count(session, {}, domain_config, "fanbox", "1") is None
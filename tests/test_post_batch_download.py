@@ -0,0 +1,131 @@
+import os
+import threading
+from types import SimpleNamespace
+
+from kemonodownloader import post_downloader as pd
+
+POST_URLS = {
+    "1": "https://kemono.cr/fanbox/user/10/post/1",
+    "2": "https://kemono.cr/patreon/user/20/post/2/",
+}
+FILES = {
+    "https://kemono.cr/data/a.jpg": "1",
+    "https://kemono.cr/data/b.jpg": "2",
+    "https://kemono.cr/data/c.jpg": "1",
+    "https://kemono.cr/data/d.jpg": "2",
+}
+
+
+def make_batch_thread(tmp_path, download_text=False):
+    settings = SimpleNamespace(
+        api_request_max_retries=1,
+        file_download_max_retries=1,
+        settings_tab=None,
+    )
+    other_dir = str(tmp_path / "other")
+    os.makedirs(other_dir, exist_ok=True)
+    thread = pd.PostBatchDownloadThread(
+        POST_URLS,
+        str(tmp_path / "download"),
+        list(FILES),
+        dict(FILES),
+        None,
+        other_dir,
+        settings,
+        max_concurrent=4,
+        auto_rename=True,
+        download_text=download_text,
+    )
+    thread.log = SimpleNamespace(emit=lambda *a: None)
+    thread.concurrency_changed = SimpleNamespace(emit=lambda *a: None)
+    thread.finished = SimpleNamespace(emit=lambda *a: None)
+    return thread
+
+
+def test_posts_keep_their_own_context_and_numbering(tmp_path):
+    thread = make_batch_thread(tmp_path)
+
+    assert thread.post_files_map == {
+        "1": ["https://kemono.cr/data/a.jpg", "https://kemono.cr/data/c.jpg"],
+        "2": ["https://kemono.cr/data/b.jpg", "https://kemono.cr/data/d.jpg"],
+    }
+    assert thread.file_number("https://kemono.cr/data/c.jpg", 2) == 2
+    assert thread.file_number("https://kemono.cr/data/b.jpg", 1) == 1
+    assert thread.post_context("2") == ("patreon", "20", "Post_2")
+    assert thread.scheduler_owner("https://kemono.cr/data/a.jpg") == "fanbox/10"
+
+
+def test_one_pool_downloads_every_post(tmp_path, monkeypatch):
+    thread = make_batch_thread(tmp_path, download_text=True)
+    fetched = []
+    downloaded = {}
+    completed = []
+    lock = threading.Lock()
+
+    def request_post_info(url):
+        with lock:
+            fetched.append(url)
+        return url.split("/")[-3], f"Title {url[-1]}", "<p>text</p>"
+
+    def download_file(self, file_url, folder, file_index, total_files):
+        post_id = self.files_to_posts_map[file_url]
+        with lock:
+            downloaded[file_url] = self.post_context(post_id)[2]
+        with self.completed_files_lock:
+            self.completed_files.add(file_url)
+        self.check_post_completion(file_url)
+
+    monkeypatch.setattr(thread, "request_post_info", request_post_info)
+    monkeypatch.setattr(pd.DownloadThread, "download_file", download_file)
+    thread.post_completed = SimpleNamespace(emit=completed.append)
+
+    thread.run()
+
+    assert sorted(fetched) == sorted(url.rstrip("/") for url in POST_URLS.values())
+    assert downloaded["https://kemono.cr/data/d.jpg"] == "Title 2"
+    assert downloaded["https://kemono.cr/data/a.jpg"] == "Title 1"
+    assert sorted(completed) == ["1", "2"]
+    desc = tmp_path / "download" / "patreon" / "2_Title 2" / "desc.txt"
+    assert desc.read_text(encoding="utf-8") == "text"
+
+
+def test_download_all_links_starts_one_batch_thread(monkeypatch):
+    created = []
+
+    class FakeBatch:
+        def __init__(self, post_urls, *args, **kwargs):
+            created.append(post_urls)
+            signal = SimpleNamespace(connect=lambda slot: None)
+            self.file_progress = self.file_completed = signal
+            self.transfer_progress = signal
+            self.post_completed = self.log = signal
+            self.concurrency_changed = self.finished = signal
+            self.start = lambda: None
+
+    monkeypatch.setattr(pd, "PostBatchDownloadThread", FakeBatch)
+    tab = SimpleNamespace(
+        all_files_map={url: [("t", pid)] for pid, url in POST_URLS.items()},
+        append_log_to_console=lambda *a: None,
+        _create_thread_settings=lambda: SimpleNamespace(simultaneous_downloads=3),
+        parent=SimpleNamespace(download_folder="/tmp/x"),
+        post_console=None,
+        other_files_dir="/tmp/o",
+        auto_rename_checkbox=SimpleNamespace(isChecked=lambda: False),
+        post_download_text_check=SimpleNamespace(isChecked=lambda: False),
+        active_threads=[],
+    )
+    for slot in (
+        "update_file_progress",
+        "update_transfer_progress",
+        "update_file_completion",
+        "update_post_completion",
+        "update_post_concurrency",
+        "cleanup_thread",
+    ):
+        setattr(tab, slot, lambda *a: None)
+
+    pd.PostDownloaderTab.start_batch_download(
+        tab, list(POST_URLS.values()), list(FILES), dict(FILES)
+    )
+
+    assert created == [POST_URLS] and len(tab.active_threads) == 1
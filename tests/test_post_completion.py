@@ -0,0 +1,152 @@
+import hashlib
+import os
+import time
+from types import SimpleNamespace
+
+import kemonodownloader.creator_downloader as cd
+from kemonodownloader.hash_db import HashDB
+from kemonodownloader.post_completion import (
+    completed_post_ids,
+    creator_key,
+    selection_key,
+)
+
+CREATOR_URL = "https://kemono.cr/fanbox/user/1"
+SELECTION = selection_key([".jpg"], True, True, True)
+
+
+class Checked:
+    def isChecked(self):
+        return True
+
+
+def url_hash(url):
+    return hashlib.md5(url.encode()).hexdigest()
+
+
+def download(db, library, post_id):
+    """Write a post's file to *library* and record it like a download."""
+    url = f"https://kemono.cr/data/aa/{post_id}.jpg"
+    path = os.path.join(library, f"{post_id}.jpg")
+    with open(path, "wb") as f:
+        f.write(post_id.encode())
+    st = os.stat(path)
+    db.store(url_hash(url), path, "h", url, st.st_size, st.st_mtime, st.st_ino)
+    return url
+
+
+def test_completion_records_round_trip(isolated_hash_dir):
+    db = HashDB(isolated_hash_dir)
+    db.mark_post_complete("fanbox", "1", "7", ["b", "a"], SELECTION)
+
+    record = db.completed_posts("fanbox", "1")["7"]
+    assert record["file_urls"] == ["a", "b"]
+    assert record["selection"] == SELECTION and record["verified"] is True
+
+    db.clear_post_completion("fanbox", "1", "7")
+    assert db.completed_posts("fanbox", "1") == {}
+
+
+def test_only_unchanged_posts_of_the_same_selection_are_skipped(
+    isolated_hash_dir, tmp_path
+):
+    db = HashDB(isolated_hash_dir)
+    for post_id in ("1", "2", "3"):
+        url = download(db, str(tmp_path), post_id)
+        db.mark_post_complete("fanbox", "1", post_id, [url], SELECTION)
+    db.mark_post_complete("fanbox", "1", "4", [], selection_key([], 1, 0, 0))
+    os.remove(tmp_path / "2.jpg")
+
+    assert completed_post_ids(db, "fanbox", "1", SELECTION) == {"1", "3"}
+    # The record of the post with a missing file is gone.
+    assert set(db.completed_posts("fanbox", "1")) == {"1", "3", "4"}
+
+
+def test_posts_edited_after_completion_are_prepared_again(isolated_hash_dir, tmp_path):
+    db = HashDB(isolated_hash_dir)
+    url = download(db, str(tmp_path), "1")
+    db.mark_post_complete("fanbox", "1", "1", [url], SELECTION)
+    edited = time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(time.time() + 3600))
+
+    listing = {"1": {"id": "1", "edited": edited}}
+    assert completed_post_ids(db, "fanbox", "1", SELECTION, listing) == set()
+    listing = {"1": {"id": "1", "edited": "2020-01-01T00:00:00"}}
+    assert completed_post_ids(db, "fanbox", "1", SELECTION, listing) == {"1"}
+
+
+def test_creator_key():
+    assert creator_key(CREATOR_URL) == ("fanbox", "1")
+    assert creator_key("https://kemono.cr/fanbox/post/1") is None
+
+
+def test_preparation_skips_completed_posts_without_requests(
+    monkeypatch, isolated_hash_dir, tmp_path
+):
+    db = HashDB(isolated_hash_dir)
+    url = download(db, str(tmp_path), "1")
+    db.mark_post_complete("fanbox", "1", "1", [url], SELECTION)
+    fetched = []
+
+    def get(url, **kwargs):
+        post_id = url.rsplit("/", 1)[-1]
+        fetched.append(post_id)
+        post = {"id": post_id, "file": {"name": "2.jpg", "path": "/aa/2.jpg"}}
+        return SimpleNamespace(status_code=200, json=lambda: {"post": post})
+
+    session = SimpleNamespace(get=get)
+    monkeypatch.setattr(cd, "get_session", lambda settings_tab=None: session)
+    settings = cd.ThreadSettings(1, 1, 1, 1, 5, listing_prep=False)
+    all_files_map = {CREATOR_URL: [("Post 1", ("1", None)), ("Post 2", ("2", None))]}
+    thread = cd.FilePreparationThread(
+        ["1", "2"], all_files_map, {".jpg": Checked()}, True, True, True, settings
+    )
+    thread.completion_db = db
+    result = []
+    thread.finished = SimpleNamespace(emit=lambda *a: result.append(a))
+    thread.log = SimpleNamespace(emit=lambda *a: None)
+    thread.progress = SimpleNamespace(emit=lambda *a: None)
+    thread.run()
+
+    assert fetched == ["2"]
+    assert thread.skipped_posts == {"1"}
+    assert list(result[0][1].values()) == ["2"]
+
+
+def test_download_thread_records_completed_posts_once(isolated_hash_dir, tmp_path):
+    thread = cd.CreatorDownloadThread(
+        "fanbox",
+        "1",
+        str(tmp_path / "library"),
+        ["5"],
+        ["u1"],
+        {"u1": "5"},
+        None,
+        isolated_hash_dir,
+        {},
+        False,
+        cd.ThreadSettings(1, 1, 1, 1, 1),
+        1,
+    )
+    thread.selection_key = SELECTION
+    db = thread.hash_db
+    thread.record_post_completion("5", ["u1"])
+    db.clear_post_completion("fanbox", "1", "5")
+    thread.record_post_completion("5", ["u1"])
+
+    assert db.completed_posts("fanbox", "1") == {}
+    thread._recorded_posts.clear()
+    thread.record_post_completion("5", ["u1"])
+    assert db.completed_posts("fanbox", "1")["5"]["file_urls"] == ["u1"]
+
+
+def test_completion_db_resolves_library_relative_paths(isolated_hash_dir, tmp_path):
+    library = str(tmp_path / "library")
+    os.makedirs(library)
+    db = HashDB(isolated_hash_dir, base_dir=library)
+    url = download(db, library, "9")
+    db.mark_post_complete("fanbox", "1", "9", [url], SELECTION)
+    db.close()
+
+    completion_db = cd.open_completion_db(isolated_hash_dir, library)
+    assert completed_post_ids(completion_db, "fanbox", "1", SELECTION) == {"9"}
+    assert set(completion_db.completed_posts("fanbox", "1")) == {"9"}
@@ -1,5 +1,7 @@
+import contextlib
 import os
 import runpy
+import time
 from types import SimpleNamespace
 
 from PyQt6.QtCore import QSize
@@ -414,30 +416,25 @@ def test_file_preparation_make_request_none_and_parse_json_success(monkeypatch):
     }
 
 
-def test_file_preparation_run_worker_returns_when_stopped(monkeypatch):
+def test_file_preparation_run_worker_returns_when_stopped():
     thread = make_file_prep_thread(max_retries=1)
     thread.log = SimpleNamespace(emit=lambda *a, **k: None)
     thread.progress = SimpleNamespace(emit=lambda *a, **k: None)
-    thread.finished = SimpleNamespace(emit=lambda *a, **k: None)
+    finished = []
+    thread.finished = SimpleNamespace(emit=lambda *a, **k: finished.append(a))
 
-    class ImmediateThread:
-        def __init__(self, target, args=(), daemon=False):
-            self.target = target
-            self.args = args
-
-        def start(self):
-            thread.is_running = False
-            self.target(*self.args)
-
-        def is_alive(self):
-            return False
+    def fetch(pid):
+        thread.is_running = False
+        return pid, [("name", "url")]
 
-    monkeypatch.setattr(pd.threading, "Thread", ImmediateThread)
+    thread.fetch_post_data = fetch
 
     thread.run()
 
+    assert finished == []
+
 
-def test_file_preparation_run_worker_runtimeerror_paths(monkeypatch):
+def test_file_preparation_run_worker_runtimeerror_paths():
     thread = make_file_prep_thread(max_retries=1)
     thread.fetch_post_data = lambda *_a, **_k: ("1", [("name", "url")])
 
@@ -449,74 +446,50 @@ def test_file_preparation_run_worker_runtimeerror_paths(monkeypatch):
     thread.progress = SimpleNamespace(
         emit=lambda *_a, **_k: (_ for _ in ()).throw(RuntimeError("gone"))
     )
-    thread.finished = SimpleNamespace(emit=lambda *a, **k: None)
-
-    class ImmediateThread:
-        def __init__(self, target, args=(), daemon=False):
-            self.target = target
-            self.args = args
-
-        def start(self):
-            self.target(*self.args)
-
-        def is_alive(self):
-            return False
-
-    monkeypatch.setattr(pd.threading, "Thread", ImmediateThread)
+    finished = []
+    thread.finished = SimpleNamespace(emit=lambda *a, **k: finished.append(a))
 
     thread.run()
 
+    assert finished == [(["url"], {"url": "1"})]
 
-def test_file_preparation_run_worker_fetch_exception_is_swallowed(monkeypatch):
+
+def test_file_preparation_run_worker_fetch_exception_is_swallowed():
     thread = make_file_prep_thread(max_retries=1)
     thread.fetch_post_data = lambda *_a, **_k: (_ for _ in ()).throw(RuntimeError("x"))
     thread.log = SimpleNamespace(emit=lambda *a, **k: None)
     thread.progress = SimpleNamespace(emit=lambda *a, **k: None)
-    thread.finished = SimpleNamespace(emit=lambda *a, **k: None)
-
-    class ImmediateThread:
-        def __init__(self, target, args=(), daemon=False):
-            self.target = target
-            self.args = args
-
-        def start(self):
-            self.target(*self.args)
-
-        def is_alive(self):
-            return False
-
-    monkeypatch.setattr(pd.threading, "Thread", ImmediateThread)
+    finished = []
+    thread.finished = SimpleNamespace(emit=lambda *a, **k: finished.append(a))
 
     thread.run()
 
+    assert finished == [([], {})]
 
-def test_file_preparation_run_wait_loop_sleeps_for_alive_workers(monkeypatch):
-    thread = make_file_prep_thread(max_retries=1)
-    thread.fetch_post_data = lambda *_a, **_k: ("1", [])
+
+def test_file_preparation_run_collects_every_post_before_finishing():
+    thread = make_file_prep_thread(max_retries=1, max_concurrent=2)
+    thread.post_ids = ["1", "2", "3"]
+    thread.all_files_map = {
+        f"https://kemono.cr/fanbox/user/123/post/{pid}": [("T", pid)]
+        for pid in thread.post_ids
+    }
     thread.log = SimpleNamespace(emit=lambda *a, **k: None)
     thread.progress = SimpleNamespace(emit=lambda *a, **k: None)
-    thread.finished = SimpleNamespace(emit=lambda *a, **k: None)
+    finished = []
+    thread.finished = SimpleNamespace(emit=lambda *a, **k: finished.append(a))
 
-    class AliveOnceThread:
-        def __init__(self, target, args=(), daemon=False):
-            self.target = target
-            self.args = args
-            self.calls = 0
-
-        def start(self):
-            self.target(*self.args)
-
-        def is_alive(self):
-            self.calls += 1
-            return self.calls == 1
+    def fetch(pid):
+        time.sleep(0.1 * int(pid))
+        return pid, [("name", f"url{pid}")]
 
-    sleeps = []
-    monkeypatch.setattr(pd.threading, "Thread", AliveOnceThread)
-    monkeypatch.setattr(pd.time, "sleep", lambda s: sleeps.append(s))
+    thread.fetch_post_data = fetch
 
     thread.run()
 
-    assert 0.05 in sleeps
+    files, files_map = finished[0]
+    assert sorted(files) == ["url1", "url2", "url3"]
+    assert files_map == {"url1": "1", "url2": "2", "url3": "3"}
 
 
 def test_download_thread_make_request_none_and_parse_invalid_gzip(
@@ -647,18 +620,17 @@ def test_download_file_returns_when_stopped_before_retry_loop(tmp_path):
     thread.download_file(file_url, thread.download_folder, 0, 1)
 
 
-def test_download_file_returns_when_stopped_inside_ssl_lock(monkeypatch, tmp_path):
+def test_download_file_returns_when_stopped_waiting_to_connect(monkeypatch, tmp_path):
     file_url = "https://kemono.cr/files/inside-lock.bin"
     thread = make_download_thread(tmp_path, [file_url], {file_url: "1"}, max_retries=1)
 
-    class ToggleLock:
-        def __enter__(self):
+    class CancellingGate:
+        @contextlib.contextmanager
+        def establishing(self, url, should_continue=None):
             thread.is_running = False
+            yield should_continue()
 
-        def __exit__(self, exc_type, exc, tb):
-            return False
-
-    thread._ssl_lock = ToggleLock()
+    thread.connection_gate = CancellingGate()
     thread.log = SimpleNamespace(emit=lambda *a, **k: None)
     thread.file_progress = SimpleNamespace(emit=lambda *a, **k: None)
     thread.file_completed = SimpleNamespace(emit=lambda *a, **k: None)
@@ -0,0 +1,116 @@
+import hashlib
+import os
+from types import SimpleNamespace
+
+import kemonodownloader.post_downloader as pd
+from kemonodownloader import resumable
+
+CONTENT = bytes(range(256)) * 32
+
+
+class RangeResponse:
+    def __init__(self, request_headers, truncate=None):
+        self.status_code = 200
+        body = CONTENT
+        self.headers = {"content-length": str(len(CONTENT))}
+        range_header = request_headers.get("Range")
+        if range_header:
+            start = int(range_header.split("=")[1].rstrip("-"))
+            body = CONTENT[start:]
+            self.status_code = 206
+            self.headers = {
+                "content-length": str(len(body)),
+                "content-range": f"bytes {start}-{len(CONTENT) - 1}/{len(CONTENT)}",
+            }
+        self._body = body[:truncate] if truncate is not None else body
+
+    def raise_for_status(self):
+        return None
+
+    def iter_content(self, chunk_size=8192):
+        for i in range(0, len(self._body), chunk_size):
+            yield self._body[i : i + chunk_size]
+
+    def close(self):
+        return None
+
+
+class RangeSession:
+    def __init__(self, truncate_first=None):
+        self.truncate_first = truncate_first
+        self.requests = []
+
+    def get(self, url, headers=None, **kwargs):
+        headers = dict(headers or {})
+        self.requests.append(headers)
+        truncate = self.truncate_first if len(self.requests) == 1 else None
+        return RangeResponse(headers, truncate)
+
+
+def make_thread(tmp_path, file_url, max_retries=1):
+    settings = SimpleNamespace(
+        api_request_max_retries=1,
+        file_download_max_retries=max_retries,
+        settings_tab=None,
+    )
+    download_folder = str(tmp_path / "download")
+    os.makedirs(download_folder, exist_ok=True)
+    thread = pd.DownloadThread(
+        url="https://kemono.cr/fanbox/user/123/post/1",
+        download_folder=download_folder,
+        selected_files=[file_url],
+        files_to_posts_map={file_url: "1"},
+        console=None,
+        other_files_dir=str(tmp_path / "other"),
+        post_id="1",
+        settings=settings,
+        max_concurrent=1,
+    )
+    thread.post_title = "Title"
+    thread.log = SimpleNamespace(emit=lambda *a, **k: None)
+    thread.file_progress = SimpleNamespace(emit=lambda *a, **k: None)
+    thread.file_completed = SimpleNamespace(emit=lambda *a, **k: None)
+    thread.post_completed = SimpleNamespace(emit=lambda *a, **k: None)
+    return thread
+
+
+def post_folder(thread):
+    folder = os.path.join(thread.download_folder, thread.service, "1_Title")
+    os.makedirs(folder, exist_ok=True)
+    return folder
+
+
+def test_post_download_resumes_existing_part(monkeypatch, tmp_path):
+    file_url = "https://kemono.cr/data/ab/cd/video.mp4"
+    session = RangeSession()
+    monkeypatch.setattr(pd, "get_session", lambda settings_tab=None: session)
+    thread = make_thread(tmp_path, file_url)
+    folder = post_folder(thread)
+    part = resumable.part_path_for(folder, hashlib.md5(file_url.encode()).hexdigest())
+    with open(part, "wb") as f:
+        f.write(CONTENT[:1234])
+
+    thread.download_file(file_url, thread.download_folder, 0, 1)
+
+    assert file_url in thread.completed_files
+    assert session.requests[0]["Range"] == "bytes=1234-"
+    assert not os.path.exists(part)
+    with open(os.path.join(folder, "video.mp4"), "rb") as f:
+        assert f.read() == CONTENT
+
+
+def test_post_download_resumes_short_transfer_on_retry(monkeypatch, tmp_path):
+    file_url = "https://kemono.cr/data/ab/cd/video.mp4"
+    session = RangeSession(truncate_first=2000)
+    monkeypatch.setattr(pd, "get_session", lambda settings_tab=None: session)
+    monkeypatch.setattr(pd.time, "sleep", lambda _s: None)
+    thread = make_thread(tmp_path, file_url, max_retries=2)
+    folder = post_folder(thread)
+
+    thread.download_file(file_url, thread.download_folder, 0, 1)
+
+    assert file_url in thread.completed_files
+    assert "Range" not in session.requests[0]
+    assert session.requests[1]["Range"] == "bytes=2000-"
+    with open(os.path.join(folder, "video.mp4"), "rb") as f:
+        assert f.read() == CONTENT
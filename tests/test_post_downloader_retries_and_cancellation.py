@@ -1,5 +1,4 @@
 import os
-from types import SimpleNamespace
 
 from kemonodownloader.post_downloader import DownloadThread, ThreadSettings
 
@@ -66,8 +65,7 @@ class FakeSessionCancel:
         return FakeResponseCancel(self._chunks, self._thread_ref)
 
 
-def make_settings(tmp_path):
-    settings_tab = SimpleNamespace(settings_tab=None)
+def make_settings(tmp_path, settings_tab):
     return ThreadSettings(
         creator_posts_max_attempts=1,
         post_data_max_retries=1,
@@ -78,7 +76,7 @@ def make_settings(tmp_path):
     )
 
 
-def test_post_size_mismatch_deletes_incomplete(monkeypatch, tmp_path):
+def test_post_size_mismatch_keeps_part(monkeypatch, tmp_path, settings_tab):
     download_folder = str(tmp_path / "pd_mismatch")
     other_files_dir = str(tmp_path / "other_pd")
     os.makedirs(download_folder, exist_ok=True)
@@ -96,7 +94,7 @@ def test_post_size_mismatch_deletes_incomplete(monkeypatch, tmp_path):
         lambda settings_tab=None: FakeSessionMismatch(chunks, header_size),
     )
 
-    settings = make_settings(tmp_path)
+    settings = make_settings(tmp_path, settings_tab)
     thread = DownloadThread(
         url="https://kemono.cr/service/user/creator/post/1",
         download_folder=download_folder,
@@ -115,15 +113,16 @@ def test_post_size_mismatch_deletes_incomplete(monkeypatch, tmp_path):
     thread.download_file(file_url, download_folder, 0, total_files=1)
 
     assert file_url not in thread.completed_files
-    # Ensure no file artifacts remain
+    # Only the resumable .part file remains; the final file is never created
     found = []
     for root, dirs, files in os.walk(download_folder):
         for f in files:
             found.append(os.path.join(root, f))
-    assert len(found) == 0
+    assert len(found) == 1
+    assert found[0].endswith(".part")
 
 
-def test_post_cancellation_deletes_incomplete(monkeypatch, tmp_path):
+def test_post_cancellation_keeps_part(monkeypatch, tmp_path, settings_tab):
     download_folder = str(tmp_path / "pd_cancel")
     other_files_dir = str(tmp_path / "other_pd2")
     os.makedirs(download_folder, exist_ok=True)
@@ -135,7 +134,7 @@ def test_post_cancellation_deletes_incomplete(monkeypatch, tmp_path):
 
     chunks = [b"first", b"second"]
 
-    settings = make_settings(tmp_path)
+    settings = make_settings(tmp_path, settings_tab)
     thread = DownloadThread(
         url="https://kemono.cr/service/user/creator/post/1",
         download_folder=download_folder,
@@ -158,14 +157,17 @@ def test_post_cancellation_deletes_incomplete(monkeypatch, tmp_path):
     thread.download_file(file_url, download_folder, 0, total_files=1)
 
     assert file_url not in thread.completed_files
+    # Only the .part file is left behind so a restart can resume it
     found = []
     for root, dirs, files in os.walk(download_folder):
         for f in files:
             found.append(os.path.join(root, f))
-    assert len(found) == 0
+    assert all(f.endswith(".part") for f in found)
 
 
-def test_post_cancellation_remove_failure_is_ignored(monkeypatch, tmp_path):
+def test_post_cancellation_remove_failure_is_ignored(
+    monkeypatch, tmp_path, settings_tab
+):
     download_folder = str(tmp_path / "pd_cancel_remove_fail")
     other_files_dir = str(tmp_path / "other_pd_cancel_remove_fail")
     os.makedirs(download_folder, exist_ok=True)
@@ -177,7 +179,7 @@ def test_post_cancellation_remove_failure_is_ignored(monkeypatch, tmp_path):
 
     chunks = [b"first", b"second"]
 
-    settings = make_settings(tmp_path)
+    settings = make_settings(tmp_path, settings_tab)
     thread = DownloadThread(
         url="https://kemono.cr/service/user/creator/post/1",
         download_folder=download_folder,
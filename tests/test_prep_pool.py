@@ -0,0 +1,97 @@
+import threading
+import time
+
+import kemonodownloader.creator_downloader as cd
+from kemonodownloader.prep_pool import PrepPool
+from kemonodownloader.retry_schedule import RetryLater
+
+
+class Concurrency:
+    def __init__(self, limit, max_limit):
+        self.limit = limit
+        self.max_limit = max_limit
+        self.successes = 0
+        self.failures = 0
+
+    def record_success(self, ttfb=None):
+        self.successes += 1
+
+    def record_failure(self, throttled=False):
+        self.failures += 1
+
+
+def test_at_most_limit_fetches_run_at_once():
+    concurrency = Concurrency(limit=2, max_limit=6)
+    lock = threading.Lock()
+    running = [0, 0]  # current, peak
+    results = {}
+
+    def fetch(item):
+        with lock:
+            running[0] += 1
+            running[1] = max(running[1], running[0])
+        time.sleep(0.02)
+        with lock:
+            running[0] -= 1
+        return item * 2 if item else None
+
+    PrepPool(concurrency, fetch, results.__setitem__).run(range(10))
+
+    assert running[1] == 2
+    assert results == {i: (i * 2 if i else None) for i in range(10)}
+    assert concurrency.successes == 9 and concurrency.failures == 1
+
+
+def test_retried_items_come_back_after_their_delay():
+    attempts = []
+    results = []
+
+    def fetch(item):
+        attempts.append(item)
+        if item == "a" and attempts.count("a") == 1:
+            return RetryLater(0.05)
+        return item
+
+    pool = PrepPool(Concurrency(1, 1), fetch, lambda i, r: results.append(r))
+    pool.run(["a", "b"])
+
+    assert attempts == ["a", "b", "a"]
+    assert results == ["b", "a"]
+
+
+def test_stop_ends_the_run_without_the_queued_items():
+    started = []
+    pool = None
+
+    def fetch(item):
+        started.append(item)
+        if item == 0:
+            pool.stop()
+        return item
+
+    pool = PrepPool(Concurrency(1, 1), fetch, lambda i, r: None)
+    pool.run(range(100))
+
+    assert len(started) < 100
+
+
+def test_work_items_follow_post_order_and_all_creators():
+    all_files_map = {
+        "https://kemono.cr/fanbox/user/1": [("a", ("3", None)), ("b", ("1", None))],
+        "https://kemono.cr/patreon/user/2": [("c", ("1", None)), ("d", ("9", None))],
+    }
+    thread = cd.FilePreparationThread(
+        ["1", "3", "1"],
+        all_files_map,
+        {},
+        True,
+        True,
+        True,
+        cd.ThreadSettings(1, 1, 1, 1, 1),
+    )
+
+    assert thread.build_work_items() == [
+        ("1", "https://kemono.cr/fanbox/user/1"),
+        ("1", "https://kemono.cr/patreon/user/2"),
+        ("3", "https://kemono.cr/fanbox/user/1"),
+    ]
@@ -0,0 +1,129 @@
+import threading
+from types import SimpleNamespace
+
+import pytest
+
+import kemonodownloader.creator_downloader as cd
+from kemonodownloader.progress import (
+    ProgressAggregator,
+    ProgressSnapshot,
+    format_bytes,
+    format_duration,
+)
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 100.0
+
+    def __call__(self):
+        return self.now
+
+
+def make_aggregator(interval=0.1):
+    clock = FakeClock()
+    published = []
+    return ProgressAggregator(published.append, interval, clock), clock, published
+
+
+def test_chunks_within_an_interval_are_coalesced():
+    aggregator, clock, published = make_aggregator()
+    for downloaded in range(8192, 8192 * 101, 8192):
+        aggregator.update(0, downloaded, 8192 * 100)
+    # Only the first chunk crossed the (initially open) deadline.
+    assert len(published) == 1
+    clock.now += 0.1
+    aggregator.update(1, 50, 100)
+    assert len(published) == 2
+    snapshot = published[-1]
+    assert snapshot.files == {0: (8192 * 100, 8192 * 100), 1: (50, 100)}
+    assert snapshot.changed == (0, 1)
+    assert snapshot.percent(0) == 100 and snapshot.percent(1) == 50
+    assert (snapshot.bytes_done, snapshot.bytes_total) == (
+        8192 * 100 + 50,
+        8192 * 100 + 100,
+    )
+
+
+def test_throughput_and_eta_follow_the_transferred_bytes():
+    aggregator, clock, published = make_aggregator()
+    aggregator.begin("a", offset=1000, total=11000)
+    aggregator.update("a", 1000, 11000)
+    assert published[-1].throughput == 0 and published[-1].eta is None
+    clock.now += 1
+    aggregator.update("a", 3000, 11000)
+    snapshot = published[-1]
+    # The resumed 1000 bytes do not count; 2000 bytes moved in a second.
+    assert snapshot.throughput == pytest.approx(2000)
+    assert snapshot.eta == pytest.approx(4)
+
+    aggregator.finish("a")
+    assert aggregator.snapshot().files == {}
+    clock.now += 1
+    aggregator.update("b", 2000, 0)
+    # Finished transfers stay in the rate; unknown totals give no ETA.
+    snapshot = published[-1]
+    assert snapshot.throughput == pytest.approx(0.3 * 2000 + 0.7 * 2000)
+    assert snapshot.bytes_total == 0 and snapshot.eta is None
+
+
+def test_flush_publishes_outside_the_interval_and_snapshot_does_not():
+    aggregator, _, published = make_aggregator(interval=60)
+    aggregator.update(0, 1, 10)
+    aggregator.update(0, 2, 10)
+    assert aggregator.snapshot().changed == (0,)
+    assert len(published) == 1
+    aggregator.flush()
+    assert len(published) == 2 and published[-1].files == {0: (2, 10)}
+    aggregator.flush()
+    assert published[-1].changed == ()
+
+
+def test_concurrent_workers_publish_at_the_interval_rate():
+    published = []
+    aggregator = ProgressAggregator(published.append, interval=60)
+
+    def worker(key):
+        for downloaded in range(1, 5001):
+            aggregator.update(key, downloaded, 5000)
+        aggregator.finish(key)
+
+    threads = [threading.Thread(target=worker, args=(i,)) for i in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert len(published) == 1
+    assert aggregator.snapshot().files == {}
+
+
+def test_formatting_helpers():
+    assert format_bytes(512) == "512 B"
+    assert format_bytes(1536) == "1.5 KB"
+    assert format_bytes(5 * 1024**3) == "5.0 GB"
+    assert format_duration(None) == "--:--"
+    assert format_duration(65) == "1:05"
+    assert format_duration(3725) == "1:02:05"
+
+
+def test_creator_thread_publishes_changed_files_and_the_snapshot(tmp_path):
+    emitted = []
+    thread = cd.CreatorDownloadThread(
+        "fanbox",
+        "1",
+        str(tmp_path),
+        [],
+        [],
+        {},
+        None,
+        str(tmp_path / "other"),
+        {},
+        False,
+        cd.ThreadSettings(1, 1, 1, 1, 1),
+        1,
+    )
+    thread.file_progress = SimpleNamespace(emit=lambda *a: emitted.append(a))
+    thread.transfer_progress = SimpleNamespace(emit=lambda *a: emitted.append(a))
+    snapshot = ProgressSnapshot({3: (25, 100), 4: (1, 2)}, (3,), 26, 102, 10.0, 7.6)
+    thread._publish_progress(snapshot)
+    assert emitted == [(3, 25), (snapshot,)]
@@ -0,0 +1,278 @@
+import asyncio
+from email.utils import formatdate
+from types import SimpleNamespace
+
+import pytest
+from requests.adapters import HTTPAdapter
+
+import kemonodownloader.creator_downloader as cd
+from kemonodownloader import rate_limiter
+from kemonodownloader.rate_limiter import HostRateLimiter, parse_retry_after
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 100.0
+        self.sleeps = []
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+def make_limiter(rate=2.0, burst=2.0):
+    clock = FakeClock()
+    limiter = HostRateLimiter(rate=rate, burst=burst, clock=clock, sleep=clock.sleep)
+    return limiter, clock
+
+
+@pytest.fixture
+def shared_limiter(monkeypatch):
+    limiter, clock = make_limiter(rate=100.0, burst=100.0)
+    monkeypatch.setattr(rate_limiter, "_limiter", limiter)
+    return limiter, clock
+
+
+class TestParseRetryAfter:
+    def test_seconds(self):
+        assert parse_retry_after("7") == 7.0
+        assert parse_retry_after(" 1.5 ") == 1.5
+
+    def test_http_date(self):
+        value = formatdate(1_000_030, usegmt=True)
+        assert parse_retry_after(value, now=1_000_000) == pytest.approx(30.0)
+
+    def test_past_date_is_zero(self):
+        value = formatdate(1_000_000, usegmt=True)
+        assert parse_retry_after(value, now=1_000_100) == 0.0
+
+    @pytest.mark.parametrize("value", [None, "", "soon", "-"])
+    def test_invalid(self, value):
+        assert parse_retry_after(value) is None
+
+
+def test_host_of_normalises_case_and_ports():
+    assert rate_limiter.host_of("https://N1.Kemono.su:443/data/a.png") == "n1.kemono.su"
+
+
+def test_burst_then_paced_by_rate():
+    limiter, _ = make_limiter(rate=2.0, burst=2.0)
+    assert limiter.reserve("h") == 0.0
+    assert limiter.reserve("h") == 0.0
+    assert limiter.reserve("h") == pytest.approx(0.5)
+    assert limiter.reserve("h") == pytest.approx(1.0)
+    # Other hosts have their own bucket.
+    assert limiter.reserve("other") == 0.0
+
+
+def test_tokens_refill_over_time():
+    limiter, clock = make_limiter(rate=2.0, burst=2.0)
+    limiter.reserve("h")
+    limiter.reserve("h")
+    clock.now += 1.0
+    assert limiter.reserve("h") == 0.0
+
+
+def test_429_with_retry_after_pauses_every_caller():
+    limiter, clock = make_limiter(rate=4.0, burst=4.0)
+    assert limiter.record_response("h", 429, "10") == 10.0
+    assert limiter.backoff_remaining("h") == pytest.approx(10.0)
+    assert limiter.reserve("h") >= 10.0
+    assert limiter.current_rate("h") == 2.0
+    assert limiter.backoff_remaining("other") == 0.0
+
+
+def test_429_without_retry_after_backs_off_exponentially():
+    limiter, _ = make_limiter()
+    first = limiter.record_response("h", 429)
+    second = limiter.record_response("h", 429)
+    assert first == rate_limiter.DEFAULT_BACKOFF
+    assert second == rate_limiter.DEFAULT_BACKOFF * 2
+
+
+def test_backoff_is_capped():
+    limiter, _ = make_limiter()
+    assert limiter.record_response("h", 429, "100000") == rate_limiter.MAX_BACKOFF
+
+
+def test_503_only_throttles_with_retry_after():
+    limiter, _ = make_limiter()
+    assert limiter.record_response("h", 503) == 0.0
+    assert limiter.record_response("h", 503, "3") == 3.0
+
+
+def test_rate_ramps_back_up_after_successes():
+    limiter, _ = make_limiter(rate=4.0, burst=4.0)
+    limiter.record_response("h", 429, "1")
+    limiter.record_response("h", 429, "1")
+    assert limiter.current_rate("h") == 1.0
+    for _ in range(100):
+        limiter.record_response("h", 200)
+    assert limiter.current_rate("h") == 4.0
+
+
+def test_rate_never_drops_below_minimum():
+    limiter, _ = make_limiter(rate=1.0)
+    for _ in range(10):
+        limiter.record_response("h", 429, "0")
+    assert limiter.current_rate("h") == rate_limiter.MIN_RATE
+
+
+def test_acquire_waits_for_backoff_recorded_while_waiting():
+    limiter, clock = make_limiter(rate=1.0, burst=1.0)
+    limiter.reserve("h")
+    original_sleep = clock.sleep
+    triggered = []
+
+    def sleep_and_throttle(seconds):
+        if not triggered:
+            triggered.append(True)
+            limiter.record_response("h", 429, "5")
+        original_sleep(seconds)
+
+    limiter._sleep = sleep_and_throttle
+    start = clock.now
+    waited = limiter.acquire("h")
+    assert waited == pytest.approx(5.0)
+    assert clock.now - start == pytest.approx(5.0)
+    # One sleep until the token was due, one for the rest of the backoff.
+    assert clock.sleeps == [pytest.approx(1.0), pytest.approx(4.0)]
+
+
+def test_cancellable_acquire_wakes_to_check_for_cancellation():
+    limiter, clock = make_limiter()
+    limiter.record_response("h", 429, "3")
+    waited = limiter.acquire("h", should_continue=lambda: True)
+    assert waited == pytest.approx(3.0)
+    assert max(clock.sleeps) <= rate_limiter._CANCEL_CHECK_INTERVAL
+
+
+def test_unpaced_acquire_takes_no_token_but_waits_for_backoff():
+    limiter, clock = make_limiter(rate=1.0, burst=1.0)
+    for _ in range(5):
+        assert limiter.acquire("h", paced=False) == 0.0
+    assert limiter.reserve("h") == 0.0
+    limiter.record_response("h", 429, "2")
+    assert limiter.acquire("h", paced=False) == pytest.approx(2.0)
+
+
+def test_acquire_stops_when_cancelled():
+    limiter, clock = make_limiter()
+    limiter.record_response("h", 429, "60")
+    waited = limiter.acquire("h", should_continue=lambda: False)
+    assert waited == 0.0
+    assert clock.sleeps == []
+
+
+def test_acquire_async_waits_for_backoff(monkeypatch):
+    limiter, clock = make_limiter()
+    limiter.record_response("h", 429, "1")
+
+    async def fake_sleep(seconds):
+        clock.now += seconds
+
+    monkeypatch.setattr(rate_limiter.asyncio, "sleep", fake_sleep)
+    waited = asyncio.run(limiter.acquire_async("h"))
+    assert waited == pytest.approx(1.0)
+
+
+def test_adapter_records_responses_with_shared_limiter(monkeypatch, shared_limiter):
+    limiter, _ = shared_limiter
+    response = SimpleNamespace(status_code=429, headers={"Retry-After": "4"})
+    monkeypatch.setattr(HTTPAdapter, "send", lambda self, request, **kw: response)
+    adapter = rate_limiter.RateLimitedAdapter()
+    request = SimpleNamespace(url="https://kemono.cr/api/v1/x")
+
+    assert adapter.send(request) is response
+    assert limiter.backoff_remaining("kemono.cr") == pytest.approx(4.0)
+
+
+def test_adapter_paces_api_requests_only(monkeypatch):
+    limiter, clock = make_limiter(rate=1.0, burst=1.0)
+    monkeypatch.setattr(rate_limiter, "_limiter", limiter)
+    response = SimpleNamespace(status_code=200, headers={})
+    monkeypatch.setattr(HTTPAdapter, "send", lambda self, request, **kw: response)
+    adapter = rate_limiter.RateLimitedAdapter()
+
+    for index in range(5):
+        adapter.send(SimpleNamespace(url=f"https://kemono.cr/data/{index}.png"))
+    assert clock.sleeps == []
+
+    adapter.send(SimpleNamespace(url="https://kemono.cr/api/v1/a"))
+    adapter.send(SimpleNamespace(url="https://kemono.cr/api/v1/b"))
+    assert clock.sleeps == [pytest.approx(1.0)]
+
+
+def test_get_session_mounts_rate_limited_adapter(monkeypatch):
+    monkeypatch.setattr(cd, "_thread_local", cd.threading.local())
+    session = cd.get_session(None)
+    assert isinstance(
+        session.get_adapter("https://kemono.cr"), rate_limiter.RateLimitedAdapter
+    )
+    assert isinstance(
+        session.get_adapter("http://kemono.cr"), rate_limiter.RateLimitedAdapter
+    )
+
+
+def test_file_preparation_429_defers_to_shared_backoff(monkeypatch, shared_limiter):
+    limiter, _ = shared_limiter
+    limiter.record_response("kemono.cr", 429, "30")
+    sleeps = []
+    monkeypatch.setattr(cd.time, "sleep", lambda s: sleeps.append(s))
+
+    class Resp429:
+        status_code = 429
+
+    class Resp200:
+        status_code = 200
+
+        def json(self):
+            return {"id": "p1", "file": {"path": "/media/1.png", "name": "1.png"}}
+
+    responses = [Resp429(), Resp200()]
+    monkeypatch.setattr(
+        cd,
+        "get_session",
+        lambda settings_tab=None: SimpleNamespace(get=lambda *a, **k: responses.pop(0)),
+    )
+    thread = cd.FilePreparationThread(
+        post_ids=[],
+        all_files_map={},
+        creator_ext_checks={".png": SimpleNamespace(isChecked=lambda: True)},
+        creator_main_check=True,
+        creator_attachments_check=True,
+        creator_content_check=True,
+        settings=SimpleNamespace(post_data_max_retries=2, settings_tab=None),
+    )
+    logs = []
+    thread.log = SimpleNamespace(emit=lambda msg, level: logs.append(msg))
+
+    result = thread.fetch_and_detect_files("p1", "https://kemono.cr/fanbox/user/10")
+
+    assert result is not None and result[0] == "p1"
+    assert sleeps == []
+    assert any("kemono.cr" in msg and "30.0s" in msg for msg in logs)
+
+
+def test_adapter_gives_up_on_a_backoff_when_cancelled(monkeypatch, shared_limiter):
+    limiter, clock = shared_limiter
+    limiter.record_response("kemono.cr", 429, "120")
+    sent = []
+    monkeypatch.setattr(HTTPAdapter, "send", lambda self, request, **kw: sent.append(1))
+    adapter = rate_limiter.RateLimitedAdapter()
+    request = SimpleNamespace(url="https://kemono.cr/data/a.png")
+    running = [True]
+
+    def stop_after_a_while(seconds):
+        clock.now += seconds
+        running[0] = clock.now < 101
+
+    limiter._sleep = stop_after_a_while
+    with rate_limiter.cancellable(lambda: running[0]):
+        with pytest.raises(rate_limiter.RequestCancelled):
+            adapter.send(request)
+    assert sent == [] and clock.now < 102
+    assert rate_limiter._local.should_continue is None
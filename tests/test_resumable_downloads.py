@@ -0,0 +1,361 @@
+import asyncio
+import hashlib
+import os
+
+import pytest
+from aiohttp import web
+
+from kemonodownloader import resumable
+from kemonodownloader.creator_downloader import CreatorDownloadThread, ThreadSettings
+
+CONTENT = bytes(range(256)) * 64  # 16 KiB
+
+
+class RangeResponse:
+    """Fake requests response that honours ``Range: bytes=N-``."""
+
+    def __init__(self, content, request_headers, honour_range=True, truncate=None):
+        self._body = content
+        self.status_code = 200
+        self.headers = {"content-length": str(len(content))}
+        range_header = request_headers.get("Range")
+        if range_header and honour_range:
+            start = int(range_header.split("=")[1].rstrip("-"))
+            if start >= len(content):
+                self.status_code = 416
+                self.headers = {"content-range": f"bytes */{len(content)}"}
+                self._body = b""
+            else:
+                self.status_code = 206
+                self._body = content[start:]
+                self.headers = {
+                    "content-length": str(len(self._body)),
+                    "content-range": f"bytes {start}-{len(content) - 1}/{len(content)}",
+                }
+        if truncate is not None:
+            self._body = self._body[:truncate]
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise AssertionError("raise_for_status should not be reached for 416")
+
+    def iter_content(self, chunk_size=8192):
+        for i in range(0, len(self._body), chunk_size):
+            yield self._body[i : i + chunk_size]
+
+    def close(self):
+        return None
+
+
+class RangeSession:
+    def __init__(self, content, honour_range=True, truncate_first=None):
+        self.content = content
+        self.honour_range = honour_range
+        self.truncate_first = truncate_first
+        self.requests = []
+
+    def get(self, url, headers=None, **kwargs):
+        headers = dict(headers or {})
+        self.requests.append(headers)
+        truncate = self.truncate_first if len(self.requests) == 1 else None
+        return RangeResponse(self.content, headers, self.honour_range, truncate)
+
+
+def make_settings(settings_tab, retries=1, engine="requests"):
+    settings_tab.settings["creator_folder_strategy"] = "single_folder"
+    return ThreadSettings(
+        creator_posts_max_attempts=1,
+        post_data_max_retries=1,
+        file_download_max_retries=retries,
+        api_request_max_retries=1,
+        simultaneous_downloads=1,
+        settings_tab=settings_tab,
+        download_engine=engine,
+    )
+
+
+def make_thread(tmp_path, file_url, settings):
+    download_folder = str(tmp_path / "downloads")
+    os.makedirs(download_folder, exist_ok=True)
+    thread = CreatorDownloadThread(
+        service="svc",
+        creator_id="c1",
+        download_folder=download_folder,
+        selected_posts=["1"],
+        files_to_download=[file_url],
+        files_to_posts_map={file_url: "1"},
+        console=None,
+        other_files_dir=str(tmp_path / "other"),
+        post_titles_map={("svc", "c1", "1"): "Post"},
+        auto_rename_enabled=False,
+        settings=settings,
+        max_concurrent=1,
+    )
+    thread.creator_name = "Creator"
+    return thread
+
+
+def part_for(thread, file_url):
+    folder = os.path.join(thread.download_folder, "c1_Creator")
+    os.makedirs(folder, exist_ok=True)
+    url_hash = hashlib.md5(file_url.encode()).hexdigest()
+    return folder, resumable.part_path_for(folder, url_hash)
+
+
+def read_final(folder):
+    names = [n for n in os.listdir(folder) if not n.endswith(".part")]
+    assert len(names) == 1
+    with open(os.path.join(folder, names[0]), "rb") as f:
+        return f.read()
+
+
+_real_sleep = asyncio.sleep
+
+
+async def _instant_sleep(delay, *args, **kwargs):
+    await _real_sleep(0)
+
+
+class TestParseContentRange:
+    def test_full_range(self):
+        assert resumable.parse_content_range("bytes 100-199/1000") == (100, 199, 1000)
+
+    def test_unsatisfied_range(self):
+        assert resumable.parse_content_range("bytes */1000") == (None, None, 1000)
+
+    def test_unknown_total(self):
+        assert resumable.parse_content_range("bytes 0-9/*") == (0, 9, None)
+
+    @pytest.mark.parametrize(
+        "value", [None, "", "items 0-1/2", "bytes 0-9", "bytes a-b/c"]
+    )
+    def test_invalid(self, value):
+        assert resumable.parse_content_range(value) is None
+
+
+class TestPlanResume:
+    def test_fresh_download(self, tmp_path):
+        plan = resumable.plan_resume(200, {"content-length": "10"}, 0, "unused")
+        assert plan == (0, 10, False)
+        assert plan.mode == "wb"
+
+    def test_partial_content_appends(self, tmp_path):
+        headers = {"content-length": "6", "content-range": "bytes 4-9/10"}
+        plan = resumable.plan_resume(206, headers, 4, "unused")
+        assert plan == (4, 10, False)
+        assert plan.mode == "ab"
+
+    def test_range_ignored_restarts(self):
+        plan = resumable.plan_resume(200, {"content-length": "10"}, 4, "unused")
+        assert plan == (0, 10, False)
+
+    def test_wrong_range_discards_part(self, tmp_path):
+        part = tmp_path / "x.part"
+        part.write_bytes(b"abcd")
+        headers = {"content-length": "10", "content-range": "bytes 0-9/10"}
+        with pytest.raises(resumable.IncompleteDownloadError):
+            resumable.plan_resume(206, headers, 4, str(part))
+        assert not part.exists()
+
+    def test_unsatisfiable_range_when_complete(self):
+        plan = resumable.plan_resume(416, {"content-range": "bytes */4"}, 4, "unused")
+        assert plan.complete
+        assert plan.total_size == 4
+
+    def test_unsatisfiable_range_with_oversized_part(self, tmp_path):
+        part = tmp_path / "x.part"
+        part.write_bytes(b"abcdef")
+        with pytest.raises(resumable.IncompleteDownloadError):
+            resumable.plan_resume(416, {"content-range": "bytes */4"}, 6, str(part))
+        assert not part.exists()
+
+
+def test_range_headers_only_added_when_resuming():
+    base = {"Accept-Encoding": "gzip, deflate"}
+    assert resumable.range_headers(base, 0) == base
+    resumed = resumable.range_headers(base, 42)
+    assert resumed["Range"] == "bytes=42-"
+    assert resumed["Accept-Encoding"] == "identity"
+    assert base == {"Accept-Encoding": "gzip, deflate"}
+
+
+class TestStreamHasher:
+    def test_resume_hashes_kept_prefix_then_chunks(self, tmp_path):
+        part = tmp_path / "x.part"
+        part.write_bytes(CONTENT[:5000] + b"stale tail")
+        hasher = resumable.StreamHasher()
+        hasher.resume(str(part), 5000)
+        hasher.update(CONTENT[5000:])
+
+        assert hasher.size == len(CONTENT)
+        assert hasher.hexdigest() == hashlib.md5(CONTENT).hexdigest()
+
+    def test_digest_for_rereads_file_when_sizes_differ(self, tmp_path):
+        path = tmp_path / "file.bin"
+        path.write_bytes(CONTENT)
+        hasher = resumable.StreamHasher()
+        hasher.update(CONTENT[:100])
+
+        assert hasher.digest_for(str(path)) == hashlib.md5(CONTENT).hexdigest()
+
+    def test_hash_file_reads_in_chunks(self, tmp_path):
+        path = tmp_path / "file.bin"
+        path.write_bytes(CONTENT)
+        sizes = []
+
+        class Recorder:
+            def update(self, chunk):
+                sizes.append(len(chunk))
+
+        resumable.hash_file(str(path), Recorder(), chunk_size=4096)
+        assert sizes == [4096] * 4
+        sizes.clear()
+        resumable.hash_file(str(path), Recorder(), limit=5000, chunk_size=4096)
+        assert sizes == [4096, 904]
+
+
+def test_creator_download_hashes_while_streaming(monkeypatch, tmp_path, settings_tab):
+    file_url = "https://kemono.cr/data/ab/cd/file.bin"
+    session = RangeSession(CONTENT)
+    monkeypatch.setattr(
+        "kemonodownloader.creator_downloader.get_session",
+        lambda settings_tab=None: session,
+    )
+
+    def no_reread(path):
+        raise AssertionError(f"{path} was read back after the download")
+
+    monkeypatch.setattr(resumable, "md5_file", no_reread)
+    thread = make_thread(tmp_path, file_url, make_settings(settings_tab))
+    _, part = part_for(thread, file_url)
+    with open(part, "wb") as f:
+        f.write(CONTENT[:5000])
+
+    asyncio.run(thread.download_file(file_url, thread.download_folder, 0, 1))
+
+    entry = thread.hash_db.lookup(hashlib.md5(file_url.encode()).hexdigest())
+    assert entry["file_hash"] == hashlib.md5(CONTENT).hexdigest()
+
+
+def test_creator_download_resumes_existing_part(monkeypatch, tmp_path, settings_tab):
+    file_url = "https://kemono.cr/data/ab/cd/file.bin"
+    session = RangeSession(CONTENT)
+    monkeypatch.setattr(
+        "kemonodownloader.creator_downloader.get_session",
+        lambda settings_tab=None: session,
+    )
+    thread = make_thread(tmp_path, file_url, make_settings(settings_tab))
+    folder, part = part_for(thread, file_url)
+    with open(part, "wb") as f:
+        f.write(CONTENT[:5000])
+
+    asyncio.run(thread.download_file(file_url, thread.download_folder, 0, 1))
+
+    assert file_url in thread.completed_files
+    assert session.requests[0]["Range"] == "bytes=5000-"
+    assert not os.path.exists(part)
+    assert read_final(folder) == CONTENT
+    entry = thread.hash_db.lookup(hashlib.md5(file_url.encode()).hexdigest())
+    assert entry["file_hash"] == hashlib.md5(CONTENT).hexdigest()
+
+
+def test_creator_download_restarts_when_range_ignored(
+    monkeypatch, tmp_path, settings_tab
+):
+    file_url = "https://kemono.cr/data/ab/cd/file.bin"
+    session = RangeSession(CONTENT, honour_range=False)
+    monkeypatch.setattr(
+        "kemonodownloader.creator_downloader.get_session",
+        lambda settings_tab=None: session,
+    )
+    thread = make_thread(tmp_path, file_url, make_settings(settings_tab))
+    folder, part = part_for(thread, file_url)
+    with open(part, "wb") as f:
+        f.write(b"garbage that must be overwritten")
+
+    asyncio.run(thread.download_file(file_url, thread.download_folder, 0, 1))
+
+    assert file_url in thread.completed_files
+    assert read_final(folder) == CONTENT
+
+
+def test_creator_download_finalizes_complete_part(monkeypatch, tmp_path, settings_tab):
+    file_url = "https://kemono.cr/data/ab/cd/file.bin"
+    session = RangeSession(CONTENT)
+    monkeypatch.setattr(
+        "kemonodownloader.creator_downloader.get_session",
+        lambda settings_tab=None: session,
+    )
+    thread = make_thread(tmp_path, file_url, make_settings(settings_tab))
+    folder, part = part_for(thread, file_url)
+    with open(part, "wb") as f:
+        f.write(CONTENT)
+
+    asyncio.run(thread.download_file(file_url, thread.download_folder, 0, 1))
+
+    assert file_url in thread.completed_files
+    assert read_final(folder) == CONTENT
+
+
+def test_creator_download_resumes_short_transfer_on_retry(
+    monkeypatch, tmp_path, settings_tab
+):
+    file_url = "https://kemono.cr/data/ab/cd/file.bin"
+    session = RangeSession(CONTENT, truncate_first=7000)
+    monkeypatch.setattr(
+        "kemonodownloader.creator_downloader.get_session",
+        lambda settings_tab=None: session,
+    )
+    monkeypatch.setattr(
+        "kemonodownloader.creator_downloader.asyncio.sleep", _instant_sleep
+    )
+    thread = make_thread(tmp_path, file_url, make_settings(settings_tab, retries=2))
+    folder, _ = part_for(thread, file_url)
+
+    asyncio.run(thread.download_file(file_url, thread.download_folder, 0, 1))
+
+    assert file_url in thread.completed_files
+    assert "Range" not in session.requests[0]
+    assert session.requests[1]["Range"] == "bytes=7000-"
+    assert read_final(folder) == CONTENT
+
+
+def test_aiohttp_engine_resumes_existing_part(tmp_path, settings_tab):
+    source = tmp_path / "source.bin"
+    source.write_bytes(CONTENT)
+    seen_ranges = []
+
+    async def handler(request):
+        seen_ranges.append(request.headers.get("Range"))
+        return web.FileResponse(str(source))
+
+    async def scenario():
+        app = web.Application()
+        app.router.add_get("/data/{name}", handler)
+        runner = web.AppRunner(app)
+        await runner.setup()
+        site = web.TCPSite(runner, "127.0.0.1", 0)
+        await site.start()
+        port = runner.addresses[0][1]
+        file_url = f"http://127.0.0.1:{port}/data/file.bin"
+        thread = make_thread(
+            tmp_path, file_url, make_settings(settings_tab, engine="aiohttp")
+        )
+        folder, part = part_for(thread, file_url)
+        with open(part, "wb") as f:
+            f.write(CONTENT[:3000])
+        try:
+            await thread._open_aiohttp_session()
+            await thread.download_file(file_url, thread.download_folder, 0, 1)
+        finally:
+            await thread._close_aiohttp_session()
+            await runner.cleanup()
+        return thread, file_url, folder, part
+
+    thread, file_url, folder, part = asyncio.run(scenario())
+    assert file_url in thread.completed_files
+    assert seen_ranges == ["bytes=3000-"]
+    assert not os.path.exists(part)
+    assert read_final(folder) == CONTENT
+    entry = thread.hash_db.lookup(hashlib.md5(file_url.encode()).hexdigest())
+    assert entry["file_hash"] == hashlib.md5(CONTENT).hexdigest()
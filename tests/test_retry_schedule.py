@@ -0,0 +1,189 @@
+import asyncio
+import os
+import threading
+import time
+from types import SimpleNamespace
+
+import requests
+
+import kemonodownloader.creator_downloader as cd
+from kemonodownloader.retry_schedule import RetryLater, RetrySchedule, backoff_delay
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 100.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_backoff_delay_doubles_within_jittered_window():
+    assert backoff_delay(1, base=2.0, rand=lambda: 0.0) == 1.0
+    assert backoff_delay(1, base=2.0, rand=lambda: 1.0) == 2.0
+    assert backoff_delay(3, base=2.0, rand=lambda: 1.0) == 8.0
+    assert backoff_delay(20, base=2.0, cap=30.0, rand=lambda: 1.0) == 30.0
+
+
+def test_schedule_releases_items_when_due_in_order():
+    clock = FakeClock()
+    schedule = RetrySchedule(clock=clock)
+    schedule.schedule("late", 5)
+    schedule.schedule("soon", 1)
+
+    assert schedule.pop_due() == []
+    assert schedule.next_due_in() == 1
+    clock.now += 5
+    assert schedule.pop_due() == ["soon", "late"]
+    assert len(schedule) == 0
+    assert schedule.next_due_in() is None
+
+
+def make_prep_thread(post_ids, max_retries=3):
+    all_files_map = {
+        "https://kemono.cr/fanbox/user/1": [
+            (f"T{pid}", (pid, None)) for pid in post_ids
+        ]
+    }
+    thread = cd.FilePreparationThread(
+        list(post_ids),
+        all_files_map,
+        {".jpg": SimpleNamespace(isChecked=lambda: True)},
+        True,
+        True,
+        True,
+        cd.ThreadSettings(1, max_retries, 1, 1, 1, settings_tab=None),
+        max_concurrent=1,
+    )
+    result = []
+    thread.log = SimpleNamespace(emit=lambda *a: None)
+    thread.progress = SimpleNamespace(emit=lambda *a: None)
+    thread.finished = SimpleNamespace(emit=lambda *a: result.append(a))
+    return thread, result
+
+
+def test_prep_failure_frees_the_slot_for_the_next_post(monkeypatch):
+    thread, result = make_prep_thread(["bad", "good"])
+    thread.PREP_RETRY_BASE_DELAY = 0.2
+    order = []
+
+    class Session:
+        def get(self, url, **kwargs):
+            post_id = url.rsplit("/", 1)[-1]
+            order.append(post_id)
+            if post_id == "bad" and order.count("bad") == 1:
+                raise requests.ConnectionError("reset")
+            file = {"name": f"{post_id}.jpg", "path": f"/aa/{post_id}.jpg"}
+            payload = {"post": {"id": post_id, "file": file}}
+            return SimpleNamespace(status_code=200, json=lambda: payload)
+
+    monkeypatch.setattr(cd, "get_session", lambda settings_tab=None: Session())
+    thread.run()
+
+    # With a single slot, "good" ran while "bad" waited out its backoff.
+    assert order == ["bad", "good", "bad"]
+    files, files_map = result[0]
+    assert sorted(files_map.values()) == ["bad", "good"]
+
+
+def test_prep_retry_gives_up_after_max_attempts(monkeypatch):
+    thread, result = make_prep_thread(["bad"], max_retries=2)
+    thread.PREP_RETRY_BASE_DELAY = 0.05
+    calls = []
+
+    class Session:
+        def get(self, url, **kwargs):
+            calls.append(url)
+            raise requests.ConnectionError("reset")
+
+    monkeypatch.setattr(cd, "get_session", lambda settings_tab=None: Session())
+    thread.run()
+
+    assert len(calls) == 2
+    assert result == [([], {})]
+
+
+def test_direct_fetch_returns_retry_later_only_when_requeueing(monkeypatch):
+    thread, _ = make_prep_thread(["1"], max_retries=2)
+
+    class Session:
+        def get(self, url, **kwargs):
+            raise requests.ConnectionError("reset")
+
+    monkeypatch.setattr(cd, "get_session", lambda settings_tab=None: Session())
+    monkeypatch.setattr(cd.time, "sleep", lambda s: None)
+    curl = "https://kemono.cr/fanbox/user/1"
+
+    assert thread.fetch_and_detect_files("1", curl) is None
+    thread._post_attempts = {}
+    assert isinstance(thread.fetch_and_detect_files("1", curl), RetryLater)
+    assert thread._post_attempts == {"1": 1}
+    assert thread.fetch_and_detect_files("1", curl) is None
+
+
+def test_download_failure_is_rescheduled_instead_of_slept(
+    monkeypatch, tmp_path, settings_tab
+):
+    download_folder = str(tmp_path / "downloads")
+    os.makedirs(download_folder)
+    file_url = "https://kemono.cr/files/1.png"
+
+    class FailingSession:
+        def get(self, *args, **kwargs):
+            raise requests.RequestException("network failure")
+
+    monkeypatch.setattr(cd, "get_session", lambda settings_tab=None: FailingSession())
+    settings = cd.ThreadSettings(
+        1,
+        1,
+        2,
+        1,
+        1,
+        settings_tab=settings_tab,
+    )
+    thread = cd.CreatorDownloadThread(
+        service="kemono",
+        creator_id="c1",
+        download_folder=download_folder,
+        selected_posts=["1"],
+        files_to_download=[file_url],
+        files_to_posts_map={file_url: "1"},
+        console=None,
+        other_files_dir=str(tmp_path),
+        post_titles_map={},
+        auto_rename_enabled=False,
+        settings=settings,
+        download_text=False,
+    )
+    clock = FakeClock()
+    thread._retry_schedule = RetrySchedule(clock=clock)
+    thread._download_attempts = {}
+
+    started = time.monotonic()
+    asyncio.run(thread.download_file(file_url, download_folder, 0, total_files=1))
+
+    assert time.monotonic() - started < 0.5
+    assert file_url not in thread.failed_files
+    assert thread._download_attempts == {file_url: 1}
+    clock.now += 60
+    assert thread._retry_schedule.pop_due() == [(0, file_url)]
+
+    # The requeued attempt is the last one allowed.
+    asyncio.run(thread.download_file(file_url, download_folder, 0, total_files=1))
+    assert file_url in thread.failed_files
+
+
+def test_schedule_is_thread_safe():
+    schedule = RetrySchedule()
+
+    def add(n):
+        for i in range(200):
+            schedule.schedule((n, i), 0)
+
+    workers = [threading.Thread(target=add, args=(n,)) for n in range(4)]
+    for w in workers:
+        w.start()
+    for w in workers:
+        w.join()
+
+    assert len(schedule.pop_due()) == 800
@@ -0,0 +1,430 @@
+import asyncio
+import hashlib
+import os
+import threading
+
+import pytest
+from aiohttp import web
+
+from kemonodownloader import segmented
+from kemonodownloader.creator_downloader import CreatorDownloadThread, ThreadSettings
+
+MIB = 1024 * 1024
+CONTENT = (bytes(range(256)) * (4 * MIB // 256))[: 4 * MIB + 123]
+CONTENT_SHA256 = hashlib.sha256(CONTENT).hexdigest()
+
+
+class RangeResponse:
+    """Fake requests response honouring ``Range: bytes=a-b``."""
+
+    def __init__(self, content, request_headers, truncate=None):
+        self.status_code = 200
+        self.headers = {"content-length": str(len(content)), "accept-ranges": "bytes"}
+        self._body = content
+        range_header = request_headers.get("Range")
+        if range_header:
+            start_text, _, end_text = range_header.split("=")[1].partition("-")
+            start = int(start_text)
+            end = int(end_text) if end_text else len(content) - 1
+            self.status_code = 206
+            self._body = content[start : end + 1]
+            self.headers = {
+                "content-length": str(len(self._body)),
+                "content-range": f"bytes {start}-{end}/{len(content)}",
+            }
+        if truncate is not None:
+            self._body = self._body[:truncate]
+        self.closed = False
+
+    def raise_for_status(self):
+        return None
+
+    def iter_content(self, chunk_size=8192):
+        for i in range(0, len(self._body), chunk_size):
+            yield self._body[i : i + chunk_size]
+
+    def close(self):
+        self.closed = True
+
+
+class RangeSession:
+    def __init__(self, content, truncate_once=None):
+        self.content = content
+        # Maps a Range header value to a byte count to cut that reply at once.
+        self.truncate_once = dict(truncate_once or {})
+        self.requests = []
+        self._lock = threading.Lock()
+
+    def get(self, url, headers=None, **kwargs):
+        headers = dict(headers or {})
+        with self._lock:
+            self.requests.append(headers.get("Range"))
+            truncate = self.truncate_once.pop(headers.get("Range"), None)
+        return RangeResponse(self.content, headers, truncate)
+
+
+def make_settings(
+    settings_tab, retries=1, threshold_mb=1, segments=4, engine="requests"
+):
+    settings_tab.settings["creator_folder_strategy"] = "single_folder"
+    return ThreadSettings(
+        creator_posts_max_attempts=1,
+        post_data_max_retries=1,
+        file_download_max_retries=retries,
+        api_request_max_retries=1,
+        simultaneous_downloads=2,
+        settings_tab=settings_tab,
+        download_engine=engine,
+        segmented_threshold_mb=threshold_mb,
+        segmented_segments=segments,
+    )
+
+
+def make_thread(tmp_path, file_url, settings, max_concurrent=1):
+    download_folder = str(tmp_path / "downloads")
+    os.makedirs(download_folder, exist_ok=True)
+    thread = CreatorDownloadThread(
+        service="svc",
+        creator_id="c1",
+        download_folder=download_folder,
+        selected_posts=["1"],
+        files_to_download=[file_url],
+        files_to_posts_map={file_url: "1"},
+        console=None,
+        other_files_dir=str(tmp_path / "other"),
+        post_titles_map={("svc", "c1", "1"): "Post"},
+        auto_rename_enabled=False,
+        settings=settings,
+        max_concurrent=max_concurrent,
+    )
+    thread.creator_name = "Creator"
+    return thread
+
+
+def creator_folder(thread):
+    folder = os.path.join(thread.download_folder, "c1_Creator")
+    os.makedirs(folder, exist_ok=True)
+    return folder
+
+
+def final_files(folder):
+    return sorted(os.listdir(folder))
+
+
+def read_final(folder):
+    names = final_files(folder)
+    assert len(names) == 1
+    with open(os.path.join(folder, names[0]), "rb") as f:
+        return f.read()
+
+
+def patch_session(monkeypatch, session):
+    monkeypatch.setattr(
+        "kemonodownloader.creator_downloader.get_session",
+        lambda settings_tab=None: session,
+    )
+
+
+_real_sleep = asyncio.sleep
+
+
+async def _instant_sleep(delay, *args, **kwargs):
+    await _real_sleep(0)
+
+
+class TestPlanning:
+    def test_split_ranges_covers_file_without_overlap(self):
+        ranges = segmented.split_ranges(10 * MIB + 7, 4)
+        assert len(ranges) == 4
+        assert ranges[0][0] == 0
+        assert ranges[-1][1] == 10 * MIB + 6
+        for (_, end), (start, _) in zip(ranges, ranges[1:]):
+            assert start == end + 1
+
+    def test_split_ranges_respects_minimum_segment_size(self):
+        assert segmented.split_ranges(3 * MIB, 16) == [
+            (0, MIB - 1),
+            (MIB, 2 * MIB - 1),
+            (2 * MIB, 3 * MIB - 1),
+        ]
+        assert segmented.split_ranges(0, 4) == []
+
+    @pytest.mark.parametrize(
+        "headers,size,threshold,segments,expected",
+        [
+            ({"accept-ranges": "bytes"}, 8 * MIB, MIB, 4, True),
+            ({}, 8 * MIB, MIB, 4, False),
+            ({"accept-ranges": "none"}, 8 * MIB, MIB, 4, False),
+            ({"accept-ranges": "bytes"}, MIB // 2, MIB // 4, 4, False),
+            ({"accept-ranges": "bytes"}, 8 * MIB, 0, 4, False),
+            ({"accept-ranges": "bytes"}, 8 * MIB, MIB, 1, False),
+            ({"accept-ranges": "bytes"}, 8 * MIB, 16 * MIB, 4, False),
+        ],
+    )
+    def test_should_segment(self, headers, size, threshold, segments, expected):
+        assert segmented.should_segment(headers, size, threshold, segments) is expected
+
+    def test_server_sha256(self):
+        url = f"https://n1.kemono.cr/data/ab/cd/{CONTENT_SHA256}.mp4?f=clip.mp4"
+        assert segmented.server_sha256(url) == CONTENT_SHA256
+        assert segmented.server_sha256("https://kemono.cr/data/ab/cd/v.mp4") is None
+
+    def test_check_segment_response(self):
+        segmented.check_segment_response(206, {"content-range": "bytes 5-9/10"}, 5)
+        with pytest.raises(segmented.SegmentFailedError):
+            segmented.check_segment_response(200, {}, 5)
+        with pytest.raises(segmented.IncompleteDownloadError):
+            segmented.check_segment_response(206, {"content-range": "bytes 0-9/10"}, 5)
+
+
+class TestSegmentedFile:
+    def test_prepare_preallocates_and_persists_progress(self, tmp_path):
+        data, state = segmented.segmented_paths(str(tmp_path), "abc")
+        ranges = segmented.split_ranges(4 * MIB, 4)
+        first = segmented.SegmentedFile(data, state, 4 * MIB, ranges)
+        first.prepare()
+        assert os.path.getsize(data) == 4 * MIB
+        first.mark_done(ranges[1])
+
+        second = segmented.SegmentedFile(data, state, 4 * MIB, ranges)
+        second.prepare()
+        assert second.pending() == [ranges[0], ranges[2], ranges[3]]
+        assert second.completed_bytes() == MIB
+
+    def test_prepare_resets_when_layout_changes(self, tmp_path):
+        data, state = segmented.segmented_paths(str(tmp_path), "abc")
+        first = segmented.SegmentedFile(
+            data, state, 4 * MIB, segmented.split_ranges(4 * MIB, 4)
+        )
+        first.prepare()
+        first.mark_done(first.ranges[0])
+
+        ranges = segmented.split_ranges(4 * MIB, 2)
+        second = segmented.SegmentedFile(data, state, 4 * MIB, ranges)
+        second.prepare()
+        assert second.pending() == ranges
+
+    def test_finalize_moves_data_and_drops_state(self, tmp_path):
+        data, state = segmented.segmented_paths(str(tmp_path), "abc")
+        seg_file = segmented.SegmentedFile(data, state, 10, [(0, 9)])
+        seg_file.prepare()
+        seg_file.mark_done((0, 9))
+        assert seg_file.is_complete()
+        target = str(tmp_path / "abc.part")
+        seg_file.finalize(target)
+        assert os.path.getsize(target) == 10
+        assert not os.path.exists(data)
+        assert not os.path.exists(state)
+
+
+class TestSegmentJob:
+    def test_owner_and_helper_share_ranges(self, tmp_path):
+        data, state = segmented.segmented_paths(str(tmp_path), "abc")
+        seg_file = segmented.SegmentedFile(
+            data, state, 40, [(0, 9), (10, 19), (20, 29), (30, 39)]
+        )
+        seg_file.prepare()
+        fetched = []
+
+        async def fetch(start, end):
+            fetched.append(start)
+            await asyncio.sleep(0)
+
+        async def scenario():
+            job = segmented.SegmentJob(seg_file, fetch)
+            assert job.helper_count == 3
+            await asyncio.gather(job.run(), job.work(), job.work())
+
+        asyncio.run(scenario())
+        assert sorted(fetched) == [0, 10, 20, 30]
+        assert seg_file.pending() == []
+
+    def test_error_is_raised_to_owner_after_helpers_finish(self, tmp_path):
+        data, state = segmented.segmented_paths(str(tmp_path), "abc")
+        seg_file = segmented.SegmentedFile(data, state, 20, [(0, 9), (10, 19)])
+        seg_file.prepare()
+        helper_done = []
+
+        async def fetch(start, end):
+            if start == 10:
+                raise segmented.SegmentFailedError("boom")
+            await asyncio.sleep(0.01)
+            helper_done.append(start)
+
+        async def scenario():
+            job = segmented.SegmentJob(seg_file, fetch)
+            helper = asyncio.ensure_future(job.work())
+            await asyncio.sleep(0)  # let the helper claim the first range
+            with pytest.raises(segmented.SegmentFailedError):
+                await job.run()
+            assert helper_done == [0]
+            await helper
+
+        asyncio.run(scenario())
+        assert seg_file.pending() == [(10, 19)]
+
+
+def test_creator_download_uses_segments_for_large_files(
+    monkeypatch, tmp_path, settings_tab
+):
+    file_url = f"https://kemono.cr/data/ab/cd/{CONTENT_SHA256}.bin"
+    session = RangeSession(CONTENT)
+    patch_session(monkeypatch, session)
+    thread = make_thread(tmp_path, file_url, make_settings(settings_tab))
+    folder = creator_folder(thread)
+
+    asyncio.run(thread.download_file(file_url, thread.download_folder, 0, 1))
+
+    assert file_url in thread.completed_files
+    # One probing request, then one request per segment.
+    assert session.requests[0] is None
+    assert len(session.requests) == 5
+    assert all(r.startswith("bytes=") for r in session.requests[1:])
+    assert read_final(folder) == CONTENT
+    entry = thread.hash_db.lookup(hashlib.md5(file_url.encode()).hexdigest())
+    assert entry["file_hash"] == hashlib.md5(CONTENT).hexdigest()
+
+
+def test_small_files_are_not_segmented(monkeypatch, tmp_path, settings_tab):
+    file_url = "https://kemono.cr/data/ab/cd/file.bin"
+    session = RangeSession(CONTENT)
+    patch_session(monkeypatch, session)
+    thread = make_thread(
+        tmp_path, file_url, make_settings(settings_tab, threshold_mb=64)
+    )
+
+    asyncio.run(thread.download_file(file_url, thread.download_folder, 0, 1))
+
+    assert file_url in thread.completed_files
+    assert session.requests == [None]
+
+
+def test_segment_retry_resumes_within_segment(monkeypatch, tmp_path, settings_tab):
+    file_url = "https://kemono.cr/data/ab/cd/file.bin"
+    ranges = segmented.split_ranges(len(CONTENT), 4)
+    second = f"bytes={ranges[1][0]}-{ranges[1][1]}"
+    session = RangeSession(CONTENT, truncate_once={second: 1000})
+    patch_session(monkeypatch, session)
+    monkeypatch.setattr(
+        "kemonodownloader.creator_downloader.asyncio.sleep", _instant_sleep
+    )
+    thread = make_thread(tmp_path, file_url, make_settings(settings_tab, retries=2))
+    folder = creator_folder(thread)
+
+    asyncio.run(thread.download_file(file_url, thread.download_folder, 0, 1))
+
+    assert file_url in thread.completed_files
+    assert f"bytes={ranges[1][0] + 1000}-{ranges[1][1]}" in session.requests
+    assert read_final(folder) == CONTENT
+
+
+def test_segment_failure_keeps_finished_ranges(monkeypatch, tmp_path, settings_tab):
+    file_url = "https://kemono.cr/data/ab/cd/file.bin"
+    ranges = segmented.split_ranges(len(CONTENT), 4)
+    last = f"bytes={ranges[-1][0]}-{ranges[-1][1]}"
+    session = RangeSession(CONTENT, truncate_once={last: 10})
+    patch_session(monkeypatch, session)
+    thread = make_thread(tmp_path, file_url, make_settings(settings_tab, retries=1))
+    folder = creator_folder(thread)
+
+    asyncio.run(thread.download_file(file_url, thread.download_folder, 0, 1))
+
+    assert file_url in thread.failed_files
+    url_hash = hashlib.md5(file_url.encode()).hexdigest()
+    data, state = segmented.segmented_paths(folder, url_hash)
+    assert os.path.exists(data) and os.path.exists(state)
+
+    # The next run only fetches the range that failed.
+    session.requests.clear()
+    thread.failed_files.clear()
+    asyncio.run(thread.download_file(file_url, thread.download_folder, 0, 1))
+    assert file_url in thread.completed_files
+    assert session.requests == [None, last]
+    assert not os.path.exists(state)
+    assert read_final(folder) == CONTENT
+
+
+def test_hash_mismatch_discards_segments(monkeypatch, tmp_path, settings_tab):
+    file_url = f"https://kemono.cr/data/ab/cd/{'0' * 64}.bin"
+    session = RangeSession(CONTENT)
+    patch_session(monkeypatch, session)
+    thread = make_thread(tmp_path, file_url, make_settings(settings_tab, retries=1))
+    folder = creator_folder(thread)
+
+    asyncio.run(thread.download_file(file_url, thread.download_folder, 0, 1))
+
+    assert file_url in thread.failed_files
+    assert final_files(folder) == []
+
+
+def test_idle_workers_help_through_the_queue(monkeypatch, tmp_path, settings_tab):
+    file_url = "https://kemono.cr/data/ab/cd/file.bin"
+    session = RangeSession(CONTENT)
+    patch_session(monkeypatch, session)
+    thread = make_thread(
+        tmp_path, file_url, make_settings(settings_tab), max_concurrent=2
+    )
+    folder = creator_folder(thread)
+    helped = []
+    original_work = segmented.SegmentJob.work
+
+    async def tracking_work(job):
+        helped.append(job)
+        await original_work(job)
+
+    async def scenario():
+        queue = asyncio.Queue()
+        queue.put_nowait((0, file_url))
+        thread._download_queue = queue
+        monkeypatch.setattr(segmented.SegmentJob, "work", tracking_work)
+        workers = [
+            asyncio.ensure_future(thread.download_worker(queue, folder, 1))
+            for _ in range(2)
+        ]
+        await queue.join()
+        thread.is_running = False
+        await asyncio.gather(*workers)
+
+    asyncio.run(scenario())
+
+    assert file_url in thread.completed_files
+    # Owner plus three helper tokens taken from the shared queue.
+    assert len(helped) == 4
+    assert read_final(folder) == CONTENT
+
+
+def test_aiohttp_engine_downloads_segments(tmp_path, settings_tab):
+    source = tmp_path / "source.bin"
+    source.write_bytes(CONTENT)
+    seen_ranges = []
+
+    async def handler(request):
+        seen_ranges.append(request.headers.get("Range"))
+        return web.FileResponse(str(source))
+
+    async def scenario():
+        app = web.Application()
+        app.router.add_get("/data/{name}", handler)
+        runner = web.AppRunner(app)
+        await runner.setup()
+        site = web.TCPSite(runner, "127.0.0.1", 0)
+        await site.start()
+        port = runner.addresses[0][1]
+        file_url = f"http://127.0.0.1:{port}/data/{CONTENT_SHA256}.bin"
+        thread = make_thread(
+            tmp_path, file_url, make_settings(settings_tab, engine="aiohttp")
+        )
+        folder = creator_folder(thread)
+        try:
+            await thread._open_aiohttp_session()
+            await thread.download_file(file_url, thread.download_folder, 0, 1)
+        finally:
+            await thread._close_aiohttp_session()
+            await runner.cleanup()
+        return thread, file_url, folder
+
+    thread, file_url, folder = asyncio.run(scenario())
+    assert file_url in thread.completed_files
+    assert seen_ranges[0] is None
+    assert len(seen_ranges) == 5
+    assert read_final(folder) == CONTENT
@@ -4,6 +4,8 @@ import runpy
 import sys
 from types import SimpleNamespace
 
+import pytest
+
 from kemonodownloader import creator_downloader as cd, kd_settings as ks
 
 
@@ -14,11 +16,24 @@ def test___main_calls_app_main(monkeypatch):
         called.append(True)
 
     monkeypatch.setattr("kemonodownloader.app.main", fake_main)
+    monkeypatch.setattr(sys, "argv", ["kemonodownloader", "-psn_0_12345"])
     # Execute package as __main__ which should call our patched main
     runpy.run_module("kemonodownloader", run_name="__main__")
     assert called
 
 
+def test___main_runs_the_command_line_with_arguments(monkeypatch):
+    received = []
+    monkeypatch.setattr(
+        "kemonodownloader.cli.main", lambda argv: received.append(argv) or 3
+    )
+    monkeypatch.setattr(sys, "argv", ["kemonodownloader", "https://kemono.cr/x"])
+    with pytest.raises(SystemExit) as exit_info:
+        runpy.run_module("kemonodownloader", run_name="__main__")
+    assert exit_info.value.code == 3
+    assert received == [["https://kemono.cr/x"]]
+
+
 def test_get_default_base_directory_various_platforms(monkeypatch):
     # Windows-like
     monkeypatch.setattr(sys, "platform", "win32")